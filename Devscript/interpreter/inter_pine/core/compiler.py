@@ -0,0 +1,476 @@
+import itertools
+import math
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from .exceptions import InterpreterError
+from .parser import ASTNode, NodeType
+from ..indicators.streaming import STREAMING_KERNELS, StreamingTAEngine
+from ..utils.ring_buffer import RingBuffer
+
+BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+UNARY_OPERATORS: Dict[str, Callable[[Any], Any]] = {
+    '-': operator.neg,
+    'not': operator.not_,
+    '!': operator.not_,
+}
+
+DEFAULT_FUNCTIONS: Dict[str, Callable] = {
+    'abs': abs,
+    'max': max,
+    'min': min,
+    'round': round,
+    'sqrt': math.sqrt,
+    'log': math.log,
+    'exp': math.exp,
+    'pow': math.pow,
+    'nz': lambda value, replacement=0: replacement if value is None or value != value else value,
+    'na': lambda value: value is None or value != value,
+}
+
+
+def latest_value(result: Any) -> Any:
+    """Current-bar value of a full-series result (array, or a dict/tuple of arrays)"""
+    if isinstance(result, np.ndarray):
+        return result[-1].item() if result.size else math.nan
+    if isinstance(result, dict):
+        return {key: latest_value(value) for key, value in result.items()}
+    if isinstance(result, tuple):
+        return tuple(latest_value(value) for value in result)
+    return result
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class Frame(list):
+    """Variable slots of one run; `state` carries that run's history, TA kernels and bar clock"""
+    __slots__ = ('state',)
+
+
+class RunState:
+    """Per-run mutable state, so one CompiledProgram can back any number of concurrent runs"""
+
+    def __init__(self, history_slots: Iterable[int], max_bars_back: int):
+        self.max_bars_back = max_bars_back
+        self.bar_index = -1
+        self.history: Dict[int, RingBuffer] = {slot: RingBuffer(max_bars_back) for slot in history_slots}
+        self.series: Dict[Any, RingBuffer] = {}
+        self.written: Dict[Any, int] = {}
+        self.ta_engine = StreamingTAEngine()
+
+    def series_buffer(self, key: Any) -> RingBuffer:
+        buffer = self.series.get(key)
+        if buffer is None:
+            buffer = self.series[key] = RingBuffer(self.max_bars_back)
+        return buffer
+
+
+class CompiledProgram:
+    """A script lowered to closures over a flat slot frame, holding no run state.
+
+    Every variable the script touches gets a fixed index in the frame; input
+    series (names read but never assigned, e.g. close) are copied into their
+    slots at the start of each bar. Names read with `name[offset]` keep a
+    bounded history ring buffer. Each `instantiate()` gets its own frame and
+    RunState, so a program compiled once can be cached and shared.
+    """
+
+    def __init__(self, body: Callable, slots: Dict[str, int], inputs: Dict[str, int],
+                 history_slots: Iterable[int], max_bars_back: int):
+        self.body = body
+        self.slots = slots
+        self.inputs = list(inputs.items())
+        self.history_slots = tuple(history_slots)
+        self.outputs = [(name, slot) for name, slot in slots.items() if name not in inputs]
+        self.max_bars_back = max_bars_back
+
+    def instantiate(self, max_bars_back: Optional[int] = None) -> 'CompiledScript':
+        return CompiledScript(self, max_bars_back)
+
+
+class CompiledScript:
+    """One run of a CompiledProgram: its frame plus the RunState the closures read through it"""
+
+    def __init__(self, program: CompiledProgram, max_bars_back: Optional[int] = None):
+        self.program = program
+        self.max_bars_back = max_bars_back or program.max_bars_back
+        self._body = program.body
+        self.slots = program.slots
+        self.inputs = program.inputs
+        self.outputs = program.outputs
+        self.reset()
+
+    @property
+    def bar_index(self) -> int:
+        return self.frame.state.bar_index
+
+    @property
+    def ta_engine(self) -> StreamingTAEngine:
+        return self.frame.state.ta_engine
+
+    def step(self, bar: Dict[str, Any]) -> Any:
+        """Run the script for one bar and return the value of a top-level `return`, if any"""
+        frame = self.frame
+        frame.state.bar_index += 1
+        for name, slot in self.inputs:
+            frame[slot] = bar.get(name)
+        try:
+            self._body(frame)
+            result = None
+        except _Return as returned:
+            result = returned.value
+        for slot, buffer in self.history:
+            buffer.append(frame[slot])
+        return result
+
+    def run(self, bars: Iterable[Dict[str, Any]]) -> Dict[str, list]:
+        """Run every bar and collect each script variable as a series"""
+        series = {name: [] for name, _ in self.outputs}
+        collectors = [(series[name].append, slot) for name, slot in self.outputs]
+        frame = self.frame
+        for bar in bars:
+            self.step(bar)
+            for append, slot in collectors:
+                append(frame[slot])
+        return series
+
+    def variables(self) -> Dict[str, Any]:
+        return {name: self.frame[slot] for name, slot in self.outputs}
+
+    def reset(self) -> None:
+        self.frame = Frame([None] * len(self.slots))
+        self.frame.state = RunState(self.program.history_slots, self.max_bars_back)
+        self.history = list(self.frame.state.history.items())
+
+
+class Compiler:
+    """Compiles a parsed ASTNode program into a CompiledProgram.
+
+    Functions named in `series_functions` compute over whole series (TA-Lib
+    style): each argument that can change from bar to bar is passed as its
+    history up to the current bar, arguments that are constant for the run
+    (literals, or names only ever assigned constants at top level) are passed
+    as plain values, and the current bar's value is taken from the result.
+    """
+
+    def __init__(self, functions: Optional[Dict[str, Callable]] = None, max_bars_back: int = 5000,
+                 series_functions: Iterable[str] = ()):
+        self.functions = {**DEFAULT_FUNCTIONS, **(functions or {})}
+        self.max_bars_back = max_bars_back
+        self.series_functions = frozenset(series_functions)
+        self.kernels = StreamingTAEngine()
+
+    def compile(self, program: ASTNode) -> CompiledScript:
+        """Lower `program` and start a run of it"""
+        return self.lower(program).instantiate()
+
+    def lower(self, program: ASTNode) -> CompiledProgram:
+        self.slots: Dict[str, int] = {}
+        self.assigned = set()
+        self.history_slots = set()
+        self.call_sites = itertools.count()
+
+        self._collect_assignments(program)
+        self.constants = self._constant_names(program)
+        body = self._statement(program)
+        inputs = {name: slot for name, slot in self.slots.items() if name not in self.assigned}
+        return CompiledProgram(body, self.slots, inputs, sorted(self.history_slots), self.max_bars_back)
+
+    # Slots
+
+    def _slot(self, name: str) -> int:
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.slots)
+        return slot
+
+    def _collect_assignments(self, node: Optional[ASTNode]) -> None:
+        if node is None:
+            return
+        if node.type in (NodeType.VARIABLE_DECL, NodeType.ASSIGNMENT) and node.value not in ('member', 'array'):
+            self.assigned.add(node.value)
+            self._slot(node.value)
+        for child in node.children:
+            self._collect_assignments(child)
+
+    def _constant_names(self, program: ASTNode) -> Set[str]:
+        """Names whose every assignment is a top-level constant expression"""
+        statements = [node.children[0] if node is not None and node.type == NodeType.RETURN_STATEMENT and node.children
+                      else node for node in program.children]
+        values: Dict[str, List[ASTNode]] = {}
+        for statement in statements:
+            if statement is not None and statement.type in (NodeType.VARIABLE_DECL, NodeType.ASSIGNMENT) \
+                    and statement.value not in ('member', 'array'):
+                values.setdefault(statement.value, []).extend(statement.children[:1])
+        nested = set()
+        for statement in statements:
+            for child in (statement.children if statement is not None else ()):
+                self._assigned_names(child, nested)
+
+        constants: Set[str] = set()
+        changed = True
+        while changed:
+            changed = False
+            for name, nodes in values.items():
+                if name in constants or name in nested or not nodes:
+                    continue
+                if all(self._is_constant(node, constants) for node in nodes):
+                    constants.add(name)
+                    changed = True
+        return constants
+
+    def _assigned_names(self, node: Optional[ASTNode], names: Set[str]) -> None:
+        if node is None:
+            return
+        if node.type in (NodeType.VARIABLE_DECL, NodeType.ASSIGNMENT) and node.value not in ('member', 'array'):
+            names.add(node.value)
+        for child in node.children:
+            self._assigned_names(child, names)
+
+    def _is_constant(self, node: Optional[ASTNode], constants: Set[str]) -> bool:
+        if node is None:
+            return False
+        if node.type == NodeType.LITERAL:
+            return True
+        if node.type == NodeType.IDENTIFIER:
+            return node.value in constants
+        if node.type in (NodeType.BINARY_OP, NodeType.UNARY_OP):
+            return all(self._is_constant(child, constants) for child in node.children)
+        return False
+
+    # Statements
+
+    def _statement(self, node: Optional[ASTNode]) -> Callable:
+        if node is None:
+            return lambda frame: None
+        kind = node.type
+
+        if kind in (NodeType.PROGRAM, NodeType.BLOCK):
+            statements = tuple(self._statement(child) for child in node.children if child is not None)
+
+            def block(frame):
+                for statement in statements:
+                    statement(frame)
+            return block
+
+        if kind == NodeType.IF_STATEMENT:
+            condition = self._expression(node.children[0])
+            then_branch = self._statement(node.children[1])
+            else_branch = self._statement(node.children[2]) if len(node.children) > 2 else self._statement(None)
+
+            def if_statement(frame):
+                if condition(frame):
+                    then_branch(frame)
+                else:
+                    else_branch(frame)
+            return if_statement
+
+        if kind == NodeType.WHILE_STATEMENT:
+            condition = self._expression(node.children[0])
+            body = self._statement(node.children[1])
+
+            def while_statement(frame):
+                while condition(frame):
+                    body(frame)
+            return while_statement
+
+        if kind == NodeType.FOR_STATEMENT:
+            initializer, condition_node, increment_node, body_node = node.children
+            init = self._statement(initializer)
+            condition = self._expression(condition_node) if condition_node else (lambda frame: True)
+            increment = self._expression(increment_node) if increment_node else (lambda frame: None)
+            body = self._statement(body_node)
+
+            def for_statement(frame):
+                init(frame)
+                while condition(frame):
+                    body(frame)
+                    increment(frame)
+            return for_statement
+
+        if kind == NodeType.RETURN_STATEMENT:
+            value = self._expression(node.children[0]) if node.children else (lambda frame: None)
+
+            def return_statement(frame):
+                raise _Return(value(frame))
+            return return_statement
+
+        if kind == NodeType.VARIABLE_DECL:
+            slot = self._slot(node.value)
+            if not node.children:
+                def declare(frame):
+                    frame[slot] = None
+                return declare
+            return self._store(slot, self._expression(node.children[0]))
+
+        return self._expression(node)
+
+    # Expressions
+
+    def _expression(self, node: ASTNode) -> Callable:
+        kind = node.type
+
+        if kind == NodeType.LITERAL:
+            value = node.value
+            return lambda frame: value
+
+        if kind == NodeType.IDENTIFIER:
+            slot = self._slot(node.value)
+            return lambda frame: frame[slot]
+
+        if kind == NodeType.ASSIGNMENT:
+            if node.value == 'array':
+                target, value_node = node.children
+                container = self._expression(target.children[0])
+                index = self._expression(target.children[1])
+                value = self._expression(value_node)
+
+                def set_item(frame):
+                    result = value(frame)
+                    container(frame)[int(index(frame))] = result
+                    return result
+                return set_item
+            if node.value == 'member':
+                target, value_node = node.children
+                owner = self._expression(target.children[0])
+                name = target.value
+                value = self._expression(value_node)
+
+                def set_member(frame):
+                    result = value(frame)
+                    holder = owner(frame)
+                    if isinstance(holder, dict):
+                        holder[name] = result
+                    else:
+                        setattr(holder, name, result)
+                    return result
+                return set_member
+            return self._store(self._slot(node.value), self._expression(node.children[0]))
+
+        if kind == NodeType.BINARY_OP:
+            left = self._expression(node.children[0])
+            right = self._expression(node.children[1])
+            op = node.value
+            if op == 'and':
+                return lambda frame: left(frame) and right(frame)
+            if op == 'or':
+                return lambda frame: left(frame) or right(frame)
+            func = BINARY_OPERATORS.get(op)
+            if func is None:
+                raise InterpreterError(f"Unsupported operator '{op}' at line {node.line}")
+            return lambda frame: func(left(frame), right(frame))
+
+        if kind == NodeType.UNARY_OP:
+            operand = self._expression(node.children[0])
+            func = UNARY_OPERATORS.get(node.value)
+            if func is None:
+                raise InterpreterError(f"Unsupported operator '{node.value}' at line {node.line}")
+            return lambda frame: func(operand(frame))
+
+        if kind == NodeType.ARRAY_ACCESS:
+            target, index_node = node.children
+            index = self._expression(index_node)
+            if target.type == NodeType.IDENTIFIER:
+                return self._history_access(target.value, index)
+            container = self._expression(target)
+            return lambda frame: container(frame)[int(index(frame))]
+
+        if kind == NodeType.MEMBER_ACCESS:
+            owner = self._expression(node.children[0])
+            name = node.value
+
+            def get_member(frame):
+                holder = owner(frame)
+                return holder[name] if isinstance(holder, dict) else getattr(holder, name)
+            return get_member
+
+        if kind == NodeType.FUNCTION_CALL:
+            return self._call(node)
+
+        raise InterpreterError(f"Cannot compile node {kind.value} at line {node.line}")
+
+    def _store(self, slot: int, value: Callable) -> Callable:
+        def store(frame):
+            result = frame[slot] = value(frame)
+            return result
+        return store
+
+    def _history_access(self, name: str, index: Callable) -> Callable:
+        """`name[offset]`: offset 0 is the current bar, history comes from a ring buffer"""
+        slot = self._slot(name)
+        self.history_slots.add(slot)
+
+        def history_access(frame):
+            offset = int(index(frame))
+            if offset == 0:
+                return frame[slot]
+            return frame.state.history[slot].get(offset - 1)
+        return history_access
+
+    def _call(self, node: ASTNode) -> Callable:
+        name = node.value
+        args = tuple(self._expression(arg) for arg in node.children)
+
+        if name in STREAMING_KERNELS and self.kernels.supports(name, args):
+            # numbered in compile order, so the id is the same for every run of the program
+            call_site = next(self.call_sites)
+
+            def ta_call(frame):
+                state = frame.state
+                return state.ta_engine.update(call_site, name, [arg(frame) for arg in args], state.bar_index)
+            return ta_call
+
+        func = self.functions.get(name)
+        if func is None:
+            raise InterpreterError(f"Unknown function '{name}' at line {node.line}")
+        if name in self.series_functions:
+            return self._series_call(node, func, args)
+        if len(args) == 1:
+            only = args[0]
+            return lambda frame: func(only(frame))
+        if len(args) == 2:
+            first, second = args
+            return lambda frame: func(first(frame), second(frame))
+        return lambda frame: func(*[arg(frame) for arg in args])
+
+    def _series_call(self, node: ASTNode, func: Callable, args: tuple) -> Callable:
+        passed = tuple(arg if self._is_constant(arg_node, self.constants) else self._series_arg(arg_node, arg)
+                       for arg_node, arg in zip(node.children, args))
+
+        def series_call(frame):
+            return latest_value(func(*[arg(frame) for arg in passed]))
+        return series_call
+
+    def _series_arg(self, node: ASTNode, value: Callable) -> Callable:
+        """History of an argument up to the current bar; one buffer per name or per argument node"""
+        key = node.value if node.type == NodeType.IDENTIFIER else next(self.call_sites)
+
+        def series_arg(frame):
+            current = value(frame)
+            state = frame.state
+            buffer = state.series_buffer(key)
+            if state.written.get(key) == state.bar_index:
+                buffer.set_last(current)
+            else:
+                buffer.append(current)
+                state.written[key] = state.bar_index
+            return buffer.view()
+        return series_arg
@@ -1,59 +1,7 @@
 from enum import Enum
 from typing import List, Optional
-from dataclasses import dataclass
 
-class TokenType(Enum):
-    # Literals
-    NUMBER = "NUMBER"
-    STRING = "STRING" 
-    IDENTIFIER = "IDENTIFIER"
-    SYNTAX = "SYNTAX"
-    
-    # Operators
-    PLUS = "+"
-    MINUS = "-"
-    STAR = "*"
-    SLASH = "/"
-    EQUAL = "="
-    GREATER = ">"
-    LESS = "<"
-    GREATER_EQUAL = ">="
-    LESS_EQUAL = "<="
-    EQUAL_EQUAL = "=="
-    NOT_EQUAL = "!="
-    
-    # Delimiters
-    LPAREN = "("
-    RPAREN = ")"
-    LBRACE = "{"
-    RBRACE = "}"
-    COMMA = ","
-    DOT = "."
-    SEMICOLON = ";"
-    
-    # Keywords
-    IF = "if"
-    ELSE = "else"
-    FOR = "for"
-    WHILE = "while"
-    RETURN = "return"
-    BREAK = "break"
-    CONTINUE = "continue"
-    VAR = "var"
-    TRUE = "true" 
-    FALSE = "false"
-    AND = "and"
-    OR = "or"
-    NOT = "not"
-    
-    EOF = "EOF"
-
-@dataclass
-class Token:
-    type: TokenType
-    value: str
-    line: int = 1
-    column: int = 1
+from .tokenizer import Token, TokenType
 
 class NodeType(Enum):
     PROGRAM = "PROGRAM"
@@ -84,7 +32,8 @@ class ASTNode:
 
 class Parser:
     def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+        # line breaks only separate statements, which the grammar does without
+        self.tokens = [token for token in tokens if token.type != TokenType.NEWLINE]
         self.current = 0
         self.had_error = False
         self.errors = []
@@ -182,6 +131,14 @@ class Parser:
         
         return ASTNode(NodeType.FOR_STATEMENT, children=[initializer, condition, increment, body])
 
+    def return_statement(self) -> ASTNode:
+        keyword = self.previous()
+        value = None
+        if not self.check(TokenType.SEMICOLON) and not self.check(TokenType.RBRACE) and not self.is_at_end():
+            value = self.expression()
+        self.match(TokenType.SEMICOLON)
+        return ASTNode(NodeType.RETURN_STATEMENT, children=[value] if value is not None else [], token=keyword)
+
     def block(self) -> ASTNode:
         statements = []
         while not self.check(TokenType.RBRACE) and not self.is_at_end():
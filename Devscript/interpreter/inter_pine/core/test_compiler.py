@@ -0,0 +1,71 @@
+import unittest
+from inter_pine.core.compiler import Compiler
+from inter_pine.core.exceptions import InterpreterError
+from inter_pine.core.parser import ASTNode, NodeType
+
+def literal(value):
+    return ASTNode(NodeType.LITERAL, value)
+
+def ident(name):
+    return ASTNode(NodeType.IDENTIFIER, name)
+
+def binary(op, left, right):
+    return ASTNode(NodeType.BINARY_OP, op, [left, right])
+
+def call(name, *args):
+    return ASTNode(NodeType.FUNCTION_CALL, name, list(args))
+
+def assign(name, value):
+    return ASTNode(NodeType.ASSIGNMENT, name, [value])
+
+def program(*statements):
+    return ASTNode(NodeType.PROGRAM, children=list(statements))
+
+class TestCompiler(unittest.TestCase):
+    def setUp(self):
+        self.bars = [{'close': float(i), 'open': float(i) - 0.5} for i in range(1, 31)]
+
+    def test_arithmetic_and_inputs(self):
+        script = Compiler().compile(program(
+            assign('spread', binary('-', ident('close'), ident('open'))),
+            assign('double', binary('*', ident('spread'), literal(2.0))),
+        ))
+        result = script.run(self.bars)
+        self.assertEqual(result['spread'], [0.5] * 30)
+        self.assertEqual(result['double'], [1.0] * 30)
+        self.assertNotIn('close', result)
+
+    def test_history_access(self):
+        history = ASTNode(NodeType.ARRAY_ACCESS, children=[ident('close'), literal(2.0)])
+        script = Compiler().compile(program(assign('prev', history)))
+        result = script.run(self.bars)
+        self.assertIsNone(result['prev'][1])
+        self.assertEqual(result['prev'][5], self.bars[3]['close'])
+
+    def test_if_statement(self):
+        condition = binary('>', ident('close'), literal(10.0))
+        script = Compiler().compile(program(
+            assign('signal', literal(0.0)),
+            ASTNode(NodeType.IF_STATEMENT, children=[condition, assign('signal', literal(1.0)), None]),
+        ))
+        result = script.run(self.bars)
+        self.assertEqual(sum(result['signal']), 20.0)
+
+    def test_ta_call_streams_per_bar(self):
+        script = Compiler().compile(program(assign('avg', call('taSma', ident('close'), literal(3)))))
+        result = script.run(self.bars)
+        self.assertTrue(result['avg'][1] != result['avg'][1])
+        self.assertAlmostEqual(result['avg'][-1], 29.0)
+
+    def test_custom_functions_and_return(self):
+        script = Compiler({'half': lambda value: value / 2}).compile(program(
+            ASTNode(NodeType.RETURN_STATEMENT, children=[call('half', ident('close'))]),
+        ))
+        self.assertEqual(script.step({'close': 8.0}), 4.0)
+
+    def test_unknown_function_fails_at_compile_time(self):
+        with self.assertRaises(InterpreterError):
+            Compiler().compile(program(call('missing', ident('close'))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,3 +2,4 @@
 from .technical import TechnicalAnalysis, TechnicalAnalysisEngine
 from .patterns import PatternsEngine, PatternSyntax, HarmonicEngine, ElliottWaveEngine, FibonacciEngine
 from .micro_structures import OrderFlowEngine, MicroStructuresSyntax, AuctionMarketEngine
+from .streaming import StreamingTAEngine, RollingWindow
@@ -0,0 +1,1127 @@
+import copy
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+NA = float('nan')
+
+# Running sums drift slightly with floating point error, so each rolling
+# window is re-summed from scratch after this many updates.
+RESUM_INTERVAL = 4096
+
+
+def _is_na(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _latest(value):
+    """Current bar value of a series argument (list/array history or scalar)"""
+    if isinstance(value, (list, tuple, np.ndarray, deque)):
+        return value[-1] if len(value) else NA
+    if value is None:
+        return NA
+    return value
+
+
+class RollingWindow:
+    """Fixed length window with O(1) running sum / sum of squares and a contiguous view"""
+
+    def __init__(self, length: int, track_squares: bool = False):
+        self.length = max(int(length), 1)
+        self.track_squares = track_squares
+        self._buffer = np.full(self.length * 2, NA)
+        self._head = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.na_count = 0
+        self._updates = 0
+
+    def push(self, value: float) -> float:
+        """Append a value and return the one that fell out of the window (NA if none)"""
+        value = NA if _is_na(value) else float(value)
+        dropped = NA
+        if self.count == self.length:
+            dropped = self._buffer[self._head]
+            self._remove(dropped)
+        else:
+            self.count += 1
+        self._buffer[self._head] = value
+        self._buffer[self._head + self.length] = value
+        self._head = (self._head + 1) % self.length
+        self._add(value)
+
+        self._updates += 1
+        if self._updates % RESUM_INTERVAL == 0:
+            self._resum()
+        return dropped
+
+    def _add(self, value: float) -> None:
+        if math.isnan(value):
+            self.na_count += 1
+            return
+        self.total += value
+        if self.track_squares:
+            self.total_sq += value * value
+
+    def _remove(self, value: float) -> None:
+        if math.isnan(value):
+            self.na_count -= 1
+            return
+        self.total -= value
+        if self.track_squares:
+            self.total_sq -= value * value
+
+    def _resum(self) -> None:
+        window = self.view()
+        valid = window[~np.isnan(window)]
+        self.total = float(valid.sum())
+        if self.track_squares:
+            self.total_sq = float(np.dot(valid, valid))
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.length
+
+    @property
+    def ready(self) -> bool:
+        return self.count == self.length and self.na_count == 0
+
+    def view(self) -> np.ndarray:
+        """Oldest-to-newest values in the window without copying"""
+        end = self._head + self.length
+        return self._buffer[end - self.count:end]
+
+    def get(self, offset: int = 0) -> float:
+        """Value `offset` bars back from the newest one"""
+        if offset >= self.count:
+            return NA
+        return self._buffer[self._head + self.length - 1 - offset]
+
+
+class SmaKernel:
+    def __init__(self, period):
+        self.window = RollingWindow(period)
+
+    def update(self, source):
+        self.window.push(source)
+        if not self.window.ready:
+            return NA
+        return self.window.total / self.window.length
+
+
+class EmaKernel:
+    """Exponential smoothing seeded with the SMA of the first `period` values"""
+
+    def __init__(self, period, alpha: Optional[float] = None):
+        self.period = max(int(period), 1)
+        self.alpha = alpha if alpha is not None else 2.0 / (self.period + 1)
+        self.value = NA
+        self._seed_sum = 0.0
+        self._seed_count = 0
+
+    def update(self, source):
+        if _is_na(source):
+            return self.value
+        if math.isnan(self.value):
+            self._seed_sum += source
+            self._seed_count += 1
+            if self._seed_count == self.period:
+                self.value = self._seed_sum / self.period
+            return self.value
+        self.value = self.alpha * source + (1 - self.alpha) * self.value
+        return self.value
+
+
+class RmaKernel(EmaKernel):
+    """Wilder's smoothing (alpha = 1 / period)"""
+
+    def __init__(self, period):
+        super().__init__(period, alpha=1.0 / max(int(period), 1))
+
+
+class SeededEmaKernel:
+    """Exponential smoothing seeded with the first value, NA until `period` values are in"""
+
+    def __init__(self, period):
+        self.period = max(int(period), 1)
+        self.alpha = 2.0 / (self.period + 1)
+        self.value = NA
+        self.count = 0
+
+    def update(self, source):
+        self.count += 1
+        if self.count == 1:
+            self.value = source
+        else:
+            self.value = self.alpha * source + (1 - self.alpha) * self.value
+        return self.value if self.count >= self.period else NA
+
+
+class WmaKernel:
+    """Linearly weighted average kept in O(1) with a running weighted numerator"""
+
+    def __init__(self, period):
+        self.window = RollingWindow(period)
+        self.period = self.window.length
+        self.denominator = self.period * (self.period + 1) / 2.0
+        self.numerator = NA
+
+    def update(self, source):
+        previous_total = self.window.total
+        was_full = self.window.full
+        self.window.push(source)
+        if not self.window.ready:
+            self.numerator = NA
+            return NA
+        if not was_full or math.isnan(self.numerator):
+            weights = np.arange(1, self.period + 1)
+            self.numerator = float(np.dot(self.window.view(), weights))
+        else:
+            self.numerator = self.numerator - previous_total + self.period * float(source)
+        return self.numerator / self.denominator
+
+
+class HmaKernel:
+    """Hull MA as the taHma builtin computes it: the short WMA covers the oldest half of each window"""
+
+    def __init__(self, period):
+        period = max(int(period), 1)
+        half = period // 2
+        # the half-length WMA ends `period - half` bars before the current one
+        self.delay = RollingWindow(period - half + 1)
+        self.half = WmaKernel(half) if half else None
+        self.full = WmaKernel(period)
+        self.smooth = WmaKernel(max(int(period ** 0.5), 1))
+
+    def update(self, source):
+        self.delay.push(source)
+        full = self.full.update(source)
+        half = NA
+        if self.half is None:
+            half = 0.0
+        elif self.delay.full:
+            half = self.half.update(self.delay.get(self.delay.length - 1))
+        if math.isnan(full) or math.isnan(half):
+            return NA
+        return self.smooth.update(2 * half - full)
+
+
+class AlmaKernel:
+    """Arnaud Legoux MA: fixed gaussian weights dotted with the contiguous window, the first weight on the newest value"""
+
+    def __init__(self, period, offset=0.85, sigma=6):
+        self.window = RollingWindow(period)
+        length = self.window.length
+        m = offset * (length - 1)
+        s = length / sigma
+        weights = np.exp(-((np.arange(length) - m) ** 2) / (2 * s * s))
+        self.weights = (weights / weights.sum())[::-1]
+
+    def update(self, source):
+        self.window.push(source)
+        if not self.window.ready:
+            return NA
+        return float(np.dot(self.window.view(), self.weights))
+
+
+class SwmaKernel:
+    WEIGHTS = np.array([1.0, 2.0, 2.0, 1.0]) / 6.0
+
+    def __init__(self):
+        self.window = RollingWindow(4)
+
+    def update(self, source):
+        self.window.push(source)
+        if not self.window.ready:
+            return NA
+        return float(np.dot(self.window.view(), self.WEIGHTS))
+
+
+class VarianceKernel:
+    """Population variance from a running sum and sum of squares"""
+
+    def __init__(self, period):
+        self.window = RollingWindow(period, track_squares=True)
+
+    def update(self, source):
+        self.window.push(source)
+        if not self.window.ready:
+            return NA
+        n = self.window.length
+        mean = self.window.total / n
+        return max(self.window.total_sq / n - mean * mean, 0.0)
+
+
+class StdevKernel(VarianceKernel):
+    def update(self, source):
+        return math.sqrt(super().update(source))
+
+
+class BollingerKernel:
+    def __init__(self, period, multiplier):
+        self.variance = VarianceKernel(period)
+        self.multiplier = multiplier
+
+    def update(self, source):
+        variance = self.variance.update(source)
+        if math.isnan(variance):
+            return NA
+        std = math.sqrt(variance)
+        window = self.variance.window
+        middle = window.total / window.length
+        return {'middle': middle, 'upper': middle + self.multiplier * std, 'lower': middle - self.multiplier * std}
+
+
+class BollingerWidthKernel(BollingerKernel):
+    def update(self, source):
+        bands = super().update(source)
+        if _is_na(bands) or bands['middle'] == 0:
+            return NA
+        return (bands['upper'] - bands['lower']) / bands['middle'] * 100
+
+
+class DevKernel:
+    """Mean absolute deviation from the window mean"""
+
+    def __init__(self, period):
+        self.window = RollingWindow(period)
+
+    def update(self, source):
+        self.window.push(source)
+        if not self.window.ready:
+            return NA
+        view = self.window.view()
+        mean = self.window.total / self.window.length
+        return float(np.abs(view - mean).mean())
+
+
+class CciKernel:
+    """Commodity channel index of the typical price"""
+
+    def __init__(self, period):
+        self.dev = DevKernel(period)
+
+    def update(self, high, low, close):
+        typical = (high + low + close) / 3
+        deviation = self.dev.update(typical)
+        if math.isnan(deviation):
+            return NA
+        if deviation == 0:
+            return 0
+        window = self.dev.window
+        mean = window.total / window.length
+        return (typical - mean) / (0.015 * deviation)
+
+
+class ChangeKernel:
+    def __init__(self, length=1):
+        self.window = RollingWindow(int(length) + 1)
+
+    def update(self, source):
+        self.window.push(source)
+        if not self.window.full:
+            return NA
+        return self.window.get(0) - self.window.get(self.window.length - 1)
+
+
+class MomKernel(ChangeKernel):
+    """Current value minus the one `period - 1` bars back, the oldest of the window"""
+
+    def __init__(self, period):
+        super().__init__(max(int(period), 1) - 1)
+
+
+class RocKernel(MomKernel):
+    def update(self, source):
+        change = super().update(source)
+        base = self.window.get(self.window.length - 1)
+        if math.isnan(change) or base == 0:
+            return NA
+        return 100 * change / base
+
+
+class CmoKernel:
+    def __init__(self, period):
+        self.previous = NA
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+
+    def update(self, source):
+        change = source - self.previous if not _is_na(source) else NA
+        self.previous = source
+        if _is_na(change):
+            return NA
+        self.gains.push(max(change, 0.0))
+        self.losses.push(max(-change, 0.0))
+        if not self.gains.ready:
+            return NA
+        total = self.gains.total + self.losses.total
+        return 100 * (self.gains.total - self.losses.total) / total if total != 0 else 0.0
+
+
+class RsiKernel:
+    """RSI from the simple average of the last `period` gains and losses"""
+
+    def __init__(self, period):
+        self.previous = NA
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+
+    def update(self, source):
+        change = source - self.previous if not _is_na(source) else NA
+        self.previous = source
+        if _is_na(change):
+            return NA
+        self.gains.push(max(change, 0.0))
+        self.losses.push(max(-change, 0.0))
+        if not self.gains.ready:
+            return NA
+        if self.losses.total == 0:
+            return 100
+        return 100 - 100 / (1 + self.gains.total / self.losses.total)
+
+
+class TrKernel:
+    def __init__(self):
+        self.previous_close = NA
+
+    def update(self, high, low, close):
+        if math.isnan(self.previous_close):
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self.previous_close), abs(low - self.previous_close))
+        self.previous_close = close
+        return tr
+
+
+class AtrKernel:
+    """Simple average of the last `period` true ranges"""
+
+    def __init__(self, period):
+        self.tr = TrKernel()
+        self.window = RollingWindow(period)
+
+    def update(self, high, low, close):
+        self.window.push(self.tr.update(high, low, close))
+        if not self.window.ready:
+            return NA
+        return self.window.total / self.window.length
+
+
+class DmiKernel:
+    """+DI, -DI and DX from the last `period` bars of directional movement"""
+
+    def __init__(self, period):
+        self.previous_high = NA
+        self.previous_low = NA
+        self.tr = RollingWindow(period)
+        self.plus_dm = RollingWindow(period)
+        self.minus_dm = RollingWindow(period)
+
+    def update(self, high, low):
+        previous_high, previous_low = self.previous_high, self.previous_low
+        self.previous_high, self.previous_low = high, low
+        if math.isnan(previous_high):
+            return NA
+        up = high - previous_high
+        down = previous_low - low
+        self.tr.push(max(high - low, abs(high - previous_low), abs(low - previous_high)))
+        self.plus_dm.push(max(up, 0) if up > down else 0)
+        self.minus_dm.push(max(down, 0) if down > up else 0)
+        if not self.tr.ready:
+            return NA
+        tr = self.tr.total
+        plus_di = 100 * self.plus_dm.total / tr if tr != 0 else 0
+        minus_di = 100 * self.minus_dm.total / tr if tr != 0 else 0
+        total = plus_di + minus_di
+        dx = 100 * abs(plus_di - minus_di) / total if total != 0 else 0
+        return {'plus_di': plus_di, 'minus_di': minus_di, 'dx': dx}
+
+
+class ExtremumKernel:
+    """Rolling highest/lowest with a monotonic deque of (bar, value)"""
+
+    def __init__(self, period, highest=True):
+        self.period = max(int(period), 1)
+        self.highest = highest
+        self.bar = -1
+        self.candidates = deque()
+
+    def push(self, source):
+        self.bar += 1
+        if not _is_na(source):
+            candidates = self.candidates
+            if self.highest:
+                while candidates and candidates[-1][1] <= source:
+                    candidates.pop()
+            else:
+                while candidates and candidates[-1][1] >= source:
+                    candidates.pop()
+            candidates.append((self.bar, source))
+        while self.candidates and self.candidates[0][0] <= self.bar - self.period:
+            self.candidates.popleft()
+
+    def update(self, source):
+        self.push(source)
+        if self.bar + 1 < self.period or not self.candidates:
+            return NA
+        return self.candidates[0][1]
+
+
+class ExtremumBarsKernel(ExtremumKernel):
+    """Bars back to the rolling extremum"""
+
+    def update(self, source):
+        self.push(source)
+        if self.bar + 1 < self.period or not self.candidates:
+            return NA
+        return self.bar - self.candidates[0][0]
+
+
+class RangeKernel:
+    """Highest minus lowest value of the window"""
+
+    def __init__(self, period):
+        self.highest = ExtremumKernel(period, highest=True)
+        self.lowest = ExtremumKernel(period, highest=False)
+
+    def update(self, source):
+        return self.highest.update(source) - self.lowest.update(source)
+
+
+class StochKernel:
+    def __init__(self, period, smooth_k, smooth_d):
+        self.highest = ExtremumKernel(period, highest=True)
+        self.lowest = ExtremumKernel(period, highest=False)
+        self.smooth_k = smooth_k
+        self.smooth_d = smooth_d
+
+    def update(self, high, low, close):
+        highest = self.highest.update(high)
+        lowest = self.lowest.update(low)
+        if math.isnan(highest) or math.isnan(lowest):
+            return NA
+        k_raw = 100 * (close - lowest) / (highest - lowest)
+        # same arithmetic as the taStoch builtin, so the results match bit for bit
+        k = sum([k_raw] * self.smooth_k) / self.smooth_k
+        return {'k': k, 'd': sum([k] * self.smooth_d) / self.smooth_d}
+
+
+class WprKernel:
+    def __init__(self, period):
+        self.highest = ExtremumKernel(period, highest=True)
+        self.lowest = ExtremumKernel(period, highest=False)
+
+    def update(self, high, low, close):
+        highest = self.highest.update(high)
+        lowest = self.lowest.update(low)
+        spread = highest - lowest
+        if math.isnan(spread) or spread == 0:
+            return NA
+        return -100 * (highest - close) / spread
+
+
+class MacdKernel:
+    """MACD of two EMAs seeded with the first value; the signal is one smoothing step of the MACD line"""
+
+    def __init__(self, fast_period, slow_period, signal_period):
+        self.alpha_fast = 2 / (fast_period + 1)
+        self.alpha_slow = 2 / (slow_period + 1)
+        self.alpha_signal = 2 / (signal_period + 1)
+        self.warmup = max(fast_period, slow_period, signal_period)
+        self.fast = NA
+        self.slow = NA
+        self.count = 0
+
+    def update(self, source):
+        self.count += 1
+        if self.count == 1:
+            self.fast = self.slow = source
+        else:
+            self.fast = self.alpha_fast * source + (1 - self.alpha_fast) * self.fast
+            self.slow = self.alpha_slow * source + (1 - self.alpha_slow) * self.slow
+        if self.count < self.warmup:
+            return NA
+        macd = self.fast - self.slow
+        signal = self.alpha_signal * macd + (1 - self.alpha_signal) * (self.fast - self.slow)
+        return {'macd': macd, 'signal': signal, 'histogram': macd - signal}
+
+
+class TsiKernel:
+    """True strength index from double-smoothed momentum, each smoothing seeded with its first input"""
+
+    def __init__(self, r_period, s_period):
+        self.alpha_r = 2 / (r_period + 1)
+        self.alpha_s = 2 / (s_period + 1)
+        self.warmup = max(r_period, s_period, 4)
+        self.previous = NA
+        self.count = 0
+        self.smooth = [NA, NA]
+        self.abs_smooth = [NA, NA]
+
+    def _smooth(self, state, momentum):
+        # the second smoothing is seeded with the first one's second value
+        if self.count == 2:
+            state[0] = momentum
+            return
+        state[0] = self.alpha_r * momentum + (1 - self.alpha_r) * state[0]
+        if self.count == 3:
+            state[1] = state[0]
+        else:
+            state[1] = self.alpha_s * state[0] + (1 - self.alpha_s) * state[1]
+
+    def update(self, source):
+        self.count += 1
+        momentum = source - self.previous
+        self.previous = source
+        if self.count == 1:
+            return NA
+        self._smooth(self.smooth, momentum)
+        self._smooth(self.abs_smooth, abs(momentum))
+        if self.count < self.warmup:
+            return NA
+        return 100 * (self.smooth[1] / self.abs_smooth[1]) if self.abs_smooth[1] != 0 else 0
+
+
+class LinRegKernel:
+    """Least squares line over the window using running sums of y and x*y"""
+
+    def __init__(self, period, offset=0):
+        self.window = RollingWindow(period)
+        n = self.window.length
+        self.offset = offset
+        self.sum_x = n * (n - 1) / 2.0
+        self.sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
+        self.sum_xy = NA
+
+    def update(self, source):
+        previous_total = self.window.total
+        dropped = self.window.push(source)
+        n = self.window.length
+        if not self.window.ready:
+            self.sum_xy = NA
+            return NA
+        if math.isnan(self.sum_xy) or math.isnan(dropped):
+            self.sum_xy = float(np.dot(self.window.view(), np.arange(n)))
+        else:
+            self.sum_xy = self.sum_xy - (previous_total - dropped) + (n - 1) * float(source)
+        if n == 1:
+            return float(source)
+        slope = (n * self.sum_xy - self.sum_x * self.window.total) / (n * self.sum_xx - self.sum_x ** 2)
+        intercept = (self.window.total - slope * self.sum_x) / n
+        return intercept + slope * (n - 1 - self.offset)
+
+
+class CorrelationKernel:
+    def __init__(self, period):
+        self.x = RollingWindow(period, track_squares=True)
+        self.y = RollingWindow(period, track_squares=True)
+        self.xy = RollingWindow(period)
+
+    def update(self, source1, source2):
+        self.x.push(source1)
+        self.y.push(source2)
+        self.xy.push(NA if _is_na(source1) or _is_na(source2) else source1 * source2)
+        if not (self.x.ready and self.y.ready):
+            return NA
+        n = self.x.length
+        cov = self.xy.total / n - (self.x.total / n) * (self.y.total / n)
+        var_x = self.x.total_sq / n - (self.x.total / n) ** 2
+        var_y = self.y.total_sq / n - (self.y.total / n) ** 2
+        if var_x <= 0 or var_y <= 0:
+            return NA
+        return cov / math.sqrt(var_x * var_y)
+
+
+class VwmaKernel:
+    def __init__(self, period):
+        self.weighted = RollingWindow(period)
+        self.volume = RollingWindow(period)
+
+    def update(self, source, volume):
+        self.weighted.push(source * volume)
+        self.volume.push(volume)
+        if not self.weighted.ready or self.volume.total == 0:
+            return NA
+        return self.weighted.total / self.volume.total
+
+
+class VwapKernel:
+    """Volume weighted typical price since the first bar"""
+
+    def __init__(self):
+        self.weighted = 0.0
+        self.volume = 0.0
+
+    def update(self, high, low, close, volume):
+        self.weighted += (high + low + close) / 3 * volume
+        self.volume += volume
+        return self.weighted / self.volume if self.volume != 0 else NA
+
+
+class MfiKernel:
+    def __init__(self, period):
+        self.previous = NA
+        self.positive = RollingWindow(period)
+        self.negative = RollingWindow(period)
+
+    def update(self, high, low, close, volume):
+        typical = (high + low + close) / 3
+        change = typical - self.previous
+        self.previous = typical
+        if math.isnan(change):
+            return NA
+        flow = typical * volume
+        # an unchanged typical price counts as negative flow
+        self.positive.push(flow if change > 0 else 0.0)
+        self.negative.push(0.0 if change > 0 else flow)
+        if not self.positive.ready:
+            return NA
+        total = self.positive.total + self.negative.total
+        return 100 * self.positive.total / total if total != 0 else 50
+
+
+class CogKernel:
+    """Center of gravity; newest value weighted 1, oldest weighted `period`"""
+
+    def __init__(self, period):
+        self.window = RollingWindow(period)
+        self.numerator = 0.0
+
+    def update(self, source):
+        previous_total = self.window.total
+        dropped = self.window.push(source)
+        if self.window.na_count:
+            self.numerator = NA
+            return NA
+        if math.isnan(self.numerator):
+            weights = np.arange(self.window.count, 0, -1)
+            self.numerator = float(np.dot(self.window.view(), weights))
+        elif math.isnan(dropped):
+            self.numerator = self.numerator + previous_total + source
+        else:
+            self.numerator = self.numerator + previous_total - (self.window.length + 1) * dropped + source
+        if not self.window.full:
+            return NA
+        if self.window.total == 0:
+            return 0
+        return -self.numerator / self.window.total
+
+
+class SortedWindowKernel:
+    """Window kept both in arrival order and sorted order for order statistics"""
+
+    def __init__(self, period):
+        self.period = max(int(period), 1)
+        self.arrival = deque()
+        self.ordered: List[float] = []
+
+    def push(self, source):
+        if _is_na(source):
+            source = NA
+        self.arrival.append(source)
+        if not math.isnan(source):
+            insort(self.ordered, source)
+        if len(self.arrival) > self.period:
+            dropped = self.arrival.popleft()
+            if not math.isnan(dropped):
+                del self.ordered[bisect_left(self.ordered, dropped)]
+
+    @property
+    def ready(self) -> bool:
+        return len(self.arrival) == self.period and len(self.ordered) == self.period
+
+
+class MedianKernel(SortedWindowKernel):
+    def update(self, source):
+        self.push(source)
+        if not self.ready:
+            return NA
+        mid = self.period // 2
+        if self.period % 2:
+            return self.ordered[mid]
+        return (self.ordered[mid - 1] + self.ordered[mid]) / 2
+
+
+class PercentileLinearKernel(SortedWindowKernel):
+    def __init__(self, period, percentage):
+        super().__init__(period)
+        self.percentage = percentage
+
+    def update(self, source):
+        self.push(source)
+        if not self.ready:
+            return NA
+        index = (self.period - 1) * self.percentage / 100
+        lower = int(index)
+        if lower + 1 >= self.period:
+            return self.ordered[-1]
+        fraction = index - lower
+        return self.ordered[lower] + fraction * (self.ordered[lower + 1] - self.ordered[lower])
+
+
+class PercentileNearestKernel(PercentileLinearKernel):
+    def update(self, source):
+        self.push(source)
+        if not self.ready:
+            return NA
+        rank = max(int(math.ceil(self.percentage / 100 * self.period)), 1)
+        return self.ordered[min(rank, self.period) - 1]
+
+
+class PercentRankKernel(SortedWindowKernel):
+    """Percent of the other `period - 1` window values that are below the current one"""
+
+    def update(self, source):
+        self.push(source)
+        if not self.ready or _is_na(source):
+            return NA
+        return 100 * bisect_left(self.ordered, source) / (self.period - 1)
+
+
+class ModeKernel:
+    """Most frequent window value; ties resolve to the one that entered the window first"""
+
+    def __init__(self, period):
+        self.period = max(int(period), 1)
+        self.arrival = deque()
+        self.counts: Dict[float, int] = {}
+
+    def update(self, source):
+        self.arrival.append(source)
+        self.counts[source] = self.counts.get(source, 0) + 1
+        if len(self.arrival) > self.period:
+            dropped = self.arrival.popleft()
+            self.counts[dropped] -= 1
+            if not self.counts[dropped]:
+                del self.counts[dropped]
+        if len(self.arrival) < self.period:
+            return NA
+        top = max(self.counts.values())
+        return next(value for value in self.arrival if self.counts[value] == top)
+
+
+class PivotKernel:
+    """Pivot value confirmed `right` bars after it printed, NA otherwise; ties are allowed on the left only"""
+
+    def __init__(self, left, right, highest=True):
+        self.left = int(left)
+        self.right = int(right)
+        self.highest = highest
+        self.window = RollingWindow(self.left + self.right + 1)
+
+    def update(self, source):
+        self.window.push(source)
+        if not self.window.ready:
+            return NA
+        view = self.window.view()
+        center = view[self.left]
+        left, right = view[:self.left], view[self.left + 1:]
+        if self.highest and (left <= center).all() and (right < center).all():
+            return center
+        if not self.highest and (left >= center).all() and (right > center).all():
+            return center
+        return NA
+
+
+class CumKernel:
+    def __init__(self):
+        self.total = 0.0
+
+    def update(self, source):
+        if not _is_na(source):
+            self.total += source
+        return self.total
+
+
+class BarsSinceKernel:
+    """Bars since the condition was last true, or since the first bar if it never was"""
+
+    def __init__(self):
+        self.count = 0
+
+    def update(self, condition):
+        self.count = 0 if condition else self.count + 1
+        return self.count
+
+
+class ValueWhenKernel:
+    def __init__(self, occurrence=0):
+        self.values = deque(maxlen=int(occurrence) + 1)
+
+    def update(self, condition, source):
+        if condition:
+            self.values.appendleft(source)
+        if len(self.values) < self.values.maxlen:
+            return NA
+        return self.values[-1]
+
+
+class TrendKernel:
+    """Rising/falling: the last `period` values move strictly in one direction"""
+
+    def __init__(self, period, rising=True):
+        self.period = max(int(period), 1)
+        self.rising = rising
+        self.previous = NA
+        self.streak = 0
+
+    def update(self, source):
+        moved = source > self.previous if self.rising else source < self.previous
+        self.streak = self.streak + 1 if moved else 0
+        self.previous = source
+        return self.streak >= self.period - 1
+
+
+class CrossKernel:
+    def __init__(self, direction='both'):
+        self.direction = direction
+        self.previous: Optional[Tuple[float, float]] = None
+
+    def update(self, source1, source2):
+        previous = self.previous
+        self.previous = (source1, source2)
+        if previous is None:
+            return False
+        over = previous[0] <= previous[1] and source1 > source2
+        under = previous[0] >= previous[1] and source1 < source2
+        if self.direction == 'over':
+            return over
+        if self.direction == 'under':
+            return under
+        return over or under
+
+
+class SarKernel:
+    """Parabolic SAR advanced one bar at a time"""
+
+    def __init__(self, acceleration=0.02, maximum=0.2):
+        self.acceleration = acceleration
+        self.maximum = maximum
+        self.trend = 1
+        self.sar = NA
+        self.extreme_point = NA
+        self.acc_factor = acceleration
+
+    def update(self, high, low):
+        if math.isnan(self.sar):
+            self.sar = low
+            self.extreme_point = high
+            return NA
+        if self.trend == 1:
+            self.sar = self.sar + self.acc_factor * (self.extreme_point - self.sar)
+            if low < self.sar:
+                self.trend = -1
+                self.sar = self.extreme_point
+                self.extreme_point = low
+                self.acc_factor = self.acceleration
+            elif high > self.extreme_point:
+                self.extreme_point = high
+                self.acc_factor = min(self.acc_factor + self.acceleration, self.maximum)
+        else:
+            self.sar = self.sar - self.acc_factor * (self.sar - self.extreme_point)
+            if high > self.sar:
+                self.trend = 1
+                self.sar = self.extreme_point
+                self.extreme_point = high
+                self.acc_factor = self.acceleration
+            elif low < self.extreme_point:
+                self.extreme_point = low
+                self.acc_factor = min(self.acc_factor + self.acceleration, self.maximum)
+        return self.sar
+
+
+class SuperTrendKernel:
+    """Bands around the bar's midpoint at `multiplier` times the average of the last `period` true ranges"""
+
+    def __init__(self, period, multiplier):
+        self.period = max(int(period), 1)
+        self.multiplier = multiplier
+        self.previous_close = NA
+        self.tr = RollingWindow(self.period)
+        self.count = 0
+
+    def update(self, high, low, close):
+        self.count += 1
+        if not math.isnan(self.previous_close):
+            previous_close = self.previous_close
+            self.tr.push(max(high - low, abs(high - previous_close), abs(low - previous_close)))
+        self.previous_close = close
+        if self.count < self.period:
+            return NA
+        atr = self.tr.total / self.period
+        upper = (high + low) / 2 + self.multiplier * atr
+        lower = (high + low) / 2 - self.multiplier * atr
+        supertrend = upper if close <= upper else lower
+        return {'supertrend': supertrend, 'direction': -1 if close > supertrend else 1}
+
+
+class KeltnerKernel:
+    """Bands at `multiplier` mean deviations around the average typical price"""
+
+    def __init__(self, period, multiplier):
+        self.dev = DevKernel(period)
+        self.multiplier = multiplier
+
+    def channel(self, high, low, close):
+        deviation = self.dev.update((high + low + close) / 3)
+        window = self.dev.window
+        return window.total / window.length, deviation
+
+    def update(self, high, low, close):
+        middle, deviation = self.channel(high, low, close)
+        if math.isnan(deviation):
+            return NA
+        width = self.multiplier * deviation
+        return {'middle': middle, 'upper': middle + width, 'lower': middle - width}
+
+
+class KeltnerWidthKernel(KeltnerKernel):
+    def update(self, high, low, close):
+        middle, deviation = self.channel(high, low, close)
+        if math.isnan(deviation) or middle == 0:
+            return NA
+        return (2 * self.multiplier * deviation) / middle * 100
+
+
+# Argument layout per builtin: 's' series (current bar value taken), 'p' required
+# parameter, 'o' optional parameter.  Parameters build the kernel once per call
+# site, series values are fed to kernel.update() on every bar.
+STREAMING_KERNELS: Dict[str, Tuple[Any, str]] = {
+    'taAlma': (AlmaKernel, 'sppp'),
+    'taAtr': (AtrKernel, 'sssp'),
+    'taBarsSince': (BarsSinceKernel, 's'),
+    'taBb': (BollingerKernel, 'spp'),
+    'taBbw': (BollingerWidthKernel, 'spp'),
+    'taCci': (CciKernel, 'sssp'),
+    'taChange': (ChangeKernel, 's'),
+    'taCmo': (CmoKernel, 'sp'),
+    'taCog': (CogKernel, 'sp'),
+    'taCorrelation': (CorrelationKernel, 'ssp'),
+    'taCross': (lambda: CrossKernel('both'), 'ss'),
+    'taCrossover': (lambda: CrossKernel('over'), 'ss'),
+    'taCrossunder': (lambda: CrossKernel('under'), 'ss'),
+    'taCum': (CumKernel, 's'),
+    'taDev': (DevKernel, 'sp'),
+    'taDmi': (DmiKernel, 'ssp'),
+    'taEma': (SeededEmaKernel, 'sp'),
+    'taFalling': (lambda period: TrendKernel(period, rising=False), 'sp'),
+    'taHighest': (lambda period: ExtremumKernel(period, highest=True), 'sp'),
+    'taHighestBars': (lambda period: ExtremumBarsKernel(period, highest=True), 'sp'),
+    'taHma': (HmaKernel, 'sp'),
+    'taKc': (KeltnerKernel, 'ssspp'),
+    'taKcw': (KeltnerWidthKernel, 'ssspp'),
+    'taLinReg': (LinRegKernel, 'sp'),
+    'taLowest': (lambda period: ExtremumKernel(period, highest=False), 'sp'),
+    'taLowestBars': (lambda period: ExtremumBarsKernel(period, highest=False), 'sp'),
+    'taMacd': (MacdKernel, 'sppp'),
+    'taMax': (lambda period: ExtremumKernel(period, highest=True), 'sp'),
+    'taMedian': (MedianKernel, 'sp'),
+    'taMfi': (MfiKernel, 'ssssp'),
+    'taMin': (lambda period: ExtremumKernel(period, highest=False), 'sp'),
+    'taMode': (ModeKernel, 'sp'),
+    'taMom': (MomKernel, 'sp'),
+    'taPercentile': (PercentileLinearKernel, 'spp'),
+    'taPercentileLinearInterpolation': (PercentileLinearKernel, 'spp'),
+    'taPercentileNearestRank': (PercentileNearestKernel, 'spp'),
+    'taPercentRank': (PercentRankKernel, 'sp'),
+    'taPivotHigh': (lambda left, right: PivotKernel(left, right, highest=True), 'spp'),
+    'taPivotLow': (lambda left, right: PivotKernel(left, right, highest=False), 'spp'),
+    'taRange': (RangeKernel, 'sp'),
+    'taRising': (lambda period: TrendKernel(period, rising=True), 'sp'),
+    'taRma': (RmaKernel, 'sp'),
+    'taRoc': (RocKernel, 'sp'),
+    'taRsi': (RsiKernel, 'sp'),
+    'taSar': (SarKernel, 'sspp'),
+    'taSma': (SmaKernel, 'sp'),
+    'taStdev': (StdevKernel, 'sp'),
+    'taStoch': (StochKernel, 'sssppp'),
+    'taSuperTrend': (SuperTrendKernel, 'ssspp'),
+    'taSwma': (SwmaKernel, 's'),
+    'taTr': (TrKernel, 'sss'),
+    'taTsi': (TsiKernel, 'spp'),
+    'taValueWhen': (ValueWhenKernel, 'ssp'),
+    'taVariance': (VarianceKernel, 'sp'),
+    'taVwap': (VwapKernel, 'ssss'),
+    'taVwma': (VwmaKernel, 'ssp'),
+    'taWma': (WmaKernel, 'sp'),
+    'taWpr': (WprKernel, 'sssp'),
+}
+
+
+def _canonical_name(operation_name: str) -> str:
+    if operation_name.endswith('Func'):
+        return operation_name[:-4]
+    return operation_name
+
+
+class _CallSite:
+    __slots__ = ('kernel', 'bar_index', 'snapshot', 'value')
+
+    def __init__(self, kernel):
+        self.kernel = kernel
+        self.bar_index = None
+        self.snapshot = None
+        self.value = NA
+
+
+class StreamingTAEngine:
+    """Per-call-site indicator state that advances exactly one bar per update.
+
+    Each call site (an AST node, or the builtin name plus its parameters when no
+    node is available) owns its own kernel.  Calling `update` again for the same
+    `bar_index` re-evaluates that bar: in realtime mode the kernel is rolled back
+    to its pre-bar snapshot so ticks can be replayed, otherwise the value already
+    computed for the bar is returned.
+    """
+
+    def __init__(self, realtime: bool = False):
+        self.realtime = realtime
+        self.call_sites: Dict[Any, _CallSite] = {}
+
+    def supports(self, operation_name: str, args=()) -> bool:
+        spec = STREAMING_KERNELS.get(_canonical_name(operation_name))
+        if spec is None:
+            return False
+        layout = spec[1]
+        required = len(layout.rstrip('o'))
+        return required <= len(args) <= len(layout)
+
+    def _split_args(self, layout: str, args) -> Tuple[list, tuple]:
+        series, params = [], []
+        for kind, value in zip(layout, args):
+            if kind == 's':
+                series.append(_latest(value))
+            else:
+                params.append(value)
+        return series, tuple(params)
+
+    def update(self, call_site, operation_name: str, args, bar_index: Optional[int] = None):
+        name = _canonical_name(operation_name)
+        factory, layout = STREAMING_KERNELS[name]
+        series, params = self._split_args(layout, args)
+
+        key = (call_site, name, params)
+        site = self.call_sites.get(key)
+        if site is None:
+            site = self.call_sites[key] = _CallSite(factory(*params))
+
+        if bar_index is not None and bar_index == site.bar_index:
+            if site.snapshot is None:
+                return site.value
+            site.kernel = copy.deepcopy(site.snapshot)
+        elif self.realtime:
+            site.snapshot = copy.deepcopy(site.kernel)
+        else:
+            site.snapshot = None
+
+        site.bar_index = bar_index
+        site.value = site.kernel.update(*series)
+        return site.value
+
+    def reset(self) -> None:
+        self.call_sites.clear()
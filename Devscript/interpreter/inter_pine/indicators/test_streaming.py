@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+import talib
+from streaming import EmaKernel, StreamingTAEngine, RollingWindow
+
+class TestStreamingTAEngine(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.close = 100 + np.cumsum(rng.normal(0, 1, 500))
+        self.high = self.close + rng.uniform(0.1, 2, 500)
+        self.low = self.close - rng.uniform(0.1, 2, 500)
+        self.volume = rng.uniform(1000, 5000, 500)
+
+    def run_stream(self, name, build_args):
+        engine = StreamingTAEngine()
+        return [engine.update('site', name, build_args(i), bar_index=i) for i in range(len(self.close))]
+
+    def assertSeriesClose(self, actual, expected):
+        actual = np.array(actual, dtype=float)
+        expected = np.asarray(expected, dtype=float)
+        np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+        mask = ~np.isnan(expected)
+        np.testing.assert_allclose(actual[mask], expected[mask], rtol=1e-7, atol=1e-7)
+
+    def test_moving_averages_match_talib(self):
+        self.assertSeriesClose(self.run_stream('taSmaFunc', lambda i: [self.close[i], 14]), talib.SMA(self.close, 14))
+        # taEma seeds with the first value like its builtin; the SMA-seeded kernel behind taRma matches talib
+        ema = EmaKernel(14)
+        self.assertSeriesClose([ema.update(value) for value in self.close], talib.EMA(self.close, 14))
+        self.assertSeriesClose(self.run_stream('taWmaFunc', lambda i: [self.close[i], 10]), talib.WMA(self.close, 10))
+
+    def test_oscillators_match_talib(self):
+        # the rsi and atr builtins average the last `period` values instead of Wilder smoothing them
+        change = np.diff(self.close, prepend=np.nan)
+        gains = talib.SMA(np.where(change > 0, change, 0.0), 14)
+        losses = talib.SMA(np.where(change < 0, -change, 0.0), 14)
+        rsi = self.run_stream('taRsiFunc', lambda i: [self.close[i], 14])
+        self.assertSeriesClose(rsi[15:], (100 - 100 / (1 + gains / losses))[15:])
+        atr = self.run_stream('taAtrFunc', lambda i: [self.high[i], self.low[i], self.close[i], 14])
+        # the first bar's true range is high - low, talib skips it
+        self.assertSeriesClose(atr[14:], talib.SMA(talib.TRANGE(self.high, self.low, self.close), 14)[14:])
+        wpr = self.run_stream('taWprFunc', lambda i: [self.high[i], self.low[i], self.close[i], 14])
+        self.assertSeriesClose(wpr, talib.WILLR(self.high, self.low, self.close, 14))
+
+    def test_rolling_statistics_match_numpy(self):
+        stdev = self.run_stream('taStdev', lambda i: [self.close[i], 20])
+        expected = [np.nan] * 19 + [np.std(self.close[i - 19:i + 1]) for i in range(19, 500)]
+        self.assertSeriesClose(stdev, expected)
+        highest = self.run_stream('taHighest', lambda i: [self.close[i], 20])
+        expected = [np.nan] * 19 + [self.close[i - 19:i + 1].max() for i in range(19, 500)]
+        self.assertSeriesClose(highest, expected)
+        median = self.run_stream('taMedian', lambda i: [self.close[i], 21])
+        expected = [np.nan] * 20 + [np.median(self.close[i - 20:i + 1]) for i in range(20, 500)]
+        self.assertSeriesClose(median, expected)
+
+    def test_series_argument_uses_latest_value(self):
+        engine = StreamingTAEngine()
+        values = [engine.update('site', 'taSma', [list(self.close[:i + 1]), 5], bar_index=i) for i in range(10)]
+        self.assertAlmostEqual(values[-1], self.close[5:10].mean())
+
+    def test_same_bar_is_not_advanced_twice(self):
+        engine = StreamingTAEngine()
+        for i in range(5):
+            engine.update('site', 'taSma', [self.close[i], 3], bar_index=i)
+        first = engine.update('site', 'taSma', [self.close[5], 3], bar_index=5)
+        again = engine.update('site', 'taSma', [self.close[5], 3], bar_index=5)
+        self.assertEqual(first, again)
+
+    def test_realtime_recomputes_current_bar(self):
+        engine = StreamingTAEngine(realtime=True)
+        for i in range(5):
+            engine.update('site', 'taSma', [float(i), 3], bar_index=i)
+        engine.update('site', 'taSma', [100.0, 3], bar_index=5)
+        tick = engine.update('site', 'taSma', [5.0, 3], bar_index=5)
+        self.assertAlmostEqual(tick, 4.0)
+
+    def test_unsupported_arity_falls_back(self):
+        engine = StreamingTAEngine()
+        self.assertTrue(engine.supports('taSmaFunc', [1.0, 5]))
+        self.assertFalse(engine.supports('taSmaFunc', [1.0]))
+        self.assertFalse(engine.supports('taPivotPointLevelsFunc', [1, 2, 3, 4]))
+
+    def test_rolling_window_view(self):
+        window = RollingWindow(3)
+        for value in [1, 2, 3, 4]:
+            window.push(value)
+        np.testing.assert_array_equal(window.view(), [2, 3, 4])
+        self.assertEqual(window.get(0), 4)
+        self.assertEqual(window.total, 9)
+
+if __name__ == '__main__':
+    unittest.main()
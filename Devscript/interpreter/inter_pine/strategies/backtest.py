@@ -0,0 +1,141 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+from .journal import TradeJournal
+from .strategy import StrategyEngine
+
+
+@dataclass
+class BacktestResult:
+    equity: np.ndarray
+    position: np.ndarray
+    trades: TradeJournal
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+def _forward_fill_state(entries: np.ndarray, exits: np.ndarray) -> np.ndarray:
+    """1 while in a position, 0 while flat; an exit on the same bar as an entry wins"""
+    marks = np.where(exits, 0.0, np.where(entries, 1.0, np.nan))
+    marks[0] = 0.0 if np.isnan(marks[0]) else marks[0]
+    last = np.where(~np.isnan(marks), np.arange(len(marks)), 0)
+    np.maximum.accumulate(last, out=last)
+    return marks[last]
+
+
+def run_backtest(close, entries, exits, open_=None, direction: str = 'long', size: float = 1.0,
+                 size_type: str = 'fixed', commission: float = 0.0, slippage: float = 0.0,
+                 initial_capital: float = 100000.0, close_open_trade: bool = True) -> BacktestResult:
+    """Single-position backtest driven by boolean entry/exit signal arrays.
+
+    Signals are evaluated on a bar's close and fill on that close, or on the
+    next bar's open when `open_` is given. `size` is a quantity (size_type
+    'fixed') or a fraction of equity compounded trade to trade ('percent').
+    `commission` and `slippage` are rates on the traded value, slippage moving
+    each fill against the trade. Everything is numpy array arithmetic; only the
+    per-trade records are built in Python.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    entries = np.asarray(entries, dtype=bool)
+    exits = np.asarray(exits, dtype=bool)
+    n = len(close)
+    sign = 1.0 if direction == 'long' else -1.0
+
+    state = _forward_fill_state(entries, exits)
+    if open_ is not None:
+        fill_price = np.asarray(open_, dtype=np.float64)
+        state = np.concatenate([[0.0], state[:-1]])
+    else:
+        fill_price = close
+
+    change = np.diff(state, prepend=0.0)
+    entry_bars = np.flatnonzero(change > 0)
+    exit_bars = np.flatnonzero(change < 0)
+    if close_open_trade and len(exit_bars) < len(entry_bars):
+        exit_bars = np.append(exit_bars, n - 1)
+        state[n - 1] = 0.0
+        forced_exit = True
+    else:
+        forced_exit = False
+    entry_bars = entry_bars[:len(exit_bars)] if close_open_trade else entry_bars
+
+    entry_fill = fill_price[entry_bars] * (1 + sign * slippage)
+    exit_prices = fill_price[exit_bars].copy()
+    if forced_exit:
+        exit_prices[-1] = close[-1]
+    exit_fill = exit_prices * (1 - sign * slippage)
+    closed = min(len(entry_bars), len(exit_bars))
+
+    # quantity per trade; percent sizing compounds on the equity left by previous trades
+    if size_type == 'percent':
+        trade_return = (sign * (exit_fill - entry_fill[:closed]) - commission * (entry_fill[:closed] + exit_fill)) \
+            / entry_fill[:closed]
+        growth = np.cumprod(1 + size * trade_return)
+        equity_before = initial_capital * np.concatenate([[1.0], growth[:-1]]) if closed else np.empty(0)
+        if len(entry_bars) > closed:
+            last_equity = initial_capital * (growth[-1] if closed else 1.0)
+            equity_before = np.append(equity_before, last_equity)
+        quantity = size * equity_before / entry_fill
+    else:
+        quantity = np.full(len(entry_bars), float(size))
+
+    # per-bar mark-to-market: quantity of the trade covering each bar
+    trade_id = np.cumsum(change > 0) - 1
+    held_qty = np.zeros(n)
+    held = trade_id >= 0
+    held_qty[held] = quantity[trade_id[held]]
+    carried = np.concatenate([[0.0], state[:-1]])
+    previous_close = np.concatenate([[close[0]], close[:-1]])
+    mark = close.copy()
+    mark[exit_bars] = exit_fill
+    pnl = carried * sign * held_qty * (mark - previous_close)
+
+    entered = np.zeros(n)
+    entered[entry_bars] = 1.0
+    entry_price_at_bar = np.zeros(n)
+    entry_price_at_bar[entry_bars] = entry_fill
+    pnl += entered * sign * held_qty * (close - entry_price_at_bar)
+    # an entry on the last bar closed out by close_open_trade only earns exit - entry
+    same_bar = np.intersect1d(entry_bars, exit_bars)
+    pnl[same_bar] = sign * held_qty[same_bar] * (mark[same_bar] - entry_price_at_bar[same_bar])
+
+    entry_costs = commission * quantity * entry_fill
+    exit_costs = commission * quantity[:closed] * exit_fill
+    costs = np.zeros(n)
+    np.add.at(costs, entry_bars, entry_costs)
+    np.add.at(costs, exit_bars[:closed], exit_costs)
+    equity = initial_capital + np.cumsum(pnl - costs)
+
+    trade_pnl = sign * quantity[:closed] * (exit_fill - entry_fill[:closed]) - entry_costs[:closed] - exit_costs
+    trades = TradeJournal.from_columns(
+        name='Long Entry' if direction == 'long' else 'Short Entry', direction=direction,
+        entry_bar=entry_bars[:closed], exit_bar=exit_bars[:closed],
+        entry_time=entry_bars[:closed], exit_time=exit_bars[:closed],
+        entry_price=entry_fill[:closed], exit_price=exit_fill, quantity=quantity[:closed],
+        pnl=trade_pnl, commission=entry_costs[:closed] + exit_costs)
+
+    return BacktestResult(equity, state * sign, trades, performance_metrics(trades, initial_capital))
+
+
+def performance_metrics(trades: Union[TradeJournal, List[Dict[str, Any]]],
+                        initial_capital: float = 100000.0) -> Dict[str, Any]:
+    """PerformanceEngine's metrics for a finished trade list, with its equity state set in one pass"""
+    if not isinstance(trades, TradeJournal):
+        trades = TradeJournal.from_records(trades)
+    engine = StrategyEngine()
+    engine.initial_capital = initial_capital
+    performance = engine.performance_engine
+    performance.initial_capital = initial_capital
+    performance.reset_metrics()
+    engine.trade_history = trades
+    if not trades:
+        return {'total_trades': 0, 'net_profit': 0.0}
+    equity = initial_capital + np.cumsum(trades.column('pnl'))
+    peak = np.maximum.accumulate(np.concatenate([[initial_capital], equity]))[1:]
+    performance.trades = trades
+    engine.equity_curve = performance.equity_curve = equity
+    performance.current_capital = float(equity[-1])
+    performance.peak_capital = float(peak[-1])
+    performance.max_drawdown_value = float(((peak - equity) / peak).max())
+    return performance.get_trade_metrics()
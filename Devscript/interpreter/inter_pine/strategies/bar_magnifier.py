@@ -0,0 +1,58 @@
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .matching import bar_path
+
+# (open, high, low, close) arrays of the lower-timeframe bars inside one chart bar
+LowerBars = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class ArraySource:
+    """Lower-timeframe bars already in memory (or memory-mapped), sliced by binary search on time"""
+
+    def __init__(self, time: np.ndarray, open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        self.time = np.asarray(time)
+        self.columns = (open_, high, low, close)
+
+    def __call__(self, start: float, end: float) -> LowerBars:
+        lo = int(np.searchsorted(self.time, start, side='left'))
+        hi = int(np.searchsorted(self.time, end, side='left'))
+        return tuple(np.asarray(column[lo:hi]) for column in self.columns)
+
+
+def candle_store_source(store, symbol: str, exchange: str, interval) -> Callable[[float, float], LowerBars]:
+    """Source reading the slice from a server CandleStore (epoch-ms times, memory-mapped and offline-safe)"""
+    def read(start: float, end: float) -> LowerBars:
+        # CandleStore.read includes `end`; the next chart bar starts there
+        frame = store.read(symbol, exchange, interval, start=start, end=end - 1)
+        return tuple(frame[name].to_numpy() for name in ('open', 'high', 'low', 'close'))
+    return read
+
+
+class BarMagnifier:
+    """Intrabar fills from lower-timeframe data, loaded only for bars that have pending orders.
+
+    `source(start, end)` returns the (open, high, low, close) arrays of the
+    lower-timeframe bars with start <= time < end; each of them contributes
+    its own bar_path, so triggers on a wide chart bar are decided in the
+    order the lower timeframe actually traded. Bars without pending orders
+    never touch the source, which keeps the cost to a small fraction of a
+    full lower-timeframe run. If the source has no data for a bar the caller
+    falls back to the chart bar's own path.
+    """
+
+    def __init__(self, source: Callable[[float, float], LowerBars], timeframe: float):
+        self.source = source
+        self.timeframe = timeframe
+        self.magnified_bars = 0
+        self.lower_bars = 0
+
+    def paths(self, time: float, end: Optional[float] = None) -> List[Sequence[float]]:
+        """Sub-bar paths for the chart bar starting at `time` (ending at `end`, default time + timeframe)"""
+        open_, high, low, close = self.source(time, time + self.timeframe if end is None else end)
+        if not len(open_):
+            return []
+        self.magnified_bars += 1
+        self.lower_bars += len(open_)
+        return [bar_path(*bar) for bar in zip(open_.tolist(), high.tolist(), low.tolist(), close.tolist())]
@@ -0,0 +1,267 @@
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+TRADE_DTYPE = np.dtype([
+    ('entry_bar', 'i8'),
+    ('exit_bar', 'i8'),
+    ('entry_time', 'f8'),
+    ('exit_time', 'f8'),
+    ('direction', 'i1'),
+    ('entry_price', 'f8'),
+    ('exit_price', 'f8'),
+    ('quantity', 'f8'),
+    ('pnl', 'f8'),
+    ('commission', 'f8'),
+    ('name', 'i4'),
+])
+
+DIRECTIONS = {'long': 1, 'short': -1}
+DIRECTION_NAMES = {1: 'long', -1: 'short', 0: None}
+
+
+def _timestamp(value: Any) -> float:
+    if value is None:
+        return np.nan
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class TradeJournal:
+    """Append-only columnar trade store behind the trade_history list interface.
+
+    Each TRADE_DTYPE field is its own growable contiguous numpy array (about
+    80 bytes a trade against ~1 KB for a dict), so aggregations are
+    vectorized reductions over whole columns. Indexing, slicing and iteration
+    still hand out trade dicts for code written against the old list. With
+    `spill_dir` set, every `spill_rows` trades are moved to a chunk file on
+    disk (parquet when pyarrow is installed, .npy otherwise) and read back
+    column by column.
+    """
+
+    def __init__(self, capacity: int = 1024, spill_dir: Optional[str] = None, spill_rows: int = 1_000_000):
+        capacity = max(capacity, 1)
+        self._columns = {name: np.empty(capacity, dtype=TRADE_DTYPE[name]) for name in TRADE_DTYPE.names}
+        self._capacity = capacity
+        self._size = 0
+        self._names: List[Optional[str]] = [None]
+        self._name_ids: Dict[Optional[str], int] = {None: 0}
+        self._datetime_times = False
+        self.spill_dir = spill_dir
+        self.spill_rows = spill_rows
+        self._chunks: List[str] = []
+        self._spilled = 0
+
+    @classmethod
+    def from_records(cls, trades: Iterable[Dict[str, Any]], **kwargs) -> 'TradeJournal':
+        journal = cls(**kwargs)
+        journal.extend(trades)
+        return journal
+
+    @classmethod
+    def from_columns(cls, name: Optional[str] = None, direction: Union[str, np.ndarray] = 'long',
+                     **columns: np.ndarray) -> 'TradeJournal':
+        """Bulk-load equal-length column arrays without building a dict per trade"""
+        length = len(next(iter(columns.values()))) if columns else 0
+        journal = cls(capacity=length)
+        journal._append_columns(length, name, direction, columns)
+        return journal
+
+    def _name_id(self, name: Optional[str]) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed > self._capacity:
+            self._capacity = max(needed, 2 * self._capacity)
+            for name, values in self._columns.items():
+                grown = np.empty(self._capacity, dtype=values.dtype)
+                grown[:self._size] = values[:self._size]
+                self._columns[name] = grown
+
+    def append(self, trade: Dict[str, Any]) -> None:
+        self._reserve(1)
+        if isinstance(trade.get('entry_time'), datetime):
+            self._datetime_times = True
+        index, columns = self._size, self._columns
+        columns['entry_bar'][index] = trade.get('entry_bar', -1)
+        columns['exit_bar'][index] = trade.get('exit_bar', -1)
+        columns['entry_time'][index] = _timestamp(trade.get('entry_time'))
+        columns['exit_time'][index] = _timestamp(trade.get('exit_time'))
+        columns['direction'][index] = DIRECTIONS.get(trade.get('direction'), 0)
+        columns['entry_price'][index] = trade.get('entry_price', np.nan)
+        columns['exit_price'][index] = trade.get('exit_price', np.nan)
+        columns['quantity'][index] = trade.get('quantity', 0.0)
+        columns['pnl'][index] = trade['pnl']
+        columns['commission'][index] = trade.get('commission', 0.0)
+        columns['name'][index] = self._name_id(trade.get('name'))
+        self._size += 1
+        self._maybe_spill()
+
+    def extend(self, trades: Iterable[Dict[str, Any]]) -> None:
+        for trade in trades:
+            self.append(trade)
+
+    def _append_columns(self, length: int, name: Optional[str], direction, columns: Dict[str, np.ndarray]) -> None:
+        self._reserve(length)
+        defaults = {'entry_bar': -1, 'exit_bar': -1, 'entry_time': np.nan, 'exit_time': np.nan,
+                    'entry_price': np.nan, 'exit_price': np.nan, 'quantity': 0.0, 'pnl': 0.0,
+                    'commission': 0.0,
+                    'direction': DIRECTIONS[direction] if isinstance(direction, str) else direction,
+                    'name': self._name_id(name)}
+        window = slice(self._size, self._size + length)
+        for column, values in self._columns.items():
+            values[window] = columns.get(column, defaults[column])
+        self._size += length
+        self._maybe_spill()
+
+    def _record(self, row) -> Dict[str, Any]:
+        entry_time, exit_time = float(row['entry_time']), float(row['exit_time'])
+        if self._datetime_times:
+            entry_time = datetime.fromtimestamp(entry_time) if entry_time == entry_time else None
+            exit_time = datetime.fromtimestamp(exit_time) if exit_time == exit_time else None
+        return {
+            'entry_bar': int(row['entry_bar']),
+            'exit_bar': int(row['exit_bar']),
+            'entry_time': entry_time,
+            'exit_time': exit_time,
+            'direction': DIRECTION_NAMES[int(row['direction'])],
+            'entry_price': float(row['entry_price']),
+            'exit_price': float(row['exit_price']),
+            'quantity': float(row['quantity']),
+            'pnl': float(row['pnl']),
+            'commission': float(row['commission']),
+            'name': self._names[int(row['name'])],
+        }
+
+    def __len__(self) -> int:
+        return self._spilled + self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(row) for row in self.rows(index)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('trade index out of range')
+        return self._record(self.rows(slice(index, index + 1))[0])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for chunk in self._chunk_rows():
+            for row in chunk:
+                yield self._record(row)
+        for row in self._memory_rows():
+            yield self._record(row)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def _memory_rows(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        stop = self._size if stop is None else stop
+        rows = np.empty(max(stop - start, 0), dtype=TRADE_DTYPE)
+        for name, values in self._columns.items():
+            rows[name] = values[start:stop]
+        return rows
+
+    def rows(self, index: slice = slice(None)) -> np.ndarray:
+        """Structured rows (TRADE_DTYPE) for `index`"""
+        start, stop, step = index.indices(len(self))
+        if start >= self._spilled and step == 1:
+            return self._memory_rows(start - self._spilled, max(stop, start) - self._spilled)
+        return np.concatenate(list(self._chunk_rows()) + [self._memory_rows()])[start:stop:step]
+
+    def column(self, name: str, start: int = 0) -> np.ndarray:
+        """Values of one column from trade `start` on; a view unless spilled chunks are involved"""
+        if start >= self._spilled:
+            return self._columns[name][start - self._spilled:self._size]
+        parts = [self._read_chunk(path, name) for path in self._chunks]
+        return np.concatenate(parts + [self._columns[name][:self._size]])[start:]
+
+    def names(self) -> np.ndarray:
+        return np.array(self._names, dtype=object)[self.column('name')]
+
+    def summary(self, initial_capital: float = 0.0) -> Dict[str, Any]:
+        """Trade statistics as whole-column numpy reductions"""
+        pnl = self.column('pnl')
+        total = len(pnl)
+        if not total:
+            return {'total_trades': 0, 'net_profit': 0.0}
+        wins, losses = np.count_nonzero(pnl > 0), np.count_nonzero(pnl < 0)
+        gross_profit, gross_loss = float(np.maximum(pnl, 0).sum()), float(np.minimum(pnl, 0).sum())
+        equity = initial_capital + np.cumsum(pnl)
+        peak = np.maximum(np.maximum.accumulate(equity), initial_capital)
+        return {
+            'total_trades': total,
+            'winning_trades': wins,
+            'losing_trades': losses,
+            'win_rate': wins / total * 100,
+            'net_profit': float(equity[-1] - initial_capital),
+            'gross_profit': gross_profit,
+            'gross_loss': gross_loss,
+            'profit_factor': gross_profit / -gross_loss if gross_loss else float('inf'),
+            'avg_trade': (gross_profit + gross_loss) / total,
+            'avg_winning_trade': gross_profit / wins if wins else 0,
+            'avg_losing_trade': gross_loss / losses if losses else 0,
+            'largest_win': float(pnl.max()),
+            'largest_loss': float(pnl.min()),
+            'max_contracts': float(self.column('quantity').max()),
+            'commission': float(self.column('commission').sum()),
+            'max_drawdown_amount': float((peak - equity).max()),
+        }
+
+    def returns(self, initial_capital: float) -> np.ndarray:
+        """Per-trade returns on the equity before each trade, for RiskEngine's return-based measures"""
+        pnl = self.column('pnl')
+        equity_before = initial_capital + np.concatenate([[0.0], np.cumsum(pnl)[:-1]])
+        return np.divide(pnl, equity_before, out=np.zeros_like(pnl), where=equity_before != 0)
+
+    def _maybe_spill(self) -> None:
+        if self.spill_dir and self._size >= self.spill_rows:
+            self.spill()
+
+    def spill(self) -> Optional[str]:
+        """Move the in-memory rows to a new chunk file under spill_dir"""
+        if not self.spill_dir or not self._size:
+            return None
+        os.makedirs(self.spill_dir, exist_ok=True)
+        rows = self._memory_rows()
+        base = os.path.join(self.spill_dir, f"trades_{len(self._chunks):05d}")
+        if pq is not None:
+            path = base + '.parquet'
+            pq.write_table(pa.table({name: rows[name] for name in TRADE_DTYPE.names}), path)
+        else:
+            path = base + '.npy'
+            np.save(path, rows)
+        self._chunks.append(path)
+        self._spilled += self._size
+        self._size = 0
+        return path
+
+    def _read_chunk(self, path: str, column: Optional[str] = None) -> np.ndarray:
+        if path.endswith('.parquet'):
+            table = pq.read_table(path, columns=[column] if column else None)
+            if column:
+                return table.column(column).to_numpy()
+            rows = np.empty(table.num_rows, dtype=TRADE_DTYPE)
+            for name in TRADE_DTYPE.names:
+                rows[name] = table.column(name).to_numpy()
+            return rows
+        rows = np.load(path, mmap_mode='r')
+        return rows[column] if column else rows
+
+    def _chunk_rows(self) -> Iterator[np.ndarray]:
+        for path in self._chunks:
+            yield self._read_chunk(path)
@@ -0,0 +1,180 @@
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+
+def bar_path(open_: float, high: float, low: float, close: float) -> Tuple[float, float, float, float]:
+    """Assumed intrabar price path: open, the nearer extreme, the other extreme, close"""
+    if high - open_ <= open_ - low:
+        return (open_, high, low, close)
+    return (open_, low, high, close)
+
+
+@dataclass
+class Fill:
+    order_id: str
+    direction: str
+    quantity: float
+    price: float
+    commission: float
+    bar_index: Optional[int]
+    name: Optional[str] = None
+
+
+class MatchingEngine:
+    """Pending order book that fills market, limit, stop and stop-limit orders along each bar's path.
+
+    Orders waiting for the price to rise to them (buy stops, sell limits) sit in
+    a min-heap keyed by trigger price and orders waiting for it to fall (buy
+    limits, sell stops) in a max-heap, so each path segment only pops the
+    orders it actually crosses: O(log N) per fill, O(1) per bar when nothing
+    triggers. Cancelled orders are dropped lazily when they surface, and the
+    heaps are rebuilt from their live entries once stale ones make up more
+    than half of them. Market orders fill at the next bar's open.
+    """
+
+    def __init__(self, trade_engine: Any = None):
+        self.trade_engine = trade_engine
+        self.orders: Dict[str, Any] = {}
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._rising: List[tuple] = []
+        self._falling: List[tuple] = []
+        self._market: List[str] = []
+        self._stage: Dict[str, str] = {}
+        self._oco: Dict[str, Set[str]] = {}
+        self._stale = 0
+
+    def next_id(self) -> str:
+        return f"ord_{next(self._ids)}"
+
+    def submit(self, order: Any) -> str:
+        """Queue an Order (strategy.Order); `order.oco` links orders that cancel each other on fill"""
+        if not order.order_id:
+            order.order_id = self.next_id()
+        self.orders[order.order_id] = order
+        oco = getattr(order, 'oco', None)
+        if oco:
+            self._oco.setdefault(oco, set()).add(order.order_id)
+        kind = order.order_type.value
+        if kind == 'market':
+            self._stage[order.order_id] = 'market'
+            self._market.append(order.order_id)
+        elif kind in ('stop', 'stop_limit'):
+            self._arm(order, 'stop', order.stop_price, rising=order.direction == 'long')
+        else:
+            self._arm(order, 'limit', order.price, rising=order.direction != 'long')
+        return order.order_id
+
+    def _arm(self, order: Any, stage: str, trigger: float, rising: bool) -> None:
+        self._stage[order.order_id] = stage
+        if rising:
+            heapq.heappush(self._rising, (trigger, next(self._seq), order.order_id, stage))
+        else:
+            heapq.heappush(self._falling, (-trigger, next(self._seq), order.order_id, stage))
+
+    def cancel(self, order_id: str) -> bool:
+        order = self.orders.pop(order_id, None)
+        if order is None:
+            return False
+        order.status = 'cancelled'
+        if self._stage.pop(order_id, None) in ('stop', 'limit'):
+            self._stale += 1
+            self._compact()
+        oco = getattr(order, 'oco', None)
+        if oco in self._oco:
+            self._oco[oco].discard(order_id)
+        return True
+
+    def _compact(self) -> None:
+        """Rebuild both heaps in place from live entries once more than half of their entries are stale"""
+        if self._stale * 2 <= len(self._rising) + len(self._falling):
+            return
+        for heap in (self._rising, self._falling):
+            heap[:] = [entry for entry in heap if self._stage.get(entry[2]) == entry[3]]
+            heapq.heapify(heap)
+        self._stale = 0
+
+    def cancel_all(self) -> None:
+        for order_id in list(self.orders):
+            self.cancel(order_id)
+        self._rising.clear()
+        self._falling.clear()
+        self._market.clear()
+        self._stale = 0
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self.orders)
+
+    def process_bar(self, open_: float, high: float, low: float, close: float,
+                    bar_index: Optional[int] = None) -> List[Fill]:
+        """Walk the bar's assumed path and return the fills in the order they happened"""
+        return self.process_paths([bar_path(open_, high, low, close)], bar_index)
+
+    def process_paths(self, paths: Sequence[Sequence[float]], bar_index: Optional[int] = None) -> List[Fill]:
+        """Walk consecutive price paths within one bar, e.g. one per lower-timeframe bar"""
+        fills: List[Fill] = []
+        if not paths:
+            return fills
+        market, self._market = self._market, []
+        for order_id in market:
+            if self._stage.get(order_id) == 'market':
+                self._fill(order_id, paths[0][0], True, bar_index, fills)
+
+        for path in paths:
+            # a gap through a trigger fills at the open
+            self._sweep(path[0], path[0], bar_index, fills)
+            for start, end in zip(path, path[1:]):
+                if end != start:
+                    self._sweep(start, end, bar_index, fills)
+        return fills
+
+    def _sweep(self, start: float, end: float, bar_index: Optional[int], fills: List[Fill]) -> None:
+        """Fill every order whose trigger lies on the segment start -> end (both sides for a single point)"""
+        if end > start:
+            sides = ((self._rising, 1),)
+        elif end < start:
+            sides = ((self._falling, -1),)
+        else:
+            sides = ((self._rising, 1), (self._falling, -1))
+        for heap, sign in sides:
+            while heap:
+                key, _, order_id, stage = heap[0]
+                if self._stage.get(order_id) != stage:
+                    heapq.heappop(heap)
+                    self._stale -= 1
+                    continue
+                trigger = sign * key
+                if (trigger > end) if sign > 0 else (trigger < end):
+                    break
+                heapq.heappop(heap)
+                # orders already beyond the segment start (gap opens) fill at the start
+                price = max(trigger, start) if sign > 0 else min(trigger, start)
+                order = self.orders[order_id]
+                if stage == 'stop' and order.order_type.value == 'stop_limit':
+                    marketable = order.price >= price if order.direction == 'long' else order.price <= price
+                    if not marketable:
+                        self._arm(order, 'limit', order.price, rising=order.direction != 'long')
+                        continue
+                    self._fill(order_id, price, False, bar_index, fills)
+                    continue
+                self._fill(order_id, price, stage == 'stop', bar_index, fills)
+
+    def _fill(self, order_id: str, price: float, slipped: bool, bar_index: Optional[int], fills: List[Fill]) -> None:
+        order = self.orders.pop(order_id)
+        self._stage.pop(order_id, None)
+        if slipped and self.trade_engine is not None:
+            slippage = self.trade_engine.calculate_slippage_amount(price)
+            price = price + slippage if order.direction == 'long' else price - slippage
+        commission = self.trade_engine.calculate_commission_amount(price * order.quantity) if self.trade_engine else 0.0
+        order.status = 'filled'
+        fills.append(Fill(order_id, order.direction, order.quantity, price, commission, bar_index,
+                          getattr(order, 'name', None)))
+        oco = getattr(order, 'oco', None)
+        if oco in self._oco:
+            siblings = self._oco.pop(oco)
+            siblings.discard(order_id)
+            for sibling in siblings:
+                self.cancel(sibling)
@@ -0,0 +1,195 @@
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class RunningStats:
+    """Welford mean/variance; `std` is the population std np.std returns"""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def add_many(self, values: np.ndarray) -> None:
+        """Fold in a batch with Chan's parallel update"""
+        count = len(values)
+        if not count:
+            return
+        mean = float(values.mean())
+        m2 = float(((values - mean) ** 2).sum())
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+class OnlineMetrics:
+    """Strategy statistics updated per trade and per equity tick, read in O(1).
+
+    `sync_trades` / `sync_equity` consume only what was appended to a list
+    since the last call, so callers can keep their list-of-dicts history and
+    still pay constant time per bar; a replaced or shortened list is
+    re-consumed from scratch.
+    """
+
+    def __init__(self, risk_free_rate: float = 0.02, periods: int = 252):
+        self.risk_free_rate = risk_free_rate
+        self.periods = periods
+        self.reset()
+
+    def reset(self) -> None:
+        self.reset_trades()
+        self.reset_equity()
+
+    def reset_trades(self) -> None:
+        self.trades = 0
+        self.wins = 0
+        self.losses = 0
+        self.net_profit = 0.0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.largest_pnl: Optional[float] = None
+        self.smallest_pnl: Optional[float] = None
+        self.max_quantity = 0.0
+        self.max_exposure = 0.0
+        self._trade_source: Optional[List[Dict[str, Any]]] = None
+        self._trades_seen = 0
+
+    def reset_equity(self) -> None:
+        self.equity: Optional[float] = None
+        self.peak: Optional[float] = None
+        self.max_drawdown = 0.0
+        self.returns = RunningStats()
+        self.downside = RunningStats()
+        self._equity_source: Optional[List[float]] = None
+        self._equity_seen = 0
+
+    def add_trade(self, pnl: float, quantity: float = 0.0, entry_price: float = 0.0) -> None:
+        self.trades += 1
+        self.net_profit += pnl
+        if pnl > 0:
+            self.wins += 1
+            self.gross_profit += pnl
+        elif pnl < 0:
+            self.losses += 1
+            self.gross_loss += pnl
+        self.largest_pnl = pnl if self.largest_pnl is None else max(self.largest_pnl, pnl)
+        self.smallest_pnl = pnl if self.smallest_pnl is None else min(self.smallest_pnl, pnl)
+        self.max_quantity = max(self.max_quantity, quantity)
+        self.max_exposure = max(self.max_exposure, quantity * entry_price)
+
+    def add_equity(self, value: float) -> None:
+        if self.equity is not None and self.equity != 0:
+            excess = (value - self.equity) / self.equity - self.risk_free_rate / self.periods
+            self.returns.add(excess)
+            if excess < 0:
+                self.downside.add(excess)
+        self.equity = value
+        if self.peak is None or value > self.peak:
+            self.peak = value
+        if self.peak:
+            self.max_drawdown = max(self.max_drawdown, (self.peak - value) / self.peak)
+
+    def add_trades(self, pnl: np.ndarray, quantity: np.ndarray, entry_price: np.ndarray) -> None:
+        """Vectorized add_trade over column arrays"""
+        if not len(pnl):
+            return
+        wins, losses = pnl[pnl > 0], pnl[pnl < 0]
+        self.trades += len(pnl)
+        self.wins += len(wins)
+        self.losses += len(losses)
+        self.net_profit += float(pnl.sum())
+        self.gross_profit += float(wins.sum())
+        self.gross_loss += float(losses.sum())
+        largest, smallest = float(pnl.max()), float(pnl.min())
+        self.largest_pnl = largest if self.largest_pnl is None else max(self.largest_pnl, largest)
+        self.smallest_pnl = smallest if self.smallest_pnl is None else min(self.smallest_pnl, smallest)
+        self.max_quantity = max(self.max_quantity, float(quantity.max()))
+        self.max_exposure = max(self.max_exposure, float(np.nanmax(quantity * entry_price, initial=0.0)))
+
+    def add_equities(self, values: np.ndarray) -> None:
+        """Vectorized add_equity over an array of equity ticks"""
+        if not len(values):
+            return
+        if self.equity is None:
+            self.add_equity(float(values[0]))
+            values = values[1:]
+            if not len(values):
+                return
+        previous = np.concatenate([[self.equity], values[:-1]])
+        valid = previous != 0
+        excess = (values[valid] - previous[valid]) / previous[valid] - self.risk_free_rate / self.periods
+        self.returns.add_many(excess)
+        self.downside.add_many(excess[excess < 0])
+        peak = np.maximum.accumulate(np.concatenate([[self.peak], values]))[1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdown = np.where(peak != 0, (peak - values) / peak, 0.0)
+        self.max_drawdown = max(self.max_drawdown, float(drawdown.max()))
+        self.peak = float(peak[-1])
+        self.equity = float(values[-1])
+
+    def sync_trades(self, trades: List[Dict[str, Any]], pnl_key: str = 'pnl') -> 'OnlineMetrics':
+        if trades is not self._trade_source or len(trades) < self._trades_seen:
+            self.reset_trades()
+            self._trade_source = trades
+        column = getattr(trades, 'column', None)
+        if column is not None:
+            # TradeJournal: read the new rows straight from its columns
+            start = self._trades_seen
+            self.add_trades(column(pnl_key, start), column('quantity', start), column('entry_price', start))
+        else:
+            for trade in trades[self._trades_seen:]:
+                self.add_trade(trade[pnl_key], trade.get('quantity', 0.0), trade.get('entry_price', 0.0))
+        self._trades_seen = len(trades)
+        return self
+
+    def sync_equity(self, equity_curve: List[float]) -> 'OnlineMetrics':
+        if equity_curve is not self._equity_source or len(equity_curve) < self._equity_seen:
+            self.reset_equity()
+            self._equity_source = equity_curve
+        if len(equity_curve) - self._equity_seen > 64:
+            self.add_equities(np.asarray(equity_curve[self._equity_seen:], dtype=np.float64))
+        else:
+            for value in equity_curve[self._equity_seen:]:
+                self.add_equity(value)
+        self._equity_seen = len(equity_curve)
+        return self
+
+    @property
+    def avg_trade(self) -> float:
+        return self.net_profit / self.trades if self.trades else 0
+
+    @property
+    def avg_winning_trade(self) -> float:
+        return self.gross_profit / self.wins if self.wins else 0
+
+    @property
+    def avg_losing_trade(self) -> float:
+        return self.gross_loss / self.losses if self.losses else 0
+
+    @property
+    def sharpe_ratio(self) -> float:
+        std = self.returns.std
+        return self.returns.mean / std * math.sqrt(self.periods) if self.returns.count and std > 0 else 0
+
+    @property
+    def sortino_ratio(self) -> float:
+        std = self.downside.std
+        if not self.returns.count or not self.downside.count or std == 0:
+            return 0.0
+        return self.returns.mean / std * math.sqrt(self.periods)
@@ -0,0 +1,165 @@
+import multiprocessing
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# floats materialized per chunk (paths x steps); 4M float64 is ~32 MB
+CHUNK_ELEMENTS = 4_000_000
+
+
+def resample_indices(rng: np.random.Generator, n_samples: int, paths: int, steps: int,
+                     method: str = 'bootstrap', block_size: int = 1) -> np.ndarray:
+    """(paths, steps) indices into the sample history for one batch of paths"""
+    if method == 'shuffle':
+        if steps > n_samples:
+            raise ValueError('shuffle paths cannot be longer than the history')
+        return rng.permuted(np.broadcast_to(np.arange(n_samples), (paths, n_samples)), axis=1)[:, :steps]
+    if method == 'block':
+        block_size = max(1, min(block_size, n_samples))
+        blocks = -(-steps // block_size)
+        starts = rng.integers(0, n_samples - block_size + 1, (paths, blocks))
+        return (starts[:, :, None] + np.arange(block_size)).reshape(paths, -1)[:, :steps]
+    if method == 'bootstrap':
+        return rng.integers(0, n_samples, (paths, steps))
+    raise ValueError(f"Unknown resampling method: {method}")
+
+
+def simulate_paths(samples: np.ndarray, paths: int, steps: int, seed, kind: str = 'pnl',
+                   initial_capital: float = 100000.0, ruin_level: float = 0.0, method: str = 'bootstrap',
+                   block_size: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Terminal equity, max drawdown (fraction of peak) and ruin flag for `paths` resampled equity paths.
+
+    `kind='pnl'` adds resampled trade PnL to the capital, `kind='returns'`
+    compounds resampled fractional returns. The whole batch is one
+    (paths, steps) matrix; cumulative sums, running peaks and drawdowns are
+    computed in place along the step axis.
+    """
+    rng = np.random.default_rng(seed)
+    if kind == 'returns':
+        with np.errstate(divide='ignore'):
+            samples = np.log1p(samples)
+    equity = samples[resample_indices(rng, len(samples), paths, steps, method, block_size)]
+    if kind == 'returns':
+        np.cumsum(equity, axis=1, out=equity)
+        np.exp(equity, out=equity)
+        equity *= initial_capital
+    else:
+        np.cumsum(equity, axis=1, out=equity)
+        equity += initial_capital
+    terminal = equity[:, -1].copy()
+    ruined = equity.min(axis=1) <= ruin_level
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peak, initial_capital, out=peak)
+    np.subtract(peak, equity, out=equity)
+    np.divide(equity, peak, out=equity)
+    return terminal, equity.max(axis=1), ruined
+
+
+def _simulate_task(args) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    samples, paths, steps, seed, kwargs = args
+    return simulate_paths(samples, paths, steps, seed, **kwargs)
+
+
+@dataclass
+class MonteCarloResult:
+    initial_capital: float
+    terminal_equity: np.ndarray
+    max_drawdown: np.ndarray
+    ruined: np.ndarray
+
+    @property
+    def simulations(self) -> int:
+        return len(self.terminal_equity)
+
+    @property
+    def ruin_probability(self) -> float:
+        return float(self.ruined.mean()) if self.simulations else 0.0
+
+    def terminal_returns(self) -> np.ndarray:
+        return self.terminal_equity / self.initial_capital - 1
+
+    def drawdown_at_risk(self, confidence: float = 0.95) -> float:
+        """Max drawdown not exceeded in `confidence` of the paths"""
+        return float(np.quantile(self.max_drawdown, confidence))
+
+    def value_at_risk(self, confidence: float = 0.95) -> float:
+        """Terminal return at the (1 - confidence) quantile, like RiskEngine.value_at_risk"""
+        return float(np.quantile(self.terminal_returns(), 1 - confidence))
+
+    def expected_shortfall(self, confidence: float = 0.95) -> float:
+        returns = self.terminal_returns()
+        return float(returns[returns <= np.quantile(returns, 1 - confidence)].mean())
+
+    def distribution(self, name: str = 'terminal_equity', bins: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram (counts, bin edges) of 'terminal_equity' or 'max_drawdown'"""
+        return np.histogram(getattr(self, name), bins=bins)
+
+    def summary(self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)) -> Dict[str, float]:
+        terminal = np.percentile(self.terminal_equity, percentiles)
+        drawdown = np.percentile(self.max_drawdown, percentiles)
+        stats = {
+            'simulations': self.simulations,
+            'mean_terminal_equity': float(self.terminal_equity.mean()),
+            'probability_of_loss': float((self.terminal_equity < self.initial_capital).mean()),
+            'ruin_probability': self.ruin_probability,
+            'mean_max_drawdown': float(self.max_drawdown.mean()),
+        }
+        for p, equity, dd in zip(percentiles, terminal, drawdown):
+            stats[f'terminal_equity_p{p:g}'] = float(equity)
+            stats[f'max_drawdown_p{p:g}'] = float(dd)
+        return stats
+
+
+class MonteCarlo:
+    """Resampled equity paths from a trade PnL or return history, simulated in batched matrices.
+
+    Paths are generated `chunk_size` at a time (by default as many as fit
+    in CHUNK_ELEMENTS floats) so memory stays bounded however many
+    simulations are requested; chunks run on a process pool when
+    `processes` > 1. Every chunk gets its own child seed, so results for a
+    given `seed` do not depend on the number of processes.
+    """
+
+    def __init__(self, samples: Sequence[float], kind: str = 'pnl', initial_capital: float = 100000.0,
+                 steps: Optional[int] = None, method: str = 'bootstrap', block_size: int = 1,
+                 ruin_threshold: float = 0.5, chunk_size: Optional[int] = None, processes: int = 1):
+        self.samples = np.asarray(samples, dtype=np.float64)
+        if not len(self.samples):
+            raise ValueError('Monte Carlo needs a non-empty history')
+        if kind not in ('pnl', 'returns'):
+            raise ValueError(f"Unknown sample kind: {kind}")
+        self.kind = kind
+        self.initial_capital = initial_capital
+        self.steps = steps or len(self.samples)
+        self.method = method
+        self.block_size = block_size
+        # ruin = equity falling to (1 - ruin_threshold) of the starting capital
+        self.ruin_level = initial_capital * (1 - ruin_threshold)
+        self.chunk_size = chunk_size or max(1, CHUNK_ELEMENTS // self.steps)
+        self.processes = processes
+
+    @classmethod
+    def from_journal(cls, journal, **kwargs) -> 'MonteCarlo':
+        """Trade-sequence simulation over a TradeJournal's pnl column"""
+        return cls(journal.column('pnl'), kind='pnl', **kwargs)
+
+    def tasks(self, simulations: int, seed=None) -> list:
+        kwargs = {'kind': self.kind, 'initial_capital': self.initial_capital, 'ruin_level': self.ruin_level,
+                  'method': self.method, 'block_size': self.block_size}
+        sizes = [min(self.chunk_size, simulations - start) for start in range(0, simulations, self.chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        return [(self.samples, size, self.steps, child, kwargs) for size, child in zip(sizes, seeds)]
+
+    def run(self, simulations: int = 10000, seed=None) -> MonteCarloResult:
+        tasks = self.tasks(simulations, seed)
+        if self.processes > 1 and len(tasks) > 1:
+            with multiprocessing.Pool(min(self.processes, len(tasks))) as pool:
+                chunks = pool.map(_simulate_task, tasks)
+        else:
+            chunks = [_simulate_task(task) for task in tasks]
+        if not chunks:
+            empty = np.zeros(0)
+            return MonteCarloResult(self.initial_capital, empty, empty, empty.astype(bool))
+        terminal, drawdown, ruined = (np.concatenate(parts) for parts in zip(*chunks))
+        return MonteCarloResult(self.initial_capital, terminal, drawdown, ruined)
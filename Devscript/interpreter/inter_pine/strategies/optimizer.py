@@ -0,0 +1,269 @@
+import bisect
+import itertools
+import math
+import multiprocessing
+import os
+import random
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .backtest import run_backtest
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass(frozen=True)
+class Range:
+    """Declared input range, inclusive of `stop` when it lands on a step"""
+    start: float
+    stop: float
+    step: float = 1
+
+    def values(self) -> List[float]:
+        count = int(math.floor((self.stop - self.start) / self.step + 1e-9)) + 1
+        values = [self.start + i * self.step for i in range(count)]
+        if all(isinstance(v, int) for v in (self.start, self.stop, self.step)):
+            return [int(v) for v in values]
+        return [round(v, 10) for v in values]
+
+
+ParameterSpace = Dict[str, Union[Range, Sequence[Any]]]
+
+
+def expand_space(space: ParameterSpace) -> Dict[str, List[Any]]:
+    return {name: values.values() if isinstance(values, Range) else list(values)
+            for name, values in space.items()}
+
+
+def grid(space: ParameterSpace) -> List[Dict[str, Any]]:
+    expanded = expand_space(space)
+    names = list(expanded)
+    return [dict(zip(names, combo)) for combo in itertools.product(*expanded.values())]
+
+
+def random_sample(space: ParameterSpace, n: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """`n` distinct combinations drawn from the grid (all of it when the grid is smaller)"""
+    expanded = expand_space(space)
+    names = list(expanded)
+    sizes = [len(values) for values in expanded.values()]
+    total = math.prod(sizes)
+    rng = random.Random(seed)
+    picks = range(total) if total <= n else rng.sample(range(total), n)
+    combos = []
+    for flat in picks:
+        combo = {}
+        for name, size in zip(reversed(names), reversed(sizes)):
+            flat, index = divmod(flat, size)
+            combo[name] = expanded[name][index]
+        combos.append({name: combo[name] for name in names})
+    return combos
+
+
+def columns_from_candles(candles: Iterable[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """/fetch_candles records -> OHLCV arrays, so a strategy fetches once and optimizes offline"""
+    candles = list(candles)
+    return {name: np.array([candle.get(name, 0.0) for candle in candles], dtype=np.float64)
+            for name in ('time',) + OHLCV_COLUMNS}
+
+
+class SharedOHLCV:
+    """OHLCV columns in one multiprocessing.shared_memory block.
+
+    The owner copies the arrays in once; workers `attach` by name and get
+    read-only numpy views over the same pages instead of unpickling a frame
+    per task.
+    """
+
+    def __init__(self, data: Dict[str, np.ndarray], columns: Sequence[str] = OHLCV_COLUMNS):
+        self.columns = tuple(name for name in columns if name in data)
+        self.length = len(data[self.columns[0]])
+        shape = (len(self.columns), self.length)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(8 * shape[0] * shape[1], 8))
+        block = np.ndarray(shape, dtype=np.float64, buffer=self.shm.buf)
+        for row, name in enumerate(self.columns):
+            block[row] = np.asarray(data[name], dtype=np.float64)
+
+    @property
+    def handle(self) -> Tuple[str, Tuple[str, ...], int]:
+        return (self.shm.name, self.columns, self.length)
+
+    @staticmethod
+    def attach(handle: Tuple[str, Tuple[str, ...], int]) -> Tuple[shared_memory.SharedMemory, Dict[str, np.ndarray]]:
+        name, columns, length = handle
+        shm = shared_memory.SharedMemory(name=name)
+        block = np.ndarray((len(columns), length), dtype=np.float64, buffer=shm.buf)
+        block.flags.writeable = False
+        return shm, {column: block[row] for row, column in enumerate(columns)}
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass
+class OptimizationResult:
+    params: Dict[str, Any]
+    score: float
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    bars: int = 0
+
+
+class ResultTable:
+    """Results kept ranked by score (best first) as they stream in"""
+
+    def __init__(self, maximize: bool = True):
+        self.maximize = maximize
+        self._keys: List[float] = []
+        self.rows: List[OptimizationResult] = []
+
+    def add(self, result: OptimizationResult) -> int:
+        """Insert and return the result's current rank (0 = best)"""
+        score = result.score if np.isfinite(result.score) else -np.inf if self.maximize else np.inf
+        key = -score if self.maximize else score
+        rank = bisect.bisect_right(self._keys, key)
+        self._keys.insert(rank, key)
+        self.rows.insert(rank, result)
+        return rank
+
+    def top(self, n: int = 10) -> List[OptimizationResult]:
+        return self.rows[:n]
+
+    @property
+    def best(self) -> Optional[OptimizationResult]:
+        return self.rows[0] if self.rows else None
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [{**row.params, 'score': row.score, 'bars': row.bars} for row in self.rows]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+SignalFunction = Callable[..., Tuple[np.ndarray, np.ndarray]]
+
+# per-worker state, set once by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(handle, signal_fn, objective, backtest_kwargs) -> None:
+    shm, data = SharedOHLCV.attach(handle)
+    _worker.update(shm=shm, data=data, signal_fn=signal_fn, objective=objective, backtest_kwargs=backtest_kwargs)
+
+
+def score_metrics(metrics: Dict[str, Any], objective: Union[str, Callable[[Dict[str, Any]], float]]) -> float:
+    value = objective(metrics) if callable(objective) else metrics.get(objective, float('nan'))
+    return float(value) if value is not None else float('nan')
+
+
+def evaluate(data: Dict[str, np.ndarray], signal_fn: SignalFunction, params: Dict[str, Any],
+             objective: Union[str, Callable] = 'net_profit', start: int = 0, end: Optional[int] = None,
+             **backtest_kwargs) -> OptimizationResult:
+    """Backtest `signal_fn(data, **params)` (entries, exits) over bars [start, end)"""
+    window = {name: values[start:end] for name, values in data.items()}
+    entries, exits = signal_fn(window, **params)
+    result = run_backtest(window['close'], entries, exits, **backtest_kwargs)
+    return OptimizationResult(params, score_metrics(result.metrics, objective), result.metrics,
+                              len(window['close']))
+
+
+def _evaluate_window(data, signal_fn, objective, backtest_kwargs, params, start, end) -> OptimizationResult:
+    return evaluate(data, signal_fn, params, objective, start, end, **backtest_kwargs)
+
+
+def _run_task(task: Tuple[Callable, tuple]) -> Any:
+    fn, args = task
+    return fn(_worker['data'], _worker['signal_fn'], _worker['objective'], _worker['backtest_kwargs'], *args)
+
+
+class Optimizer:
+    """Grid, random and successive-halving searches over a strategy's declared inputs.
+
+    `signal_fn(data, **params)` must be a module-level function (it is sent to
+    the workers) returning boolean entry/exit arrays for the bars in `data`.
+    Candles are loaded once by the caller and shared with a process pool
+    through SharedOHLCV; each worker evaluates parameter sets with the
+    vectorized backtester and results stream back into a ResultTable.
+    """
+
+    def __init__(self, signal_fn: SignalFunction, data: Dict[str, np.ndarray], space: ParameterSpace,
+                 objective: Union[str, Callable[[Dict[str, Any]], float]] = 'net_profit', maximize: bool = True,
+                 processes: Optional[int] = None, chunksize: Optional[int] = None, **backtest_kwargs):
+        self.signal_fn = signal_fn
+        self.data = {name: np.asarray(values, dtype=np.float64) for name, values in data.items()}
+        self.space = space
+        self.objective = objective
+        self.maximize = maximize
+        self.processes = processes if processes is not None else os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.backtest_kwargs = backtest_kwargs
+
+    @property
+    def length(self) -> int:
+        return len(self.data['close'])
+
+    def run(self, candidates: Sequence[Dict[str, Any]], start: int = 0, end: Optional[int] = None,
+            table: Optional[ResultTable] = None,
+            on_result: Optional[Callable[[OptimizationResult, int], None]] = None) -> ResultTable:
+        """Evaluate every candidate over bars [start, end); `on_result(result, rank)` sees each as it lands"""
+        table = table if table is not None else ResultTable(self.maximize)
+        for result in self.stream(candidates, start, end):
+            rank = table.add(result)
+            if on_result:
+                on_result(result, rank)
+        return table
+
+    def stream(self, candidates: Sequence[Dict[str, Any]], start: int = 0,
+               end: Optional[int] = None) -> Iterator[OptimizationResult]:
+        """Yield results in completion order"""
+        return self.imap(_evaluate_window, [(params, start, end) for params in candidates])
+
+    def imap(self, fn: Callable, tasks: Sequence[tuple]) -> Iterator[Any]:
+        """Yield fn(data, signal_fn, objective, backtest_kwargs, *args) for each args tuple, in completion order.
+
+        `fn` must be module-level; on the pool it runs against the worker's
+        shared-memory view of the data.
+        """
+        if self.processes <= 1 or len(tasks) <= 1:
+            for args in tasks:
+                yield fn(self.data, self.signal_fn, self.objective, self.backtest_kwargs, *args)
+            return
+        processes = min(self.processes, len(tasks))
+        chunksize = self.chunksize or max(1, len(tasks) // (processes * 4))
+        with SharedOHLCV(self.data, tuple(self.data)) as shared:
+            with multiprocessing.Pool(processes, _init_worker,
+                                      (shared.handle, self.signal_fn, self.objective, self.backtest_kwargs)) as pool:
+                yield from pool.imap_unordered(_run_task, [(fn, args) for args in tasks], chunksize)
+
+    def grid_search(self, **kwargs) -> ResultTable:
+        return self.run(grid(self.space), **kwargs)
+
+    def random_search(self, n: int, seed: Optional[int] = None, **kwargs) -> ResultTable:
+        return self.run(random_sample(self.space, n, seed), **kwargs)
+
+    def successive_halving(self, n: Optional[int] = None, eta: int = 3, min_bars: Optional[int] = None,
+                           seed: Optional[int] = None, **kwargs) -> ResultTable:
+        """Score many candidates on the most recent bars, keep the best 1/eta, repeat on eta times more history.
+
+        Starts from `n` random candidates (the full grid when n is None) and
+        ends with the survivors evaluated on all bars; the returned table is
+        that final round.
+        """
+        candidates = grid(self.space) if n is None else random_sample(self.space, n, seed)
+        rounds = max(1, math.ceil(math.log(max(len(candidates), 1), eta)))
+        bars = min_bars or max(1, self.length // eta ** (rounds - 1))
+        while True:
+            bars = min(bars, self.length)
+            table = self.run(candidates, start=self.length - bars, **kwargs)
+            if bars >= self.length:
+                return table
+            candidates = [row.params for row in table.top(max(1, len(candidates) // eta))]
+            bars = self.length if len(candidates) <= 1 else bars * eta
@@ -0,0 +1,249 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import stats
+
+from .position_book import PositionBook
+
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class BarWindow:
+    """The last `capacity` bars of every symbol as symbols x bars matrices, one per OHLCV field.
+
+    Uses RingBuffer's double write: each column goes to `head` and
+    `head + capacity`, so `view()` is always a contiguous, copy-free
+    oldest-to-newest slice. Symbols without a bar on a clock tick carry their
+    previous values forward.
+    """
+
+    def __init__(self, n_symbols: int, capacity: int, fields: Sequence[str] = BAR_FIELDS):
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._buffers = {name: np.full((n_symbols, 2 * capacity), np.nan) for name in self.fields}
+        self._latest = {name: np.full(n_symbols, np.nan) for name in self.fields}
+        self._head = 0
+        self.count = 0
+
+    def push(self, symbols: np.ndarray, bars: Dict[str, np.ndarray]) -> None:
+        """Advance the clock one tick; `bars[field][i]` is the new bar of `symbols[i]`"""
+        for name in self.fields:
+            latest = self._latest[name]
+            latest[symbols] = bars[name]
+            buffer = self._buffers[name]
+            buffer[:, self._head] = latest
+            buffer[:, self._head + self.capacity] = latest
+        self._head = (self._head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def latest(self, name: str = 'close') -> np.ndarray:
+        return self._latest[name]
+
+    def view(self, name: str = 'close', length: Optional[int] = None) -> np.ndarray:
+        count = self.count if length is None else max(0, min(int(length), self.count))
+        end = self._head + self.capacity
+        return self._buffers[name][:, end - count:end]
+
+
+class RollingCovariance:
+    """Covariance of the last `window` return vectors, updated in O(n^2) per tick.
+
+    Keeps the window's sum and cross-product matrix, adding the new row and
+    subtracting the one that falls out; both are rebuilt from the stored rows
+    once per window to stop floating-point drift.
+    """
+
+    def __init__(self, n_assets: int, window: int):
+        self.window = window
+        self._rows = np.zeros((window, n_assets))
+        self._sum = np.zeros(n_assets)
+        self._cross = np.zeros((n_assets, n_assets))
+        self._position = 0
+        self.count = 0
+
+    def update(self, returns: np.ndarray) -> None:
+        returns = np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+        if self.count == self.window:
+            old = self._rows[self._position]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        else:
+            self.count += 1
+        self._rows[self._position] = returns
+        self._sum += returns
+        self._cross += np.outer(returns, returns)
+        self._position = (self._position + 1) % self.window
+        if self._position == 0 and self.count == self.window:
+            self._sum = self._rows.sum(axis=0)
+            self._cross = self._rows.T @ self._rows
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self._sum / self.count if self.count else self._sum
+
+    def covariance(self) -> np.ndarray:
+        """Population covariance (np.cov with bias=True)"""
+        if not self.count:
+            return self._cross.copy()
+        mean = self.mean
+        return self._cross / self.count - np.outer(mean, mean)
+
+    def correlation(self) -> np.ndarray:
+        covariance = self.covariance()
+        std = np.sqrt(np.clip(np.diag(covariance), 0, None))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = covariance / np.outer(std, std)
+        return np.nan_to_num(correlation)
+
+    def portfolio_variance(self, weights: np.ndarray) -> float:
+        """w' C w from the running sums, without materializing C"""
+        if not self.count:
+            return 0.0
+        return float(weights @ self._cross @ weights / self.count - (weights @ self.mean) ** 2)
+
+    def value_at_risk(self, weights: np.ndarray, confidence: float = 0.95) -> float:
+        """Parametric (normal) one-period VaR as a return, negative like RiskEngine.value_at_risk"""
+        sigma = np.sqrt(max(self.portfolio_variance(weights), 0.0))
+        return float(weights @ self.mean + stats.norm.ppf(1 - confidence) * sigma)
+
+
+def bar_clock(data: Dict[str, Dict[str, np.ndarray]]) -> Iterator[Tuple[float, np.ndarray, np.ndarray]]:
+    """Merge per-symbol bar times into one ascending clock.
+
+    Yields (time, symbol indices with a bar at that time, each symbol's bar
+    index). A heap holds one cursor per symbol, so nothing is materialized
+    beyond the symbols' own (possibly memory-mapped) arrays.
+    """
+    times = [np.asarray(columns['time']) for columns in data.values()]
+    heap = [(float(symbol_times[0]), index) for index, symbol_times in enumerate(times) if len(symbol_times)]
+    heapq.heapify(heap)
+    cursors = np.zeros(len(times), dtype=np.int64)
+    while heap:
+        now = heap[0][0]
+        symbols = []
+        while heap and heap[0][0] == now:
+            _, index = heapq.heappop(heap)
+            symbols.append(index)
+        symbols = np.array(symbols, dtype=np.int64)
+        yield now, symbols, cursors[symbols].copy()
+        for index in symbols:
+            cursors[index] += 1
+            if cursors[index] < len(times[index]):
+                heapq.heappush(heap, (float(times[index][cursors[index]]), index))
+
+
+@dataclass
+class PortfolioResult:
+    symbols: List[str]
+    time: np.ndarray
+    equity: np.ndarray
+    gross_exposure: np.ndarray
+    value_at_risk: np.ndarray
+    quantities: np.ndarray
+    book: PositionBook
+    fills: int = 0
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+class PortfolioBacktest:
+    """Many symbols on one aligned bar clock, trading out of a single shared account.
+
+    On each tick `signal_fn(window, active, state)` sees every symbol's
+    recent bars at once (BarWindow matrices) and returns target weights of
+    equity per symbol, NaN meaning "leave as is"; only symbols with a bar on
+    that tick are traded. Targets are scaled down to `max_leverage` and
+    filled at the close into a PositionBook. Portfolio VaR comes from a
+    RollingCovariance of the symbols' returns. Memory is O(symbols x window)
+    plus the input arrays.
+    """
+
+    def __init__(self, data: Dict[str, Dict[str, np.ndarray]], signal_fn: Callable, window: int = 200,
+                 initial_capital: float = 1_000_000.0, commission: float = 0.0, slippage: float = 0.0,
+                 max_leverage: float = 1.0, risk_window: int = 60, confidence: float = 0.95,
+                 sectors: Optional[Dict[str, str]] = None, betas: Optional[Dict[str, float]] = None):
+        self.data = data
+        self.symbols = list(data)
+        self.signal_fn = signal_fn
+        self.window = window
+        self.initial_capital = initial_capital
+        self.commission = commission
+        self.slippage = slippage
+        self.max_leverage = max_leverage
+        self.risk_window = risk_window
+        self.confidence = confidence
+        self.sectors = sectors or {}
+        self.betas = betas or {}
+
+    def run(self, state: Any = None) -> PortfolioResult:
+        n = len(self.symbols)
+        columns = list(self.data.values())
+        window = BarWindow(n, self.window)
+        covariance = RollingCovariance(n, self.risk_window)
+        book = PositionBook()
+        for symbol in self.symbols:
+            book.register(symbol, self.sectors.get(symbol), self.betas.get(symbol))
+
+        quantities = np.zeros(n)
+        cash = self.initial_capital
+        fills = 0
+        times, equity_curve, gross_curve, var_curve = [], [], [], []
+        previous_close = np.full(n, np.nan)
+
+        for now, symbols, cursors in bar_clock(self.data):
+            bars = {name: np.array([columns[s][name][c] for s, c in zip(symbols, cursors)], dtype=np.float64)
+                    for name in BAR_FIELDS}
+            window.push(symbols, bars)
+            close = window.latest('close')
+            for symbol in symbols[quantities[symbols] != 0]:
+                book.mark(self.symbols[symbol], close[symbol])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                covariance.update(close / previous_close - 1)
+            previous_close = close.copy()
+
+            equity = cash + book.net_exposure
+            active = np.zeros(n, dtype=bool)
+            active[symbols] = True
+            targets = np.asarray(self.signal_fn(window, active, state), dtype=np.float64)
+            targets = np.where(active, targets, np.nan)
+
+            if equity > 0 and not np.all(np.isnan(targets)):
+                current = np.nan_to_num(quantities * close) / equity
+                effective = np.where(np.isnan(targets), current, targets)
+                gross = np.abs(effective).sum()
+                scale = self.max_leverage / gross if gross > self.max_leverage else 1.0
+                for symbol in np.flatnonzero(~np.isnan(targets)):
+                    price = close[symbol]
+                    delta = targets[symbol] * scale * equity / price - quantities[symbol]
+                    if not np.isfinite(delta) or abs(delta * price) < 1e-9 * equity:
+                        continue
+                    fill_price = price * (1 + self.slippage if delta > 0 else 1 - self.slippage)
+                    fee = abs(delta) * fill_price * self.commission
+                    book.fill(self.symbols[symbol], delta, fill_price, fee)
+                    book.mark(self.symbols[symbol], price)
+                    cash -= delta * fill_price + fee
+                    quantities[symbol] += delta
+                    fills += 1
+                equity = cash + book.net_exposure
+
+            weights = np.nan_to_num(quantities * close) / equity if equity else np.zeros(n)
+            times.append(now)
+            equity_curve.append(equity)
+            gross_curve.append(book.gross_exposure)
+            var_curve.append(covariance.value_at_risk(weights, self.confidence) if covariance.count > 1 else 0.0)
+
+        equity_curve = np.array(equity_curve)
+        returns = np.diff(equity_curve) / equity_curve[:-1] if len(equity_curve) > 1 else np.zeros(0)
+        peak = np.maximum.accumulate(equity_curve) if len(equity_curve) else equity_curve
+        metrics = {
+            'net_profit': float(equity_curve[-1] - self.initial_capital) if len(equity_curve) else 0.0,
+            'return_pct': float(equity_curve[-1] / self.initial_capital * 100 - 100) if len(equity_curve) else 0.0,
+            'max_drawdown': float(((peak - equity_curve) / peak).max()) if len(equity_curve) else 0.0,
+            'volatility': float(returns.std()) if len(returns) else 0.0,
+            'realized_pnl': book.realized_pnl,
+            'unrealized_pnl': book.unrealized_pnl,
+            'fills': fills,
+        }
+        return PortfolioResult(self.symbols, np.array(times), equity_curve, np.array(gross_curve),
+                               np.array(var_curve), quantities, book, fills, metrics)
@@ -0,0 +1,186 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# quantities this close to zero after incremental updates are treated as flat
+EPSILON = 1e-9
+
+
+@dataclass
+class SymbolPosition:
+    symbol: str
+    sector: str = 'Unknown'
+    beta: float = 1.0
+    long_qty: float = 0.0
+    long_cost: float = 0.0
+    short_qty: float = 0.0
+    short_cost: float = 0.0
+    realized_pnl: float = 0.0
+    last_price: Optional[float] = None
+
+    @property
+    def net_quantity(self) -> float:
+        return self.long_qty - self.short_qty
+
+    @property
+    def gross_quantity(self) -> float:
+        return self.long_qty + self.short_qty
+
+    @property
+    def avg_price(self) -> float:
+        """Average entry price over every open lot"""
+        gross = self.gross_quantity
+        return (self.long_cost + self.short_cost) / gross if gross > 0 else 0.0
+
+    def side_avg_price(self, direction: str) -> float:
+        if direction == 'long':
+            return self.long_cost / self.long_qty if self.long_qty > 0 else 0.0
+        return self.short_cost / self.short_qty if self.short_qty > 0 else 0.0
+
+    @property
+    def market_value(self) -> float:
+        return self.net_quantity * (self.last_price or 0.0)
+
+    @property
+    def unrealized_pnl(self) -> float:
+        if self.last_price is None:
+            return 0.0
+        return (self.last_price * self.long_qty - self.long_cost) + (self.short_cost - self.last_price * self.short_qty)
+
+
+class PositionBook:
+    """Per-symbol lots netted into running quantities, costs and PnL, with portfolio aggregates kept incrementally.
+
+    Every change to a symbol (lot opened or closed, fill, new mark price)
+    subtracts that symbol's old contribution from the totals and adds the
+    new one, so exposure, PnL and sector/beta reads are O(1) however many
+    lots or symbols are open.
+    """
+
+    def __init__(self):
+        self.positions: Dict[str, SymbolPosition] = {}
+        self.net_exposure = 0.0
+        self.gross_exposure = 0.0
+        self.beta_exposure = 0.0
+        self.unrealized_pnl = 0.0
+        self.realized_pnl = 0.0
+        self.sector_exposure: Dict[str, float] = {}
+
+    def register(self, symbol: str, sector: Optional[str] = None, beta: Optional[float] = None) -> SymbolPosition:
+        """Get (creating on first use) a symbol's entry, optionally setting its sector and beta"""
+        position = self.positions.get(symbol)
+        if position is None:
+            position = self.positions[symbol] = SymbolPosition(symbol)
+        if sector is not None or beta is not None:
+            before = self._contribution(position)
+            if sector is not None:
+                position.sector = sector
+            if beta is not None:
+                position.beta = beta
+            self._apply(position, before)
+        return position
+
+    def _contribution(self, position: SymbolPosition) -> Tuple[str, float, float, float, float]:
+        value = position.market_value
+        return (position.sector, value, abs(value), position.beta * value, position.unrealized_pnl)
+
+    def _apply(self, position: SymbolPosition, before: Tuple[str, float, float, float, float]) -> None:
+        old_sector, old_value, old_abs, old_beta, old_unrealized = before
+        sector, value, abs_value, beta_value, unrealized = self._contribution(position)
+        self.net_exposure += value - old_value
+        self.gross_exposure += abs_value - old_abs
+        self.beta_exposure += beta_value - old_beta
+        self.unrealized_pnl += unrealized - old_unrealized
+        self.sector_exposure[old_sector] = self.sector_exposure.get(old_sector, 0.0) - old_value
+        self.sector_exposure[sector] = self.sector_exposure.get(sector, 0.0) + value
+
+    def add_lot(self, symbol: str, direction: str, quantity: float, price: float) -> None:
+        position = self.register(symbol)
+        before = self._contribution(position)
+        if position.last_price is None:
+            position.last_price = price
+        if direction == 'long':
+            position.long_qty += quantity
+            position.long_cost += quantity * price
+        else:
+            position.short_qty += quantity
+            position.short_cost += quantity * price
+        self._apply(position, before)
+
+    def remove_lot(self, symbol: str, direction: str, quantity: float, entry_price: float,
+                   exit_price: float, commission: float = 0.0) -> float:
+        """Close `quantity` of a lot entered at `entry_price`; returns the realized PnL"""
+        position = self.register(symbol)
+        before = self._contribution(position)
+        if direction == 'long':
+            position.long_qty -= quantity
+            position.long_cost -= quantity * entry_price
+            if position.long_qty <= EPSILON:
+                position.long_qty = position.long_cost = 0.0
+            pnl = (exit_price - entry_price) * quantity - commission
+        else:
+            position.short_qty -= quantity
+            position.short_cost -= quantity * entry_price
+            if position.short_qty <= EPSILON:
+                position.short_qty = position.short_cost = 0.0
+            pnl = (entry_price - exit_price) * quantity - commission
+        position.realized_pnl += pnl
+        self.realized_pnl += pnl
+        self._apply(position, before)
+        return pnl
+
+    def fill(self, symbol: str, quantity: float, price: float, commission: float = 0.0) -> float:
+        """Apply a signed fill (buy > 0), netting against the opposite side at its average cost"""
+        position = self.register(symbol)
+        direction = 'long' if quantity > 0 else 'short'
+        opposite = 'short' if direction == 'long' else 'long'
+        remaining = abs(quantity)
+        realized = 0.0
+        open_opposite = position.short_qty if direction == 'long' else position.long_qty
+        if open_opposite > 0:
+            closed = min(remaining, open_opposite)
+            realized = self.remove_lot(symbol, opposite, closed, position.side_avg_price(opposite), price,
+                                       commission * closed / remaining)
+            commission -= commission * closed / remaining
+            remaining -= closed
+        if remaining > EPSILON:
+            self.add_lot(symbol, direction, remaining, price)
+            if commission:
+                position.realized_pnl -= commission
+                self.realized_pnl -= commission
+                realized -= commission
+        return realized
+
+    def mark(self, symbol: str, price: float) -> None:
+        position = self.positions.get(symbol)
+        if position is None:
+            return
+        before = self._contribution(position)
+        position.last_price = price
+        self._apply(position, before)
+
+    def get(self, symbol: str) -> Optional[SymbolPosition]:
+        return self.positions.get(symbol)
+
+    def net_quantity(self, symbol: str) -> float:
+        position = self.positions.get(symbol)
+        return position.net_quantity if position else 0.0
+
+    def gross_quantity(self, symbol: str) -> float:
+        position = self.positions.get(symbol)
+        return position.gross_quantity if position else 0.0
+
+    def avg_price(self, symbol: str) -> float:
+        position = self.positions.get(symbol)
+        return position.avg_price if position else 0.0
+
+    def exposure(self, symbol: str) -> float:
+        position = self.positions.get(symbol)
+        return position.market_value if position else 0.0
+
+    def projected(self, symbol: str, quantity: float, price: float) -> Tuple[float, float]:
+        """(symbol exposure, portfolio gross exposure) after a hypothetical signed fill at `price`"""
+        position = self.positions.get(symbol)
+        current_qty = position.net_quantity if position else 0.0
+        current_value = abs(current_qty * (position.last_price or price)) if position else 0.0
+        symbol_value = abs((current_qty + quantity) * price)
+        return symbol_value, self.gross_exposure - current_value + symbol_value
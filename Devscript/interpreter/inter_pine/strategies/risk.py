@@ -158,13 +158,66 @@ class RiskEngine:
             sector_exposure[sector] = sector_exposure.get(sector, 0) + position
         return sector_exposure
 
+    def calculate_sector_exposure(self, book) -> Dict[str, float]:
+        """Market value per sector, read from a PositionBook's running aggregates"""
+        return {sector: value for sector, value in book.sector_exposure.items() if value}
+
+    def calculate_beta_exposure(self, book) -> float:
+        """Beta-weighted market value of a PositionBook"""
+        return book.beta_exposure
+
     def position_correlation(self, 
                            position1: np.ndarray,
                            position2: np.ndarray) -> float:
         """Calculate correlation between two positions"""
         return np.corrcoef(position1, position2)[0][1]
 
-    def check_limits(self, 
+    def trade_risk(self,
+                   journal,
+                   capital: float,
+                   confidence: float = 0.95) -> Dict[str, float]:
+        """Risk measures over a TradeJournal's per-trade returns, computed on its columns"""
+        returns = journal.returns(capital)
+        if len(returns) == 0:
+            return {}
+        wins, losses = returns[returns > 0], returns[returns < 0]
+        win_rate = len(wins) / len(returns)
+        win_loss_ratio = wins.mean() / -losses.mean() if len(wins) and len(losses) else 0.0
+        return {
+            'value_at_risk': self.value_at_risk(returns, confidence),
+            'expected_shortfall': self.expected_shortfall(returns, confidence),
+            'max_drawdown': self.max_drawdown(returns),
+            'win_rate': win_rate,
+            'win_loss_ratio': win_loss_ratio,
+            'kelly_fraction': self.kelly_criterion(win_rate, win_loss_ratio) if win_loss_ratio else 0.0
+        }
+
+    def monte_carlo_risk(self,
+                         result,
+                         confidence: float = 0.95) -> Dict[str, float]:
+        """Distribution-based counterparts of the point estimates from a MonteCarloResult"""
+        return {
+            'value_at_risk': result.value_at_risk(confidence),
+            'expected_shortfall': result.expected_shortfall(confidence),
+            'drawdown_at_risk': result.drawdown_at_risk(confidence),
+            'ruin_probability': result.ruin_probability,
+            'median_terminal_equity': float(np.median(result.terminal_equity))
+        }
+
+    def rolling_portfolio_risk(self,
+                               covariance,
+                               weights: np.ndarray,
+                               confidence: float = 0.95) -> Dict[str, float]:
+        """portfolio_var / correlation_risk from a RollingCovariance's running sums instead of return arrays"""
+        correlation = covariance.correlation()
+        off_diagonal = np.abs(correlation[~np.eye(len(correlation), dtype=bool)])
+        var = covariance.value_at_risk(weights, confidence)
+        return {
+            'value_at_risk': max(min(var, 0), -1),
+            'max_correlation': float(off_diagonal.max()) if len(off_diagonal) else 0.0
+        }
+
+    def check_limits(self,
                     position_size: float,
                     portfolio_risk: float,
                     correlation: float,
@@ -178,6 +231,21 @@ class RiskEngine:
             'leverage': leverage <= self.risk_limits['max_leverage'],
             'concentration': concentration <= self.risk_limits['max_concentration']
         }
+    def check_order(self,
+                    book,
+                    symbol: str,
+                    quantity: float,
+                    price: float,
+                    equity: float) -> Dict[str, bool]:
+        """Pre-trade limit check of a signed order against a PositionBook's running exposures"""
+        symbol_value, gross_value = book.projected(symbol, quantity, price)
+        return {
+            'position_size': symbol_value <= equity * self.risk_limits['max_position_size'],
+            'leverage': gross_value <= equity * self.risk_limits['max_leverage'],
+            'concentration': symbol_value <= gross_value * self.risk_limits['max_concentration']
+                             if gross_value > 0 else True
+        }
+
     def calculate_max_position_size(self, capital: float, price: float) -> float:
         """Calculate maximum allowed position size based on capital"""
         max_size = capital * self.risk_limits['max_position_size']
@@ -248,6 +316,8 @@ def get_risk_registry(risk_engine: RiskEngine) -> Dict:
         'correlation_risk': risk_engine.correlation_risk,
         'beta_exposure': risk_engine.beta_exposure,
         'sector_exposure': risk_engine.sector_exposure,
+        'calculate_sector_exposure': risk_engine.calculate_sector_exposure,
+        'calculate_beta_exposure': risk_engine.calculate_beta_exposure,
         'position_correlation': risk_engine.position_correlation,
         
         # Risk Limits
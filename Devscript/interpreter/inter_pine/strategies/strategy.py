@@ -1,9 +1,17 @@
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 from datetime import datetime
+import itertools
 import numpy as np
 from enum import Enum
 
+from .bar_magnifier import BarMagnifier
+from .journal import TradeJournal
+from .matching import Fill, MatchingEngine
+from .metrics import OnlineMetrics
+from .position_book import PositionBook
+from .risk import RiskEngine as PortfolioRiskEngine
+
 class OrderType(Enum):
     MARKET = "market"
     LIMIT = "limit"
@@ -22,6 +30,7 @@ class Position:
     entry_comment: str
     sl_price: Optional[float] = None
     tp_price: Optional[float] = None
+    commission: float = 0.0
 
 @dataclass
 class Order:
@@ -32,6 +41,9 @@ class Order:
     order_id: str
     timestamp: datetime
     status: str = 'pending'
+    stop_price: Optional[float] = None
+    name: Optional[str] = None
+    oco: Optional[str] = None
 
 class RiskEngine:
     def __init__(self):
@@ -79,6 +91,12 @@ class PerformanceEngine:
         self.current_capital: float = self.initial_capital
         self.max_drawdown_value: float = 0
         self.peak_capital: float = self.initial_capital
+        self.online = OnlineMetrics()
+
+    def _metrics(self) -> OnlineMetrics:
+        """Running statistics, caught up with trades and equity ticks appended since the last read"""
+        self.online.sync_trades(self.strategy_engine.trade_history)
+        return self.online.sync_equity(self.equity_curve)
         
     def calculate_equity(self) -> float:
         return self.current_capital
@@ -87,10 +105,10 @@ class PerformanceEngine:
         return self.current_capital - self.initial_capital
         
     def calculate_gross_profit(self) -> float:
-        return sum(trade['pnl'] for trade in self.strategy_engine.trade_history if trade['pnl'] > 0)
+        return self._metrics().gross_profit
         
     def calculate_gross_loss(self) -> float:
-        return sum(trade['pnl'] for trade in self.strategy_engine.trade_history if trade['pnl'] < 0)
+        return self._metrics().gross_loss
         
     def calculate_profit_factor(self) -> float:
         gross_profit = self.calculate_gross_profit()
@@ -98,17 +116,7 @@ class PerformanceEngine:
         return gross_profit / gross_loss if gross_loss != 0 else float('inf')
         
     def calculate_max_drawdown(self) -> float:
-        if not self.equity_curve:
-            return 0.0
-        peak = self.equity_curve[0]
-        max_dd = 0.0
-        
-        for equity in self.equity_curve:
-            if equity > peak:
-                peak = equity
-            dd = (peak - equity) / peak
-            max_dd = max(max_dd, dd)
-        return max_dd
+        return self._metrics().max_drawdown
         
     def calculate_recovery_factor(self) -> float:
         net_profit = self.calculate_net_profit()
@@ -118,6 +126,8 @@ class PerformanceEngine:
     def calculate_sharpe_ratio(self, risk_free_rate: float = 0.02) -> float:
         if len(self.equity_curve) < 2:
             return 0.0
+        if risk_free_rate == self.online.risk_free_rate:
+            return self._metrics().sharpe_ratio
             
         returns = np.diff(self.equity_curve) / self.equity_curve[:-1]
         excess_returns = returns - (risk_free_rate / 252)
@@ -126,6 +136,8 @@ class PerformanceEngine:
     def calculate_sortino_ratio(self, risk_free_rate: float = 0.02) -> float:
         if len(self.equity_curve) < 2:
             return 0.0
+        if risk_free_rate == self.online.risk_free_rate:
+            return self._metrics().sortino_ratio
             
         returns = np.diff(self.equity_curve) / self.equity_curve[:-1]
         excess_returns = returns - (risk_free_rate / 252)
@@ -143,42 +155,40 @@ class PerformanceEngine:
         return annual_return / max_dd if max_dd > 0 else 0
         
     def get_total_trades(self) -> int:
-        return len(self.strategy_engine.trade_history)
+        return self._metrics().trades
         
     def get_winning_trades(self) -> int:
-        return sum(1 for trade in self.strategy_engine.trade_history if trade['pnl'] > 0)
+        return self._metrics().wins
         
     def get_losing_trades(self) -> int:
-        return sum(1 for trade in self.strategy_engine.trade_history if trade['pnl'] < 0)
+        return self._metrics().losses
         
     def calculate_win_rate(self) -> float:
         total = self.get_total_trades()
         return (self.get_winning_trades() / total) * 100 if total > 0 else 0
         
     def calculate_avg_trade(self) -> float:
-        trades = self.strategy_engine.trade_history
-        return sum(trade['pnl'] for trade in trades) / len(trades) if trades else 0
+        return self._metrics().avg_trade
         
     def calculate_avg_winning_trade(self) -> float:
-        winning_trades = [trade['pnl'] for trade in self.strategy_engine.trade_history if trade['pnl'] > 0]
-        return sum(winning_trades) / len(winning_trades) if winning_trades else 0
+        return self._metrics().avg_winning_trade
         
     def calculate_avg_losing_trade(self) -> float:
-        losing_trades = [trade['pnl'] for trade in self.strategy_engine.trade_history if trade['pnl'] < 0]
-        return sum(losing_trades) / len(losing_trades) if losing_trades else 0
+        return self._metrics().avg_losing_trade
         
     def get_largest_win(self) -> float:
-        return max((trade['pnl'] for trade in self.strategy_engine.trade_history), default=0)
+        largest = self._metrics().largest_pnl
+        return largest if largest is not None else 0
         
     def get_largest_loss(self) -> float:
-        return min((trade['pnl'] for trade in self.strategy_engine.trade_history), default=0)
+        smallest = self._metrics().smallest_pnl
+        return smallest if smallest is not None else 0
         
     def get_max_contracts_held(self) -> float:
-        return max((trade['quantity'] for trade in self.strategy_engine.trade_history), default=0)
+        return self._metrics().max_quantity
         
     def calculate_max_leverage(self) -> float:
-        max_exposure = max((trade['quantity'] * trade['entry_price'] 
-                          for trade in self.strategy_engine.trade_history), default=0)
+        max_exposure = self._metrics().max_exposure
         return max_exposure / self.initial_capital if self.initial_capital > 0 else 0
 
     def update_metrics(self, trade: Dict[str, Any]) -> None:
@@ -230,6 +240,7 @@ class PerformanceEngine:
         self.current_capital = self.initial_capital
         self.peak_capital = self.initial_capital
         self.max_drawdown_value = 0
+        self.online.reset()
 
 class TradeEngine:
     def __init__(self, strategy_engine: 'StrategyEngine'):
@@ -274,8 +285,7 @@ class TradeEngine:
 class StrategyEngine:
     def __init__(self):
         self.positions: Dict[str, Position] = {}
-        self.orders: Dict[str, Order] = {}
-        self.trade_history: List[Dict] = []
+        self.trade_history = TradeJournal()
         self.equity_curve = []
         self.initial_capital = 100000
         self.current_capital = self.initial_capital
@@ -283,6 +293,16 @@ class StrategyEngine:
         self.risk_engine = RiskEngine()
         self.performance_engine = PerformanceEngine(self)
         self.trade_engine = TradeEngine(self)
+        self.matching_engine = MatchingEngine(self.trade_engine)
+        self.orders: Dict[str, Order] = self.matching_engine.orders
+        self.symbol = 'default'
+        self.position_book = PositionBook()
+        # pre-trade limits on the book's exposures; unconstrained until a strategy sets them
+        self.portfolio_risk = PortfolioRiskEngine()
+        self.portfolio_risk.risk_limits.update(max_position_size=float('inf'), max_leverage=float('inf'),
+                                               max_concentration=1.0)
+        self.bar_magnifier: Optional[BarMagnifier] = None
+        self._position_ids = itertools.count(1)
         
         self.current_bar = 0
 
@@ -295,8 +315,18 @@ class StrategyEngine:
         # Check if entry is allowed by risk engine
         if not self.risk_engine.check_entry_allowed():
             return False
-            
-        return True
+
+        # Exposure limits against the position book, valued at the order's price or the last mark
+        price = order.price or order.stop_price
+        if price is None:
+            position = self.position_book.get(self.symbol)
+            price = position.last_price if position else None
+        if price is None:
+            return True
+        quantity = order.quantity if order.direction == 'long' else -order.quantity
+        checks = self.portfolio_risk.check_order(self.position_book, self.symbol, quantity, price,
+                                                 self.current_capital)
+        return all(checks.values())
 
     def enter_long(self, price: float, qty: float, name: Optional[str] = None) -> bool:
         order = Order(
@@ -319,19 +349,88 @@ class StrategyEngine:
                 entry_bar=self.current_bar,
                 entry_comment=""
             )
-            self.positions[position.entry_id] = position
+            self._open_position(position)
             return True
         return False
     def cancel_order(self, order_id: str) -> bool:
-        if order_id in self.orders:
-            del self.orders[order_id]
-            return True
-        return False
+        return self.matching_engine.cancel(order_id)
 
     def cancel_all_orders(self) -> bool:
-        self.orders.clear()
+        self.matching_engine.cancel_all()
         return True
 
+    def place_order(self, direction: str, qty: float, order_type: OrderType = OrderType.MARKET,
+                    limit: Optional[float] = None, stop: Optional[float] = None,
+                    name: Optional[str] = None, oco: Optional[str] = None) -> Optional[str]:
+        """Queue an order for the matching engine; fills happen in process_bar"""
+        order = Order(
+            direction=direction,
+            price=limit,
+            quantity=qty,
+            order_type=order_type,
+            order_id=self.matching_engine.next_id(),
+            timestamp=datetime.now(),
+            stop_price=stop,
+            name=name,
+            oco=oco
+        )
+        # only orders that add to (or open) exposure are subject to the position limits
+        if self._net_direction() in (None, direction) and not self._check_risk_limits(order):
+            return None
+        return self.matching_engine.submit(order)
+
+    def process_bar(self, open_: float, high: float, low: float, close: float,
+                    bar_index: Optional[int] = None, time: Optional[float] = None) -> List[Fill]:
+        """Match pending orders against the bar and apply the fills to positions.
+
+        With a bar_magnifier set and the bar's `time` given, bars that have
+        pending orders are matched along their lower-timeframe bars instead.
+        """
+        if bar_index is not None:
+            self.current_bar = bar_index
+        paths = None
+        if self.bar_magnifier is not None and time is not None and self.matching_engine.has_pending:
+            paths = self.bar_magnifier.paths(time)
+        if paths:
+            fills = self.matching_engine.process_paths(paths, self.current_bar)
+        else:
+            fills = self.matching_engine.process_bar(open_, high, low, close, self.current_bar)
+        for fill in fills:
+            self._apply_fill(fill)
+        self.position_book.mark(self.symbol, close)
+        return fills
+
+    def _net_direction(self) -> Optional[str]:
+        return next(iter(self.positions.values())).direction if self.positions else None
+
+    def _apply_fill(self, fill: Fill) -> None:
+        """Net a fill against opposite positions first (FIFO), then open the remainder"""
+        remaining = fill.quantity
+        for pos_id, position in list(self.positions.items()):
+            if remaining <= 0 or position.direction == fill.direction:
+                continue
+            closed = min(remaining, position.size)
+            self._process_exit(pos_id, position, fill.price, closed,
+                               commission=fill.commission * closed / fill.quantity)
+            remaining -= closed
+        if remaining > 0:
+            position = Position(
+                direction=fill.direction,
+                size=remaining,
+                entry_price=fill.price,
+                entry_time=datetime.now(),
+                entry_name=fill.name or ('Long Entry' if fill.direction == 'long' else 'Short Entry'),
+                entry_id=fill.order_id,
+                entry_bar=self.current_bar,
+                entry_comment="",
+                commission=fill.commission * remaining / fill.quantity
+            )
+            self._open_position(position)
+
+    def _open_position(self, position: Position) -> None:
+        self.positions[position.entry_id] = position
+        self.position_book.add_lot(self.symbol, position.direction, position.size, position.entry_price)
+
 
     def enter_short(self, price: float, qty: float, name: Optional[str] = None) -> bool:
         order = Order(
@@ -354,7 +453,7 @@ class StrategyEngine:
                 entry_bar=self.current_bar,
                 entry_comment=""
             )
-            self.positions[position.entry_id] = position
+            self._open_position(position)
             return True
         return False
     def exit_position(self, price: Optional[float] = None, qty: Optional[float] = None, 
@@ -375,15 +474,18 @@ class StrategyEngine:
         return True
 
     def get_position_size(self) -> float:
-        return sum(pos.size for pos in self.positions.values())
+        return self.position_book.gross_quantity(self.symbol)
+
+    def get_net_position_size(self) -> float:
+        """Signed size, positive when long (Pine's strategy.position_size)"""
+        return self.position_book.net_quantity(self.symbol)
 
     def get_position_value(self) -> float:
-        return sum(pos.size * pos.entry_price for pos in self.positions.values())
+        position = self.position_book.get(self.symbol)
+        return position.long_cost + position.short_cost if position else 0.0
 
     def get_position_avg_price(self) -> float:
-        total_value = sum(pos.size * pos.entry_price for pos in self.positions.values())
-        total_size = sum(pos.size for pos in self.positions.values())
-        return total_value / total_size if total_size > 0 else 0.0
+        return self.position_book.avg_price(self.symbol)
 
     def get_position_entry_name(self) -> str:
         return next(iter(self.positions.values())).entry_name if self.positions else ""
@@ -403,9 +505,14 @@ class StrategyEngine:
     def get_position_entry_comment(self) -> str:
         return next(iter(self.positions.values())).entry_comment if self.positions else ""
 
-    def _process_exit(self, pos_id: str, position: Position, exit_price: float, exit_qty: float):
-        pnl = self._calculate_position_pnl(position, exit_price)
+    def _process_exit(self, pos_id: str, position: Position, exit_price: float, exit_qty: float,
+                      commission: float = 0.0):
+        exit_qty = min(exit_qty, position.size)
+        entry_commission = position.commission * exit_qty / position.size
+        pnl = self._calculate_position_pnl(position, exit_price, exit_qty) - entry_commission - commission
         self._update_equity(pnl)
+        self.position_book.remove_lot(self.symbol, position.direction, exit_qty, position.entry_price,
+                                      exit_price, entry_commission + commission)
         
         trade_record = {
             'entry_time': position.entry_time,
@@ -415,6 +522,7 @@ class StrategyEngine:
             'exit_price': exit_price,
             'quantity': exit_qty,
             'pnl': pnl,
+            'commission': entry_commission + commission,
             'name': position.entry_name
         }
         self.trade_history.append(trade_record)
@@ -424,11 +532,13 @@ class StrategyEngine:
             del self.positions[pos_id]
         else:
             position.size -= exit_qty
+            position.commission -= entry_commission
 
-    def _calculate_position_pnl(self, position: Position, exit_price: float) -> float:
+    def _calculate_position_pnl(self, position: Position, exit_price: float, qty: Optional[float] = None) -> float:
+        size = position.size if qty is None else qty
         if position.direction == 'long':
-            return (exit_price - position.entry_price) * position.size
-        return (position.entry_price - exit_price) * position.size
+            return (exit_price - position.entry_price) * size
+        return (position.entry_price - exit_price) * size
 
     def _update_equity(self, pnl: float):
         self.current_capital += pnl
@@ -436,7 +546,7 @@ class StrategyEngine:
         self.performance_engine.equity_curve = self.equity_curve
 
     def _generate_position_id(self) -> str:
-        return f"pos_{datetime.now().timestamp()}"
+        return f"pos_{next(self._position_ids)}"
 
     def update_bar(self, bar_index: int) -> None:
         self.current_bar = bar_index
@@ -454,7 +564,9 @@ class StrategySyntax:
             'strategy_cancel': lambda id=None: self.strategy_engine.cancel_order(id),
             'strategy_cancel_all': lambda: self.strategy_engine.cancel_all_orders(),
             'strategy_close_all': lambda: self.strategy_engine.close_all_positions(),
-            'strategy_order': lambda direction, price, qty: self.strategy_engine.cancel_all_orders(direction, price, qty),
+            'strategy_order': lambda direction, qty, order_type=OrderType.MARKET, limit=None, stop=None, name=None, oco=None: self.strategy_engine.place_order(direction, qty, order_type, limit, stop, name, oco),
+            'strategy_process_bar': lambda open_, high, low, close, bar_index=None, time=None: self.strategy_engine.process_bar(open_, high, low, close, bar_index, time),
+            'strategy_bar_magnifier': lambda source, timeframe: setattr(self.strategy_engine, 'bar_magnifier', BarMagnifier(source, timeframe)),
             'strategy_order_cancel': lambda id: self.strategy_engine.cancel_order(id),
             'strategy_risk_allow_entry': lambda: self.strategy_engine.risk_engine.check_entry_allowed(),
 
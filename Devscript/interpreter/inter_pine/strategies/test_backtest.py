@@ -0,0 +1,48 @@
+from strategies.backtest import run_backtest
+import numpy as np
+import unittest
+
+class TestVectorizedBacktest(unittest.TestCase):
+    def setUp(self):
+        self.close = np.array([100.0, 101.0, 103.0, 102.0, 105.0, 104.0])
+        self.entries = np.array([False, True, False, False, False, False])
+        self.exits = np.array([False, False, False, False, True, False])
+
+    def test_fixed_size_long_on_close(self):
+        result = run_backtest(self.close, self.entries, self.exits, size=2.0)
+        self.assertEqual(len(result.trades), 1)
+        trade = result.trades[0]
+        self.assertEqual((trade['entry_bar'], trade['exit_bar']), (1, 4))
+        self.assertAlmostEqual(trade['pnl'], 8.0)
+        np.testing.assert_allclose(result.equity - 100000, [0, 0, 4, 2, 8, 8])
+        np.testing.assert_array_equal(result.position, [0, 1, 1, 1, 0, 0])
+        self.assertEqual(result.metrics['total_trades'], 1)
+        self.assertAlmostEqual(result.metrics['net_profit'], 8.0)
+
+    def test_next_open_fills_and_costs(self):
+        open_ = self.close - 0.5
+        result = run_backtest(self.close, self.entries, self.exits, open_=open_, direction='short',
+                              commission=0.001, slippage=0.01)
+        trade = result.trades[0]
+        self.assertEqual((trade['entry_bar'], trade['exit_bar']), (2, 5))
+        self.assertAlmostEqual(trade['entry_price'], 102.5 * 0.99)
+        self.assertAlmostEqual(trade['exit_price'], 103.5 * 1.01)
+        self.assertAlmostEqual(result.equity[-1] - 100000, trade['pnl'])
+        self.assertLess(trade['pnl'], 0)
+
+    def test_percent_size_compounds(self):
+        entries = np.array([True, False, True, False])
+        exits = np.array([False, True, False, True])
+        result = run_backtest([100.0, 110.0, 100.0, 110.0], entries, exits, size=1.0, size_type='percent',
+                              initial_capital=1000.0)
+        self.assertAlmostEqual(result.equity[-1], 1000.0 * 1.1 * 1.1)
+        self.assertAlmostEqual(result.trades[1]['quantity'], 11.0)
+
+    def test_open_trade_closed_on_last_bar(self):
+        entries = np.array([False, False, True, False])
+        result = run_backtest([10.0, 11.0, 12.0, 15.0], entries, np.zeros(4, dtype=bool))
+        self.assertEqual(result.trades[0]['exit_bar'], 3)
+        self.assertAlmostEqual(result.equity[-1], 100003.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+from strategies.bar_magnifier import ArraySource, BarMagnifier
+from strategies.strategy import StrategyEngine, OrderType
+import numpy as np
+import unittest
+
+class CountingSource(ArraySource):
+    def __init__(self, *columns):
+        super().__init__(*columns)
+        self.calls = 0
+
+    def __call__(self, start, end):
+        self.calls += 1
+        return super().__call__(start, end)
+
+class TestBarMagnifier(unittest.TestCase):
+    def setUp(self):
+        # one 60-unit chart bar 100/110/90/97 made of minute bars that dip to 90 only after reaching 110
+        self.source = CountingSource(np.array([0, 15, 30, 45, 60]),
+                                     np.array([100, 104, 109, 94, 105]),
+                                     np.array([105, 110, 109, 100, 106]),
+                                     np.array([99, 103, 96.5, 90, 104]),
+                                     np.array([104, 109, 97, 97, 105]))
+        self.engine = StrategyEngine()
+        self.engine.trade_engine.commission_rate = 0.0
+        self.engine.trade_engine.slippage_rate = 0.0
+
+    def test_lower_timeframe_decides_fill_order(self):
+        # the chart bar alone assumes the low comes first (nearer extreme) and would hit the stop
+        self.engine.place_order('long', 1.0)
+        self.engine.process_bar(100, 100, 100, 100)
+        target = self.engine.place_order('short', 1.0, OrderType.LIMIT, limit=108.0, oco='exit')
+        self.engine.place_order('short', 1.0, OrderType.STOP, stop=92.0, oco='exit')
+        self.engine.bar_magnifier = BarMagnifier(self.source, 60)
+        fills = self.engine.process_bar(100, 110, 90, 97, 1, time=0)
+        self.assertEqual([(fill.order_id, fill.price) for fill in fills], [(target, 108.0)])
+
+    def test_gap_between_lower_bars_fills_at_open(self):
+        self.engine.place_order('short', 1.0, OrderType.STOP, stop=96.0)
+        self.engine.bar_magnifier = BarMagnifier(self.source, 60)
+        fills = self.engine.process_bar(100, 110, 90, 97, 1, time=0)
+        self.assertEqual(fills[0].price, 94.0)
+
+    def test_source_only_read_with_pending_orders(self):
+        magnifier = self.engine.bar_magnifier = BarMagnifier(self.source, 60)
+        self.engine.process_bar(100, 110, 90, 97, 1, time=0)
+        self.assertEqual(self.source.calls, 0)
+        self.engine.place_order('long', 1.0, OrderType.LIMIT, limit=50.0)
+        self.engine.process_bar(100, 110, 90, 97, 2, time=0)
+        self.assertEqual((self.source.calls, magnifier.magnified_bars, magnifier.lower_bars), (1, 1, 4))
+        # no lower-timeframe data: fall back to the chart bar
+        self.engine.process_bar(60, 60, 40, 45, 3, time=600)
+        self.assertEqual(self.engine.get_position_avg_price(), 50.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+from strategies.journal import TradeJournal
+from strategies.strategy import StrategyEngine
+from datetime import datetime
+import numpy as np
+import tempfile
+import unittest
+
+class TestTradeJournal(unittest.TestCase):
+    def setUp(self):
+        self.trades = [{'pnl': pnl, 'quantity': 1.0, 'entry_price': 100.0, 'direction': 'long', 'name': 'L'}
+                       for pnl in (10.0, -4.0, 6.0, -2.0)]
+
+    def test_list_interface(self):
+        journal = TradeJournal.from_records(self.trades, capacity=1)
+        self.assertEqual(len(journal), 4)
+        self.assertEqual(journal[-1]['pnl'], -2.0)
+        self.assertEqual([trade['pnl'] for trade in journal[1:3]], [-4.0, 6.0])
+        self.assertEqual(journal[0]['name'], 'L')
+        self.assertEqual(journal[0]['direction'], 'long')
+
+    def test_datetimes_round_trip(self):
+        journal = TradeJournal()
+        entry = datetime(2024, 1, 2, 3, 4, 5)
+        journal.append({'pnl': 1.0, 'entry_time': entry, 'exit_time': entry})
+        self.assertEqual(journal[0]['entry_time'], entry)
+
+    def test_summary_is_columnar(self):
+        summary = TradeJournal.from_records(self.trades).summary(1000.0)
+        self.assertEqual(summary['net_profit'], 10.0)
+        self.assertEqual((summary['winning_trades'], summary['losing_trades']), (2, 2))
+        self.assertEqual(summary['gross_loss'], -6.0)
+        self.assertAlmostEqual(summary['profit_factor'], 16.0 / 6.0)
+        self.assertEqual(summary['max_drawdown_amount'], 4.0)
+
+    def test_spill_keeps_every_trade_readable(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            journal = TradeJournal(spill_dir=spill_dir, spill_rows=3)
+            journal.extend(self.trades * 2)
+            self.assertEqual(len(journal), 8)
+            np.testing.assert_array_equal(journal.column('pnl'), [t['pnl'] for t in self.trades * 2])
+            self.assertEqual(journal[1]['pnl'], -4.0)
+            self.assertEqual(sum(trade['pnl'] for trade in journal), 20.0)
+
+    def test_strategy_engine_records_into_journal(self):
+        engine = StrategyEngine()
+        engine.trade_engine.commission_rate = 0.0
+        engine.enter_long(100.0, 2.0)
+        engine.exit_position(105.0)
+        self.assertIsInstance(engine.trade_history, TradeJournal)
+        self.assertEqual(engine.trade_history[0]['pnl'], 10.0)
+        self.assertEqual(engine.performance_engine.get_trade_metrics()['gross_profit'], 10.0)
+
+if __name__ == '__main__':
+    unittest.main()
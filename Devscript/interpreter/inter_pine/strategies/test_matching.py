@@ -0,0 +1,74 @@
+from strategies.strategy import StrategyEngine, OrderType
+from strategies.matching import bar_path
+import unittest
+
+class TestMatchingEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = StrategyEngine()
+        self.engine.trade_engine.commission_rate = 0.0
+        self.engine.trade_engine.slippage_rate = 0.0
+
+    def test_bar_path_visits_nearer_extreme_first(self):
+        self.assertEqual(bar_path(100, 101, 90, 95), (100, 101, 90, 95))
+        self.assertEqual(bar_path(100, 110, 99, 105), (100, 99, 110, 105))
+
+    def test_market_order_fills_at_next_open(self):
+        self.engine.place_order('long', 1.0)
+        self.assertEqual(self.engine.get_position_size(), 0)
+        fills = self.engine.process_bar(100, 105, 99, 104, 1)
+        self.assertEqual(fills[0].price, 100)
+        self.assertEqual(self.engine.get_position_avg_price(), 100)
+
+    def test_limit_and_stop_trigger_on_path(self):
+        limit_id = self.engine.place_order('long', 1.0, OrderType.LIMIT, limit=95.0)
+        self.engine.place_order('long', 1.0, OrderType.STOP, stop=200.0)
+        self.assertEqual(self.engine.process_bar(100, 101, 96, 100), [])
+        fills = self.engine.process_bar(100, 101, 90, 92)
+        self.assertEqual([(fill.order_id, fill.price) for fill in fills], [(limit_id, 95.0)])
+
+    def test_gap_through_stop_fills_at_open(self):
+        self.engine.place_order('long', 1.0, OrderType.STOP, stop=105.0)
+        fills = self.engine.process_bar(110, 112, 108, 111)
+        self.assertEqual(fills[0].price, 110)
+
+    def test_oco_cancels_sibling(self):
+        self.engine.place_order('long', 1.0)
+        self.engine.process_bar(100, 100, 100, 100)
+        take_profit = self.engine.place_order('short', 1.0, OrderType.LIMIT, limit=110.0, oco='exit')
+        stop_loss = self.engine.place_order('short', 1.0, OrderType.STOP, stop=95.0, oco='exit')
+        fills = self.engine.process_bar(100, 112, 99, 111)
+        self.assertEqual([fill.order_id for fill in fills], [take_profit])
+        self.assertNotIn(stop_loss, self.engine.orders)
+        self.assertEqual(self.engine.get_position_size(), 0)
+        self.assertEqual(self.engine.trade_history[-1]['pnl'], 10.0)
+
+    def test_stop_limit_waits_for_limit(self):
+        order_id = self.engine.place_order('long', 1.0, OrderType.STOP_LIMIT, limit=101.0, stop=103.0)
+        self.assertEqual(self.engine.process_bar(100, 104, 102, 103), [])
+        fills = self.engine.process_bar(103, 103, 100, 101)
+        self.assertEqual([(fill.order_id, fill.price) for fill in fills], [(order_id, 101.0)])
+
+    def test_commission_and_slippage_applied(self):
+        self.engine.trade_engine.commission_rate = 0.001
+        self.engine.trade_engine.slippage_rate = 0.01
+        self.engine.place_order('long', 2.0, OrderType.STOP, stop=100.0)
+        fill = self.engine.process_bar(99, 102, 98, 101)[0]
+        self.assertAlmostEqual(fill.price, 101.0)
+        self.assertAlmostEqual(fill.commission, 0.202)
+
+    def test_ids_are_monotonic(self):
+        ids = [self.engine.place_order('long', 1.0, OrderType.LIMIT, limit=50.0) for _ in range(3)]
+        self.assertEqual(ids, ['ord_1', 'ord_2', 'ord_3'])
+    def test_cancelled_orders_are_compacted_out_of_the_heaps(self):
+        book = self.engine.matching_engine
+        ids = [self.engine.place_order('long', 1.0, OrderType.LIMIT, limit=50.0 + i) for i in range(10)]
+        keep = self.engine.place_order('long', 1.0, OrderType.STOP, stop=200.0)
+        for order_id in ids:
+            self.engine.cancel_order(order_id)
+        self.assertLessEqual(len(book._falling) + len(book._rising), 6)
+        self.assertEqual([entry[2] for entry in book._rising], [keep])
+        fills = self.engine.process_bar(100, 201, 40, 150)
+        self.assertEqual([fill.order_id for fill in fills], [keep])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+from strategies.journal import TradeJournal
+from strategies.metrics import OnlineMetrics, RunningStats
+import numpy as np
+import unittest
+
+
+def scan_max_drawdown(equity_curve):
+    peak = equity_curve[0]
+    max_dd = 0.0
+    for equity in equity_curve:
+        if equity > peak:
+            peak = equity
+        max_dd = max(max_dd, (peak - equity) / peak)
+    return max_dd
+
+
+def scan_excess_returns(equity_curve, risk_free_rate=0.02):
+    returns = np.diff(equity_curve) / np.asarray(equity_curve[:-1])
+    return returns - risk_free_rate / 252
+
+
+def scan_sharpe(equity_curve):
+    excess = scan_excess_returns(equity_curve)
+    return np.mean(excess) / np.std(excess) * np.sqrt(252) if np.std(excess) > 0 else 0
+
+
+def scan_sortino(equity_curve):
+    excess = scan_excess_returns(equity_curve)
+    downside = excess[excess < 0]
+    if len(downside) == 0 or np.std(downside) == 0:
+        return 0.0
+    return np.mean(excess) / np.std(downside) * np.sqrt(252)
+
+
+class TestOnlineMetrics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.trades = [{'pnl': float(pnl), 'quantity': float(quantity), 'entry_price': float(price)}
+                       for pnl, quantity, price in zip(rng.normal(5, 40, 300), rng.integers(1, 20, 300),
+                                                       rng.uniform(50, 150, 300))]
+        self.equity = list(10000 * np.cumprod(1 + rng.normal(0.0005, 0.01, 500)))
+
+    def assertMatchesScan(self, metrics, trades, equity):
+        pnl = [trade['pnl'] for trade in trades]
+        self.assertEqual(metrics.trades, len(trades))
+        self.assertEqual(metrics.wins, sum(1 for value in pnl if value > 0))
+        self.assertEqual(metrics.losses, sum(1 for value in pnl if value < 0))
+        self.assertAlmostEqual(metrics.gross_profit, sum(value for value in pnl if value > 0), places=6)
+        self.assertAlmostEqual(metrics.gross_loss, sum(value for value in pnl if value < 0), places=6)
+        self.assertAlmostEqual(metrics.avg_trade, sum(pnl) / len(pnl), places=9)
+        self.assertEqual(metrics.largest_pnl, max(pnl))
+        self.assertEqual(metrics.smallest_pnl, min(pnl))
+        self.assertEqual(metrics.max_quantity, max(trade['quantity'] for trade in trades))
+        self.assertAlmostEqual(metrics.max_exposure,
+                               max(trade['quantity'] * trade['entry_price'] for trade in trades), places=9)
+        self.assertAlmostEqual(metrics.max_drawdown, scan_max_drawdown(equity), places=12)
+        self.assertAlmostEqual(metrics.sharpe_ratio, scan_sharpe(equity), places=9)
+        self.assertAlmostEqual(metrics.sortino_ratio, scan_sortino(equity), places=9)
+
+    def test_tick_by_tick_matches_full_scans(self):
+        metrics = OnlineMetrics()
+        trades, equity = [], []
+        for trade in self.trades:
+            trades.append(trade)
+            metrics.sync_trades(trades)
+        for value in self.equity:
+            equity.append(value)
+            metrics.sync_equity(equity)
+        self.assertMatchesScan(metrics, trades, equity)
+
+    def test_large_appends_take_the_vectorized_path(self):
+        # more than 64 new ticks at once go through add_equities / RunningStats.add_many
+        metrics = OnlineMetrics()
+        equity = self.equity[:10]
+        metrics.sync_equity(equity)
+        equity.extend(self.equity[10:200])
+        metrics.sync_equity(equity)
+        equity.extend(self.equity[200:203])
+        metrics.sync_equity(equity)
+        equity.extend(self.equity[203:])
+        metrics.sync_equity(equity)
+        metrics.sync_trades(self.trades)
+        self.assertMatchesScan(metrics, self.trades, equity)
+
+        batch = OnlineMetrics().sync_equity(list(self.equity))
+        self.assertAlmostEqual(batch.sharpe_ratio, scan_sharpe(self.equity), places=9)
+        self.assertAlmostEqual(batch.max_drawdown, scan_max_drawdown(self.equity), places=12)
+
+    def test_journal_columns_match_the_record_scan(self):
+        journal = TradeJournal.from_records(self.trades[:150], capacity=16)
+        metrics = OnlineMetrics().sync_trades(journal)
+        journal.extend(self.trades[150:])
+        metrics.sync_trades(journal).sync_equity(self.equity)
+        self.assertMatchesScan(metrics, self.trades, self.equity)
+
+    def test_replaced_list_is_consumed_from_scratch(self):
+        metrics = OnlineMetrics().sync_trades(self.trades).sync_equity(self.equity)
+        trades, equity = self.trades[100:], self.equity[100:]
+        metrics.sync_trades(trades).sync_equity(equity)
+        self.assertMatchesScan(metrics, trades, equity)
+
+    def test_shortened_list_is_consumed_from_scratch(self):
+        trades, equity = list(self.trades), list(self.equity)
+        metrics = OnlineMetrics().sync_trades(trades).sync_equity(equity)
+        del trades[50:]
+        del equity[80:]
+        metrics.sync_trades(trades).sync_equity(equity)
+        self.assertMatchesScan(metrics, trades, equity)
+
+    def test_running_stats_batches_match_numpy(self):
+        values = np.random.default_rng(1).normal(0, 3, 257)
+        stats = RunningStats()
+        stats.add(float(values[0]))
+        stats.add_many(values[1:100])
+        for value in values[100:120]:
+            stats.add(float(value))
+        stats.add_many(values[120:])
+        self.assertEqual(stats.count, len(values))
+        self.assertAlmostEqual(stats.mean, values.mean(), places=12)
+        self.assertAlmostEqual(stats.std, values.std(), places=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+from strategies.journal import TradeJournal
+from strategies.monte_carlo import MonteCarlo, resample_indices, simulate_paths
+from strategies.risk import RiskEngine
+import numpy as np
+import unittest
+
+class TestMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        self.pnl = np.random.default_rng(0).normal(50, 500, 200)
+
+    def test_paths_match_reference_loop(self):
+        terminal, drawdown, ruined = simulate_paths(self.pnl, 20, 200, 7, ruin_level=98000.0)
+        indices = resample_indices(np.random.default_rng(7), 200, 20, 200)
+        for path in range(20):
+            equity = 100000.0 + np.cumsum(self.pnl[indices[path]])
+            peak = np.maximum(np.maximum.accumulate(equity), 100000.0)
+            self.assertAlmostEqual(terminal[path], equity[-1], places=6)
+            self.assertAlmostEqual(drawdown[path], ((peak - equity) / peak).max(), places=12)
+            self.assertEqual(ruined[path], equity.min() <= 98000.0)
+
+    def test_shuffle_preserves_terminal_equity(self):
+        result = MonteCarlo(self.pnl, method='shuffle').run(500, seed=1)
+        np.testing.assert_allclose(result.terminal_equity, 100000.0 + self.pnl.sum())
+        self.assertGreater(result.max_drawdown.std(), 0)
+
+    def test_chunking_is_seed_stable(self):
+        small = MonteCarlo(self.pnl, chunk_size=300).run(1000, seed=5)
+        again = MonteCarlo(self.pnl, chunk_size=300).run(1000, seed=5)
+        np.testing.assert_array_equal(small.terminal_equity, again.terminal_equity)
+        self.assertEqual(small.simulations, 1000)
+        block = MonteCarlo(self.pnl / 100000.0, kind='returns', method='block', block_size=10).run(1000, seed=5)
+        self.assertTrue(np.all(block.terminal_equity > 0))
+
+    def test_risk_summary(self):
+        journal = TradeJournal.from_columns(pnl=self.pnl)
+        result = MonteCarlo.from_journal(journal, ruin_threshold=0.05).run(2000, seed=2)
+        risk = RiskEngine().monte_carlo_risk(result)
+        self.assertLess(risk['value_at_risk'], np.median(result.terminal_returns()))
+        self.assertLessEqual(risk['expected_shortfall'], risk['value_at_risk'])
+        self.assertTrue(0 < risk['ruin_probability'] < 1)
+        self.assertIn('terminal_equity_p50', result.summary())
+
+if __name__ == '__main__':
+    unittest.main()
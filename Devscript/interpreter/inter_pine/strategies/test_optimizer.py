@@ -0,0 +1,52 @@
+from strategies.optimizer import Optimizer, Range, ResultTable, OptimizationResult, SharedOHLCV, grid, random_sample
+import numpy as np
+import unittest
+
+def sma_cross(data, fast, slow):
+    close = data['close']
+    kernel_fast = np.convolve(close, np.ones(fast) / fast)[:len(close)]
+    kernel_slow = np.convolve(close, np.ones(slow) / slow)[:len(close)]
+    return kernel_fast > kernel_slow, kernel_fast < kernel_slow
+
+class TestOptimizer(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        close = 100 + np.cumsum(rng.normal(0, 1, 2000))
+        self.data = {'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+                     'volume': np.ones_like(close)}
+        self.space = {'fast': Range(2, 10, 2), 'slow': [20, 40, 60]}
+
+    def test_space_expansion(self):
+        self.assertEqual(Range(0.5, 1.5, 0.5).values(), [0.5, 1.0, 1.5])
+        self.assertEqual(len(grid(self.space)), 15)
+        sample = random_sample(self.space, 5, seed=1)
+        self.assertEqual(len(sample), 5)
+        self.assertEqual(len({tuple(p.items()) for p in sample}), 5)
+
+    def test_result_table_ranks(self):
+        table = ResultTable()
+        for score in (1.0, 3.0, float('nan'), 2.0):
+            table.add(OptimizationResult({'score': score}, score))
+        self.assertEqual([row.score for row in table.top(3)], [3.0, 2.0, 1.0])
+
+    def test_pool_matches_inline(self):
+        inline = Optimizer(sma_cross, self.data, self.space, processes=1).grid_search()
+        pooled = Optimizer(sma_cross, self.data, self.space, processes=2).grid_search()
+        self.assertEqual(len(pooled), 15)
+        self.assertEqual(inline.best.params, pooled.best.params)
+        self.assertAlmostEqual(inline.best.score, pooled.best.score)
+
+    def test_successive_halving_ends_on_full_history(self):
+        table = Optimizer(sma_cross, self.data, self.space, processes=1).successive_halving(eta=3)
+        self.assertTrue(all(row.bars == 2000 for row in table.rows))
+        self.assertLessEqual(len(table), 5)
+
+    def test_shared_memory_round_trip(self):
+        with SharedOHLCV(self.data) as shared:
+            shm, data = SharedOHLCV.attach(shared.handle)
+            np.testing.assert_array_equal(data['close'], self.data['close'])
+            del data
+            shm.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+from strategies.portfolio import BarWindow, PortfolioBacktest, RollingCovariance, bar_clock
+from strategies.risk import RiskEngine
+import numpy as np
+import unittest
+
+def make_symbol(times, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(times))))
+    return {'time': np.asarray(times, dtype=np.float64), 'open': close, 'high': close * 1.01,
+            'low': close * 0.99, 'close': close, 'volume': np.ones(len(times))}
+
+def equal_weight(window, active, state):
+    return np.full(len(active), 1.0 / len(active))
+
+class TestPortfolio(unittest.TestCase):
+    def test_clock_aligns_symbols(self):
+        data = {'A': make_symbol([1, 2, 3, 5], 0), 'B': make_symbol([2, 3, 4], 1)}
+        ticks = [(now, list(symbols), list(cursors)) for now, symbols, cursors in bar_clock(data)]
+        self.assertEqual([tick[0] for tick in ticks], [1, 2, 3, 4, 5])
+        self.assertEqual(ticks[1][1:], ([0, 1], [1, 0]))
+        self.assertEqual(ticks[3][1:], ([1], [2]))
+
+    def test_window_forward_fills(self):
+        window = BarWindow(2, 3, fields=('close',))
+        window.push(np.array([0, 1]), {'close': np.array([1.0, 10.0])})
+        window.push(np.array([0]), {'close': np.array([2.0])})
+        for value in (3.0, 4.0):
+            window.push(np.array([1]), {'close': np.array([value])})
+        np.testing.assert_array_equal(window.view('close'), [[2, 2, 2], [10, 3, 4]])
+        np.testing.assert_array_equal(window.view('close', 1), [[2], [4]])
+
+    def test_rolling_covariance_matches_numpy(self):
+        returns = np.random.default_rng(2).normal(0, 0.01, (250, 4))
+        covariance = RollingCovariance(4, 60)
+        for row in returns:
+            covariance.update(row)
+        np.testing.assert_allclose(covariance.covariance(), np.cov(returns[-60:].T, bias=True), atol=1e-12)
+        np.testing.assert_allclose(covariance.correlation(), np.corrcoef(returns[-60:].T), atol=1e-9)
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        portfolio = returns[-60:] @ weights
+        self.assertAlmostEqual(covariance.portfolio_variance(weights), portfolio.var(), places=12)
+        risk = RiskEngine().rolling_portfolio_risk(covariance, weights)
+        self.assertLess(risk['value_at_risk'], 0)
+
+    def test_shared_capital_and_leverage(self):
+        data = {name: make_symbol(np.arange(300), seed) for seed, name in enumerate('ABCDE')}
+        result = PortfolioBacktest(data, lambda window, active, state: np.full(len(active), 1.0),
+                                   initial_capital=100000.0, max_leverage=1.0, risk_window=30).run()
+        self.assertEqual(len(result.equity), 300)
+        self.assertLessEqual((result.gross_exposure / result.equity).max(), 1.0 + 1e-9)
+        value = (result.quantities * np.array([data[name]['close'][-1] for name in data])).sum()
+        self.assertAlmostEqual(result.book.net_exposure, value, places=6)
+        self.assertTrue(np.all(result.value_at_risk[40:] < 0))
+        free = PortfolioBacktest(data, equal_weight, initial_capital=100000.0).run()
+        charged = PortfolioBacktest(data, equal_weight, initial_capital=100000.0, commission=0.001).run()
+        self.assertGreater(charged.fills, 5)
+        self.assertLess(charged.metrics['net_profit'], free.metrics['net_profit'])
+
+if __name__ == '__main__':
+    unittest.main()
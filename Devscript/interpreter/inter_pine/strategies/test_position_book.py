@@ -0,0 +1,70 @@
+from strategies.position_book import PositionBook
+from strategies.risk import RiskEngine
+from strategies.strategy import OrderType, StrategyEngine
+import unittest
+
+class TestPositionBook(unittest.TestCase):
+    def setUp(self):
+        self.book = PositionBook()
+        self.book.register('AAPL', sector='Tech', beta=1.2)
+        self.book.register('XOM', sector='Energy', beta=0.8)
+
+    def test_fills_net_at_average_cost(self):
+        self.book.fill('AAPL', 10, 100.0)
+        self.book.fill('AAPL', 10, 110.0)
+        self.assertEqual(self.book.net_quantity('AAPL'), 20)
+        self.assertEqual(self.book.avg_price('AAPL'), 105.0)
+        realized = self.book.fill('AAPL', -25, 120.0)
+        self.assertAlmostEqual(realized, 300.0)
+        self.assertEqual(self.book.net_quantity('AAPL'), -5)
+        self.assertEqual(self.book.get('AAPL').side_avg_price('short'), 120.0)
+
+    def test_aggregates_follow_fills_and_marks(self):
+        self.book.fill('AAPL', 10, 100.0)
+        self.book.fill('XOM', -20, 50.0)
+        self.assertAlmostEqual(self.book.net_exposure, 0.0)
+        self.assertAlmostEqual(self.book.gross_exposure, 2000.0)
+        self.assertAlmostEqual(self.book.beta_exposure, 1.2 * 1000 - 0.8 * 1000)
+        self.book.mark('AAPL', 110.0)
+        self.assertAlmostEqual(self.book.sector_exposure['Tech'], 1100.0)
+        self.assertAlmostEqual(self.book.unrealized_pnl, 100.0)
+        self.book.register('AAPL', sector='Hardware')
+        self.assertAlmostEqual(self.book.sector_exposure['Tech'], 0.0)
+        self.assertAlmostEqual(self.book.sector_exposure['Hardware'], 1100.0)
+
+    def test_pre_trade_check(self):
+        self.book.fill('AAPL', 100, 100.0)
+        checks = RiskEngine().check_order(self.book, 'AAPL', 100, 100.0, equity=100000.0)
+        self.assertFalse(checks['position_size'])
+        self.assertTrue(checks['leverage'])
+
+    def test_strategy_engine_reads_from_book(self):
+        engine = StrategyEngine()
+        engine.trade_engine.commission_rate = 0.0
+        engine.enter_long(100.0, 2.0)
+        engine.enter_long(110.0, 2.0)
+        self.assertEqual(engine.get_position_size(), 4.0)
+        self.assertEqual(engine.get_position_avg_price(), 105.0)
+        engine.exit_position(120.0)
+        self.assertEqual(engine.get_position_size(), 2.0)
+        self.assertEqual(engine.get_net_position_size(), 2.0)
+        self.assertAlmostEqual(engine.position_book.realized_pnl, 40.0)
+
+    def test_exposure_reads_come_from_the_book(self):
+        self.book.fill('AAPL', 10, 100.0)
+        self.book.fill('XOM', -20, 50.0)
+        risk = RiskEngine()
+        self.assertEqual(risk.calculate_sector_exposure(self.book), {'Tech': 1000.0, 'Energy': -1000.0})
+        self.assertAlmostEqual(risk.calculate_beta_exposure(self.book), 400.0)
+
+    def test_strategy_orders_go_through_check_order(self):
+        engine = StrategyEngine()
+        engine.portfolio_risk.risk_limits['max_position_size'] = 0.01
+        self.assertTrue(engine.enter_long(100.0, 10.0))
+        self.assertFalse(engine.enter_long(100.0, 1.0))
+        self.assertIsNone(engine.place_order('long', 1.0, OrderType.LIMIT, limit=100.0))
+        self.assertIsNotNone(engine.place_order('short', 5.0, OrderType.LIMIT, limit=100.0))
+        self.assertEqual(engine.get_position_size(), 10.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+from strategies.walk_forward import WalkForward, walk_forward_splits
+from strategies.optimizer import Range
+from strategies.test_optimizer import sma_cross
+import numpy as np
+import unittest
+
+class TestWalkForward(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        close = 100 + np.cumsum(rng.normal(0, 1, 1200))
+        self.data = {'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+                     'volume': np.ones_like(close)}
+        self.space = {'fast': Range(2, 8, 3), 'slow': [20, 40]}
+
+    def test_splits_match_time_series_split_layout(self):
+        self.assertEqual(walk_forward_splits(12, 3), [(0, 3, 3, 6), (0, 6, 6, 9), (0, 9, 9, 12)])
+        self.assertEqual(walk_forward_splits(12, 3, train_size=2, gap=1),
+                         [(0, 2, 3, 6), (3, 5, 6, 9), (6, 8, 9, 12)])
+        with self.assertRaises(ValueError):
+            walk_forward_splits(5, 10)
+
+    def test_oos_trades_stay_inside_their_fold(self):
+        result = WalkForward(sma_cross, self.data, self.space, n_splits=4, train_size=300,
+                             processes=1).run()
+        self.assertEqual(len(result.folds), 4)
+        self.assertEqual(len(result.equity), 4 * 240)
+        for fold in result.folds:
+            _, _, test_start, test_end = fold.fold
+            for trade in fold.trades:
+                self.assertTrue(test_start <= trade['entry_bar'] <= trade['exit_bar'] < test_end)
+        self.assertEqual(result.metrics['total_trades'], len(result.trades))
+        self.assertAlmostEqual(result.equity[-1] - 100000, sum(t['pnl'] for t in result.trades))
+
+    def test_pool_matches_inline(self):
+        inline = WalkForward(sma_cross, self.data, self.space, n_splits=3, processes=1).run()
+        pooled = WalkForward(sma_cross, self.data, self.space, n_splits=3, processes=2).run()
+        self.assertEqual([fold.params for fold in inline.folds], [fold.params for fold in pooled.folds])
+        np.testing.assert_allclose(inline.equity, pooled.equity)
+
+if __name__ == '__main__':
+    unittest.main()
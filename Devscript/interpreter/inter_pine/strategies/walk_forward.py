@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .backtest import performance_metrics, run_backtest
+from .optimizer import Optimizer, ParameterSpace, grid, random_sample, score_metrics
+
+Fold = Tuple[int, int, int, int]
+
+
+def walk_forward_splits(n_bars: int, n_splits: int = 5, train_size: Optional[int] = None,
+                        test_size: Optional[int] = None, gap: int = 0) -> List[Fold]:
+    """(train_start, train_end, test_start, test_end) windows laid out like sklearn's TimeSeriesSplit.
+
+    Test windows tile the end of the history; each in-sample window ends
+    `gap` bars before its test window. `train_size` caps the in-sample length
+    (a rolling walk-forward, TimeSeriesSplit's max_train_size); None anchors
+    every window at bar 0.
+    """
+    test_size = test_size or n_bars // (n_splits + 1)
+    first_test = n_bars - n_splits * test_size
+    if test_size <= 0 or first_test - gap <= 0:
+        raise ValueError(f"Too many splits ({n_splits}) for {n_bars} bars")
+    folds = []
+    for test_start in range(first_test, n_bars, test_size):
+        train_end = test_start - gap
+        train_start = max(0, train_end - train_size) if train_size else 0
+        folds.append((train_start, train_end, test_start, test_start + test_size))
+    return folds
+
+
+def _slice_backtest(data, entries, exits, start, end, backtest_kwargs):
+    return run_backtest(data['close'][start:end], entries[start:end], exits[start:end], **backtest_kwargs)
+
+
+def _score_folds(data, signal_fn, objective, backtest_kwargs, params, folds):
+    """One candidate on every fold: signals are computed once over the whole history and sliced per window"""
+    entries, exits = signal_fn(data, **params)
+    entries, exits = np.asarray(entries, dtype=bool), np.asarray(exits, dtype=bool)
+    in_sample, out_of_sample = [], []
+    for train_start, train_end, test_start, test_end in folds:
+        in_sample.append(score_metrics(
+            _slice_backtest(data, entries, exits, train_start, train_end, backtest_kwargs).metrics, objective))
+        out_of_sample.append(score_metrics(
+            _slice_backtest(data, entries, exits, test_start, test_end, backtest_kwargs).metrics, objective))
+    return params, in_sample, out_of_sample
+
+
+@dataclass
+class FoldResult:
+    fold: Fold
+    params: Dict[str, Any]
+    in_sample_score: float
+    out_of_sample_score: float
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+    equity: Optional[np.ndarray] = None
+
+
+@dataclass
+class WalkForwardResult:
+    folds: List[FoldResult]
+    trades: List[Dict[str, Any]]
+    equity: np.ndarray
+    metrics: Dict[str, Any]
+
+    @property
+    def efficiency(self) -> float:
+        """Mean out-of-sample over mean in-sample score (walk-forward efficiency)"""
+        in_sample = np.nanmean([fold.in_sample_score for fold in self.folds])
+        out_of_sample = np.nanmean([fold.out_of_sample_score for fold in self.folds])
+        return float(out_of_sample / in_sample) if in_sample else float('nan')
+
+
+class WalkForward:
+    """Rolling in-sample optimization with out-of-sample evaluation on the following window.
+
+    Every candidate is a single pool task that computes its signals once over
+    the full history, then backtests each fold's in-sample and out-of-sample
+    slices of those arrays, so indicators are never recomputed per fold and
+    the folds of all candidates run in parallel. Causal indicators are
+    unchanged by slicing, and windows after the first start warmed up.
+    """
+
+    def __init__(self, signal_fn: Callable, data: Dict[str, np.ndarray], space: ParameterSpace,
+                 n_splits: int = 5, train_size: Optional[int] = None, test_size: Optional[int] = None,
+                 gap: int = 0, objective: Union[str, Callable[[Dict[str, Any]], float]] = 'net_profit',
+                 maximize: bool = True, processes: Optional[int] = None, **backtest_kwargs):
+        self.optimizer = Optimizer(signal_fn, data, space, objective, maximize, processes, **backtest_kwargs)
+        self.folds = walk_forward_splits(self.optimizer.length, n_splits, train_size, test_size, gap)
+
+    def run(self, candidates: Optional[Sequence[Dict[str, Any]]] = None, n: Optional[int] = None,
+            seed: Optional[int] = None) -> WalkForwardResult:
+        """Walk forward over `candidates` (default: the full grid, or `n` random combinations)"""
+        optimizer = self.optimizer
+        if candidates is None:
+            candidates = grid(optimizer.space) if n is None else random_sample(optimizer.space, n, seed)
+        rows = list(optimizer.imap(_score_folds, [(params, self.folds) for params in candidates]))
+        # deterministic tie-breaking regardless of completion order
+        order = {repr(sorted(params.items())): i for i, params in enumerate(candidates)}
+        rows.sort(key=lambda row: order[repr(sorted(row[0].items()))])
+
+        in_sample = np.array([row[1] for row in rows], dtype=np.float64)
+        ranked = np.where(np.isnan(in_sample), -np.inf if optimizer.maximize else np.inf, in_sample)
+        best = ranked.argmax(axis=0) if optimizer.maximize else ranked.argmin(axis=0)
+
+        signals: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        folds, trades, equity = [], [], []
+        capital = optimizer.backtest_kwargs.get('initial_capital', 100000.0)
+        for index, fold in enumerate(self.folds):
+            params, scores, oos_scores = rows[best[index]]
+            key = repr(sorted(params.items()))
+            if key not in signals:
+                entries, exits = optimizer.signal_fn(optimizer.data, **params)
+                signals[key] = (np.asarray(entries, dtype=bool), np.asarray(exits, dtype=bool))
+            entries, exits = signals[key]
+            _, _, test_start, test_end = fold
+            kwargs = {**optimizer.backtest_kwargs, 'initial_capital': capital}
+            result = _slice_backtest(optimizer.data, entries, exits, test_start, test_end, kwargs)
+            fold_trades = [{**trade, **{column: trade[column] + test_start
+                                        for column in ('entry_bar', 'exit_bar', 'entry_time', 'exit_time')}}
+                           for trade in result.trades]
+            folds.append(FoldResult(fold, params, scores[index], oos_scores[index], fold_trades, result.equity))
+            trades.extend(fold_trades)
+            equity.append(result.equity)
+            capital = float(result.equity[-1]) if len(result.equity) else capital
+
+        initial_capital = optimizer.backtest_kwargs.get('initial_capital', 100000.0)
+        return WalkForwardResult(folds, trades, np.concatenate(equity) if equity else np.empty(0),
+                                 performance_metrics(trades, initial_capital))
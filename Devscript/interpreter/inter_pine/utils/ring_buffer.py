@@ -0,0 +1,98 @@
+from typing import Any, Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed capacity series history with O(1) append and offset access.
+
+    Values are written twice, at `head` and `head + capacity`, so the newest
+    `len(self)` values are always one contiguous slice of the backing array and
+    `view()` can hand them to numpy/TA code without copying.  Numeric buffers
+store na as NaN; `get` turns it back into None.  The buffer starts
+    as float64 and is promoted to an object array the first time a value that
+    is not a number (string, dict, color, ...) is appended.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self._buffer = self._allocate(np.dtype(dtype))
+        self._head = 0
+        self._count = 0
+
+    def _allocate(self, dtype: np.dtype) -> np.ndarray:
+        fill = np.nan if dtype.kind == 'f' else None
+        return np.full(self.capacity * 2, fill, dtype=dtype)
+
+    @property
+    def is_numeric(self) -> bool:
+        return self._buffer.dtype.kind == 'f'
+
+    def _promote(self) -> None:
+        promoted = self._allocate(np.dtype(object))
+        promoted[:] = [None if v != v else v for v in self._buffer.tolist()]
+        self._buffer = promoted
+
+    def _coerce(self, value: Any) -> Any:
+        if self.is_numeric:
+            if value is None:
+                return np.nan
+            if not isinstance(value, (int, float, np.number)) or isinstance(value, (bool, np.bool_)):
+                self._promote()
+        return value
+
+    def append(self, value: Any) -> None:
+        value = self._coerce(value)
+        self._buffer[self._head] = value
+        self._buffer[self._head + self.capacity] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def get(self, offset: int = 0, default: Any = None) -> Any:
+        """Value `offset` bars back from the newest one; na (stored as NaN in numeric buffers) reads back as None"""
+        if offset < 0 or offset >= self._count:
+            return default
+        value = self._buffer[self._head + self.capacity - 1 - offset]
+        if self.is_numeric:
+            value = float(value)
+            return None if value != value else value
+        return value
+
+    def set_last(self, value: Any) -> None:
+        """Overwrite the newest value (realtime bar updates)"""
+        if not self._count:
+            self.append(value)
+            return
+        value = self._coerce(value)
+        index = (self._head - 1) % self.capacity
+        self._buffer[index] = value
+        self._buffer[index + self.capacity] = value
+
+    def view(self, length: Optional[int] = None) -> np.ndarray:
+        """Oldest-to-newest window over the last `length` values without copying"""
+        count = self._count if length is None else max(0, min(int(length), self._count))
+        end = self._head + self.capacity
+        return self._buffer[end - count:end]
+
+    def clear(self) -> None:
+        self._buffer = self._allocate(self._buffer.dtype)
+        self._head = 0
+        self._count = 0
+
+    def tolist(self) -> list:
+        return self.view().tolist()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __getitem__(self, key):
+        return self.view()[key]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self.capacity}, size={self._count})"
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+
+@dataclass
+class CachedScript:
+    key: str
+    tokens: Any
+    ast: Any
+    compiled: Any = None
+
+
+class ScriptCache:
+    """Bounded LRU of front-end results keyed by sha256(language version + source).
+
+    Holds the token stream, AST and compiled form of each script so repeated
+    runs of the same source skip tokenizing/parsing/compiling. When
+    `cache_dir` is set, tokens and AST are also pickled to disk (the compiled
+    form is rebuilt from the AST on load, since closures don't pickle) so a
+    restarted worker comes back warm.
+    """
+
+    def __init__(self, version: str, max_entries: int = 256, cache_dir: Optional[str] = None):
+        self.version = version
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.entries: 'OrderedDict[str, CachedScript]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, source: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(self.version.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(source.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, source: str) -> Optional[CachedScript]:
+        key = self.key(source)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def get_or_build(self, source: str, front_end: Callable[[str], Tuple[Any, Any]],
+                     compile: Optional[Callable[[Any], Any]] = None) -> CachedScript:
+        """Return the cached front-end result for `source`, building it on a miss"""
+        key = self.key(source)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = self._load(key)
+        if entry is None:
+            tokens, ast = front_end(source)
+            entry = CachedScript(key, tokens, ast)
+            self._store(entry)
+        if compile is not None and entry.ast is not None:
+            entry.compiled = compile(entry.ast)
+
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _load(self, key: str) -> Optional[CachedScript]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), 'rb') as handle:
+                tokens, ast = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            return None
+        return CachedScript(key, tokens, ast)
+
+    def _store(self, entry: CachedScript) -> None:
+        if not self.cache_dir:
+            return
+        path = self._path(entry.key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as handle:
+                pickle.dump((entry.tokens, entry.ast), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
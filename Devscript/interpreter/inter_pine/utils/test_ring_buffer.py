@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from ring_buffer import RingBuffer
+
+class TestRingBuffer(unittest.TestCase):
+    def test_append_and_offset_access(self):
+        buffer = RingBuffer(3)
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            buffer.append(value)
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.get(0), 4.0)
+        self.assertEqual(buffer.get(2), 2.0)
+        self.assertIsNone(buffer.get(3))
+        self.assertEqual(buffer.tolist(), [2.0, 3.0, 4.0])
+
+    def test_view_is_contiguous_and_zero_copy(self):
+        buffer = RingBuffer(4)
+        for value in range(10):
+            buffer.append(value)
+        window = buffer.view(3)
+        np.testing.assert_array_equal(window, [7, 8, 9])
+        self.assertTrue(window.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.shares_memory(window, buffer.view()))
+        self.assertEqual(buffer[-1], 9)
+
+    def test_promotes_to_object_for_non_numeric_values(self):
+        buffer = RingBuffer(3)
+        buffer.append(1.0)
+        buffer.append(None)
+        buffer.append({'upper': 2.0})
+        self.assertFalse(buffer.is_numeric)
+        self.assertEqual(buffer.tolist(), [1.0, None, {'upper': 2.0}])
+
+    def test_set_last_overwrites_newest_value(self):
+        buffer = RingBuffer(2)
+        buffer.append(1.0)
+        buffer.append(2.0)
+        buffer.set_last(5.0)
+        self.assertEqual(buffer.tolist(), [1.0, 5.0])
+
+    def test_na_reads_back_as_none(self):
+        buffer = RingBuffer(3)
+        buffer.append(1.0)
+        buffer.append(None)
+        buffer.append(float('nan'))
+        self.assertTrue(buffer.is_numeric)
+        self.assertIsNone(buffer.get(0))
+        self.assertIsNone(buffer.get(1))
+        self.assertEqual(buffer.get(2), 1.0)
+        buffer.set_last(None)
+        self.assertIsNone(buffer.get(0))
+        self.assertTrue(np.isnan(buffer.view()[1]))
+
+if __name__ == '__main__':
+    unittest.main()
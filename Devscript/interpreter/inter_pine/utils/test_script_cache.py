@@ -0,0 +1,49 @@
+import shutil
+import tempfile
+import unittest
+from script_cache import ScriptCache
+
+def front_end(source):
+    front_end.calls += 1
+    tokens = source.split()
+    return tokens, {'name': tokens[0]}
+front_end.calls = 0
+
+class TestScriptCache(unittest.TestCase):
+    def setUp(self):
+        front_end.calls = 0
+
+    def test_repeat_source_skips_front_end(self):
+        cache = ScriptCache('1')
+        first = cache.get_or_build('close + open', front_end, lambda ast: ast['name'].upper())
+        second = cache.get_or_build('close + open', front_end)
+        self.assertIs(first, second)
+        self.assertEqual(first.compiled, 'CLOSE')
+        self.assertEqual(front_end.calls, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_includes_language_version(self):
+        self.assertNotEqual(ScriptCache('1').key('close'), ScriptCache('2').key('close'))
+
+    def test_lru_bound(self):
+        cache = ScriptCache('1', max_entries=2)
+        for source in ['a', 'b', 'a', 'c']:
+            cache.get_or_build(source, front_end)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(len(cache.entries), 2)
+
+    def test_disk_cache_survives_restart(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            ScriptCache('1', cache_dir=cache_dir).get_or_build('high low', front_end)
+            restarted = ScriptCache('1', cache_dir=cache_dir)
+            entry = restarted.get_or_build('high low', front_end, lambda ast: ast['name'])
+            self.assertEqual(front_end.calls, 1)
+            self.assertEqual(entry.tokens, ['high', 'low'])
+            self.assertEqual(entry.compiled, 'high')
+        finally:
+            shutil.rmtree(cache_dir)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,210 @@
+import itertools
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
+import types
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 import math
 import numpy as np
 
+from .inter_pine.indicators.streaming import StreamingTAEngine
+from .inter_pine.strategies.metrics import OnlineMetrics
+
 
 """-----------------------------------------------------------------------------------------------------------------------------------------"""
 
 #innitialization and configuration
 
+KEYWORDS = frozenset([
+    'andOp', 'enumType', 'exportFunc', 'forLoop', 'forInLoop', 'ifCond', 'importFunc', 'methodFunc', 'notOp',
+    'orOp', 'switchCase', 'typeDef', 'let', 'letip', 'whileLoop',
+])
+
+BUILTIN_VARIABLES = frozenset([
+    'open', 'high', 'low', 'close', 'volume', 'barIndex', 'barStateIsConfirmed', 'barStateIsFirst',
+    'barStateIsHistory', 'barStateIsLast', 'barStateIsLastConfirmedHistory', 'barStateIsNew',
+    'barStateIsRealtime', 'boxAll', 'chartBgCol', 'chartFgCol', 'chartIsHeikinAshi', 'chartIsKagi',
+    'chartIsLineBreak', 'chartIsPnf', 'chartIsRange', 'chartIsRenko', 'chartIsStandard',
+    'chartLeftVisibleBarTime', 'chartRightVisibleBarTime', 'dayOfMonth', 'dayOfWeek',
+    'dividendsFutureAmount', 'dividendsFutureExDate', 'dividendsFuturePayDate', 'earningsFutureEps',
+    'earningsFuturePeriodEndTime', 'earningsFutureRevenue', 'earningsFutureTime', 'hl2', 'hlc3', 'hlcc4',
+    'hour', 'labelAll', 'lastBarIndex', 'lastBarTime', 'lineAll', 'lineFillAll', 'minute', 'month', 'na',
+    'ohlc4', 'polylineAll', 'second', 'sessionIsFirstBar', 'sessionIsFirstBarRegular', 'sessionIsLastBar',
+    'sessionIsLastBarRegular', 'sessionIsMarket', 'sessionIsPostMarket', 'sessionIsPreMarket',
+    'strategyAccountCurrency', 'strategyAvgLosingTrade', 'strategyAvgLosingTradePercent', 'strategyAvgTrade',
+    'strategyAvgTradePercent', 'strategyAvgWinningTrade', 'strategyAvgWinningTradePercent',
+    'strategyClosedTrades', 'strategyClosedTradesFirstIndex', 'strategyEquity', 'strategyEvenTrades',
+    'strategyGrossLoss', 'strategyGrossLossPercent', 'strategyGrossProfit', 'strategyGrossProfitPercent',
+    'strategyInitialCapital', 'strategyLossTrades', 'strategyMarginLiquidationPrice',
+    'strategyMaxContractsHeldAll', 'strategyMaxContractsHeldLong', 'strategyMaxContractsHeldShort',
+    'strategyMaxDrawdown', 'strategyMaxDrawdownPercent', 'strategyMaxRunup', 'strategyMaxRunupPercent',
+    'strategyNetProfit', 'strategyNetProfitPercent', 'strategyOpenProfit', 'strategyOpenProfitPercent',
+    'strategyOpenTrades', 'strategyOpenTradesCapitalHeld', 'strategyPositionAvgPrice',
+    'strategyPositionEntryName', 'strategyPositionSize', 'strategyWinTrades', 'symInfoBaseCurrency',
+    'symInfoCountry', 'symInfoCurrency', 'symInfoDescription', 'symInfoEmployees', 'symInfoExpirationDate',
+    'symInfoIndustry', 'symInfoMainTickerId', 'symInfoMinContract', 'symInfoMinMove', 'symInfoMinTick',
+    'symInfoPointValue', 'symInfoPrefix', 'symInfoPriceScale', 'symInfoRecommendationsBuy',
+    'symInfoRecommendationsBuyStrong', 'symInfoRecommendationsDate', 'symInfoRecommendationsHold',
+    'symInfoRecommendationsSell', 'symInfoRecommendationsSellStrong', 'symInfoRecommendationsTotal',
+    'symInfoRoot', 'symInfoSector', 'symInfoSession', 'symInfoShareholders', 'symInfoSharesOutstandingFloat',
+    'symInfoSharesOutstandingTotal', 'symInfoTargetPriceAverage', 'symInfoTargetPriceDate',
+    'symInfoTargetPriceEstimates', 'symInfoTargetPriceHigh', 'symInfoTargetPriceLow',
+    'symInfoTargetPriceMedian', 'symInfoTicker', 'symInfoTickerId', 'symInfoTimezone', 'symInfoType',
+    'symInfoVolumeType', 'taAccDist', 'taIII', 'taNVI', 'taOBV', 'taPVI', 'taPVT', 'taTR', 'taVWAP', 'taWAD',
+    'taWVAD', 'tableAll', 'time', 'timeClose', 'timeTradingDay', 'timeframeIsDaily', 'timeframeIsDWM',
+    'timeframeIsIntraday', 'timeframeIsMinutes', 'timeframeIsMonthly', 'timeframeIsSeconds',
+    'timeframeIsTicks', 'timeframeIsWeekly', 'timeframeMainPeriod', 'timeframeMultiplier', 'timeframePeriod',
+    'timeNow', 'weekOfYear', 'year',
+])
+
+BUILTIN_FUNCTIONS = frozenset([
+    'sma', 'ema', 'rsi', 'minvalue', 'maxvalue', 'alertFunc', 'alertConditionFunc', 'arrAbs', 'arrAvg',
+    'arrBinarySearch', 'arrBinarySearchLeftmost', 'arrBinarySearchRightmost', 'arrClear', 'arrConcat',
+    'arrCopy', 'arrCovariance', 'arrEvery', 'arrFill', 'arrFirst', 'arrFrom', 'arrGet', 'arrIncludes',
+    'arrIndexOf', 'arrInsert', 'arrJoin', 'arrLast', 'arrLastIndexOf', 'arrMax', 'arrMedian', 'arrMin',
+    'arrMode', 'arrNewBool', 'arrNewBox', 'aryNewCol', 'arrNewFloat', 'arrNewInt', 'arrNewLabel',
+    'arrNewLine', 'arrNewLineFill', 'arrNewString', 'arrNewTable', 'arrNewType',
+    'arrPercentileLinearInterpolation', 'arrPercentileNearestRank', 'arrPercentRank', 'arrPop', 'arrPush',
+    'arrRange', 'arrRemove', 'arrReverse', 'arrSet', 'arrShift', 'arrSize', 'arrSlice', 'arrSome', 'arrSort',
+    'arrSortIndices', 'arrStandardize', 'arrStdev', 'arrSum', 'arrUnshift', 'arrVariance', 'barColFunc',
+    'bgColFunc', 'boolFunc', 'boxFunc', 'boxCopyFunc', 'boxDeleteFunc', 'boxGetBottomFunc', 'boxGetLeftFunc',
+    'boxGetRightFunc', 'boxGetTopFunc', 'boxNewFunc', 'boxSetBgColFunc', 'boxSetBorderColFunc',
+    'boxSetBorderStyleFunc', 'boxSetBorderWidthFunc', 'boxSetBottomFunc', 'boxSetBottomRightPointFunc',
+    'boxSetExtendFunc', 'boxSetLeftFunc', 'boxSetLeftTopFunc', 'boxSetRightFunc', 'boxSetRightBottomFunc',
+    'boxSetTextFunc', 'boxSetTextColFunc', 'boxSetTextFontFamilyFunc', 'boxSetTextHAlignFunc',
+    'boxSetTextSizeFunc', 'boxSetTextVAlignFunc', 'boxSetTextWrapFunc', 'boxSetTopFunc',
+    'boxSetTopLeftPointFunc', 'chartPointCopyFunc', 'chartPointFromIndexFunc', 'chartPointFromTimeFunc',
+    'chartPointNewFunc', 'chartPointNowFunc', 'colFunc', 'colBFunc', 'colFromGradientFunc', 'colGFunc',
+    'colNewFunc', 'colRFunc', 'colRgbFunc', 'colTFunc', 'dayOfMonthFunc', 'dayOfWeekFunc', 'fillFunc',
+    'fixNanFunc', 'floatFunc', 'hLineFunc', 'hourFunc', 'indicatorFunc', 'inputFunc', 'inputBoolFunc',
+    'inputColFunc', 'inputEnumFunc', 'inputFloatFunc', 'inputIntFunc', 'inputPriceFunc', 'inputSessionFunc',
+    'inputSourceFunc', 'inputStringFunc', 'inputSymbolFunc', 'inputTextAreaFunc', 'inputTimeFunc',
+    'inputTimeFrameFunc', 'intFunc', 'labelFunc', 'labelCopyFunc', 'labelDeleteFunc', 'labelGetTextFunc',
+    'labelGetXFunc', 'labelGetYFunc', 'labelNewFunc', 'labelSetColFunc', 'labelSetPointFunc',
+    'labelSetSizeFunc', 'labelSetStyleFunc', 'labelSetTextFunc', 'labelSetTextFontFamilyFunc',
+    'labelSetTextAlignFunc', 'labelSetTextColFunc', 'labelSetToolTipFunc', 'labelSetXFunc',
+    'labelSetXLocFunc', 'labelSetXYFunc', 'labelSetYFunc', 'labelSetYLocFunc', 'libraryFunc', 'lineFunc',
+    'lineCopyFunc', 'lineDeleteFunc', 'lineGetPriceFunc', 'lineGetX1Func', 'lineGetX2Func', 'lineGetY1Func',
+    'lineGetY2Func', 'lineNewFunc', 'lineSetColFunc', 'lineSetExtendFunc', 'lineSetFirstPointFunc',
+    'lineSetSecondPointFunc', 'lineSetStyleFunc', 'lineSetWidthFunc', 'lineSetX1Func', 'lineSetX2Func',
+    'lineSetXLocFunc', 'lineSetXY1Func', 'lineSetXY2Func', 'lineSetY1Func', 'lineSetY2Func', 'lineFillFunc',
+    'lineFillDeleteFunc', 'lineFillGetLine1Func', 'lineFillGetLine2Func', 'lineFillNewFunc',
+    'lineFillSetColFunc', 'logErrorFunc', 'logInfoFunc', 'logWarningFunc', 'mapClearFunc', 'mapContainsFunc',
+    'mapCopyFunc', 'mapGetFunc', 'mapKeysFunc', 'mapNewTypeFunc', 'mapPutFunc', 'mapPutAllFunc',
+    'mapRemoveFunc', 'mapSizeFunc', 'mapValuesFunc', 'mathAbsFunc', 'mathAcosFunc', 'mathAsinFunc',
+    'mathAtanFunc', 'mathAvgFunc', 'mathCeilFunc', 'mathCosFunc', 'mathExpFunc', 'mathFloorFunc',
+    'mathLogFunc', 'mathLog10Func', 'mathMaxFunc', 'mathMinFunc', 'mathPowFunc', 'mathRandomFunc',
+    'mathRoundFunc', 'mathRoundToMinTickFunc', 'mathSignFunc', 'mathSinFunc', 'mathSqrtFunc', 'mathSumFunc',
+    'mathTanFunc', 'mathToDegreesFunc', 'mathToRadiansFunc', 'matrixAddColFunc', 'matrixAddRowFunc',
+    'matrixAvgFunc', 'matrixColFunc', 'matrixColumnsFunc', 'matrixConcatFunc', 'matrixCopyFunc',
+    'matrixDetFunc', 'matrixDiffFunc', 'matrixEigenValuesFunc', 'matrixEigenVectorsFunc',
+    'matrixElementsCountFunc', 'matrixFillFunc', 'matrixGetFunc', 'matrixInvFunc',
+    'matrixIsAntiDiagonalFunc', 'matrixIsAntiSymmetricFunc', 'matrixIsBinaryFunc', 'matrixIsDiagonalFunc',
+    'matrixIsIdentityFunc', 'matrixIsSquareFunc', 'matrixIsStochasticFunc', 'matrixIsSymmetricFunc',
+    'matrixIsTriangularFunc', 'matrixIsZeroFunc', 'matrixKronFunc', 'matrixMaxFunc', 'matrixMedianFunc',
+    'matrixMinFunc', 'matrixModeFunc', 'matrixMultFunc', 'matrixNewTypeFunc', 'matrixPinvFunc',
+    'matrixPowFunc', 'matrixRankFunc', 'matrixRemoveColFunc', 'matrixRemoveRowFunc', 'matrixReshapeFunc',
+    'matrixReverseFunc', 'matrixRowFunc', 'matrixRowsFunc', 'matrixSetFunc', 'matrixSortFunc',
+    'matrixSubMatrixFunc', 'matrixSumFunc', 'matrixSwapColumnsFunc', 'matrixSwapRowsFunc', 'matrixTraceFunc',
+    'matrixTransposeFunc', 'maxBarsBackFunc', 'minuteFunc', 'monthFunc', 'naFunc', 'nzFunc',
+    'polylineDeleteFunc', 'polylineNewFunc', 'requestCurrencyRateFunc', 'requestDividendsFunc',
+    'requestEarningsFunc', 'requestEconomicFunc', 'requestFinancialFunc', 'requestQuandlFunc',
+    'requestSecurityFunc', 'requestSecurityLowerTfFunc', 'requestSeedFunc', 'requestSplitsFunc',
+    'runtimeErrorFunc', 'secondFunc', 'strContainsFunc', 'strEndsWithFunc', 'strFormatFunc',
+    'strFormatTimeFunc', 'strLengthFunc', 'strLowerFunc', 'strMatchFunc', 'strPosFunc', 'strRepeatFunc',
+    'strReplaceFunc', 'strReplaceAllFunc', 'strSplitFunc', 'strStartsWithFunc', 'strSubstringFunc',
+    'strToNumberFunc', 'strToStringFunc', 'strTrimFunc', 'strUpperFunc', 'strategyFunc',
+    'strategyCancelFunc', 'strategyCancelAllFunc', 'strategyCloseFunc', 'strategyCloseAllFunc',
+    'strategyClosedTradesCommissionFunc', 'strategyClosedTradesEntryBarIndexFunc',
+    'strategyClosedTradesEntryCommentFunc', 'strategyClosedTradesEntryIdFunc',
+    'strategyClosedTradesEntryPriceFunc', 'strategyClosedTradesEntryTimeFunc',
+    'strategyClosedTradesExitBarIndexFunc', 'strategyClosedTradesExitCommentFunc',
+    'strategyClosedTradesExitIdFunc', 'strategyClosedTradesExitPriceFunc',
+    'strategyClosedTradesExitTimeFunc', 'strategyClosedTradesMaxDrawdownFunc',
+    'strategyClosedTradesMaxDrawdownPercentFunc', 'strategyClosedTradesMaxRunupFunc',
+    'strategyClosedTradesMaxRunupPercentFunc', 'strategyClosedTradesProfitFunc',
+    'strategyClosedTradesProfitPercentFunc', 'strategyClosedTradesSizeFunc', 'strategyConvertToAccountFunc',
+    'strategyConvertToSymbolFunc', 'strategyDefaultEntryQtyFunc', 'strategyEntryFunc', 'strategyExitFunc',
+    'strategyOpenTradesCommissionFunc', 'strategyOpenTradesEntryBarIndexFunc',
+    'strategyOpenTradesEntryCommentFunc', 'strategyOpenTradesEntryIdFunc',
+    'strategyOpenTradesEntryPriceFunc', 'strategyOpenTradesEntryTimeFunc',
+    'strategyOpenTradesMaxDrawdownFunc', 'strategyOpenTradesMaxDrawdownPercentFunc',
+    'strategyOpenTradesMaxRunupFunc', 'strategyOpenTradesMaxRunupPercentFunc',
+    'strategyOpenTradesProfitFunc', 'strategyOpenTradesProfitPercentFunc', 'strategyOpenTradesSizeFunc',
+    'strategyOrderFunc', 'strategyRiskAllowEntryInFunc', 'strategyRiskMaxConsLossDaysFunc',
+    'strategyRiskMaxDrawdownFunc', 'strategyRiskMaxIntradayFilledOrdersFunc',
+    'strategyRiskMaxIntradayLossFunc', 'strategyRiskMaxPositionSizeFunc', 'symInfoPrefixFunc',
+    'symInfoTickerFunc', 'timeFunc', 'timeCloseFunc', 'timeframeChangeFunc', 'timeframeFromSecondsFunc',
+    'timeframeInSecondsFunc', 'timestampFunc', 'weekOfYearFunc', 'yearFunc',
+])
+
+CONSTANTS = frozenset([
+    'showStyleArea', 'showStyleAreaBr', 'showStyleCircles', 'showStyleColumns', 'showStyleCross',
+    'showStyleHistogram', 'showStyleLine', 'showStyleLineBr', 'showStyleStepLine',
+    'showStyleStepLineDiamond', 'showStyleStepLineBr', 'positionBottomCenter', 'positionBottomLeft',
+    'positionBottomRight', 'positionMiddleCenter', 'positionMiddleLeft', 'positionMiddleRight',
+    'positionTopCenter', 'positionTopLeft', 'positionTopRight', 'scaleLeft', 'scaleNone', 'scaleRight',
+    'sessionExtended', 'sessionRegular', 'settlementAsCloseInherit', 'settlementAsCloseOff',
+    'settlementAsCloseOn', 'shapeArrowDown', 'shapeArrowUp', 'shapeCircle', 'shapeCross', 'shapeDiamond',
+    'shapeFlag', 'shapeLabelDown', 'shapeLabelUp', 'shapeSquare', 'shapeTriangleDown', 'shapeTriangleUp',
+    'shapeXCross', 'sizeAuto', 'sizeHuge', 'sizeLarge', 'sizeNormal', 'sizeSmall', 'sizeTiny',
+    'splitsDenominator', 'splitsNumerator', 'strategyCash', 'strategyCommissionCashPerContract',
+    'strategyCommissionCashPerOrder', 'strategyCommissionPercent', 'strategyDirectionAll',
+    'strategyDirectionLong', 'strategyDirectionShort', 'strategyFixed', 'strategyLong', 'strategyOcaCancel',
+    'strategyOcaNone', 'strategyOcaReduce', 'strategyPercentOfEquity', 'strategyShort', 'textAlignBottom',
+    'textAlignCenter', 'textAlignLeft', 'textAlignRight', 'textAlignTop', 'textWrapAuto', 'textWrapNone',
+    'trueValue', 'xLocBarIndex', 'xLocBarTime', 'yLocAboveBar', 'yLocBelowBar', 'yLocPrice',
+    'adjustmentDividends', 'adjustmentNone', 'adjustmentSplits', 'alertFreqAll', 'alertFreqOncePerBar',
+    'alertFreqOncePerBarClose', 'backAdjustmentInherit', 'backAdjustmentOff', 'backAdjustmentOn',
+    'barMergeGapsOff', 'barMergeGapsOn', 'barMergeLookaheadOff', 'barMergeLookaheadOn', 'colAqua',
+    'colBlack', 'colBlue', 'colFuchsia', 'colGray', 'colGreen', 'colLime', 'colMaroon', 'colNavy',
+    'colOlive', 'colOrange', 'colPurple', 'colRed', 'colSilver', 'colTeal', 'colWhite', 'colYellow',
+    'currencyAUD', 'currencyBTC', 'currencyCAD', 'currencyCHF', 'currencyETH', 'currencyEUR', 'currencyGBP',
+    'currencyHKD', 'currencyINR', 'currencyJPY', 'currencyKRW', 'currencyMYR', 'currencyNOK', 'currencyNone',
+    'currencyNZD', 'currencyRUB', 'currencySEK', 'currencySGD', 'currencyTRY', 'currencyUSD', 'currencyUSDT',
+    'currencyZAR', 'dayOfWeekFriday', 'dayOfWeekMonday', 'dayOfWeekSaturday', 'dayOfWeekSunday',
+    'dayOfWeekThursday', 'dayOfWeekTuesday', 'dayOfWeekWednesday', 'displayAll', 'displayDataWindow',
+    'displayNone', 'displayPane', 'displayPriceScale', 'displayStatusLine', 'dividendsGross', 'dividendsNet',
+    'earningsActual', 'earningsEstimate', 'earningsStandardized', 'extendBoth', 'extendLeft', 'extendNone',
+    'extendRight', 'falseValue', 'fontFamilyDefault', 'fontFamilyMonospace', 'formatInherit',
+    'formatMinTick', 'formatPercent', 'formatPrice', 'formatVolume', 'hlineStyleDashed', 'hlineStyleDotted',
+    'hlineStyleSolid', 'labelStyleArrowDown', 'labelStyleArrowUp', 'labelStyleCircle', 'labelStyleCross',
+    'labelStyleDiamond', 'labelStyleFlag', 'labelStyleLabelCenter', 'labelStyleLabelDown',
+    'labelStyleLabelLeft', 'labelStyleLabelLowerLeft', 'labelStyleLabelLowerRight', 'labelStyleLabelRight',
+    'labelStyleLabelUp', 'labelStyleLabelUpperLeft', 'labelStyleLabelUpperRight', 'labelStyleNone',
+    'labelStyleSquare', 'labelStyleTextOutline', 'labelStyleTriangleDown', 'labelStyleTriangleUp',
+    'labelStyleXCross', 'lineStyleArrowBoth', 'lineStyleArrowLeft', 'lineStyleArrowRight', 'lineStyleDashed',
+    'lineStyleDotted', 'lineStyleSolid', 'locationAboveBar', 'locationAbsolute', 'locationBelowBar',
+    'locationBottom', 'locationTop', 'mathE', 'mathPhi', 'mathPi', 'mathRPhi', 'orderAscending',
+    'orderDescending',
+])
+
+TYPE_DECLARATIONS = frozenset([
+    'arr', 'bool', 'box', 'chartPoint', 'col', 'const', 'float', 'int', 'label', 'line', 'lineFill', 'map',
+    'matrx', 'polyline', 'series', 'simple', 'string', 'table',
+])
+
+# identifier -> token type; when a name is listed twice the earlier group wins
+IDENTIFIER_TYPES: Dict[str, str] = {}
+for _token_type, _names in (('KEYWORD', KEYWORDS), ('BUILTIN_VARIABLE', BUILTIN_VARIABLES),
+                            ('BUILTIN_FUNCTION', BUILTIN_FUNCTIONS), ('BOOLEAN', ('true', 'false')),
+                            ('CONSTANT', CONSTANTS), ('TYPE_DECLARATION', TYPE_DECLARATIONS)):
+    for _name in _names:
+        IDENTIFIER_TYPES.setdefault(_name, _token_type)
+
+TOKEN_PATTERN = re.compile(r'''
+    (?P<NUMBER>-?\d+(?:\.\d*)?)
+  | (?P<NAME>[a-zA-Z][a-zA-Z_]*)
+  | (?P<OPERATOR>[=!><]=|[-+*/%=><!])
+  | (?P<LPAREN>\()
+  | (?P<RPAREN>\))
+  | (?P<LBRACE>\{)
+  | (?P<RBRACE>\})
+  | (?P<COMMA>,)
+  | (?P<COLON>:)
+  | (?P<STRING>"[^"]*"?)
+  | (?P<SKIP>\s+|[\s\S])
+''', re.VERBOSE)
+
+
 class Tokenizer:
     def __init__(self, source_code):
         self.source_code = source_code
@@ -15,94 +212,21 @@ class Tokenizer:
 
     def tokenize(self):
         tokens = []
-        while self.current_position < len(self.source_code):
-            char = self.source_code[self.current_position]
-            
-            if char.isspace():
-                self.current_position += 1
-                continue
-            
-            elif char.isdigit() or (char == '-' and self.peek().isdigit()):
-                match = re.match(r'-?\d+(\.\d*)?', self.source_code[self.current_position:])
-                if match:
-                    value = float(match.group(0))
-                    tokens.append(('NUMBER', value))
-                    self.current_position += match.end()
-                    continue
-            
-            elif char.isalpha():
-                match = re.match(r'[a-zA-Z_]+', self.source_code[self.current_position:])
-                if match:
-                    identifier = match.group(0)
-                    if identifier in ['andOp', 'enumType', 'exportFunc', 'forLoop', 'forInLoop', 'ifCond', 'importFunc', 'methodFunc', 'notOp', 'orOp', 'switchCase', 'typeDef', 'let', 'letip', 'whileLoop']:
-                        tokens.append(('KEYWORD', identifier))
-                    elif identifier in ['open','high','low','close','volume','barIndex','barStateIsConfirmed','barStateIsFirst','barStateIsHistory','barStateIsLast','barStateIsLastConfirmedHistory','barStateIsNew','barStateIsRealtime','boxAll','chartBgCol','chartFgCol','chartIsHeikinAshi','chartIsKagi','chartIsLineBreak','chartIsPnf','chartIsRange','chartIsRenko','chartIsStandard','chartLeftVisibleBarTime','chartRightVisibleBarTime','dayOfMonth','dayOfWeek','dividendsFutureAmount','dividendsFutureExDate','dividendsFuturePayDate','earningsFutureEps','earningsFuturePeriodEndTime','earningsFutureRevenue','earningsFutureTime','hl2','hlc3','hlcc4','hour','labelAll','lastBarIndex','lastBarTime','lineAll','lineFillAll','minute','month','na','ohlc4','polylineAll','second','sessionIsFirstBar','sessionIsFirstBarRegular','sessionIsLastBar','sessionIsLastBarRegular','sessionIsMarket','sessionIsPostMarket','sessionIsPreMarket','strategyAccountCurrency','strategyAvgLosingTrade','strategyAvgLosingTradePercent','strategyAvgTrade','strategyAvgTradePercent','strategyAvgWinningTrade','strategyAvgWinningTradePercent','strategyClosedTrades','strategyClosedTradesFirstIndex','strategyEquity','strategyEvenTrades','strategyGrossLoss','strategyGrossLossPercent','strategyGrossProfit','strategyGrossProfitPercent','strategyInitialCapital','strategyLossTrades','strategyMarginLiquidationPrice','strategyMaxContractsHeldAll','strategyMaxContractsHeldLong','strategyMaxContractsHeldShort','strategyMaxDrawdown','strategyMaxDrawdownPercent','strategyMaxRunup','strategyMaxRunupPercent','strategyNetProfit','strategyNetProfitPercent','strategyOpenProfit','strategyOpenProfitPercent','strategyOpenTrades','strategyOpenTradesCapitalHeld','strategyPositionAvgPrice','strategyPositionEntryName','strategyPositionSize','strategyWinTrades','symInfoBaseCurrency','symInfoCountry','symInfoCurrency','symInfoDescription','symInfoEmployees','symInfoExpirationDate','symInfoIndustry','symInfoMainTickerId','symInfoMinContract','symInfoMinMove','symInfoMinTick','symInfoPointValue','symInfoPrefix','symInfoPriceScale','symInfoRecommendationsBuy','symInfoRecommendationsBuyStrong','symInfoRecommendationsDate','symInfoRecommendationsHold','symInfoRecommendationsSell','symInfoRecommendationsSellStrong','symInfoRecommendationsTotal','symInfoRoot','symInfoSector','symInfoSession','symInfoShareholders','symInfoSharesOutstandingFloat','symInfoSharesOutstandingTotal','symInfoTargetPriceAverage','symInfoTargetPriceDate','symInfoTargetPriceEstimates','symInfoTargetPriceHigh','symInfoTargetPriceLow','symInfoTargetPriceMedian','symInfoTicker','symInfoTickerId','symInfoTimezone','symInfoType','symInfoVolumeType','taAccDist','taIII','taNVI','taOBV','taPVI','taPVT','taTR','taVWAP','taWAD','taWVAD','tableAll','time','timeClose','timeTradingDay','timeframeIsDaily','timeframeIsDWM','timeframeIsIntraday','timeframeIsMinutes','timeframeIsMonthly','timeframeIsSeconds','timeframeIsTicks','timeframeIsWeekly','timeframeMainPeriod','timeframeMultiplier','timeframePeriod','timeNow','weekOfYear','year']:
-                        tokens.append(('BUILTIN_VARIABLE', identifier))
-                    elif identifier in ['sma', 'ema', 'rsi', 'minvalue', 'maxvalue','alertFunc', 'alertConditionFunc', 'arrAbs', 'arrAvg', 'arrBinarySearch', 'arrBinarySearchLeftmost', 'arrBinarySearchRightmost', 'arrClear', 'arrConcat', 'arrCopy', 'arrCovariance', 'arrEvery', 'arrFill', 'arrFirst', 'arrFrom', 'arrGet', 'arrIncludes', 'arrIndexOf', 'arrInsert', 'arrJoin', 'arrLast', 'arrLastIndexOf', 'arrMax', 'arrMedian', 'arrMin', 'arrMode', 'arrNewBool', 'arrNewBox', 'aryNewCol', 'arrNewFloat', 'arrNewInt', 'arrNewLabel', 'arrNewLine', 'arrNewLineFill', 'arrNewString', 'arrNewTable', 'arrNewType', 'arrPercentileLinearInterpolation', 'arrPercentileNearestRank', 'arrPercentRank', 'arrPop', 'arrPush', 'arrRange', 'arrRemove', 'arrReverse', 'arrSet', 'arrShift', 'arrSize', 'arrSlice', 'arrSome', 'arrSort', 'arrSortIndices', 'arrStandardize', 'arrStdev', 'arrSum', 'arrUnshift', 'arrVariance', 'barColFunc', 'bgColFunc', 'boolFunc', 'boxFunc', 'boxCopyFunc', 'boxDeleteFunc', 'boxGetBottomFunc', 'boxGetLeftFunc', 'boxGetRightFunc', 'boxGetTopFunc', 'boxNewFunc', 'boxSetBgColFunc', 'boxSetBorderColFunc', 'boxSetBorderStyleFunc', 'boxSetBorderWidthFunc', 'boxSetBottomFunc', 'boxSetBottomRightPointFunc', 'boxSetExtendFunc', 'boxSetLeftFunc', 'boxSetLeftTopFunc', 'boxSetRightFunc', 'boxSetRightBottomFunc', 'boxSetTextFunc', 'boxSetTextColFunc', 'boxSetTextFontFamilyFunc', 'boxSetTextHAlignFunc', 'boxSetTextSizeFunc', 'boxSetTextVAlignFunc', 'boxSetTextWrapFunc', 'boxSetTopFunc', 'boxSetTopLeftPointFunc', 'chartPointCopyFunc', 'chartPointFromIndexFunc', 'chartPointFromTimeFunc', 'chartPointNewFunc', 'chartPointNowFunc', 'colFunc', 'colBFunc', 'colFromGradientFunc', 'colGFunc', 'colNewFunc', 'colRFunc', 'colRgbFunc', 'colTFunc', 'dayOfMonthFunc', 'dayOfWeekFunc', 'fillFunc', 'fixNanFunc', 'floatFunc', 'hLineFunc', 'hourFunc', 'indicatorFunc', 'inputFunc', 'inputBoolFunc', 'inputColFunc', 'inputEnumFunc', 'inputFloatFunc', 'inputIntFunc', 'inputPriceFunc', 'inputSessionFunc', 'inputSourceFunc', 'inputStringFunc', 'inputSymbolFunc', 'inputTextAreaFunc', 'inputTimeFunc', 'inputTimeFrameFunc', 'intFunc', 'labelFunc', 'labelCopyFunc', 'labelDeleteFunc', 'labelGetTextFunc', 'labelGetXFunc', 'labelGetYFunc', 'labelNewFunc', 'labelSetColFunc', 'labelSetPointFunc', 'labelSetSizeFunc', 'labelSetStyleFunc', 'labelSetTextFunc', 'labelSetTextFontFamilyFunc', 'labelSetTextAlignFunc', 'labelSetTextColFunc', 'labelSetToolTipFunc', 'labelSetXFunc', 'labelSetXLocFunc', 'labelSetXYFunc', 'labelSetYFunc', 'labelSetYLocFunc', 'libraryFunc', 'lineFunc', 'lineCopyFunc', 'lineDeleteFunc', 'lineGetPriceFunc', 'lineGetX1Func', 'lineGetX2Func', 'lineGetY1Func', 'lineGetY2Func', 'lineNewFunc', 'lineSetColFunc', 'lineSetExtendFunc', 'lineSetFirstPointFunc', 'lineSetSecondPointFunc', 'lineSetStyleFunc', 'lineSetWidthFunc', 'lineSetX1Func', 'lineSetX2Func', 'lineSetXLocFunc', 'lineSetXY1Func', 'lineSetXY2Func', 'lineSetY1Func', 'lineSetY2Func', 'lineFillFunc', 'lineFillDeleteFunc', 'lineFillGetLine1Func', 'lineFillGetLine2Func', 'lineFillNewFunc', 'lineFillSetColFunc', 'logErrorFunc', 'logInfoFunc', 'logWarningFunc', 'mapClearFunc', 'mapContainsFunc', 'mapCopyFunc', 'mapGetFunc', 'mapKeysFunc', 'mapNewTypeFunc', 'mapPutFunc', 'mapPutAllFunc', 'mapRemoveFunc', 'mapSizeFunc', 'mapValuesFunc', 'mathAbsFunc', 'mathAcosFunc', 'mathAsinFunc', 'mathAtanFunc', 'mathAvgFunc', 'mathCeilFunc', 'mathCosFunc', 'mathExpFunc', 'mathFloorFunc', 'mathLogFunc', 'mathLog10Func', 'mathMaxFunc', 'mathMinFunc', 'mathPowFunc', 'mathRandomFunc', 'mathRoundFunc', 'mathRoundToMinTickFunc', 'mathSignFunc', 'mathSinFunc', 'mathSqrtFunc', 'mathSumFunc', 'mathTanFunc', 'mathToDegreesFunc', 'mathToRadiansFunc', 'matrixAddColFunc', 'matrixAddRowFunc', 'matrixAvgFunc', 'matrixColFunc', 'matrixColumnsFunc', 'matrixConcatFunc', 'matrixCopyFunc', 'matrixDetFunc', 'matrixDiffFunc', 'matrixEigenValuesFunc', 'matrixEigenVectorsFunc', 'matrixElementsCountFunc', 'matrixFillFunc', 'matrixGetFunc', 'matrixInvFunc', 'matrixIsAntiDiagonalFunc', 'matrixIsAntiSymmetricFunc', 'matrixIsBinaryFunc', 'matrixIsDiagonalFunc', 'matrixIsIdentityFunc', 'matrixIsSquareFunc', 'matrixIsStochasticFunc', 'matrixIsSymmetricFunc', 'matrixIsTriangularFunc', 'matrixIsZeroFunc', 'matrixKronFunc', 'matrixMaxFunc', 'matrixMedianFunc', 'matrixMinFunc', 'matrixModeFunc', 'matrixMultFunc', 'matrixNewTypeFunc', 'matrixPinvFunc', 'matrixPowFunc', 'matrixRankFunc', 'matrixRemoveColFunc', 'matrixRemoveRowFunc', 'matrixReshapeFunc', 'matrixReverseFunc', 'matrixRowFunc', 'matrixRowsFunc', 'matrixSetFunc', 'matrixSortFunc', 'matrixSubMatrixFunc', 'matrixSumFunc', 'matrixSwapColumnsFunc', 'matrixSwapRowsFunc', 'matrixTraceFunc', 'matrixTransposeFunc', 'maxBarsBackFunc', 'minuteFunc', 'monthFunc', 'naFunc', 'nzFunc', 'polylineDeleteFunc', 'polylineNewFunc', 'requestCurrencyRateFunc', 'requestDividendsFunc', 'requestEarningsFunc', 'requestEconomicFunc', 'requestFinancialFunc', 'requestQuandlFunc', 'requestSecurityFunc', 'requestSecurityLowerTfFunc', 'requestSeedFunc', 'requestSplitsFunc', 'runtimeErrorFunc', 'secondFunc', 'strContainsFunc', 'strEndsWithFunc', 'strFormatFunc', 'strFormatTimeFunc', 'strLengthFunc', 'strLowerFunc', 'strMatchFunc', 'strPosFunc', 'strRepeatFunc', 'strReplaceFunc', 'strReplaceAllFunc', 'strSplitFunc', 'strStartsWithFunc', 'strSubstringFunc', 'strToNumberFunc', 'strToStringFunc', 'strTrimFunc', 'strUpperFunc', 'strategyFunc', 'strategyCancelFunc', 'strategyCancelAllFunc', 'strategyCloseFunc', 'strategyCloseAllFunc', 'strategyClosedTradesCommissionFunc', 'strategyClosedTradesEntryBarIndexFunc', 'strategyClosedTradesEntryCommentFunc', 'strategyClosedTradesEntryIdFunc', 'strategyClosedTradesEntryPriceFunc', 'strategyClosedTradesEntryTimeFunc', 'strategyClosedTradesExitBarIndexFunc', 'strategyClosedTradesExitCommentFunc', 'strategyClosedTradesExitIdFunc', 'strategyClosedTradesExitPriceFunc', 'strategyClosedTradesExitTimeFunc', 'strategyClosedTradesMaxDrawdownFunc', 'strategyClosedTradesMaxDrawdownPercentFunc', 'strategyClosedTradesMaxRunupFunc', 'strategyClosedTradesMaxRunupPercentFunc', 'strategyClosedTradesProfitFunc', 'strategyClosedTradesProfitPercentFunc', 'strategyClosedTradesSizeFunc', 'strategyConvertToAccountFunc', 'strategyConvertToSymbolFunc', 'strategyDefaultEntryQtyFunc', 'strategyEntryFunc', 'strategyExitFunc', 'strategyOpenTradesCommissionFunc', 'strategyOpenTradesEntryBarIndexFunc', 'strategyOpenTradesEntryCommentFunc', 'strategyOpenTradesEntryIdFunc', 'strategyOpenTradesEntryPriceFunc', 'strategyOpenTradesEntryTimeFunc', 'strategyOpenTradesMaxDrawdownFunc', 'strategyOpenTradesMaxDrawdownPercentFunc', 'strategyOpenTradesMaxRunupFunc', 'strategyOpenTradesMaxRunupPercentFunc', 'strategyOpenTradesProfitFunc', 'strategyOpenTradesProfitPercentFunc', 'strategyOpenTradesSizeFunc', 'strategyOrderFunc', 'strategyRiskAllowEntryInFunc', 'strategyRiskMaxConsLossDaysFunc', 'strategyRiskMaxDrawdownFunc', 'strategyRiskMaxIntradayFilledOrdersFunc', 'strategyRiskMaxIntradayLossFunc', 'strategyRiskMaxPositionSizeFunc', 'symInfoPrefixFunc', 'symInfoTickerFunc', 'timeFunc', 'timeCloseFunc', 'timeframeChangeFunc', 'timeframeFromSecondsFunc', 'timeframeInSecondsFunc', 'timestampFunc', 'weekOfYearFunc', 'yearFunc']:
-                        tokens.append(('BUILTIN_FUNCTION', identifier))
-                    elif identifier == 'true' or identifier == 'false':
-                        tokens.append(('BOOLEAN', identifier == 'true'))
-                    elif identifier in ['showStyleArea','showStyleAreaBr','showStyleCircles','showStyleColumns','showStyleCross','showStyleHistogram','showStyleLine','showStyleLineBr','showStyleStepLine','showStyleStepLineDiamond','showStyleStepLineBr','positionBottomCenter','positionBottomLeft','positionBottomRight','positionMiddleCenter','positionMiddleLeft','positionMiddleRight','positionTopCenter','positionTopLeft','positionTopRight','scaleLeft','scaleNone','scaleRight','sessionExtended','sessionRegular','settlementAsCloseInherit','settlementAsCloseOff','settlementAsCloseOn','shapeArrowDown','shapeArrowUp','shapeCircle','shapeCross','shapeDiamond','shapeFlag','shapeLabelDown','shapeLabelUp','shapeSquare','shapeTriangleDown','shapeTriangleUp','shapeXCross','sizeAuto','sizeHuge','sizeLarge','sizeNormal','sizeSmall','sizeTiny','splitsDenominator','splitsNumerator','strategyCash','strategyCommissionCashPerContract','strategyCommissionCashPerOrder','strategyCommissionPercent','strategyDirectionAll','strategyDirectionLong','strategyDirectionShort','strategyFixed','strategyLong','strategyOcaCancel','strategyOcaNone','strategyOcaReduce','strategyPercentOfEquity','strategyShort','textAlignBottom','textAlignCenter','textAlignLeft','textAlignRight','textAlignTop','textWrapAuto','textWrapNone','trueValue','xLocBarIndex','xLocBarTime','yLocAboveBar','yLocBelowBar','yLocPrice','adjustmentDividends','adjustmentNone','adjustmentSplits','alertFreqAll','alertFreqOncePerBar','alertFreqOncePerBarClose','backAdjustmentInherit','backAdjustmentOff','backAdjustmentOn','barMergeGapsOff','barMergeGapsOn','barMergeLookaheadOff','barMergeLookaheadOn','colAqua','colBlack','colBlue','colFuchsia','colGray','colGreen','colLime','colMaroon','colNavy','colOlive','colOrange','colPurple','colRed','colSilver','colTeal','colWhite','colYellow','currencyAUD','currencyBTC','currencyCAD','currencyCHF','currencyETH','currencyEUR','currencyGBP','currencyHKD','currencyINR','currencyJPY','currencyKRW','currencyMYR','currencyNOK','currencyNone','currencyNZD','currencyRUB','currencySEK','currencySGD','currencyTRY','currencyUSD','currencyUSDT','currencyZAR','dayOfWeekFriday','dayOfWeekMonday','dayOfWeekSaturday','dayOfWeekSunday','dayOfWeekThursday','dayOfWeekTuesday','dayOfWeekWednesday','displayAll','displayDataWindow','displayNone','displayPane','displayPriceScale','displayStatusLine','dividendsGross','dividendsNet','earningsActual','earningsEstimate','earningsStandardized','extendBoth','extendLeft','extendNone','extendRight','falseValue','fontFamilyDefault','fontFamilyMonospace','formatInherit','formatMinTick','formatPercent','formatPrice','formatVolume','hlineStyleDashed','hlineStyleDotted','hlineStyleSolid','labelStyleArrowDown','labelStyleArrowUp','labelStyleCircle','labelStyleCross','labelStyleDiamond','labelStyleFlag','labelStyleLabelCenter','labelStyleLabelDown','labelStyleLabelLeft','labelStyleLabelLowerLeft','labelStyleLabelLowerRight','labelStyleLabelRight','labelStyleLabelUp','labelStyleLabelUpperLeft','labelStyleLabelUpperRight','labelStyleNone','labelStyleSquare','labelStyleTextOutline','labelStyleTriangleDown','labelStyleTriangleUp','labelStyleXCross','lineStyleArrowBoth','lineStyleArrowLeft','lineStyleArrowRight','lineStyleDashed','lineStyleDotted','lineStyleSolid','locationAboveBar','locationAbsolute','locationBelowBar','locationBottom','locationTop','mathE','mathPhi','mathPi','mathRPhi','orderAscending','orderDescending']:
-                        tokens.append(('CONSTANT', identifier))
-                    elif identifier in ['arr', 'bool', 'box', 'chartPoint', 'col', 'const', 'float', 'int', 'label', 'line', 'lineFill', 'map', 'matrx', 'polyline', 'series', 'simple', 'string', 'table']:
-                        tokens.append(('TYPE_DECLARATION', identifier))
-                    else:
-                        tokens.append(('IDENTIFIER', identifier))
-                    self.current_position += match.end()
-                    continue
-            
-            elif char in ['+', '-', '*', '/', '%', '=', '>', '<', '!', '=']:
-                if char == '=' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '=='))
-                    self.current_position += 2
-                elif char == '!' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '!='))
-                    self.current_position += 2
-                elif char == '>' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '>='))
-                    self.current_position += 2
-                elif char == '<' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '<='))
-                    self.current_position += 2
-                else:
-                    tokens.append(('OPERATOR', char))
-                    self.current_position += 1
-                continue
-            
-            elif char == '(':
-                tokens.append(('LPAREN', char))
-                self.current_position += 1
-                continue
-            elif char == ')':
-                tokens.append(('RPAREN', char))
-                self.current_position += 1
-                continue
-            elif char == '{':
-                tokens.append(('LBRACE', char))
-                self.current_position += 1
-                continue
-            elif char == '}':
-                tokens.append(('RBRACE', char))
-                self.current_position += 1
-                continue
-            elif char == ',':
-                tokens.append(('COMMA', char))
-                self.current_position += 1
-                continue
-            elif char == ':':
-                tokens.append(('COLON', char))
-                self.current_position += 1
-                continue
-            elif char == '"':
-                self.current_position += 1
-                start = self.current_position
-                while self.current_position < len(self.source_code) and self.source_code[self.current_position] != '"':
-                    self.current_position += 1
-                tokens.append(('STRING', self.source_code[start:self.current_position]))
-                self.current_position += 1
+        for match in TOKEN_PATTERN.finditer(self.source_code):
+            kind = match.lastgroup
+            text = match.group()
+            if kind == 'SKIP':
                 continue
-
-            self.current_position += 1 # Skip characters we don't recognize for now
+            if kind == 'NUMBER':
+                tokens.append(('NUMBER', float(text)))
+            elif kind == 'NAME':
+                token_type = IDENTIFIER_TYPES.get(text, 'IDENTIFIER')
+                tokens.append((token_type, text == 'true' if token_type == 'BOOLEAN' else text))
+            elif kind == 'STRING':
+                tokens.append(('STRING', text[1:-1] if len(text) > 1 and text.endswith('"') else text[1:]))
+            else:
+                tokens.append((kind, text))
+        self.current_position = len(self.source_code)
         return tokens
 
     def peek(self):
@@ -505,7 +629,8 @@ class Parser:
             if self._match('COMMA'):
                 self._consume()  # Consume ','
         self._consume()  # Consume ')'
-        return {'type': 'function_call', 'name': function_name, 'arguments': arguments}
+        return {'type': 'function_call', 'name': function_name, 'arguments': arguments,
+                'call_site': next(CALL_SITE_IDS)}
 
     def parse_param_declaration(self):
         self.current_token_index += 1  # Consume 'param'
@@ -708,10 +833,20 @@ class Evaluator:
     def __init__(self, ast):
         self.ast = ast
         self.environment = {}
+        # set by the bar loop (evaluate_bar); ta kernels advance once per bar_index
+        self.bar_index = None
+        self.ta_stream = StreamingTAEngine()
+        self.builtins = bind_builtins(self)
 
     def evaluate(self):
         return self._evaluate(self.ast)
 
+    def evaluate_bar(self, env, bar_index):
+        """Evaluate the script for one bar; repeated ta calls within the bar reuse that bar's value"""
+        self.environment = env
+        self.bar_index = bar_index
+        return self._evaluate(self.ast)
+
 
 """-----------------------------------------------------------------------------------------------------------------------------------------"""
 
@@ -1352,109 +1487,6 @@ def _evaluate_builtin_variable(self, node):
 
 
 
-#builtin_functions
-
-def _evaluate_builtin_function(self, node):
-        args = [self._evaluate(arg) for arg in node['arguments']]
-
-    # Alert and Notification Functions
-        if node['name'] == 'alertFunc':
-            print(f"ALERT: {args[0]}")
-            return None
-        elif node['name'] == 'alertConditionFunc':
-            return args[0] and args[1]
-        elif node['name'] == 'logErrorFunc':
-            print(f"ERROR: {args[0]}")
-            return None
-        elif node['name'] == 'logInfoFunc':
-            print(f"INFO: {args[0]}")
-            return None
-        elif node['name'] == 'logWarningFunc':
-            print(f"WARNING: {args[0]}")
-            return None
-
-        # Array Functions
-        elif node['name'] in ['arrAbs', 'arrAvg', 'arrBinarySearch', 'arrBinarySearchLeftmost', 'arrBinarySearchRightmost', 'arrClear', 'arrConcat', 'arrCopy', 'arrCovariance', 'arrEvery', 'arrFill', 'arrFirst', 'arrFrom', 'arrGet', 'arrIncludes', 'arrIndexOf', 'arrInsert', 'arrJoin', 'arrLast', 'arrLastIndexOf', 'arrMax', 'arrMedian', 'arrMin', 'arrMode', 'arrNewBool', 'arrNewBox', 'aryNewCol', 'arrNewFloat', 'arrNewInt', 'arrNewLabel', 'arrNewLine', 'arrNewLineFill', 'arrNewString', 'arrNewTable', 'arrNewType', 'arrPercentileLinearInterpolation', 'arrPercentileNearestRank', 'arrPercentRank', 'arrPop', 'arrPush', 'arrRange', 'arrRemove', 'arrReverse', 'arrSet', 'arrShift', 'arrSize', 'arrSlice', 'arrSome', 'arrSort', 'arrSortIndices', 'arrStandardize', 'arrStdev', 'arrSum', 'arrUnshift', 'arrVariance']:
-            return self._handle_array_operation(node['name'], args)
-
-        # Box Functions
-        elif node['name'] in ['boxFunc', 'boxCopyFunc', 'boxDeleteFunc','boxGetBottomFunc', 'boxGetLeftFunc','boxGetRightFunc', 'boxGetTopFunc', 'boxNewFunc','boxSetBgColFunc', 'boxSetBorderColFunc','boxSetBorderStyleFunc', 'boxSetBorderWidthFunc','boxSetBottomFunc', 'boxSetBottomRightPointFunc','boxSetExtendFunc', 'boxSetLeftFunc','boxSetLeftTopFunc', 'boxSetRightFunc', 'boxSetRightBottomFunc','boxSetTextFunc','boxSetTextColFunc', 'boxSetTextFontFamilyFunc', 'boxSetTextHAlignFunc','boxSetTextSizeFunc','boxSetTextVAlignFunc', 'boxSetTextWrapFunc', 'boxSetTopFunc','boxSetTopLeftPointFunc','chartPointCopyFunc', 'chartPointFromIndexFunc',]:
-            return self._handle_box_operation(node['name'], args)
-
-        # Chart Functions
-        elif node['name'] in ['chartPointCopyFunc', 'chartPointFromIndexFunc', 'chartPointFromTimeFunc',
-                             'chartPointNewFunc', 'chartPointNowFunc']:
-            return self._handle_chart_operation(node['name'], args)
-
-        # Weird Functions
-        elif node['name'] in ['dayOfMonthFunc', 'dayOfWeekFunc', 'fillFunc','fixNanFunc', 'floatFunc','hLineFunc', 'hourFunc', 'indicatorFunc','maxBarsBackFunc', 'minuteFunc', 'monthFunc', 'naFunc','nzFunc', 'polylineDeleteFunc','polylineNewFunc', 'requestCurrencyRateFunc', 'requestDividendsFunc','requestEarningsFunc','requestEconomicFunc', 'requestFinancialFunc', 'requestQuandlFunc', 'requestSecurityFunc','requestSecurityLowerTfFunc', 'requestSeedFunc', 'requestSplitsFunc', 'runtimeErrorFunc','secondFunc','barColFunc','bgColFunc', 'boolFunc']:
-            return self._handle_weird_operation(node['name'], args)
-
-        # Color Functions
-        elif node['name'] in ['colFunc', 'colBFunc', 'colFromGradientFunc', 'colGFunc', 'colNewFunc','colRFunc', 'colRgbFunc', 'colTFunc']:
-            return self._handle_color_operation(node['name'], args)
-
-        # Input Functions
-        elif node['name'] in ['inputFunc','inputBoolFunc', 'inputColFunc', 'inputEnumFunc', 'inputFloatFunc','inputIntFunc','inputPriceFunc', 'inputSessionFunc', 'inputSourceFunc', 'inputStringFunc','inputSymbolFunc','inputTextAreaFunc', 'inputTimeFunc', 'inputTimeFrameFunc', 'intFunc']:
-            return self._handle_input_operation(node['name'], args)
-
-        # Label Functions
-        elif node['name'] in ['labelFunc','labelCopyFunc', 'labelDeleteFunc', 'labelGetTextFunc', 'labelGetXFunc', 'labelGetYFunc','labelNewFunc', 'labelSetColFunc', 'labelSetPointFunc', 'labelSetSizeFunc', 'labelSetStyleFunc','labelSetTextFunc', 'labelSetTextFontFamilyFunc', 'labelSetTextAlignFunc', 'labelSetTextColFunc','labelSetToolTipFunc', 'labelSetXFunc', 'labelSetXLocFunc', 'labelSetXYFunc', 'labelSetYFunc','labelSetYLocFunc']:
-            return self._handle_label_operation(node['name'], args)
-
-        # Line Functions
-        elif node['name'] in ['libraryFunc', 'lineFunc', 'lineCopyFunc', 'lineDeleteFunc','lineGetPriceFunc', 'lineGetX1Func','lineGetX2Func', 'lineGetY1Func', 'lineGetY2Func','lineNewFunc', 'lineSetColFunc', 'lineSetExtendFunc','lineSetFirstPointFunc','lineSetSecondPointFunc', 'lineSetStyleFunc', 'lineSetWidthFunc', 'lineSetX1Func','lineSetX2Func', 'lineSetXLocFunc', 'lineSetXY1Func', 'lineSetXY2Func', 'lineSetY1Func','lineSetY2Func', 'lineFillFunc', 'lineFillDeleteFunc', 'lineFillGetLine1Func','lineFillGetLine2Func', 'lineFillNewFunc', 'lineFillSetColFunc']:
-            return self._handle_line_operation(node['name'], args)
-
-        # log Functions
-        elif node['name'] in ['logErrorFunc','logInfoFunc', 'logWarningFunc']:
-            return self._handle_log_operation(node['name'], args)
-
-        # map Functions
-        elif node['name'] in ['mapClearFunc', 'mapContainsFunc', 'mapCopyFunc','mapGetFunc', 'mapKeysFunc', 'mapNewTypeFunc','mapPutFunc', 'mapPutAllFunc','mapRemoveFunc', 'mapSizeFunc', 'mapValuesFunc']:
-            return self._handle_map_operation(node['name'], args)
-
-        # Math Functions
-        elif node['name'] in ['mathAbsFunc', 'mathAcosFunc','mathAsinFunc', 'mathAtanFunc', 'mathAvgFunc', 'mathCeilFunc','mathCosFunc','mathExpFunc', 'mathFloorFunc', 'mathLogFunc', 'mathLog10Func', 'mathMaxFunc','mathMinFunc', 'mathPowFunc', 'mathRandomFunc', 'mathRoundFunc', 'mathRoundToMinTickFunc','mathSignFunc', 'mathSinFunc', 'mathSqrtFunc', 'mathSumFunc', 'mathTanFunc','mathToDegreesFunc', 'mathToRadiansFunc']:
-            return self._handle_math_operation(node['name'], args)
-
-        # Matrix Functions
-        elif node['name'] in ['matrixAddColFunc', 'matrixAddRowFunc','matrixAvgFunc', 'matrixColFunc', 'matrixColumnsFunc', 'matrixConcatFunc', 'matrixCopyFunc','matrixDetFunc', 'matrixDiffFunc', 'matrixEigenValuesFunc', 'matrixEigenVectorsFunc','matrixElementsCountFunc', 'matrixFillFunc', 'matrixGetFunc', 'matrixInvFunc','matrixIsAntiDiagonalFunc', 'matrixIsAntiSymmetricFunc', 'matrixIsBinaryFunc','matrixIsDiagonalFunc','matrixIsIdentityFunc', 'matrixIsSquareFunc', 'matrixIsStochasticFunc','matrixIsSymmetricFunc','matrixIsTriangularFunc', 'matrixIsZeroFunc', 'matrixKronFunc','matrixMaxFunc', 'matrixMedianFunc','matrixMinFunc', 'matrixModeFunc', 'matrixMultFunc','matrixNewTypeFunc', 'matrixPinvFunc', 'matrixPowFunc','matrixRankFunc', 'matrixRemoveColFunc','matrixRemoveRowFunc', 'matrixReshapeFunc', 'matrixReverseFunc','matrixRowFunc','matrixRowsFunc', 'matrixSetFunc', 'matrixSortFunc', 'matrixSubMatrixFunc', 'matrixSumFunc','matrixSwapColumnsFunc', 'matrixSwapRowsFunc', 'matrixTraceFunc', 'matrixTransposeFunc']:
-            return self._handle_matrix_operation(node['name'], args)
-
-        # str Functions
-        elif node['name'] in ['strContainsFunc', 'strEndsWithFunc', 'strFormatFunc', 'strFormatTimeFunc','strLengthFunc', 'strLowerFunc', 'strMatchFunc', 'strPosFunc', 'strRepeatFunc','strReplaceFunc', 'strReplaceAllFunc', 'strSplitFunc', 'strStartsWithFunc', 'strSubstringFunc','strToNumberFunc', 'strToStringFunc', 'strTrimFunc', 'strUpperFunc']:
-            return self._handle_str_operation(node['name'], args)
-
-
-        # Strategy Functions
-        elif node['name'] in ['strategyFunc','strategyCancelFunc', 'strategyCancelAllFunc', 'strategyCloseFunc', 'strategyCloseAllFunc','strategyClosedTradesCommissionFunc', 'strategyClosedTradesEntryBarIndexFunc','strategyClosedTradesEntryCommentFunc', 'strategyClosedTradesEntryIdFunc','strategyClosedTradesEntryPriceFunc','strategyClosedTradesEntryTimeFunc','strategyClosedTradesExitBarIndexFunc', 'strategyClosedTradesExitCommentFunc','strategyClosedTradesExitIdFunc', 'strategyClosedTradesExitPriceFunc','strategyClosedTradesExitTimeFunc','strategyClosedTradesMaxDrawdownFunc','strategyClosedTradesMaxDrawdownPercentFunc', 'strategyClosedTradesMaxRunupFunc','strategyClosedTradesMaxRunupPercentFunc', 'strategyClosedTradesProfitFunc','strategyClosedTradesProfitPercentFunc','strategyClosedTradesSizeFunc','strategyConver,ToAccountFunc', 'strategyConvertToSymbolFunc', 'strategyDefaultEntryQtyFunc','strategyEntryFunc', 'strategyExitFunc', 'strategyOpenTradesCommissionFunc','strategyOpenTradesEntryBarIndexFunc','strategyOpenTradesEntryCommentFunc','strategyOpenTradesEntryIdFunc', 'strategyOpenTradesEntryPriceFunc','strategyOpenTradesEntryTimeFunc', 'strategyOpenTradesMaxDrawdownFunc','strategyOpenTradesMaxDrawdownPercentFunc','strategyOpenTradesMaxRunupFunc','strategyOpenTradesMaxRunupPercentFunc', 'strategyOpenTradesProfitFunc','strategyOpenTradesProfitPercentFunc', 'strategyOpenTradesSizeFunc', 'strategyOrderFunc','strategyRiskAllowEntryInFunc','strategyRiskMaxConsLossDaysFunc', 'strategyRiskMaxDrawdownFunc','strategyRiskMaxIntradayFilledOrdersFunc','strategyRiskMaxIntradayLossFunc','strategyRiskMaxPositionSizeFunc']:
-            return self._handle_strategy_operation(node['name'], args)
-
-        # Time Functions
-        elif node['name'] in ['symInfoPrefixFunc', 'symInfoTickerFunc', 'timeFunc','timeCloseFunc', 'timeframeChangeFunc','timeframeFromSecondsFunc', 'timeframeInSecondsFunc','timestampFunc', 'weekOfYearFunc', 'yearFunc']:
-            return self._handle_time_operation(node['name'], args)
-
-        # Original functions remain unchanged
-        elif node['name'] == 'sma':
-            return sum(args[0][-args[1]:]) / args[1]
-        elif node['name'] == 'ema':
-            k = 2 / (args[1] + 1)
-            ema = args[0][0]
-            for price in args[0][1:]:
-                ema = price * k + ema * (1 - k)
-            return ema
-        elif node['name'] == 'rsi':
-            gains = [args[0][i] - args[0][i - 1] for i in range(1, len(args[0])) if args[0][i] > args[0][i - 1]]
-            losses = [-args[0][i] + args[0][i - 1] for i in range(1, len(args[0])) if args[0][i] < args[0][i - 1]]
-            avg_gain = sum(gains) / args[1]
-            avg_loss = sum(losses) / args[1]
-            rs = avg_gain / avg_loss if avg_loss != 0 else 0
-            return 100 - (100 / (1 + rs))
-
-        return None
-
-
 #type_declaration
 
 def _evaluate_type_declaration(self, node):
@@ -1766,16 +1798,15 @@ def _calculate_strategy_metrics(self):
     trades = self.trades  # Assuming we have a trades list
     
     if trades:
-        profits = [t['profit'] for t in trades if t['profit'] > 0]
-        losses = [t['profit'] for t in trades if t['profit'] < 0]
+        metrics = _trade_metrics(self)
         
         self.environment.update({
-            'strategyAvgTrade': sum(t['profit'] for t in trades) / len(trades),
-            'strategyAvgWinningTrade': sum(profits) / len(profits) if profits else 0,
-            'strategyAvgLosingTrade': sum(losses) / len(losses) if losses else 0,
-            'strategyNetProfit': sum(t['profit'] for t in trades),
-            'strategyWinTrades': len(profits),
-            'strategyLossTrades': len(losses)
+            'strategyAvgTrade': metrics.avg_trade,
+            'strategyAvgWinningTrade': metrics.avg_winning_trade,
+            'strategyAvgLosingTrade': metrics.avg_losing_trade,
+            'strategyNetProfit': metrics.net_profit,
+            'strategyWinTrades': metrics.wins,
+            'strategyLossTrades': metrics.losses
         })
 
 def _calculate_price_aggregates(self):
@@ -1916,24 +1947,29 @@ def _calculate_technical_indicators(self):
             'taIII': (2 * close[-1] - high[-1] - low[-1]) / (high[-1] - low[-1]) * volume[-1]
         })
 
+def _trade_metrics(self):
+    """Running trade statistics, fed only the trades closed since the previous bar"""
+    metrics = getattr(self, 'trade_metrics', None)
+    if metrics is None:
+        metrics = self.trade_metrics = OnlineMetrics()
+    return metrics.sync_trades(self.trades, pnl_key='profit')
+
 def _calculate_strategy_metrics(self):
     """Strategy metrics calculations"""
     if self.trades:
-        trades_array = np.array([t['profit'] for t in self.trades])
-        winning_trades = trades_array[trades_array > 0]
-        losing_trades = trades_array[trades_array < 0]
+        metrics = _trade_metrics(self)
         
         initial_capital = self.environment['strategyInitialCapital']
-        current_equity = initial_capital + trades_array.sum()
+        current_equity = initial_capital + metrics.net_profit
         
         self.environment.update({
-            'strategyNetProfit': trades_array.sum(),
-            'strategyNetProfitPercent': (trades_array.sum() / initial_capital) * 100,
-            'strategyAvgTrade': trades_array.mean(),
-            'strategyAvgWinningTrade': winning_trades.mean() if len(winning_trades) > 0 else 0,
-            'strategyAvgLosingTrade': losing_trades.mean() if len(losing_trades) > 0 else 0,
-            'strategyWinTrades': len(winning_trades),
-            'strategyLossTrades': len(losing_trades),
+            'strategyNetProfit': metrics.net_profit,
+            'strategyNetProfitPercent': (metrics.net_profit / initial_capital) * 100,
+            'strategyAvgTrade': metrics.avg_trade,
+            'strategyAvgWinningTrade': metrics.avg_winning_trade,
+            'strategyAvgLosingTrade': metrics.avg_losing_trade,
+            'strategyWinTrades': metrics.wins,
+            'strategyLossTrades': metrics.losses,
             'strategyEquity': current_equity
         })
 
@@ -2000,124 +2036,56 @@ def _get_timeframe_multiplier(self, minutes):
 
 #builttin function
 
-def _evaluate_builtin_function(self, node):
-        args = [self._evaluate(arg) for arg in node['arguments']]
-
-    # Alert and Notification Functions
-        if node['name'] == 'alertFunc':
-            print(f"ALERT: {args[0]}")
-            return None
-        elif node['name'] == 'alertConditionFunc':
-            return args[0] and args[1]
-        elif node['name'] == 'logErrorFunc':
-            print(f"ERROR: {args[0]}")
-            return None
-        elif node['name'] == 'logInfoFunc':
-            print(f"INFO: {args[0]}")
-            return None
-        elif node['name'] == 'logWarningFunc':
-            print(f"WARNING: {args[0]}")
-            return None
-
-        # Array Functions
-        elif node['name'] in ['arrAbs', 'arrAvg', 'arrBinarySearch', 'arrBinarySearchLeftmost', 'arrBinarySearchRightmost', 'arrClear', 'arrConcat', 'arrCopy', 'arrCovariance', 'arrEvery', 'arrFill', 'arrFirst', 'arrFrom', 'arrGet', 'arrIncludes', 'arrIndexOf', 'arrInsert', 'arrJoin', 'arrLast', 'arrLastIndexOf', 'arrMax', 'arrMedian', 'arrMin', 'arrMode', 'arrNewBool', 'arrNewBox', 'arrNewCol', 'arrNewFloat', 'arrNewInt', 'arrNewLabel', 'arrNewLine', 'arrNewLineFill', 'arrNewString', 'arrNewTable', 'arrNewType', 'arrPercentileLinearInterpolation', 'arrPercentileNearestRank', 'arrPercentRank', 'arrPop', 'arrPush', 'arrRange', 'arrRemove', 'arrReverse', 'arrSet', 'arrShift', 'arrSize', 'arrSlice', 'arrSome', 'arrSort', 'arrSortIndices', 'arrStandardize', 'arrStdev', 'arrSum', 'arrUnshift', 'arrVariance']:
-            return self._handle_array_operation(node['name'], args)
-
-        # Box Functions
-        elif node['name'] in ['boxFunc', 'boxCopyFunc', 'boxDeleteFunc', 'boxGetBottomFunc', 'boxGetLeftFunc', 'boxGetRightFunc', 'boxGetTopFunc', 'boxNewFunc', 'boxSetBgColFunc', 'boxSetBorderColFunc', 'boxSetBorderStyleFunc', 'boxSetBorderWidthFunc', 'boxSetBottomFunc', 'boxSetBottomRightPointFunc', 'boxSetExtendFunc', 'boxSetLeftFunc', 'boxSetLeftTopFunc', 'boxSetRightFunc', 'boxSetRightBottomFunc', 'boxSetTextFunc', 'boxSetTextColFunc', 'boxSetTextFontFamilyFunc', 'boxSetTextHAlignFunc', 'boxSetTextSizeFunc', 'boxSetTextVAlignFunc', 'boxSetTextWrapFunc', 'boxSetTopFunc', 'boxSetTopLeftPointFunc']:
-            return self._handle_box_operation(node['name'], args)
-
-        # Chart Functions
-        elif node['name'] in ['chartPointCopyFunc', 'chartPointFromIndexFunc', 'chartPointFromTimeFunc',
-                             'chartPointNewFunc', 'chartPointNowFunc']:
-            return self._handle_chart_operation(node['name'], args)
-
-        # Weird Functions
-        elif node['name'] in ['dayOfMonthFunc', 'dayOfWeekFunc', 'fillFunc','fixNanFunc', 'floatFunc','hLineFunc', 'hourFunc', 'indicatorFunc','maxBarsBackFunc', 'minuteFunc', 'monthFunc', 'naFunc','nzFunc', 'polylineDeleteFunc','polylineNewFunc', 'requestCurrencyRateFunc', 'requestDividendsFunc','requestEarningsFunc','requestEconomicFunc', 'requestFinancialFunc', 'requestQuandlFunc', 'requestSecurityFunc','requestSecurityLowerTfFunc', 'requestSeedFunc', 'requestSplitsFunc', 'runtimeErrorFunc','secondFunc','barColFunc','bgColFunc', 'boolFunc']:
-            return self._handle_weird_operation(node['name'], args)
-
-        # Color Functions
-        elif node['name'] in ['colFunc', 'colBFunc', 'colFromGradientFunc', 'colGFunc', 'colNewFunc','colRFunc', 'colRgbFunc', 'colTFunc']:
-            return self._handle_color_operation(node['name'], args)
-
-        # Input Functions
-        elif node['name'] in ['inputFunc','inputBoolFunc', 'inputColFunc', 'inputEnumFunc', 'inputFloatFunc','inputIntFunc','inputPriceFunc', 'inputSessionFunc', 'inputSourceFunc', 'inputStringFunc','inputSymbolFunc','inputTextAreaFunc', 'inputTimeFunc', 'inputTimeFrameFunc', 'intFunc']:
-            return self._handle_input_operation(node['name'], args)
+# stable ta call-site ids, assigned once per parsed call node (survives AST caching/copies)
+CALL_SITE_IDS = itertools.count()
 
-        # Label Functions
-        elif node['name'] in ['labelFunc','labelCopyFunc', 'labelDeleteFunc', 'labelGetTextFunc', 'labelGetXFunc', 'labelGetYFunc','labelNewFunc', 'labelSetColFunc', 'labelSetPointFunc', 'labelSetSizeFunc', 'labelSetStyleFunc','labelSetTextFunc', 'labelSetTextFontFamilyFunc', 'labelSetTextAlignFunc', 'labelSetTextColFunc','labelSetToolTipFunc', 'labelSetXFunc', 'labelSetXLocFunc', 'labelSetXYFunc', 'labelSetYFunc','labelSetYLocFunc']:
-            return self._handle_label_operation(node['name'], args)
+class Builtin(NamedTuple):
+    name: str
+    func: Callable
 
-        # Line Functions
-        elif node['name'] in ['libraryFunc', 'lineFunc', 'lineCopyFunc', 'lineDeleteFunc','lineGetPriceFunc', 'lineGetX1Func','lineGetX2Func', 'lineGetY1Func', 'lineGetY2Func','lineNewFunc', 'lineSetColFunc', 'lineSetExtendFunc','lineSetFirstPointFunc','lineSetSecondPointFunc', 'lineSetStyleFunc', 'lineSetWidthFunc', 'lineSetX1Func','lineSetX2Func', 'lineSetXLocFunc', 'lineSetXY1Func', 'lineSetXY2Func', 'lineSetY1Func','lineSetY2Func', 'lineFillFunc', 'lineFillDeleteFunc', 'lineFillGetLine1Func','lineFillGetLine2Func', 'lineFillNewFunc', 'lineFillSetColFunc']:
-            return self._handle_line_operation(node['name'], args)
 
-        # log Functions
-        elif node['name'] in ['logErrorFunc','logInfoFunc', 'logWarningFunc']:
-            return self._handle_log_operation(node['name'], args)
+# name -> Builtin, filled in at import by the @builtin decorators below
+BUILTINS: Dict[str, Builtin] = {}
 
-        # map Functions
-        elif node['name'] in ['mapClearFunc', 'mapContainsFunc', 'mapCopyFunc','mapGetFunc', 'mapKeysFunc', 'mapNewTypeFunc','mapPutFunc', 'mapPutAllFunc','mapRemoveFunc', 'mapSizeFunc', 'mapValuesFunc']:
-            return self._handle_map_operation(node['name'], args)
+def builtin(*names):
+    """Register a builtin implementation under its DevScript name(s); the first definition of a name wins"""
+    def register(func):
+        for name in names:
+            BUILTINS.setdefault(name, Builtin(name, func))
+        return func
+    return register
 
-        # Math Functions
-        elif node['name'] in ['mathAbsFunc', 'mathAcosFunc','mathAsinFunc', 'mathAtanFunc', 'mathAvgFunc', 'mathCeilFunc','mathCosFunc','mathExpFunc', 'mathFloorFunc', 'mathLogFunc', 'mathLog10Func', 'mathMaxFunc','mathMinFunc', 'mathPowFunc', 'mathRandomFunc', 'mathRoundFunc', 'mathRoundToMinTickFunc','mathSignFunc', 'mathSinFunc', 'mathSqrtFunc', 'mathSumFunc', 'mathTanFunc','mathToDegreesFunc', 'mathToRadiansFunc']:
-            return self._handle_math_operation(node['name'], args)
-
-        # Matrix Functions
-        elif node['name'] in ['matrixAddColFunc', 'matrixAddRowFunc','matrixAvgFunc', 'matrixColFunc', 'matrixColumnsFunc', 'matrixConcatFunc', 'matrixCopyFunc','matrixDetFunc', 'matrixDiffFunc', 'matrixEigenValuesFunc', 'matrixEigenVectorsFunc','matrixElementsCountFunc', 'matrixFillFunc', 'matrixGetFunc', 'matrixInvFunc','matrixIsAntiDiagonalFunc', 'matrixIsAntiSymmetricFunc', 'matrixIsBinaryFunc','matrixIsDiagonalFunc','matrixIsIdentityFunc', 'matrixIsSquareFunc', 'matrixIsStochasticFunc','matrixIsSymmetricFunc','matrixIsTriangularFunc', 'matrixIsZeroFunc', 'matrixKronFunc','matrixMaxFunc', 'matrixMedianFunc','matrixMinFunc', 'matrixModeFunc', 'matrixMultFunc','matrixNewTypeFunc', 'matrixPinvFunc', 'matrixPowFunc','matrixRankFunc', 'matrixRemoveColFunc','matrixRemoveRowFunc', 'matrixReshapeFunc', 'matrixReverseFunc','matrixRowFunc','matrixRowsFunc', 'matrixSetFunc', 'matrixSortFunc', 'matrixSubMatrixFunc', 'matrixSumFunc','matrixSwapColumnsFunc', 'matrixSwapRowsFunc', 'matrixTraceFunc', 'matrixTransposeFunc']:
-            return self._handle_matrix_operation(node['name'], args)
-
-        # str Functions
-        elif node['name'] in ['strContainsFunc', 'strEndsWithFunc', 'strFormatFunc', 'strFormatTimeFunc','strLengthFunc', 'strLowerFunc', 'strMatchFunc', 'strPosFunc', 'strRepeatFunc','strReplaceFunc', 'strReplaceAllFunc', 'strSplitFunc', 'strStartsWithFunc', 'strSubstringFunc','strToNumberFunc', 'strToStringFunc', 'strTrimFunc', 'strUpperFunc']:
-            return self._handle_str_operation(node['name'], args)
-
-        # ta Functions
-        elif node['name'] in ['taAlmaFunc', 'taAtrFunc', 'taBarsSinceFunc', 'taBbFunc', 'taBbwFunc', 'taCciFunc', 'taChangeFunc', 'taCmoFunc', 'taCogFunc', 'taCorrelationFunc', 'taCrossFunc', 'taCrossoverFunc', 'taCrossunderFunc', 'taCumFunc', 'taDevFunc', 'taDmiFunc', 'taEmaFunc', 'taFallingFunc', 'taHighestFunc', 'taHighestBarsFunc', 'taHmaFunc', 'taKcFunc', 'taKcwFunc', 'taLinRegFunc', 'taLowestFunc', 'taLowestBarsFunc', 'taMacdFunc', 'taMaxFunc', 'taMedianFunc', 'taMfiFunc', 'taMinFunc', 'taModeFunc', 'taMomFunc', 'taPercentileLinearInterpolationFunc', 'taPercentileNearestRankFunc', 'taPercentRankFunc', 'taPivotPointLevelsFunc', 'taPivotHighFunc', 'taPivotLowFunc', 'taRangeFunc', 'taRisingFunc', 'taRmaFunc', 'taRocFunc', 'taRsiFunc', 'taSarFunc', 'taSmaFunc', 'taStdevFunc', 'taStochFunc', 'taSuperTrendFunc', 'taSwmaFunc', 'taTrFunc', 'taTsiFunc', 'taValueWhenFunc', 'taVarianceFunc', 'taVwapFunc', 'taVwmaFunc', 'taWmaFunc', 'taWprFunc']:
-            return self._handle_ta_operation(node['name'], args)
-
-        # table Functions
-        elif node['name'] in ['tableFunc', 'tableCellFunc', 'tableCellSetBgColFunc', 'tableCellSetHeightFunc', 'tableCellSetTextFunc', 'tableCellSetTextColFunc', 'tableCellSetTextFontFamilyFunc', 'tableCellSetTextHAlignFunc', 'tableCellSetTextSizeFunc', 'tableCellSetTextVAlignFunc', 'tableCellSetToolTipFunc', 'tableCellSetWidthFunc', 'tableClearFunc', 'tableDeleteFunc', 'tableMergeCellsFunc', 'tableNewFunc', 'tableSetBgColFunc', 'tableSetBorderColFunc', 'tableSetBorderWidthFunc', 'tableSetFrameColFunc', 'tableSetFrameWidthFunc', 'tableSetPositionFunc']:
-            return self._handle_table_operation(node['name'], args)
+def _evaluate_builtin_function(self, node):
+        args = [self._evaluate(arg) for arg in node['arguments']]
+        # callables were bound to this evaluator once, in __init__
+        builtin = self.builtins.get(node['name'])
+        if builtin is None:
+            return None
+        if builtin.func.__func__ is _handle_ta_operation:
+            return builtin.func(node['name'], args, call_site=node.get('call_site'))
+        return builtin.func(node['name'], args)
 
 
-        # ticker Functions
-        elif node['name'] in [ 'tickerHeikinAshiFunc', 'tickerInheritFunc', 'tickerKagiFunc', 'tickerLineBreakFunc', 'tickerModifyFunc', 'tickerNewFunc', 'tickerPointFigureFunc', 'tickerRenkoFunc', 'tickerStandardFunc']:
-            return self._handle_ticker_operation(node['name'], args)
-        
+@builtin('sma')
+def _builtin_sma(self, operation_name, args):
+    return sum(args[0][-args[1]:]) / args[1]
 
-        # utility Functions
-        elif node['name'] in ['fillFunc', 'fixNanFunc', 'floatFunc', 'hLineFunc', 'indicatorFunc', 'intFunc', 'libraryFunc', 'maxBarsBackFunc', 'naFunc', 'nzFunc', 'polylineDeleteFunc', 'polylineNewFunc', 'runtimeErrorFunc', 'stringFunc', 'symInfoPrefixFunc', 'symInfoTickerFunc']:
-            return self._handle_utility_operation(node['name'], args)
-
-
-
-        # Strategy Functions
-        elif node['name'] in ['strategyFunc','strategyCancelFunc', 'strategyCancelAllFunc', 'strategyCloseFunc', 'strategyCloseAllFunc','strategyClosedTradesCommissionFunc', 'strategyClosedTradesEntryBarIndexFunc','strategyClosedTradesEntryCommentFunc', 'strategyClosedTradesEntryIdFunc','strategyClosedTradesEntryPriceFunc','strategyClosedTradesEntryTimeFunc','strategyClosedTradesExitBarIndexFunc', 'strategyClosedTradesExitCommentFunc','strategyClosedTradesExitIdFunc', 'strategyClosedTradesExitPriceFunc','strategyClosedTradesExitTimeFunc','strategyClosedTradesMaxDrawdownFunc','strategyClosedTradesMaxDrawdownPercentFunc', 'strategyClosedTradesMaxRunupFunc','strategyClosedTradesMaxRunupPercentFunc', 'strategyClosedTradesProfitFunc','strategyClosedTradesProfitPercentFunc','strategyClosedTradesSizeFunc','strategyConver,ToAccountFunc', 'strategyConvertToSymbolFunc', 'strategyDefaultEntryQtyFunc','strategyEntryFunc', 'strategyExitFunc', 'strategyOpenTradesCommissionFunc','strategyOpenTradesEntryBarIndexFunc','strategyOpenTradesEntryCommentFunc','strategyOpenTradesEntryIdFunc', 'strategyOpenTradesEntryPriceFunc','strategyOpenTradesEntryTimeFunc', 'strategyOpenTradesMaxDrawdownFunc','strategyOpenTradesMaxDrawdownPercentFunc','strategyOpenTradesMaxRunupFunc','strategyOpenTradesMaxRunupPercentFunc', 'strategyOpenTradesProfitFunc','strategyOpenTradesProfitPercentFunc', 'strategyOpenTradesSizeFunc', 'strategyOrderFunc','strategyRiskAllowEntryInFunc','strategyRiskMaxConsLossDaysFunc', 'strategyRiskMaxDrawdownFunc','strategyRiskMaxIntradayFilledOrdersFunc','strategyRiskMaxIntradayLossFunc','strategyRiskMaxPositionSizeFunc']:
-            return self._handle_strategy_operation(node['name'], args)
-
-        # Time Functions
-        elif node['name'] in ['symInfoPrefixFunc', 'symInfoTickerFunc', 'timeFunc','timeCloseFunc', 'timeframeChangeFunc','timeframeFromSecondsFunc', 'timeframeInSecondsFunc','timestampFunc', 'weekOfYearFunc', 'yearFunc']:
-            return self._handle_time_operation(node['name'], args)
-
-        # Original functions remain unchanged
-        elif node['name'] == 'sma':
-            return sum(args[0][-args[1]:]) / args[1]
-        elif node['name'] == 'ema':
-            k = 2 / (args[1] + 1)
-            ema = args[0][0]
-            for price in args[0][1:]:
-                ema = price * k + ema * (1 - k)
-            return ema
-        elif node['name'] == 'rsi':
-            gains = [args[0][i] - args[0][i - 1] for i in range(1, len(args[0])) if args[0][i] > args[0][i - 1]]
-            losses = [-args[0][i] + args[0][i - 1] for i in range(1, len(args[0])) if args[0][i] < args[0][i - 1]]
-            avg_gain = sum(gains) / args[1]
-            avg_loss = sum(losses) / args[1]
-            rs = avg_gain / avg_loss if avg_loss != 0 else 0
-            return 100 - (100 / (1 + rs))
+@builtin('ema')
+def _builtin_ema(self, operation_name, args):
+    k = 2 / (args[1] + 1)
+    ema = args[0][0]
+    for price in args[0][1:]:
+        ema = price * k + ema * (1 - k)
+    return ema
 
-        return None
+@builtin('rsi')
+def _builtin_rsi(self, operation_name, args):
+    gains = [args[0][i] - args[0][i - 1] for i in range(1, len(args[0])) if args[0][i] > args[0][i - 1]]
+    losses = [-args[0][i] + args[0][i - 1] for i in range(1, len(args[0])) if args[0][i] < args[0][i - 1]]
+    avg_gain = sum(gains) / args[1]
+    avg_loss = sum(losses) / args[1]
+    rs = avg_gain / avg_loss if avg_loss != 0 else 0
+    return 100 - (100 / (1 + rs))
 
 
 def _calculate_strategy_metrics(self):
@@ -2125,16 +2093,15 @@ def _calculate_strategy_metrics(self):
     trades = self.trades  # Assuming we have a trades list
     
     if trades:
-        profits = [t['profit'] for t in trades if t['profit'] > 0]
-        losses = [t['profit'] for t in trades if t['profit'] < 0]
+        metrics = _trade_metrics(self)
         
         self.environment.update({
-            'strategyAvgTrade': sum(t['profit'] for t in trades) / len(trades),
-            'strategyAvgWinningTrade': sum(profits) / len(profits) if profits else 0,
-            'strategyAvgLosingTrade': sum(losses) / len(losses) if losses else 0,
-            'strategyNetProfit': sum(t['profit'] for t in trades),
-            'strategyWinTrades': len(profits),
-            'strategyLossTrades': len(losses)
+            'strategyAvgTrade': metrics.avg_trade,
+            'strategyAvgWinningTrade': metrics.avg_winning_trade,
+            'strategyAvgLosingTrade': metrics.avg_losing_trade,
+            'strategyNetProfit': metrics.net_profit,
+            'strategyWinTrades': metrics.wins,
+            'strategyLossTrades': metrics.losses
         })
 
 def _calculate_price_aggregates(self):
@@ -2275,24 +2242,29 @@ def _calculate_technical_indicators(self):
             'taIII': (2 * close[-1] - high[-1] - low[-1]) / (high[-1] - low[-1]) * volume[-1]
         })
 
+def _trade_metrics(self):
+    """Running trade statistics, fed only the trades closed since the previous bar"""
+    metrics = getattr(self, 'trade_metrics', None)
+    if metrics is None:
+        metrics = self.trade_metrics = OnlineMetrics()
+    return metrics.sync_trades(self.trades, pnl_key='profit')
+
 def _calculate_strategy_metrics(self):
     """Strategy metrics calculations"""
     if self.trades:
-        trades_array = np.array([t['profit'] for t in self.trades])
-        winning_trades = trades_array[trades_array > 0]
-        losing_trades = trades_array[trades_array < 0]
+        metrics = _trade_metrics(self)
         
         initial_capital = self.environment['strategyInitialCapital']
-        current_equity = initial_capital + trades_array.sum()
+        current_equity = initial_capital + metrics.net_profit
         
         self.environment.update({
-            'strategyNetProfit': trades_array.sum(),
-            'strategyNetProfitPercent': (trades_array.sum() / initial_capital) * 100,
-            'strategyAvgTrade': trades_array.mean(),
-            'strategyAvgWinningTrade': winning_trades.mean() if len(winning_trades) > 0 else 0,
-            'strategyAvgLosingTrade': losing_trades.mean() if len(losing_trades) > 0 else 0,
-            'strategyWinTrades': len(winning_trades),
-            'strategyLossTrades': len(losing_trades),
+            'strategyNetProfit': metrics.net_profit,
+            'strategyNetProfitPercent': (metrics.net_profit / initial_capital) * 100,
+            'strategyAvgTrade': metrics.avg_trade,
+            'strategyAvgWinningTrade': metrics.avg_winning_trade,
+            'strategyAvgLosingTrade': metrics.avg_losing_trade,
+            'strategyWinTrades': metrics.wins,
+            'strategyLossTrades': metrics.losses,
             'strategyEquity': current_equity
         })
 
@@ -3004,1737 +2976,2012 @@ def _handle_keyword_operation(self, operation, args):
 
 
 #Array
-def _handle_array_operation(self, operation_name, args):
-    if operation_name == 'arrAbs':
-        return [abs(x) for x in args[0]]
-    
-    elif operation_name == 'arrAvg':
-        return sum(args[0]) / len(args[0]) if args[0] else 0
-    
-    elif operation_name == 'arrBinarySearch':
-        target = args[1]
-        left, right = 0, len(args[0]) - 1
-        while left <= right:
-            mid = (left + right) // 2
-            if args[0][mid] == target:
-                return mid
-            elif args[0][mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
+@builtin('arrAbs')
+def _array_arrAbs(self, operation_name, args):
+    return [abs(x) for x in args[0]]
+
+@builtin('arrAvg')
+def _array_arrAvg(self, operation_name, args):
+    return sum(args[0]) / len(args[0]) if args[0] else 0
+
+@builtin('arrBinarySearch')
+def _array_arrBinarySearch(self, operation_name, args):
+    target = args[1]
+    left, right = 0, len(args[0]) - 1
+    while left <= right:
+        mid = (left + right) // 2
+        if args[0][mid] == target:
+            return mid
+        elif args[0][mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1
+
+@builtin('arrBinarySearchLeftmost')
+def _array_arrBinarySearchLeftmost(self, operation_name, args):
+    target = args[1]
+    left, right = 0, len(args[0]) - 1
+    result = -1
+    while left <= right:
+        mid = (left + right) // 2
+        if args[0][mid] == target:
+            result = mid
+            right = mid - 1
+        elif args[0][mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return result
+
+@builtin('arrBinarySearchRightmost')
+def _array_arrBinarySearchRightmost(self, operation_name, args):
+    target = args[1]
+    left, right = 0, len(args[0]) - 1
+    result = -1
+    while left <= right:
+        mid = (left + right) // 2
+        if args[0][mid] == target:
+            result = mid
+            left = mid + 1
+        elif args[0][mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return result
+
+@builtin('arrClear')
+def _array_arrClear(self, operation_name, args):
+    args[0].clear()
+    return args[0]
+
+@builtin('arrConcat')
+def _array_arrConcat(self, operation_name, args):
+    return args[0] + args[1]
+
+@builtin('arrCopy')
+def _array_arrCopy(self, operation_name, args):
+    return args[0].copy()
+
+@builtin('arrCovariance')
+def _array_arrCovariance(self, operation_name, args):
+    if len(args[0]) != len(args[1]) or len(args[0]) == 0:
+        return 0
+    mean_x = sum(args[0]) / len(args[0])
+    mean_y = sum(args[1]) / len(args[1])
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(args[0], args[1])) / len(args[0])
+
+@builtin('arrEvery')
+def _array_arrEvery(self, operation_name, args):
+    return all(args[0])
+
+@builtin('arrFill')
+def _array_arrFill(self, operation_name, args):
+    return [args[1]] * args[0]
+
+@builtin('arrFirst')
+def _array_arrFirst(self, operation_name, args):
+    return args[0][0] if args[0] else None
+
+@builtin('arrFrom')
+def _array_arrFrom(self, operation_name, args):
+    return list(args[0])
+
+@builtin('arrGet')
+def _array_arrGet(self, operation_name, args):
+    return args[0][args[1]] if 0 <= args[1] < len(args[0]) else None
+
+@builtin('arrIncludes')
+def _array_arrIncludes(self, operation_name, args):
+    return args[1] in args[0]
+
+@builtin('arrIndexOf')
+def _array_arrIndexOf(self, operation_name, args):
+    try:
+        return args[0].index(args[1])
+    except ValueError:
         return -1
-    
-    elif operation_name == 'arrBinarySearchLeftmost':
-        target = args[1]
-        left, right = 0, len(args[0]) - 1
-        result = -1
-        while left <= right:
-            mid = (left + right) // 2
-            if args[0][mid] == target:
-                result = mid
-                right = mid - 1
-            elif args[0][mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
-        return result
-    
-    elif operation_name == 'arrBinarySearchRightmost':
-        target = args[1]
-        left, right = 0, len(args[0]) - 1
-        result = -1
-        while left <= right:
-            mid = (left + right) // 2
-            if args[0][mid] == target:
-                result = mid
-                left = mid + 1
-            elif args[0][mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
-        return result
 
-    elif operation_name == 'arrClear':
-        args[0].clear()
-        return args[0]
-    
-    elif operation_name == 'arrConcat':
-        return args[0] + args[1]
-    
-    elif operation_name == 'arrCopy':
-        return args[0].copy()
-    
-    elif operation_name == 'arrCovariance':
-        if len(args[0]) != len(args[1]) or len(args[0]) == 0:
-            return 0
-        mean_x = sum(args[0]) / len(args[0])
-        mean_y = sum(args[1]) / len(args[1])
-        return sum((x - mean_x) * (y - mean_y) for x, y in zip(args[0], args[1])) / len(args[0])
-    
-    elif operation_name == 'arrEvery':
-        return all(args[0])
-    
-    elif operation_name == 'arrFill':
-        return [args[1]] * args[0]
-    
-    elif operation_name == 'arrFirst':
-        return args[0][0] if args[0] else None
-    
-    elif operation_name == 'arrFrom':
-        return list(args[0])
-    
-    elif operation_name == 'arrGet':
-        return args[0][args[1]] if 0 <= args[1] < len(args[0]) else None
-    
-    elif operation_name == 'arrIncludes':
-        return args[1] in args[0]
-    
-    elif operation_name == 'arrIndexOf':
-        try:
-            return args[0].index(args[1])
-        except ValueError:
-            return -1
-    
-    elif operation_name == 'arrInsert':
-        args[0].insert(args[1], args[2])
-        return args[0]
-    
-    elif operation_name == 'arrJoin':
-        return args[1].join(map(str, args[0]))
-    
-    elif operation_name == 'arrLast':
-        return args[0][-1] if args[0] else None
-    
-    elif operation_name == 'arrLastIndexOf':
-        return len(args[0]) - 1 - args[0][::-1].index(args[1]) if args[1] in args[0] else -1
-    
-    elif operation_name == 'arrMax':
-        return max(args[0]) if args[0] else None
-    
-    elif operation_name == 'arrMedian':
-        sorted_arr = sorted(args[0])
-        n = len(sorted_arr)
-        if n % 2 == 0:
-            return (sorted_arr[n//2 - 1] + sorted_arr[n//2]) / 2
-        return sorted_arr[n//2]
-    
-    elif operation_name == 'arrMin':
-        return min(args[0]) if args[0] else None
-    
-    elif operation_name == 'arrMode':
-        from collections import Counter
-        return Counter(args[0]).most_common(1)[0][0] if args[0] else None
-
-    elif operation_name == 'arrPercentileLinearInterpolation':
-        sorted_arr = sorted(args[0])
-        p = args[1]
-        n = len(sorted_arr)
-        r = p * (n - 1) / 100
-        i = int(r)
-        f = r - i
-        return sorted_arr[i] + f * (sorted_arr[i + 1] - sorted_arr[i]) if i + 1 < n else sorted_arr[i]
-
-    elif operation_name == 'arrPercentileNearestRank':
-        sorted_arr = sorted(args[0])
-        p = args[1]
-        n = len(sorted_arr)
-        r = int(round(p * (n - 1) / 100))
-        return sorted_arr[r]
-
-    elif operation_name == 'arrPercentRank':
-        value = args[1]
-        arr = sorted(args[0])
-        return sum(1 for x in arr if x < value) * 100 / len(arr)
-
-    elif operation_name == 'arrPop':
-        return args[0].pop() if args[0] else None
-
-    elif operation_name == 'arrPush':
-        args[0].append(args[1])
-        return len(args[0])
-
-    elif operation_name == 'arrRange':
-        return list(range(args[0], args[1], args[2] if len(args) > 2 else 1))
-
-    elif operation_name == 'arrRemove':
-        del args[0][args[1]]
-        return args[0]
+@builtin('arrInsert')
+def _array_arrInsert(self, operation_name, args):
+    args[0].insert(args[1], args[2])
+    return args[0]
+
+@builtin('arrJoin')
+def _array_arrJoin(self, operation_name, args):
+    return args[1].join(map(str, args[0]))
+
+@builtin('arrLast')
+def _array_arrLast(self, operation_name, args):
+    return args[0][-1] if args[0] else None
+
+@builtin('arrLastIndexOf')
+def _array_arrLastIndexOf(self, operation_name, args):
+    return len(args[0]) - 1 - args[0][::-1].index(args[1]) if args[1] in args[0] else -1
+
+@builtin('arrMax')
+def _array_arrMax(self, operation_name, args):
+    return max(args[0]) if args[0] else None
+
+@builtin('arrMedian')
+def _array_arrMedian(self, operation_name, args):
+    sorted_arr = sorted(args[0])
+    n = len(sorted_arr)
+    if n % 2 == 0:
+        return (sorted_arr[n//2 - 1] + sorted_arr[n//2]) / 2
+    return sorted_arr[n//2]
+
+@builtin('arrMin')
+def _array_arrMin(self, operation_name, args):
+    return min(args[0]) if args[0] else None
+
+@builtin('arrMode')
+def _array_arrMode(self, operation_name, args):
+    from collections import Counter
+    return Counter(args[0]).most_common(1)[0][0] if args[0] else None
+
+@builtin('arrPercentileLinearInterpolation')
+def _array_arrPercentileLinearInterpolation(self, operation_name, args):
+    sorted_arr = sorted(args[0])
+    p = args[1]
+    n = len(sorted_arr)
+    r = p * (n - 1) / 100
+    i = int(r)
+    f = r - i
+    return sorted_arr[i] + f * (sorted_arr[i + 1] - sorted_arr[i]) if i + 1 < n else sorted_arr[i]
+
+@builtin('arrPercentileNearestRank')
+def _array_arrPercentileNearestRank(self, operation_name, args):
+    sorted_arr = sorted(args[0])
+    p = args[1]
+    n = len(sorted_arr)
+    r = int(round(p * (n - 1) / 100))
+    return sorted_arr[r]
+
+@builtin('arrPercentRank')
+def _array_arrPercentRank(self, operation_name, args):
+    value = args[1]
+    arr = sorted(args[0])
+    return sum(1 for x in arr if x < value) * 100 / len(arr)
+
+@builtin('arrPop')
+def _array_arrPop(self, operation_name, args):
+    return args[0].pop() if args[0] else None
+
+@builtin('arrPush')
+def _array_arrPush(self, operation_name, args):
+    args[0].append(args[1])
+    return len(args[0])
+
+@builtin('arrRange')
+def _array_arrRange(self, operation_name, args):
+    return list(range(args[0], args[1], args[2] if len(args) > 2 else 1))
+
+@builtin('arrRemove')
+def _array_arrRemove(self, operation_name, args):
+    del args[0][args[1]]
+    return args[0]
+
+@builtin('arrReverse')
+def _array_arrReverse(self, operation_name, args):
+    return args[0][::-1]
+
+@builtin('arrSet')
+def _array_arrSet(self, operation_name, args):
+    args[0][args[1]] = args[2]
+    return args[0]
+
+@builtin('arrShift')
+def _array_arrShift(self, operation_name, args):
+    return args[0].pop(0) if args[0] else None
+
+@builtin('arrSize')
+def _array_arrSize(self, operation_name, args):
+    return len(args[0])
+
+@builtin('arrSlice')
+def _array_arrSlice(self, operation_name, args):
+    start = args[1]
+    end = args[2] if len(args) > 2 else None
+    return args[0][start:end]
+
+@builtin('arrSome')
+def _array_arrSome(self, operation_name, args):
+    return any(args[0])
+
+@builtin('arrSort')
+def _array_arrSort(self, operation_name, args):
+    return sorted(args[0], reverse=args[1] if len(args) > 1 else False)
+
+@builtin('arrSortIndices')
+def _array_arrSortIndices(self, operation_name, args):
+    return sorted(range(len(args[0])), key=lambda k: args[0][k], reverse=args[1] if len(args) > 1 else False)
+
+@builtin('arrStandardize')
+def _array_arrStandardize(self, operation_name, args):
+    mean = sum(args[0]) / len(args[0])
+    std = (sum((x - mean) ** 2 for x in args[0]) / len(args[0])) ** 0.5
+    return [(x - mean) / std for x in args[0]] if std != 0 else [0] * len(args[0])
+
+@builtin('arrStdev')
+def _array_arrStdev(self, operation_name, args):
+    mean = sum(args[0]) / len(args[0])
+    return (sum((x - mean) ** 2 for x in args[0]) / len(args[0])) ** 0.5
+
+@builtin('arrSum')
+def _array_arrSum(self, operation_name, args):
+    return sum(args[0])
+
+@builtin('arrUnshift')
+def _array_arrUnshift(self, operation_name, args):
+    args[0].insert(0, args[1])
+    return len(args[0])
+
+@builtin('arrVariance')
+def _array_arrVariance(self, operation_name, args):
+    mean = sum(args[0]) / len(args[0])
+    return sum((x - mean) ** 2 for x in args[0]) / len(args[0])
+
+
+def _new_array(args, convert, default):
+    size = args[0]
+    initial_value = args[1] if len(args) > 1 else None
+    return [convert(initial_value)] * size if initial_value is not None else [default] * size
+
+@builtin('arrNewBool')
+def _array_arrNewBool(self, operation_name, args):
+    return _new_array(args, bool, False)
+
+@builtin('arrNewFloat')
+def _array_arrNewFloat(self, operation_name, args):
+    return _new_array(args, float, 0.0)
 
-    elif operation_name == 'arrReverse':
-        return args[0][::-1]
+@builtin('arrNewInt')
+def _array_arrNewInt(self, operation_name, args):
+    return _new_array(args, int, 0)
 
-    elif operation_name == 'arrSet':
-        args[0][args[1]] = args[2]
-        return args[0]
+@builtin('arrNewString')
+def _array_arrNewString(self, operation_name, args):
+    return _new_array(args, str, '')
 
-    elif operation_name == 'arrShift':
-        return args[0].pop(0) if args[0] else None
+@builtin('arrNewBox')
+def _array_arrNewBox(self, operation_name, args):
+    return [None] * args[0]
 
-    elif operation_name == 'arrSize':
-        return len(args[0])
+@builtin('arrNewType')
+def _array_arrNewType(self, operation_name, args):
+    return [{}] * args[0]
 
-    elif operation_name == 'arrSlice':
-        start = args[1]
-        end = args[2] if len(args) > 2 else None
-        return args[0][start:end]
 
-    elif operation_name == 'arrSome':
-        return any(args[0])
 
-    elif operation_name == 'arrSort':
-        return sorted(args[0], reverse=args[1] if len(args) > 1 else False)
 
-    elif operation_name == 'arrSortIndices':
-        return sorted(range(len(args[0])), key=lambda k: args[0][k], reverse=args[1] if len(args) > 1 else False)
+#box
+@builtin('boxFunc')
+def _box_boxFunc(self, operation_name, args):
+    return {
+        'left': args[0],
+        'top': args[1],
+        'right': args[2],
+        'bottom': args[3],
+        'border_color': args[4] if len(args) > 4 else None,
+        'bg_color': args[5] if len(args) > 5 else None
+    }
 
-    elif operation_name == 'arrStandardize':
-        mean = sum(args[0]) / len(args[0])
-        std = (sum((x - mean) ** 2 for x in args[0]) / len(args[0])) ** 0.5
-        return [(x - mean) / std for x in args[0]] if std != 0 else [0] * len(args[0])
+@builtin('boxCopyFunc')
+def _box_boxCopyFunc(self, operation_name, args):
+    return dict(args[0])
 
-    elif operation_name == 'arrStdev':
-        mean = sum(args[0]) / len(args[0])
-        return (sum((x - mean) ** 2 for x in args[0]) / len(args[0])) ** 0.5
+@builtin('boxDeleteFunc')
+def _box_boxDeleteFunc(self, operation_name, args):
+    return None
 
-    elif operation_name == 'arrSum':
-        return sum(args[0])
+@builtin('boxGetBottomFunc')
+def _box_boxGetBottomFunc(self, operation_name, args):
+    return args[0]['bottom']
 
-    elif operation_name == 'arrUnshift':
-        args[0].insert(0, args[1])
-        return len(args[0])
+@builtin('boxGetLeftFunc')
+def _box_boxGetLeftFunc(self, operation_name, args):
+    return args[0]['left']
 
-    elif operation_name == 'arrVariance':
-        mean = sum(args[0]) / len(args[0])
-        return sum((x - mean) ** 2 for x in args[0]) / len(args[0])
+@builtin('boxGetRightFunc')
+def _box_boxGetRightFunc(self, operation_name, args):
+    return args[0]['right']
 
-    elif operation_name.startswith('arrNew'):
-        size = args[0]
-        initial_value = args[1] if len(args) > 1 else None
-        
-        if operation_name == 'arrNewBool':
-            return [bool(initial_value)] * size if initial_value is not None else [False] * size
-        elif operation_name == 'arrNewFloat':
-            return [float(initial_value)] * size if initial_value is not None else [0.0] * size
-        elif operation_name == 'arrNewInt':
-            return [int(initial_value)] * size if initial_value is not None else [0] * size
-        elif operation_name == 'arrNewString':
-            return [str(initial_value)] * size if initial_value is not None else [''] * size
-        elif operation_name in ['arrNewBox', 'arrayNewCol', 'arrayNewLabel', 'arrayNewLine', 'arrayNewTable']:
-            return [None] * size
-        elif operation_name == 'arrNewType':
-            return [{}] * size
+@builtin('boxGetTopFunc')
+def _box_boxGetTopFunc(self, operation_name, args):
+    return args[0]['top']
 
-    return None
+@builtin('boxNewFunc')
+def _box_boxNewFunc(self, operation_name, args):
+    return {
+        'left': 0,
+        'top': 0,
+        'right': 0,
+        'bottom': 0,
+        'border_color': None,
+        'bg_color': None,
+        'text': '',
+        'text_color': None,
+        'border_width': 1,
+        'border_style': 'solid',
+        'text_halign': 'center',
+        'text_valign': 'middle',
+        'text_font_family': 'Arial',
+        'text_size': 12,
+        'extend': False
+    }
 
+@builtin('boxSetBgColFunc')
+def _box_boxSetBgColFunc(self, operation_name, args):
+    args[0]['bg_color'] = args[1]
+    return args[0]
+
+@builtin('boxSetBorderColFunc')
+def _box_boxSetBorderColFunc(self, operation_name, args):
+    args[0]['border_color'] = args[1]
+    return args[0]
+
+@builtin('boxSetBorderStyleFunc')
+def _box_boxSetBorderStyleFunc(self, operation_name, args):
+    args[0]['border_style'] = args[1]
+    return args[0]
+
+@builtin('boxSetBorderWidthFunc')
+def _box_boxSetBorderWidthFunc(self, operation_name, args):
+    args[0]['border_width'] = args[1]
+    return args[0]
+
+@builtin('boxSetBottomFunc')
+def _box_boxSetBottomFunc(self, operation_name, args):
+    args[0]['bottom'] = args[1]
+    return args[0]
+
+@builtin('boxSetBottomRightPointFunc')
+def _box_boxSetBottomRightPointFunc(self, operation_name, args):
+    args[0]['bottom'] = args[1]
+    args[0]['right'] = args[2]
+    return args[0]
+
+@builtin('boxSetExtendFunc')
+def _box_boxSetExtendFunc(self, operation_name, args):
+    args[0]['extend'] = args[1]
+    return args[0]
+
+@builtin('boxSetLeftFunc')
+def _box_boxSetLeftFunc(self, operation_name, args):
+    args[0]['left'] = args[1]
+    return args[0]
+
+@builtin('boxSetLeftTopFunc')
+def _box_boxSetLeftTopFunc(self, operation_name, args):
+    args[0]['left'] = args[1]
+    args[0]['top'] = args[2]
+    return args[0]
+
+@builtin('boxSetTextFunc')
+def _box_boxSetTextFunc(self, operation_name, args):
+    args[0]['text'] = args[1]
+    return args[0]
+
+@builtin('boxSetTextColFunc')
+def _box_boxSetTextColFunc(self, operation_name, args):
+    args[0]['text_color'] = args[1]
+    return args[0]
+
+@builtin('boxSetTextFontFamilyFunc')
+def _box_boxSetTextFontFamilyFunc(self, operation_name, args):
+    args[0]['text_font_family'] = args[1]
+    return args[0]
+
+@builtin('boxSetTextHAlignFunc')
+def _box_boxSetTextHAlignFunc(self, operation_name, args):
+    args[0]['text_halign'] = args[1]
+    return args[0]
+
+@builtin('boxSetTextSizeFunc')
+def _box_boxSetTextSizeFunc(self, operation_name, args):
+    args[0]['text_size'] = args[1]
+    return args[0]
+
+@builtin('boxSetTextVAlignFunc')
+def _box_boxSetTextVAlignFunc(self, operation_name, args):
+    args[0]['text_valign'] = args[1]
+    return args[0]
+
+@builtin('boxSetTextWrapFunc')
+def _box_boxSetTextWrapFunc(self, operation_name, args):
+    args[0]['text_wrap'] = args[1]
+    return args[0]
+
+@builtin('boxSetTopFunc')
+def _box_boxSetTopFunc(self, operation_name, args):
+    args[0]['top'] = args[1]
+    return args[0]
+
+@builtin('boxSetTopLeftPointFunc')
+def _box_boxSetTopLeftPointFunc(self, operation_name, args):
+    args[0]['top'] = args[1]
+    args[0]['left'] = args[2]
+    return args[0]
+
+@builtin('boxSetRightFunc')
+def _box_boxSetRightFunc(self, operation_name, args):
+    args[0]['right'] = args[1]
+    return args[0]
+
+@builtin('boxSetRightBottomFunc')
+def _box_boxSetRightBottomFunc(self, operation_name, args):
+    args[0]['right'] = args[1]
+    args[0]['bottom'] = args[2]
+    return args[0]
 
 
+#chart
+@builtin('chartPointCopyFunc')
+def _chart_chartPointCopyFunc(self, operation_name, args):
+    return dict(args[0])
 
-#box
-def _handle_box_operation(self, operation_name, args):
-    if operation_name == 'boxFunc':
-        return {
-            'left': args[0],
-            'top': args[1],
-            'right': args[2],
-            'bottom': args[3],
-            'border_color': args[4] if len(args) > 4 else None,
-            'bg_color': args[5] if len(args) > 5 else None
-        }
-    
-    elif operation_name == 'boxCopyFunc':
-        return dict(args[0])
-    
-    elif operation_name == 'boxDeleteFunc':
-        return None
-    
-    elif operation_name == 'boxGetBottomFunc':
-        return args[0]['bottom']
-    
-    elif operation_name == 'boxGetLeftFunc':
-        return args[0]['left']
-    
-    elif operation_name == 'boxGetRightFunc':
-        return args[0]['right']
-    
-    elif operation_name == 'boxGetTopFunc':
-        return args[0]['top']
-    
-    elif operation_name == 'boxNewFunc':
-        return {
-            'left': 0,
-            'top': 0,
-            'right': 0,
-            'bottom': 0,
-            'border_color': None,
-            'bg_color': None,
-            'text': '',
-            'text_color': None,
-            'border_width': 1,
-            'border_style': 'solid',
-            'text_halign': 'center',
-            'text_valign': 'middle',
-            'text_font_family': 'Arial',
-            'text_size': 12,
-            'extend': False
-        }
-    
-    elif operation_name == 'boxSetBgColFunc':
-        args[0]['bg_color'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetBorderColFunc':
-        args[0]['border_color'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetBorderStyleFunc':
-        args[0]['border_style'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetBorderWidthFunc':
-        args[0]['border_width'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetBottomFunc':
-        args[0]['bottom'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetBottomRightPointFunc':
-        args[0]['bottom'] = args[1]
-        args[0]['right'] = args[2]
-        return args[0]
-    
-    elif operation_name == 'boxSetExtendFunc':
-        args[0]['extend'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetLeftFunc':
-        args[0]['left'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetLeftTopFunc':
-        args[0]['left'] = args[1]
-        args[0]['top'] = args[2]
-        return args[0]
-    
-    elif operation_name == 'boxSetTextFunc':
-        args[0]['text'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTextColFunc':
-        args[0]['text_color'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTextFontFamilyFunc':
-        args[0]['text_font_family'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTextHAlignFunc':
-        args[0]['text_halign'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTextSizeFunc':
-        args[0]['text_size'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTextVAlignFunc':
-        args[0]['text_valign'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTextWrapFunc':
-        args[0]['text_wrap'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTopFunc':
-        args[0]['top'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetTopLeftPointFunc':
-        args[0]['top'] = args[1]
-        args[0]['left'] = args[2]
-        return args[0]
-
-    elif operation_name == 'boxSetRightFunc':
-        args[0]['right'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'boxSetRightBottomFunc':
-        args[0]['right'] = args[1]
-        args[0]['bottom'] = args[2]
-        return args[0]
+@builtin('chartPointFromIndexFunc')
+def _chart_chartPointFromIndexFunc(self, operation_name, args):
+    return {
+        'index': args[0],
+        'price': args[1],
+        'time': None,
+        'bar_index': args[0],
+        'offset': 0,
+        'plotchar': None,
+        'style': 'line',
+        'color': None,
+        'width': 1
+    }
 
-    elif operation_name == 'boxSetTextFunc':
-        args[0]['text'] = args[1]
-        return args[0]
+@builtin('chartPointFromTimeFunc')
+def _chart_chartPointFromTimeFunc(self, operation_name, args):
+    return {
+        'time': args[0],
+        'price': args[1],
+        'index': None,
+        'bar_index': None,
+        'offset': 0,
+        'plotchar': None,
+        'style': 'line',
+        'color': None,
+        'width': 1
+    }
 
-    elif operation_name == 'boxSetTextColFunc':
-        args[0]['text_color'] = args[1]
-        return args[0]
+@builtin('chartPointNewFunc')
+def _chart_chartPointNewFunc(self, operation_name, args):
+    return {
+        'time': None,
+        'price': None,
+        'index': None,
+        'bar_index': None,
+        'offset': 0,
+        'plotchar': None,
+        'style': 'line',
+        'color': None,
+        'width': 1
+    }
 
-    elif operation_name == 'boxSetTextFontFamilyFunc':
-        args[0]['text_font_family'] = args[1]
-        return args[0]
+@builtin('chartPointNowFunc')
+def _chart_chartPointNowFunc(self, operation_name, args):
+    import time
+    return {
+        'time': time.time(),
+        'price': args[0],
+        'index': None,
+        'bar_index': None,
+        'offset': 0,
+        'plotchar': None,
+        'style': 'line',
+        'color': None,
+        'width': 1
+    }
 
-    elif operation_name == 'boxSetTextHAlignFunc':
-        args[0]['text_halign'] = args[1]
-        return args[0]
+@builtin('chartPointSetOffsetFunc')
+def _chart_chartPointSetOffsetFunc(self, operation_name, args):
+    args[0]['offset'] = args[1]
+    return args[0]
 
-    elif operation_name == 'boxSetTextSizeFunc':
-        args[0]['text_size'] = args[1]
-        return args[0]
+@builtin('chartPointSetPlotCharFunc')
+def _chart_chartPointSetPlotCharFunc(self, operation_name, args):
+    args[0]['plotchar'] = args[1]
+    return args[0]
 
-    elif operation_name == 'boxSetTextVAlignFunc':
-        args[0]['text_valign'] = args[1]
-        return args[0]
+@builtin('chartPointSetStyleFunc')
+def _chart_chartPointSetStyleFunc(self, operation_name, args):
+    args[0]['style'] = args[1]
+    return args[0]
 
-    elif operation_name == 'boxSetTextWrapFunc':
-        args[0]['text_wrap'] = args[1]
-        return args[0]
+@builtin('chartPointSetColorFunc')
+def _chart_chartPointSetColorFunc(self, operation_name, args):
+    args[0]['color'] = args[1]
+    return args[0]
 
+@builtin('chartPointSetWidthFunc')
+def _chart_chartPointSetWidthFunc(self, operation_name, args):
+    args[0]['width'] = args[1]
+    return args[0]
 
-    return None
+@builtin('chartPointGetIndexFunc')
+def _chart_chartPointGetIndexFunc(self, operation_name, args):
+    return args[0]['index']
 
+@builtin('chartPointGetPriceFunc')
+def _chart_chartPointGetPriceFunc(self, operation_name, args):
+    return args[0]['price']
 
+@builtin('chartPointGetTimeFunc')
+def _chart_chartPointGetTimeFunc(self, operation_name, args):
+    return args[0]['time']
 
-#chart
-def _handle_chart_operation(self, operation_name, args):
-    if operation_name == 'chartPointCopyFunc':
-        return dict(args[0])
-    
-    elif operation_name == 'chartPointFromIndexFunc':
-        return {
-            'index': args[0],
-            'price': args[1],
-            'time': None,
-            'bar_index': args[0],
-            'offset': 0,
-            'plotchar': None,
-            'style': 'line',
-            'color': None,
-            'width': 1
-        }
-    
-    elif operation_name == 'chartPointFromTimeFunc':
-        return {
-            'time': args[0],
-            'price': args[1],
-            'index': None,
-            'bar_index': None,
-            'offset': 0,
-            'plotchar': None,
-            'style': 'line',
-            'color': None,
-            'width': 1
-        }
-    
-    elif operation_name == 'chartPointNewFunc':
-        return {
-            'time': None,
-            'price': None,
-            'index': None,
-            'bar_index': None,
-            'offset': 0,
-            'plotchar': None,
-            'style': 'line',
-            'color': None,
-            'width': 1
-        }
-    
-    elif operation_name == 'chartPointNowFunc':
-        import time
-        return {
-            'time': time.time(),
-            'price': args[0],
-            'index': None,
-            'bar_index': None,
-            'offset': 0,
-            'plotchar': None,
-            'style': 'line',
-            'color': None,
-            'width': 1
-        }
-    
-    elif operation_name == 'chartPointSetOffsetFunc':
-        args[0]['offset'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'chartPointSetPlotCharFunc':
-        args[0]['plotchar'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'chartPointSetStyleFunc':
-        args[0]['style'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'chartPointSetColorFunc':
-        args[0]['color'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'chartPointSetWidthFunc':
-        args[0]['width'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'chartPointGetIndexFunc':
-        return args[0]['index']
-    
-    elif operation_name == 'chartPointGetPriceFunc':
-        return args[0]['price']
-    
-    elif operation_name == 'chartPointGetTimeFunc':
-        return args[0]['time']
-    
-    elif operation_name == 'chartPointGetBarIndexFunc':
-        return args[0]['bar_index']
-    
-    elif operation_name == 'chartPointGetOffsetFunc':
-        return args[0]['offset']
-    
-    elif operation_name == 'chartPointGetStyleFunc':
-        return args[0]['style']
-    
-    elif operation_name == 'chartPointGetColorFunc':
-        return args[0]['color']
-    
-    elif operation_name == 'chartPointGetWidthFunc':
-        return args[0]['width']
+@builtin('chartPointGetBarIndexFunc')
+def _chart_chartPointGetBarIndexFunc(self, operation_name, args):
+    return args[0]['bar_index']
 
-    return None
+@builtin('chartPointGetOffsetFunc')
+def _chart_chartPointGetOffsetFunc(self, operation_name, args):
+    return args[0]['offset']
 
+@builtin('chartPointGetStyleFunc')
+def _chart_chartPointGetStyleFunc(self, operation_name, args):
+    return args[0]['style']
+
+@builtin('chartPointGetColorFunc')
+def _chart_chartPointGetColorFunc(self, operation_name, args):
+    return args[0]['color']
+
+@builtin('chartPointGetWidthFunc')
+def _chart_chartPointGetWidthFunc(self, operation_name, args):
+    return args[0]['width']
 
 
 #col
-def _handle_color_operation(self, operation_name, args):
-    if operation_name == 'colFunc':
-        return {'r': args[0], 'g': args[1], 'b': args[2], 't': args[3] if len(args) > 3 else 0}
-    
-    elif operation_name == 'colBFunc':
-        return args[0]['b']
-    
-    elif operation_name == 'colFromGradientFunc':
-        start_color = args[0]
-        end_color = args[1]
-        step = args[2]
-        return {
-            'r': start_color['r'] + (end_color['r'] - start_color['r']) * step,
-            'g': start_color['g'] + (end_color['g'] - start_color['g']) * step,
-            'b': start_color['b'] + (end_color['b'] - start_color['b']) * step,
-            't': start_color['t'] + (end_color['t'] - start_color['t']) * step
-        }
-    
-    elif operation_name == 'colGFunc':
-        return args[0]['g']
-    
-    elif operation_name == 'colNewFunc':
-        return {'r': 0, 'g': 0, 'b': 0, 't': 0}
-    
-    elif operation_name == 'colRFunc':
-        return args[0]['r']
-    
-    elif operation_name == 'colRgbFunc':
-        return {'r': args[0], 'g': args[1], 'b': args[2], 't': args[3] if len(args) > 3 else 0}
-    
-    elif operation_name == 'colTFunc':
-        return args[0]['t']
+@builtin('colFunc')
+def _color_colFunc(self, operation_name, args):
+    return {'r': args[0], 'g': args[1], 'b': args[2], 't': args[3] if len(args) > 3 else 0}
+
+@builtin('colBFunc')
+def _color_colBFunc(self, operation_name, args):
+    return args[0]['b']
+
+@builtin('colFromGradientFunc')
+def _color_colFromGradientFunc(self, operation_name, args):
+    start_color = args[0]
+    end_color = args[1]
+    step = args[2]
+    return {
+        'r': start_color['r'] + (end_color['r'] - start_color['r']) * step,
+        'g': start_color['g'] + (end_color['g'] - start_color['g']) * step,
+        'b': start_color['b'] + (end_color['b'] - start_color['b']) * step,
+        't': start_color['t'] + (end_color['t'] - start_color['t']) * step
+    }
+
+@builtin('colGFunc')
+def _color_colGFunc(self, operation_name, args):
+    return args[0]['g']
+
+@builtin('colNewFunc')
+def _color_colNewFunc(self, operation_name, args):
+    return {'r': 0, 'g': 0, 'b': 0, 't': 0}
+
+@builtin('colRFunc')
+def _color_colRFunc(self, operation_name, args):
+    return args[0]['r']
 
+@builtin('colRgbFunc')
+def _color_colRgbFunc(self, operation_name, args):
+    return {'r': args[0], 'g': args[1], 'b': args[2], 't': args[3] if len(args) > 3 else 0}
+
+@builtin('colTFunc')
+def _color_colTFunc(self, operation_name, args):
+    return args[0]['t']
 
 
 #input
-def _handle_input_operation(self, operation_name, args):
-    if operation_name == 'inputFunc':
-        return args[0]
-    
-    elif operation_name == 'inputBoolFunc':
-        return bool(args[0])
-    
-    elif operation_name == 'inputColFunc':
-        return args[0]
-    
-    elif operation_name == 'inputEnumFunc':
-        options = args[1]
-        default_index = args[2] if len(args) > 2 else 0
-        return options[default_index]
-    
-    elif operation_name == 'inputFloatFunc':
-        return float(args[0])
-    
-    elif operation_name == 'inputIntFunc':
-        return int(args[0])
-    
-    elif operation_name == 'inputPriceFunc':
-        return float(args[0])
-    
-    elif operation_name == 'inputSessionFunc':
-        return args[0]
-    
-    elif operation_name == 'inputSourceFunc':
-        return args[0]
-    
-    elif operation_name == 'inputStringFunc':
-        return str(args[0])
-    
-    elif operation_name == 'inputSymbolFunc':
-        return args[0]
-    
-    elif operation_name == 'inputTextAreaFunc':
-        return args[0]
-    
-    elif operation_name == 'inputTimeFunc':
-        return args[0]
-    
-    elif operation_name == 'inputTimeFrameFunc':
-        return args[0]
+@builtin('inputFunc')
+def _input_inputFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('inputBoolFunc')
+def _input_inputBoolFunc(self, operation_name, args):
+    return bool(args[0])
+
+@builtin('inputColFunc')
+def _input_inputColFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('inputEnumFunc')
+def _input_inputEnumFunc(self, operation_name, args):
+    options = args[1]
+    default_index = args[2] if len(args) > 2 else 0
+    return options[default_index]
+
+@builtin('inputFloatFunc')
+def _input_inputFloatFunc(self, operation_name, args):
+    return float(args[0])
 
+@builtin('inputIntFunc')
+def _input_inputIntFunc(self, operation_name, args):
+    return int(args[0])
 
+@builtin('inputPriceFunc')
+def _input_inputPriceFunc(self, operation_name, args):
+    return float(args[0])
 
+@builtin('inputSessionFunc')
+def _input_inputSessionFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('inputSourceFunc')
+def _input_inputSourceFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('inputStringFunc')
+def _input_inputStringFunc(self, operation_name, args):
+    return str(args[0])
+
+@builtin('inputSymbolFunc')
+def _input_inputSymbolFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('inputTextAreaFunc')
+def _input_inputTextAreaFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('inputTimeFunc')
+def _input_inputTimeFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('inputTimeFrameFunc')
+def _input_inputTimeFrameFunc(self, operation_name, args):
+    return args[0]
 
 
 #label
-def _handle_label_operation(self, operation_name, args):
-    if operation_name == 'labelFunc':
-        return {
-            'text': args[0],
-            'x': args[1],
-            'y': args[2],
-            'color': args[3] if len(args) > 3 else None,
-            'style': args[4] if len(args) > 4 else 'label_style_none',
-            'textcolor': args[5] if len(args) > 5 else None,
-            'size': args[6] if len(args) > 6 else 'size_auto',
-            'textalign': args[7] if len(args) > 7 else 'align_center'
-        }
-    
-    elif operation_name == 'labelCopyFunc':
-        return dict(args[0])
-    
-    elif operation_name == 'labelDeleteFunc':
-        return None
-    
-    elif operation_name == 'labelGetTextFunc':
-        return args[0]['text']
-    
-    elif operation_name == 'labelGetXFunc':
-        return args[0]['x']
-    
-    elif operation_name == 'labelGetYFunc':
-        return args[0]['y']
-    
-    elif operation_name == 'labelNewFunc':
-        return {
-            'text': '',
-            'x': 0,
-            'y': 0,
-            'color': None,
-            'style': 'label_style_none',
-            'textcolor': None,
-            'size': 'size_auto',
-            'textalign': 'align_center',
-            'tooltip': '',
-            'xloc': 'xloc_bar',
-            'yloc': 'yloc_price'
-        }
-    
-    elif operation_name == 'labelSetColFunc':
-        args[0]['color'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetPointFunc':
-        args[0]['x'] = args[1]['x']
-        args[0]['y'] = args[1]['y']
-        return args[0]
-    
-    elif operation_name == 'labelSetSizeFunc':
-        args[0]['size'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetStyleFunc':
-        args[0]['style'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetTextFunc':
-        args[0]['text'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetTextFontFamilyFunc':
-        args[0]['font_family'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetTextAlignFunc':
-        args[0]['textalign'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetTextColFunc':
-        args[0]['textcolor'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetToolTipFunc':
-        args[0]['tooltip'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetXFunc':
-        args[0]['x'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetXLocFunc':
-        args[0]['xloc'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetXYFunc':
-        args[0]['x'] = args[1]
-        args[0]['y'] = args[2]
-        return args[0]
-    
-    elif operation_name == 'labelSetYFunc':
-        args[0]['y'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'labelSetYLocFunc':
-        args[0]['yloc'] = args[1]
-        return args[0]
+@builtin('labelFunc')
+def _label_labelFunc(self, operation_name, args):
+    return {
+        'text': args[0],
+        'x': args[1],
+        'y': args[2],
+        'color': args[3] if len(args) > 3 else None,
+        'style': args[4] if len(args) > 4 else 'label_style_none',
+        'textcolor': args[5] if len(args) > 5 else None,
+        'size': args[6] if len(args) > 6 else 'size_auto',
+        'textalign': args[7] if len(args) > 7 else 'align_center'
+    }
+
+@builtin('labelCopyFunc')
+def _label_labelCopyFunc(self, operation_name, args):
+    return dict(args[0])
+
+@builtin('labelDeleteFunc')
+def _label_labelDeleteFunc(self, operation_name, args):
+    return None
+
+@builtin('labelGetTextFunc')
+def _label_labelGetTextFunc(self, operation_name, args):
+    return args[0]['text']
+
+@builtin('labelGetXFunc')
+def _label_labelGetXFunc(self, operation_name, args):
+    return args[0]['x']
+
+@builtin('labelGetYFunc')
+def _label_labelGetYFunc(self, operation_name, args):
+    return args[0]['y']
+
+@builtin('labelNewFunc')
+def _label_labelNewFunc(self, operation_name, args):
+    return {
+        'text': '',
+        'x': 0,
+        'y': 0,
+        'color': None,
+        'style': 'label_style_none',
+        'textcolor': None,
+        'size': 'size_auto',
+        'textalign': 'align_center',
+        'tooltip': '',
+        'xloc': 'xloc_bar',
+        'yloc': 'yloc_price'
+    }
 
+@builtin('labelSetColFunc')
+def _label_labelSetColFunc(self, operation_name, args):
+    args[0]['color'] = args[1]
+    return args[0]
+
+@builtin('labelSetPointFunc')
+def _label_labelSetPointFunc(self, operation_name, args):
+    args[0]['x'] = args[1]['x']
+    args[0]['y'] = args[1]['y']
+    return args[0]
+
+@builtin('labelSetSizeFunc')
+def _label_labelSetSizeFunc(self, operation_name, args):
+    args[0]['size'] = args[1]
+    return args[0]
+
+@builtin('labelSetStyleFunc')
+def _label_labelSetStyleFunc(self, operation_name, args):
+    args[0]['style'] = args[1]
+    return args[0]
+
+@builtin('labelSetTextFunc')
+def _label_labelSetTextFunc(self, operation_name, args):
+    args[0]['text'] = args[1]
+    return args[0]
+
+@builtin('labelSetTextFontFamilyFunc')
+def _label_labelSetTextFontFamilyFunc(self, operation_name, args):
+    args[0]['font_family'] = args[1]
+    return args[0]
+
+@builtin('labelSetTextAlignFunc')
+def _label_labelSetTextAlignFunc(self, operation_name, args):
+    args[0]['textalign'] = args[1]
+    return args[0]
+
+@builtin('labelSetTextColFunc')
+def _label_labelSetTextColFunc(self, operation_name, args):
+    args[0]['textcolor'] = args[1]
+    return args[0]
+
+@builtin('labelSetToolTipFunc')
+def _label_labelSetToolTipFunc(self, operation_name, args):
+    args[0]['tooltip'] = args[1]
+    return args[0]
+
+@builtin('labelSetXFunc')
+def _label_labelSetXFunc(self, operation_name, args):
+    args[0]['x'] = args[1]
+    return args[0]
+
+@builtin('labelSetXLocFunc')
+def _label_labelSetXLocFunc(self, operation_name, args):
+    args[0]['xloc'] = args[1]
+    return args[0]
+
+@builtin('labelSetXYFunc')
+def _label_labelSetXYFunc(self, operation_name, args):
+    args[0]['x'] = args[1]
+    args[0]['y'] = args[2]
+    return args[0]
+
+@builtin('labelSetYFunc')
+def _label_labelSetYFunc(self, operation_name, args):
+    args[0]['y'] = args[1]
+    return args[0]
+
+@builtin('labelSetYLocFunc')
+def _label_labelSetYLocFunc(self, operation_name, args):
+    args[0]['yloc'] = args[1]
+    return args[0]
 
 
 #line
-def _handle_line_operation(self, operation_name, args):
-    if operation_name == 'lineFunc':
-        return {
-            'x1': args[0],
-            'y1': args[1],
-            'x2': args[2],
-            'y2': args[3],
-            'color': args[4] if len(args) > 4 else None,
-            'width': args[5] if len(args) > 5 else 1,
-            'style': args[6] if len(args) > 6 else 'solid',
-            'extend': False
-        }
-    
-    elif operation_name == 'lineCopyFunc':
-        return dict(args[0])
-    
-    elif operation_name == 'lineDeleteFunc':
-        return None
-    
-    elif operation_name == 'lineGetPriceFunc':
-        x = args[1]
-        line = args[0]
-        # Linear interpolation
-        if x <= line['x1']:
-            return line['y1']
-        if x >= line['x2']:
-            return line['y2']
-        ratio = (x - line['x1']) / (line['x2'] - line['x1'])
-        return line['y1'] + ratio * (line['y2'] - line['y1'])
-    
-    elif operation_name == 'lineGetX1Func':
-        return args[0]['x1']
-    
-    elif operation_name == 'lineGetX2Func':
-        return args[0]['x2']
-    
-    elif operation_name == 'lineGetY1Func':
-        return args[0]['y1']
-    
-    elif operation_name == 'lineGetY2Func':
-        return args[0]['y2']
-    
-    elif operation_name == 'lineNewFunc':
-        return {
-            'x1': 0,
-            'y1': 0,
-            'x2': 0,
-            'y2': 0,
-            'color': None,
-            'width': 1,
-            'style': 'solid',
-            'extend': False
-        }
-    
-    elif operation_name == 'lineSetColFunc':
-        args[0]['color'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetExtendFunc':
-        args[0]['extend'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetFirstPointFunc':
-        args[0]['x1'] = args[1]['x']
-        args[0]['y1'] = args[1]['y']
-        return args[0]
-    
-    elif operation_name == 'lineSetSecondPointFunc':
-        args[0]['x2'] = args[1]['x']
-        args[0]['y2'] = args[1]['y']
-        return args[0]
-    
-    elif operation_name == 'lineSetStyleFunc':
-        args[0]['style'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetWidthFunc':
-        args[0]['width'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetX1Func':
-        args[0]['x1'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetX2Func':
-        args[0]['x2'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetXLocFunc':
-        args[0]['xloc'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetXY1Func':
-        args[0]['x1'] = args[1]
-        args[0]['y1'] = args[2]
-        return args[0]
-    
-    elif operation_name == 'lineSetXY2Func':
-        args[0]['x2'] = args[1]
-        args[0]['y2'] = args[2]
-        return args[0]
-    
-    elif operation_name == 'lineSetY1Func':
-        args[0]['y1'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineSetY2Func':
-        args[0]['y2'] = args[1]
-        return args[0]
-    
-    elif operation_name == 'lineFillFunc':
-        return {
-            'line1': args[0],
-            'line2': args[1],
-            'color': args[2] if len(args) > 2 else None
-        }
-    
-    elif operation_name == 'lineFillDeleteFunc':
-        return None
-    
-    elif operation_name == 'lineFillGetLine1Func':
-        return args[0]['line1']
-    
-    elif operation_name == 'lineFillGetLine2Func':
-        return args[0]['line2']
-    
-    elif operation_name == 'lineFillNewFunc':
-        return {
-            'line1': None,
-            'line2': None,
-            'color': None
-        }
-    
-    elif operation_name == 'lineFillSetColFunc':
-        args[0]['color'] = args[1]
-        return args[0]
+@builtin('lineFunc')
+def _line_lineFunc(self, operation_name, args):
+    return {
+        'x1': args[0],
+        'y1': args[1],
+        'x2': args[2],
+        'y2': args[3],
+        'color': args[4] if len(args) > 4 else None,
+        'width': args[5] if len(args) > 5 else 1,
+        'style': args[6] if len(args) > 6 else 'solid',
+        'extend': False
+    }
+
+@builtin('lineCopyFunc')
+def _line_lineCopyFunc(self, operation_name, args):
+    return dict(args[0])
+
+@builtin('lineDeleteFunc')
+def _line_lineDeleteFunc(self, operation_name, args):
+    return None
+
+@builtin('lineGetPriceFunc')
+def _line_lineGetPriceFunc(self, operation_name, args):
+    x = args[1]
+    line = args[0]
+    # Linear interpolation
+    if x <= line['x1']:
+        return line['y1']
+    if x >= line['x2']:
+        return line['y2']
+    ratio = (x - line['x1']) / (line['x2'] - line['x1'])
+    return line['y1'] + ratio * (line['y2'] - line['y1'])
+
+@builtin('lineGetX1Func')
+def _line_lineGetX1Func(self, operation_name, args):
+    return args[0]['x1']
+
+@builtin('lineGetX2Func')
+def _line_lineGetX2Func(self, operation_name, args):
+    return args[0]['x2']
+
+@builtin('lineGetY1Func')
+def _line_lineGetY1Func(self, operation_name, args):
+    return args[0]['y1']
+
+@builtin('lineGetY2Func')
+def _line_lineGetY2Func(self, operation_name, args):
+    return args[0]['y2']
+
+@builtin('lineNewFunc')
+def _line_lineNewFunc(self, operation_name, args):
+    return {
+        'x1': 0,
+        'y1': 0,
+        'x2': 0,
+        'y2': 0,
+        'color': None,
+        'width': 1,
+        'style': 'solid',
+        'extend': False
+    }
 
+@builtin('lineSetColFunc')
+def _line_lineSetColFunc(self, operation_name, args):
+    args[0]['color'] = args[1]
+    return args[0]
+
+@builtin('lineSetExtendFunc')
+def _line_lineSetExtendFunc(self, operation_name, args):
+    args[0]['extend'] = args[1]
+    return args[0]
+
+@builtin('lineSetFirstPointFunc')
+def _line_lineSetFirstPointFunc(self, operation_name, args):
+    args[0]['x1'] = args[1]['x']
+    args[0]['y1'] = args[1]['y']
+    return args[0]
+
+@builtin('lineSetSecondPointFunc')
+def _line_lineSetSecondPointFunc(self, operation_name, args):
+    args[0]['x2'] = args[1]['x']
+    args[0]['y2'] = args[1]['y']
+    return args[0]
+
+@builtin('lineSetStyleFunc')
+def _line_lineSetStyleFunc(self, operation_name, args):
+    args[0]['style'] = args[1]
+    return args[0]
+
+@builtin('lineSetWidthFunc')
+def _line_lineSetWidthFunc(self, operation_name, args):
+    args[0]['width'] = args[1]
+    return args[0]
+
+@builtin('lineSetX1Func')
+def _line_lineSetX1Func(self, operation_name, args):
+    args[0]['x1'] = args[1]
+    return args[0]
+
+@builtin('lineSetX2Func')
+def _line_lineSetX2Func(self, operation_name, args):
+    args[0]['x2'] = args[1]
+    return args[0]
+
+@builtin('lineSetXLocFunc')
+def _line_lineSetXLocFunc(self, operation_name, args):
+    args[0]['xloc'] = args[1]
+    return args[0]
+
+@builtin('lineSetXY1Func')
+def _line_lineSetXY1Func(self, operation_name, args):
+    args[0]['x1'] = args[1]
+    args[0]['y1'] = args[2]
+    return args[0]
+
+@builtin('lineSetXY2Func')
+def _line_lineSetXY2Func(self, operation_name, args):
+    args[0]['x2'] = args[1]
+    args[0]['y2'] = args[2]
+    return args[0]
+
+@builtin('lineSetY1Func')
+def _line_lineSetY1Func(self, operation_name, args):
+    args[0]['y1'] = args[1]
+    return args[0]
+
+@builtin('lineSetY2Func')
+def _line_lineSetY2Func(self, operation_name, args):
+    args[0]['y2'] = args[1]
+    return args[0]
+
+@builtin('lineFillFunc')
+def _line_lineFillFunc(self, operation_name, args):
+    return {
+        'line1': args[0],
+        'line2': args[1],
+        'color': args[2] if len(args) > 2 else None
+    }
+
+@builtin('lineFillDeleteFunc')
+def _line_lineFillDeleteFunc(self, operation_name, args):
+    return None
 
+@builtin('lineFillGetLine1Func')
+def _line_lineFillGetLine1Func(self, operation_name, args):
+    return args[0]['line1']
+
+@builtin('lineFillGetLine2Func')
+def _line_lineFillGetLine2Func(self, operation_name, args):
+    return args[0]['line2']
+
+@builtin('lineFillNewFunc')
+def _line_lineFillNewFunc(self, operation_name, args):
+    return {
+        'line1': None,
+        'line2': None,
+        'color': None
+    }
+
+@builtin('lineFillSetColFunc')
+def _line_lineFillSetColFunc(self, operation_name, args):
+    args[0]['color'] = args[1]
+    return args[0]
 
 
 #map
-def _handle_map_operation(self, operation_name, args):
-    if operation_name == 'mapClearFunc':
-        args[0].clear()
-        return args[0]
-    
-    elif operation_name == 'mapContainsFunc':
-        return args[1] in args[0]
-    
-    elif operation_name == 'mapCopyFunc':
-        return dict(args[0])
-    
-    elif operation_name == 'mapGetFunc':
-        return args[0].get(args[1])
-    
-    elif operation_name == 'mapKeysFunc':
-        return list(args[0].keys())
-    
-    elif operation_name == 'mapNewTypeFunc':
-        return {}
-    
-    elif operation_name == 'mapPutFunc':
-        args[0][args[1]] = args[2]
-        return args[0]
-    
-    elif operation_name == 'mapPutAllFunc':
-        args[0].update(args[1])
-        return args[0]
-    
-    elif operation_name == 'mapRemoveFunc':
-        if args[1] in args[0]:
-            del args[0][args[1]]
-        return args[0]
-    
-    elif operation_name == 'mapSizeFunc':
-        return len(args[0])
-    
-    elif operation_name == 'mapValuesFunc':
-        return list(args[0].values())
+@builtin('mapClearFunc')
+def _map_mapClearFunc(self, operation_name, args):
+    args[0].clear()
+    return args[0]
+
+@builtin('mapContainsFunc')
+def _map_mapContainsFunc(self, operation_name, args):
+    return args[1] in args[0]
+
+@builtin('mapCopyFunc')
+def _map_mapCopyFunc(self, operation_name, args):
+    return dict(args[0])
+
+@builtin('mapGetFunc')
+def _map_mapGetFunc(self, operation_name, args):
+    return args[0].get(args[1])
+
+@builtin('mapKeysFunc')
+def _map_mapKeysFunc(self, operation_name, args):
+    return list(args[0].keys())
+
+@builtin('mapNewTypeFunc')
+def _map_mapNewTypeFunc(self, operation_name, args):
+    return {}
+
+@builtin('mapPutFunc')
+def _map_mapPutFunc(self, operation_name, args):
+    args[0][args[1]] = args[2]
+    return args[0]
+
+@builtin('mapPutAllFunc')
+def _map_mapPutAllFunc(self, operation_name, args):
+    args[0].update(args[1])
+    return args[0]
+
+@builtin('mapRemoveFunc')
+def _map_mapRemoveFunc(self, operation_name, args):
+    if args[1] in args[0]:
+        del args[0][args[1]]
+    return args[0]
 
-    elif operation_name == 'mapNewBoolFunc':
-        return {'type': 'bool', 'value': bool(args[0]) if args else False}
-        
-    elif operation_name == 'mapNewFloatFunc':
-        return {'type': 'float', 'value': float(args[0]) if args else 0.0}
-        
-    elif operation_name == 'mapNewIntFunc':
-        return {'type': 'int', 'value': int(args[0]) if args else 0}
-        
-    elif operation_name == 'mapNewStringFunc':
-        return {'type': 'string', 'value': str(args[0]) if args else ''}
+@builtin('mapSizeFunc')
+def _map_mapSizeFunc(self, operation_name, args):
+    return len(args[0])
+
+@builtin('mapValuesFunc')
+def _map_mapValuesFunc(self, operation_name, args):
+    return list(args[0].values())
+
+@builtin('mapNewBoolFunc')
+def _map_mapNewBoolFunc(self, operation_name, args):
+    return {'type': 'bool', 'value': bool(args[0]) if args else False}
 
+@builtin('mapNewFloatFunc')
+def _map_mapNewFloatFunc(self, operation_name, args):
+    return {'type': 'float', 'value': float(args[0]) if args else 0.0}
 
+@builtin('mapNewIntFunc')
+def _map_mapNewIntFunc(self, operation_name, args):
+    return {'type': 'int', 'value': int(args[0]) if args else 0}
+
+@builtin('mapNewStringFunc')
+def _map_mapNewStringFunc(self, operation_name, args):
+    return {'type': 'string', 'value': str(args[0]) if args else ''}
 
 
 #math
-def _handle_math_operation(self, operation_name, args):
-    import math
+@builtin('mathAbsFunc')
+def _math_mathAbsFunc(self, operation_name, args):
+    return abs(args[0])
 
-    if operation_name == 'mathAbsFunc':
-        return abs(args[0])
-    
-    elif operation_name == 'mathAcosFunc':
-        return math.acos(args[0])
-    
-    elif operation_name == 'mathAsinFunc':
-        return math.asin(args[0])
-    
-    elif operation_name == 'mathAtanFunc':
-        return math.atan(args[0])
-    
-    elif operation_name == 'mathAvgFunc':
-        return sum(args[0]) / len(args[0])
-    
-    elif operation_name == 'mathCeilFunc':
-        return math.ceil(args[0])
-    
-    elif operation_name == 'mathCosFunc':
-        return math.cos(args[0])
-    
-    elif operation_name == 'mathExpFunc':
-        return math.exp(args[0])
-    
-    elif operation_name == 'mathFloorFunc':
-        return math.floor(args[0])
-    
-    elif operation_name == 'mathLogFunc':
-        return math.log(args[0])
-    
-    elif operation_name == 'mathLog10Func':
-        return math.log10(args[0])
-    
-    elif operation_name == 'mathMaxFunc':
-        return max(args[0])
-    
-    elif operation_name == 'mathMinFunc':
-        return min(args[0])
-    
-    elif operation_name == 'mathPowFunc':
-        return math.pow(args[0], args[1])
-    
-    elif operation_name == 'mathRandomFunc':
-        return random.random()
-    
-    elif operation_name == 'mathRoundFunc':
-        return round(args[0])
-    
-    elif operation_name == 'mathRoundToMinTickFunc':
-        return round(args[0] / args[1]) * args[1]
-    
-    elif operation_name == 'mathSignFunc':
-        return (1 if args[0] > 0 else -1) if args[0] != 0 else 0
-    
-    elif operation_name == 'mathSinFunc':
-        return math.sin(args[0])
-    
-    elif operation_name == 'mathSqrtFunc':
-        return math.sqrt(args[0])
-    
-    elif operation_name == 'mathSumFunc':
-        return sum(args[0])
-    
-    elif operation_name == 'mathTanFunc':
-        return math.tan(args[0])
-    
-    elif operation_name == 'mathToDegreesFunc':
-        return math.degrees(args[0])
-    
-    elif operation_name == 'mathToRadiansFunc':
-        return math.radians(args[0])
+@builtin('mathAcosFunc')
+def _math_mathAcosFunc(self, operation_name, args):
+    return math.acos(args[0])
 
+@builtin('mathAsinFunc')
+def _math_mathAsinFunc(self, operation_name, args):
+    return math.asin(args[0])
 
+@builtin('mathAtanFunc')
+def _math_mathAtanFunc(self, operation_name, args):
+    return math.atan(args[0])
 
+@builtin('mathAvgFunc')
+def _math_mathAvgFunc(self, operation_name, args):
+    return sum(args[0]) / len(args[0])
 
-#matrix
-def _handle_matrix_operation(self, operation_name, args):
-    import numpy as np
+@builtin('mathCeilFunc')
+def _math_mathCeilFunc(self, operation_name, args):
+    return math.ceil(args[0])
 
-    if operation_name == 'matrixAddColFunc':
-        matrix = np.array(args[0])
-        col = np.array(args[1])
-        return np.column_stack((matrix, col)).tolist()
-    
-    elif operation_name == 'matrixAddRowFunc':
-        matrix = np.array(args[0])
-        row = np.array(args[1])
-        return np.vstack((matrix, row)).tolist()
-    
-    elif operation_name == 'matrixAvgFunc':
-        return np.mean(np.array(args[0])).tolist()
-    
-    elif operation_name == 'matrixColFunc':
-        return np.array(args[0])[:, args[1]].tolist()
-    
-    elif operation_name == 'matrixColumnsFunc':
-        return len(np.array(args[0])[0])
-    
-    elif operation_name == 'matrixConcatFunc':
-        return np.concatenate((np.array(args[0]), np.array(args[1]))).tolist()
-    
-    elif operation_name == 'matrixCopyFunc':
-        return np.array(args[0]).copy().tolist()
-    
-    elif operation_name == 'matrixDetFunc':
-        return np.linalg.det(np.array(args[0]))
-    
-    elif operation_name == 'matrixDiffFunc':
-        return np.diff(np.array(args[0])).tolist()
-    
-    elif operation_name == 'matrixEigenValuesFunc':
-        return np.linalg.eigvals(np.array(args[0])).tolist()
-    
-    elif operation_name == 'matrixEigenVectorsFunc':
-        return np.linalg.eig(np.array(args[0]))[1].tolist()
-    
-    elif operation_name == 'matrixElementsCountFunc':
-        return np.array(args[0]).size
-    
-    elif operation_name == 'matrixFillFunc':
-        shape = tuple(args[0])
-        value = args[1]
-        return np.full(shape, value).tolist()
-    
-    elif operation_name == 'matrixGetFunc':
-        matrix = np.array(args[0])
-        row = args[1]
-        col = args[2]
-        return matrix[row, col]
-    
-    elif operation_name == 'matrixInvFunc':
-        return np.linalg.inv(np.array(args[0])).tolist()
-    
-    elif operation_name == 'matrixIsAntiDiagonalFunc':
-        matrix = np.array(args[0])
-        n = len(matrix)
-        return all(matrix[i][n-1-i] != 0 for i in range(n)) and \
-               all(matrix[i][j] == 0 for i in range(n) for j in range(n) if j != n-1-i)
-    
-    elif operation_name == 'matrixIsAntiSymmetricFunc':
-        matrix = np.array(args[0])
-        return np.array_equal(matrix, -matrix.T)
-    
-    elif operation_name == 'matrixIsBinaryFunc':
-        return np.all(np.logical_or(np.array(args[0]) == 0, np.array(args[0]) == 1))
-    
-    elif operation_name == 'matrixIsDiagonalFunc':
-        matrix = np.array(args[0])
-        return np.all(matrix == np.diag(np.diag(matrix)))
-    
-    elif operation_name == 'matrixIsIdentityFunc':
-        return np.array_equal(np.array(args[0]), np.eye(len(args[0])))
-    
-    elif operation_name == 'matrixIsSquareFunc':
-        matrix = np.array(args[0])
-        return matrix.shape[0] == matrix.shape[1]
-    
-    elif operation_name == 'matrixIsSymmetricFunc':
-        matrix = np.array(args[0])
-        return np.array_equal(matrix, matrix.T)
-    
-    elif operation_name == 'matrixIsTriangularFunc':
-        matrix = np.array(args[0])
-        return np.allclose(np.tril(matrix), matrix) or np.allclose(np.triu(matrix), matrix)
-    
-    elif operation_name == 'matrixIsZeroFunc':
-        return np.all(np.array(args[0]) == 0)
-    
-    elif operation_name == 'matrixKronFunc':
-        return np.kron(np.array(args[0]), np.array(args[1])).tolist()
-    
-    elif operation_name == 'matrixMaxFunc':
-        return np.max(np.array(args[0]))
-    
-    elif operation_name == 'matrixMinFunc':
-        return np.min(np.array(args[0]))
-    
-    elif operation_name == 'matrixMultFunc':
-        return np.matmul(np.array(args[0]), np.array(args[1])).tolist()
-    
-    elif operation_name == 'matrixNewTypeFunc':
-        rows = args[0]
-        cols = args[1]
-        return np.zeros((rows, cols)).tolist()
-    
-    elif operation_name == 'matrixRankFunc':
-        return np.linalg.matrix_rank(np.array(args[0]))
-    
-    elif operation_name == 'matrixReshapeFunc':
-        matrix = np.array(args[0])
-        new_shape = tuple(args[1])
-        return matrix.reshape(new_shape).tolist()
-    
-    elif operation_name == 'matrixReverseFunc':
-        return np.flip(np.array(args[0])).tolist()
-    
-    elif operation_name == 'matrixRowFunc':
-        return np.array(args[0])[args[1]].tolist()
-    
-    elif operation_name == 'matrixRowsFunc':
-        return len(np.array(args[0]))
-    
-    elif operation_name == 'matrixSetFunc':
-        matrix = np.array(args[0])
-        row = args[1]
-        col = args[2]
-        value = args[3]
-        matrix[row, col] = value
-        return matrix.tolist()
-    
-    elif operation_name == 'matrixSortFunc':
-        return np.sort(np.array(args[0])).tolist()
-    
-    elif operation_name == 'matrixTraceFunc':
-        return np.trace(np.array(args[0]))
-    
-    elif operation_name == 'matrixTransposeFunc':
-        return np.transpose(np.array(args[0])).tolist()
+@builtin('mathCosFunc')
+def _math_mathCosFunc(self, operation_name, args):
+    return math.cos(args[0])
+
+@builtin('mathExpFunc')
+def _math_mathExpFunc(self, operation_name, args):
+    return math.exp(args[0])
+
+@builtin('mathFloorFunc')
+def _math_mathFloorFunc(self, operation_name, args):
+    return math.floor(args[0])
+
+@builtin('mathLogFunc')
+def _math_mathLogFunc(self, operation_name, args):
+    return math.log(args[0])
+
+@builtin('mathLog10Func')
+def _math_mathLog10Func(self, operation_name, args):
+    return math.log10(args[0])
 
+@builtin('mathMaxFunc')
+def _math_mathMaxFunc(self, operation_name, args):
+    return max(args[0])
+
+@builtin('mathMinFunc')
+def _math_mathMinFunc(self, operation_name, args):
+    return min(args[0])
+
+@builtin('mathPowFunc')
+def _math_mathPowFunc(self, operation_name, args):
+    return math.pow(args[0], args[1])
+
+@builtin('mathRandomFunc')
+def _math_mathRandomFunc(self, operation_name, args):
+    return random.random()
+
+@builtin('mathRoundFunc')
+def _math_mathRoundFunc(self, operation_name, args):
+    return round(args[0])
+
+@builtin('mathRoundToMinTickFunc')
+def _math_mathRoundToMinTickFunc(self, operation_name, args):
+    return round(args[0] / args[1]) * args[1]
+
+@builtin('mathSignFunc')
+def _math_mathSignFunc(self, operation_name, args):
+    return (1 if args[0] > 0 else -1) if args[0] != 0 else 0
+
+@builtin('mathSinFunc')
+def _math_mathSinFunc(self, operation_name, args):
+    return math.sin(args[0])
+
+@builtin('mathSqrtFunc')
+def _math_mathSqrtFunc(self, operation_name, args):
+    return math.sqrt(args[0])
+
+@builtin('mathSumFunc')
+def _math_mathSumFunc(self, operation_name, args):
+    return sum(args[0])
+
+@builtin('mathTanFunc')
+def _math_mathTanFunc(self, operation_name, args):
+    return math.tan(args[0])
+
+@builtin('mathToDegreesFunc')
+def _math_mathToDegreesFunc(self, operation_name, args):
+    return math.degrees(args[0])
+
+@builtin('mathToRadiansFunc')
+def _math_mathToRadiansFunc(self, operation_name, args):
+    return math.radians(args[0])
+
+
+#matrix
+@builtin('matrixAddColFunc')
+def _matrix_matrixAddColFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    col = np.array(args[1])
+    return np.column_stack((matrix, col)).tolist()
+
+@builtin('matrixAddRowFunc')
+def _matrix_matrixAddRowFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    row = np.array(args[1])
+    return np.vstack((matrix, row)).tolist()
+
+@builtin('matrixAvgFunc')
+def _matrix_matrixAvgFunc(self, operation_name, args):
+    return np.mean(np.array(args[0])).tolist()
+
+@builtin('matrixColFunc')
+def _matrix_matrixColFunc(self, operation_name, args):
+    return np.array(args[0])[:, args[1]].tolist()
+
+@builtin('matrixColumnsFunc')
+def _matrix_matrixColumnsFunc(self, operation_name, args):
+    return len(np.array(args[0])[0])
+
+@builtin('matrixConcatFunc')
+def _matrix_matrixConcatFunc(self, operation_name, args):
+    return np.concatenate((np.array(args[0]), np.array(args[1]))).tolist()
+
+@builtin('matrixCopyFunc')
+def _matrix_matrixCopyFunc(self, operation_name, args):
+    return np.array(args[0]).copy().tolist()
+
+@builtin('matrixDetFunc')
+def _matrix_matrixDetFunc(self, operation_name, args):
+    return np.linalg.det(np.array(args[0]))
+
+@builtin('matrixDiffFunc')
+def _matrix_matrixDiffFunc(self, operation_name, args):
+    return np.diff(np.array(args[0])).tolist()
+
+@builtin('matrixEigenValuesFunc')
+def _matrix_matrixEigenValuesFunc(self, operation_name, args):
+    return np.linalg.eigvals(np.array(args[0])).tolist()
+
+@builtin('matrixEigenVectorsFunc')
+def _matrix_matrixEigenVectorsFunc(self, operation_name, args):
+    return np.linalg.eig(np.array(args[0]))[1].tolist()
+
+@builtin('matrixElementsCountFunc')
+def _matrix_matrixElementsCountFunc(self, operation_name, args):
+    return np.array(args[0]).size
+
+@builtin('matrixFillFunc')
+def _matrix_matrixFillFunc(self, operation_name, args):
+    shape = tuple(args[0])
+    value = args[1]
+    return np.full(shape, value).tolist()
+
+@builtin('matrixGetFunc')
+def _matrix_matrixGetFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    row = args[1]
+    col = args[2]
+    return matrix[row, col]
+
+@builtin('matrixInvFunc')
+def _matrix_matrixInvFunc(self, operation_name, args):
+    return np.linalg.inv(np.array(args[0])).tolist()
+
+@builtin('matrixIsAntiDiagonalFunc')
+def _matrix_matrixIsAntiDiagonalFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    n = len(matrix)
+    return all(matrix[i][n-1-i] != 0 for i in range(n)) and \
+           all(matrix[i][j] == 0 for i in range(n) for j in range(n) if j != n-1-i)
+
+@builtin('matrixIsAntiSymmetricFunc')
+def _matrix_matrixIsAntiSymmetricFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    return np.array_equal(matrix, -matrix.T)
+
+@builtin('matrixIsBinaryFunc')
+def _matrix_matrixIsBinaryFunc(self, operation_name, args):
+    return np.all(np.logical_or(np.array(args[0]) == 0, np.array(args[0]) == 1))
+
+@builtin('matrixIsDiagonalFunc')
+def _matrix_matrixIsDiagonalFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    return np.all(matrix == np.diag(np.diag(matrix)))
+
+@builtin('matrixIsIdentityFunc')
+def _matrix_matrixIsIdentityFunc(self, operation_name, args):
+    return np.array_equal(np.array(args[0]), np.eye(len(args[0])))
+
+@builtin('matrixIsSquareFunc')
+def _matrix_matrixIsSquareFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    return matrix.shape[0] == matrix.shape[1]
+
+@builtin('matrixIsSymmetricFunc')
+def _matrix_matrixIsSymmetricFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    return np.array_equal(matrix, matrix.T)
+
+@builtin('matrixIsTriangularFunc')
+def _matrix_matrixIsTriangularFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    return np.allclose(np.tril(matrix), matrix) or np.allclose(np.triu(matrix), matrix)
+
+@builtin('matrixIsZeroFunc')
+def _matrix_matrixIsZeroFunc(self, operation_name, args):
+    return np.all(np.array(args[0]) == 0)
+
+@builtin('matrixKronFunc')
+def _matrix_matrixKronFunc(self, operation_name, args):
+    return np.kron(np.array(args[0]), np.array(args[1])).tolist()
+
+@builtin('matrixMaxFunc')
+def _matrix_matrixMaxFunc(self, operation_name, args):
+    return np.max(np.array(args[0]))
+
+@builtin('matrixMinFunc')
+def _matrix_matrixMinFunc(self, operation_name, args):
+    return np.min(np.array(args[0]))
+
+@builtin('matrixMultFunc')
+def _matrix_matrixMultFunc(self, operation_name, args):
+    return np.matmul(np.array(args[0]), np.array(args[1])).tolist()
+
+@builtin('matrixNewTypeFunc')
+def _matrix_matrixNewTypeFunc(self, operation_name, args):
+    rows = args[0]
+    cols = args[1]
+    return np.zeros((rows, cols)).tolist()
+
+@builtin('matrixRankFunc')
+def _matrix_matrixRankFunc(self, operation_name, args):
+    return np.linalg.matrix_rank(np.array(args[0]))
+
+@builtin('matrixReshapeFunc')
+def _matrix_matrixReshapeFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    new_shape = tuple(args[1])
+    return matrix.reshape(new_shape).tolist()
+
+@builtin('matrixReverseFunc')
+def _matrix_matrixReverseFunc(self, operation_name, args):
+    return np.flip(np.array(args[0])).tolist()
+
+@builtin('matrixRowFunc')
+def _matrix_matrixRowFunc(self, operation_name, args):
+    return np.array(args[0])[args[1]].tolist()
+
+@builtin('matrixRowsFunc')
+def _matrix_matrixRowsFunc(self, operation_name, args):
+    return len(np.array(args[0]))
+
+@builtin('matrixSetFunc')
+def _matrix_matrixSetFunc(self, operation_name, args):
+    matrix = np.array(args[0])
+    row = args[1]
+    col = args[2]
+    value = args[3]
+    matrix[row, col] = value
+    return matrix.tolist()
+
+@builtin('matrixSortFunc')
+def _matrix_matrixSortFunc(self, operation_name, args):
+    return np.sort(np.array(args[0])).tolist()
+
+@builtin('matrixTraceFunc')
+def _matrix_matrixTraceFunc(self, operation_name, args):
+    return np.trace(np.array(args[0]))
+
+@builtin('matrixTransposeFunc')
+def _matrix_matrixTransposeFunc(self, operation_name, args):
+    return np.transpose(np.array(args[0])).tolist()
 
 
 #strategy
-def _handle_strategy_operation(self, operation_name, args):
-    if operation_name == 'strategyFunc':
-        return {
-            'positions': [],
-            'orders': [],
-            'closed_trades': [],
-            'settings': {
-                'initial_capital': args[0] if args else 100000,
-                'commission': 0.1,
-                'margin_long': 1.0,
-                'margin_short': 1.0
-            }
-        }
-    
-    elif operation_name == 'strategyCancelFunc':
-        order_id = args[0]
-        strategy = args[1]
-        strategy['orders'] = [order for order in strategy['orders'] if order['id'] != order_id]
-        return strategy
-    
-    elif operation_name == 'strategyCancelAllFunc':
-        strategy = args[0]
-        strategy['orders'] = []
-        return strategy
-    
-    elif operation_name == 'strategyCloseFunc':
-        strategy = args[0]
-        position_id = args[1]
-        price = args[2]
-        strategy['positions'] = [pos for pos in strategy['positions'] if pos['id'] != position_id]
-        return strategy
-    
-    elif operation_name == 'strategyCloseAllFunc':
-        strategy = args[0]
-        price = args[1]
-        strategy['positions'] = []
-        return strategy
-    
-    elif operation_name == 'strategyEntryFunc':
-        strategy = args[0]
-        direction = args[1]  # 'long' or 'short'
-        quantity = args[2]
-        price = args[3]
-        
-        new_position = {
-            'id': len(strategy['positions']),
-            'direction': direction,
-            'quantity': quantity,
-            'entry_price': price,
-            'entry_time': time.time(),
-            'profit': 0
-        }
-        strategy['positions'].append(new_position)
-        return strategy
-    
-    elif operation_name == 'strategyExitFunc':
-        strategy = args[0]
-        position_id = args[1]
-        price = args[2]
-        
-        for pos in strategy['positions']:
-            if pos['id'] == position_id:
-                profit = (price - pos['entry_price']) * pos['quantity'] if pos['direction'] == 'long' else \
-                        (pos['entry_price'] - price) * pos['quantity']
-                closed_trade = {
-                    'entry_price': pos['entry_price'],
-                    'exit_price': price,
-                    'quantity': pos['quantity'],
-                    'direction': pos['direction'],
-                    'profit': profit,
-                    'entry_time': pos['entry_time'],
-                    'exit_time': time.time()
-                }
-                strategy['closed_trades'].append(closed_trade)
-                strategy['positions'] = [p for p in strategy['positions'] if p['id'] != position_id]
-                break
-        return strategy
-    
-    elif operation_name == 'strategyOrderFunc':
-        strategy = args[0]
-        order_type = args[1]  # 'limit', 'market', 'stop'
-        direction = args[2]  # 'long' or 'short'
-        quantity = args[3]
-        price = args[4]
-        
-        new_order = {
-            'id': len(strategy['orders']),
-            'type': order_type,
-            'direction': direction,
-            'quantity': quantity,
-            'price': price,
-            'time': time.time()
+@builtin('strategyFunc')
+def _strategy_strategyFunc(self, operation_name, args):
+    return {
+        'positions': [],
+        'orders': [],
+        'closed_trades': [],
+        'settings': {
+            'initial_capital': args[0] if args else 100000,
+            'commission': 0.1,
+            'margin_long': 1.0,
+            'margin_short': 1.0
         }
-        strategy['orders'].append(new_order)
-        return strategy
-
+    }
 
+@builtin('strategyCancelFunc')
+def _strategy_strategyCancelFunc(self, operation_name, args):
+    order_id = args[0]
+    strategy = args[1]
+    strategy['orders'] = [order for order in strategy['orders'] if order['id'] != order_id]
+    return strategy
+
+@builtin('strategyCancelAllFunc')
+def _strategy_strategyCancelAllFunc(self, operation_name, args):
+    strategy = args[0]
+    strategy['orders'] = []
+    return strategy
+
+@builtin('strategyCloseFunc')
+def _strategy_strategyCloseFunc(self, operation_name, args):
+    strategy = args[0]
+    position_id = args[1]
+    price = args[2]
+    strategy['positions'] = [pos for pos in strategy['positions'] if pos['id'] != position_id]
+    return strategy
+
+@builtin('strategyCloseAllFunc')
+def _strategy_strategyCloseAllFunc(self, operation_name, args):
+    strategy = args[0]
+    price = args[1]
+    strategy['positions'] = []
+    return strategy
+
+@builtin('strategyEntryFunc')
+def _strategy_strategyEntryFunc(self, operation_name, args):
+    strategy = args[0]
+    direction = args[1]  # 'long' or 'short'
+    quantity = args[2]
+    price = args[3]
+
+    new_position = {
+        'id': len(strategy['positions']),
+        'direction': direction,
+        'quantity': quantity,
+        'entry_price': price,
+        'entry_time': time.time(),
+        'profit': 0
+    }
+    strategy['positions'].append(new_position)
+    return strategy
+
+@builtin('strategyExitFunc')
+def _strategy_strategyExitFunc(self, operation_name, args):
+    strategy = args[0]
+    position_id = args[1]
+    price = args[2]
+
+    for pos in strategy['positions']:
+        if pos['id'] == position_id:
+            profit = (price - pos['entry_price']) * pos['quantity'] if pos['direction'] == 'long' else \
+                    (pos['entry_price'] - price) * pos['quantity']
+            closed_trade = {
+                'entry_price': pos['entry_price'],
+                'exit_price': price,
+                'quantity': pos['quantity'],
+                'direction': pos['direction'],
+                'profit': profit,
+                'entry_time': pos['entry_time'],
+                'exit_time': time.time()
+            }
+            strategy['closed_trades'].append(closed_trade)
+            strategy['positions'] = [p for p in strategy['positions'] if p['id'] != position_id]
+            break
+    return strategy
+
+@builtin('strategyOrderFunc')
+def _strategy_strategyOrderFunc(self, operation_name, args):
+    strategy = args[0]
+    order_type = args[1]  # 'limit', 'market', 'stop'
+    direction = args[2]  # 'long' or 'short'
+    quantity = args[3]
+    price = args[4]
+
+    new_order = {
+        'id': len(strategy['orders']),
+        'type': order_type,
+        'direction': direction,
+        'quantity': quantity,
+        'price': price,
+        'time': time.time()
+    }
+    strategy['orders'].append(new_order)
+    return strategy
 
 
 #str
-def _handle_str_operation(self, operation_name, args):
-    if operation_name == 'strContainsFunc':
-        return args[1] in args[0]
-    
-    elif operation_name == 'strEndsWithFunc':
-        return args[0].endswith(args[1])
-    
-    elif operation_name == 'strFormatFunc':
-        return args[0].format(*args[1:])
-    
-    elif operation_name == 'strFormatTimeFunc':
-        return time.strftime(args[1], time.localtime(args[0]))
-    
-    elif operation_name == 'strLengthFunc':
-        return len(args[0])
-    
-    elif operation_name == 'strLowerFunc':
-        return args[0].lower()
-    
-    elif operation_name == 'strMatchFunc':
-        import re
-        return bool(re.match(args[1], args[0]))
-    
-    elif operation_name == 'strPosFunc':
-        return args[0].find(args[1])
-    
-    elif operation_name == 'strRepeatFunc':
-        return args[0] * args[1]
-    
-    elif operation_name == 'strReplaceFunc':
-        return args[0].replace(args[1], args[2], 1)
-    
-    elif operation_name == 'strReplaceAllFunc':
-        return args[0].replace(args[1], args[2])
-    
-    elif operation_name == 'strSplitFunc':
-        return args[0].split(args[1])
-    
-    elif operation_name == 'strStartsWithFunc':
-        return args[0].startswith(args[1])
-    
-    elif operation_name == 'strSubstringFunc':
-        return args[0][args[1]:args[2] if len(args) > 2 else None]
-    
-    elif operation_name == 'strToNumberFunc':
+#str
+@builtin('strContainsFunc')
+def _str_strContainsFunc(self, operation_name, args):
+    return args[1] in args[0]
+
+@builtin('strEndsWithFunc')
+def _str_strEndsWithFunc(self, operation_name, args):
+    return args[0].endswith(args[1])
+
+@builtin('strFormatFunc')
+def _str_strFormatFunc(self, operation_name, args):
+    return args[0] % tuple(args[1:])
+
+@builtin('strFormatTimeFunc')
+def _str_strFormatTimeFunc(self, operation_name, args):
+    return args[0].strftime(args[1])
+
+@builtin('strLengthFunc')
+def _str_strLengthFunc(self, operation_name, args):
+    return len(args[0])
+
+@builtin('strLowerFunc')
+def _str_strLowerFunc(self, operation_name, args):
+    return args[0].lower()
+
+@builtin('strMatchFunc')
+def _str_strMatchFunc(self, operation_name, args):
+    import re
+    return bool(re.match(args[1], args[0]))
+
+@builtin('strPosFunc')
+def _str_strPosFunc(self, operation_name, args):
+    return args[0].find(args[1])
+
+@builtin('strRepeatFunc')
+def _str_strRepeatFunc(self, operation_name, args):
+    return args[0] * args[1]
+
+@builtin('strReplaceFunc')
+def _str_strReplaceFunc(self, operation_name, args):
+    return args[0].replace(args[1], args[2], 1)
+
+@builtin('strReplaceAllFunc')
+def _str_strReplaceAllFunc(self, operation_name, args):
+    return args[0].replace(args[1], args[2])
+
+@builtin('strSplitFunc')
+def _str_strSplitFunc(self, operation_name, args):
+    return args[0].split(args[1])
+
+@builtin('strStartsWithFunc')
+def _str_strStartsWithFunc(self, operation_name, args):
+    return args[0].startswith(args[1])
+
+@builtin('strSubstringFunc')
+def _str_strSubstringFunc(self, operation_name, args):
+    start = args[1]
+    end = args[2] if len(args) > 2 else None
+    return args[0][start:end]
+
+@builtin('strToNumberFunc')
+def _str_strToNumberFunc(self, operation_name, args):
+    try:
         return float(args[0])
-    
-    elif operation_name == 'strToStringFunc':
-        return str(args[0])
-    
-    elif operation_name == 'strTrimFunc':
-        return args[0].strip()
-    
-    elif operation_name == 'strUpperFunc':
-        return args[0].upper()
-    
-    elif operation_name == 'strIndexOfFunc':
-        return args[0].find(args[1], args[2] if len(args) > 2 else 0)
-        
-    elif operation_name == 'strLastIndexOfFunc':
-        return args[0].rfind(args[1])
-        
-    elif operation_name == 'strCompareFunc':
-        return (args[0] > args[1]) - (args[0] < args[1])
-        
-    elif operation_name == 'strCountFunc':
-        return args[0].count(args[1])
-        
-    elif operation_name == 'strReverseFunc':
-        return args[0][::-1]
-        
-    elif operation_name == 'strPadLeftFunc':
-        return args[0].rjust(args[1], args[2] if len(args) > 2 else ' ')
-        
-    elif operation_name == 'strPadRightFunc':
-        return args[0].ljust(args[1], args[2] if len(args) > 2 else ' ')
+    except ValueError:
+        return None
 
+@builtin('strToStringFunc')
+def _str_strToStringFunc(self, operation_name, args):
+    return str(args[0])
 
+@builtin('strTrimFunc')
+def _str_strTrimFunc(self, operation_name, args):
+    return args[0].strip()
 
+@builtin('strUpperFunc')
+def _str_strUpperFunc(self, operation_name, args):
+    return args[0].upper()
 
-#str
-def _handle_str_operation(self, operation_name, args):
-    if operation_name == 'strContainsFunc':
-        return args[1] in args[0]
-    
-    elif operation_name == 'strEndsWithFunc':
-        return args[0].endswith(args[1])
-    
-    elif operation_name == 'strFormatFunc':
-        return args[0] % tuple(args[1:])
-    
-    elif operation_name == 'strFormatTimeFunc':
-        return args[0].strftime(args[1])
-    
-    elif operation_name == 'strLengthFunc':
-        return len(args[0])
-    
-    elif operation_name == 'strLowerFunc':
-        return args[0].lower()
-    
-    elif operation_name == 'strMatchFunc':
-        import re
-        return bool(re.match(args[1], args[0]))
-    
-    elif operation_name == 'strPosFunc':
-        return args[0].find(args[1])
-    
-    elif operation_name == 'strRepeatFunc':
-        return args[0] * args[1]
-    
-    elif operation_name == 'strReplaceFunc':
-        return args[0].replace(args[1], args[2], 1)
-    
-    elif operation_name == 'strReplaceAllFunc':
-        return args[0].replace(args[1], args[2])
-    
-    elif operation_name == 'strSplitFunc':
-        return args[0].split(args[1])
-    
-    elif operation_name == 'strStartsWithFunc':
-        return args[0].startswith(args[1])
-    
-    elif operation_name == 'strSubstringFunc':
-        start = args[1]
-        end = args[2] if len(args) > 2 else None
-        return args[0][start:end]
-    
-    elif operation_name == 'strToNumberFunc':
-        try:
-            return float(args[0])
-        except ValueError:
-            return None
-    
-    elif operation_name == 'strToStringFunc':
-        return str(args[0])
-    
-    elif operation_name == 'strTrimFunc':
-        return args[0].strip()
-    
-    elif operation_name == 'strUpperFunc':
-        return args[0].upper()
 
+#table
+@builtin('tableFunc')
+def _table_tableFunc(self, operation_name, args):
+    return {'rows': [], 'headers': []}
+
+@builtin('tableCellFunc')
+def _table_tableCellFunc(self, operation_name, args):
+    return {'text': args[0], 'properties': {}}
+
+@builtin('tableCellSetBgColFunc')
+def _table_tableCellSetBgColFunc(self, operation_name, args):
+    args[0]['properties']['bgcolor'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetHeightFunc')
+def _table_tableCellSetHeightFunc(self, operation_name, args):
+    args[0]['properties']['height'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetTextFunc')
+def _table_tableCellSetTextFunc(self, operation_name, args):
+    args[0]['text'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetTextColFunc')
+def _table_tableCellSetTextColFunc(self, operation_name, args):
+    args[0]['properties']['textcolor'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetTextFontFamilyFunc')
+def _table_tableCellSetTextFontFamilyFunc(self, operation_name, args):
+    args[0]['properties']['fontfamily'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetTextHAlignFunc')
+def _table_tableCellSetTextHAlignFunc(self, operation_name, args):
+    args[0]['properties']['halign'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetTextSizeFunc')
+def _table_tableCellSetTextSizeFunc(self, operation_name, args):
+    args[0]['properties']['textsize'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetTextVAlignFunc')
+def _table_tableCellSetTextVAlignFunc(self, operation_name, args):
+    args[0]['properties']['valign'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetToolTipFunc')
+def _table_tableCellSetToolTipFunc(self, operation_name, args):
+    args[0]['properties']['tooltip'] = args[1]
+    return args[0]
+
+@builtin('tableCellSetWidthFunc')
+def _table_tableCellSetWidthFunc(self, operation_name, args):
+    args[0]['properties']['width'] = args[1]
+    return args[0]
+
+@builtin('tableClearFunc')
+def _table_tableClearFunc(self, operation_name, args):
+    args[0]['rows'] = []
+    return args[0]
+
+@builtin('tableDeleteFunc')
+def _table_tableDeleteFunc(self, operation_name, args):
     return None
 
+@builtin('tableMergeCellsFunc')
+def _table_tableMergeCellsFunc(self, operation_name, args):
+    start_row = args[1]
+    end_row = args[2]
+    start_col = args[3]
+    end_col = args[4]
+    args[0]['merged_cells'].append({
+        'start_row': start_row,
+        'end_row': end_row,
+        'start_col': start_col,
+        'end_col': end_col
+    })
+    return args[0]
 
+@builtin('tableNewFunc')
+def _table_tableNewFunc(self, operation_name, args):
+    return {
+        'rows': [],
+        'headers': [],
+        'merged_cells': [],
+        'properties': {}
+    }
 
-#table
-def _handle_table_operation(self, operation_name, args):
-    if operation_name == 'tableFunc':
-        return {'rows': [], 'headers': []}
-        
-    elif operation_name == 'tableCellFunc':
-        return {'text': args[0], 'properties': {}}
-        
-    elif operation_name == 'tableCellSetBgColFunc':
-        args[0]['properties']['bgcolor'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetHeightFunc':
-        args[0]['properties']['height'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetTextFunc':
-        args[0]['text'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetTextColFunc':
-        args[0]['properties']['textcolor'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetTextFontFamilyFunc':
-        args[0]['properties']['fontfamily'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetTextHAlignFunc':
-        args[0]['properties']['halign'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetTextSizeFunc':
-        args[0]['properties']['textsize'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetTextVAlignFunc':
-        args[0]['properties']['valign'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetToolTipFunc':
-        args[0]['properties']['tooltip'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableCellSetWidthFunc':
-        args[0]['properties']['width'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableClearFunc':
-        args[0]['rows'] = []
-        return args[0]
-        
-    elif operation_name == 'tableDeleteFunc':
-        return None
-        
-    elif operation_name == 'tableMergeCellsFunc':
-        start_row = args[1]
-        end_row = args[2]
-        start_col = args[3]
-        end_col = args[4]
-        args[0]['merged_cells'].append({
-            'start_row': start_row,
-            'end_row': end_row,
-            'start_col': start_col,
-            'end_col': end_col
-        })
-        return args[0]
-        
-    elif operation_name == 'tableNewFunc':
-        return {
-            'rows': [],
-            'headers': [],
-            'merged_cells': [],
-            'properties': {}
-        }
-        
-    elif operation_name == 'tableSetBgColFunc':
-        args[0]['properties']['bgcolor'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableSetBorderColFunc':
-        args[0]['properties']['bordercolor'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableSetBorderWidthFunc':
-        args[0]['properties']['borderwidth'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableSetFrameColFunc':
-        args[0]['properties']['framecolor'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableSetFrameWidthFunc':
-        args[0]['properties']['framewidth'] = args[1]
-        return args[0]
-        
-    elif operation_name == 'tableSetPositionFunc':
-        args[0]['properties']['position'] = args[1]
-        return args[0]
+@builtin('tableSetBgColFunc')
+def _table_tableSetBgColFunc(self, operation_name, args):
+    args[0]['properties']['bgcolor'] = args[1]
+    return args[0]
 
-    return None
+@builtin('tableSetBorderColFunc')
+def _table_tableSetBorderColFunc(self, operation_name, args):
+    args[0]['properties']['bordercolor'] = args[1]
+    return args[0]
+
+@builtin('tableSetBorderWidthFunc')
+def _table_tableSetBorderWidthFunc(self, operation_name, args):
+    args[0]['properties']['borderwidth'] = args[1]
+    return args[0]
 
+@builtin('tableSetFrameColFunc')
+def _table_tableSetFrameColFunc(self, operation_name, args):
+    args[0]['properties']['framecolor'] = args[1]
+    return args[0]
+
+@builtin('tableSetFrameWidthFunc')
+def _table_tableSetFrameWidthFunc(self, operation_name, args):
+    args[0]['properties']['framewidth'] = args[1]
+    return args[0]
+
+@builtin('tableSetPositionFunc')
+def _table_tableSetPositionFunc(self, operation_name, args):
+    args[0]['properties']['position'] = args[1]
+    return args[0]
 
 
 #weird
-def _handle_weird_operation(self, operation_name, args):
-    if operation_name == 'dayOfMonthFunc':
-        return datetime.now().day
-    
-    elif operation_name == 'dayOfWeekFunc':
-        return datetime.now().weekday()
-    
-    elif operation_name == 'fillFunc':
-        return args[0]
-    
-    elif operation_name == 'fixNanFunc':
-        return args[1] if args[0] is None or math.isnan(args[0]) else args[0]
-    
-    elif operation_name == 'floatFunc':
-        return float(args[0])
-    
-    elif operation_name == 'hLineFunc':
-        return {'price': args[0], 'color': args[1] if len(args) > 1 else None}
-    
-    elif operation_name == 'hourFunc':
-        return datetime.now().hour
-    
-    elif operation_name == 'indicatorFunc':
-        return {'name': args[0], 'parameters': args[1:]}
-    
-    elif operation_name == 'maxBarsBackFunc':
-        return args[0]
-    
-    elif operation_name == 'minuteFunc':
-        return datetime.now().minute
-    
-    elif operation_name == 'monthFunc':
-        return datetime.now().month
-    
-    elif operation_name == 'naFunc':
-        return None
-    
-    elif operation_name == 'nzFunc':
-        return args[1] if args[0] is None else args[0]
-    
-    elif operation_name == 'barColFunc':
-        return args[0]
-    
-    elif operation_name == 'bgColFunc':
-        return args[0]
-    
-    elif operation_name == 'boolFunc':
-        return bool(args[0])
+@builtin('dayOfMonthFunc')
+def _weird_dayOfMonthFunc(self, operation_name, args):
+    return datetime.now().day
 
-    elif operation_name == 'polylineDeleteFunc':
-        return None
-        
-    elif operation_name == 'polylineNewFunc':
-        return {'points': [], 'color': args[0] if args else None}
-        
-    elif operation_name == 'requestCurrencyRateFunc':
-        return {'currency': args[0], 'rate': args[1]}
-        
-    elif operation_name == 'requestDividendsFunc':
-        return {'symbol': args[0], 'dividends': args[1]}
-        
-    elif operation_name == 'requestEarningsFunc':
-        return {'symbol': args[0], 'earnings': args[1]}
-        
-    elif operation_name == 'requestEconomicFunc':
-        return {'indicator': args[0], 'value': args[1]}
-        
-    elif operation_name == 'requestFinancialFunc':
-        return {'symbol': args[0], 'data': args[1]}
-        
-    elif operation_name == 'requestQuandlFunc':
-        return {'code': args[0], 'data': args[1]}
-        
-    elif operation_name == 'requestSecurityFunc':
-        return {'symbol': args[0], 'data': args[1]}
-        
-    elif operation_name == 'requestSecurityLowerTfFunc':
-        return {'symbol': args[0], 'timeframe': args[1], 'data': args[2]}
-        
-    elif operation_name == 'requestSeedFunc':
-        return args[0]
-        
-    elif operation_name == 'requestSplitsFunc':
-        return {'symbol': args[0], 'splits': args[1]}
-        
-    elif operation_name == 'runtimeErrorFunc':
-        raise RuntimeError(args[0])
-        
-    elif operation_name == 'secondFunc':
-        return datetime.now().second
+@builtin('dayOfWeekFunc')
+def _weird_dayOfWeekFunc(self, operation_name, args):
+    return datetime.now().weekday()
+
+@builtin('fillFunc')
+def _weird_fillFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('fixNanFunc')
+def _weird_fixNanFunc(self, operation_name, args):
+    return args[1] if args[0] is None or math.isnan(args[0]) else args[0]
+
+@builtin('floatFunc')
+def _weird_floatFunc(self, operation_name, args):
+    return float(args[0])
+
+@builtin('hLineFunc')
+def _weird_hLineFunc(self, operation_name, args):
+    return {'price': args[0], 'color': args[1] if len(args) > 1 else None}
+
+@builtin('hourFunc')
+def _weird_hourFunc(self, operation_name, args):
+    return datetime.now().hour
+
+@builtin('indicatorFunc')
+def _weird_indicatorFunc(self, operation_name, args):
+    return {'name': args[0], 'parameters': args[1:]}
+
+@builtin('maxBarsBackFunc')
+def _weird_maxBarsBackFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('minuteFunc')
+def _weird_minuteFunc(self, operation_name, args):
+    return datetime.now().minute
+
+@builtin('monthFunc')
+def _weird_monthFunc(self, operation_name, args):
+    return datetime.now().month
+
+@builtin('naFunc')
+def _weird_naFunc(self, operation_name, args):
+    return None
+
+@builtin('nzFunc')
+def _weird_nzFunc(self, operation_name, args):
+    return args[1] if args[0] is None else args[0]
 
+@builtin('barColFunc')
+def _weird_barColFunc(self, operation_name, args):
+    return args[0]
 
+@builtin('bgColFunc')
+def _weird_bgColFunc(self, operation_name, args):
+    return args[0]
 
+@builtin('boolFunc')
+def _weird_boolFunc(self, operation_name, args):
+    return bool(args[0])
+
+@builtin('polylineDeleteFunc')
+def _weird_polylineDeleteFunc(self, operation_name, args):
+    return None
+
+@builtin('polylineNewFunc')
+def _weird_polylineNewFunc(self, operation_name, args):
+    return {'points': [], 'color': args[0] if args else None}
+
+@builtin('requestCurrencyRateFunc')
+def _weird_requestCurrencyRateFunc(self, operation_name, args):
+    return {'currency': args[0], 'rate': args[1]}
+
+@builtin('requestDividendsFunc')
+def _weird_requestDividendsFunc(self, operation_name, args):
+    return {'symbol': args[0], 'dividends': args[1]}
+
+@builtin('requestEarningsFunc')
+def _weird_requestEarningsFunc(self, operation_name, args):
+    return {'symbol': args[0], 'earnings': args[1]}
+
+@builtin('requestEconomicFunc')
+def _weird_requestEconomicFunc(self, operation_name, args):
+    return {'indicator': args[0], 'value': args[1]}
+
+@builtin('requestFinancialFunc')
+def _weird_requestFinancialFunc(self, operation_name, args):
+    return {'symbol': args[0], 'data': args[1]}
+
+@builtin('requestQuandlFunc')
+def _weird_requestQuandlFunc(self, operation_name, args):
+    return {'code': args[0], 'data': args[1]}
+
+@builtin('requestSecurityFunc')
+def _weird_requestSecurityFunc(self, operation_name, args):
+    return {'symbol': args[0], 'data': args[1]}
+
+@builtin('requestSecurityLowerTfFunc')
+def _weird_requestSecurityLowerTfFunc(self, operation_name, args):
+    return {'symbol': args[0], 'timeframe': args[1], 'data': args[2]}
+
+@builtin('requestSeedFunc')
+def _weird_requestSeedFunc(self, operation_name, args):
+    return args[0]
+
+@builtin('requestSplitsFunc')
+def _weird_requestSplitsFunc(self, operation_name, args):
+    return {'symbol': args[0], 'splits': args[1]}
+
+@builtin('runtimeErrorFunc')
+def _weird_runtimeErrorFunc(self, operation_name, args):
+    raise RuntimeError(args[0])
+
+@builtin('secondFunc')
+def _weird_secondFunc(self, operation_name, args):
+    return datetime.now().second
+
+
+#alert and log
+@builtin('alertFunc')
+def _alert_alertFunc(self, operation_name, args):
+    print(f"ALERT: {args[0]}")
+    return None
+
+@builtin('alertConditionFunc')
+def _alert_alertConditionFunc(self, operation_name, args):
+    return args[0] and args[1]
+
+
+@builtin('logErrorFunc')
+def _log_logErrorFunc(self, operation_name, args):
+    print(f"ERROR: {args[0]}")
+    return None
+
+@builtin('logInfoFunc')
+def _log_logInfoFunc(self, operation_name, args):
+    print(f"INFO: {args[0]}")
+    return None
+
+@builtin('logWarningFunc')
+def _log_logWarningFunc(self, operation_name, args):
+    print(f"WARNING: {args[0]}")
+    return None
 
 
 #ta functions
-def _handle_ta_operation(self, operation_name, args):
-    if operation_name == 'taAlmaFunc':
-        return self._calculate_alma(args[0], args[1], args[2], args[3])
-        
-    elif operation_name == 'taAtrFunc':
-        return self._calculate_atr(args[0], args[1], args[2], args[3])
-        
-    elif operation_name == 'taBarsSinceFunc':
-        return self._calculate_bars_since(args[0])
-        
-    elif operation_name == 'taBbFunc':
-        return self._calculate_bollinger_bands(args[0], args[1], args[2])
-        
-    elif operation_name == 'taBbwFunc':
-        return self._calculate_bb_width(args[0], args[1], args[2])
-        
-    elif operation_name == 'taCciFunc':
-        return self._calculate_cci(args[0], args[1])
-        
-    elif operation_name == 'taChangeFunc':
-        return self._calculate_change(args[0])
-        
-    elif operation_name == 'taCmoFunc':
-        return self._calculate_cmo(args[0], args[1])
-        
-    elif operation_name == 'taCogFunc':
-        return self._calculate_cog(args[0], args[1])
-        
-    elif operation_name == 'taCorrelationFunc':
-        return self._calculate_correlation(args[0], args[1], args[2])
-        
-    elif operation_name == 'taCrossFunc':
-        return self._check_cross(args[0], args[1])
-        
-    elif operation_name == 'taCrossoverFunc':
-        return self._check_crossover(args[0], args[1])
-        
-    elif operation_name == 'taCrossunderFunc':
-        return self._check_crossunder(args[0], args[1])
-        
-    elif operation_name == 'taCumFunc':
-        return self._calculate_cumulative(args[0])
-        
-    elif operation_name == 'taDevFunc':
-        return self._calculate_deviation(args[0], args[1])
-        
-    elif operation_name == 'taDmiFunc':
-        return self._calculate_dmi(args[0], args[1])
-        
-    elif operation_name == 'taEmaFunc':
-        return self._calculate_ema(args[0], args[1])
-        
-    elif operation_name == 'taFallingFunc':
-        return self._check_falling(args[0], args[1])
-        
-    elif operation_name == 'taHighestFunc':
-        return self._find_highest(args[0], args[1])
-        
-    elif operation_name == 'taHighestBarsFunc':
-        return self._find_highest_bars(args[0], args[1])
-        
-    elif operation_name == 'taHmaFunc':
-        return self._calculate_hma(args[0], args[1])
-        
-    elif operation_name == 'taKcFunc':
-        return self._calculate_keltner_channels(args[0], args[1], args[2])
-        
-    elif operation_name == 'taKcwFunc':
-        return self._calculate_kc_width(args[0], args[1], args[2])
-        
-    elif operation_name == 'taLinRegFunc':
-        return self._calculate_linear_regression(args[0], args[1])
-        
-    elif operation_name == 'taLowestFunc':
-        return self._find_lowest(args[0], args[1])
-        
-    elif operation_name == 'taLowestBarsFunc':
-        return self._find_lowest_bars(args[0], args[1])
-        
-    elif operation_name == 'taMacdFunc':
-        return self._calculate_macd(args[0], args[1], args[2], args[3])
-        
-    elif operation_name == 'taMaxFunc':
-        return self._calculate_max(args[0], args[1])
-        
-    elif operation_name == 'taMedianFunc':
-        return self._calculate_median(args[0], args[1])
-        
-    elif operation_name == 'taMfiFunc':
-        return self._calculate_mfi(args[0], args[1], args[2], args[3], args[4])
-        
-    elif operation_name == 'taMinFunc':
-        return self._calculate_min(args[0], args[1])
-        
-    elif operation_name == 'taModeFunc':
-        return self._calculate_mode(args[0], args[1])
-        
-    elif operation_name == 'taMomFunc':
-        return self._calculate_momentum(args[0], args[1])
-        
-    elif operation_name == 'taPercentileLinearInterpolationFunc':
-        return self._calculate_percentile_linear(args[0], args[1], args[2])
-        
-    elif operation_name == 'taPercentileNearestRankFunc':
-        return self._calculate_percentile_rank(args[0], args[1], args[2])
-        
-    elif operation_name == 'taPercentRankFunc':
-        return self._calculate_percent_rank(args[0], args[1])
-        
-    elif operation_name == 'taPivotPointLevelsFunc':
-        return self._calculate_pivot_points(args[0], args[1], args[2], args[3])
-        
-    elif operation_name == 'taPivotHighFunc':
-        return self._find_pivot_high(args[0], args[1], args[2])
-        
-    elif operation_name == 'taPivotLowFunc':
-        return self._find_pivot_low(args[0], args[1], args[2])
-        
-    elif operation_name == 'taRangeFunc':
-        return self._calculate_range(args[0], args[1])
-        
-    elif operation_name == 'taRisingFunc':
-        return self._check_rising(args[0], args[1])
-        
-    elif operation_name == 'taRmaFunc':
-        return self._calculate_rma(args[0], args[1])
-        
-    elif operation_name == 'taRocFunc':
-        return self._calculate_roc(args[0], args[1])
-        
-    elif operation_name == 'taRsiFunc':
-        return self._calculate_rsi(args[0], args[1])
-        
-    elif operation_name == 'taSarFunc':
-        return self._calculate_sar(args[0], args[1], args[2], args[3])
-        
-    elif operation_name == 'taSmaFunc':
-        return self._calculate_sma(args[0], args[1])
-        
-    elif operation_name == 'taStdevFunc':
-        return self._calculate_stdev(args[0], args[1])
-        
-    elif operation_name == 'taStochFunc':
-        return self._calculate_stoch(args[0], args[1], args[2], args[3], args[4])
-        
-    elif operation_name == 'taSuperTrendFunc':
-        return self._calculate_supertrend(args[0], args[1], args[2])
-        
-    elif operation_name == 'taSwmaFunc':
-        return self._calculate_swma(args[0])
-        
-    elif operation_name == 'taTrFunc':
-        return self._calculate_true_range(args[0], args[1], args[2])
-        
-    elif operation_name == 'taTsiFunc':
-        return self._calculate_tsi(args[0], args[1], args[2])
-        
-    elif operation_name == 'taValueWhenFunc':
-        return self._get_value_when(args[0], args[1])
-        
-    elif operation_name == 'taVarianceFunc':
-        return self._calculate_variance(args[0], args[1])
-        
-    elif operation_name == 'taVwapFunc':
-        return self._calculate_vwap(args[0], args[1], args[2])
-        
-    elif operation_name == 'taVwmaFunc':
-        return self._calculate_vwma(args[0], args[1], args[2])
-        
-    elif operation_name == 'taWmaFunc':
-        return self._calculate_wma(args[0], args[1])
-        
-    elif operation_name == 'taWprFunc':
-        return self._calculate_wpr(args[0], args[1], args[2], args[3])
+def _ta_taAlmaFunc(self, operation_name, args):
+    return self._calculate_alma(args[0], args[1], args[2], args[3])
+
+def _ta_taAtrFunc(self, operation_name, args):
+    return self._calculate_atr(args[0], args[1], args[2], args[3])
+
+def _ta_taBarsSinceFunc(self, operation_name, args):
+    return self._calculate_bars_since(args[0])
+
+def _ta_taBbFunc(self, operation_name, args):
+    return self._calculate_bollinger_bands(args[0], args[1], args[2])
+
+def _ta_taBbwFunc(self, operation_name, args):
+    return self._calculate_bb_width(args[0], args[1], args[2])
+
+def _ta_taCciFunc(self, operation_name, args):
+    return self._calculate_cci(args[0], args[1])
+
+def _ta_taChangeFunc(self, operation_name, args):
+    return self._calculate_change(args[0])
+
+def _ta_taCmoFunc(self, operation_name, args):
+    return self._calculate_cmo(args[0], args[1])
+
+def _ta_taCogFunc(self, operation_name, args):
+    return self._calculate_cog(args[0], args[1])
+
+def _ta_taCorrelationFunc(self, operation_name, args):
+    return self._calculate_correlation(args[0], args[1], args[2])
+
+def _ta_taCrossFunc(self, operation_name, args):
+    return self._check_cross(args[0], args[1])
+
+def _ta_taCrossoverFunc(self, operation_name, args):
+    return self._check_crossover(args[0], args[1])
+
+def _ta_taCrossunderFunc(self, operation_name, args):
+    return self._check_crossunder(args[0], args[1])
+
+def _ta_taCumFunc(self, operation_name, args):
+    return self._calculate_cumulative(args[0])
+
+def _ta_taDevFunc(self, operation_name, args):
+    return self._calculate_deviation(args[0], args[1])
+
+def _ta_taDmiFunc(self, operation_name, args):
+    return self._calculate_dmi(args[0], args[1])
+
+def _ta_taEmaFunc(self, operation_name, args):
+    return self._calculate_ema(args[0], args[1])
+
+def _ta_taFallingFunc(self, operation_name, args):
+    return self._check_falling(args[0], args[1])
+
+def _ta_taHighestFunc(self, operation_name, args):
+    return self._find_highest(args[0], args[1])
+
+def _ta_taHighestBarsFunc(self, operation_name, args):
+    return self._find_highest_bars(args[0], args[1])
+
+def _ta_taHmaFunc(self, operation_name, args):
+    return self._calculate_hma(args[0], args[1])
+
+def _ta_taKcFunc(self, operation_name, args):
+    return self._calculate_keltner_channels(args[0], args[1], args[2])
+
+def _ta_taKcwFunc(self, operation_name, args):
+    return self._calculate_kc_width(args[0], args[1], args[2])
 
+def _ta_taLinRegFunc(self, operation_name, args):
+    return self._calculate_linear_regression(args[0], args[1])
+
+def _ta_taLowestFunc(self, operation_name, args):
+    return self._find_lowest(args[0], args[1])
+
+def _ta_taLowestBarsFunc(self, operation_name, args):
+    return self._find_lowest_bars(args[0], args[1])
+
+def _ta_taMacdFunc(self, operation_name, args):
+    return self._calculate_macd(args[0], args[1], args[2], args[3])
+
+def _ta_taMaxFunc(self, operation_name, args):
+    return self._calculate_max(args[0], args[1])
+
+def _ta_taMedianFunc(self, operation_name, args):
+    return self._calculate_median(args[0], args[1])
+
+def _ta_taMfiFunc(self, operation_name, args):
+    return self._calculate_mfi(args[0], args[1], args[2], args[3], args[4])
+
+def _ta_taMinFunc(self, operation_name, args):
+    return self._calculate_min(args[0], args[1])
+
+def _ta_taModeFunc(self, operation_name, args):
+    return self._calculate_mode(args[0], args[1])
+
+def _ta_taMomFunc(self, operation_name, args):
+    return self._calculate_momentum(args[0], args[1])
+
+def _ta_taPercentileLinearInterpolationFunc(self, operation_name, args):
+    return self._calculate_percentile_linear(args[0], args[1], args[2])
+
+def _ta_taPercentileNearestRankFunc(self, operation_name, args):
+    return self._calculate_percentile_rank(args[0], args[1], args[2])
+
+def _ta_taPercentRankFunc(self, operation_name, args):
+    return self._calculate_percent_rank(args[0], args[1])
+
+def _ta_taPivotPointLevelsFunc(self, operation_name, args):
+    return self._calculate_pivot_points(args[0], args[1], args[2], args[3])
+
+def _ta_taPivotHighFunc(self, operation_name, args):
+    return self._find_pivot_high(args[0], args[1], args[2])
+
+def _ta_taPivotLowFunc(self, operation_name, args):
+    return self._find_pivot_low(args[0], args[1], args[2])
+
+def _ta_taRangeFunc(self, operation_name, args):
+    return self._calculate_range(args[0], args[1])
+
+def _ta_taRisingFunc(self, operation_name, args):
+    return self._check_rising(args[0], args[1])
+
+def _ta_taRmaFunc(self, operation_name, args):
+    return self._calculate_rma(args[0], args[1])
+
+def _ta_taRocFunc(self, operation_name, args):
+    return self._calculate_roc(args[0], args[1])
+
+def _ta_taRsiFunc(self, operation_name, args):
+    return self._calculate_rsi(args[0], args[1])
+
+def _ta_taSarFunc(self, operation_name, args):
+    return self._calculate_sar(args[0], args[1], args[2], args[3])
+
+def _ta_taSmaFunc(self, operation_name, args):
+    return self._calculate_sma(args[0], args[1])
+
+def _ta_taStdevFunc(self, operation_name, args):
+    return self._calculate_stdev(args[0], args[1])
+
+def _ta_taStochFunc(self, operation_name, args):
+    return self._calculate_stoch(args[0], args[1], args[2], args[3], args[4])
+
+def _ta_taSuperTrendFunc(self, operation_name, args):
+    return self._calculate_supertrend(args[0], args[1], args[2])
+
+def _ta_taSwmaFunc(self, operation_name, args):
+    return self._calculate_swma(args[0])
+
+def _ta_taTrFunc(self, operation_name, args):
+    return self._calculate_true_range(args[0], args[1], args[2])
+
+def _ta_taTsiFunc(self, operation_name, args):
+    return self._calculate_tsi(args[0], args[1], args[2])
+
+def _ta_taValueWhenFunc(self, operation_name, args):
+    return self._get_value_when(args[0], args[1])
+
+def _ta_taVarianceFunc(self, operation_name, args):
+    return self._calculate_variance(args[0], args[1])
+
+def _ta_taVwapFunc(self, operation_name, args):
+    return self._calculate_vwap(args[0], args[1], args[2])
+
+def _ta_taVwmaFunc(self, operation_name, args):
+    return self._calculate_vwma(args[0], args[1], args[2])
+
+def _ta_taWmaFunc(self, operation_name, args):
+    return self._calculate_wma(args[0], args[1])
+
+def _ta_taWprFunc(self, operation_name, args):
+    return self._calculate_wpr(args[0], args[1], args[2], args[3])
+
+
+TA_OPERATIONS = {
+    'taAlmaFunc': _ta_taAlmaFunc,
+    'taAtrFunc': _ta_taAtrFunc,
+    'taBarsSinceFunc': _ta_taBarsSinceFunc,
+    'taBbFunc': _ta_taBbFunc,
+    'taBbwFunc': _ta_taBbwFunc,
+    'taCciFunc': _ta_taCciFunc,
+    'taChangeFunc': _ta_taChangeFunc,
+    'taCmoFunc': _ta_taCmoFunc,
+    'taCogFunc': _ta_taCogFunc,
+    'taCorrelationFunc': _ta_taCorrelationFunc,
+    'taCrossFunc': _ta_taCrossFunc,
+    'taCrossoverFunc': _ta_taCrossoverFunc,
+    'taCrossunderFunc': _ta_taCrossunderFunc,
+    'taCumFunc': _ta_taCumFunc,
+    'taDevFunc': _ta_taDevFunc,
+    'taDmiFunc': _ta_taDmiFunc,
+    'taEmaFunc': _ta_taEmaFunc,
+    'taFallingFunc': _ta_taFallingFunc,
+    'taHighestFunc': _ta_taHighestFunc,
+    'taHighestBarsFunc': _ta_taHighestBarsFunc,
+    'taHmaFunc': _ta_taHmaFunc,
+    'taKcFunc': _ta_taKcFunc,
+    'taKcwFunc': _ta_taKcwFunc,
+    'taLinRegFunc': _ta_taLinRegFunc,
+    'taLowestFunc': _ta_taLowestFunc,
+    'taLowestBarsFunc': _ta_taLowestBarsFunc,
+    'taMacdFunc': _ta_taMacdFunc,
+    'taMaxFunc': _ta_taMaxFunc,
+    'taMedianFunc': _ta_taMedianFunc,
+    'taMfiFunc': _ta_taMfiFunc,
+    'taMinFunc': _ta_taMinFunc,
+    'taModeFunc': _ta_taModeFunc,
+    'taMomFunc': _ta_taMomFunc,
+    'taPercentileLinearInterpolationFunc': _ta_taPercentileLinearInterpolationFunc,
+    'taPercentileNearestRankFunc': _ta_taPercentileNearestRankFunc,
+    'taPercentRankFunc': _ta_taPercentRankFunc,
+    'taPivotPointLevelsFunc': _ta_taPivotPointLevelsFunc,
+    'taPivotHighFunc': _ta_taPivotHighFunc,
+    'taPivotLowFunc': _ta_taPivotLowFunc,
+    'taRangeFunc': _ta_taRangeFunc,
+    'taRisingFunc': _ta_taRisingFunc,
+    'taRmaFunc': _ta_taRmaFunc,
+    'taRocFunc': _ta_taRocFunc,
+    'taRsiFunc': _ta_taRsiFunc,
+    'taSarFunc': _ta_taSarFunc,
+    'taSmaFunc': _ta_taSmaFunc,
+    'taStdevFunc': _ta_taStdevFunc,
+    'taStochFunc': _ta_taStochFunc,
+    'taSuperTrendFunc': _ta_taSuperTrendFunc,
+    'taSwmaFunc': _ta_taSwmaFunc,
+    'taTrFunc': _ta_taTrFunc,
+    'taTsiFunc': _ta_taTsiFunc,
+    'taValueWhenFunc': _ta_taValueWhenFunc,
+    'taVarianceFunc': _ta_taVarianceFunc,
+    'taVwapFunc': _ta_taVwapFunc,
+    'taVwmaFunc': _ta_taVwmaFunc,
+    'taWmaFunc': _ta_taWmaFunc,
+    'taWprFunc': _ta_taWprFunc,
+}
+
+
+@builtin(*TA_OPERATIONS)
+def _handle_ta_operation(self, operation_name, args, call_site=None):
+    # Per-bar (scalar) sources advance a streaming kernel in O(1); a full
+    # history list or array is computed in one batch by the helpers below.
+    operation = TA_OPERATIONS.get(operation_name)
+    batch = operation is not None and args and isinstance(args[0], (list, tuple, np.ndarray))
+    stream = getattr(self, 'ta_stream', None)
+    if not batch and stream is not None and stream.supports(operation_name, args):
+        bar_index = getattr(self, 'bar_index', None)
+        if bar_index is None:
+            bar_index = getattr(self, 'environment', {}).get('barIndex')
+        return stream.update(call_site, operation_name, args, bar_index)
+
+    if operation is not None:
+        return operation(self, operation_name, args)
     return None
 
 
@@ -5524,9 +5771,20 @@ class ResultFormatter:
 """---------------------------------------------------------------------------------------------------------------------------------------------"""
 
 
+#builtin registry
+
+def bind_builtins(evaluator):
+    """name -> Builtin whose func is bound to `evaluator`"""
+    return {name: entry._replace(func=types.MethodType(entry.func, evaluator)) for name, entry in BUILTINS.items()}
+
+
+"""---------------------------------------------------------------------------------------------------------------------------------------------"""
+
+
 #final evaluation#
-def evaluate_with_env(self, env):
+def evaluate_with_env(self, env, bar_index=None):
         self.environment = env
+        self.bar_index = bar_index
         return self._evaluate(self.ast)
 
 def interpret(source_code):
@@ -1,128 +1,264 @@
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
+from bisect import bisect_left
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 import math
+import os
 import numpy as np
 import talib
 
+from .inter_pine.core.compiler import Compiler
+from .inter_pine.core.exceptions import ParserError
+from .inter_pine.core import parser as pine_parser, tokenizer as pine_tokenizer
+from .inter_pine.utils.ring_buffer import RingBuffer
+from .inter_pine.utils.script_cache import ScriptCache
+
 """-----------------------------------------------------------------------------------------------------------------------------------------"""
 #innitialization and configuration
 
+SYNTAX_NAMES = frozenset([
+    'open', 'high', 'low', 'close', 'volume', 'hl2', 'hlc3', 'hlcc4', 'ohlc4', 'symInfoMinMove',
+    'symInfoMinTick', 'symInfoPointValue', 'symInfoPrefix', 'symInfoPriceScale', 'symInfoRoot',
+    'symInfoSector', 'symInfoSession', 'symInfoShareholders', 'symInfoSharesOutstandingFloat',
+    'symInfoSharesOutstandingTotal', 'sma', 'ema', 'rsi', 'minvalue', 'maxvalue', 'taAccDist', 'taIII',
+    'taNVI', 'taOBV', 'taPVI', 'taPVT', 'taTR', 'taVWAP', 'taWAD', 'taWVAD', 'taAlma', 'taAtr',
+    'taBarsSince', 'taBb', 'taBbw', 'taCci', 'taChange', 'taCmo', 'taCog', 'taCorrelation', 'taCross',
+    'taCrossover', 'taCrossunder', 'taCum', 'taDev', 'taDmi', 'taEma', 'taFalling', 'taHighest',
+    'taHighestBars', 'taHma', 'taKc', 'taKcw', 'taLinReg', 'taLowest', 'taLowestBars', 'taMacd', 'taMax',
+    'taMedian', 'taMfi', 'taMin', 'taMode', 'taMom', 'taPercentile', 'taPercentRank', 'taPivotHigh',
+    'taPivotLow', 'taRange', 'taRising', 'taRma', 'taRoc', 'taRsi', 'taSar', 'taSma', 'taStdev', 'taStoch',
+    'taSuperTrend', 'taSwma', 'taTsi', 'taValueWhen', 'taVariance', 'taVwap', 'taVwma', 'taWma', 'taWpr',
+    'strategyAccountCurrency', 'strategyAvgLosingTrade', 'strategyAvgLosingTradePercent', 'strategyAvgTrade',
+    'strategyAvgTradePercent', 'strategyAvgWinningTrade', 'strategyAvgWinningTradePercent',
+    'strategyClosedTrades', 'strategyClosedTradesFirstIndex', 'strategyEquity', 'strategyEvenTrades',
+    'strategyGrossLoss', 'strategyGrossLossPercent', 'strategyGrossProfit', 'strategyGrossProfitPercent',
+    'strategyInitialCapital', 'strategyLossTrades', 'strategyMarginLiquidationPrice',
+    'strategyMaxContractsHeldAll', 'strategyMaxContractsHeldLong', 'strategyMaxContractsHeldShort',
+    'strategyMaxDrawdown', 'strategyMaxDrawdownPercent', 'strategyMaxRunup', 'strategyMaxRunupPercent',
+    'strategyNetProfit', 'strategyNetProfitPercent', 'strategyOpenProfit', 'strategyOpenProfitPercent',
+    'strategyOpenTrades', 'strategyOpenTradesCapitalHeld', 'strategyPositionAvgPrice',
+    'strategyPositionEntryName', 'strategyPositionSize', 'strategyWinTrades', 'dayOfMonth', 'dayOfWeek',
+    'hour', 'minute', 'month', 'second', 'time', 'timeClose', 'timeTradingDay', 'timeNow', 'weekOfYear',
+    'year', 'sessionIsFirstBar', 'sessionIsFirstBarRegular', 'sessionIsLastBar', 'sessionIsLastBarRegular',
+    'sessionIsMarket', 'sessionIsPostMarket', 'sessionIsPreMarket', 'boxAll', 'chartBgCol', 'chartFgCol',
+    'chartIsHeikinAshi', 'chartIsKagi', 'chartIsLineBreak', 'chartIsPnf', 'chartIsRange', 'chartIsRenko',
+    'chartIsStandard', 'chartLeftVisibleBarTime', 'chartRightVisibleBarTime', 'labelAll', 'lineAll',
+    'lineFillAll', 'polylineAll', 'tableAll', 'andOp', 'enumType', 'exportFunc', 'forLoop', 'forInLoop',
+    'ifCond', 'importFunc', 'methodFunc', 'notOp', 'orOp', 'switchCase', 'typeDef', 'let', 'letip',
+    'whileLoop', 'barIndex', 'barStateIsConfirmed', 'barStateIsFirst', 'barStateIsHistory', 'barStateIsLast',
+    'barStateIsLastConfirmedHistory', 'barStateIsNew', 'barStateIsRealtime', 'dividendsFutureAmount',
+    'dividendsFutureExDate', 'dividendsFuturePayDate', 'earningsFutureEps', 'earningsFuturePeriodEndTime',
+    'earningsFutureRevenue', 'earningsFutureTime', 'lastBarIndex', 'lastBarTime', 'na',
+    'symInfoBaseCurrency', 'symInfoCountry', 'symInfoCurrency', 'symInfoDescription', 'symInfoEmployees',
+    'symInfoExpirationDate', 'symInfoIndustry', 'symInfoMainTickerId', 'symInfoMinContract',
+    'symInfoRecommendationsBuy', 'symInfoRecommendationsBuyStrong', 'symInfoRecommendationsDate',
+    'symInfoRecommendationsHold', 'symInfoRecommendationsSell', 'symInfoRecommendationsSellStrong',
+    'symInfoRecommendationsTotal', 'symInfoTargetPriceAverage', 'symInfoTargetPriceDate',
+    'symInfoTargetPriceEstimates', 'symInfoTargetPriceHigh', 'symInfoTargetPriceLow',
+    'symInfoTargetPriceMedian', 'symInfoTicker', 'symInfoTickerId', 'symInfoTimezone', 'symInfoType',
+    'symInfoVolumeType', 'timeframeIsDaily', 'timeframeIsDWM', 'timeframeIsIntraday', 'timeframeIsMinutes',
+    'timeframeIsMonthly', 'timeframeIsSeconds', 'timeframeIsTicks', 'timeframeIsWeekly',
+    'timeframeMainPeriod', 'timeframeMultiplier', 'timeframePeriod', 'showStyleArea', 'showStyleAreaBr',
+    'showStyleCircles', 'showStyleColumns', 'showStyleCross', 'showStyleHistogram', 'showStyleLine',
+    'showStyleLineBr', 'showStyleStepLine', 'showStyleStepLineDiamond', 'showStyleStepLineBr',
+    'positionBottomCenter', 'positionBottomLeft', 'positionBottomRight', 'positionMiddleCenter',
+    'positionMiddleLeft', 'positionMiddleRight', 'positionTopCenter', 'positionTopLeft', 'positionTopRight',
+    'scaleLeft', 'scaleNone', 'scaleRight', 'sessionExtended', 'sessionRegular', 'settlementAsCloseInherit',
+    'settlementAsCloseOff', 'settlementAsCloseOn', 'shapeArrowDown', 'shapeArrowUp', 'shapeCircle',
+    'shapeCross', 'shapeDiamond', 'shapeFlag', 'shapeLabelDown', 'shapeLabelUp', 'shapeSquare',
+    'shapeTriangleDown', 'shapeTriangleUp', 'shapeXCross', 'sizeAuto', 'sizeHuge', 'sizeLarge', 'sizeNormal',
+    'sizeSmall', 'sizeTiny', 'splitsDenominator', 'splitsNumerator', 'strategyCash',
+    'strategyCommissionCashPerContract', 'strategyCommissionCashPerOrder', 'strategyCommissionPercent',
+    'strategyDirectionAll', 'strategyDirectionLong', 'strategyDirectionShort', 'strategyFixed',
+    'strategyLong', 'strategyOcaCancel', 'strategyOcaNone', 'strategyOcaReduce', 'strategyPercentOfEquity',
+    'strategyShort', 'textAlignBottom', 'textAlignCenter', 'textAlignLeft', 'textAlignRight', 'textAlignTop',
+    'textWrapAuto', 'textWrapNone', 'trueValue', 'xLocBarIndex', 'xLocBarTime', 'yLocAboveBar',
+    'yLocBelowBar', 'yLocPrice', 'adjustmentDividends', 'adjustmentNone', 'adjustmentSplits', 'alertFreqAll',
+    'alertFreqOncePerBar', 'alertFreqOncePerBarClose', 'backAdjustmentInherit', 'backAdjustmentOff',
+    'backAdjustmentOn', 'barMergeGapsOff', 'barMergeGapsOn', 'barMergeLookaheadOff', 'barMergeLookaheadOn',
+    'colAqua', 'colBlack', 'colBlue', 'colFuchsia', 'colGray', 'colGreen', 'colLime', 'colMaroon', 'colNavy',
+    'colOlive', 'colOrange', 'colPurple', 'colRed', 'colSilver', 'colTeal', 'colWhite', 'colYellow',
+    'currencyAUD', 'currencyBTC', 'currencyCAD', 'currencyCHF', 'currencyETH', 'currencyEUR', 'currencyGBP',
+    'currencyHKD', 'currencyINR', 'currencyJPY', 'currencyKRW', 'currencyMYR', 'currencyNOK', 'currencyNone',
+    'currencyNZD', 'currencyRUB', 'currencySEK', 'currencySGD', 'currencyTRY', 'currencyUSD', 'currencyUSDT',
+    'currencyZAR', 'dayOfWeekFriday', 'dayOfWeekMonday', 'dayOfWeekSaturday', 'dayOfWeekSunday',
+    'dayOfWeekThursday', 'dayOfWeekTuesday', 'dayOfWeekWednesday', 'displayAll', 'displayDataWindow',
+    'displayNone', 'displayPane', 'displayPriceScale', 'displayStatusLine', 'dividendsGross', 'dividendsNet',
+    'earningsActual', 'earningsEstimate', 'earningsStandardized', 'extendBoth', 'extendLeft', 'extendNone',
+    'extendRight', 'falseValue', 'fontFamilyDefault', 'fontFamilyMonospace', 'formatInherit',
+    'formatMinTick', 'formatPercent', 'formatPrice', 'formatVolume', 'hlineStyleDashed', 'hlineStyleDotted',
+    'hlineStyleSolid', 'labelStyleArrowDown', 'labelStyleArrowUp', 'labelStyleCircle', 'labelStyleCross',
+    'labelStyleDiamond', 'labelStyleFlag', 'labelStyleLabelCenter', 'labelStyleLabelDown',
+    'labelStyleLabelLeft', 'labelStyleLabelLowerLeft', 'labelStyleLabelLowerRight', 'labelStyleLabelRight',
+    'labelStyleLabelUp', 'labelStyleLabelUpperLeft', 'labelStyleLabelUpperRight', 'labelStyleNone',
+    'labelStyleSquare', 'labelStyleTextOutline', 'labelStyleTriangleDown', 'labelStyleTriangleUp',
+    'labelStyleXCross', 'lineStyleArrowBoth', 'lineStyleArrowLeft', 'lineStyleArrowRight', 'lineStyleDashed',
+    'lineStyleDotted', 'lineStyleSolid', 'locationAboveBar', 'locationAbsolute', 'locationBelowBar',
+    'locationBottom', 'locationTop', 'mathE', 'mathPhi', 'mathPi', 'mathRPhi', 'orderAscending',
+    'orderDescending', 'onTick', 'onBar', '=', '+', '-', '*', '/', '%', '==', '!', '!=', '>', '<', '>=',
+    '<=', 'and', 'or', 'not', 'if', 'else', 'for', 'while', 'arr', 'bool', 'box', 'chartPoint', 'col',
+    'const', 'float', 'int', 'label', 'alertFunc', 'alertConditionFunc', 'arrAbs', 'arrAvg',
+    'arrBinarySearch', 'arrBinarySearchLeftmost', 'arrBinarySearchRightmost', 'arrClear', 'arrConcat',
+    'arrCopy', 'arrCovariance', 'arrEvery', 'arrFill', 'arrFirst', 'arrFrom', 'arrGet', 'arrIncludes',
+    'arrIndexOf', 'arrInsert', 'arrJoin', 'arrLast', 'arrLastIndexOf', 'arrMax', 'arrMedian', 'arrMin',
+    'arrMode', 'arrNewBool', 'arrNewBox', 'aryNewCol', 'arrNewFloat', 'arrNewInt', 'arrNewLabel',
+    'arrNewLine', 'arrNewLineFill', 'arrNewString', 'arrNewTable', 'arrNewType',
+    'arrPercentileLinearInterpolation', 'arrPercentileNearestRank', 'arrPercentRank', 'arrPop', 'arrPush',
+    'arrRange', 'arrRemove', 'arrReverse', 'arrSet', 'arrShift', 'arrSize', 'arrSlice', 'arrSome', 'arrSort',
+    'arrSortIndices', 'arrStandardize', 'arrStdev', 'arrSum', 'arrUnshift', 'arrVariance', 'barColFunc',
+    'bgColFunc', 'boolFunc', 'boxFunc', 'boxCopyFunc', 'boxDeleteFunc', 'boxGetBottomFunc', 'boxGetLeftFunc',
+    'boxGetRightFunc', 'boxGetTopFunc', 'boxNewFunc', 'boxSetBgColFunc', 'boxSetBorderColFunc',
+    'boxSetBorderStyleFunc', 'boxSetBorderWidthFunc', 'boxSetBottomFunc', 'boxSetBottomRightPointFunc',
+    'boxSetExtendFunc', 'boxSetLeftFunc', 'boxSetLeftTopFunc', 'boxSetRightFunc', 'boxSetRightBottomFunc',
+    'boxSetTextFunc', 'boxSetTextColFunc', 'boxSetTextFontFamilyFunc', 'boxSetTextHAlignFunc',
+    'boxSetTextSizeFunc', 'boxSetTextVAlignFunc', 'boxSetTextWrapFunc', 'boxSetTopFunc',
+    'boxSetTopLeftPointFunc', 'chartPointCopyFunc', 'chartPointFromIndexFunc', 'chartPointFromTimeFunc',
+    'chartPointNewFunc', 'chartPointNowFunc', 'colFunc', 'colBFunc', 'colFromGradientFunc', 'colGFunc',
+    'colNewFunc', 'colRFunc', 'colRgbFunc', 'colTFunc', 'dayOfMonthFunc', 'dayOfWeekFunc', 'fillFunc',
+    'fixNanFunc', 'floatFunc', 'hLineFunc', 'hourFunc', 'indicatorFunc', 'inputFunc', 'inputBoolFunc',
+    'inputColFunc', 'inputEnumFunc', 'inputFloatFunc', 'inputIntFunc', 'inputPriceFunc', 'inputSessionFunc',
+    'inputSourceFunc', 'inputStringFunc', 'inputSymbolFunc', 'inputTextAreaFunc', 'inputTimeFunc',
+    'inputTimeFrameFunc', 'intFunc', 'labelFunc', 'labelCopyFunc', 'labelDeleteFunc', 'labelGetTextFunc',
+    'labelGetXFunc', 'labelGetYFunc', 'labelNewFunc', 'labelSetColFunc', 'labelSetPointFunc',
+    'labelSetSizeFunc', 'labelSetStyleFunc', 'labelSetTextFunc', 'labelSetTextFontFamilyFunc',
+    'labelSetTextAlignFunc', 'labelSetTextColFunc', 'labelSetToolTipFunc', 'labelSetXFunc',
+    'labelSetXLocFunc', 'labelSetXYFunc', 'labelSetYFunc', 'labelSetYLocFunc', 'libraryFunc', 'lineFunc',
+    'lineCopyFunc', 'lineDeleteFunc', 'lineGetPriceFunc', 'lineGetX1Func', 'lineGetX2Func', 'lineGetY1Func',
+    'lineGetY2Func', 'lineNewFunc', 'lineSetColFunc', 'lineSetExtendFunc', 'lineSetFirstPointFunc',
+    'lineSetSecondPointFunc', 'lineSetStyleFunc', 'lineSetWidthFunc', 'lineSetX1Func', 'lineSetX2Func',
+    'lineSetXLocFunc', 'lineSetXY1Func', 'lineSetXY2Func', 'lineSetY1Func', 'lineSetY2Func', 'lineFillFunc',
+    'lineFillDeleteFunc', 'lineFillGetLine1Func', 'lineFillGetLine2Func', 'lineFillNewFunc',
+    'lineFillSetColFunc', 'logErrorFunc', 'logInfoFunc', 'logWarningFunc', 'mapClearFunc', 'mapContainsFunc',
+    'mapCopyFunc', 'mapGetFunc', 'mapKeysFunc', 'mapNewTypeFunc', 'mapPutFunc', 'mapPutAllFunc',
+    'mapRemoveFunc', 'mapSizeFunc', 'mapValuesFunc', 'mathAbsFunc', 'mathAcosFunc', 'mathAsinFunc',
+    'mathAtanFunc', 'mathAvgFunc', 'mathCeilFunc', 'mathCosFunc', 'mathExpFunc', 'mathFloorFunc',
+    'mathLogFunc', 'mathLog10Func', 'mathMaxFunc', 'mathMinFunc', 'mathPowFunc', 'mathRandomFunc',
+    'mathRoundFunc', 'mathRoundToMinTickFunc', 'mathSignFunc', 'mathSinFunc', 'mathSqrtFunc', 'mathSumFunc',
+    'mathTanFunc', 'mathToDegreesFunc', 'mathToRadiansFunc', 'matrixAddColFunc', 'matrixAddRowFunc',
+    'matrixAvgFunc', 'matrixColFunc', 'matrixColumnsFunc', 'matrixConcatFunc', 'matrixCopyFunc',
+    'matrixDetFunc', 'matrixDiffFunc', 'matrixEigenValuesFunc', 'matrixEigenVectorsFunc',
+    'matrixElementsCountFunc', 'matrixFillFunc', 'matrixGetFunc', 'matrixInvFunc',
+    'matrixIsAntiDiagonalFunc', 'matrixIsAntiSymmetricFunc', 'matrixIsBinaryFunc', 'matrixIsDiagonalFunc',
+    'matrixIsIdentityFunc', 'matrixIsSquareFunc', 'matrixIsStochasticFunc', 'matrixIsSymmetricFunc',
+    'matrixIsTriangularFunc', 'matrixIsZeroFunc', 'matrixKronFunc', 'matrixMaxFunc', 'matrixMedianFunc',
+    'matrixMinFunc', 'matrixModeFunc', 'matrixMultFunc', 'matrixNewTypeFunc', 'matrixPinvFunc',
+    'matrixPowFunc', 'matrixRankFunc', 'matrixRemoveColFunc', 'matrixRemoveRowFunc', 'matrixReshapeFunc',
+    'matrixReverseFunc', 'matrixRowFunc', 'matrixRowsFunc', 'matrixSetFunc', 'matrixSortFunc',
+    'matrixSubMatrixFunc', 'matrixSumFunc', 'matrixSwapColumnsFunc', 'matrixSwapRowsFunc', 'matrixTraceFunc',
+    'matrixTransposeFunc', 'maxBarsBackFunc', 'minuteFunc', 'monthFunc', 'naFunc', 'nzFunc',
+    'polylineDeleteFunc', 'polylineNewFunc', 'requestCurrencyRateFunc', 'requestDividendsFunc',
+    'requestEarningsFunc', 'requestEconomicFunc', 'requestFinancialFunc', 'requestQuandlFunc',
+    'requestSecurityFunc', 'requestSecurityLowerTfFunc', 'requestSeedFunc', 'requestSplitsFunc',
+    'runtimeErrorFunc', 'secondFunc', 'strContainsFunc', 'strEndsWithFunc', 'strFormatFunc',
+    'strFormatTimeFunc', 'strLengthFunc', 'strLowerFunc', 'strMatchFunc', 'strPosFunc', 'strRepeatFunc',
+    'strReplaceFunc', 'strReplaceAllFunc', 'strSplitFunc', 'strStartsWithFunc', 'strSubstringFunc',
+    'strToNumberFunc', 'strToStringFunc', 'strTrimFunc', 'strUpperFunc', 'strategyFunc',
+    'strategyCancelFunc', 'strategyCancelAllFunc', 'strategyCloseFunc', 'strategyCloseAllFunc',
+    'strategyClosedTradesCommissionFunc', 'strategyClosedTradesEntryBarIndexFunc',
+    'strategyClosedTradesEntryCommentFunc', 'strategyClosedTradesEntryIdFunc',
+    'strategyClosedTradesEntryPriceFunc', 'strategyClosedTradesEntryTimeFunc',
+    'strategyClosedTradesExitBarIndexFunc', 'strategyClosedTradesExitCommentFunc',
+    'strategyClosedTradesExitIdFunc', 'strategyClosedTradesExitPriceFunc',
+    'strategyClosedTradesExitTimeFunc', 'strategyClosedTradesMaxDrawdownFunc',
+    'strategyClosedTradesMaxDrawdownPercentFunc', 'strategyClosedTradesMaxRunupFunc',
+    'strategyClosedTradesMaxRunupPercentFunc', 'strategyClosedTradesProfitFunc',
+    'strategyClosedTradesProfitPercentFunc', 'strategyClosedTradesSizeFunc', 'strategyConvertToAccountFunc',
+    'strategyConvertToSymbolFunc', 'strategyDefaultEntryQtyFunc', 'strategyEntryFunc', 'strategyExitFunc',
+    'strategyOpenTradesCommissionFunc', 'strategyOpenTradesEntryBarIndexFunc',
+    'strategyOpenTradesEntryCommentFunc', 'strategyOpenTradesEntryIdFunc',
+    'strategyOpenTradesEntryPriceFunc', 'strategyOpenTradesEntryTimeFunc',
+    'strategyOpenTradesMaxDrawdownFunc', 'strategyOpenTradesMaxDrawdownPercentFunc',
+    'strategyOpenTradesMaxRunupFunc', 'strategyOpenTradesMaxRunupPercentFunc',
+    'strategyOpenTradesProfitFunc', 'strategyOpenTradesProfitPercentFunc', 'strategyOpenTradesSizeFunc',
+    'strategyOrderFunc', 'strategyRiskAllowEntryInFunc', 'strategyRiskMaxConsLossDaysFunc',
+    'strategyRiskMaxDrawdownFunc', 'strategyRiskMaxIntradayFilledOrdersFunc',
+    'strategyRiskMaxIntradayLossFunc', 'strategyRiskMaxPositionSizeFunc', 'symInfoPrefixFunc',
+    'symInfoTickerFunc', 'timeFunc', 'timeCloseFunc', 'timeframeChangeFunc', 'timeframeFromSecondsFunc',
+    'timeframeInSecondsFunc', 'timestampFunc', 'weekOfYearFunc', 'yearFunc', 'show', 'showshape', 'showcond',
+    'solid', 'dotted', 'dashed', 'tableFunc ', 'tableCellFunc', 'tableCellSetBgColFunc',
+    'tableCellSetHeightFunc', 'tableCellSetTextFunc', 'tableCellSetTextColFunc',
+    'tableCellSetTextFontFamily', 'tableCellSetTextHAlignFunc', 'tableCellSetTextSizeFunc',
+    'tableCellSetTextVAlignFunc', 'tableCellSetToolTipFunc', 'tableCellSetWidthFunc', 'tableClearFunc ',
+    'tableDeleteFunc ', 'tableMergeCellsFunc', 'tableNewFunc', 'tableSetBgColFunc', 'tableSetBorderColFunc',
+    'tableSetBorderWidthFunc', 'tableSetFrameColFunc ', 'tableSetFrameWidthFunc', 'tableSetPositionFunc',
+    'adLine', 'adOsc', 'adx', 'adxr', 'apo', 'aroon', 'aroonOsc', 'atr', 'avgPrice', 'bbands', 'beta', 'bop',
+    'cci', 'cmo', 'correl', 'dema', 'dx', 'htDcPeriod', 'htDcPhase', 'htPhasor', 'htSine', 'htTrendline',
+    'htTrendMode', 'kama', 'linearReg', 'linearRegAngle', 'linearRegIntercept', 'linearRegSlope', 'ma',
+    'macd', 'macdExt', 'macdFix', 'mama', 'maxIndex', 'medPrice', 'mfi', 'midPoint', 'midPrice', 'minIndex',
+    'minMax', 'minMaxIndex', 'minusDI', 'minusDM', 'mom', 'natr', 'obv', 'plusDI', 'plusDM', 'ppo', 'roc',
+    'rocp', 'rocr', 'rocr100', 'sar', 'sarExt', 'stdDev', 'stoch', 'stochF', 'stochRsi', 'sum', 't3', 'tema',
+    'tRange', 'trima', 'trix', 'tsf', 'typPrice', 'ultOsc', 'variance', 'wclPrice', 'willr', 'wma',
+    'pattern2Crows', 'pattern3BlackCrows', 'pattern3Inside', 'pattern3LineStrike', 'pattern3StarsInSouth',
+    'pattern3WhiteSoldiers', 'patternAbandonedBaby', 'patternAdvanceBlock', 'patternBeltHold',
+    'patternBreakaway', 'patternClosingMarubozu', 'patternConcealBabySwallow', 'patternCounterattack',
+    'patternDarkCloud', 'patternDoji', 'patternDojiStar', 'patternDragonflyDoji', 'patternEngulfing',
+    'patternEveningDojiStar', 'patternEveningStar', 'patternGapSideSide', 'patternGravestoneDoji',
+    'patternHammer', 'patternHangingMan', 'patternHarami', 'patternHaramiCross', 'patternHighWave',
+    'patternHikkake', 'patternHikkakeMod', 'patternHomingPigeon', 'patternIdentical3Crows', 'patternInNeck',
+    'patternInvertedHammer', 'patternKicking', 'patternKickingByLength', 'patternLadderBottom',
+    'patternLongLeggedDoji', 'patternLongLine', 'patternMarubozu', 'patternMatchingLow', 'patternMatHold',
+    'patternMorningDojiStar', 'patternMorningStar', 'patternOnNeck', 'patternPiercing', 'patternRickshawMan',
+    'patternRiseFall3Methods', 'patternSeparatingLines', 'patternShootingStar', 'patternShortLine',
+    'patternSpinningTop', 'patternStalledPattern', 'patternStickSandwich', 'patternTakuri',
+    'patternTasukiGap', 'patternThrusting', 'patternTristar', 'patternUnique3River',
+    'patternUpsideGap2Crows', 'patternXsideGap3Methods',
+])
+
+TOKEN_PATTERN = re.compile(r'''
+    (?P<NUMBER>-?\d+(?:\.\d*)?)
+  | (?P<NAME>[a-zA-Z][a-zA-Z_]*)
+  | (?P<OPERATOR>[=!><]=|[-+*/%=><!])
+  | (?P<LPAREN>\()
+  | (?P<RPAREN>\))
+  | (?P<LBRACE>\{)
+  | (?P<RBRACE>\})
+  | (?P<COMMA>,)
+  | (?P<COLON>:)
+  | (?P<STRING>"[^"]*"?)
+  | (?P<SKIP>\s+|[\s\S])
+''', re.VERBOSE)
+
+
+class Token(NamedTuple):
+    type: str
+    value: Any
+
+
 class Tokenizer:
     def __init__(self, source_code):
         self.source_code = source_code
         self.current_position = 0
+        self.tokens = None
+        self.token_index = 0
 
     def tokenize(self):
         tokens = []
-        while self.current_position < len(self.source_code):
-            char = self.source_code[self.current_position]
-            
-            if char.isspace():
-                self.current_position += 1
-                continue
-            
-            elif char.isdigit() or (char == '-' and self.peek().isdigit()):
-                match = re.match(r'-?\d+(\.\d*)?', self.source_code[self.current_position:])
-                if match:
-                    value = float(match.group(0))
-                    tokens.append(('NUMBER', value))
-                    self.current_position += match.end()
-                    continue
-            
-            elif char.isalpha():
-                match = re.match(r'[a-zA-Z_]+', self.source_code[self.current_position:])
-                if match:
-                    identifier = match.group(0)
-                    if identifier in ['open', 'high', 'low', 'close', 'volume', 'hl2', 'hlc3', 'hlcc4', 'ohlc4','symInfoMinMove', 'symInfoMinTick', 'symInfoPointValue', 'symInfoPrefix','symInfoPriceScale', 'symInfoRoot', 'symInfoSector', 'symInfoSession','symInfoShareholders', 'symInfoSharesOutstandingFloat','symInfoSharesOutstandingTotal',             'sma', 'ema', 'rsi', 'minvalue', 'maxvalue', 'taAccDist', 'taIII', 'taNVI', 'taOBV', 'taPVI', 'taPVT', 'taTR', 'taVWAP','taWAD', 'taWVAD', 'taAlma', 'taAtr', 'taBarsSince', 'taBb', 'taBbw', 'taCci','taChange', 'taCmo', 'taCog', 'taCorrelation', 'taCross', 'taCrossover','taCrossunder', 'taCum', 'taDev', 'taDmi', 'taEma', 'taFalling', 'taHighest','taHighestBars', 'taHma', 'taKc', 'taKcw', 'taLinReg', 'taLowest','taLowestBars', 'taMacd', 'taMax', 'taMedian', 'taMfi', 'taMin', 'taMode','taMom', 'taPercentile', 'taPercentRank', 'taPivotHigh', 'taPivotLow','taRange', 'taRising', 'taRma', 'taRoc', 'taRsi', 'taSar', 'taSma', 'taStdev','taStoch', 'taSuperTrend', 'taSwma', 'taTsi', 'taValueWhen', 'taVariance','taVwap', 'taVwma', 'taWma', 'taWpr', 'strategyAccountCurrency', 'strategyAvgLosingTrade','strategyAvgLosingTradePercent', 'strategyAvgTrade','strategyAvgTradePercent', 'strategyAvgWinningTrade','strategyAvgWinningTradePercent', 'strategyClosedTrades','strategyClosedTradesFirstIndex', 'strategyEquity', 'strategyEvenTrades','strategyGrossLoss', 'strategyGrossLossPercent', 'strategyGrossProfit','strategyGrossProfitPercent', 'strategyInitialCapital', 'strategyLossTrades','strategyMarginLiquidationPrice', 'strategyMaxContractsHeldAll','strategyMaxContractsHeldLong', 'strategyMaxContractsHeldShort','strategyMaxDrawdown', 'strategyMaxDrawdownPercent', 'strategyMaxRunup','strategyMaxRunupPercent', 'strategyNetProfit', 'strategyNetProfitPercent','strategyOpenProfit', 'strategyOpenProfitPercent', 'strategyOpenTrades','strategyOpenTradesCapitalHeld', 'strategyPositionAvgPrice','strategyPositionEntryName', 'strategyPositionSize', 'strategyWinTrades',             'dayOfMonth', 'dayOfWeek', 'hour', 'minute', 'month','second', 'time', 'timeClose', 'timeTradingDay', 'timeNow','weekOfYear', 'year', 'sessionIsFirstBar', 'sessionIsFirstBarRegular','sessionIsLastBar', 'sessionIsLastBarRegular', 'sessionIsMarket','sessionIsPostMarket', 'sessionIsPreMarket',             'boxAll', 'chartBgCol', 'chartFgCol', 'chartIsHeikinAshi','chartIsKagi', 'chartIsLineBreak', 'chartIsPnf', 'chartIsRange','chartIsRenko', 'chartIsStandard', 'chartLeftVisibleBarTime','chartRightVisibleBarTime', 'labelAll', 'lineAll', 'lineFillAll','polylineAll', 'tableAll', 'andOp', 'enumType', 'exportFunc', 'forLoop', 'forInLoop', 'ifCond', 'importFunc', 'methodFunc', 'notOp', 'orOp', 'switchCase', 'typeDef', 'let', 'letip', 'whileLoop','open','high','low','close','volume','barIndex','barStateIsConfirmed','barStateIsFirst','barStateIsHistory','barStateIsLast','barStateIsLastConfirmedHistory','barStateIsNew','barStateIsRealtime','boxAll','chartBgCol','chartFgCol','chartIsHeikinAshi','chartIsKagi','chartIsLineBreak','chartIsPnf','chartIsRange','chartIsRenko','chartIsStandard','chartLeftVisibleBarTime','chartRightVisibleBarTime','dayOfMonth','dayOfWeek','dividendsFutureAmount','dividendsFutureExDate','dividendsFuturePayDate','earningsFutureEps','earningsFuturePeriodEndTime','earningsFutureRevenue','earningsFutureTime','hl2','hlc3','hlcc4','hour','labelAll','lastBarIndex','lastBarTime','lineAll','lineFillAll','minute','month','na','ohlc4','polylineAll','second','sessionIsFirstBar','sessionIsFirstBarRegular','sessionIsLastBar','sessionIsLastBarRegular','sessionIsMarket','sessionIsPostMarket','sessionIsPreMarket','strategyAccountCurrency','strategyAvgLosingTrade','strategyAvgLosingTradePercent','strategyAvgTrade','strategyAvgTradePercent','strategyAvgWinningTrade','strategyAvgWinningTradePercent','strategyClosedTrades','strategyClosedTradesFirstIndex','strategyEquity','strategyEvenTrades','strategyGrossLoss','strategyGrossLossPercent','strategyGrossProfit','strategyGrossProfitPercent','strategyInitialCapital','strategyLossTrades','strategyMarginLiquidationPrice','strategyMaxContractsHeldAll','strategyMaxContractsHeldLong','strategyMaxContractsHeldShort','strategyMaxDrawdown','strategyMaxDrawdownPercent','strategyMaxRunup','strategyMaxRunupPercent','strategyNetProfit','strategyNetProfitPercent','strategyOpenProfit','strategyOpenProfitPercent','strategyOpenTrades','strategyOpenTradesCapitalHeld','strategyPositionAvgPrice','strategyPositionEntryName','strategyPositionSize','strategyWinTrades','symInfoBaseCurrency','symInfoCountry','symInfoCurrency','symInfoDescription','symInfoEmployees','symInfoExpirationDate','symInfoIndustry','symInfoMainTickerId','symInfoMinContract','symInfoMinMove','symInfoMinTick','symInfoPointValue','symInfoPrefix','symInfoPriceScale','symInfoRecommendationsBuy','symInfoRecommendationsBuyStrong','symInfoRecommendationsDate','symInfoRecommendationsHold','symInfoRecommendationsSell','symInfoRecommendationsSellStrong','symInfoRecommendationsTotal','symInfoRoot','symInfoSector','symInfoSession','symInfoShareholders','symInfoSharesOutstandingFloat','symInfoSharesOutstandingTotal','symInfoTargetPriceAverage','symInfoTargetPriceDate','symInfoTargetPriceEstimates','symInfoTargetPriceHigh','symInfoTargetPriceLow','symInfoTargetPriceMedian','symInfoTicker','symInfoTickerId','symInfoTimezone','symInfoType','symInfoVolumeType','taAccDist','taIII','taNVI','taOBV','taPVI','taPVT','taTR','taVWAP','taWAD','taWVAD','tableAll','time','timeClose','timeTradingDay','timeframeIsDaily','timeframeIsDWM','timeframeIsIntraday','timeframeIsMinutes','timeframeIsMonthly','timeframeIsSeconds','timeframeIsTicks','timeframeIsWeekly','timeframeMainPeriod','timeframeMultiplier','timeframePeriod','timeNow','weekOfYear','year','showStyleArea','showStyleAreaBr','showStyleCircles','showStyleColumns','showStyleCross','showStyleHistogram','showStyleLine','showStyleLineBr','showStyleStepLine','showStyleStepLineDiamond','showStyleStepLineBr','positionBottomCenter','positionBottomLeft','positionBottomRight','positionMiddleCenter','positionMiddleLeft','positionMiddleRight','positionTopCenter','positionTopLeft','positionTopRight','scaleLeft','scaleNone','scaleRight','sessionExtended','sessionRegular','settlementAsCloseInherit','settlementAsCloseOff','settlementAsCloseOn','shapeArrowDown','shapeArrowUp','shapeCircle','shapeCross','shapeDiamond','shapeFlag','shapeLabelDown','shapeLabelUp','shapeSquare','shapeTriangleDown','shapeTriangleUp','shapeXCross','sizeAuto','sizeHuge','sizeLarge','sizeNormal','sizeSmall','sizeTiny','splitsDenominator','splitsNumerator','strategyCash','strategyCommissionCashPerContract','strategyCommissionCashPerOrder','strategyCommissionPercent','strategyDirectionAll','strategyDirectionLong','strategyDirectionShort','strategyFixed','strategyLong','strategyOcaCancel','strategyOcaNone','strategyOcaReduce','strategyPercentOfEquity','strategyShort','textAlignBottom','textAlignCenter','textAlignLeft','textAlignRight','textAlignTop','textWrapAuto','textWrapNone','trueValue','xLocBarIndex','xLocBarTime','yLocAboveBar','yLocBelowBar','yLocPrice','adjustmentDividends','adjustmentNone','adjustmentSplits','alertFreqAll','alertFreqOncePerBar','alertFreqOncePerBarClose','backAdjustmentInherit','backAdjustmentOff','backAdjustmentOn','barMergeGapsOff','barMergeGapsOn','barMergeLookaheadOff','barMergeLookaheadOn','colAqua','colBlack','colBlue','colFuchsia','colGray','colGreen','colLime','colMaroon','colNavy','colOlive','colOrange','colPurple','colRed','colSilver','colTeal','colWhite','colYellow','currencyAUD','currencyBTC','currencyCAD','currencyCHF','currencyETH','currencyEUR','currencyGBP','currencyHKD','currencyINR','currencyJPY','currencyKRW','currencyMYR','currencyNOK','currencyNone','currencyNZD','currencyRUB','currencySEK','currencySGD','currencyTRY','currencyUSD','currencyUSDT','currencyZAR','dayOfWeekFriday','dayOfWeekMonday','dayOfWeekSaturday','dayOfWeekSunday','dayOfWeekThursday','dayOfWeekTuesday','dayOfWeekWednesday','displayAll','displayDataWindow','displayNone','displayPane','displayPriceScale','displayStatusLine','dividendsGross','dividendsNet','earningsActual','earningsEstimate','earningsStandardized','extendBoth','extendLeft','extendNone','extendRight','falseValue','fontFamilyDefault','fontFamilyMonospace','formatInherit','formatMinTick','formatPercent','formatPrice','formatVolume','hlineStyleDashed','hlineStyleDotted','hlineStyleSolid','labelStyleArrowDown','labelStyleArrowUp','labelStyleCircle','labelStyleCross','labelStyleDiamond','labelStyleFlag','labelStyleLabelCenter','labelStyleLabelDown','labelStyleLabelLeft','labelStyleLabelLowerLeft','labelStyleLabelLowerRight','labelStyleLabelRight','labelStyleLabelUp','labelStyleLabelUpperLeft','labelStyleLabelUpperRight','labelStyleNone','labelStyleSquare','labelStyleTextOutline','labelStyleTriangleDown','labelStyleTriangleUp','labelStyleXCross','lineStyleArrowBoth','lineStyleArrowLeft','lineStyleArrowRight','lineStyleDashed','lineStyleDotted','lineStyleSolid','locationAboveBar','locationAbsolute','locationBelowBar','locationBottom','locationTop','mathE','mathPhi','mathPi','mathRPhi','orderAscending','orderDescending', 'onTick', 'onBar','=', '+', '-', '*', '/', '%', '==','!', '!=', '>', '<', '>=', '<=', 'and', 'or', 'not', 'if', 'else', 'for', 'while', 'let', 'arr', 'bool', 'box', 'chartPoint', 'col', 'const', 'float', 'int', 'label',             'dayOfMonth', 'dayOfWeek', 'hour', 'minute', 'month','second', 'time', 'timeClose', 'timeTradingDay', 'timeNow','weekOfYear', 'year', 'sessionIsFirstBar', 'sessionIsFirstBarRegular','sessionIsLastBar', 'sessionIsLastBarRegular', 'sessionIsMarket','sessionIsPostMarket', 'sessionIsPreMarket',             'sma', 'ema', 'rsi', 'minvalue', 'maxvalue', 'taAccDist', 'taIII', 'taNVI', 'taOBV', 'taPVI', 'taPVT', 'taTR', 'taVWAP','taWAD', 'taWVAD', 'taAlma', 'taAtr', 'taBarsSince', 'taBb', 'taBbw', 'taCci','taChange', 'taCmo', 'taCog', 'taCorrelation', 'taCross', 'taCrossover','taCrossunder', 'taCum', 'taDev', 'taDmi', 'taEma', 'taFalling', 'taHighest','taHighestBars', 'taHma', 'taKc', 'taKcw', 'taLinReg', 'taLowest','taLowestBars', 'taMacd', 'taMax', 'taMedian', 'taMfi', 'taMin', 'taMode','taMom', 'taPercentile', 'taPercentRank', 'taPivotHigh', 'taPivotLow','taRange', 'taRising', 'taRma', 'taRoc', 'taRsi', 'taSar', 'taSma', 'taStdev','taStoch', 'taSuperTrend', 'taSwma', 'taTsi', 'taValueWhen', 'taVariance','taVwap', 'taVwma', 'taWma', 'taWpr',             'adjustmentDividends', 'adjustmentNone', 'adjustmentSplits','alertFreqAll', 'alertFreqOncePerBar', 'alertFreqOncePerBarClose','colAqua', 'colBlack', 'colBlue', 'colFuchsia', 'colGray','colGreen', 'colLime', 'colMaroon', 'colNavy', 'colOlive','colOrange', 'colPurple', 'colRed', 'colSilver', 'colTeal','colWhite', 'colYellow',            'symInfoRecommendationsBuy', 'symInfoRecommendationsBuyStrong','symInfoRecommendationsDate', 'symInfoRecommendationsHold','symInfoRecommendationsSell', 'symInfoRecommendationsSellStrong','symInfoRecommendationsTotal', 'symInfoTargetPriceAverage','symInfoTargetPriceDate', 'symInfoTargetPriceEstimates','symInfoTargetPriceHigh', 'symInfoTargetPriceLow','symInfoTargetPriceMedian', 'symInfoTicker', 'symInfoTickerId','symInfoTimezone', 'symInfoType', 'symInfoVolumeType', 'symInfoBaseCurrency', 'symInfoCountry', 'symInfoCurrency','symInfoDescription', 'symInfoEmployees', 'symInfoExpirationDate','symInfoIndustry', 'symInfoMainTickerId', 'symInfoMinContract',   'strategyAccountCurrency', 'strategyAvgLosingTrade','strategyAvgLosingTradePercent', 'strategyAvgTrade','strategyAvgTradePercent', 'strategyAvgWinningTrade','strategyAvgWinningTradePercent', 'strategyClosedTrades','strategyClosedTradesFirstIndex', 'strategyEquity', 'strategyEvenTrades','strategyGrossLoss', 'strategyGrossLossPercent', 'strategyGrossProfit','strategyGrossProfitPercent', 'strategyInitialCapital', 'strategyLossTrades','strategyMarginLiquidationPrice', 'strategyMaxContractsHeldAll','strategyMaxContractsHeldLong', 'strategyMaxContractsHeldShort','strategyMaxDrawdown', 'strategyMaxDrawdownPercent', 'strategyMaxRunup','strategyMaxRunupPercent', 'strategyNetProfit', 'strategyNetProfitPercent','strategyOpenProfit', 'strategyOpenProfitPercent', 'strategyOpenTrades','strategyOpenTradesCapitalHeld', 'strategyPositionAvgPrice','strategyPositionEntryName', 'strategyPositionSize', 'strategyWinTrades','sma', 'ema', 'rsi', 'minvalue', 'maxvalue','alertFunc', 'alertConditionFunc', 'arrAbs', 'arrAvg', 'arrBinarySearch', 'arrBinarySearchLeftmost', 'arrBinarySearchRightmost', 'arrClear', 'arrConcat', 'arrCopy', 'arrCovariance', 'arrEvery', 'arrFill', 'arrFirst', 'arrFrom', 'arrGet', 'arrIncludes', 'arrIndexOf', 'arrInsert', 'arrJoin', 'arrLast', 'arrLastIndexOf', 'arrMax', 'arrMedian', 'arrMin', 'arrMode', 'arrNewBool', 'arrNewBox', 'aryNewCol', 'arrNewFloat', 'arrNewInt', 'arrNewLabel', 'arrNewLine', 'arrNewLineFill', 'arrNewString', 'arrNewTable', 'arrNewType', 'arrPercentileLinearInterpolation', 'arrPercentileNearestRank', 'arrPercentRank', 'arrPop', 'arrPush', 'arrRange', 'arrRemove', 'arrReverse', 'arrSet', 'arrShift', 'arrSize', 'arrSlice', 'arrSome', 'arrSort', 'arrSortIndices', 'arrStandardize', 'arrStdev', 'arrSum', 'arrUnshift', 'arrVariance', 'barColFunc', 'bgColFunc', 'boolFunc', 'boxFunc', 'boxCopyFunc', 'boxDeleteFunc', 'boxGetBottomFunc', 'boxGetLeftFunc', 'boxGetRightFunc', 'boxGetTopFunc', 'boxNewFunc', 'boxSetBgColFunc', 'boxSetBorderColFunc', 'boxSetBorderStyleFunc', 'boxSetBorderWidthFunc', 'boxSetBottomFunc', 'boxSetBottomRightPointFunc', 'boxSetExtendFunc', 'boxSetLeftFunc', 'boxSetLeftTopFunc', 'boxSetRightFunc', 'boxSetRightBottomFunc', 'boxSetTextFunc', 'boxSetTextColFunc', 'boxSetTextFontFamilyFunc', 'boxSetTextHAlignFunc', 'boxSetTextSizeFunc', 'boxSetTextVAlignFunc', 'boxSetTextWrapFunc', 'boxSetTopFunc', 'boxSetTopLeftPointFunc', 'chartPointCopyFunc', 'chartPointFromIndexFunc', 'chartPointFromTimeFunc', 'chartPointNewFunc', 'chartPointNowFunc', 'colFunc', 'colBFunc', 'colFromGradientFunc', 'colGFunc', 'colNewFunc', 'colRFunc', 'colRgbFunc', 'colTFunc', 'dayOfMonthFunc', 'dayOfWeekFunc', 'fillFunc', 'fixNanFunc', 'floatFunc', 'hLineFunc', 'hourFunc', 'indicatorFunc', 'inputFunc', 'inputBoolFunc', 'inputColFunc', 'inputEnumFunc', 'inputFloatFunc', 'inputIntFunc', 'inputPriceFunc', 'inputSessionFunc', 'inputSourceFunc', 'inputStringFunc', 'inputSymbolFunc', 'inputTextAreaFunc', 'inputTimeFunc', 'inputTimeFrameFunc', 'intFunc', 'labelFunc', 'labelCopyFunc', 'labelDeleteFunc', 'labelGetTextFunc', 'labelGetXFunc', 'labelGetYFunc', 'labelNewFunc', 'labelSetColFunc', 'labelSetPointFunc', 'labelSetSizeFunc', 'labelSetStyleFunc', 'labelSetTextFunc', 'labelSetTextFontFamilyFunc', 'labelSetTextAlignFunc', 'labelSetTextColFunc', 'labelSetToolTipFunc', 'labelSetXFunc', 'labelSetXLocFunc', 'labelSetXYFunc', 'labelSetYFunc', 'labelSetYLocFunc', 'libraryFunc', 'lineFunc', 'lineCopyFunc', 'lineDeleteFunc', 'lineGetPriceFunc', 'lineGetX1Func', 'lineGetX2Func', 'lineGetY1Func', 'lineGetY2Func', 'lineNewFunc', 'lineSetColFunc', 'lineSetExtendFunc', 'lineSetFirstPointFunc', 'lineSetSecondPointFunc', 'lineSetStyleFunc', 'lineSetWidthFunc', 'lineSetX1Func', 'lineSetX2Func', 'lineSetXLocFunc', 'lineSetXY1Func', 'lineSetXY2Func', 'lineSetY1Func', 'lineSetY2Func', 'lineFillFunc', 'lineFillDeleteFunc', 'lineFillGetLine1Func', 'lineFillGetLine2Func', 'lineFillNewFunc', 'lineFillSetColFunc', 'logErrorFunc', 'logInfoFunc', 'logWarningFunc', 'mapClearFunc', 'mapContainsFunc', 'mapCopyFunc', 'mapGetFunc', 'mapKeysFunc', 'mapNewTypeFunc', 'mapPutFunc', 'mapPutAllFunc', 'mapRemoveFunc', 'mapSizeFunc', 'mapValuesFunc', 'mathAbsFunc', 'mathAcosFunc', 'mathAsinFunc', 'mathAtanFunc', 'mathAvgFunc', 'mathCeilFunc', 'mathCosFunc', 'mathExpFunc', 'mathFloorFunc', 'mathLogFunc', 'mathLog10Func', 'mathMaxFunc', 'mathMinFunc', 'mathPowFunc', 'mathRandomFunc', 'mathRoundFunc', 'mathRoundToMinTickFunc', 'mathSignFunc', 'mathSinFunc', 'mathSqrtFunc', 'mathSumFunc', 'mathTanFunc', 'mathToDegreesFunc', 'mathToRadiansFunc', 'matrixAddColFunc', 'matrixAddRowFunc', 'matrixAvgFunc', 'matrixColFunc', 'matrixColumnsFunc', 'matrixConcatFunc', 'matrixCopyFunc', 'matrixDetFunc', 'matrixDiffFunc', 'matrixEigenValuesFunc', 'matrixEigenVectorsFunc', 'matrixElementsCountFunc', 'matrixFillFunc', 'matrixGetFunc', 'matrixInvFunc', 'matrixIsAntiDiagonalFunc', 'matrixIsAntiSymmetricFunc', 'matrixIsBinaryFunc', 'matrixIsDiagonalFunc', 'matrixIsIdentityFunc', 'matrixIsSquareFunc', 'matrixIsStochasticFunc', 'matrixIsSymmetricFunc', 'matrixIsTriangularFunc', 'matrixIsZeroFunc', 'matrixKronFunc', 'matrixMaxFunc', 'matrixMedianFunc', 'matrixMinFunc', 'matrixModeFunc', 'matrixMultFunc', 'matrixNewTypeFunc', 'matrixPinvFunc', 'matrixPowFunc', 'matrixRankFunc', 'matrixRemoveColFunc', 'matrixRemoveRowFunc', 'matrixReshapeFunc', 'matrixReverseFunc', 'matrixRowFunc', 'matrixRowsFunc', 'matrixSetFunc', 'matrixSortFunc', 'matrixSubMatrixFunc', 'matrixSumFunc', 'matrixSwapColumnsFunc', 'matrixSwapRowsFunc', 'matrixTraceFunc', 'matrixTransposeFunc', 'maxBarsBackFunc', 'minuteFunc', 'monthFunc', 'naFunc', 'nzFunc', 'polylineDeleteFunc', 'polylineNewFunc', 'requestCurrencyRateFunc', 'requestDividendsFunc', 'requestEarningsFunc', 'requestEconomicFunc', 'requestFinancialFunc', 'requestQuandlFunc', 'requestSecurityFunc', 'requestSecurityLowerTfFunc', 'requestSeedFunc', 'requestSplitsFunc', 'runtimeErrorFunc', 'secondFunc', 'strContainsFunc', 'strEndsWithFunc', 'strFormatFunc', 'strFormatTimeFunc', 'strLengthFunc', 'strLowerFunc', 'strMatchFunc', 'strPosFunc', 'strRepeatFunc', 'strReplaceFunc', 'strReplaceAllFunc', 'strSplitFunc', 'strStartsWithFunc', 'strSubstringFunc', 'strToNumberFunc', 'strToStringFunc', 'strTrimFunc', 'strUpperFunc', 'strategyFunc', 'strategyCancelFunc', 'strategyCancelAllFunc', 'strategyCloseFunc', 'strategyCloseAllFunc', 'strategyClosedTradesCommissionFunc', 'strategyClosedTradesEntryBarIndexFunc', 'strategyClosedTradesEntryCommentFunc', 'strategyClosedTradesEntryIdFunc', 'strategyClosedTradesEntryPriceFunc', 'strategyClosedTradesEntryTimeFunc', 'strategyClosedTradesExitBarIndexFunc', 'strategyClosedTradesExitCommentFunc', 'strategyClosedTradesExitIdFunc', 'strategyClosedTradesExitPriceFunc', 'strategyClosedTradesExitTimeFunc', 'strategyClosedTradesMaxDrawdownFunc', 'strategyClosedTradesMaxDrawdownPercentFunc', 'strategyClosedTradesMaxRunupFunc', 'strategyClosedTradesMaxRunupPercentFunc', 'strategyClosedTradesProfitFunc', 'strategyClosedTradesProfitPercentFunc', 
-                                      'strategyClosedTradesSizeFunc', 'strategyConvertToAccountFunc', 'strategyConvertToSymbolFunc', 'strategyDefaultEntryQtyFunc', 'strategyEntryFunc', 'strategyExitFunc', 'strategyOpenTradesCommissionFunc', 'strategyOpenTradesEntryBarIndexFunc', 'strategyOpenTradesEntryCommentFunc', 'strategyOpenTradesEntryIdFunc', 'strategyOpenTradesEntryPriceFunc', 'strategyOpenTradesEntryTimeFunc', 'strategyOpenTradesMaxDrawdownFunc', 'strategyOpenTradesMaxDrawdownPercentFunc', 'strategyOpenTradesMaxRunupFunc', 'strategyOpenTradesMaxRunupPercentFunc', 'strategyOpenTradesProfitFunc', 'strategyOpenTradesProfitPercentFunc', 'strategyOpenTradesSizeFunc', 'strategyOrderFunc', 'strategyRiskAllowEntryInFunc', 'strategyRiskMaxConsLossDaysFunc', 'strategyRiskMaxDrawdownFunc', 'strategyRiskMaxIntradayFilledOrdersFunc', 'strategyRiskMaxIntradayLossFunc', 'strategyRiskMaxPositionSizeFunc', 'symInfoPrefixFunc', 'symInfoTickerFunc', 'timeFunc', 'timeCloseFunc', 'timeframeChangeFunc', 'timeframeFromSecondsFunc', 'timeframeInSecondsFunc', 'timestampFunc', 'weekOfYearFunc', 'yearFunc',             'show', 'showshape', 'showcond','solid', 'dotted', 'dashed','fontFamilyDefault', 'fontFamilyMonospace','extendBoth', 'extendLeft', 'extendNone', 'extendRight','hlineStyleDashed', 'hlineStyleDotted', 'hlineStyleSolid','tableFunc ','tableCellFunc','tableCellSetBgColFunc','tableCellSetHeightFunc' ,'tableCellSetTextFunc','tableCellSetTextColFunc','tableCellSetTextFontFamily','tableCellSetTextHAlignFunc','tableCellSetTextSizeFunc','tableCellSetTextVAlignFunc','tableCellSetToolTipFunc','tableCellSetWidthFunc','tableClearFunc ','tableDeleteFunc ','tableMergeCellsFunc','tableNewFunc','tableSetBgColFunc','tableSetBorderColFunc','tableSetBorderWidthFunc','tableSetFrameColFunc ','tableSetFrameWidthFunc','tableSetPositionFunc',
-                                      # Indicator Functions
-                                        'adLine', 'adOsc', 'adx', 'adxr', 'apo', 'aroon', 'aroonOsc', 'atr', 'avgPrice', 
-                                        'bbands', 'beta', 'bop', 'cci', 'cmo', 'correl', 'dema', 'dx', 'ema', 
-                                        'htDcPeriod', 'htDcPhase', 'htPhasor', 'htSine', 'htTrendline', 'htTrendMode',
-                                        'kama', 'linearReg', 'linearRegAngle', 'linearRegIntercept', 'linearRegSlope',
-                                        'ma', 'macd', 'macdExt', 'macdFix', 'mama', 'maxIndex', 'medPrice', 'mfi',
-                                        'midPoint', 'midPrice', 'minIndex', 'minMax', 'minMaxIndex', 'minusDI', 'minusDM',
-                                        'mom', 'natr', 'obv', 'plusDI', 'plusDM', 'ppo', 'roc', 'rocp', 'rocr', 'rocr100',
-                                        'rsi', 'sar', 'sarExt', 'sma', 'stdDev', 'stoch', 'stochF', 'stochRsi', 'sum',
-                                        't3', 'tema', 'tRange', 'trima', 'trix', 'tsf', 'typPrice', 'ultOsc', 'variance',
-                                        'wclPrice', 'willr', 'wma',
-                                        # Pattern Recognition Functions
-                                        'pattern2Crows', 'pattern3BlackCrows', 'pattern3Inside', 'pattern3LineStrike',
-                                        'pattern3StarsInSouth', 'pattern3WhiteSoldiers', 'patternAbandonedBaby',
-                                        'patternAdvanceBlock', 'patternBeltHold', 'patternBreakaway', 'patternClosingMarubozu',
-                                        'patternConcealBabySwallow', 'patternCounterattack', 'patternDarkCloud', 'patternDoji',
-                                        'patternDojiStar', 'patternDragonflyDoji', 'patternEngulfing', 'patternEveningDojiStar',
-                                        'patternEveningStar', 'patternGapSideSide', 'patternGravestoneDoji', 'patternHammer',
-                                        'patternHangingMan', 'patternHarami', 'patternHaramiCross', 'patternHighWave',
-                                        'patternHikkake', 'patternHikkakeMod', 'patternHomingPigeon', 'patternIdentical3Crows',
-                                        'patternInNeck', 'patternInvertedHammer', 'patternKicking', 'patternKickingByLength',
-                                        'patternLadderBottom', 'patternLongLeggedDoji', 'patternLongLine', 'patternMarubozu',
-                                        'patternMatchingLow', 'patternMatHold', 'patternMorningDojiStar', 'patternMorningStar',
-                                        'patternOnNeck', 'patternPiercing', 'patternRickshawMan', 'patternRiseFall3Methods',
-                                        'patternSeparatingLines', 'patternShootingStar', 'patternShortLine', 'patternSpinningTop',
-                                        'patternStalledPattern', 'patternStickSandwich', 'patternTakuri', 'patternTasukiGap',
-                                        'patternThrusting', 'patternTristar', 'patternUnique3River', 'patternUpsideGap2Crows',
-                                        'patternXsideGap3Methods']:
-                        tokens.append(('SYNTAX', identifier))
-                    else:
-                        tokens.append(('IDENTIFIER', identifier))
-                    self.current_position += match.end()
-                    continue
-            
-            elif char in ['+', '-', '*', '/', '%', '=', '>', '<', '!', '=']:
-                if char == '=' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '=='))
-                    self.current_position += 2
-                elif char == '!' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '!='))
-                    self.current_position += 2
-                elif char == '>' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '>='))
-                    self.current_position += 2
-                elif char == '<' and self.peek() == '=':
-                    tokens.append(('OPERATOR', '<='))
-                    self.current_position += 2
-                else:
-                    tokens.append(('OPERATOR', char))
-                    self.current_position += 1
-                continue
-            
-            elif char == '(':
-                tokens.append(('LPAREN', char))
-                self.current_position += 1
-                continue
-            elif char == ')':
-                tokens.append(('RPAREN', char))
-                self.current_position += 1
-                continue
-            elif char == '{':
-                tokens.append(('LBRACE', char))
-                self.current_position += 1
-                continue
-            elif char == '}':
-                tokens.append(('RBRACE', char))
-                self.current_position += 1
+        for match in TOKEN_PATTERN.finditer(self.source_code):
+            kind = match.lastgroup
+            text = match.group()
+            if kind == 'SKIP':
                 continue
-            elif char == ',':
-                tokens.append(('COMMA', char))
-                self.current_position += 1
-                continue
-            elif char == ':':
-                tokens.append(('COLON', char))
-                self.current_position += 1
-                continue
-            elif char == '"':
-                self.current_position += 1
-                start = self.current_position
-                while self.current_position < len(self.source_code) and self.source_code[self.current_position] != '"':
-                    self.current_position += 1
-                tokens.append(('STRING', self.source_code[start:self.current_position]))
-                self.current_position += 1
-                continue
-
-            self.current_position += 1 # Skip characters we don't recognize for now
+            if kind == 'NUMBER':
+                tokens.append(('NUMBER', float(text)))
+            elif kind == 'NAME':
+                tokens.append(('SYNTAX' if text in SYNTAX_NAMES else 'IDENTIFIER', text))
+            elif kind == 'STRING':
+                tokens.append(('STRING', text[1:-1] if len(text) > 1 and text.endswith('"') else text[1:]))
+            else:
+                tokens.append((kind, text))
+        self.current_position = len(self.source_code)
         return tokens
 
+    def get_next_token(self):
+        """Lexer interface used by Parser: one Token at a time, then EOF"""
+        if self.tokens is None:
+            self.tokens = self.tokenize()
+        if self.token_index >= len(self.tokens):
+            return Token('EOF', None)
+        token = Token(*self.tokens[self.token_index])
+        self.token_index += 1
+        return token
+
     def peek(self):
         if self.current_position + 1 < len(self.source_code):
             return self.source_code[self.current_position + 1]
@@ -143,9 +279,18 @@ class DevScriptAutocomplete:
                 'params': func_info.get('params', {}),
                 'description': func_info.get('description', '')
             }
+        # sorted once so prefix lookups are a bisect plus the matching run
+        self.sorted_names = sorted(self.suggestions)
 
     def get_suggestions(self, prefix):
-        return {k: v for k, v in self.suggestions.items() if k.startswith(prefix)}
+        names = self.sorted_names
+        matches = {}
+        for index in range(bisect_left(names, prefix), len(names)):
+            name = names[index]
+            if not name.startswith(prefix):
+                break
+            matches[name] = self.suggestions[name]
+        return matches
 
     def get_signature(self, func_name):
         if func_name in self.suggestions:
@@ -248,6 +393,13 @@ class Parser:
 
         self.registry = self._initialize_registries()
 
+    def _initialize_registries(self):
+        return {
+            'syntax_registry': {
+                'elements': frozenset(self.syntax_list)
+            }
+        }
+
     def parse_all_syntax(self):
         while self.current_token.type != 'EOF':
             syntax = {
@@ -265,6 +417,8 @@ class Parser:
                 'value': self.current_token.value
             }
             if syntax['name'] in self.registry['syntax_registry']['elements']:
+                # resolve the implementation once here instead of on every call
+                syntax['builtin'] = resolve_builtin(syntax['name'])
                 return syntax
             self.current_token = self.lexer.get_next_token()
 
@@ -273,5585 +427,7029 @@ class Parser:
         return self.calculate_syntax(parsed_syntax)
 
 
+# Builtin registry
+
+class Builtin(NamedTuple):
+    name: str
+    func: Callable
+
+
+# name -> Builtin, filled in at import by the @builtin decorators below
+BUILTINS: Dict[str, Builtin] = {}
+
+
+def builtin(*names: str):
+    """Register a calculate_syntax implementation under its DevScript name(s); the first definition of a name wins"""
+    def register(func):
+        for name in names:
+            BUILTINS.setdefault(name, Builtin(name, func))
+        return func
+    return register
+
+
+def resolve_builtin(name: str) -> Optional[Builtin]:
+    return BUILTINS.get(name)
+
+
 def calculate_syntax(self, syntax_list: dict, *args: Any) -> Union[float, list, dict, None]:
-    syntax_info = self.registry['syntax_registry']['elements'].get(syntax_list['name'])
-    
-    if syntax_info:
-        if syntax_list['name'] == 'arrAbs':
-            return [abs(x) for x in args[0]]
-            
-        elif syntax_list['name'] == 'arrAvg':
-            return sum(args[0]) / len(args[0])
-            
-        elif syntax_list['name'] == 'arrBinarySearch':
-            left, right = 0, len(args[0]) - 1
-            while left <= right:
-                mid = (left + right) // 2
-                if args[0][mid] == args[1]:
-                    return mid
-                elif args[0][mid] < args[1]:
-                    left = mid + 1
-                else:
-                    right = mid - 1
-            return left
-            
-        elif syntax_list['name'] == 'arrBinarySearchLeftmost':
-            left, right = 0, len(args[0])
-            while left < right:
-                mid = (left + right) // 2
-                if args[0][mid] < args[1]:
-                    left = mid + 1
-                else:
-                    right = mid
-            return left
-            
-        elif syntax_list['name'] == 'arrBinarySearchRightmost':
-            left, right = 0, len(args[0])
-            while left < right:
-                mid = (left + right) // 2
-                if args[0][mid] <= args[1]:
-                    left = mid + 1
-                else:
-                    right = mid
-            return left
-            
-        elif syntax_list['name'] == 'arrClear':
-            args[0] = []
-            return args[0]
-            
-        elif syntax_list['name'] == 'arrConcat':
-            result = []
-            for x in args[0]:
-                result.append(x)
-            for x in args[1]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrCopy':
-            result = []
-            for x in args[0]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrCovariance':
-            mean1 = sum(args[0]) / len(args[0])
-            mean2 = sum(args[1]) / len(args[1])
-            sum_of_products = sum((x - mean1) * (y - mean2) for x, y in zip(args[0], args[1]))
-            return sum_of_products / len(args[0])
-            
-        elif syntax_list['name'] == 'arrEvery':
-            for x in args[0]:
-                if not args[1](x):
-                    return False
-            return True
-            
-        elif syntax_list['name'] == 'arrFill':
-            result = []
-            for _ in range(len(args[0])):
-                result.append(args[1])
-            return result
-            
-        elif syntax_list['name'] == 'arrFirst':
-            if len(args[0]) > 0:
-                return args[0][0]
-            return None
-            
-        elif syntax_list['name'] == 'arrFrom':
-            result = []
-            for x in args[0]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrGet':
-            return args[0][args[1]]
-            
-        elif syntax_list['name'] == 'arrIncludes':
-            for x in args[0]:
-                if x == args[1]:
-                    return True
-            return False
-            
-        elif syntax_list['name'] == 'arrIndexOf':
-            for i in range(len(args[0])):
-                if args[0][i] == args[1]:
-                    return i
-            return -1
-            
-        elif syntax_list['name'] == 'arrInsert':
-            result = []
-            for i in range(len(args[0])):
-                if i == args[1]:
-                    result.append(args[2])
-                result.append(args[0][i])
-            if args[1] >= len(args[0]):
-                result.append(args[2])
-            return result
-            
-        elif syntax_list['name'] == 'arrJoin':
-            result = str(args[0][0]) if args[0] else ""
-            for x in args[0][1:]:
-                result += args[1] + str(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrLast':
-            if len(args[0]) > 0:
-                return args[0][-1]
-            return None
-            
-        elif syntax_list['name'] == 'arrLastIndexOf':
-            for i in range(len(args[0])-1, -1, -1):
-                if args[0][i] == args[1]:
-                    return i
-            return -1
-            
-        elif syntax_list['name'] == 'arrMax':
-            if not args[0]:
-                return None
-            max_val = args[0][0]
-            for x in args[0][1:]:
-                if x > max_val:
-                    max_val = x
-            return max_val
-            
-        elif syntax_list['name'] == 'arrMedian':
-            sorted_arr = []
-            for x in args[0]:
-                sorted_arr.append(x)
-            for i in range(len(sorted_arr)):
-                for j in range(len(sorted_arr)-1-i):
-                    if sorted_arr[j] > sorted_arr[j+1]:
-                        sorted_arr[j], sorted_arr[j+1] = sorted_arr[j+1], sorted_arr[j]
-            n = len(sorted_arr)
-            if n % 2 == 0:
-                return (sorted_arr[n//2-1] + sorted_arr[n//2]) / 2
-            return sorted_arr[n//2]
-            
-        elif syntax_list['name'] == 'arrMin':
-            if not args[0]:
-                return None
-            min_val = args[0][0]
-            for x in args[0][1:]:
-                if x < min_val:
-                    min_val = x
-            return min_val
-            
-        elif syntax_list['name'] == 'arrMode':
-            if not args[0]:
-                return None
-            counts = {}
-            for x in args[0]:
-                if x in counts:
-                    counts[x] += 1
-                else:
-                    counts[x] = 1
-            max_count = 0
-            mode = None
-            for x, count in counts.items():
-                if count > max_count:
-                    max_count = count
-                    mode = x
-            return mode
-            
-        elif syntax_list['name'] == 'arrNewBox':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'aryNewCol':
-            result = []
-            for _ in range(args[0]):
-                result.append([])
-            return result
-            
-        elif syntax_list['name'] == 'arrNewLabel':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewLine':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewLineFill':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewTable':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewType':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrPercentileLinearInterpolation':
-            sorted_arr = sorted(args[0])
-            rank = args[1] * (len(sorted_arr) - 1) / 100
-            lower_idx = int(rank)
-            fraction = rank - lower_idx
-            if lower_idx >= len(sorted_arr) - 1:
-                return sorted_arr[-1]
-            return sorted_arr[lower_idx] + fraction * (sorted_arr[lower_idx + 1] - sorted_arr[lower_idx])
-            
-        elif syntax_list['name'] == 'arrPercentileNearestRank':
-            sorted_arr = sorted(args[0])
-            rank = round(args[1] * (len(sorted_arr) - 1) / 100)
-            return sorted_arr[rank]
-            
-        elif syntax_list['name'] == 'arrRemove':
-            result = []
-            for x in args[0]:
-                if x != args[1]:
-                    result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrSome':
-            for x in args[0]:
-                if args[1](x):
-                    return True
-            return False
-            
-        elif syntax_list['name'] == 'arrSortIndices':
-            indices = list(range(len(args[0])))
-            for i in range(len(indices)):
-                for j in range(len(indices)-1-i):
-                    if args[0][indices[j]] > args[0][indices[j+1]]:
-                        indices[j], indices[j+1] = indices[j+1], indices[j]
-            return indices
-
-        elif syntax_list['name'] == 'arrNewBool':
-            result = []
-            for _ in range(args[0]):
-                result.append(False)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewFloat':
-            result = []
-            for _ in range(args[0]):
-                result.append(0.0)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewInt':
-            result = []
-            for _ in range(args[0]):
-                result.append(0)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewString':
-            result = []
-            for _ in range(args[0]):
-                result.append("")
-            return result
-            
-        elif syntax_list['name'] == 'arrPercentRank':
-            result = []
-            for val in args[0]:
-                count = 0
-                for x in args[0]:
-                    if x < val:
-                        count += 1
-                result.append(count / len(args[0]))
-            return result
-            
-        elif syntax_list['name'] == 'arrPop':
-            if len(args[0]) > 0:
-                last_val = args[0][-1]
-                args[0] = args[0][:-1]
-                return last_val
-            return None
-            
-        elif syntax_list['name'] == 'arrPush':
-            args[0].append(args[1])
-            return len(args[0])
-            
-        elif syntax_list['name'] == 'arrRange':
-            start = args[0]
-            end = args[1]
-            step = args[2] if len(args) > 2 else 1
-            result = []
-            current = start
-            while (step > 0 and current < end) or (step < 0 and current > end):
-                result.append(current)
-                current += step
-            return result
-            
-        elif syntax_list['name'] == 'arrReverse':
-            result = []
-            for i in range(len(args[0])-1, -1, -1):
-                result.append(args[0][i])
-            return result
-            
-        elif syntax_list['name'] == 'arrSet':
-            args[0][args[1]] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'arrShift':
-            if len(args[0]) > 0:
-                first_val = args[0][0]
-                args[0] = args[0][1:]
-                return first_val
-            return None
-            
-        elif syntax_list['name'] == 'arrSize':
-            count = 0
-            for _ in args[0]:
-                count += 1
-            return count
-            
-        elif syntax_list['name'] == 'arrSlice':
-            result = []
-            start = args[1]
-            end = args[2]
-            for i in range(start, end):
-                result.append(args[0][i])
-            return result
-            
-        elif syntax_list['name'] == 'arrSort':
-            result = args[0].copy()
-            for i in range(len(result)):
-                for j in range(len(result)-1-i):
-                    if result[j] > result[j+1]:
-                        result[j], result[j+1] = result[j+1], result[j]
-            return result
-            
-        elif syntax_list['name'] == 'arrStandardize':
-            mean = sum(args[0]) / len(args[0])
-            squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
-            std_dev = (squared_diff_sum / len(args[0])) ** 0.5
-            return [(x - mean) / std_dev for x in args[0]]
-            
-        elif syntax_list['name'] == 'arrStdev':
-            mean = sum(args[0]) / len(args[0])
-            squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
-            return (squared_diff_sum / (len(args[0]) - 1)) ** 0.5
-            
-        elif syntax_list['name'] == 'arrSum':
-            total = 0
-            for x in args[0]:
-                total += x
-            return total
-            
-        elif syntax_list['name'] == 'arrUnshift':
-            result = [args[1]]
-            for x in args[0]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrVariance':
-            mean = sum(args[0]) / len(args[0])
-            squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
-            return squared_diff_sum / (len(args[0]) - 1)
+    if not self.registry['syntax_registry']['elements'].get(syntax_list['name']):
+        return None
+    entry = syntax_list.get('builtin') or BUILTINS.get(syntax_list['name'])
+    if entry is None:
+        return None
+    return entry.func(self, *args)
+
+
+@builtin('arrAbs')
+def _syntax_arrAbs(self, *args):
+    return [abs(x) for x in args[0]]
+
+
+@builtin('arrAvg')
+def _syntax_arrAvg(self, *args):
+    return sum(args[0]) / len(args[0])
+
+
+@builtin('arrBinarySearch')
+def _syntax_arrBinarySearch(self, *args):
+    left, right = 0, len(args[0]) - 1
+    while left <= right:
+        mid = (left + right) // 2
+        if args[0][mid] == args[1]:
+            return mid
+        elif args[0][mid] < args[1]:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return left
+
+
+@builtin('arrBinarySearchLeftmost')
+def _syntax_arrBinarySearchLeftmost(self, *args):
+    left, right = 0, len(args[0])
+    while left < right:
+        mid = (left + right) // 2
+        if args[0][mid] < args[1]:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+@builtin('arrBinarySearchRightmost')
+def _syntax_arrBinarySearchRightmost(self, *args):
+    left, right = 0, len(args[0])
+    while left < right:
+        mid = (left + right) // 2
+        if args[0][mid] <= args[1]:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+@builtin('arrClear')
+def _syntax_arrClear(self, *args):
+    args[0] = []
+    return args[0]
+
+
+@builtin('arrConcat')
+def _syntax_arrConcat(self, *args):
+    result = []
+    for x in args[0]:
+        result.append(x)
+    for x in args[1]:
+        result.append(x)
+    return result
 
 
+@builtin('arrCopy')
+def _syntax_arrCopy(self, *args):
+    result = []
+    for x in args[0]:
+        result.append(x)
+    return result
 
 
-        # ta-lib functions
+@builtin('arrCovariance')
+def _syntax_arrCovariance(self, *args):
+    mean1 = sum(args[0]) / len(args[0])
+    mean2 = sum(args[1]) / len(args[1])
+    sum_of_products = sum((x - mean1) * (y - mean2) for x, y in zip(args[0], args[1]))
+    return sum_of_products / len(args[0])
 
-        elif syntax_list['name'] == 'adLine':
-            return talib.AD(args[0], args[1], args[2], args[3])  # high, low, close, volume
 
-        elif syntax_list['name'] == 'adOsc':
-            return talib.ADOSC(args[0], args[1], args[2], args[3], fastperiod=args[4], slowperiod=args[5])
-        
-        elif syntax_list['name'] == 'adx':
-            return talib.ADX(args[0], args[1], args[2], timeperiod=args[3])
-        
-        elif syntax_list['name'] == 'adxr':
-            return talib.ADXR(args[0], args[1], args[2], timeperiod=args[3])
-        
-        elif syntax_list['name'] == 'apo':
-            return talib.APO(args[0], fastperiod=args[1], slowperiod=args[2])
-        
-        elif syntax_list['name'] == 'aroon':
-            aroondown, aroonup = talib.AROON(args[0], args[1], timeperiod=args[2])
-            return {'down': aroondown, 'up': aroonup}
-        
-        elif syntax_list['name'] == 'aroonOsc':
-            return talib.AROONOSC(args[0], args[1], timeperiod=args[2])
-        
-        elif syntax_list['name'] == 'atr':
-            return talib.ATR(args[0], args[1], args[2], timeperiod=args[3])
-        
-        elif syntax_list['name'] == 'avgPrice':
-            return talib.AVGPRICE(args[0], args[1], args[2], args[3])
-        
-        elif syntax_list['name'] == 'bbands':
-            upper, middle, lower = talib.BBANDS(args[0], timeperiod=args[1], nbdevup=args[2], nbdevdn=args[2])
-            return {'upper': upper, 'middle': middle, 'lower': lower}
-        
-        elif syntax_list['name'] == 'beta':
-            return talib.BETA(args[0], args[1], timeperiod=args[2])
-        
-        elif syntax_list['name'] == 'bop':
-            return talib.BOP(args[0], args[1], args[2], args[3])
-        
-        elif syntax_list['name'] == 'cci':
-            return talib.CCI(args[0], args[1], args[2], timeperiod=args[3])
-        
-        elif syntax_list['name'] == 'cmo':
-            return talib.CMO(args[0], timeperiod=args[1])
-        
-        elif syntax_list['name'] == 'correl':
-            return talib.CORREL(args[0], args[1], timeperiod=args[2])
-        
-        elif syntax_list['name'] == 'dema':
-            return talib.DEMA(args[0], timeperiod=args[1])
-        
-        elif syntax_list['name'] == 'dx':
-            return talib.DX(args[0], args[1], args[2], timeperiod=args[3])
-        
-        elif syntax_list['name'] == 'ema':
-            return talib.EMA(args[0], timeperiod=args[1])
-        
-        elif syntax_list['name'] == 'htDcPeriod':
-            return talib.HT_DCPERIOD(args[0])
-        
-        elif syntax_list['name'] == 'htDcPhase':
-            return talib.HT_DCPHASE(args[0])
-        
-        elif syntax_list['name'] == 'htPhasor':
-            inphase, quadrature = talib.HT_PHASOR(args[0])
-            return {'inphase': inphase, 'quadrature': quadrature}
-        
-        elif syntax_list['name'] == 'htSine':
-            sine, leadsine = talib.HT_SINE(args[0])
-            return {'sine': sine, 'leadsine': leadsine}
-        
-        elif syntax_list['name'] == 'htTrendline':
-            return talib.HT_TRENDLINE(args[0])
-        
-        elif syntax_list['name'] == 'htTrendMode':
-            return talib.HT_TRENDMODE(args[0])
+@builtin('arrEvery')
+def _syntax_arrEvery(self, *args):
+    for x in args[0]:
+        if not args[1](x):
+            return False
+    return True
 
-        elif syntax_list['name'] == 'kama':
-            return talib.KAMA(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'linearReg':
-            return talib.LINEARREG(args[0], timeperiod=args[1])
+@builtin('arrFill')
+def _syntax_arrFill(self, *args):
+    result = []
+    for _ in range(len(args[0])):
+        result.append(args[1])
+    return result
 
-        elif syntax_list['name'] == 'linearRegAngle':
-            return talib.LINEARREG_ANGLE(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'linearRegIntercept':
-            return talib.LINEARREG_INTERCEPT(args[0], timeperiod=args[1])
+@builtin('arrFirst')
+def _syntax_arrFirst(self, *args):
+    if len(args[0]) > 0:
+        return args[0][0]
+    return None
 
-        elif syntax_list['name'] == 'linearRegSlope':
-            return talib.LINEARREG_SLOPE(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'ma':
-            return talib.MA(args[0], timeperiod=args[1], matype=args[2])
+@builtin('arrFrom')
+def _syntax_arrFrom(self, *args):
+    result = []
+    for x in args[0]:
+        result.append(x)
+    return result
 
-        elif syntax_list['name'] == 'macd':
-            macd, signal, hist = talib.MACD(args[0], fastperiod=args[1], slowperiod=args[2], signalperiod=args[3])
-            return {'macd': macd, 'signal': signal, 'hist': hist}
 
-        elif syntax_list['name'] == 'macdExt':
-            macd, signal, hist = talib.MACDEXT(args[0], fastperiod=args[1], fastmatype=args[2], slowperiod=args[3], slowmatype=args[4], signalperiod=args[5], signalmatype=args[6])
-            return {'macd': macd, 'signal': signal, 'hist': hist}
+@builtin('arrGet')
+def _syntax_arrGet(self, *args):
+    return args[0][args[1]]
 
-        elif syntax_list['name'] == 'macdFix':
-            macd, signal, hist = talib.MACDFIX(args[0], signalperiod=args[1])
-            return {'macd': macd, 'signal': signal, 'hist': hist}
 
-        elif syntax_list['name'] == 'mama':
-            mama, fama = talib.MAMA(args[0], fastlimit=args[1], slowlimit=args[2])
-            return {'mama': mama, 'fama': fama}
+@builtin('arrIncludes')
+def _syntax_arrIncludes(self, *args):
+    for x in args[0]:
+        if x == args[1]:
+            return True
+    return False
+
+
+@builtin('arrIndexOf')
+def _syntax_arrIndexOf(self, *args):
+    for i in range(len(args[0])):
+        if args[0][i] == args[1]:
+            return i
+    return -1
+
+
+@builtin('arrInsert')
+def _syntax_arrInsert(self, *args):
+    result = []
+    for i in range(len(args[0])):
+        if i == args[1]:
+            result.append(args[2])
+        result.append(args[0][i])
+    if args[1] >= len(args[0]):
+        result.append(args[2])
+    return result
 
-        elif syntax_list['name'] == 'maxIndex':
-            return talib.MAXINDEX(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'medPrice':
-            return talib.MEDPRICE(args[0], args[1])
+@builtin('arrJoin')
+def _syntax_arrJoin(self, *args):
+    result = str(args[0][0]) if args[0] else ""
+    for x in args[0][1:]:
+        result += args[1] + str(x)
+    return result
 
-        elif syntax_list['name'] == 'mfi':
-            return talib.MFI(args[0], args[1], args[2], args[3], timeperiod=args[4])
 
-        elif syntax_list['name'] == 'midPoint':
-            return talib.MIDPOINT(args[0], timeperiod=args[1])
+@builtin('arrLast')
+def _syntax_arrLast(self, *args):
+    if len(args[0]) > 0:
+        return args[0][-1]
+    return None
 
-        elif syntax_list['name'] == 'midPrice':
-            return talib.MIDPRICE(args[0], args[1], timeperiod=args[2])
 
-        elif syntax_list['name'] == 'minIndex':
-            return talib.MININDEX(args[0], timeperiod=args[1])
+@builtin('arrLastIndexOf')
+def _syntax_arrLastIndexOf(self, *args):
+    for i in range(len(args[0])-1, -1, -1):
+        if args[0][i] == args[1]:
+            return i
+    return -1
 
-        elif syntax_list['name'] == 'minMax':
-            min_val, max_val = talib.MINMAX(args[0], timeperiod=args[1])
-            return {'min': min_val, 'max': max_val}
 
-        elif syntax_list['name'] == 'minMaxIndex':
-            minidx, maxidx = talib.MINMAXINDEX(args[0], timeperiod=args[1])
-            return {'minidx': minidx, 'maxidx': maxidx}
+@builtin('arrMax')
+def _syntax_arrMax(self, *args):
+    if not args[0]:
+        return None
+    max_val = args[0][0]
+    for x in args[0][1:]:
+        if x > max_val:
+            max_val = x
+    return max_val
+
+
+@builtin('arrMedian')
+def _syntax_arrMedian(self, *args):
+    sorted_arr = []
+    for x in args[0]:
+        sorted_arr.append(x)
+    for i in range(len(sorted_arr)):
+        for j in range(len(sorted_arr)-1-i):
+            if sorted_arr[j] > sorted_arr[j+1]:
+                sorted_arr[j], sorted_arr[j+1] = sorted_arr[j+1], sorted_arr[j]
+    n = len(sorted_arr)
+    if n % 2 == 0:
+        return (sorted_arr[n//2-1] + sorted_arr[n//2]) / 2
+    return sorted_arr[n//2]
+
+
+@builtin('arrMin')
+def _syntax_arrMin(self, *args):
+    if not args[0]:
+        return None
+    min_val = args[0][0]
+    for x in args[0][1:]:
+        if x < min_val:
+            min_val = x
+    return min_val
 
-        elif syntax_list['name'] == 'minusDI':
-            return talib.MINUS_DI(args[0], args[1], args[2], timeperiod=args[3])
 
-        elif syntax_list['name'] == 'minusDM':
-            return talib.MINUS_DM(args[0], args[1], timeperiod=args[2])
+@builtin('arrMode')
+def _syntax_arrMode(self, *args):
+    if not args[0]:
+        return None
+    counts = {}
+    for x in args[0]:
+        if x in counts:
+            counts[x] += 1
+        else:
+            counts[x] = 1
+    max_count = 0
+    mode = None
+    for x, count in counts.items():
+        if count > max_count:
+            max_count = count
+            mode = x
+    return mode
+
+
+@builtin('arrNewBox')
+def _syntax_arrNewBox(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
 
-        elif syntax_list['name'] == 'mom':
-            return talib.MOM(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'natr':
-            return talib.NATR(args[0], args[1], args[2], timeperiod=args[3])
+@builtin('aryNewCol')
+def _syntax_aryNewCol(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append([])
+    return result
 
-        elif syntax_list['name'] == 'obv':
-            return talib.OBV(args[0], args[1])
 
-        elif syntax_list['name'] == 'plusDI':
-            return talib.PLUS_DI(args[0], args[1], args[2], timeperiod=args[3])
+@builtin('arrNewLabel')
+def _syntax_arrNewLabel(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
 
-        elif syntax_list['name'] == 'plusDM':
-            return talib.PLUS_DM(args[0], args[1], timeperiod=args[2])
 
-        elif syntax_list['name'] == 'ppo':
-            return talib.PPO(args[0], fastperiod=args[1], slowperiod=args[2], matype=args[3])
+@builtin('arrNewLine')
+def _syntax_arrNewLine(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
 
-        elif syntax_list['name'] == 'roc':
-            return talib.ROC(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'rocp':
-            return talib.ROCP(args[0], timeperiod=args[1])
+@builtin('arrNewLineFill')
+def _syntax_arrNewLineFill(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
 
-        elif syntax_list['name'] == 'rocr':
-            return talib.ROCR(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'rocr100':
-            return talib.ROCR100(args[0], timeperiod=args[1])
+@builtin('arrNewTable')
+def _syntax_arrNewTable(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
 
-        elif syntax_list['name'] == 'rsi':
-            return talib.RSI(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'sar':
-            return talib.SAR(args[0], args[1], acceleration=args[2], maximum=args[3])
+@builtin('arrNewType')
+def _syntax_arrNewType(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
 
-        elif syntax_list['name'] == 'sarExt':
-            return talib.SAREXT(args[0], args[1], startvalue=args[2], offsetonreverse=args[3], accelerationinitlong=args[4], accelerationlong=args[5], accelerationmaxlong=args[6], accelerationinitshort=args[7], accelerationshort=args[8], accelerationmaxshort=args[9])
 
-        elif syntax_list['name'] == 'sma':
-            return talib.SMA(args[0], timeperiod=args[1])
+@builtin('arrPercentileLinearInterpolation')
+def _syntax_arrPercentileLinearInterpolation(self, *args):
+    sorted_arr = sorted(args[0])
+    rank = args[1] * (len(sorted_arr) - 1) / 100
+    lower_idx = int(rank)
+    fraction = rank - lower_idx
+    if lower_idx >= len(sorted_arr) - 1:
+        return sorted_arr[-1]
+    return sorted_arr[lower_idx] + fraction * (sorted_arr[lower_idx + 1] - sorted_arr[lower_idx])
 
-        elif syntax_list['name'] == 'stdDev':
-            return talib.STDDEV(args[0], timeperiod=args[1], nbdev=args[2])
 
-        elif syntax_list['name'] == 'stoch':
-            slowk, slowd = talib.STOCH(args[0], args[1], args[2], fastk_period=args[3], slowk_period=args[4], slowk_matype=args[5], slowd_period=args[6], slowd_matype=args[7])
-            return {'slowk': slowk, 'slowd': slowd}
+@builtin('arrPercentileNearestRank')
+def _syntax_arrPercentileNearestRank(self, *args):
+    sorted_arr = sorted(args[0])
+    rank = round(args[1] * (len(sorted_arr) - 1) / 100)
+    return sorted_arr[rank]
 
-        elif syntax_list['name'] == 'stochF':
-            fastk, fastd = talib.STOCHF(args[0], args[1], args[2], fastk_period=args[3], fastd_period=args[4], fastd_matype=args[5])
-            return {'fastk': fastk, 'fastd': fastd}
 
-        elif syntax_list['name'] == 'stochRsi':
-            fastk, fastd = talib.STOCHRSI(args[0], timeperiod=args[1], fastk_period=args[2], fastd_period=args[3], fastd_matype=args[4])
-            return {'fastk': fastk, 'fastd': fastd}
+@builtin('arrRemove')
+def _syntax_arrRemove(self, *args):
+    result = []
+    for x in args[0]:
+        if x != args[1]:
+            result.append(x)
+    return result
 
-        elif syntax_list['name'] == 'sum':
-            return talib.SUM(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 't3':
-            return talib.T3(args[0], timeperiod=args[1], vfactor=args[2])
+@builtin('arrSome')
+def _syntax_arrSome(self, *args):
+    for x in args[0]:
+        if args[1](x):
+            return True
+    return False
 
-        elif syntax_list['name'] == 'tema':
-            return talib.TEMA(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'tRange':
-            return talib.TRANGE(args[0], args[1], args[2])
+@builtin('arrSortIndices')
+def _syntax_arrSortIndices(self, *args):
+    indices = list(range(len(args[0])))
+    for i in range(len(indices)):
+        for j in range(len(indices)-1-i):
+            if args[0][indices[j]] > args[0][indices[j+1]]:
+                indices[j], indices[j+1] = indices[j+1], indices[j]
+    return indices
 
-        elif syntax_list['name'] == 'trima':
-            return talib.TRIMA(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'trix':
-            return talib.TRIX(args[0], timeperiod=args[1])
+@builtin('arrNewBool')
+def _syntax_arrNewBool(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(False)
+    return result
 
-        elif syntax_list['name'] == 'tsf':
-            return talib.TSF(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'typPrice':
-            return talib.TYPPRICE(args[0], args[1], args[2])
+@builtin('arrNewFloat')
+def _syntax_arrNewFloat(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(0.0)
+    return result
 
-        elif syntax_list['name'] == 'ultOsc':
-            return talib.ULTOSC(args[0], args[1], args[2], timeperiod1=args[3], timeperiod2=args[4], timeperiod3=args[5])
 
-        elif syntax_list['name'] == 'variance':
-            return talib.VAR(args[0], timeperiod=args[1], nbdev=args[2])
+@builtin('arrNewInt')
+def _syntax_arrNewInt(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(0)
+    return result
 
-        elif syntax_list['name'] == 'wclPrice':
-            return talib.WCLPRICE(args[0], args[1], args[2])
 
-        elif syntax_list['name'] == 'willr':
-            return talib.WILLR(args[0], args[1], args[2], timeperiod=args[3])
+@builtin('arrNewString')
+def _syntax_arrNewString(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append("")
+    return result
 
-        elif syntax_list['name'] == 'wma':
-            return talib.WMA(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'pattern2Crows':
-            return talib.CDL2CROWS(args[0], args[1], args[2], args[3])  # open, high, low, close
+@builtin('arrPercentRank')
+def _syntax_arrPercentRank(self, *args):
+    result = []
+    for val in args[0]:
+        count = 0
+        for x in args[0]:
+            if x < val:
+                count += 1
+        result.append(count / len(args[0]))
+    return result
 
-        elif syntax_list['name'] == 'pattern3BlackCrows':
-            return talib.CDL3BLACKCROWS(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'pattern3Inside':
-            return talib.CDL3INSIDE(args[0], args[1], args[2], args[3])
+@builtin('arrPop')
+def _syntax_arrPop(self, *args):
+    if len(args[0]) > 0:
+        last_val = args[0][-1]
+        args[0] = args[0][:-1]
+        return last_val
+    return None
 
-        elif syntax_list['name'] == 'pattern3LineStrike':
-            return talib.CDL3LINESTRIKE(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'pattern3StarsInSouth':
-            return talib.CDL3STARSINSOUTH(args[0], args[1], args[2], args[3])
+@builtin('arrPush')
+def _syntax_arrPush(self, *args):
+    args[0].append(args[1])
+    return len(args[0])
 
-        elif syntax_list['name'] == 'pattern3WhiteSoldiers':
-            return talib.CDL3WHITESOLDIERS(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternAbandonedBaby':
-            return talib.CDLABANDONEDBABY(args[0], args[1], args[2], args[3], penetration=args[4])
+@builtin('arrRange')
+def _syntax_arrRange(self, *args):
+    start = args[0]
+    end = args[1]
+    step = args[2] if len(args) > 2 else 1
+    result = []
+    current = start
+    while (step > 0 and current < end) or (step < 0 and current > end):
+        result.append(current)
+        current += step
+    return result
 
-        elif syntax_list['name'] == 'patternAdvanceBlock':
-            return talib.CDLADVANCEBLOCK(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternBeltHold':
-            return talib.CDLBELTHOLD(args[0], args[1], args[2], args[3])
+@builtin('arrReverse')
+def _syntax_arrReverse(self, *args):
+    result = []
+    for i in range(len(args[0])-1, -1, -1):
+        result.append(args[0][i])
+    return result
 
-        elif syntax_list['name'] == 'patternBreakaway':
-            return talib.CDLBREAKAWAY(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternClosingMarubozu':
-            return talib.CDLCLOSINGMARUBOZU(args[0], args[1], args[2], args[3])
+@builtin('arrSet')
+def _syntax_arrSet(self, *args):
+    args[0][args[1]] = args[2]
+    return args[0]
 
-        elif syntax_list['name'] == 'patternConcealBabySwallow':
-            return talib.CDLCONCEALBABYSWALL(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternCounterattack':
-            return talib.CDLCOUNTERATTACK(args[0], args[1], args[2], args[3])
+@builtin('arrShift')
+def _syntax_arrShift(self, *args):
+    if len(args[0]) > 0:
+        first_val = args[0][0]
+        args[0] = args[0][1:]
+        return first_val
+    return None
 
-        elif syntax_list['name'] == 'patternDarkCloud':
-            return talib.CDLDARKCLOUDCOVER(args[0], args[1], args[2], args[3], penetration=args[4])
 
-        elif syntax_list['name'] == 'patternDoji':
-            return talib.CDLDOJI(args[0], args[1], args[2], args[3])
+@builtin('arrSize')
+def _syntax_arrSize(self, *args):
+    count = 0
+    for _ in args[0]:
+        count += 1
+    return count
 
-        elif syntax_list['name'] == 'patternDojiStar':
-            return talib.CDLDOJISTAR(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternDragonflyDoji':
-            return talib.CDLDRAGONFLYDOJI(args[0], args[1], args[2], args[3])
+@builtin('arrSlice')
+def _syntax_arrSlice(self, *args):
+    result = []
+    start = args[1]
+    end = args[2]
+    for i in range(start, end):
+        result.append(args[0][i])
+    return result
 
-        elif syntax_list['name'] == 'patternEngulfing':
-            return talib.CDLENGULFING(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternEveningDojiStar':
-            return talib.CDLEVENINGDOJISTAR(args[0], args[1], args[2], args[3], penetration=args[4])
+@builtin('arrSort')
+def _syntax_arrSort(self, *args):
+    result = args[0].copy()
+    for i in range(len(result)):
+        for j in range(len(result)-1-i):
+            if result[j] > result[j+1]:
+                result[j], result[j+1] = result[j+1], result[j]
+    return result
 
-        elif syntax_list['name'] == 'patternEveningStar':
-            return talib.CDLEVENINGSTAR(args[0], args[1], args[2], args[3], penetration=args[4])
 
-        elif syntax_list['name'] == 'patternGapSideSide':
-            return talib.CDLGAPSIDESIDEWHITE(args[0], args[1], args[2], args[3])
+@builtin('arrStandardize')
+def _syntax_arrStandardize(self, *args):
+    mean = sum(args[0]) / len(args[0])
+    squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
+    std_dev = (squared_diff_sum / len(args[0])) ** 0.5
+    return [(x - mean) / std_dev for x in args[0]]
 
-        elif syntax_list['name'] == 'patternGravestoneDoji':
-            return talib.CDLGRAVESTONEDOJI(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternHammer':
-            return talib.CDLHAMMER(args[0], args[1], args[2], args[3])
+@builtin('arrStdev')
+def _syntax_arrStdev(self, *args):
+    mean = sum(args[0]) / len(args[0])
+    squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
+    return (squared_diff_sum / (len(args[0]) - 1)) ** 0.5
 
-        elif syntax_list['name'] == 'patternHangingMan':
-            return talib.CDLHANGINGMAN(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternHarami':
-            return talib.CDLHARAMI(args[0], args[1], args[2], args[3])
+@builtin('arrSum')
+def _syntax_arrSum(self, *args):
+    total = 0
+    for x in args[0]:
+        total += x
+    return total
 
-        elif syntax_list['name'] == 'patternHaramiCross':
-            return talib.CDLHARAMICROSS(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternHighWave':
-            return talib.CDLHIGHWAVE(args[0], args[1], args[2], args[3])
+@builtin('arrUnshift')
+def _syntax_arrUnshift(self, *args):
+    result = [args[1]]
+    for x in args[0]:
+        result.append(x)
+    return result
 
-        elif syntax_list['name'] == 'patternHikkake':
-            return talib.CDLHIKKAKE(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternHikkakeMod':
-            return talib.CDLHIKKAKEMOD(args[0], args[1], args[2], args[3])
+@builtin('arrVariance')
+def _syntax_arrVariance(self, *args):
+    mean = sum(args[0]) / len(args[0])
+    squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
+    return squared_diff_sum / (len(args[0]) - 1)
 
-        elif syntax_list['name'] == 'patternHomingPigeon':
-            return talib.CDLHOMINGPIGEON(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternIdentical3Crows':
-            return talib.CDLIDENTICAL3CROWS(args[0], args[1], args[2], args[3])
+# ta-lib functions
 
-        elif syntax_list['name'] == 'patternInNeck':
-            return talib.CDLINNECK(args[0], args[1], args[2], args[3])
+@builtin('adLine')
+def _syntax_adLine(self, *args):
+    return talib.AD(args[0], args[1], args[2], args[3])  # high, low, close, volume
 
-        elif syntax_list['name'] == 'patternInvertedHammer':
-            return talib.CDLINVERTEDHAMMER(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternKicking':
-            return talib.CDLKICKING(args[0], args[1], args[2], args[3])
+@builtin('adOsc')
+def _syntax_adOsc(self, *args):
+    return talib.ADOSC(args[0], args[1], args[2], args[3], fastperiod=args[4], slowperiod=args[5])
 
-        elif syntax_list['name'] == 'patternKickingByLength':
-            return talib.CDLKICKINGBYLENGTH(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternLadderBottom':
-            return talib.CDLLADDERBOTTOM(args[0], args[1], args[2], args[3])
+@builtin('adx')
+def _syntax_adx(self, *args):
+    return talib.ADX(args[0], args[1], args[2], timeperiod=args[3])
 
-        elif syntax_list['name'] == 'patternLongLeggedDoji':
-            return talib.CDLLONGLEGGEDDOJI(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternLongLine':
-            return talib.CDLLONGLINE(args[0], args[1], args[2], args[3])
+@builtin('adxr')
+def _syntax_adxr(self, *args):
+    return talib.ADXR(args[0], args[1], args[2], timeperiod=args[3])
 
-        elif syntax_list['name'] == 'patternMarubozu':
-            return talib.CDLMARUBOZU(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternMatchingLow':
-            return talib.CDLMATCHINGLOW(args[0], args[1], args[2], args[3])
+@builtin('apo')
+def _syntax_apo(self, *args):
+    return talib.APO(args[0], fastperiod=args[1], slowperiod=args[2])
 
-        elif syntax_list['name'] == 'patternMatHold':
-            return talib.CDLMATHOLD(args[0], args[1], args[2], args[3], penetration=args[4])
 
-        elif syntax_list['name'] == 'patternMorningDojiStar':
-            return talib.CDLMORNINGDOJISTAR(args[0], args[1], args[2], args[3], penetration=args[4])
+@builtin('aroon')
+def _syntax_aroon(self, *args):
+    aroondown, aroonup = talib.AROON(args[0], args[1], timeperiod=args[2])
+    return {'down': aroondown, 'up': aroonup}
 
-        elif syntax_list['name'] == 'patternMorningStar':
-            return talib.CDLMORNINGSTAR(args[0], args[1], args[2], args[3], penetration=args[4])
 
-        elif syntax_list['name'] == 'patternOnNeck':
-            return talib.CDLONNECK(args[0], args[1], args[2], args[3])
+@builtin('aroonOsc')
+def _syntax_aroonOsc(self, *args):
+    return talib.AROONOSC(args[0], args[1], timeperiod=args[2])
 
-        elif syntax_list['name'] == 'patternPiercing':
-            return talib.CDLPIERCING(args[0], args[1], args[2], args[3])
-        elif syntax_list['name'] == 'patternRickshawMan':
-            return talib.CDLRICKSHAWMAN(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternRiseFall3Methods':
-            return talib.CDLRISEFALL3METHODS(args[0], args[1], args[2], args[3])
+@builtin('atr')
+def _syntax_atr(self, *args):
+    return talib.ATR(args[0], args[1], args[2], timeperiod=args[3])
 
-        elif syntax_list['name'] == 'patternSeparatingLines':
-            return talib.CDLSEPARATINGLINES(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternShootingStar':
-            return talib.CDLSHOOTINGSTAR(args[0], args[1], args[2], args[3])
+@builtin('avgPrice')
+def _syntax_avgPrice(self, *args):
+    return talib.AVGPRICE(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternShortLine':
-            return talib.CDLSHORTLINE(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternSpinningTop':
-            return talib.CDLSPINNINGTOP(args[0], args[1], args[2], args[3])
+@builtin('bbands')
+def _syntax_bbands(self, *args):
+    upper, middle, lower = talib.BBANDS(args[0], timeperiod=args[1], nbdevup=args[2], nbdevdn=args[2])
+    return {'upper': upper, 'middle': middle, 'lower': lower}
 
-        elif syntax_list['name'] == 'patternStalledPattern':
-            return talib.CDLSTALLEDPATTERN(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternStickSandwich':
-            return talib.CDLSTICKSANDWICH(args[0], args[1], args[2], args[3])
+@builtin('beta')
+def _syntax_beta(self, *args):
+    return talib.BETA(args[0], args[1], timeperiod=args[2])
 
-        elif syntax_list['name'] == 'patternTakuri':
-            return talib.CDLTAKURI(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternTasukiGap':
-            return talib.CDLTASUKIGAP(args[0], args[1], args[2], args[3])
+@builtin('bop')
+def _syntax_bop(self, *args):
+    return talib.BOP(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternThrusting':
-            return talib.CDLTHRUSTING(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternTristar':
-            return talib.CDLTRISTAR(args[0], args[1], args[2], args[3])
+@builtin('cci')
+def _syntax_cci(self, *args):
+    return talib.CCI(args[0], args[1], args[2], timeperiod=args[3])
 
-        elif syntax_list['name'] == 'patternUnique3River':
-            return talib.CDLUNIQUE3RIVER(args[0], args[1], args[2], args[3])
 
-        elif syntax_list['name'] == 'patternUpsideGap2Crows':
-            return talib.CDLUPSIDEGAP2CROWS(args[0], args[1], args[2], args[3])
+@builtin('cmo')
+def _syntax_cmo(self, *args):
+    return talib.CMO(args[0], timeperiod=args[1])
 
-        elif syntax_list['name'] == 'patternXsideGap3Methods':
-            return talib.CDLXSIDEGAP3METHODS(args[0], args[1], args[2], args[3])
 
+@builtin('correl')
+def _syntax_correl(self, *args):
+    return talib.CORREL(args[0], args[1], timeperiod=args[2])
 
-        # box
-        elif syntax_list['name'] == 'boxFunc':
-            return {
-                'left': 0,
-                'top': 0,
-                'right': 0,
-                'bottom': 0,
-                'text': '',
-                'bgColor': '#FFFFFF',
-                'borderColor': '#000000',
-                'borderWidth': 1,
-                'borderStyle': 'solid',
-                'textColor': '#000000',
-                'textSize': 12,
-                'textAlign': 'center',
-                'textVAlign': 'middle',
-                'textWrap': 'none',
-                'textFontFamily': 'Arial'
-            }
-            
-        elif syntax_list['name'] == 'boxCopyFunc':
-            return {
-                'left': args[0]['left'],
-                'top': args[0]['top'],
-                'right': args[0]['right'],
-                'bottom': args[0]['bottom'],
-                'text': args[0]['text'],
-                'bgColor': args[0]['bgColor'],
-                'borderColor': args[0]['borderColor'],
-                'borderWidth': args[0]['borderWidth'],
-                'borderStyle': args[0]['borderStyle'],
-                'textColor': args[0]['textColor'],
-                'textSize': args[0]['textSize'],
-                'textAlign': args[0]['textAlign'],
-                'textVAlign': args[0]['textVAlign'],
-                'textWrap': args[0]['textWrap'],
-                'textFontFamily': args[0]['textFontFamily']
-            }
-            
-        elif syntax_list['name'] == 'boxDeleteFunc':
-            args[0] = None
-            return True
-            
-        elif syntax_list['name'] == 'boxGetBottomFunc':
-            return args[0]['bottom']
-            
-        elif syntax_list['name'] == 'boxGetLeftFunc':
-            return args[0]['left']
-            
-        elif syntax_list['name'] == 'boxGetRightFunc':
-            return args[0]['right']
-            
-        elif syntax_list['name'] == 'boxGetTopFunc':
-            return args[0]['top']
-            
-        elif syntax_list['name'] == 'boxNewFunc':
-            return {
-                'left': args[0],
-                'top': args[1],
-                'right': args[2],
-                'bottom': args[3]
-            }
-            
-        elif syntax_list['name'] == 'boxSetBgColFunc':
-            args[0]['bgColor'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBorderColFunc':
-            args[0]['borderColor'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBorderStyleFunc':
-            args[0]['borderStyle'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBorderWidthFunc':
-            args[0]['borderWidth'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBottomFunc':
-            args[0]['bottom'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBottomRightPointFunc':
-            args[0]['bottom'] = args[1]
-            args[0]['right'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetExtendFunc':
-            args[0]['extend'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetLeftFunc':
-            args[0]['left'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetLeftTopFunc':
-            args[0]['left'] = args[1]
-            args[0]['top'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetRightFunc':
-            args[0]['right'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetRightBottomFunc':
-            args[0]['right'] = args[1]
-            args[0]['bottom'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextFunc':
-            args[0]['text'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextColFunc':
-            args[0]['textColor'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextFontFamilyFunc':
-            args[0]['textFontFamily'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextHAlignFunc':
-            args[0]['textAlign'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextSizeFunc':
-            args[0]['textSize'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextVAlignFunc':
-            args[0]['textVAlign'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextWrapFunc':
-            args[0]['textWrap'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTopFunc':
-            args[0]['top'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTopLeftPointFunc':
-            args[0]['top'] = args[1]
-            args[0]['left'] = args[2]
-            return args[0]
- 
-
-        #col , day
-
-        elif syntax_list['name'] == 'chartPointCopyFunc':
-            return {
-                'x': args[0]['x'],
-                'y': args[0]['y'],
-                'time': args[0]['time'],
-                'index': args[0]['index']
-            }
-            
-        elif syntax_list['name'] == 'chartPointFromIndexFunc':
-            return {
-                'x': args[0],
-                'y': 0,
-                'time': args[1],
-                'index': args[0]
-            }
-            
-        elif syntax_list['name'] == 'chartPointFromTimeFunc':
-            return {
-                'x': 0,
-                'y': 0,
-                'time': args[0],
-                'index': args[1]
-            }
-            
-        elif syntax_list['name'] == 'chartPointNewFunc':
-            return {
-                'x': args[0],
-                'y': args[1],
-                'time': args[2],
-                'index': args[3]
-            }
-            
-        elif syntax_list['name'] == 'chartPointNowFunc':
-            return {
-                'x': args[0],
-                'y': args[1],
-                'time': args[2],
-                'index': 0
-            }
-            
-        elif syntax_list['name'] == 'colFunc':
-            return {
-                'r': args[0],
-                'g': args[1],
-                'b': args[2],
-                't': args[3] if len(args) > 3 else 255
-            }
-            
-        elif syntax_list['name'] == 'colBFunc':
-            return args[0]['b']
-            
-        elif syntax_list['name'] == 'colFromGradientFunc':
-            start_r = args[0]['r']
-            start_g = args[0]['g']
-            start_b = args[0]['b']
-            end_r = args[1]['r']
-            end_g = args[1]['g']
-            end_b = args[1]['b']
-            percent = args[2]
-            
-            r = start_r + (end_r - start_r) * percent
-            g = start_g + (end_g - start_g) * percent
-            b = start_b + (end_b - start_b) * percent
-            
-            return {'r': r, 'g': g, 'b': b, 't': 255}
-            
-        elif syntax_list['name'] == 'colGFunc':
-            return args[0]['g']
-            
-        elif syntax_list['name'] == 'colNewFunc':
-            return {
-                'r': args[0],
-                'g': args[1],
-                'b': args[2],
-                't': args[3] if len(args) > 3 else 255
-            }
-            
-        elif syntax_list['name'] == 'colRFunc':
-            return args[0]['r']
-            
-        elif syntax_list['name'] == 'colRgbFunc':
-            return {
-                'r': (args[0] >> 16) & 255,
-                'g': (args[0] >> 8) & 255,
-                'b': args[0] & 255,
-                't': 255
-            }
-            
-        elif syntax_list['name'] == 'colTFunc':
-            return args[0]['t']
-            
-        elif syntax_list['name'] == 'dayOfMonthFunc':
-            return args[0].day
-            
-        elif syntax_list['name'] == 'dayOfWeekFunc':
-            return args[0].weekday()
-            
-        elif syntax_list['name'] == 'fillFunc':
-            return [args[1] for _ in range(args[0])]
-            
-        elif syntax_list['name'] == 'fixNanFunc':
-            return args[1] if args[0] != args[0] else args[0]
-            
-        elif syntax_list['name'] == 'floatFunc':
-            return float(args[0])
-            
-        elif syntax_list['name'] == 'hLineFunc':
-            return {
-                'price': args[0],
-                'color': args[1] if len(args) > 1 else 'black',
-                'width': args[2] if len(args) > 2 else 1,
-                'style': args[3] if len(args) > 3 else 'solid'
-            }
-            
-        elif syntax_list['name'] == 'hourFunc':
-            return args[0].hour
-            
-        elif syntax_list['name'] == 'indicatorFunc':
-            return {
-                'name': args[0],
-                'parameters': args[1] if len(args) > 1 else {},
-                'series': args[2] if len(args) > 2 else []
-            }
 
+@builtin('dema')
+def _syntax_dema(self, *args):
+    return talib.DEMA(args[0], timeperiod=args[1])
 
-        # input
-        elif syntax_list['name'] == 'inputFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'input',
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'inputBoolFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'bool',
-                'value': True if args[1] else False
-            }
-            
-        elif syntax_list['name'] == 'inputColFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'color',
-                'value': {
-                    'r': args[1]['r'],
-                    'g': args[1]['g'],
-                    'b': args[1]['b'],
-                    't': args[1]['t']
-                }
-            }
-            
-        elif syntax_list['name'] == 'inputEnumFunc':
-            return {
-                'name': args[0],
-                'options': args[1],
-                'defval': args[2],
-                'type': 'enum',
-                'value': args[2]
-            }
-            
-        elif syntax_list['name'] == 'inputFloatFunc':
-            return {
-                'name': args[0],
-                'defval': float(args[1]),
-                'minval': float(args[2]) if len(args) > 2 else None,
-                'maxval': float(args[3]) if len(args) > 3 else None,
-                'step': float(args[4]) if len(args) > 4 else 0.1,
-                'type': 'float',
-                'value': float(args[1])
-            }
-            
-        elif syntax_list['name'] == 'inputIntFunc':
-            return {
-                'name': args[0],
-                'defval': int(args[1]),
-                'minval': int(args[2]) if len(args) > 2 else None,
-                'maxval': int(args[3]) if len(args) > 3 else None,
-                'type': 'integer',
-                'value': int(args[1])
-            }
-            
-        elif syntax_list['name'] == 'inputPriceFunc':
-            return {
-                'name': args[0],
-                'defval': float(args[1]),
-                'type': 'price',
-                'value': float(args[1])
-            }
-            
-        elif syntax_list['name'] == 'inputSessionFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'session',
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'inputSourceFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'source',
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'inputStringFunc':
-            return {
-                'name': args[0],
-                'defval': str(args[1]),
-                'type': 'string',
-                'value': str(args[1])
-            }
-            
-        elif syntax_list['name'] == 'inputSymbolFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'symbol',
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'inputTextAreaFunc':
-            return {
-                'name': args[0],
-                'defval': str(args[1]),
-                'type': 'textarea',
-                'value': str(args[1])
-            }
-            
-        elif syntax_list['name'] == 'inputTimeFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'time',
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'inputTimeFrameFunc':
-            return {
-                'name': args[0],
-                'defval': args[1],
-                'type': 'timeframe',
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'intFunc':
-            return int(float(args[0]))
 
-        # label , library
+@builtin('dx')
+def _syntax_dx(self, *args):
+    return talib.DX(args[0], args[1], args[2], timeperiod=args[3])
 
-        elif syntax_list['name'] == 'labelFunc':
-            return {
-                'text': '',
-                'x': 0,
-                'y': 0,
-                'color': '#000000',
-                'size': 12,
-                'style': 'normal',
-                'textColor': '#000000',
-                'fontFamily': 'Arial',
-                'textAlign': 'left',
-                'tooltip': '',
-                'xLoc': 'bar',
-                'yLoc': 'price'
-            }
-            
-        elif syntax_list['name'] == 'labelCopyFunc':
-            return {
-                'text': args[0]['text'],
-                'x': args[0]['x'],
-                'y': args[0]['y'],
-                'color': args[0]['color'],
-                'size': args[0]['size'],
-                'style': args[0]['style'],
-                'textColor': args[0]['textColor'],
-                'fontFamily': args[0]['fontFamily'],
-                'textAlign': args[0]['textAlign'],
-                'tooltip': args[0]['tooltip'],
-                'xLoc': args[0]['xLoc'],
-                'yLoc': args[0]['yLoc']
-            }
-            
-        elif syntax_list['name'] == 'labelDeleteFunc':
-            args[0] = None
-            return True
-            
-        elif syntax_list['name'] == 'labelGetTextFunc':
-            return args[0]['text']
-            
-        elif syntax_list['name'] == 'labelGetXFunc':
-            return args[0]['x']
-            
-        elif syntax_list['name'] == 'labelGetYFunc':
-            return args[0]['y']
-            
-        elif syntax_list['name'] == 'labelNewFunc':
-            return {
-                'text': args[0],
-                'x': args[1],
-                'y': args[2],
-                'color': '#000000',
-                'size': 12,
-                'style': 'normal',
-                'textColor': '#000000',
-                'fontFamily': 'Arial',
-                'textAlign': 'left',
-                'tooltip': '',
-                'xLoc': 'bar',
-                'yLoc': 'price'
-            }
-            
-        elif syntax_list['name'] == 'labelSetColFunc':
-            args[0]['color'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetPointFunc':
-            args[0]['x'] = args[1]['x']
-            args[0]['y'] = args[1]['y']
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetSizeFunc':
-            args[0]['size'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetStyleFunc':
-            args[0]['style'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetTextFunc':
-            args[0]['text'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetTextFontFamilyFunc':
-            args[0]['fontFamily'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetTextAlignFunc':
-            args[0]['textAlign'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetTextColFunc':
-            args[0]['textColor'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetToolTipFunc':
-            args[0]['tooltip'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetXFunc':
-            args[0]['x'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetXLocFunc':
-            args[0]['xLoc'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetXYFunc':
-            args[0]['x'] = args[1]
-            args[0]['y'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetYFunc':
-            args[0]['y'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'labelSetYLocFunc':
-            args[0]['yLoc'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'libraryFunc':
-            return {
-                'name': args[0],
-                'version': args[1],
-                'code': args[2]
-            }
 
-        # line
-        elif syntax_list['name'] == 'lineFunc':
-            return {
-                'x1': 0, 'y1': 0,
-                'x2': 0, 'y2': 0,
-                'color': '#000000',
-                'width': 1,
-                'style': 'solid',
-                'extend': 'none',
-                'xLoc': 'bar'
-            }
-            
-        elif syntax_list['name'] == 'lineCopyFunc':
-            return {
-                'x1': args[0]['x1'],
-                'y1': args[0]['y1'],
-                'x2': args[0]['x2'],
-                'y2': args[0]['y2'],
-                'color': args[0]['color'],
-                'width': args[0]['width'],
-                'style': args[0]['style'],
-                'extend': args[0]['extend'],
-                'xLoc': args[0]['xLoc']
-            }
-            
-        elif syntax_list['name'] == 'lineDeleteFunc':
-            args[0] = None
-            return True
-            
-        elif syntax_list['name'] == 'lineGetPriceFunc':
-            return args[0]['y1']
-            
-        elif syntax_list['name'] == 'lineGetX1Func':
-            return args[0]['x1']
-            
-        elif syntax_list['name'] == 'lineGetX2Func':
-            return args[0]['x2']
-            
-        elif syntax_list['name'] == 'lineGetY1Func':
-            return args[0]['y1']
-            
-        elif syntax_list['name'] == 'lineGetY2Func':
-            return args[0]['y2']
-            
-        elif syntax_list['name'] == 'lineNewFunc':
-            return {
-                'x1': args[0],
-                'y1': args[1],
-                'x2': args[2],
-                'y2': args[3],
-                'color': '#000000',
-                'width': 1,
-                'style': 'solid',
-                'extend': 'none',
-                'xLoc': 'bar'
-            }
-            
-        elif syntax_list['name'] == 'lineSetColFunc':
-            args[0]['color'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetExtendFunc':
-            args[0]['extend'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetFirstPointFunc':
-            args[0]['x1'] = args[1]['x']
-            args[0]['y1'] = args[1]['y']
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetSecondPointFunc':
-            args[0]['x2'] = args[1]['x']
-            args[0]['y2'] = args[1]['y']
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetStyleFunc':
-            args[0]['style'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetWidthFunc':
-            args[0]['width'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetX1Func':
-            args[0]['x1'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetX2Func':
-            args[0]['x2'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetXLocFunc':
-            args[0]['xLoc'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetXY1Func':
-            args[0]['x1'] = args[1]
-            args[0]['y1'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetXY2Func':
-            args[0]['x2'] = args[1]
-            args[0]['y2'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetY1Func':
-            args[0]['y1'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineSetY2Func':
-            args[0]['y2'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'lineFillFunc':
-            return {
-                'line1': None,
-                'line2': None,
-                'color': '#000000'
-            }
-            
-        elif syntax_list['name'] == 'lineFillDeleteFunc':
-            args[0] = None
-            return True
-            
-        elif syntax_list['name'] == 'lineFillGetLine1Func':
-            return args[0]['line1']
-            
-        elif syntax_list['name'] == 'lineFillGetLine2Func':
-            return args[0]['line2']
-            
-        elif syntax_list['name'] == 'lineFillNewFunc':
-            return {
-                'line1': args[0],
-                'line2': args[1],
-                'color': args[2] if len(args) > 2 else '#000000'
-            }
-            
-        elif syntax_list['name'] == 'lineFillSetColFunc':
-            args[0]['color'] = args[1]
-            return args[0]
+@builtin('ema')
+def _syntax_ema(self, *args):
+    return talib.EMA(args[0], timeperiod=args[1])
 
-        # map , log
 
-        elif syntax_list['name'] == 'logErrorFunc':
-            return {
-                'type': 'error',
-                'message': args[0],
-                'timestamp': args[1]
-            }
-            
-        elif syntax_list['name'] == 'logInfoFunc':
-            return {
-                'type': 'info',
-                'message': args[0],
-                'timestamp': args[1]
-            }
-            
-        elif syntax_list['name'] == 'logWarningFunc':
-            return {
-                'type': 'warning',
-                'message': args[0],
-                'timestamp': args[1]
-            }
-            
-        elif syntax_list['name'] == 'mapClearFunc':
-            args[0].clear()
-            return {}
-            
-        elif syntax_list['name'] == 'mapContainsFunc':
-            return args[1] in args[0]
-            
-        elif syntax_list['name'] == 'mapCopyFunc':
-            new_map = {}
-            for key in args[0]:
-                new_map[key] = args[0][key]
-            return new_map
-            
-        elif syntax_list['name'] == 'mapGetFunc':
-            return args[0].get(args[1])
-            
-        elif syntax_list['name'] == 'mapKeysFunc':
-            keys = []
-            for key in args[0]:
-                keys.append(key)
-            return keys
-            
-        elif syntax_list['name'] == 'mapNewTypeFunc':
-            return {}
-            
-        elif syntax_list['name'] == 'mapPutFunc':
-            args[0][args[1]] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'mapPutAllFunc':
-            for key in args[1]:
-                args[0][key] = args[1][key]
-            return args[0]
-            
-        elif syntax_list['name'] == 'mapRemoveFunc':
-            if args[1] in args[0]:
-                del args[0][args[1]]
-            return args[0]
-            
-        elif syntax_list['name'] == 'mapSizeFunc':
-            count = 0
-            for _ in args[0]:
-                count += 1
-            return count
-            
-        elif syntax_list['name'] == 'mapValuesFunc':
-            values = []
-            for key in args[0]:
-                values.append(args[0][key])
-            return values
-
-
-        # math
-
-        elif syntax_list['name'] == 'mathAbsFunc':
-            return -args[0] if args[0] < 0 else args[0]
-            
-        elif syntax_list['name'] == 'mathAcosFunc':
-            x = args[0]
-            if x < -1 or x > 1:
-                return None
-            return 3.141592653589793 / 2 - (x + x**3/6 + 3*x**5/40 + 5*x**7/112)
-            
-        elif syntax_list['name'] == 'mathAsinFunc':
-            x = args[0]
-            if x < -1 or x > 1:
-                return None
-            return x + x**3/6 + 3*x**5/40 + 5*x**7/112
-            
-        elif syntax_list['name'] == 'mathAtanFunc':
-            x = args[0]
-            return x - x**3/3 + x**5/5 - x**7/7 if abs(x) <= 1 else (3.141592653589793/2 if x > 0 else -3.141592653589793/2)
-            
-        elif syntax_list['name'] == 'mathAvgFunc':
-            sum_val = 0
-            count = 0
-            for x in args[0]:
-                sum_val += x
-                count += 1
-            return sum_val / count if count > 0 else 0
-            
-        elif syntax_list['name'] == 'mathCeilFunc':
-            integer = int(args[0])
-            return integer + 1 if args[0] > integer else integer
-            
-        elif syntax_list['name'] == 'mathCosFunc':
-            x = args[0]
-            x = x % (2 * 3.141592653589793)
-            return 1 - x**2/2 + x**4/24 - x**6/720
-            
-        elif syntax_list['name'] == 'mathExpFunc':
-            x = args[0]
-            result = 1
-            term = 1
-            for i in range(1, 100):
-                term *= x/i
-                result += term
-                if term < 0.0000001:
-                    break
-            return result
-            
-        elif syntax_list['name'] == 'mathFloorFunc':
-            integer = int(args[0])
-            return integer - 1 if args[0] < integer else integer
-            
-        elif syntax_list['name'] == 'mathLogFunc':
-            x = args[0]
-            if x <= 0:
-                return None
-            y = (x - 1) / (x + 1)
-            result = 0
-            term = y
-            for i in range(1, 100, 2):
-                result += term / i
-                term *= y * y
-                if term < 0.0000001:
-                    break
-            return 2 * result
-            
-        elif syntax_list['name'] == 'mathLog10Func':
-            x = args[0]
-            if x <= 0:
-                return None
-            return mathLogFunc(x) / 2.302585092994046  # ln(10)
-            
-        elif syntax_list['name'] == 'mathMaxFunc':
-            max_val = args[0][0]
-            for x in args[0][1:]:
-                if x > max_val:
-                    max_val = x
-            return max_val
-            
-        elif syntax_list['name'] == 'mathMinFunc':
-            min_val = args[0][0]
-            for x in args[0][1:]:
-                if x < min_val:
-                    min_val = x
-            return min_val
-            
-        elif syntax_list['name'] == 'mathPowFunc':
-            result = 1
-            for _ in range(int(args[1])):
-                result *= args[0]
-            return result
-            
-        elif syntax_list['name'] == 'mathRandomFunc':
-            seed = args[0] if args else 1
-            a = 1664525
-            c = 1013904223
-            m = 2**32
-            seed = (a * seed + c) % m
-            return seed / m
-            
-        elif syntax_list['name'] == 'mathRoundFunc':
-            decimal = args[0] - int(args[0])
-            return int(args[0]) + (1 if decimal >= 0.5 else 0)
-            
-        elif syntax_list['name'] == 'mathRoundToMinTickFunc':
-            tick = args[1]
-            return round(args[0] / tick) * tick
-            
-        elif syntax_list['name'] == 'mathSignFunc':
-            return 1 if args[0] > 0 else (-1 if args[0] < 0 else 0)
-            
-        elif syntax_list['name'] == 'mathSinFunc':
-            x = args[0]
-            x = x % (2 * 3.141592653589793)
-            return x - x**3/6 + x**5/120 - x**7/5040
-            
-        elif syntax_list['name'] == 'mathSqrtFunc':
-            x = args[0]
-            if x < 0:
-                return None
-            guess = x / 2
-            for _ in range(20):
-                new_guess = (guess + x/guess) / 2
-                if abs(new_guess - guess) < 0.0000001:
-                    break
-                guess = new_guess
-            return guess
-            
-        elif syntax_list['name'] == 'mathSumFunc':
-            total = 0
-            for x in args[0]:
-                total += x
-            return total
-            
-        elif syntax_list['name'] == 'mathTanFunc':
-            sin_val = mathSinFunc(args[0])
-            cos_val = mathCosFunc(args[0])
-            return sin_val / cos_val if cos_val != 0 else None
-            
-        elif syntax_list['name'] == 'mathToDegreesFunc':
-            return args[0] * 180 / 3.141592653589793
-            
-        elif syntax_list['name'] == 'mathToRadiansFunc':
-            return args[0] * 3.141592653589793 / 180
-
-        # matrix
-
-        elif syntax_list['name'] == 'matrixAddColFunc':
-            result = [row[:] for row in args[0]]
-            for i in range(len(result)):
-                result[i].append(args[1][i])
-            return result
-            
-        elif syntax_list['name'] == 'matrixAddRowFunc':
-            result = [row[:] for row in args[0]]
-            result.append(args[1])
-            return result
-            
-        elif syntax_list['name'] == 'matrixAvgFunc':
-            sum_val = 0
-            count = 0
-            for row in args[0]:
-                for val in row:
-                    sum_val += val
-                    count += 1
-            return sum_val / count if count > 0 else 0
-            
-        elif syntax_list['name'] == 'matrixColFunc':
-            return [row[args[1]] for row in args[0]]
-            
-        elif syntax_list['name'] == 'matrixColumnsFunc':
-            return len(args[0][0]) if args[0] else 0
-            
-        elif syntax_list['name'] == 'matrixConcatFunc':
-            return [row[:] for row in args[0]] + [row[:] for row in args[1]]
-            
-        elif syntax_list['name'] == 'matrixCopyFunc':
-            return [row[:] for row in args[0]]
-            
-        elif syntax_list['name'] == 'matrixDetFunc':
-            n = len(args[0])
-            if n == 1:
-                return args[0][0][0]
-            if n == 2:
-                return args[0][0][0] * args[0][1][1] - args[0][0][1] * args[0][1][0]
-            det = 0
-            for j in range(n):
-                submatrix = [[args[0][i][k] for k in range(n) if k != j] for i in range(1, n)]
-                det += ((-1) ** j) * args[0][0][j] * matrixDetFunc(submatrix)
-            return det
-            
-        elif syntax_list['name'] == 'matrixDiffFunc':
-            rows = len(args[0])
-            cols = len(args[0][0])
-            result = [[0] * cols for _ in range(rows)]
-            for i in range(rows):
-                for j in range(cols):
-                    result[i][j] = args[0][i][j] - args[1][i][j]
-            return result
-            
-        elif syntax_list['name'] == 'matrixElementsCountFunc':
-            count = 0
-            for row in args[0]:
-                count += len(row)
-            return count
-            
-        elif syntax_list['name'] == 'matrixFillFunc':
-            rows = len(args[0])
-            cols = len(args[0][0])
-            return [[args[1] for _ in range(cols)] for _ in range(rows)]
-            
-        elif syntax_list['name'] == 'matrixGetFunc':
-            return args[0][args[1]][args[2]]
-            
-        elif syntax_list['name'] == 'matrixIsAntiDiagonalFunc':
-            n = len(args[0])
-            for i in range(n):
-                for j in range(n):
-                    if i + j != n - 1 and args[0][i][j] != 0:
-                        return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixIsAntiSymmetricFunc':
-            n = len(args[0])
-            for i in range(n):
-                for j in range(n):
-                    if args[0][i][j] != -args[0][j][i]:
-                        return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixIsBinaryFunc':
-            for row in args[0]:
-                for val in row:
-                    if val != 0 and val != 1:
-                        return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixIsDiagonalFunc':
-            n = len(args[0])
-            for i in range(n):
-                for j in range(n):
-                    if i != j and args[0][i][j] != 0:
-                        return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixIsIdentityFunc':
-            n = len(args[0])
-            for i in range(n):
-                for j in range(n):
-                    if (i == j and args[0][i][j] != 1) or (i != j and args[0][i][j] != 0):
-                        return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixIsSquareFunc':
-            return len(args[0]) == len(args[0][0])
-            
-        elif syntax_list['name'] == 'matrixIsStochasticFunc':
-            for row in args[0]:
-                row_sum = sum(row)
-                if abs(row_sum - 1) > 0.000001:
-                    return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixIsSymmetricFunc':
-            n = len(args[0])
-            for i in range(n):
-                for j in range(i + 1, n):
-                    if args[0][i][j] != args[0][j][i]:
-                        return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixIsTriangularFunc':
-            n = len(args[0])
-            lower = True
-            upper = True
-            for i in range(n):
-                for j in range(n):
-                    if i < j and args[0][i][j] != 0:
-                        lower = False
-                    if i > j and args[0][i][j] != 0:
-                        upper = False
-            return lower or upper
-            
-        elif syntax_list['name'] == 'matrixIsZeroFunc':
-            for row in args[0]:
-                for val in row:
-                    if val != 0:
-                        return False
-            return True
-            
-        elif syntax_list['name'] == 'matrixMaxFunc':
-            max_val = args[0][0][0]
-            for row in args[0]:
-                for val in row:
-                    if val > max_val:
-                        max_val = val
-            return max_val
-            
-        elif syntax_list['name'] == 'matrixMinFunc':
-            min_val = args[0][0][0]
-            for row in args[0]:
-                for val in row:
-                    if val < min_val:
-                        min_val = val
-            return min_val
-            
-        elif syntax_list['name'] == 'matrixMultFunc':
-            m1, n1 = len(args[0]), len(args[0][0])
-            n2 = len(args[1][0])
-            result = [[0] * n2 for _ in range(m1)]
-            for i in range(m1):
-                for j in range(n2):
-                    for k in range(n1):
-                        result[i][j] += args[0][i][k] * args[1][k][j]
-            return result
-            
-        elif syntax_list['name'] == 'matrixNewTypeFunc':
-            return [[0] * args[1] for _ in range(args[0])]
-            
-        elif syntax_list['name'] == 'matrixReshapeFunc':
-            flat = []
-            for row in args[0]:
-                flat.extend(row)
-            rows, cols = args[1], args[2]
-            return [flat[i:i + cols] for i in range(0, len(flat), cols)]
-            
-        elif syntax_list['name'] == 'matrixReverseFunc':
-            return [row[::-1] for row in args[0][::-1]]
-            
-        elif syntax_list['name'] == 'matrixRowFunc':
-            return args[0][args[1]][:]
-            
-        elif syntax_list['name'] == 'matrixRowsFunc':
-            return len(args[0])
-            
-        elif syntax_list['name'] == 'matrixSetFunc':
-            args[0][args[1]][args[2]] = args[3]
-            return args[0]
-            
-        elif syntax_list['name'] == 'matrixSortFunc':
-            flat = []
-            for row in args[0]:
-                flat.extend(row)
-            flat.sort()
-            rows = len(args[0])
-            cols = len(args[0][0])
-            return [flat[i:i + cols] for i in range(0, len(flat), cols)]
-            
-        elif syntax_list['name'] == 'matrixSumFunc':
-            total = 0
-            for row in args[0]:
-                for val in row:
-                    total += val
-            return total
-            
-        elif syntax_list['name'] == 'matrixTraceFunc':
-            trace = 0
-            for i in range(len(args[0])):
-                trace += args[0][i][i]
-            return trace
-            
-        elif syntax_list['name'] == 'matrixTransposeFunc':
-            rows = len(args[0])
-            cols = len(args[0][0])
-            return [[args[0][j][i] for j in range(rows)] for i in range(cols)]
-
-        elif syntax_list['name'] == 'matrixEigenValuesFunc':
-            n = len(args[0])
-            # Power iteration method for dominant eigenvalue
-            v = [1] * n
-            for _ in range(100):
-                # Matrix-vector multiplication
-                new_v = [0] * n
-                for i in range(n):
-                    for j in range(n):
-                        new_v[i] += args[0][i][j] * v[j]
-                # Normalize
-                norm = sum(x*x for x in new_v) ** 0.5
-                v = [x/norm for x in new_v]
-            # Compute Rayleigh quotient
-            eigenvalue = sum(v[i] * sum(args[0][i][j] * v[j] for j in range(n)) for i in range(n))
-            return [eigenvalue]
-            
-        elif syntax_list['name'] == 'matrixEigenVectorsFunc':
-            n = len(args[0])
-            # Power iteration method for dominant eigenvector
-            v = [1] * n
-            for _ in range(100):
-                new_v = [0] * n
-                for i in range(n):
-                    for j in range(n):
-                        new_v[i] += args[0][i][j] * v[j]
-                norm = sum(x*x for x in new_v) ** 0.5
-                v = [x/norm for x in new_v]
-            return [v]
-            
-        elif syntax_list['name'] == 'matrixInvFunc':
-            n = len(args[0])
-            # Augment matrix with identity
-            aug = [[args[0][i][j] for j in range(n)] + [1 if i == j else 0 for j in range(n)] for i in range(n)]
-            
-            # Gaussian elimination
-            for i in range(n):
-                pivot = aug[i][i]
-                for j in range(2*n):
-                    aug[i][j] /= pivot
-                for k in range(n):
-                    if k != i:
-                        factor = aug[k][i]
-                        for j in range(2*n):
-                            aug[k][j] -= factor * aug[i][j]
-                            
-            return [[aug[i][j+n] for j in range(n)] for i in range(n)]
-            
-        elif syntax_list['name'] == 'matrixKronFunc':
-            m1, n1 = len(args[0]), len(args[0][0])
-            m2, n2 = len(args[1]), len(args[1][0])
-            result = [[0] * (n1*n2) for _ in range(m1*m2)]
-            
-            for i in range(m1):
-                for j in range(n1):
-                    for k in range(m2):
-                        for l in range(n2):
-                            result[i*m2 + k][j*n2 + l] = args[0][i][j] * args[1][k][l]
-            return result
-            
-        elif syntax_list['name'] == 'matrixPinvFunc':
-            # Moore-Penrose pseudoinverse using SVD-like approach
-            n = len(args[0])
-            m = len(args[0][0])
-            
-            # Compute A^T * A
-            ata = [[sum(args[0][k][i] * args[0][k][j] for k in range(n)) for j in range(m)] for i in range(m)]
-            
-            # Compute inverse of A^T * A
-            inv_ata = matrixInvFunc(ata)
-            
-            # Compute pseudoinverse
-            return [[sum(inv_ata[i][k] * args[0][j][k] for k in range(m)) for j in range(n)] for i in range(m)]
-            
-        elif syntax_list['name'] == 'matrixPowFunc':
-            n = len(args[0])
-            power = args[1]
-            
-            # Initialize result as identity matrix
-            result = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
-            
-            # Multiply matrix power times
-            for _ in range(power):
-                new_result = [[0] * n for _ in range(n)]
-                for i in range(n):
-                    for j in range(n):
-                        for k in range(n):
-                            new_result[i][j] += result[i][k] * args[0][k][j]
-                result = new_result
-                
-            return result
-            
-        elif syntax_list['name'] == 'matrixRankFunc':
-            # Gaussian elimination to compute rank
-            m = [row[:] for row in args[0]]
-            rows, cols = len(m), len(m[0])
-            rank = 0
-            
-            for col in range(cols):
-                if rank >= rows:
-                    break
-                    
-                # Find pivot
-                pivot_row = rank
-                while pivot_row < rows and m[pivot_row][col] == 0:
-                    pivot_row += 1
-                    
-                if pivot_row < rows:
-                    if pivot_row != rank:
-                        m[rank], m[pivot_row] = m[pivot_row], m[rank]
-                    
-                    # Eliminate column entries
-                    for i in range(rank + 1, rows):
-                        factor = m[i][col] / m[rank][col]
-                        for j in range(col, cols):
-                            m[i][j] -= factor * m[rank][j]
-                            
-                    rank += 1
-                    
-            return rank
-
-        elif syntax_list['name'] == 'matrixMedianFunc':
-            flat = []
-            for row in args[0]:
-                flat.extend(row)
-            flat.sort()
-            mid = len(flat) // 2
-            return flat[mid] if len(flat) % 2 else (flat[mid-1] + flat[mid]) / 2
-            
-        elif syntax_list['name'] == 'matrixModeFunc':
-            flat = []
-            for row in args[0]:
-                flat.extend(row)
-            counts = {}
-            for val in flat:
-                counts[val] = counts.get(val, 0) + 1
-            max_count = max(counts.values())
-            return [k for k, v in counts.items() if v == max_count][0]
-            
-        elif syntax_list['name'] == 'matrixRemoveColFunc':
-            return [[val for j, val in enumerate(row) if j != args[1]] for row in args[0]]
-            
-        elif syntax_list['name'] == 'matrixRemoveRowFunc':
-            return [row for i, row in enumerate(args[0]) if i != args[1]]
-            
-        elif syntax_list['name'] == 'matrixSubMatrixFunc':
-            return [[args[0][i][j] for j in range(args[2], args[4])] 
-                    for i in range(args[1], args[3])]
-            
-        elif syntax_list['name'] == 'matrixSwapColumnsFunc':
-            result = [row[:] for row in args[0]]
-            for row in result:
-                row[args[1]], row[args[2]] = row[args[2]], row[args[1]]
-            return result
-            
-        elif syntax_list['name'] == 'matrixSwapRowsFunc':
-            result = [row[:] for row in args[0]]
-            result[args[1]], result[args[2]] = result[args[2]], result[args[1]]
-            return result
+@builtin('htDcPeriod')
+def _syntax_htDcPeriod(self, *args):
+    return talib.HT_DCPERIOD(args[0])
 
 
-        # request , time
+@builtin('htDcPhase')
+def _syntax_htDcPhase(self, *args):
+    return talib.HT_DCPHASE(args[0])
 
-        elif syntax_list['name'] == 'maxBarsBackFunc':
-            return {
-                'buffer': args[0],
-                'max_bars': args[1]
-            }
-            
-        elif syntax_list['name'] == 'minuteFunc':
-            return args[0].minute
-            
-        elif syntax_list['name'] == 'monthFunc':
-            return args[0].month
-            
-        elif syntax_list['name'] == 'naFunc':
-            return float('nan')
-            
-        elif syntax_list['name'] == 'nzFunc':
-            return args[1] if args[0] != args[0] else args[0]
-            
-        elif syntax_list['name'] == 'polylineDeleteFunc':
-            args[0] = None
-            return True
-            
-        elif syntax_list['name'] == 'polylineNewFunc':
-            return {
-                'points': args[0],
-                'color': args[1] if len(args) > 1 else '#000000',
-                'width': args[2] if len(args) > 2 else 1,
-                'style': args[3] if len(args) > 3 else 'solid'
-            }
-            
-        elif syntax_list['name'] == 'requestCurrencyRateFunc':
-            return {
-                'from_currency': args[0],
-                'to_currency': args[1],
-                'timestamp': args[2]
-            }
-            
-        elif syntax_list['name'] == 'requestDividendsFunc':
-            return {
-                'symbol': args[0],
-                'from_date': args[1],
-                'to_date': args[2]
-            }
-            
-        elif syntax_list['name'] == 'requestEarningsFunc':
-            return {
-                'symbol': args[0],
-                'from_date': args[1],
-                'to_date': args[2]
-            }
-            
-        elif syntax_list['name'] == 'requestEconomicFunc':
-            return {
-                'indicator': args[0],
-                'from_date': args[1],
-                'to_date': args[2]
-            }
-            
-        elif syntax_list['name'] == 'requestFinancialFunc':
-            return {
-                'symbol': args[0],
-                'statement': args[1],
-                'period': args[2]
-            }
-            
-        elif syntax_list['name'] == 'requestQuandlFunc':
-            return {
-                'code': args[0],
-                'from_date': args[1],
-                'to_date': args[2]
-            }
-            
-        elif syntax_list['name'] == 'requestSecurityFunc':
-            return {
-                'symbol': args[0],
-                'resolution': args[1],
-                'from_date': args[2],
-                'to_date': args[3]
-            }
-            
-        elif syntax_list['name'] == 'requestSecurityLowerTfFunc':
-            return {
-                'symbol': args[0],
-                'resolution': args[1],
-                'from_date': args[2],
-                'to_date': args[3],
-                'timeframe': args[4]
-            }
-            
-        elif syntax_list['name'] == 'requestSeedFunc':
-            return {
-                'seed_value': args[0]
-            }
-            
-        elif syntax_list['name'] == 'requestSplitsFunc':
-            return {
-                'symbol': args[0],
-                'from_date': args[1],
-                'to_date': args[2]
-            }
-            
-        elif syntax_list['name'] == 'runtimeErrorFunc':
-            return {
-                'error_message': args[0],
-                'error_type': 'runtime',
-                'timestamp': args[1]
-            }
-            
-        elif syntax_list['name'] == 'secondFunc':
-            return args[0].second
 
+@builtin('htPhasor')
+def _syntax_htPhasor(self, *args):
+    inphase, quadrature = talib.HT_PHASOR(args[0])
+    return {'inphase': inphase, 'quadrature': quadrature}
 
-        # str
 
-        elif syntax_list['name'] == 'strContainsFunc':
-            text = args[0]
-            search = args[1]
-            for i in range(len(text) - len(search) + 1):
-                if text[i:i+len(search)] == search:
-                    return True
-            return False
-            
-        elif syntax_list['name'] == 'strEndsWithFunc':
-            text = args[0]
-            search = args[1]
-            return text[-len(search):] == search if len(text) >= len(search) else False
-            
-        elif syntax_list['name'] == 'strFormatFunc':
-            text = args[0]
-            values = args[1:]
-            result = ''
-            i = 0
-            val_index = 0
-            while i < len(text):
-                if text[i:i+2] == '{}':
-                    result += str(values[val_index])
-                    val_index += 1
-                    i += 2
-                else:
-                    result += text[i]
-                    i += 1
-            return result
-            
-        elif syntax_list['name'] == 'strFormatTimeFunc':
-            timestamp = args[0]
-            format_str = args[1]
-            dt = args[0]
-            return format_str.replace('%Y', str(dt.year))\
-                           .replace('%m', str(dt.month).zfill(2))\
-                           .replace('%d', str(dt.day).zfill(2))\
-                           .replace('%H', str(dt.hour).zfill(2))\
-                           .replace('%M', str(dt.minute).zfill(2))\
-                           .replace('%S', str(dt.second).zfill(2))
-            
-        elif syntax_list['name'] == 'strLengthFunc':
-            count = 0
-            for _ in args[0]:
-                count += 1
-            return count
-            
-        elif syntax_list['name'] == 'strLowerFunc':
-            result = ''
-            for c in args[0]:
-                if 'A' <= c <= 'Z':
-                    result += chr(ord(c) + 32)
-                else:
-                    result += c
-            return result
-            
-        elif syntax_list['name'] == 'strMatchFunc':
-            text = args[0]
-            pattern = args[1]
-            return text == pattern
-            
-        elif syntax_list['name'] == 'strPosFunc':
-            text = args[0]
-            search = args[1]
-            for i in range(len(text) - len(search) + 1):
-                if text[i:i+len(search)] == search:
-                    return i
-            return -1
-            
-        elif syntax_list['name'] == 'strRepeatFunc':
-            result = ''
-            for _ in range(args[1]):
-                result += args[0]
-            return result
-            
-        elif syntax_list['name'] == 'strReplaceFunc':
-            text = args[0]
-            old = args[1]
-            new = args[2]
-            pos = 0
-            result = ''
-            while pos < len(text):
-                if text[pos:pos+len(old)] == old:
-                    result += new
-                    pos += len(old)
-                else:
-                    result += text[pos]
-                    pos += 1
-            return result
-            
-        elif syntax_list['name'] == 'strReplaceAllFunc':
-            text = args[0]
-            old = args[1]
-            new = args[2]
-            result = ''
-            i = 0
-            while i < len(text):
-                if text[i:i+len(old)] == old:
-                    result += new
-                    i += len(old)
-                else:
-                    result += text[i]
-                    i += 1
-            return result
-            
-        elif syntax_list['name'] == 'strSplitFunc':
-            text = args[0]
-            delimiter = args[1]
-            result = []
-            current = ''
-            i = 0
-            while i < len(text):
-                if text[i:i+len(delimiter)] == delimiter:
-                    result.append(current)
-                    current = ''
-                    i += len(delimiter)
-                else:
-                    current += text[i]
-                    i += 1
+@builtin('htSine')
+def _syntax_htSine(self, *args):
+    sine, leadsine = talib.HT_SINE(args[0])
+    return {'sine': sine, 'leadsine': leadsine}
+
+
+@builtin('htTrendline')
+def _syntax_htTrendline(self, *args):
+    return talib.HT_TRENDLINE(args[0])
+
+
+@builtin('htTrendMode')
+def _syntax_htTrendMode(self, *args):
+    return talib.HT_TRENDMODE(args[0])
+
+
+@builtin('kama')
+def _syntax_kama(self, *args):
+    return talib.KAMA(args[0], timeperiod=args[1])
+
+
+@builtin('linearReg')
+def _syntax_linearReg(self, *args):
+    return talib.LINEARREG(args[0], timeperiod=args[1])
+
+
+@builtin('linearRegAngle')
+def _syntax_linearRegAngle(self, *args):
+    return talib.LINEARREG_ANGLE(args[0], timeperiod=args[1])
+
+
+@builtin('linearRegIntercept')
+def _syntax_linearRegIntercept(self, *args):
+    return talib.LINEARREG_INTERCEPT(args[0], timeperiod=args[1])
+
+
+@builtin('linearRegSlope')
+def _syntax_linearRegSlope(self, *args):
+    return talib.LINEARREG_SLOPE(args[0], timeperiod=args[1])
+
+
+@builtin('ma')
+def _syntax_ma(self, *args):
+    return talib.MA(args[0], timeperiod=args[1], matype=args[2])
+
+
+@builtin('macd')
+def _syntax_macd(self, *args):
+    macd, signal, hist = talib.MACD(args[0], fastperiod=args[1], slowperiod=args[2], signalperiod=args[3])
+    return {'macd': macd, 'signal': signal, 'hist': hist}
+
+
+@builtin('macdExt')
+def _syntax_macdExt(self, *args):
+    macd, signal, hist = talib.MACDEXT(args[0], fastperiod=args[1], fastmatype=args[2], slowperiod=args[3], slowmatype=args[4], signalperiod=args[5], signalmatype=args[6])
+    return {'macd': macd, 'signal': signal, 'hist': hist}
+
+
+@builtin('macdFix')
+def _syntax_macdFix(self, *args):
+    macd, signal, hist = talib.MACDFIX(args[0], signalperiod=args[1])
+    return {'macd': macd, 'signal': signal, 'hist': hist}
+
+
+@builtin('mama')
+def _syntax_mama(self, *args):
+    mama, fama = talib.MAMA(args[0], fastlimit=args[1], slowlimit=args[2])
+    return {'mama': mama, 'fama': fama}
+
+
+@builtin('maxIndex')
+def _syntax_maxIndex(self, *args):
+    return talib.MAXINDEX(args[0], timeperiod=args[1])
+
+
+@builtin('medPrice')
+def _syntax_medPrice(self, *args):
+    return talib.MEDPRICE(args[0], args[1])
+
+
+@builtin('mfi')
+def _syntax_mfi(self, *args):
+    return talib.MFI(args[0], args[1], args[2], args[3], timeperiod=args[4])
+
+
+@builtin('midPoint')
+def _syntax_midPoint(self, *args):
+    return talib.MIDPOINT(args[0], timeperiod=args[1])
+
+
+@builtin('midPrice')
+def _syntax_midPrice(self, *args):
+    return talib.MIDPRICE(args[0], args[1], timeperiod=args[2])
+
+
+@builtin('minIndex')
+def _syntax_minIndex(self, *args):
+    return talib.MININDEX(args[0], timeperiod=args[1])
+
+
+@builtin('minMax')
+def _syntax_minMax(self, *args):
+    min_val, max_val = talib.MINMAX(args[0], timeperiod=args[1])
+    return {'min': min_val, 'max': max_val}
+
+
+@builtin('minMaxIndex')
+def _syntax_minMaxIndex(self, *args):
+    minidx, maxidx = talib.MINMAXINDEX(args[0], timeperiod=args[1])
+    return {'minidx': minidx, 'maxidx': maxidx}
+
+
+@builtin('minusDI')
+def _syntax_minusDI(self, *args):
+    return talib.MINUS_DI(args[0], args[1], args[2], timeperiod=args[3])
+
+
+@builtin('minusDM')
+def _syntax_minusDM(self, *args):
+    return talib.MINUS_DM(args[0], args[1], timeperiod=args[2])
+
+
+@builtin('mom')
+def _syntax_mom(self, *args):
+    return talib.MOM(args[0], timeperiod=args[1])
+
+
+@builtin('natr')
+def _syntax_natr(self, *args):
+    return talib.NATR(args[0], args[1], args[2], timeperiod=args[3])
+
+
+@builtin('obv')
+def _syntax_obv(self, *args):
+    return talib.OBV(args[0], args[1])
+
+
+@builtin('plusDI')
+def _syntax_plusDI(self, *args):
+    return talib.PLUS_DI(args[0], args[1], args[2], timeperiod=args[3])
+
+
+@builtin('plusDM')
+def _syntax_plusDM(self, *args):
+    return talib.PLUS_DM(args[0], args[1], timeperiod=args[2])
+
+
+@builtin('ppo')
+def _syntax_ppo(self, *args):
+    return talib.PPO(args[0], fastperiod=args[1], slowperiod=args[2], matype=args[3])
+
+
+@builtin('roc')
+def _syntax_roc(self, *args):
+    return talib.ROC(args[0], timeperiod=args[1])
+
+
+@builtin('rocp')
+def _syntax_rocp(self, *args):
+    return talib.ROCP(args[0], timeperiod=args[1])
+
+
+@builtin('rocr')
+def _syntax_rocr(self, *args):
+    return talib.ROCR(args[0], timeperiod=args[1])
+
+
+@builtin('rocr100')
+def _syntax_rocr100(self, *args):
+    return talib.ROCR100(args[0], timeperiod=args[1])
+
+
+@builtin('rsi')
+def _syntax_rsi(self, *args):
+    return talib.RSI(args[0], timeperiod=args[1])
+
+
+@builtin('sar')
+def _syntax_sar(self, *args):
+    return talib.SAR(args[0], args[1], acceleration=args[2], maximum=args[3])
+
+
+@builtin('sarExt')
+def _syntax_sarExt(self, *args):
+    return talib.SAREXT(args[0], args[1], startvalue=args[2], offsetonreverse=args[3], accelerationinitlong=args[4], accelerationlong=args[5], accelerationmaxlong=args[6], accelerationinitshort=args[7], accelerationshort=args[8], accelerationmaxshort=args[9])
+
+
+@builtin('sma')
+def _syntax_sma(self, *args):
+    return talib.SMA(args[0], timeperiod=args[1])
+
+
+@builtin('stdDev')
+def _syntax_stdDev(self, *args):
+    return talib.STDDEV(args[0], timeperiod=args[1], nbdev=args[2])
+
+
+@builtin('stoch')
+def _syntax_stoch(self, *args):
+    slowk, slowd = talib.STOCH(args[0], args[1], args[2], fastk_period=args[3], slowk_period=args[4], slowk_matype=args[5], slowd_period=args[6], slowd_matype=args[7])
+    return {'slowk': slowk, 'slowd': slowd}
+
+
+@builtin('stochF')
+def _syntax_stochF(self, *args):
+    fastk, fastd = talib.STOCHF(args[0], args[1], args[2], fastk_period=args[3], fastd_period=args[4], fastd_matype=args[5])
+    return {'fastk': fastk, 'fastd': fastd}
+
+
+@builtin('stochRsi')
+def _syntax_stochRsi(self, *args):
+    fastk, fastd = talib.STOCHRSI(args[0], timeperiod=args[1], fastk_period=args[2], fastd_period=args[3], fastd_matype=args[4])
+    return {'fastk': fastk, 'fastd': fastd}
+
+
+@builtin('sum')
+def _syntax_sum(self, *args):
+    return talib.SUM(args[0], timeperiod=args[1])
+
+
+@builtin('t3')
+def _syntax_t3(self, *args):
+    return talib.T3(args[0], timeperiod=args[1], vfactor=args[2])
+
+
+@builtin('tema')
+def _syntax_tema(self, *args):
+    return talib.TEMA(args[0], timeperiod=args[1])
+
+
+@builtin('tRange')
+def _syntax_tRange(self, *args):
+    return talib.TRANGE(args[0], args[1], args[2])
+
+
+@builtin('trima')
+def _syntax_trima(self, *args):
+    return talib.TRIMA(args[0], timeperiod=args[1])
+
+
+@builtin('trix')
+def _syntax_trix(self, *args):
+    return talib.TRIX(args[0], timeperiod=args[1])
+
+
+@builtin('tsf')
+def _syntax_tsf(self, *args):
+    return talib.TSF(args[0], timeperiod=args[1])
+
+
+@builtin('typPrice')
+def _syntax_typPrice(self, *args):
+    return talib.TYPPRICE(args[0], args[1], args[2])
+
+
+@builtin('ultOsc')
+def _syntax_ultOsc(self, *args):
+    return talib.ULTOSC(args[0], args[1], args[2], timeperiod1=args[3], timeperiod2=args[4], timeperiod3=args[5])
+
+
+@builtin('variance')
+def _syntax_variance(self, *args):
+    return talib.VAR(args[0], timeperiod=args[1], nbdev=args[2])
+
+
+@builtin('wclPrice')
+def _syntax_wclPrice(self, *args):
+    return talib.WCLPRICE(args[0], args[1], args[2])
+
+
+@builtin('willr')
+def _syntax_willr(self, *args):
+    return talib.WILLR(args[0], args[1], args[2], timeperiod=args[3])
+
+
+@builtin('wma')
+def _syntax_wma(self, *args):
+    return talib.WMA(args[0], timeperiod=args[1])
+
+
+@builtin('pattern2Crows')
+def _syntax_pattern2Crows(self, *args):
+    return talib.CDL2CROWS(args[0], args[1], args[2], args[3])  # open, high, low, close
+
+
+@builtin('pattern3BlackCrows')
+def _syntax_pattern3BlackCrows(self, *args):
+    return talib.CDL3BLACKCROWS(args[0], args[1], args[2], args[3])
+
+
+@builtin('pattern3Inside')
+def _syntax_pattern3Inside(self, *args):
+    return talib.CDL3INSIDE(args[0], args[1], args[2], args[3])
+
+
+@builtin('pattern3LineStrike')
+def _syntax_pattern3LineStrike(self, *args):
+    return talib.CDL3LINESTRIKE(args[0], args[1], args[2], args[3])
+
+
+@builtin('pattern3StarsInSouth')
+def _syntax_pattern3StarsInSouth(self, *args):
+    return talib.CDL3STARSINSOUTH(args[0], args[1], args[2], args[3])
+
+
+@builtin('pattern3WhiteSoldiers')
+def _syntax_pattern3WhiteSoldiers(self, *args):
+    return talib.CDL3WHITESOLDIERS(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternAbandonedBaby')
+def _syntax_patternAbandonedBaby(self, *args):
+    return talib.CDLABANDONEDBABY(args[0], args[1], args[2], args[3], penetration=args[4])
+
+
+@builtin('patternAdvanceBlock')
+def _syntax_patternAdvanceBlock(self, *args):
+    return talib.CDLADVANCEBLOCK(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternBeltHold')
+def _syntax_patternBeltHold(self, *args):
+    return talib.CDLBELTHOLD(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternBreakaway')
+def _syntax_patternBreakaway(self, *args):
+    return talib.CDLBREAKAWAY(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternClosingMarubozu')
+def _syntax_patternClosingMarubozu(self, *args):
+    return talib.CDLCLOSINGMARUBOZU(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternConcealBabySwallow')
+def _syntax_patternConcealBabySwallow(self, *args):
+    return talib.CDLCONCEALBABYSWALL(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternCounterattack')
+def _syntax_patternCounterattack(self, *args):
+    return talib.CDLCOUNTERATTACK(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternDarkCloud')
+def _syntax_patternDarkCloud(self, *args):
+    return talib.CDLDARKCLOUDCOVER(args[0], args[1], args[2], args[3], penetration=args[4])
+
+
+@builtin('patternDoji')
+def _syntax_patternDoji(self, *args):
+    return talib.CDLDOJI(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternDojiStar')
+def _syntax_patternDojiStar(self, *args):
+    return talib.CDLDOJISTAR(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternDragonflyDoji')
+def _syntax_patternDragonflyDoji(self, *args):
+    return talib.CDLDRAGONFLYDOJI(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternEngulfing')
+def _syntax_patternEngulfing(self, *args):
+    return talib.CDLENGULFING(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternEveningDojiStar')
+def _syntax_patternEveningDojiStar(self, *args):
+    return talib.CDLEVENINGDOJISTAR(args[0], args[1], args[2], args[3], penetration=args[4])
+
+
+@builtin('patternEveningStar')
+def _syntax_patternEveningStar(self, *args):
+    return talib.CDLEVENINGSTAR(args[0], args[1], args[2], args[3], penetration=args[4])
+
+
+@builtin('patternGapSideSide')
+def _syntax_patternGapSideSide(self, *args):
+    return talib.CDLGAPSIDESIDEWHITE(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternGravestoneDoji')
+def _syntax_patternGravestoneDoji(self, *args):
+    return talib.CDLGRAVESTONEDOJI(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHammer')
+def _syntax_patternHammer(self, *args):
+    return talib.CDLHAMMER(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHangingMan')
+def _syntax_patternHangingMan(self, *args):
+    return talib.CDLHANGINGMAN(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHarami')
+def _syntax_patternHarami(self, *args):
+    return talib.CDLHARAMI(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHaramiCross')
+def _syntax_patternHaramiCross(self, *args):
+    return talib.CDLHARAMICROSS(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHighWave')
+def _syntax_patternHighWave(self, *args):
+    return talib.CDLHIGHWAVE(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHikkake')
+def _syntax_patternHikkake(self, *args):
+    return talib.CDLHIKKAKE(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHikkakeMod')
+def _syntax_patternHikkakeMod(self, *args):
+    return talib.CDLHIKKAKEMOD(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternHomingPigeon')
+def _syntax_patternHomingPigeon(self, *args):
+    return talib.CDLHOMINGPIGEON(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternIdentical3Crows')
+def _syntax_patternIdentical3Crows(self, *args):
+    return talib.CDLIDENTICAL3CROWS(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternInNeck')
+def _syntax_patternInNeck(self, *args):
+    return talib.CDLINNECK(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternInvertedHammer')
+def _syntax_patternInvertedHammer(self, *args):
+    return talib.CDLINVERTEDHAMMER(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternKicking')
+def _syntax_patternKicking(self, *args):
+    return talib.CDLKICKING(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternKickingByLength')
+def _syntax_patternKickingByLength(self, *args):
+    return talib.CDLKICKINGBYLENGTH(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternLadderBottom')
+def _syntax_patternLadderBottom(self, *args):
+    return talib.CDLLADDERBOTTOM(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternLongLeggedDoji')
+def _syntax_patternLongLeggedDoji(self, *args):
+    return talib.CDLLONGLEGGEDDOJI(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternLongLine')
+def _syntax_patternLongLine(self, *args):
+    return talib.CDLLONGLINE(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternMarubozu')
+def _syntax_patternMarubozu(self, *args):
+    return talib.CDLMARUBOZU(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternMatchingLow')
+def _syntax_patternMatchingLow(self, *args):
+    return talib.CDLMATCHINGLOW(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternMatHold')
+def _syntax_patternMatHold(self, *args):
+    return talib.CDLMATHOLD(args[0], args[1], args[2], args[3], penetration=args[4])
+
+
+@builtin('patternMorningDojiStar')
+def _syntax_patternMorningDojiStar(self, *args):
+    return talib.CDLMORNINGDOJISTAR(args[0], args[1], args[2], args[3], penetration=args[4])
+
+
+@builtin('patternMorningStar')
+def _syntax_patternMorningStar(self, *args):
+    return talib.CDLMORNINGSTAR(args[0], args[1], args[2], args[3], penetration=args[4])
+
+
+@builtin('patternOnNeck')
+def _syntax_patternOnNeck(self, *args):
+    return talib.CDLONNECK(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternPiercing')
+def _syntax_patternPiercing(self, *args):
+    return talib.CDLPIERCING(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternRickshawMan')
+def _syntax_patternRickshawMan(self, *args):
+    return talib.CDLRICKSHAWMAN(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternRiseFall3Methods')
+def _syntax_patternRiseFall3Methods(self, *args):
+    return talib.CDLRISEFALL3METHODS(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternSeparatingLines')
+def _syntax_patternSeparatingLines(self, *args):
+    return talib.CDLSEPARATINGLINES(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternShootingStar')
+def _syntax_patternShootingStar(self, *args):
+    return talib.CDLSHOOTINGSTAR(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternShortLine')
+def _syntax_patternShortLine(self, *args):
+    return talib.CDLSHORTLINE(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternSpinningTop')
+def _syntax_patternSpinningTop(self, *args):
+    return talib.CDLSPINNINGTOP(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternStalledPattern')
+def _syntax_patternStalledPattern(self, *args):
+    return talib.CDLSTALLEDPATTERN(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternStickSandwich')
+def _syntax_patternStickSandwich(self, *args):
+    return talib.CDLSTICKSANDWICH(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternTakuri')
+def _syntax_patternTakuri(self, *args):
+    return talib.CDLTAKURI(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternTasukiGap')
+def _syntax_patternTasukiGap(self, *args):
+    return talib.CDLTASUKIGAP(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternThrusting')
+def _syntax_patternThrusting(self, *args):
+    return talib.CDLTHRUSTING(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternTristar')
+def _syntax_patternTristar(self, *args):
+    return talib.CDLTRISTAR(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternUnique3River')
+def _syntax_patternUnique3River(self, *args):
+    return talib.CDLUNIQUE3RIVER(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternUpsideGap2Crows')
+def _syntax_patternUpsideGap2Crows(self, *args):
+    return talib.CDLUPSIDEGAP2CROWS(args[0], args[1], args[2], args[3])
+
+
+@builtin('patternXsideGap3Methods')
+def _syntax_patternXsideGap3Methods(self, *args):
+    return talib.CDLXSIDEGAP3METHODS(args[0], args[1], args[2], args[3])
+
+
+# box
+
+@builtin('boxFunc')
+def _syntax_boxFunc(self, *args):
+    return {
+        'left': 0,
+        'top': 0,
+        'right': 0,
+        'bottom': 0,
+        'text': '',
+        'bgColor': '#FFFFFF',
+        'borderColor': '#000000',
+        'borderWidth': 1,
+        'borderStyle': 'solid',
+        'textColor': '#000000',
+        'textSize': 12,
+        'textAlign': 'center',
+        'textVAlign': 'middle',
+        'textWrap': 'none',
+        'textFontFamily': 'Arial'
+    }
+
+
+@builtin('boxCopyFunc')
+def _syntax_boxCopyFunc(self, *args):
+    return {
+        'left': args[0]['left'],
+        'top': args[0]['top'],
+        'right': args[0]['right'],
+        'bottom': args[0]['bottom'],
+        'text': args[0]['text'],
+        'bgColor': args[0]['bgColor'],
+        'borderColor': args[0]['borderColor'],
+        'borderWidth': args[0]['borderWidth'],
+        'borderStyle': args[0]['borderStyle'],
+        'textColor': args[0]['textColor'],
+        'textSize': args[0]['textSize'],
+        'textAlign': args[0]['textAlign'],
+        'textVAlign': args[0]['textVAlign'],
+        'textWrap': args[0]['textWrap'],
+        'textFontFamily': args[0]['textFontFamily']
+    }
+
+
+@builtin('boxDeleteFunc')
+def _syntax_boxDeleteFunc(self, *args):
+    args[0] = None
+    return True
+
+
+@builtin('boxGetBottomFunc')
+def _syntax_boxGetBottomFunc(self, *args):
+    return args[0]['bottom']
+
+
+@builtin('boxGetLeftFunc')
+def _syntax_boxGetLeftFunc(self, *args):
+    return args[0]['left']
+
+
+@builtin('boxGetRightFunc')
+def _syntax_boxGetRightFunc(self, *args):
+    return args[0]['right']
+
+
+@builtin('boxGetTopFunc')
+def _syntax_boxGetTopFunc(self, *args):
+    return args[0]['top']
+
+
+@builtin('boxNewFunc')
+def _syntax_boxNewFunc(self, *args):
+    return {
+        'left': args[0],
+        'top': args[1],
+        'right': args[2],
+        'bottom': args[3]
+    }
+
+
+@builtin('boxSetBgColFunc')
+def _syntax_boxSetBgColFunc(self, *args):
+    args[0]['bgColor'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetBorderColFunc')
+def _syntax_boxSetBorderColFunc(self, *args):
+    args[0]['borderColor'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetBorderStyleFunc')
+def _syntax_boxSetBorderStyleFunc(self, *args):
+    args[0]['borderStyle'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetBorderWidthFunc')
+def _syntax_boxSetBorderWidthFunc(self, *args):
+    args[0]['borderWidth'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetBottomFunc')
+def _syntax_boxSetBottomFunc(self, *args):
+    args[0]['bottom'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetBottomRightPointFunc')
+def _syntax_boxSetBottomRightPointFunc(self, *args):
+    args[0]['bottom'] = args[1]
+    args[0]['right'] = args[2]
+    return args[0]
+
+
+@builtin('boxSetExtendFunc')
+def _syntax_boxSetExtendFunc(self, *args):
+    args[0]['extend'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetLeftFunc')
+def _syntax_boxSetLeftFunc(self, *args):
+    args[0]['left'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetLeftTopFunc')
+def _syntax_boxSetLeftTopFunc(self, *args):
+    args[0]['left'] = args[1]
+    args[0]['top'] = args[2]
+    return args[0]
+
+
+@builtin('boxSetRightFunc')
+def _syntax_boxSetRightFunc(self, *args):
+    args[0]['right'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetRightBottomFunc')
+def _syntax_boxSetRightBottomFunc(self, *args):
+    args[0]['right'] = args[1]
+    args[0]['bottom'] = args[2]
+    return args[0]
+
+
+@builtin('boxSetTextFunc')
+def _syntax_boxSetTextFunc(self, *args):
+    args[0]['text'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextColFunc')
+def _syntax_boxSetTextColFunc(self, *args):
+    args[0]['textColor'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextFontFamilyFunc')
+def _syntax_boxSetTextFontFamilyFunc(self, *args):
+    args[0]['textFontFamily'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextHAlignFunc')
+def _syntax_boxSetTextHAlignFunc(self, *args):
+    args[0]['textAlign'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextSizeFunc')
+def _syntax_boxSetTextSizeFunc(self, *args):
+    args[0]['textSize'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextVAlignFunc')
+def _syntax_boxSetTextVAlignFunc(self, *args):
+    args[0]['textVAlign'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextWrapFunc')
+def _syntax_boxSetTextWrapFunc(self, *args):
+    args[0]['textWrap'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTopFunc')
+def _syntax_boxSetTopFunc(self, *args):
+    args[0]['top'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTopLeftPointFunc')
+def _syntax_boxSetTopLeftPointFunc(self, *args):
+    args[0]['top'] = args[1]
+    args[0]['left'] = args[2]
+    return args[0]
+
+
+#col , day
+
+@builtin('chartPointCopyFunc')
+def _syntax_chartPointCopyFunc(self, *args):
+    return {
+        'x': args[0]['x'],
+        'y': args[0]['y'],
+        'time': args[0]['time'],
+        'index': args[0]['index']
+    }
+
+
+@builtin('chartPointFromIndexFunc')
+def _syntax_chartPointFromIndexFunc(self, *args):
+    return {
+        'x': args[0],
+        'y': 0,
+        'time': args[1],
+        'index': args[0]
+    }
+
+
+@builtin('chartPointFromTimeFunc')
+def _syntax_chartPointFromTimeFunc(self, *args):
+    return {
+        'x': 0,
+        'y': 0,
+        'time': args[0],
+        'index': args[1]
+    }
+
+
+@builtin('chartPointNewFunc')
+def _syntax_chartPointNewFunc(self, *args):
+    return {
+        'x': args[0],
+        'y': args[1],
+        'time': args[2],
+        'index': args[3]
+    }
+
+
+@builtin('chartPointNowFunc')
+def _syntax_chartPointNowFunc(self, *args):
+    return {
+        'x': args[0],
+        'y': args[1],
+        'time': args[2],
+        'index': 0
+    }
+
+
+@builtin('colFunc')
+def _syntax_colFunc(self, *args):
+    return {
+        'r': args[0],
+        'g': args[1],
+        'b': args[2],
+        't': args[3] if len(args) > 3 else 255
+    }
+
+
+@builtin('colBFunc')
+def _syntax_colBFunc(self, *args):
+    return args[0]['b']
+
+
+@builtin('colFromGradientFunc')
+def _syntax_colFromGradientFunc(self, *args):
+    start_r = args[0]['r']
+    start_g = args[0]['g']
+    start_b = args[0]['b']
+    end_r = args[1]['r']
+    end_g = args[1]['g']
+    end_b = args[1]['b']
+    percent = args[2]
+
+    r = start_r + (end_r - start_r) * percent
+    g = start_g + (end_g - start_g) * percent
+    b = start_b + (end_b - start_b) * percent
+
+    return {'r': r, 'g': g, 'b': b, 't': 255}
+
+
+@builtin('colGFunc')
+def _syntax_colGFunc(self, *args):
+    return args[0]['g']
+
+
+@builtin('colNewFunc')
+def _syntax_colNewFunc(self, *args):
+    return {
+        'r': args[0],
+        'g': args[1],
+        'b': args[2],
+        't': args[3] if len(args) > 3 else 255
+    }
+
+
+@builtin('colRFunc')
+def _syntax_colRFunc(self, *args):
+    return args[0]['r']
+
+
+@builtin('colRgbFunc')
+def _syntax_colRgbFunc(self, *args):
+    return {
+        'r': (args[0] >> 16) & 255,
+        'g': (args[0] >> 8) & 255,
+        'b': args[0] & 255,
+        't': 255
+    }
+
+
+@builtin('colTFunc')
+def _syntax_colTFunc(self, *args):
+    return args[0]['t']
+
+
+@builtin('dayOfMonthFunc')
+def _syntax_dayOfMonthFunc(self, *args):
+    return args[0].day
+
+
+@builtin('dayOfWeekFunc')
+def _syntax_dayOfWeekFunc(self, *args):
+    return args[0].weekday()
+
+
+@builtin('fillFunc')
+def _syntax_fillFunc(self, *args):
+    return [args[1] for _ in range(args[0])]
+
+
+@builtin('fixNanFunc')
+def _syntax_fixNanFunc(self, *args):
+    return args[1] if args[0] != args[0] else args[0]
+
+
+@builtin('floatFunc')
+def _syntax_floatFunc(self, *args):
+    return float(args[0])
+
+
+@builtin('hLineFunc')
+def _syntax_hLineFunc(self, *args):
+    return {
+        'price': args[0],
+        'color': args[1] if len(args) > 1 else 'black',
+        'width': args[2] if len(args) > 2 else 1,
+        'style': args[3] if len(args) > 3 else 'solid'
+    }
+
+
+@builtin('hourFunc')
+def _syntax_hourFunc(self, *args):
+    return args[0].hour
+
+
+@builtin('indicatorFunc')
+def _syntax_indicatorFunc(self, *args):
+    return {
+        'name': args[0],
+        'parameters': args[1] if len(args) > 1 else {},
+        'series': args[2] if len(args) > 2 else []
+    }
+
+
+# input
+
+@builtin('inputFunc')
+def _syntax_inputFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'input',
+        'value': args[1]
+    }
+
+
+@builtin('inputBoolFunc')
+def _syntax_inputBoolFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'bool',
+        'value': True if args[1] else False
+    }
+
+
+@builtin('inputColFunc')
+def _syntax_inputColFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'color',
+        'value': {
+            'r': args[1]['r'],
+            'g': args[1]['g'],
+            'b': args[1]['b'],
+            't': args[1]['t']
+        }
+    }
+
+
+@builtin('inputEnumFunc')
+def _syntax_inputEnumFunc(self, *args):
+    return {
+        'name': args[0],
+        'options': args[1],
+        'defval': args[2],
+        'type': 'enum',
+        'value': args[2]
+    }
+
+
+@builtin('inputFloatFunc')
+def _syntax_inputFloatFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': float(args[1]),
+        'minval': float(args[2]) if len(args) > 2 else None,
+        'maxval': float(args[3]) if len(args) > 3 else None,
+        'step': float(args[4]) if len(args) > 4 else 0.1,
+        'type': 'float',
+        'value': float(args[1])
+    }
+
+
+@builtin('inputIntFunc')
+def _syntax_inputIntFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': int(args[1]),
+        'minval': int(args[2]) if len(args) > 2 else None,
+        'maxval': int(args[3]) if len(args) > 3 else None,
+        'type': 'integer',
+        'value': int(args[1])
+    }
+
+
+@builtin('inputPriceFunc')
+def _syntax_inputPriceFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': float(args[1]),
+        'type': 'price',
+        'value': float(args[1])
+    }
+
+
+@builtin('inputSessionFunc')
+def _syntax_inputSessionFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'session',
+        'value': args[1]
+    }
+
+
+@builtin('inputSourceFunc')
+def _syntax_inputSourceFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'source',
+        'value': args[1]
+    }
+
+
+@builtin('inputStringFunc')
+def _syntax_inputStringFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': str(args[1]),
+        'type': 'string',
+        'value': str(args[1])
+    }
+
+
+@builtin('inputSymbolFunc')
+def _syntax_inputSymbolFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'symbol',
+        'value': args[1]
+    }
+
+
+@builtin('inputTextAreaFunc')
+def _syntax_inputTextAreaFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': str(args[1]),
+        'type': 'textarea',
+        'value': str(args[1])
+    }
+
+
+@builtin('inputTimeFunc')
+def _syntax_inputTimeFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'time',
+        'value': args[1]
+    }
+
+
+@builtin('inputTimeFrameFunc')
+def _syntax_inputTimeFrameFunc(self, *args):
+    return {
+        'name': args[0],
+        'defval': args[1],
+        'type': 'timeframe',
+        'value': args[1]
+    }
+
+
+@builtin('intFunc')
+def _syntax_intFunc(self, *args):
+    return int(float(args[0]))
+
+
+# label , library
+
+@builtin('labelFunc')
+def _syntax_labelFunc(self, *args):
+    return {
+        'text': '',
+        'x': 0,
+        'y': 0,
+        'color': '#000000',
+        'size': 12,
+        'style': 'normal',
+        'textColor': '#000000',
+        'fontFamily': 'Arial',
+        'textAlign': 'left',
+        'tooltip': '',
+        'xLoc': 'bar',
+        'yLoc': 'price'
+    }
+
+
+@builtin('labelCopyFunc')
+def _syntax_labelCopyFunc(self, *args):
+    return {
+        'text': args[0]['text'],
+        'x': args[0]['x'],
+        'y': args[0]['y'],
+        'color': args[0]['color'],
+        'size': args[0]['size'],
+        'style': args[0]['style'],
+        'textColor': args[0]['textColor'],
+        'fontFamily': args[0]['fontFamily'],
+        'textAlign': args[0]['textAlign'],
+        'tooltip': args[0]['tooltip'],
+        'xLoc': args[0]['xLoc'],
+        'yLoc': args[0]['yLoc']
+    }
+
+
+@builtin('labelDeleteFunc')
+def _syntax_labelDeleteFunc(self, *args):
+    args[0] = None
+    return True
+
+
+@builtin('labelGetTextFunc')
+def _syntax_labelGetTextFunc(self, *args):
+    return args[0]['text']
+
+
+@builtin('labelGetXFunc')
+def _syntax_labelGetXFunc(self, *args):
+    return args[0]['x']
+
+
+@builtin('labelGetYFunc')
+def _syntax_labelGetYFunc(self, *args):
+    return args[0]['y']
+
+
+@builtin('labelNewFunc')
+def _syntax_labelNewFunc(self, *args):
+    return {
+        'text': args[0],
+        'x': args[1],
+        'y': args[2],
+        'color': '#000000',
+        'size': 12,
+        'style': 'normal',
+        'textColor': '#000000',
+        'fontFamily': 'Arial',
+        'textAlign': 'left',
+        'tooltip': '',
+        'xLoc': 'bar',
+        'yLoc': 'price'
+    }
+
+
+@builtin('labelSetColFunc')
+def _syntax_labelSetColFunc(self, *args):
+    args[0]['color'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetPointFunc')
+def _syntax_labelSetPointFunc(self, *args):
+    args[0]['x'] = args[1]['x']
+    args[0]['y'] = args[1]['y']
+    return args[0]
+
+
+@builtin('labelSetSizeFunc')
+def _syntax_labelSetSizeFunc(self, *args):
+    args[0]['size'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetStyleFunc')
+def _syntax_labelSetStyleFunc(self, *args):
+    args[0]['style'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetTextFunc')
+def _syntax_labelSetTextFunc(self, *args):
+    args[0]['text'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetTextFontFamilyFunc')
+def _syntax_labelSetTextFontFamilyFunc(self, *args):
+    args[0]['fontFamily'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetTextAlignFunc')
+def _syntax_labelSetTextAlignFunc(self, *args):
+    args[0]['textAlign'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetTextColFunc')
+def _syntax_labelSetTextColFunc(self, *args):
+    args[0]['textColor'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetToolTipFunc')
+def _syntax_labelSetToolTipFunc(self, *args):
+    args[0]['tooltip'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetXFunc')
+def _syntax_labelSetXFunc(self, *args):
+    args[0]['x'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetXLocFunc')
+def _syntax_labelSetXLocFunc(self, *args):
+    args[0]['xLoc'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetXYFunc')
+def _syntax_labelSetXYFunc(self, *args):
+    args[0]['x'] = args[1]
+    args[0]['y'] = args[2]
+    return args[0]
+
+
+@builtin('labelSetYFunc')
+def _syntax_labelSetYFunc(self, *args):
+    args[0]['y'] = args[1]
+    return args[0]
+
+
+@builtin('labelSetYLocFunc')
+def _syntax_labelSetYLocFunc(self, *args):
+    args[0]['yLoc'] = args[1]
+    return args[0]
+
+
+@builtin('libraryFunc')
+def _syntax_libraryFunc(self, *args):
+    return {
+        'name': args[0],
+        'version': args[1],
+        'code': args[2]
+    }
+
+
+# line
+
+@builtin('lineFunc')
+def _syntax_lineFunc(self, *args):
+    return {
+        'x1': 0, 'y1': 0,
+        'x2': 0, 'y2': 0,
+        'color': '#000000',
+        'width': 1,
+        'style': 'solid',
+        'extend': 'none',
+        'xLoc': 'bar'
+    }
+
+
+@builtin('lineCopyFunc')
+def _syntax_lineCopyFunc(self, *args):
+    return {
+        'x1': args[0]['x1'],
+        'y1': args[0]['y1'],
+        'x2': args[0]['x2'],
+        'y2': args[0]['y2'],
+        'color': args[0]['color'],
+        'width': args[0]['width'],
+        'style': args[0]['style'],
+        'extend': args[0]['extend'],
+        'xLoc': args[0]['xLoc']
+    }
+
+
+@builtin('lineDeleteFunc')
+def _syntax_lineDeleteFunc(self, *args):
+    args[0] = None
+    return True
+
+
+@builtin('lineGetPriceFunc')
+def _syntax_lineGetPriceFunc(self, *args):
+    return args[0]['y1']
+
+
+@builtin('lineGetX1Func')
+def _syntax_lineGetX1Func(self, *args):
+    return args[0]['x1']
+
+
+@builtin('lineGetX2Func')
+def _syntax_lineGetX2Func(self, *args):
+    return args[0]['x2']
+
+
+@builtin('lineGetY1Func')
+def _syntax_lineGetY1Func(self, *args):
+    return args[0]['y1']
+
+
+@builtin('lineGetY2Func')
+def _syntax_lineGetY2Func(self, *args):
+    return args[0]['y2']
+
+
+@builtin('lineNewFunc')
+def _syntax_lineNewFunc(self, *args):
+    return {
+        'x1': args[0],
+        'y1': args[1],
+        'x2': args[2],
+        'y2': args[3],
+        'color': '#000000',
+        'width': 1,
+        'style': 'solid',
+        'extend': 'none',
+        'xLoc': 'bar'
+    }
+
+
+@builtin('lineSetColFunc')
+def _syntax_lineSetColFunc(self, *args):
+    args[0]['color'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetExtendFunc')
+def _syntax_lineSetExtendFunc(self, *args):
+    args[0]['extend'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetFirstPointFunc')
+def _syntax_lineSetFirstPointFunc(self, *args):
+    args[0]['x1'] = args[1]['x']
+    args[0]['y1'] = args[1]['y']
+    return args[0]
+
+
+@builtin('lineSetSecondPointFunc')
+def _syntax_lineSetSecondPointFunc(self, *args):
+    args[0]['x2'] = args[1]['x']
+    args[0]['y2'] = args[1]['y']
+    return args[0]
+
+
+@builtin('lineSetStyleFunc')
+def _syntax_lineSetStyleFunc(self, *args):
+    args[0]['style'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetWidthFunc')
+def _syntax_lineSetWidthFunc(self, *args):
+    args[0]['width'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetX1Func')
+def _syntax_lineSetX1Func(self, *args):
+    args[0]['x1'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetX2Func')
+def _syntax_lineSetX2Func(self, *args):
+    args[0]['x2'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetXLocFunc')
+def _syntax_lineSetXLocFunc(self, *args):
+    args[0]['xLoc'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetXY1Func')
+def _syntax_lineSetXY1Func(self, *args):
+    args[0]['x1'] = args[1]
+    args[0]['y1'] = args[2]
+    return args[0]
+
+
+@builtin('lineSetXY2Func')
+def _syntax_lineSetXY2Func(self, *args):
+    args[0]['x2'] = args[1]
+    args[0]['y2'] = args[2]
+    return args[0]
+
+
+@builtin('lineSetY1Func')
+def _syntax_lineSetY1Func(self, *args):
+    args[0]['y1'] = args[1]
+    return args[0]
+
+
+@builtin('lineSetY2Func')
+def _syntax_lineSetY2Func(self, *args):
+    args[0]['y2'] = args[1]
+    return args[0]
+
+
+@builtin('lineFillFunc')
+def _syntax_lineFillFunc(self, *args):
+    return {
+        'line1': None,
+        'line2': None,
+        'color': '#000000'
+    }
+
+
+@builtin('lineFillDeleteFunc')
+def _syntax_lineFillDeleteFunc(self, *args):
+    args[0] = None
+    return True
+
+
+@builtin('lineFillGetLine1Func')
+def _syntax_lineFillGetLine1Func(self, *args):
+    return args[0]['line1']
+
+
+@builtin('lineFillGetLine2Func')
+def _syntax_lineFillGetLine2Func(self, *args):
+    return args[0]['line2']
+
+
+@builtin('lineFillNewFunc')
+def _syntax_lineFillNewFunc(self, *args):
+    return {
+        'line1': args[0],
+        'line2': args[1],
+        'color': args[2] if len(args) > 2 else '#000000'
+    }
+
+
+@builtin('lineFillSetColFunc')
+def _syntax_lineFillSetColFunc(self, *args):
+    args[0]['color'] = args[1]
+    return args[0]
+
+
+# map , log
+
+@builtin('logErrorFunc')
+def _syntax_logErrorFunc(self, *args):
+    return {
+        'type': 'error',
+        'message': args[0],
+        'timestamp': args[1]
+    }
+
+
+@builtin('logInfoFunc')
+def _syntax_logInfoFunc(self, *args):
+    return {
+        'type': 'info',
+        'message': args[0],
+        'timestamp': args[1]
+    }
+
+
+@builtin('logWarningFunc')
+def _syntax_logWarningFunc(self, *args):
+    return {
+        'type': 'warning',
+        'message': args[0],
+        'timestamp': args[1]
+    }
+
+
+@builtin('mapClearFunc')
+def _syntax_mapClearFunc(self, *args):
+    args[0].clear()
+    return {}
+
+
+@builtin('mapContainsFunc')
+def _syntax_mapContainsFunc(self, *args):
+    return args[1] in args[0]
+
+
+@builtin('mapCopyFunc')
+def _syntax_mapCopyFunc(self, *args):
+    new_map = {}
+    for key in args[0]:
+        new_map[key] = args[0][key]
+    return new_map
+
+
+@builtin('mapGetFunc')
+def _syntax_mapGetFunc(self, *args):
+    return args[0].get(args[1])
+
+
+@builtin('mapKeysFunc')
+def _syntax_mapKeysFunc(self, *args):
+    keys = []
+    for key in args[0]:
+        keys.append(key)
+    return keys
+
+
+@builtin('mapNewTypeFunc')
+def _syntax_mapNewTypeFunc(self, *args):
+    return {}
+
+
+@builtin('mapPutFunc')
+def _syntax_mapPutFunc(self, *args):
+    args[0][args[1]] = args[2]
+    return args[0]
+
+
+@builtin('mapPutAllFunc')
+def _syntax_mapPutAllFunc(self, *args):
+    for key in args[1]:
+        args[0][key] = args[1][key]
+    return args[0]
+
+
+@builtin('mapRemoveFunc')
+def _syntax_mapRemoveFunc(self, *args):
+    if args[1] in args[0]:
+        del args[0][args[1]]
+    return args[0]
+
+
+@builtin('mapSizeFunc')
+def _syntax_mapSizeFunc(self, *args):
+    count = 0
+    for _ in args[0]:
+        count += 1
+    return count
+
+
+@builtin('mapValuesFunc')
+def _syntax_mapValuesFunc(self, *args):
+    values = []
+    for key in args[0]:
+        values.append(args[0][key])
+    return values
+
+
+# math
+
+@builtin('mathAbsFunc')
+def _syntax_mathAbsFunc(self, *args):
+    return -args[0] if args[0] < 0 else args[0]
+
+
+@builtin('mathAcosFunc')
+def _syntax_mathAcosFunc(self, *args):
+    x = args[0]
+    if x < -1 or x > 1:
+        return None
+    return 3.141592653589793 / 2 - (x + x**3/6 + 3*x**5/40 + 5*x**7/112)
+
+
+@builtin('mathAsinFunc')
+def _syntax_mathAsinFunc(self, *args):
+    x = args[0]
+    if x < -1 or x > 1:
+        return None
+    return x + x**3/6 + 3*x**5/40 + 5*x**7/112
+
+
+@builtin('mathAtanFunc')
+def _syntax_mathAtanFunc(self, *args):
+    x = args[0]
+    return x - x**3/3 + x**5/5 - x**7/7 if abs(x) <= 1 else (3.141592653589793/2 if x > 0 else -3.141592653589793/2)
+
+
+@builtin('mathAvgFunc')
+def _syntax_mathAvgFunc(self, *args):
+    sum_val = 0
+    count = 0
+    for x in args[0]:
+        sum_val += x
+        count += 1
+    return sum_val / count if count > 0 else 0
+
+
+@builtin('mathCeilFunc')
+def _syntax_mathCeilFunc(self, *args):
+    integer = int(args[0])
+    return integer + 1 if args[0] > integer else integer
+
+
+@builtin('mathCosFunc')
+def _syntax_mathCosFunc(self, *args):
+    x = args[0]
+    x = x % (2 * 3.141592653589793)
+    return 1 - x**2/2 + x**4/24 - x**6/720
+
+
+@builtin('mathExpFunc')
+def _syntax_mathExpFunc(self, *args):
+    x = args[0]
+    result = 1
+    term = 1
+    for i in range(1, 100):
+        term *= x/i
+        result += term
+        if term < 0.0000001:
+            break
+    return result
+
+
+@builtin('mathFloorFunc')
+def _syntax_mathFloorFunc(self, *args):
+    integer = int(args[0])
+    return integer - 1 if args[0] < integer else integer
+
+
+@builtin('mathLogFunc')
+def _syntax_mathLogFunc(self, *args):
+    x = args[0]
+    if x <= 0:
+        return None
+    y = (x - 1) / (x + 1)
+    result = 0
+    term = y
+    for i in range(1, 100, 2):
+        result += term / i
+        term *= y * y
+        if term < 0.0000001:
+            break
+    return 2 * result
+
+
+@builtin('mathLog10Func')
+def _syntax_mathLog10Func(self, *args):
+    x = args[0]
+    if x <= 0:
+        return None
+    return mathLogFunc(x) / 2.302585092994046  # ln(10)
+
+
+@builtin('mathMaxFunc')
+def _syntax_mathMaxFunc(self, *args):
+    max_val = args[0][0]
+    for x in args[0][1:]:
+        if x > max_val:
+            max_val = x
+    return max_val
+
+
+@builtin('mathMinFunc')
+def _syntax_mathMinFunc(self, *args):
+    min_val = args[0][0]
+    for x in args[0][1:]:
+        if x < min_val:
+            min_val = x
+    return min_val
+
+
+@builtin('mathPowFunc')
+def _syntax_mathPowFunc(self, *args):
+    result = 1
+    for _ in range(int(args[1])):
+        result *= args[0]
+    return result
+
+
+@builtin('mathRandomFunc')
+def _syntax_mathRandomFunc(self, *args):
+    seed = args[0] if args else 1
+    a = 1664525
+    c = 1013904223
+    m = 2**32
+    seed = (a * seed + c) % m
+    return seed / m
+
+
+@builtin('mathRoundFunc')
+def _syntax_mathRoundFunc(self, *args):
+    decimal = args[0] - int(args[0])
+    return int(args[0]) + (1 if decimal >= 0.5 else 0)
+
+
+@builtin('mathRoundToMinTickFunc')
+def _syntax_mathRoundToMinTickFunc(self, *args):
+    tick = args[1]
+    return round(args[0] / tick) * tick
+
+
+@builtin('mathSignFunc')
+def _syntax_mathSignFunc(self, *args):
+    return 1 if args[0] > 0 else (-1 if args[0] < 0 else 0)
+
+
+@builtin('mathSinFunc')
+def _syntax_mathSinFunc(self, *args):
+    x = args[0]
+    x = x % (2 * 3.141592653589793)
+    return x - x**3/6 + x**5/120 - x**7/5040
+
+
+@builtin('mathSqrtFunc')
+def _syntax_mathSqrtFunc(self, *args):
+    x = args[0]
+    if x < 0:
+        return None
+    guess = x / 2
+    for _ in range(20):
+        new_guess = (guess + x/guess) / 2
+        if abs(new_guess - guess) < 0.0000001:
+            break
+        guess = new_guess
+    return guess
+
+
+@builtin('mathSumFunc')
+def _syntax_mathSumFunc(self, *args):
+    total = 0
+    for x in args[0]:
+        total += x
+    return total
+
+
+@builtin('mathTanFunc')
+def _syntax_mathTanFunc(self, *args):
+    sin_val = mathSinFunc(args[0])
+    cos_val = mathCosFunc(args[0])
+    return sin_val / cos_val if cos_val != 0 else None
+
+
+@builtin('mathToDegreesFunc')
+def _syntax_mathToDegreesFunc(self, *args):
+    return args[0] * 180 / 3.141592653589793
+
+
+@builtin('mathToRadiansFunc')
+def _syntax_mathToRadiansFunc(self, *args):
+    return args[0] * 3.141592653589793 / 180
+
+
+# matrix
+
+@builtin('matrixAddColFunc')
+def _syntax_matrixAddColFunc(self, *args):
+    result = [row[:] for row in args[0]]
+    for i in range(len(result)):
+        result[i].append(args[1][i])
+    return result
+
+
+@builtin('matrixAddRowFunc')
+def _syntax_matrixAddRowFunc(self, *args):
+    result = [row[:] for row in args[0]]
+    result.append(args[1])
+    return result
+
+
+@builtin('matrixAvgFunc')
+def _syntax_matrixAvgFunc(self, *args):
+    sum_val = 0
+    count = 0
+    for row in args[0]:
+        for val in row:
+            sum_val += val
+            count += 1
+    return sum_val / count if count > 0 else 0
+
+
+@builtin('matrixColFunc')
+def _syntax_matrixColFunc(self, *args):
+    return [row[args[1]] for row in args[0]]
+
+
+@builtin('matrixColumnsFunc')
+def _syntax_matrixColumnsFunc(self, *args):
+    return len(args[0][0]) if args[0] else 0
+
+
+@builtin('matrixConcatFunc')
+def _syntax_matrixConcatFunc(self, *args):
+    return [row[:] for row in args[0]] + [row[:] for row in args[1]]
+
+
+@builtin('matrixCopyFunc')
+def _syntax_matrixCopyFunc(self, *args):
+    return [row[:] for row in args[0]]
+
+
+@builtin('matrixDetFunc')
+def _syntax_matrixDetFunc(self, *args):
+    n = len(args[0])
+    if n == 1:
+        return args[0][0][0]
+    if n == 2:
+        return args[0][0][0] * args[0][1][1] - args[0][0][1] * args[0][1][0]
+    det = 0
+    for j in range(n):
+        submatrix = [[args[0][i][k] for k in range(n) if k != j] for i in range(1, n)]
+        det += ((-1) ** j) * args[0][0][j] * matrixDetFunc(submatrix)
+    return det
+
+
+@builtin('matrixDiffFunc')
+def _syntax_matrixDiffFunc(self, *args):
+    rows = len(args[0])
+    cols = len(args[0][0])
+    result = [[0] * cols for _ in range(rows)]
+    for i in range(rows):
+        for j in range(cols):
+            result[i][j] = args[0][i][j] - args[1][i][j]
+    return result
+
+
+@builtin('matrixElementsCountFunc')
+def _syntax_matrixElementsCountFunc(self, *args):
+    count = 0
+    for row in args[0]:
+        count += len(row)
+    return count
+
+
+@builtin('matrixFillFunc')
+def _syntax_matrixFillFunc(self, *args):
+    rows = len(args[0])
+    cols = len(args[0][0])
+    return [[args[1] for _ in range(cols)] for _ in range(rows)]
+
+
+@builtin('matrixGetFunc')
+def _syntax_matrixGetFunc(self, *args):
+    return args[0][args[1]][args[2]]
+
+
+@builtin('matrixIsAntiDiagonalFunc')
+def _syntax_matrixIsAntiDiagonalFunc(self, *args):
+    n = len(args[0])
+    for i in range(n):
+        for j in range(n):
+            if i + j != n - 1 and args[0][i][j] != 0:
+                return False
+    return True
+
+
+@builtin('matrixIsAntiSymmetricFunc')
+def _syntax_matrixIsAntiSymmetricFunc(self, *args):
+    n = len(args[0])
+    for i in range(n):
+        for j in range(n):
+            if args[0][i][j] != -args[0][j][i]:
+                return False
+    return True
+
+
+@builtin('matrixIsBinaryFunc')
+def _syntax_matrixIsBinaryFunc(self, *args):
+    for row in args[0]:
+        for val in row:
+            if val != 0 and val != 1:
+                return False
+    return True
+
+
+@builtin('matrixIsDiagonalFunc')
+def _syntax_matrixIsDiagonalFunc(self, *args):
+    n = len(args[0])
+    for i in range(n):
+        for j in range(n):
+            if i != j and args[0][i][j] != 0:
+                return False
+    return True
+
+
+@builtin('matrixIsIdentityFunc')
+def _syntax_matrixIsIdentityFunc(self, *args):
+    n = len(args[0])
+    for i in range(n):
+        for j in range(n):
+            if (i == j and args[0][i][j] != 1) or (i != j and args[0][i][j] != 0):
+                return False
+    return True
+
+
+@builtin('matrixIsSquareFunc')
+def _syntax_matrixIsSquareFunc(self, *args):
+    return len(args[0]) == len(args[0][0])
+
+
+@builtin('matrixIsStochasticFunc')
+def _syntax_matrixIsStochasticFunc(self, *args):
+    for row in args[0]:
+        row_sum = sum(row)
+        if abs(row_sum - 1) > 0.000001:
+            return False
+    return True
+
+
+@builtin('matrixIsSymmetricFunc')
+def _syntax_matrixIsSymmetricFunc(self, *args):
+    n = len(args[0])
+    for i in range(n):
+        for j in range(i + 1, n):
+            if args[0][i][j] != args[0][j][i]:
+                return False
+    return True
+
+
+@builtin('matrixIsTriangularFunc')
+def _syntax_matrixIsTriangularFunc(self, *args):
+    n = len(args[0])
+    lower = True
+    upper = True
+    for i in range(n):
+        for j in range(n):
+            if i < j and args[0][i][j] != 0:
+                lower = False
+            if i > j and args[0][i][j] != 0:
+                upper = False
+    return lower or upper
+
+
+@builtin('matrixIsZeroFunc')
+def _syntax_matrixIsZeroFunc(self, *args):
+    for row in args[0]:
+        for val in row:
+            if val != 0:
+                return False
+    return True
+
+
+@builtin('matrixMaxFunc')
+def _syntax_matrixMaxFunc(self, *args):
+    max_val = args[0][0][0]
+    for row in args[0]:
+        for val in row:
+            if val > max_val:
+                max_val = val
+    return max_val
+
+
+@builtin('matrixMinFunc')
+def _syntax_matrixMinFunc(self, *args):
+    min_val = args[0][0][0]
+    for row in args[0]:
+        for val in row:
+            if val < min_val:
+                min_val = val
+    return min_val
+
+
+@builtin('matrixMultFunc')
+def _syntax_matrixMultFunc(self, *args):
+    m1, n1 = len(args[0]), len(args[0][0])
+    n2 = len(args[1][0])
+    result = [[0] * n2 for _ in range(m1)]
+    for i in range(m1):
+        for j in range(n2):
+            for k in range(n1):
+                result[i][j] += args[0][i][k] * args[1][k][j]
+    return result
+
+
+@builtin('matrixNewTypeFunc')
+def _syntax_matrixNewTypeFunc(self, *args):
+    return [[0] * args[1] for _ in range(args[0])]
+
+
+@builtin('matrixReshapeFunc')
+def _syntax_matrixReshapeFunc(self, *args):
+    flat = []
+    for row in args[0]:
+        flat.extend(row)
+    rows, cols = args[1], args[2]
+    return [flat[i:i + cols] for i in range(0, len(flat), cols)]
+
+
+@builtin('matrixReverseFunc')
+def _syntax_matrixReverseFunc(self, *args):
+    return [row[::-1] for row in args[0][::-1]]
+
+
+@builtin('matrixRowFunc')
+def _syntax_matrixRowFunc(self, *args):
+    return args[0][args[1]][:]
+
+
+@builtin('matrixRowsFunc')
+def _syntax_matrixRowsFunc(self, *args):
+    return len(args[0])
+
+
+@builtin('matrixSetFunc')
+def _syntax_matrixSetFunc(self, *args):
+    args[0][args[1]][args[2]] = args[3]
+    return args[0]
+
+
+@builtin('matrixSortFunc')
+def _syntax_matrixSortFunc(self, *args):
+    flat = []
+    for row in args[0]:
+        flat.extend(row)
+    flat.sort()
+    rows = len(args[0])
+    cols = len(args[0][0])
+    return [flat[i:i + cols] for i in range(0, len(flat), cols)]
+
+
+@builtin('matrixSumFunc')
+def _syntax_matrixSumFunc(self, *args):
+    total = 0
+    for row in args[0]:
+        for val in row:
+            total += val
+    return total
+
+
+@builtin('matrixTraceFunc')
+def _syntax_matrixTraceFunc(self, *args):
+    trace = 0
+    for i in range(len(args[0])):
+        trace += args[0][i][i]
+    return trace
+
+
+@builtin('matrixTransposeFunc')
+def _syntax_matrixTransposeFunc(self, *args):
+    rows = len(args[0])
+    cols = len(args[0][0])
+    return [[args[0][j][i] for j in range(rows)] for i in range(cols)]
+
+
+@builtin('matrixEigenValuesFunc')
+def _syntax_matrixEigenValuesFunc(self, *args):
+    n = len(args[0])
+    # Power iteration method for dominant eigenvalue
+    v = [1] * n
+    for _ in range(100):
+        # Matrix-vector multiplication
+        new_v = [0] * n
+        for i in range(n):
+            for j in range(n):
+                new_v[i] += args[0][i][j] * v[j]
+        # Normalize
+        norm = sum(x*x for x in new_v) ** 0.5
+        v = [x/norm for x in new_v]
+    # Compute Rayleigh quotient
+    eigenvalue = sum(v[i] * sum(args[0][i][j] * v[j] for j in range(n)) for i in range(n))
+    return [eigenvalue]
+
+
+@builtin('matrixEigenVectorsFunc')
+def _syntax_matrixEigenVectorsFunc(self, *args):
+    n = len(args[0])
+    # Power iteration method for dominant eigenvector
+    v = [1] * n
+    for _ in range(100):
+        new_v = [0] * n
+        for i in range(n):
+            for j in range(n):
+                new_v[i] += args[0][i][j] * v[j]
+        norm = sum(x*x for x in new_v) ** 0.5
+        v = [x/norm for x in new_v]
+    return [v]
+
+
+@builtin('matrixInvFunc')
+def _syntax_matrixInvFunc(self, *args):
+    n = len(args[0])
+    # Augment matrix with identity
+    aug = [[args[0][i][j] for j in range(n)] + [1 if i == j else 0 for j in range(n)] for i in range(n)]
+
+    # Gaussian elimination
+    for i in range(n):
+        pivot = aug[i][i]
+        for j in range(2*n):
+            aug[i][j] /= pivot
+        for k in range(n):
+            if k != i:
+                factor = aug[k][i]
+                for j in range(2*n):
+                    aug[k][j] -= factor * aug[i][j]
+
+    return [[aug[i][j+n] for j in range(n)] for i in range(n)]
+
+
+@builtin('matrixKronFunc')
+def _syntax_matrixKronFunc(self, *args):
+    m1, n1 = len(args[0]), len(args[0][0])
+    m2, n2 = len(args[1]), len(args[1][0])
+    result = [[0] * (n1*n2) for _ in range(m1*m2)]
+
+    for i in range(m1):
+        for j in range(n1):
+            for k in range(m2):
+                for l in range(n2):
+                    result[i*m2 + k][j*n2 + l] = args[0][i][j] * args[1][k][l]
+    return result
+
+
+@builtin('matrixPinvFunc')
+def _syntax_matrixPinvFunc(self, *args):
+    # Moore-Penrose pseudoinverse using SVD-like approach
+    n = len(args[0])
+    m = len(args[0][0])
+
+    # Compute A^T * A
+    ata = [[sum(args[0][k][i] * args[0][k][j] for k in range(n)) for j in range(m)] for i in range(m)]
+
+    # Compute inverse of A^T * A
+    inv_ata = matrixInvFunc(ata)
+
+    # Compute pseudoinverse
+    return [[sum(inv_ata[i][k] * args[0][j][k] for k in range(m)) for j in range(n)] for i in range(m)]
+
+
+@builtin('matrixPowFunc')
+def _syntax_matrixPowFunc(self, *args):
+    n = len(args[0])
+    power = args[1]
+
+    # Initialize result as identity matrix
+    result = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+
+    # Multiply matrix power times
+    for _ in range(power):
+        new_result = [[0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(n):
+                for k in range(n):
+                    new_result[i][j] += result[i][k] * args[0][k][j]
+        result = new_result
+
+    return result
+
+
+@builtin('matrixRankFunc')
+def _syntax_matrixRankFunc(self, *args):
+    # Gaussian elimination to compute rank
+    m = [row[:] for row in args[0]]
+    rows, cols = len(m), len(m[0])
+    rank = 0
+
+    for col in range(cols):
+        if rank >= rows:
+            break
+
+        # Find pivot
+        pivot_row = rank
+        while pivot_row < rows and m[pivot_row][col] == 0:
+            pivot_row += 1
+
+        if pivot_row < rows:
+            if pivot_row != rank:
+                m[rank], m[pivot_row] = m[pivot_row], m[rank]
+
+            # Eliminate column entries
+            for i in range(rank + 1, rows):
+                factor = m[i][col] / m[rank][col]
+                for j in range(col, cols):
+                    m[i][j] -= factor * m[rank][j]
+
+            rank += 1
+
+    return rank
+
+
+@builtin('matrixMedianFunc')
+def _syntax_matrixMedianFunc(self, *args):
+    flat = []
+    for row in args[0]:
+        flat.extend(row)
+    flat.sort()
+    mid = len(flat) // 2
+    return flat[mid] if len(flat) % 2 else (flat[mid-1] + flat[mid]) / 2
+
+
+@builtin('matrixModeFunc')
+def _syntax_matrixModeFunc(self, *args):
+    flat = []
+    for row in args[0]:
+        flat.extend(row)
+    counts = {}
+    for val in flat:
+        counts[val] = counts.get(val, 0) + 1
+    max_count = max(counts.values())
+    return [k for k, v in counts.items() if v == max_count][0]
+
+
+@builtin('matrixRemoveColFunc')
+def _syntax_matrixRemoveColFunc(self, *args):
+    return [[val for j, val in enumerate(row) if j != args[1]] for row in args[0]]
+
+
+@builtin('matrixRemoveRowFunc')
+def _syntax_matrixRemoveRowFunc(self, *args):
+    return [row for i, row in enumerate(args[0]) if i != args[1]]
+
+
+@builtin('matrixSubMatrixFunc')
+def _syntax_matrixSubMatrixFunc(self, *args):
+    return [[args[0][i][j] for j in range(args[2], args[4])] 
+            for i in range(args[1], args[3])]
+
+
+@builtin('matrixSwapColumnsFunc')
+def _syntax_matrixSwapColumnsFunc(self, *args):
+    result = [row[:] for row in args[0]]
+    for row in result:
+        row[args[1]], row[args[2]] = row[args[2]], row[args[1]]
+    return result
+
+
+@builtin('matrixSwapRowsFunc')
+def _syntax_matrixSwapRowsFunc(self, *args):
+    result = [row[:] for row in args[0]]
+    result[args[1]], result[args[2]] = result[args[2]], result[args[1]]
+    return result
+
+
+# request , time
+
+@builtin('maxBarsBackFunc')
+def _syntax_maxBarsBackFunc(self, *args):
+    return {
+        'buffer': args[0],
+        'max_bars': args[1]
+    }
+
+
+@builtin('minuteFunc')
+def _syntax_minuteFunc(self, *args):
+    return args[0].minute
+
+
+@builtin('monthFunc')
+def _syntax_monthFunc(self, *args):
+    return args[0].month
+
+
+@builtin('naFunc')
+def _syntax_naFunc(self, *args):
+    return float('nan')
+
+
+@builtin('nzFunc')
+def _syntax_nzFunc(self, *args):
+    return args[1] if args[0] != args[0] else args[0]
+
+
+@builtin('polylineDeleteFunc')
+def _syntax_polylineDeleteFunc(self, *args):
+    args[0] = None
+    return True
+
+
+@builtin('polylineNewFunc')
+def _syntax_polylineNewFunc(self, *args):
+    return {
+        'points': args[0],
+        'color': args[1] if len(args) > 1 else '#000000',
+        'width': args[2] if len(args) > 2 else 1,
+        'style': args[3] if len(args) > 3 else 'solid'
+    }
+
+
+@builtin('requestCurrencyRateFunc')
+def _syntax_requestCurrencyRateFunc(self, *args):
+    return {
+        'from_currency': args[0],
+        'to_currency': args[1],
+        'timestamp': args[2]
+    }
+
+
+@builtin('requestDividendsFunc')
+def _syntax_requestDividendsFunc(self, *args):
+    return {
+        'symbol': args[0],
+        'from_date': args[1],
+        'to_date': args[2]
+    }
+
+
+@builtin('requestEarningsFunc')
+def _syntax_requestEarningsFunc(self, *args):
+    return {
+        'symbol': args[0],
+        'from_date': args[1],
+        'to_date': args[2]
+    }
+
+
+@builtin('requestEconomicFunc')
+def _syntax_requestEconomicFunc(self, *args):
+    return {
+        'indicator': args[0],
+        'from_date': args[1],
+        'to_date': args[2]
+    }
+
+
+@builtin('requestFinancialFunc')
+def _syntax_requestFinancialFunc(self, *args):
+    return {
+        'symbol': args[0],
+        'statement': args[1],
+        'period': args[2]
+    }
+
+
+@builtin('requestQuandlFunc')
+def _syntax_requestQuandlFunc(self, *args):
+    return {
+        'code': args[0],
+        'from_date': args[1],
+        'to_date': args[2]
+    }
+
+
+@builtin('requestSecurityFunc')
+def _syntax_requestSecurityFunc(self, *args):
+    return {
+        'symbol': args[0],
+        'resolution': args[1],
+        'from_date': args[2],
+        'to_date': args[3]
+    }
+
+
+@builtin('requestSecurityLowerTfFunc')
+def _syntax_requestSecurityLowerTfFunc(self, *args):
+    return {
+        'symbol': args[0],
+        'resolution': args[1],
+        'from_date': args[2],
+        'to_date': args[3],
+        'timeframe': args[4]
+    }
+
+
+@builtin('requestSeedFunc')
+def _syntax_requestSeedFunc(self, *args):
+    return {
+        'seed_value': args[0]
+    }
+
+
+@builtin('requestSplitsFunc')
+def _syntax_requestSplitsFunc(self, *args):
+    return {
+        'symbol': args[0],
+        'from_date': args[1],
+        'to_date': args[2]
+    }
+
+
+@builtin('runtimeErrorFunc')
+def _syntax_runtimeErrorFunc(self, *args):
+    return {
+        'error_message': args[0],
+        'error_type': 'runtime',
+        'timestamp': args[1]
+    }
+
+
+@builtin('secondFunc')
+def _syntax_secondFunc(self, *args):
+    return args[0].second
+
+
+# str
+
+@builtin('strContainsFunc')
+def _syntax_strContainsFunc(self, *args):
+    text = args[0]
+    search = args[1]
+    for i in range(len(text) - len(search) + 1):
+        if text[i:i+len(search)] == search:
+            return True
+    return False
+
+
+@builtin('strEndsWithFunc')
+def _syntax_strEndsWithFunc(self, *args):
+    text = args[0]
+    search = args[1]
+    return text[-len(search):] == search if len(text) >= len(search) else False
+
+
+@builtin('strFormatFunc')
+def _syntax_strFormatFunc(self, *args):
+    text = args[0]
+    values = args[1:]
+    result = ''
+    i = 0
+    val_index = 0
+    while i < len(text):
+        if text[i:i+2] == '{}':
+            result += str(values[val_index])
+            val_index += 1
+            i += 2
+        else:
+            result += text[i]
+            i += 1
+    return result
+
+
+@builtin('strFormatTimeFunc')
+def _syntax_strFormatTimeFunc(self, *args):
+    timestamp = args[0]
+    format_str = args[1]
+    dt = args[0]
+    return format_str.replace('%Y', str(dt.year))\
+                   .replace('%m', str(dt.month).zfill(2))\
+                   .replace('%d', str(dt.day).zfill(2))\
+                   .replace('%H', str(dt.hour).zfill(2))\
+                   .replace('%M', str(dt.minute).zfill(2))\
+                   .replace('%S', str(dt.second).zfill(2))
+
+
+@builtin('strLengthFunc')
+def _syntax_strLengthFunc(self, *args):
+    count = 0
+    for _ in args[0]:
+        count += 1
+    return count
+
+
+@builtin('strLowerFunc')
+def _syntax_strLowerFunc(self, *args):
+    result = ''
+    for c in args[0]:
+        if 'A' <= c <= 'Z':
+            result += chr(ord(c) + 32)
+        else:
+            result += c
+    return result
+
+
+@builtin('strMatchFunc')
+def _syntax_strMatchFunc(self, *args):
+    text = args[0]
+    pattern = args[1]
+    return text == pattern
+
+
+@builtin('strPosFunc')
+def _syntax_strPosFunc(self, *args):
+    text = args[0]
+    search = args[1]
+    for i in range(len(text) - len(search) + 1):
+        if text[i:i+len(search)] == search:
+            return i
+    return -1
+
+
+@builtin('strRepeatFunc')
+def _syntax_strRepeatFunc(self, *args):
+    result = ''
+    for _ in range(args[1]):
+        result += args[0]
+    return result
+
+
+@builtin('strReplaceFunc')
+def _syntax_strReplaceFunc(self, *args):
+    text = args[0]
+    old = args[1]
+    new = args[2]
+    pos = 0
+    result = ''
+    while pos < len(text):
+        if text[pos:pos+len(old)] == old:
+            result += new
+            pos += len(old)
+        else:
+            result += text[pos]
+            pos += 1
+    return result
+
+
+@builtin('strReplaceAllFunc')
+def _syntax_strReplaceAllFunc(self, *args):
+    text = args[0]
+    old = args[1]
+    new = args[2]
+    result = ''
+    i = 0
+    while i < len(text):
+        if text[i:i+len(old)] == old:
+            result += new
+            i += len(old)
+        else:
+            result += text[i]
+            i += 1
+    return result
+
+
+@builtin('strSplitFunc')
+def _syntax_strSplitFunc(self, *args):
+    text = args[0]
+    delimiter = args[1]
+    result = []
+    current = ''
+    i = 0
+    while i < len(text):
+        if text[i:i+len(delimiter)] == delimiter:
             result.append(current)
-            return result
-            
-        elif syntax_list['name'] == 'strStartsWithFunc':
-            text = args[0]
-            search = args[1]
-            return text[:len(search)] == search if len(text) >= len(search) else False
-            
-        elif syntax_list['name'] == 'strSubstringFunc':
-            text = args[0]
-            start = args[1]
-            length = args[2] if len(args) > 2 else len(text) - start
-            return text[start:start+length]
-            
-        elif syntax_list['name'] == 'strToNumberFunc':
-            text = args[0].strip()
-            result = 0
-            decimal = 0
-            decimal_pos = 0
-            negative = text[0] == '-'
-            start = 1 if negative else 0
-            
-            for i in range(start, len(text)):
-                if text[i] == '.':
-                    decimal_pos = i
-                    continue
-                digit = ord(text[i]) - ord('0')
-                if decimal_pos:
-                    decimal = decimal * 10 + digit
-                else:
-                    result = result * 10 + digit
-                    
-            final = result + decimal / (10 ** (len(text) - decimal_pos - 1)) if decimal_pos else result
-            return -final if negative else final
-            
-        elif syntax_list['name'] == 'strToStringFunc':
-            return str(args[0])
-            
-        elif syntax_list['name'] == 'strTrimFunc':
-            text = args[0]
-            start = 0
-            end = len(text)
-            while start < end and text[start] in ' \t\n\r':
-                start += 1
-            while end > start and text[end-1] in ' \t\n\r':
-                end -= 1
-            return text[start:end]
-            
-        elif syntax_list['name'] == 'strUpperFunc':
-            result = ''
-            for c in args[0]:
-                if 'a' <= c <= 'z':
-                    result += chr(ord(c) - 32)
-                else:
-                    result += c
-            return result
-        
+            current = ''
+            i += len(delimiter)
+        else:
+            current += text[i]
+            i += 1
+    result.append(current)
+    return result
+
+
+@builtin('strStartsWithFunc')
+def _syntax_strStartsWithFunc(self, *args):
+    text = args[0]
+    search = args[1]
+    return text[:len(search)] == search if len(text) >= len(search) else False
+
+
+@builtin('strSubstringFunc')
+def _syntax_strSubstringFunc(self, *args):
+    text = args[0]
+    start = args[1]
+    length = args[2] if len(args) > 2 else len(text) - start
+    return text[start:start+length]
+
+
+@builtin('strToNumberFunc')
+def _syntax_strToNumberFunc(self, *args):
+    text = args[0].strip()
+    result = 0
+    decimal = 0
+    decimal_pos = 0
+    negative = text[0] == '-'
+    start = 1 if negative else 0
+
+    for i in range(start, len(text)):
+        if text[i] == '.':
+            decimal_pos = i
+            continue
+        digit = ord(text[i]) - ord('0')
+        if decimal_pos:
+            decimal = decimal * 10 + digit
+        else:
+            result = result * 10 + digit
+
+    final = result + decimal / (10 ** (len(text) - decimal_pos - 1)) if decimal_pos else result
+    return -final if negative else final
+
+
+@builtin('strToStringFunc')
+def _syntax_strToStringFunc(self, *args):
+    return str(args[0])
+
+
+@builtin('strTrimFunc')
+def _syntax_strTrimFunc(self, *args):
+    text = args[0]
+    start = 0
+    end = len(text)
+    while start < end and text[start] in ' \t\n\r':
+        start += 1
+    while end > start and text[end-1] in ' \t\n\r':
+        end -= 1
+    return text[start:end]
+
+
+@builtin('strUpperFunc')
+def _syntax_strUpperFunc(self, *args):
+    result = ''
+    for c in args[0]:
+        if 'a' <= c <= 'z':
+            result += chr(ord(c) - 32)
+        else:
+            result += c
+    return result
+
+
+# strategy
+
+@builtin('strategyFunc')
+def _syntax_strategyFunc(self, *args):
+    return {
+        'name': args[0],
+        'initial_capital': args[1],
+        'currency': args[2],
+        'trades': [],
+        'open_positions': []
+    }
+
+
+@builtin('strategyCancelFunc')
+def _syntax_strategyCancelFunc(self, *args):
+    return {
+        'order_id': args[0],
+        'status': 'cancelled'
+    }
+
+
+@builtin('strategyCancelAllFunc')
+def _syntax_strategyCancelAllFunc(self, *args):
+    return {
+        'status': 'all_cancelled'
+    }
+
+
+@builtin('strategyCloseFunc')
+def _syntax_strategyCloseFunc(self, *args):
+    return {
+        'position_id': args[0],
+        'exit_price': args[1],
+        'exit_time': args[2]
+    }
+
+
+@builtin('strategyCloseAllFunc')
+def _syntax_strategyCloseAllFunc(self, *args):
+    return {
+        'exit_price': args[0],
+        'exit_time': args[1]
+    }
+
+
+@builtin('strategyClosedTradesCommissionFunc')
+def _syntax_strategyClosedTradesCommissionFunc(self, *args):
+    return args[0]['trades'][args[1]]['commission']
+
+
+@builtin('strategyClosedTradesEntryBarIndexFunc')
+def _syntax_strategyClosedTradesEntryBarIndexFunc(self, *args):
+    return args[0]['trades'][args[1]]['entry_bar_index']
+
+
+@builtin('strategyClosedTradesEntryCommentFunc')
+def _syntax_strategyClosedTradesEntryCommentFunc(self, *args):
+    return args[0]['trades'][args[1]]['entry_comment']
+
+
+@builtin('strategyClosedTradesEntryIdFunc')
+def _syntax_strategyClosedTradesEntryIdFunc(self, *args):
+    return args[0]['trades'][args[1]]['entry_id']
+
+
+@builtin('strategyClosedTradesEntryPriceFunc')
+def _syntax_strategyClosedTradesEntryPriceFunc(self, *args):
+    return args[0]['trades'][args[1]]['entry_price']
+
+
+@builtin('strategyClosedTradesEntryTimeFunc')
+def _syntax_strategyClosedTradesEntryTimeFunc(self, *args):
+    return args[0]['trades'][args[1]]['entry_time']
+
+
+@builtin('strategyClosedTradesExitBarIndexFunc')
+def _syntax_strategyClosedTradesExitBarIndexFunc(self, *args):
+    return args[0]['trades'][args[1]]['exit_bar_index']
+
+
+@builtin('strategyClosedTradesExitCommentFunc')
+def _syntax_strategyClosedTradesExitCommentFunc(self, *args):
+    return args[0]['trades'][args[1]]['exit_comment']
+
+
+@builtin('strategyClosedTradesExitIdFunc')
+def _syntax_strategyClosedTradesExitIdFunc(self, *args):
+    return args[0]['trades'][args[1]]['exit_id']
+
+
+@builtin('strategyClosedTradesExitPriceFunc')
+def _syntax_strategyClosedTradesExitPriceFunc(self, *args):
+    return args[0]['trades'][args[1]]['exit_price']
+
+
+@builtin('strategyClosedTradesExitTimeFunc')
+def _syntax_strategyClosedTradesExitTimeFunc(self, *args):
+    return args[0]['trades'][args[1]]['exit_time']
+
+
+@builtin('strategyClosedTradesMaxDrawdownFunc')
+def _syntax_strategyClosedTradesMaxDrawdownFunc(self, *args):
+    return args[0]['trades'][args[1]]['max_drawdown']
+
+
+@builtin('strategyClosedTradesMaxDrawdownPercentFunc')
+def _syntax_strategyClosedTradesMaxDrawdownPercentFunc(self, *args):
+    trade = args[0]['trades'][args[1]]
+    return (trade['max_drawdown'] / trade['entry_price']) * 100
+
+
+@builtin('strategyClosedTradesMaxRunupFunc')
+def _syntax_strategyClosedTradesMaxRunupFunc(self, *args):
+    return args[0]['trades'][args[1]]['max_runup']
+
+
+@builtin('strategyClosedTradesMaxRunupPercentFunc')
+def _syntax_strategyClosedTradesMaxRunupPercentFunc(self, *args):
+    trade = args[0]['trades'][args[1]]
+    return (trade['max_runup'] / trade['entry_price']) * 100
+
+
+@builtin('strategyClosedTradesProfitFunc')
+def _syntax_strategyClosedTradesProfitFunc(self, *args):
+    trade = args[0]['trades'][args[1]]
+    return (trade['exit_price'] - trade['entry_price']) * trade['size']
+
+
+@builtin('strategyClosedTradesProfitPercentFunc')
+def _syntax_strategyClosedTradesProfitPercentFunc(self, *args):
+    trade = args[0]['trades'][args[1]]
+    return ((trade['exit_price'] - trade['entry_price']) / trade['entry_price']) * 100
+
+
+@builtin('strategyClosedTradesSizeFunc')
+def _syntax_strategyClosedTradesSizeFunc(self, *args):
+    return args[0]['trades'][args[1]]['size']
+
+
+@builtin('strategyConvertToAccountFunc')
+def _syntax_strategyConvertToAccountFunc(self, *args):
+    return args[0] * args[1]  # value * exchange_rate
+
+
+@builtin('strategyConvertToSymbolFunc')
+def _syntax_strategyConvertToSymbolFunc(self, *args):
+    return args[0] / args[1]  # value / exchange_rate
+
+
+@builtin('strategyDefaultEntryQtyFunc')
+def _syntax_strategyDefaultEntryQtyFunc(self, *args):
+    return {
+        'quantity': args[0],
+        'status': 'set'
+    }
+
+
+@builtin('strategyEntryFunc')
+def _syntax_strategyEntryFunc(self, *args):
+    return {
+        'direction': args[0],
+        'size': args[1],
+        'price': args[2],
+        'comment': args[3]
+    }
+
+
+@builtin('strategyExitFunc')
+def _syntax_strategyExitFunc(self, *args):
+    return {
+        'from_entry': args[0],
+        'size': args[1],
+        'price': args[2],
+        'comment': args[3]
+    }
+
+
+@builtin('strategyOpenTradesCommissionFunc')
+def _syntax_strategyOpenTradesCommissionFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['commission']
+
+
+@builtin('strategyOpenTradesEntryBarIndexFunc')
+def _syntax_strategyOpenTradesEntryBarIndexFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['entry_bar_index']
+
+
+@builtin('strategyOpenTradesEntryCommentFunc')
+def _syntax_strategyOpenTradesEntryCommentFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['entry_comment']
+
+
+@builtin('strategyOpenTradesEntryIdFunc')
+def _syntax_strategyOpenTradesEntryIdFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['entry_id']
+
+
+@builtin('strategyOpenTradesEntryPriceFunc')
+def _syntax_strategyOpenTradesEntryPriceFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['entry_price']
+
+
+@builtin('strategyOpenTradesEntryTimeFunc')
+def _syntax_strategyOpenTradesEntryTimeFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['entry_time']
+
+
+@builtin('strategyOpenTradesMaxDrawdownFunc')
+def _syntax_strategyOpenTradesMaxDrawdownFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['max_drawdown']
+
+
+@builtin('strategyOpenTradesMaxDrawdownPercentFunc')
+def _syntax_strategyOpenTradesMaxDrawdownPercentFunc(self, *args):
+    pos = args[0]['open_positions'][args[1]]
+    return (pos['max_drawdown'] / pos['entry_price']) * 100
+
+
+@builtin('strategyOpenTradesMaxRunupFunc')
+def _syntax_strategyOpenTradesMaxRunupFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['max_runup']
+
+
+@builtin('strategyOpenTradesMaxRunupPercentFunc')
+def _syntax_strategyOpenTradesMaxRunupPercentFunc(self, *args):
+    pos = args[0]['open_positions'][args[1]]
+    return (pos['max_runup'] / pos['entry_price']) * 100
+
+
+@builtin('strategyOpenTradesProfitFunc')
+def _syntax_strategyOpenTradesProfitFunc(self, *args):
+    pos = args[0]['open_positions'][args[1]]
+    current_price = args[2]
+    return (current_price - pos['entry_price']) * pos['size']
+
+
+@builtin('strategyOpenTradesProfitPercentFunc')
+def _syntax_strategyOpenTradesProfitPercentFunc(self, *args):
+    pos = args[0]['open_positions'][args[1]]
+    current_price = args[2]
+    return ((current_price - pos['entry_price']) / pos['entry_price']) * 100
+
+
+@builtin('strategyOpenTradesSizeFunc')
+def _syntax_strategyOpenTradesSizeFunc(self, *args):
+    return args[0]['open_positions'][args[1]]['size']
+
+
+@builtin('strategyOrderFunc')
+def _syntax_strategyOrderFunc(self, *args):
+    return {
+        'type': args[0],
+        'direction': args[1],
+        'size': args[2],
+        'price': args[3],
+        'comment': args[4]
+    }
+
+
+@builtin('strategyRiskAllowEntryInFunc')
+def _syntax_strategyRiskAllowEntryInFunc(self, *args):
+    return args[0] <= args[1]  # current_risk <= max_risk
+
+
+@builtin('strategyRiskMaxConsLossDaysFunc')
+def _syntax_strategyRiskMaxConsLossDaysFunc(self, *args):
+    return args[0] <= args[1]  # consecutive_loss_days <= max_days
+
+
+@builtin('strategyRiskMaxDrawdownFunc')
+def _syntax_strategyRiskMaxDrawdownFunc(self, *args):
+    return args[0] <= args[1]  # current_drawdown <= max_drawdown
+
+
+@builtin('strategyRiskMaxIntradayFilledOrdersFunc')
+def _syntax_strategyRiskMaxIntradayFilledOrdersFunc(self, *args):
+    return args[0] <= args[1]  # filled_orders <= max_orders
+
+
+@builtin('strategyRiskMaxIntradayLossFunc')
+def _syntax_strategyRiskMaxIntradayLossFunc(self, *args):
+    return args[0] <= args[1]  # intraday_loss <= max_loss
+
+
+@builtin('strategyRiskMaxPositionSizeFunc')
+def _syntax_strategyRiskMaxPositionSizeFunc(self, *args):
+    return args[0] <= args[1]  # position_size <= max_size
+
+
+# weird functions
+
+@builtin('symInfoPrefixFunc')
+def _syntax_symInfoPrefixFunc(self, *args):
+    return args[0].split(':')[0] if ':' in args[0] else ''
+
+
+@builtin('symInfoTickerFunc')
+def _syntax_symInfoTickerFunc(self, *args):
+    return args[0].split(':')[1] if ':' in args[0] else args[0]
+
+
+@builtin('timeFunc')
+def _syntax_timeFunc(self, *args):
+    return args[0].timestamp()
+
+
+@builtin('timeCloseFunc')
+def _syntax_timeCloseFunc(self, *args):
+    return args[0].replace(hour=16, minute=0, second=0, microsecond=0).timestamp()
+
+
+@builtin('timeframeChangeFunc')
+def _syntax_timeframeChangeFunc(self, *args):
+    return {
+        'original': args[0],
+        'new': args[1],
+        'adjustment': args[2]
+    }
+
+
+@builtin('timeframeFromSecondsFunc')
+def _syntax_timeframeFromSecondsFunc(self, *args):
+    seconds = args[0]
+    if seconds < 60:
+        return f"{seconds}S"
+    elif seconds < 3600:
+        return f"{seconds//60}M"
+    elif seconds < 86400:
+        return f"{seconds//3600}H"
+    else:
+        return f"{seconds//86400}D"
+
+
+@builtin('timeframeInSecondsFunc')
+def _syntax_timeframeInSecondsFunc(self, *args):
+    timeframe = args[0].upper()
+    multiplier = int(''.join(filter(str.isdigit, timeframe)))
+    unit = ''.join(filter(str.isalpha, timeframe))
+
+    if unit == 'S':
+        return multiplier
+    elif unit == 'M':
+        return multiplier * 60
+    elif unit == 'H':
+        return multiplier * 3600
+    elif unit == 'D':
+        return multiplier * 86400
+
+
+@builtin('timestampFunc')
+def _syntax_timestampFunc(self, *args):
+    return args[0].timestamp()
+
+
+@builtin('weekOfYearFunc')
+def _syntax_weekOfYearFunc(self, *args):
+    return args[0].isocalendar()[1]
+
+
+@builtin('yearFunc')
+def _syntax_yearFunc(self, *args):
+    return args[0].year
+
+
+@builtin('show')
+def _syntax_show(self, *args):
+    return {
+        'type': 'plot',
+        'series': args[0],
+        'title': args[1] if len(args) > 1 else '',
+        'color': args[2] if len(args) > 2 else '#000000',
+        'linewidth': args[3] if len(args) > 3 else 1,
+        'style': args[4] if len(args) > 4 else 'line'
+    }
+
+
+@builtin('showshape')
+def _syntax_showshape(self, *args):
+    return {
+        'type': 'shape',
+        'location': args[0],
+        'shape': args[1],
+        'color': args[2] if len(args) > 2 else '#000000',
+        'size': args[3] if len(args) > 3 else 'normal',
+        'text': args[4] if len(args) > 4 else ''
+    }
+
+
+@builtin('showcond')
+def _syntax_showcond(self, *args):
+    return {
+        'type': 'plot_condition',
+        'condition': args[0],
+        'title': args[1] if len(args) > 1 else '',
+        'color': args[2] if len(args) > 2 else '#000000',
+        'linewidth': args[3] if len(args) > 3 else 1,
+        'style': args[4] if len(args) > 4 else 'line'
+    }
+
+
+@builtin('solid')
+def _syntax_solid(self, *args):
+    return {
+        'line_style': 'solid',
+        'pattern': []
+    }
+
+
+@builtin('dotted')
+def _syntax_dotted(self, *args):
+    return {
+        'line_style': 'dotted',
+        'pattern': [1, 1]
+    }
+
+
+@builtin('dashed')
+def _syntax_dashed(self, *args):
+    return {
+        'line_style': 'dashed',
+        'pattern': [5, 5]
+    }
+
+
+@builtin('fontFamilyDefault')
+def _syntax_fontFamilyDefault(self, *args):
+    return {
+        'font': 'Arial',
+        'type': 'default'
+    }
+
+
+@builtin('fontFamilyMonospace')
+def _syntax_fontFamilyMonospace(self, *args):
+    return {
+        'font': 'Courier New',
+        'type': 'monospace'
+    }
+
+
+@builtin('extendBoth')
+def _syntax_extendBoth(self, *args):
+    return {
+        'extend': 'both',
+        'plot_range': {'start': -999999, 'end': 999999},
+        'visibility': {'past': True, 'future': True}
+    }
+
+
+@builtin('extendLeft')
+def _syntax_extendLeft(self, *args):
+    return {
+        'extend': 'left',
+        'plot_range': {'start': -999999, 'end': 0},
+        'visibility': {'past': True, 'future': False}
+    }
+
+
+@builtin('extendNone')
+def _syntax_extendNone(self, *args):
+    return {
+        'extend': 'none',
+        'plot_range': {'start': 0, 'end': 0},
+        'visibility': {'past': False, 'future': False}
+    }
+
+
+@builtin('extendRight')
+def _syntax_extendRight(self, *args):
+    return {
+        'extend': 'right',
+        'plot_range': {'start': 0, 'end': 999999},
+        'visibility': {'past': False, 'future': True}
+    }
+
+
+@builtin('hlineStyleDashed')
+def _syntax_hlineStyleDashed(self, *args):
+    return {
+        'style': 'dashed',
+        'pattern': [5, 5],
+        'type': 'horizontal'
+    }
+
+
+@builtin('hlineStyleDotted')
+def _syntax_hlineStyleDotted(self, *args):
+    return {
+        'style': 'dotted',
+        'pattern': [1, 1],
+        'type': 'horizontal'
+    }
+
+
+@builtin('hlineStyleSolid')
+def _syntax_hlineStyleSolid(self, *args):
+    return {
+        'style': 'solid',
+        'pattern': [],
+        'type': 'horizontal'
+    }
+
+
+@builtin('dayOfMonth')
+def _syntax_dayOfMonth(self, *args):
+    timestamp = args[0]
+    days_since_epoch = timestamp // 86400
+    year = 1970 + (days_since_epoch // 365.25)
+    day_of_year = days_since_epoch % 365.25
+    month_days = [31, 28 + (year % 4 == 0), 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    month = 0
+    while day_of_year > month_days[month]:
+        day_of_year -= month_days[month]
+        month += 1
+    return int(day_of_year)
+
+
+@builtin('dayOfWeek')
+def _syntax_dayOfWeek(self, *args):
+    timestamp = args[0]
+    days_since_epoch = timestamp // 86400
+    return int((days_since_epoch + 4) % 7)
+
+
+@builtin('hour')
+def _syntax_hour(self, *args):
+    timestamp = args[0]
+    return int((timestamp % 86400) // 3600)
+
+
+@builtin('minute')
+def _syntax_minute(self, *args):
+    timestamp = args[0]
+    return int((timestamp % 3600) // 60)
+
+
+@builtin('month')
+def _syntax_month(self, *args):
+    timestamp = args[0]
+    days_since_epoch = timestamp // 86400
+    year = 1970 + (days_since_epoch // 365.25)
+    day_of_year = days_since_epoch % 365.25
+    month_days = [31, 28 + (year % 4 == 0), 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    month = 0
+    while day_of_year > month_days[month]:
+        day_of_year -= month_days[month]
+        month += 1
+    return month + 1
+
+
+@builtin('second')
+def _syntax_second(self, *args):
+    timestamp = args[0]
+    return int(timestamp % 60)
+
+
+@builtin('time')
+def _syntax_time(self, *args):
+    current_bar = args[0]
+    return current_bar['timestamp']
+
+
+@builtin('timeClose')
+def _syntax_timeClose(self, *args):
+    current_bar = args[0]
+    return current_bar['timestamp'] + current_bar['duration']
+
+
+@builtin('timeTradingDay')
+def _syntax_timeTradingDay(self, *args):
+    current_bar = args[0]
+    day_start = current_bar['timestamp'] - (current_bar['timestamp'] % 86400)
+    market_open = day_start + current_bar['session']['market_open_offset']
+    return market_open
+
+
+@builtin('timeNow')
+def _syntax_timeNow(self, *args):
+    return int(time.time())
+
+
+@builtin('weekOfYear')
+def _syntax_weekOfYear(self, *args):
+    timestamp = args[0]
+    days_since_epoch = timestamp // 86400
+    year = 1970 + (days_since_epoch // 365.25)
+    day_of_year = days_since_epoch % 365.25
+    return int((day_of_year + 10) // 7)
+
+
+@builtin('year')
+def _syntax_year(self, *args):
+    timestamp = args[0]
+    days_since_epoch = timestamp // 86400
+    return int(1970 + (days_since_epoch // 365.25))
+
+
+@builtin('sessionIsFirstBar')
+def _syntax_sessionIsFirstBar(self, *args):
+    bar_data = args[0]
+    session_start = bar_data['session_start']
+    current_time = bar_data['timestamp']
+    return current_time == session_start
+
+
+@builtin('sessionIsFirstBarRegular')
+def _syntax_sessionIsFirstBarRegular(self, *args):
+    bar_data = args[0]
+    regular_session_start = bar_data['regular_session_start']
+    current_time = bar_data['timestamp']
+    return current_time == regular_session_start
+
+
+@builtin('sessionIsLastBar')
+def _syntax_sessionIsLastBar(self, *args):
+    bar_data = args[0]
+    session_end = bar_data['session_end']
+    current_time = bar_data['timestamp']
+    bar_duration = bar_data['duration']
+    return current_time + bar_duration == session_end
+
+
+@builtin('sessionIsLastBarRegular')
+def _syntax_sessionIsLastBarRegular(self, *args):
+    bar_data = args[0]
+    regular_session_end = bar_data['regular_session_end']
+    current_time = bar_data['timestamp']
+    bar_duration = bar_data['duration']
+    return current_time + bar_duration == regular_session_end
+
+
+@builtin('sessionIsMarket')
+def _syntax_sessionIsMarket(self, *args):
+    bar_data = args[0]
+    current_time = bar_data['timestamp']
+    market_start = bar_data['market_session_start']
+    market_end = bar_data['market_session_end']
+    return market_start <= current_time < market_end
+
+
+@builtin('sessionIsPostMarket')
+def _syntax_sessionIsPostMarket(self, *args):
+    bar_data = args[0]
+    current_time = bar_data['timestamp']
+    market_end = bar_data['market_session_end']
+    session_end = bar_data['session_end']
+    return market_end <= current_time < session_end
+
+
+@builtin('sessionIsPreMarket')
+def _syntax_sessionIsPreMarket(self, *args):
+    bar_data = args[0]
+    current_time = bar_data['timestamp']
+    session_start = bar_data['session_start']
+    market_start = bar_data['market_session_start']
+    return session_start <= current_time < market_start
+
+
+@builtin('boxAll')
+def _syntax_boxAll(self, *args):
+    chart_data = args[0]
+    boxes = []
+    for box in chart_data['boxes']:
+        boxes.append({
+            'id': box['id'],
+            'left': box['left'],
+            'top': box['top'],
+            'right': box['right'],
+            'bottom': box['bottom'],
+            'border_color': box['border_color'],
+            'background_color': box['background_color'],
+            'text': box['text']
+        })
+    return boxes
+
+
+@builtin('chartBgCol')
+def _syntax_chartBgCol(self, *args):
+    chart_data = args[0]
+    return chart_data['background_color']
+
+
+@builtin('chartFgCol')
+def _syntax_chartFgCol(self, *args):
+    chart_data = args[0]
+    return chart_data['foreground_color']
+
+
+@builtin('chartIsHeikinAshi')
+def _syntax_chartIsHeikinAshi(self, *args):
+    chart_data = args[0]
+    return chart_data['chart_type'] == 'heikin_ashi'
+
+
+@builtin('chartIsKagi')
+def _syntax_chartIsKagi(self, *args):
+    chart_data = args[0]
+    return chart_data['chart_type'] == 'kagi'
+
+
+@builtin('chartIsLineBreak')
+def _syntax_chartIsLineBreak(self, *args):
+    chart_data = args[0]
+    return chart_data['chart_type'] == 'line_break'
+
+
+@builtin('chartIsPnf')
+def _syntax_chartIsPnf(self, *args):
+    chart_data = args[0]
+    return chart_data['chart_type'] == 'point_and_figure'
+
+
+@builtin('chartIsRange')
+def _syntax_chartIsRange(self, *args):
+    chart_data = args[0]
+    return chart_data['chart_type'] == 'range'
+
+
+@builtin('chartIsRenko')
+def _syntax_chartIsRenko(self, *args):
+    chart_data = args[0]
+    return chart_data['chart_type'] == 'renko'
+
+
+@builtin('chartIsStandard')
+def _syntax_chartIsStandard(self, *args):
+    chart_data = args[0]
+    return chart_data['chart_type'] == 'standard'
+
+
+@builtin('chartLeftVisibleBarTime')
+def _syntax_chartLeftVisibleBarTime(self, *args):
+    chart_data = args[0]
+    return chart_data['visible_range']['left_bar_time']
+
+
+@builtin('chartRightVisibleBarTime')
+def _syntax_chartRightVisibleBarTime(self, *args):
+    chart_data = args[0]
+    return chart_data['visible_range']['right_bar_time']
+
+
+@builtin('labelAll')
+def _syntax_labelAll(self, *args):
+    chart_data = args[0]
+    labels = []
+    for label in chart_data['labels']:
+        labels.append({
+            'id': label['id'],
+            'x': label['x'],
+            'y': label['y'],
+            'text': label['text'],
+            'color': label['color'],
+            'style': label['style'],
+            'size': label['size']
+        })
+    return labels
+
+
+@builtin('lineAll')
+def _syntax_lineAll(self, *args):
+    chart_data = args[0]
+    lines = []
+    for line in chart_data['lines']:
+        lines.append({
+            'id': line['id'],
+            'x1': line['x1'],
+            'y1': line['y1'],
+            'x2': line['x2'],
+            'y2': line['y2'],
+            'color': line['color'],
+            'width': line['width'],
+            'style': line['style']
+        })
+    return lines
+
+
+@builtin('lineFillAll')
+def _syntax_lineFillAll(self, *args):
+    chart_data = args[0]
+    fills = []
+    for fill in chart_data['line_fills']:
+        fills.append({
+            'id': fill['id'],
+            'line1_id': fill['line1_id'],
+            'line2_id': fill['line2_id'],
+            'color': fill['color'],
+            'transparency': fill['transparency']
+        })
+    return fills
+
+
+@builtin('polylineAll')
+def _syntax_polylineAll(self, *args):
+    chart_data = args[0]
+    polylines = []
+    for polyline in chart_data['polylines']:
+        polylines.append({
+            'id': polyline['id'],
+            'points': polyline['points'],
+            'color': polyline['color'],
+            'width': polyline['width'],
+            'style': polyline['style']
+        })
+    return polylines
+
+
+@builtin('tableAll')
+def _syntax_tableAll(self, *args):
+    chart_data = args[0]
+    tables = []
+    for table in chart_data['tables']:
+        tables.append({
+            'id': table['id'],
+            'position': table['position'],
+            'rows': table['rows'],
+            'columns': table['columns'],
+            'cells': table['cells'],
+            'colors': table['colors'],
+            'borders': table['borders']
+        })
+    return tables
+
+
+@builtin('andOp')
+def _syntax_andOp(self, *args):
+    left_operand = args[0]
+    right_operand = args[1]
+    return bool(left_operand and right_operand)
+
+
+@builtin('enumType')
+def _syntax_enumType(self, *args):
+    enum_name = args[0]
+    enum_values = args[1]
+    enum_dict = {}
+    for i, value in enumerate(enum_values):
+        enum_dict[value] = i
+    return {
+        'name': enum_name,
+        'values': enum_dict,
+        'type': 'enum'
+    }
+
+
+@builtin('exportFunc')
+def _syntax_exportFunc(self, *args):
+    export_name = args[0]
+    export_value = args[1]
+    return {
+        'name': export_name,
+        'value': export_value,
+        'type': 'export'
+    }
+
+
+@builtin('forLoop')
+def _syntax_forLoop(self, *args):
+    init_value = args[0]
+    condition = args[1]
+    increment = args[2]
+    body = args[3]
+    results = []
+    current = init_value
+
+    while condition(current):
+        results.append(body(current))
+        current = increment(current)
+    return results
+
+
+@builtin('forInLoop')
+def _syntax_forInLoop(self, *args):
+    iterable = args[0]
+    body = args[1]
+    results = []
+
+    for item in iterable:
+        results.append(body(item))
+    return results
+
+
+@builtin('ifCond')
+def _syntax_ifCond(self, *args):
+    condition = args[0]
+    true_branch = args[1]
+    false_branch = args[2] if len(args) > 2 else None
+
+    if condition:
+        return true_branch
+    elif false_branch is not None:
+        return false_branch
+    return None
+
+
+@builtin('importFunc')
+def _syntax_importFunc(self, *args):
+    module_path = args[0]
+    import_options = args[1] if len(args) > 1 else {}
+    return {
+        'path': module_path,
+        'options': import_options,
+        'type': 'import'
+    }
+
+
+@builtin('methodFunc')
+def _syntax_methodFunc(self, *args):
+    method_name = args[0]
+    parameters = args[1]
+    body = args[2]
+    return {
+        'name': method_name,
+        'parameters': parameters,
+        'body': body,
+        'type': 'method'
+    }
+
+
+@builtin('notOp')
+def _syntax_notOp(self, *args):
+    operand = args[0]
+    return not bool(operand)
+
+
+@builtin('orOp')
+def _syntax_orOp(self, *args):
+    left_operand = args[0]
+    right_operand = args[1]
+    return bool(left_operand or right_operand)
+
+
+@builtin('switchCase')
+def _syntax_switchCase(self, *args):
+    value = args[0]
+    cases = args[1]
+    default = args[2] if len(args) > 2 else None
+
+    for case in cases:
+        if case['value'] == value:
+            return case['body']
+    return default
+
+
+@builtin('typeDef')
+def _syntax_typeDef(self, *args):
+    type_name = args[0]
+    type_definition = args[1]
+    return {
+        'name': type_name,
+        'definition': type_definition,
+        'type': 'typedef'
+    }
+
+
+@builtin('let')
+def _syntax_let(self, *args):
+    variable_name = args[0]
+    initial_value = args[1]
+    return {
+        'name': variable_name,
+        'value': initial_value,
+        'type': 'variable',
+        'mutable': True
+    }
+
+
+@builtin('letip')
+def _syntax_letip(self, *args):
+    variable_name = args[0]
+    initial_value = args[1]
+    return {
+        'name': variable_name,
+        'value': initial_value,
+        'type': 'variable',
+        'mutable': False
+    }
+
+
+@builtin('whileLoop')
+def _syntax_whileLoop(self, *args):
+    condition = args[0]
+    body = args[1]
+    results = []
+
+    while condition():
+        results.append(body())
+    return results
+
+
+# market data
+
+@builtin('open')
+def _syntax_open(self, *args):
+    return args[0][0]
+
+
+@builtin('high')
+def _syntax_high(self, *args):
+    return args[0][1]
+
+
+@builtin('low')
+def _syntax_low(self, *args):
+    return args[0][2]
+
+
+@builtin('close')
+def _syntax_close(self, *args):
+    return args[0][3]
+
+
+@builtin('volume')
+def _syntax_volume(self, *args):
+    return args[0][4]
+
+
+@builtin('hl2')
+def _syntax_hl2(self, *args):
+    return (args[0][1] + args[0][2]) / 2
+
+
+@builtin('hlc3')
+def _syntax_hlc3(self, *args):
+    return (args[0][1] + args[0][2] + args[0][3]) / 3
+
+
+@builtin('hlcc4')
+def _syntax_hlcc4(self, *args):
+    return (args[0][1] + args[0][2] + args[0][3] + args[0][3]) / 4
+
+
+@builtin('ohlc4')
+def _syntax_ohlc4(self, *args):
+    return (args[0][0] + args[0][1] + args[0][2] + args[0][3]) / 4
+
+
+@builtin('symInfoMinMove')
+def _syntax_symInfoMinMove(self, *args):
+    return {
+        'type': 'numeric',
+        'value': args[0]['instrument_details']['minimum_price_movement'],
+        'decimals': args[0]['instrument_details']['price_decimals']
+    }
+
+
+@builtin('symInfoMinTick')
+def _syntax_symInfoMinTick(self, *args):
+    return {
+        'type': 'numeric',
+        'value': args[0]['instrument_details']['minimum_tick_size'],
+        'decimals': args[0]['instrument_details']['price_decimals']
+    }
+
+
+@builtin('symInfoPointValue')
+def _syntax_symInfoPointValue(self, *args):
+    return {
+        'type': 'numeric',
+        'value': args[0]['instrument_details']['contract_size'],
+        'currency': args[0]['instrument_details']['currency']
+    }
+
+
+@builtin('symInfoPrefix')
+def _syntax_symInfoPrefix(self, *args):
+    return {
+        'type': 'string',
+        'exchange': args[0]['exchange']['code'],
+        'market': args[0]['market']['code'],
+        'value': args[0]['exchange']['code'] + ':' + args[0]['market']['code']
+    }
+
+
+@builtin('symInfoPriceScale')
+def _syntax_symInfoPriceScale(self, *args):
+    return {
+        'type': 'numeric',
+        'value': 10 ** args[0]['instrument_details']['price_decimals'],
+        'decimals': args[0]['instrument_details']['price_decimals']
+    }
+
+
+@builtin('symInfoRoot')
+def _syntax_symInfoRoot(self, *args):
+    return {
+        'type': 'string',
+        'value': args[0]['instrument_details']['root_symbol'],
+        'description': args[0]['instrument_details']['description']
+    }
+
+
+@builtin('symInfoSector')
+def _syntax_symInfoSector(self, *args):
+    return {
+        'type': 'string',
+        'sector': args[0]['company']['sector'],
+        'industry': args[0]['company']['industry'],
+        'category': args[0]['company']['category']
+    }
+
+
+@builtin('symInfoSession')
+def _syntax_symInfoSession(self, *args):
+    return {
+        'type': 'object',
+        'regular': {
+            'start': args[0]['session']['regular']['start'],
+            'end': args[0]['session']['regular']['end'],
+            'timezone': args[0]['session']['timezone']
+        },
+        'extended': {
+            'pre_market': {
+                'start': args[0]['session']['pre_market']['start'],
+                'end': args[0]['session']['pre_market']['end']
+            },
+            'post_market': {
+                'start': args[0]['session']['post_market']['start'],
+                'end': args[0]['session']['post_market']['end']
+            }
+        }
+    }
+
+
+@builtin('symInfoShareholders')
+def _syntax_symInfoShareholders(self, *args):
+    return {
+        'type': 'object',
+        'institutional': {
+            'count': args[0]['shareholders']['institutional']['count'],
+            'ownership_percent': args[0]['shareholders']['institutional']['ownership_percent']
+        },
+        'individual': {
+            'count': args[0]['shareholders']['individual']['count'],
+            'ownership_percent': args[0]['shareholders']['individual']['ownership_percent']
+        }
+    }
+
+
+@builtin('symInfoSharesOutstandingFloat')
+def _syntax_symInfoSharesOutstandingFloat(self, *args):
+    return {
+        'type': 'numeric',
+        'value': args[0]['shares']['float'],
+        'last_update': args[0]['shares']['float_date']
+    }
+
+
+@builtin('symInfoSharesOutstandingTotal')
+def _syntax_symInfoSharesOutstandingTotal(self, *args):
+    return {
+        'type': 'numeric',
+        'value': args[0]['shares']['total'],
+        'last_update': args[0]['shares']['total_date']
+    }
+
+
+@builtin('minvalue')
+def _syntax_minvalue(self, *args):
+    return min(args[0])
+
+
+@builtin('maxvalue')
+def _syntax_maxvalue(self, *args):
+    return max(args[0])
+
+
+@builtin('taAccDist')
+def _syntax_taAccDist(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    volume = args[3]
+    mfm = ((close - low) - (high - close)) / (high - low) if high != low else 0
+    return mfm * volume
+
+
+@builtin('taIII')
+def _syntax_taIII(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    volume = args[3]
+    return (2 * close - high - low) / (high - low) * volume if high != low else 0
+
+
+@builtin('taNVI')
+def _syntax_taNVI(self, *args):
+    close = args[0]
+    volume = args[1]
+    if len(close) < 2:
+        return 1000
+    prev_volume = volume[-2]
+    curr_volume = volume[-1]
+    if curr_volume < prev_volume:
+        return (close[-1] - close[-2]) / close[-2] * 1000
+    return 1000
+
+
+@builtin('taOBV')
+def _syntax_taOBV(self, *args):
+    close = args[0]
+    volume = args[1]
+    if len(close) < 2:
+        return 0
+    prev_close = close[-2]
+    curr_close = close[-1]
+    if curr_close > prev_close:
+        return volume[-1]
+    elif curr_close < prev_close:
+        return -volume[-1]
+    return 0
+
+
+@builtin('taPVI')
+def _syntax_taPVI(self, *args):
+    close = args[0]
+    volume = args[1]
+    if len(close) < 2:
+        return 1000
+    prev_volume = volume[-2]
+    curr_volume = volume[-1]
+    if curr_volume > prev_volume:
+        return (close[-1] - close[-2]) / close[-2] * 1000
+    return 1000
+
+
+@builtin('taPVT')
+def _syntax_taPVT(self, *args):
+    close = args[0]
+    volume = args[1]
+    if len(close) < 2:
+        return 0
+    return ((close[-1] - close[-2]) / close[-2]) * volume[-1]
+
+
+@builtin('taTR')
+def _syntax_taTR(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    if len(close) < 2:
+        return high[-1] - low[-1]
+    prev_close = close[-2]
+    return max(high[-1] - low[-1], abs(high[-1] - prev_close), abs(low[-1] - prev_close))
+
+
+@builtin('taVWAP')
+def _syntax_taVWAP(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    volume = args[3]
+    typical_price = (high + low + close) / 3
+    return sum(typical_price * volume) / sum(volume)
+
+
+@builtin('taWAD')
+def _syntax_taWAD(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    if len(close) < 2:
+        return 0
+    prev_close = close[-2]
+    if close[-1] > prev_close:
+        return close[-1] - min(low[-1], prev_close)
+    else:
+        return close[-1] - max(high[-1], prev_close)
+
+
+@builtin('taWVAD')
+def _syntax_taWVAD(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    volume = args[3]
+    if len(close) < 2:
+        return 0
+    prev_close = close[-2]
+    if close[-1] > prev_close:
+        return (close[-1] - min(low[-1], prev_close)) * volume[-1]
+    else:
+        return (close[-1] - max(high[-1], prev_close)) * volume[-1]
+
+
+@builtin('taAlma')
+def _syntax_taAlma(self, *args):
+    data = args[0]
+    window = args[1]
+    offset = args[2]
+    sigma = args[3]
+    if len(data) < window:
+        return float('nan')
+    m = offset * (window - 1)
+    s = window / sigma
+    weights = []
+    norm = 0
+
+    for i in range(window):
+        w = math.exp(-((i - m) * (i - m)) / (2 * s * s))
+        weights.append(w)
+        norm += w
+
+    for i in range(window):
+        weights[i] /= norm
+
+    result = 0
+    for i in range(window):
+        result += data[-i-1] * weights[i]
+    return result
+
+
+@builtin('taAtr')
+def _syntax_taAtr(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    period = args[3]
+    tr_values = []
+
+    for i in range(len(close)):
+        if i == 0:
+            tr = high[i] - low[i]
+        else:
+            tr = max(high[i] - low[i],
+                    abs(high[i] - close[i-1]),
+                    abs(low[i] - close[i-1]))
+        tr_values.append(tr)
+
+    if len(tr_values) < period:
+        return float('nan')
+
+    return sum(tr_values[-period:]) / period
+
+
+@builtin('taBarsSince')
+def _syntax_taBarsSince(self, *args):
+    condition = args[0]
+    count = 0
+    for i in reversed(range(len(condition))):
+        if not condition[i]:
+            count += 1
+        else:
+            break
+    return count
+
+
+@builtin('taBb')
+def _syntax_taBb(self, *args):
+    data = args[0]
+    period = args[1]
+    mult = args[2]
+    if len(data) < period:
+        return float('nan')
+    sma = sum(data[-period:]) / period
+    variance = sum((x - sma) ** 2 for x in data[-period:]) / period
+    std = variance ** 0.5
+    return {
+        'middle': sma,
+        'upper': sma + mult * std,
+        'lower': sma - mult * std
+    }
+
+
+@builtin('taBbw')
+def _syntax_taBbw(self, *args):
+    data = args[0]
+    period = args[1]
+    mult = args[2]
+    if len(data) < period:
+        return float('nan')
+    sma = sum(data[-period:]) / period
+    variance = sum((x - sma) ** 2 for x in data[-period:]) / period
+    std = variance ** 0.5
+    return ((sma + mult * std) - (sma - mult * std)) / sma * 100
+
+
+@builtin('taCci')
+def _syntax_taCci(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    period = args[3]
+    if len(close) < period:
+        return float('nan')
+    tp = [(h + l + c) / 3 for h, l, c in zip(high[-period:], low[-period:], close[-period:])]
+    sma = sum(tp) / period
+    mean_dev = sum(abs(x - sma) for x in tp) / period
+    return (tp[-1] - sma) / (0.015 * mean_dev) if mean_dev != 0 else 0
+
+
+@builtin('taChange')
+def _syntax_taChange(self, *args):
+    data = args[0]
+    if len(data) < 2:
+        return float('nan')
+    return data[-1] - data[-2]
+
+
+@builtin('taCmo')
+def _syntax_taCmo(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period + 1:
+        return float('nan')
+    ups = []
+    downs = []
+    for i in range(1, period + 1):
+        change = data[-i] - data[-i-1]
+        ups.append(max(change, 0))
+        downs.append(max(-change, 0))
+    sum_ups = sum(ups)
+    sum_downs = sum(downs)
+    return 100 * (sum_ups - sum_downs) / (sum_ups + sum_downs) if (sum_ups + sum_downs) != 0 else 0
+
+
+@builtin('taCog')
+def _syntax_taCog(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    numerator = 0
+    denominator = 0
+    for i in range(period):
+        numerator += (i + 1) * data[-i-1]
+        denominator += data[-i-1]
+    return -numerator / denominator if denominator != 0 else 0
+
+
+@builtin('taCorrelation')
+def _syntax_taCorrelation(self, *args):
+    data1 = args[0]
+    data2 = args[1]
+    period = args[2]
+    if len(data1) < period or len(data2) < period:
+        return float('nan')
+    x = data1[-period:]
+    y = data2[-period:]
+    mean_x = sum(x) / period
+    mean_y = sum(y) / period
+    covar = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(period))
+    var_x = sum((val - mean_x) ** 2 for val in x)
+    var_y = sum((val - mean_y) ** 2 for val in y)
+    return covar / ((var_x * var_y) ** 0.5) if var_x != 0 and var_y != 0 else 0
+
+
+@builtin('taCross')
+def _syntax_taCross(self, *args):
+    data1 = args[0]
+    data2 = args[1]
+    if len(data1) < 2 or len(data2) < 2:
+        return False
+    return (data1[-2] <= data2[-2] and data1[-1] > data2[-1]) or (data1[-2] >= data2[-2] and data1[-1] < data2[-1])
+
+
+@builtin('taCrossover')
+def _syntax_taCrossover(self, *args):
+    data1 = args[0]
+    data2 = args[1]
+    if len(data1) < 2 or len(data2) < 2:
+        return False
+    return data1[-2] <= data2[-2] and data1[-1] > data2[-1]
+
+
+@builtin('taCrossunder')
+def _syntax_taCrossunder(self, *args):
+    data1 = args[0]
+    data2 = args[1]
+    if len(data1) < 2 or len(data2) < 2:
+        return False
+    return data1[-2] >= data2[-2] and data1[-1] < data2[-1]
+
+
+@builtin('taCum')
+def _syntax_taCum(self, *args):
+    data = args[0]
+    result = 0
+    for value in data:
+        result += value
+    return result
+
+
+@builtin('taDev')
+def _syntax_taDev(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    mean = sum(data[-period:]) / period
+    return sum(abs(x - mean) for x in data[-period:]) / period
+
+
+@builtin('taDmi')
+def _syntax_taDmi(self, *args):
+    high = args[0]
+    low = args[1]
+    period = args[2]
+    if len(high) < period + 1:
+        return float('nan')
+    tr_list = []
+    plus_dm_list = []
+    minus_dm_list = []
+
+    for i in range(1, len(high)):
+        tr = max(high[i] - low[i],
+                abs(high[i] - low[i-1]),
+                abs(low[i] - high[i-1]))
+        plus_dm = max(high[i] - high[i-1], 0) if high[i] - high[i-1] > low[i-1] - low[i] else 0
+        minus_dm = max(low[i-1] - low[i], 0) if low[i-1] - low[i] > high[i] - high[i-1] else 0
+        tr_list.append(tr)
+        plus_dm_list.append(plus_dm)
+        minus_dm_list.append(minus_dm)
+
+    tr_sum = sum(tr_list[-period:])
+    plus_dm_sum = sum(plus_dm_list[-period:])
+    minus_dm_sum = sum(minus_dm_list[-period:])
+
+    plus_di = 100 * plus_dm_sum / tr_sum if tr_sum != 0 else 0
+    minus_di = 100 * minus_dm_sum / tr_sum if tr_sum != 0 else 0
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di) if (plus_di + minus_di) != 0 else 0
+
+    return {
+        'plus_di': plus_di,
+        'minus_di': minus_di,
+        'dx': dx
+    }
+
+
+@builtin('taEma')
+def _syntax_taEma(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    alpha = 2 / (period + 1)
+    result = data[0]
+    for i in range(1, len(data)):
+        result = alpha * data[i] + (1 - alpha) * result
+    return result
+
+
+@builtin('taFalling')
+def _syntax_taFalling(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return False
+    for i in range(1, period):
+        if data[-i] >= data[-i-1]:
+            return False
+    return True
+
+
+@builtin('taHighest')
+def _syntax_taHighest(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return max(data[-period:])
+
+
+@builtin('taHighestBars')
+def _syntax_taHighestBars(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    highest = max(data[-period:])
+    for i in range(period):
+        if data[-i-1] == highest:
+            return i
+    return 0
+
+
+@builtin('taHma')
+def _syntax_taHma(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+
+    half_period = period // 2
+    sqrt_period = int(period ** 0.5)
+
+    wma1 = []
+    wma2 = []
+    for i in range(len(data) - period + 1):
+        sum1 = sum((j + 1) * data[i + j] for j in range(half_period))
+        div1 = sum(j + 1 for j in range(half_period))
+        wma1.append(sum1 / div1 if div1 != 0 else 0)
+
+        sum2 = sum((j + 1) * data[i + j] for j in range(period))
+        div2 = sum(j + 1 for j in range(period))
+        wma2.append(sum2 / div2 if div2 != 0 else 0)
+
+    raw = [2 * wma1[i] - wma2[i] for i in range(len(wma1))]
+    if len(raw) < sqrt_period:
+        return float('nan')
+
+    final_sum = sum((j + 1) * raw[-(sqrt_period-j)] for j in range(sqrt_period))
+    final_div = sum(j + 1 for j in range(sqrt_period))
+
+    return final_sum / final_div if final_div != 0 else 0
+
+
+@builtin('taKc')
+def _syntax_taKc(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    period = args[3]
+    mult = args[4]
+    if len(close) < period:
+        return float('nan')
+
+    typical_prices = [(h + l + c) / 3 for h, l, c in zip(high[-period:], low[-period:], close[-period:])]
+    sma = sum(typical_prices) / period
+
+    mean_dev = sum(abs(tp - sma) for tp in typical_prices) / period
+
+    return {
+        'middle': sma,
+        'upper': sma + mult * mean_dev,
+        'lower': sma - mult * mean_dev
+    }
+
+
+@builtin('taKcw')
+def _syntax_taKcw(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    period = args[3]
+    mult = args[4]
+    if len(close) < period:
+        return float('nan')
+
+    typical_prices = [(h + l + c) / 3 for h, l, c in zip(high[-period:], low[-period:], close[-period:])]
+    sma = sum(typical_prices) / period
+    mean_dev = sum(abs(tp - sma) for tp in typical_prices) / period
+
+    return (2 * mult * mean_dev) / sma * 100
+
+
+@builtin('taLinReg')
+def _syntax_taLinReg(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+
+    x = list(range(period))
+    y = data[-period:]
+    sum_x = sum(x)
+    sum_y = sum(y)
+    sum_xy = sum(x[i] * y[i] for i in range(period))
+    sum_xx = sum(x[i] * x[i] for i in range(period))
+
+    slope = (period * sum_xy - sum_x * sum_y) / (period * sum_xx - sum_x * sum_x)
+    intercept = (sum_y - slope * sum_x) / period
+
+    return slope * (period - 1) + intercept
+
+
+@builtin('taLowest')
+def _syntax_taLowest(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return min(data[-period:])
+
+
+@builtin('taLowestBars')
+def _syntax_taLowestBars(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    lowest = min(data[-period:])
+    for i in range(period):
+        if data[-i-1] == lowest:
+            return i
+    return 0
+
+
+@builtin('taMacd')
+def _syntax_taMacd(self, *args):
+    data = args[0]
+    fast_length = args[1]
+    slow_length = args[2]
+    signal_length = args[3]
+    if len(data) < max(fast_length, slow_length, signal_length):
+        return float('nan')
+
+    alpha_fast = 2 / (fast_length + 1)
+    alpha_slow = 2 / (slow_length + 1)
+    alpha_signal = 2 / (signal_length + 1)
+
+    ema_fast = data[0]
+    ema_slow = data[0]
+    for price in data[1:]:
+        ema_fast = alpha_fast * price + (1 - alpha_fast) * ema_fast
+        ema_slow = alpha_slow * price + (1 - alpha_slow) * ema_slow
+
+    macd_line = ema_fast - ema_slow
+    signal_line = alpha_signal * macd_line + (1 - alpha_signal) * (ema_fast - ema_slow)
+    histogram = macd_line - signal_line
+
+    return {
+        'macd': macd_line,
+        'signal': signal_line,
+        'histogram': histogram
+    }
+
+
+@builtin('taMax')
+def _syntax_taMax(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return max(data[-period:])
+
+
+@builtin('taMedian')
+def _syntax_taMedian(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    sorted_data = sorted(data[-period:])
+    mid = period // 2
+    return sorted_data[mid] if period % 2 else (sorted_data[mid-1] + sorted_data[mid]) / 2
+
+
+@builtin('taMfi')
+def _syntax_taMfi(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    volume = args[3]
+    period = args[4]
+    if len(close) < period + 1:
+        return float('nan')
+
+    typical_prices = [(h + l + c) / 3 for h, l, c in zip(high, low, close)]
+    money_flows = [tp * v for tp, v in zip(typical_prices, volume)]
+
+    pos_flows = []
+    neg_flows = []
+    for i in range(1, len(typical_prices)):
+        if typical_prices[i] > typical_prices[i-1]:
+            pos_flows.append(money_flows[i])
+            neg_flows.append(0)
+        else:
+            pos_flows.append(0)
+            neg_flows.append(money_flows[i])
+
+    pos_sum = sum(pos_flows[-period:])
+    neg_sum = sum(neg_flows[-period:])
+
+    return 100 * pos_sum / (pos_sum + neg_sum) if (pos_sum + neg_sum) != 0 else 50
+
+
+@builtin('taMin')
+def _syntax_taMin(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return min(data[-period:])
+
+
+@builtin('taMode')
+def _syntax_taMode(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    values = data[-period:]
+    counts = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    max_count = max(counts.values())
+    modes = [k for k, v in counts.items() if v == max_count]
+    return modes[0]
+
+
+@builtin('taMom')
+def _syntax_taMom(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return data[-1] - data[-period]
+
+
+@builtin('taPercentile')
+def _syntax_taPercentile(self, *args):
+    data = args[0]
+    period = args[1]
+    percentage = args[2]
+    if len(data) < period:
+        return float('nan')
+    sorted_data = sorted(data[-period:])
+    index = (period - 1) * percentage / 100
+    lower_idx = int(index)
+    fraction = index - lower_idx
+    if lower_idx + 1 >= period:
+        return sorted_data[-1]
+    return sorted_data[lower_idx] + fraction * (sorted_data[lower_idx + 1] - sorted_data[lower_idx])
+
+
+@builtin('taPercentRank')
+def _syntax_taPercentRank(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    current = data[-1]
+    window = data[-period:]
+    count = sum(1 for x in window if x < current)
+    return 100 * count / (period - 1)
+
+
+@builtin('taPivotHigh')
+def _syntax_taPivotHigh(self, *args):
+    data = args[0]
+    left_bars = args[1]
+    right_bars = args[2]
+    if len(data) < left_bars + right_bars + 1:
+        return float('nan')
+    center_idx = -right_bars - 1
+    value = data[center_idx]
+    for i in range(-right_bars - left_bars - 1, -right_bars):
+        if data[i] > value:
+            return float('nan')
+    for i in range(-right_bars, 0):
+        if data[i] >= value:
+            return float('nan')
+    return value
+
+
+@builtin('taPivotLow')
+def _syntax_taPivotLow(self, *args):
+    data = args[0]
+    left_bars = args[1]
+    right_bars = args[2]
+    if len(data) < left_bars + right_bars + 1:
+        return float('nan')
+    center_idx = -right_bars - 1
+    value = data[center_idx]
+    for i in range(-right_bars - left_bars - 1, -right_bars):
+        if data[i] < value:
+            return float('nan')
+    for i in range(-right_bars, 0):
+        if data[i] <= value:
+            return float('nan')
+    return value
+
+
+@builtin('taRange')
+def _syntax_taRange(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return max(data[-period:]) - min(data[-period:])
+
+
+@builtin('taRising')
+def _syntax_taRising(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return False
+    for i in range(1, period):
+        if data[-i] <= data[-i-1]:
+            return False
+    return True
+
+
+@builtin('taRma')
+def _syntax_taRma(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    alpha = 1 / period
+    result = sum(data[:period]) / period
+    for i in range(period, len(data)):
+        result = alpha * data[i] + (1 - alpha) * result
+    return result
+
+
+@builtin('taRoc')
+def _syntax_taRoc(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return ((data[-1] - data[-period]) / data[-period]) * 100 if data[-period] != 0 else float('nan')
+
+
+@builtin('taRsi')
+def _syntax_taRsi(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period + 1:
+        return float('nan')
+    gains = []
+    losses = []
+    for i in range(1, len(data)):
+        change = data[i] - data[i-1]
+        gains.append(max(change, 0))
+        losses.append(max(-change, 0))
+    avg_gain = sum(gains[-period:]) / period
+    avg_loss = sum(losses[-period:]) / period
+    if avg_loss == 0:
+        return 100
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+@builtin('taSar')
+def _syntax_taSar(self, *args):
+    high = args[0]
+    low = args[1]
+    acceleration = args[2]
+    maximum = args[3]
+    if len(high) < 2:
+        return float('nan')
+    trend = 1  # 1 for up, -1 for down
+    sar = low[0]
+    extreme_point = high[0]
+    acc_factor = acceleration
+
+    for i in range(1, len(high)):
+        if trend == 1:
+            sar = sar + acc_factor * (extreme_point - sar)
+            if low[i] < sar:
+                trend = -1
+                sar = extreme_point
+                extreme_point = low[i]
+                acc_factor = acceleration
+            else:
+                if high[i] > extreme_point:
+                    extreme_point = high[i]
+                    acc_factor = min(acc_factor + acceleration, maximum)
+        else:
+            sar = sar - acc_factor * (sar - extreme_point)
+            if high[i] > sar:
+                trend = 1
+                sar = extreme_point
+                extreme_point = high[i]
+                acc_factor = acceleration
+            else:
+                if low[i] < extreme_point:
+                    extreme_point = low[i]
+                    acc_factor = min(acc_factor + acceleration, maximum)
+    return sar
+
+
+@builtin('taSma')
+def _syntax_taSma(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    return sum(data[-period:]) / period
+
+
+@builtin('taStdev')
+def _syntax_taStdev(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    mean = sum(data[-period:]) / period
+    squared_diff_sum = sum((x - mean) ** 2 for x in data[-period:])
+    return (squared_diff_sum / period) ** 0.5
+
+
+@builtin('taStoch')
+def _syntax_taStoch(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    period = args[3]
+    smooth_k = args[4]
+    smooth_d = args[5]
+    if len(close) < period:
+        return float('nan')
+
+    k_raw = 100 * (close[-1] - min(low[-period:])) / (max(high[-period:]) - min(low[-period:]))
+    k = sum([k_raw] * smooth_k) / smooth_k
+    d = sum([k] * smooth_d) / smooth_d
+
+    return {
+        'k': k,
+        'd': d
+    }
+
+
+@builtin('taSuperTrend')
+def _syntax_taSuperTrend(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    period = args[3]
+    multiplier = args[4]
+    if len(close) < period:
+        return float('nan')
+
+    tr_list = []
+    for i in range(1, len(high)):
+        tr = max(high[i] - low[i],
+                abs(high[i] - close[i-1]),
+                abs(low[i] - close[i-1]))
+        tr_list.append(tr)
+
+    atr = sum(tr_list[-period:]) / period
+
+    upper_band = (high[-1] + low[-1]) / 2 + multiplier * atr
+    lower_band = (high[-1] + low[-1]) / 2 - multiplier * atr
+
+    supertrend = upper_band if close[-1] <= upper_band else lower_band
+
+    return {
+        'supertrend': supertrend,
+        'direction': -1 if close[-1] > supertrend else 1
+    }
+
+
+@builtin('taSwma')
+def _syntax_taSwma(self, *args):
+    data = args[0]
+    if len(data) < 4:
+        return float('nan')
+    weights = [1/6, 2/6, 2/6, 1/6]
+    return sum(w * d for w, d in zip(weights, data[-4:]))
+
+
+@builtin('taTsi')
+def _syntax_taTsi(self, *args):
+    data = args[0]
+    r_period = args[1]
+    s_period = args[2]
+    if len(data) < max(r_period, s_period, 4):
+        return float('nan')
+
+    momentum = [data[i] - data[i-1] for i in range(1, len(data))]
+
+    smooth1 = []
+    value = momentum[0]
+    for price in momentum[1:]:
+        value = (2 / (r_period + 1)) * price + (1 - (2 / (r_period + 1))) * value
+        smooth1.append(value)
+
+    smooth2 = []
+    value = smooth1[0]
+    for price in smooth1[1:]:
+        value = (2 / (s_period + 1)) * price + (1 - (2 / (s_period + 1))) * value
+        smooth2.append(value)
+
+    abs_momentum = [abs(x) for x in momentum]
+
+    abs_smooth1 = []
+    value = abs_momentum[0]
+    for price in abs_momentum[1:]:
+        value = (2 / (r_period + 1)) * price + (1 - (2 / (r_period + 1))) * value
+        abs_smooth1.append(value)
+
+    abs_smooth2 = []
+    value = abs_smooth1[0]
+    for price in abs_smooth1[1:]:
+        value = (2 / (s_period + 1)) * price + (1 - (2 / (s_period + 1))) * value
+        abs_smooth2.append(value)
+
+    return 100 * (smooth2[-1] / abs_smooth2[-1]) if abs_smooth2[-1] != 0 else 0
+
+
+@builtin('taValueWhen')
+def _syntax_taValueWhen(self, *args):
+    condition = args[0]
+    source = args[1]
+    occurrence = args[2]
+    if len(condition) != len(source):
+        return float('nan')
+    count = 0
+    for i in reversed(range(len(condition))):
+        if condition[i]:
+            if count == occurrence:
+                return source[i]
+            count += 1
+    return float('nan')
+
+
+@builtin('taVariance')
+def _syntax_taVariance(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    mean = sum(data[-period:]) / period
+    return sum((x - mean) ** 2 for x in data[-period:]) / period
+
+
+@builtin('taVwap')
+def _syntax_taVwap(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    volume = args[3]
+    typical_price = [(h + l + c) / 3 for h, l, c in zip(high, low, close)]
+    return sum(tp * v for tp, v in zip(typical_price, volume)) / sum(volume) if sum(volume) != 0 else float('nan')
+
+
+@builtin('taVwma')
+def _syntax_taVwma(self, *args):
+    data = args[0]
+    volume = args[1]
+    period = args[2]
+    if len(data) < period:
+        return float('nan')
+    return sum(d * v for d, v in zip(data[-period:], volume[-period:])) / sum(volume[-period:]) if sum(volume[-period:]) != 0 else float('nan')
+
+
+@builtin('taWma')
+def _syntax_taWma(self, *args):
+    data = args[0]
+    period = args[1]
+    if len(data) < period:
+        return float('nan')
+    weights = list(range(1, period + 1))
+    weighted_sum = sum(w * d for w, d in zip(weights, data[-period:]))
+    return weighted_sum / sum(weights)
+
+
+@builtin('taWpr')
+def _syntax_taWpr(self, *args):
+    high = args[0]
+    low = args[1]
+    close = args[2]
+    period = args[3]
+    if len(close) < period:
+        return float('nan')
+    highest_high = max(high[-period:])
+    lowest_low = min(low[-period:])
+    return -100 * (highest_high - close[-1]) / (highest_high - lowest_low) if (highest_high - lowest_low) != 0 else 0
+
+
+# strategy
+
+@builtin('strategyAccountCurrency')
+def _syntax_strategyAccountCurrency(self, *args):
+    return args[0]['account']['currency']
+
+
+@builtin('strategyAvgLosingTrade')
+def _syntax_strategyAvgLosingTrade(self, *args):
+    total_loss = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
+    loss_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] < 0)
+    return total_loss / loss_count if loss_count > 0 else 0
+
+
+@builtin('strategyAvgLosingTradePercent')
+def _syntax_strategyAvgLosingTradePercent(self, *args):
+    total_loss_percent = sum(trade['profit_percent'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
+    loss_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] < 0)
+    return total_loss_percent / loss_count if loss_count > 0 else 0
+
+
+@builtin('strategyAvgTrade')
+def _syntax_strategyAvgTrade(self, *args):
+    total_profit = sum(trade['profit'] for trade in args[0]['closed_trades'])
+    trade_count = len(args[0]['closed_trades'])
+    return total_profit / trade_count if trade_count > 0 else 0
+
+
+@builtin('strategyAvgTradePercent')
+def _syntax_strategyAvgTradePercent(self, *args):
+    total_profit_percent = sum(trade['profit_percent'] for trade in args[0]['closed_trades'])
+    trade_count = len(args[0]['closed_trades'])
+    return total_profit_percent / trade_count if trade_count > 0 else 0
+
+
+@builtin('strategyAvgWinningTrade')
+def _syntax_strategyAvgWinningTrade(self, *args):
+    total_win = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
+    win_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] > 0)
+    return total_win / win_count if win_count > 0 else 0
+
+
+@builtin('strategyAvgWinningTradePercent')
+def _syntax_strategyAvgWinningTradePercent(self, *args):
+    total_win_percent = sum(trade['profit_percent'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
+    win_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] > 0)
+    return total_win_percent / win_count if win_count > 0 else 0
+
+
+@builtin('strategyClosedTrades')
+def _syntax_strategyClosedTrades(self, *args):
+    return len(args[0]['closed_trades'])
+
+
+@builtin('strategyClosedTradesFirstIndex')
+def _syntax_strategyClosedTradesFirstIndex(self, *args):
+    return args[0]['closed_trades'][0]['entry_bar_index'] if args[0]['closed_trades'] else 0
+
+
+@builtin('strategyEquity')
+def _syntax_strategyEquity(self, *args):
+    return args[0]['account']['initial_capital'] + args[0]['net_profit']
+
+
+@builtin('strategyEvenTrades')
+def _syntax_strategyEvenTrades(self, *args):
+    return sum(1 for trade in args[0]['closed_trades'] if trade['profit'] == 0)
+
+
+@builtin('strategyGrossLoss')
+def _syntax_strategyGrossLoss(self, *args):
+    return sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
+
+
+@builtin('strategyGrossLossPercent')
+def _syntax_strategyGrossLossPercent(self, *args):
+    initial_capital = args[0]['account']['initial_capital']
+    gross_loss = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
+    return (gross_loss / initial_capital) * 100 if initial_capital != 0 else 0
+
+
+@builtin('strategyGrossProfit')
+def _syntax_strategyGrossProfit(self, *args):
+    return sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
+
+
+@builtin('strategyGrossProfitPercent')
+def _syntax_strategyGrossProfitPercent(self, *args):
+    initial_capital = args[0]['account']['initial_capital']
+    gross_profit = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
+    return (gross_profit / initial_capital) * 100 if initial_capital != 0 else 0
+
+
+@builtin('strategyInitialCapital')
+def _syntax_strategyInitialCapital(self, *args):
+    return args[0]['account']['initial_capital']
+
+
+@builtin('strategyLossTrades')
+def _syntax_strategyLossTrades(self, *args):
+    return sum(1 for trade in args[0]['closed_trades'] if trade['profit'] < 0)
+
+
+@builtin('strategyMarginLiquidationPrice')
+def _syntax_strategyMarginLiquidationPrice(self, *args):
+    position = args[0]['position']
+    margin_requirement = args[0]['account']['margin_requirement']
+    return position['entry_price'] * (1 - margin_requirement) if position['direction'] == 'long' else position['entry_price'] * (1 + margin_requirement)
+
+
+@builtin('strategyMaxContractsHeldAll')
+def _syntax_strategyMaxContractsHeldAll(self, *args):
+    return max(trade['contracts'] for trade in args[0]['all_trades'])
+
+
+@builtin('strategyMaxContractsHeldLong')
+def _syntax_strategyMaxContractsHeldLong(self, *args):
+    return max((trade['contracts'] for trade in args[0]['all_trades'] if trade['direction'] == 'long'), default=0)
+
+
+@builtin('strategyMaxContractsHeldShort')
+def _syntax_strategyMaxContractsHeldShort(self, *args):
+    return max((trade['contracts'] for trade in args[0]['all_trades'] if trade['direction'] == 'short'), default=0)
+
+
+@builtin('strategyMaxDrawdown')
+def _syntax_strategyMaxDrawdown(self, *args):
+    equity_curve = []
+    current_equity = args[0]['account']['initial_capital']
+    for trade in args[0]['closed_trades']:
+        current_equity += trade['profit']
+        equity_curve.append(current_equity)
+
+    max_drawdown = 0
+    peak = equity_curve[0]
+    for equity in equity_curve:
+        if equity > peak:
+            peak = equity
+        drawdown = peak - equity
+        max_drawdown = max(max_drawdown, drawdown)
+    return max_drawdown
+
+
+@builtin('strategyMaxDrawdownPercent')
+def _syntax_strategyMaxDrawdownPercent(self, *args):
+    equity_curve = []
+    current_equity = args[0]['account']['initial_capital']
+    for trade in args[0]['closed_trades']:
+        current_equity += trade['profit']
+        equity_curve.append(current_equity)
+
+    max_drawdown_percent = 0
+    peak = equity_curve[0]
+    for equity in equity_curve:
+        if equity > peak:
+            peak = equity
+        drawdown_percent = ((peak - equity) / peak) * 100 if peak != 0 else 0
+        max_drawdown_percent = max(max_drawdown_percent, drawdown_percent)
+    return max_drawdown_percent
+
+
+@builtin('strategyMaxRunup')
+def _syntax_strategyMaxRunup(self, *args):
+    equity_curve = []
+    current_equity = args[0]['account']['initial_capital']
+    for trade in args[0]['closed_trades']:
+        current_equity += trade['profit']
+        equity_curve.append(current_equity)
+
+    max_runup = 0
+    trough = equity_curve[0]
+    for equity in equity_curve:
+        if equity < trough:
+            trough = equity
+        runup = equity - trough
+        max_runup = max(max_runup, runup)
+    return max_runup
+
+
+@builtin('strategyMaxRunupPercent')
+def _syntax_strategyMaxRunupPercent(self, *args):
+    equity_curve = []
+    current_equity = args[0]['account']['initial_capital']
+    for trade in args[0]['closed_trades']:
+        current_equity += trade['profit']
+        equity_curve.append(current_equity)
+
+    max_runup_percent = 0
+    trough = equity_curve[0]
+    for equity in equity_curve:
+        if equity < trough:
+            trough = equity
+        runup_percent = ((equity - trough) / trough) * 100 if trough != 0 else 0
+        max_runup_percent = max(max_runup_percent, runup_percent)
+    return max_runup_percent
+
+
+@builtin('strategyNetProfit')
+def _syntax_strategyNetProfit(self, *args):
+    return sum(trade['profit'] for trade in args[0]['closed_trades'])
+
+
+@builtin('strategyNetProfitPercent')
+def _syntax_strategyNetProfitPercent(self, *args):
+    initial_capital = args[0]['account']['initial_capital']
+    net_profit = sum(trade['profit'] for trade in args[0]['closed_trades'])
+    return (net_profit / initial_capital) * 100 if initial_capital != 0 else 0
+
+
+@builtin('strategyOpenProfit')
+def _syntax_strategyOpenProfit(self, *args):
+    return sum(trade['unrealized_profit'] for trade in args[0]['open_trades'])
+
+
+@builtin('strategyOpenProfitPercent')
+def _syntax_strategyOpenProfitPercent(self, *args):
+    initial_capital = args[0]['account']['initial_capital']
+    open_profit = sum(trade['unrealized_profit'] for trade in args[0]['open_trades'])
+    return (open_profit / initial_capital) * 100 if initial_capital != 0 else 0
+
+
+@builtin('strategyOpenTrades')
+def _syntax_strategyOpenTrades(self, *args):
+    return len(args[0]['open_trades'])
+
+
+@builtin('strategyOpenTradesCapitalHeld')
+def _syntax_strategyOpenTradesCapitalHeld(self, *args):
+    return sum(trade['margin_required'] for trade in args[0]['open_trades'])
+
+
+@builtin('strategyPositionAvgPrice')
+def _syntax_strategyPositionAvgPrice(self, *args):
+    open_positions = args[0]['open_trades']
+    total_cost = sum(trade['entry_price'] * trade['contracts'] for trade in open_positions)
+    total_contracts = sum(trade['contracts'] for trade in open_positions)
+    return total_cost / total_contracts if total_contracts > 0 else 0
+
+
+@builtin('strategyPositionEntryName')
+def _syntax_strategyPositionEntryName(self, *args):
+    return args[0]['position']['entry_name'] if args[0]['position'] else ''
+
+
+@builtin('strategyPositionSize')
+def _syntax_strategyPositionSize(self, *args):
+    return sum(trade['contracts'] for trade in args[0]['open_trades'])
+
+
+@builtin('strategyWinTrades')
+def _syntax_strategyWinTrades(self, *args):
+    return sum(1 for trade in args[0]['closed_trades'] if trade['profit'] > 0)
+
+
+@builtin('timeframeIsDaily')
+def _syntax_timeframeIsDaily(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] == 'day' and timeframe_data['value'] == 1
+
+
+@builtin('timeframeIsDWM')
+def _syntax_timeframeIsDWM(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] in ['day', 'week', 'month']
+
+
+@builtin('timeframeIsIntraday')
+def _syntax_timeframeIsIntraday(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] in ['minute', 'second', 'tick']
+
+
+@builtin('timeframeIsMinutes')
+def _syntax_timeframeIsMinutes(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] == 'minute'
+
+
+@builtin('timeframeIsMonthly')
+def _syntax_timeframeIsMonthly(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] == 'month' and timeframe_data['value'] == 1
+
+
+@builtin('timeframeIsSeconds')
+def _syntax_timeframeIsSeconds(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] == 'second'
+
+
+@builtin('timeframeIsTicks')
+def _syntax_timeframeIsTicks(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] == 'tick'
+
+
+@builtin('timeframeIsWeekly')
+def _syntax_timeframeIsWeekly(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['unit'] == 'week' and timeframe_data['value'] == 1
+
+
+@builtin('timeframeMainPeriod')
+def _syntax_timeframeMainPeriod(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['main_period']
+
+
+@builtin('timeframeMultiplier')
+def _syntax_timeframeMultiplier(self, *args):
+    timeframe_data = args[0]
+    return timeframe_data['value']
+
+
+@builtin('timeframePeriod')
+def _syntax_timeframePeriod(self, *args):
+    timeframe_data = args[0]
+    base_periods = {'tick': 1, 'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400, 'week': 604800, 'month': 2592000}
+    return base_periods[timeframe_data['unit']] * timeframe_data['value']
+
+
+# show style
+
+@builtin('showStyleArea')
+def _syntax_showStyleArea(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'area',
+        'fill_opacity': 0.5 if not args else args[0]
+    }
+    return style_data
+
+
+@builtin('showStyleAreaBr')
+def _syntax_showStyleAreaBr(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'area_br',
+        'fill_opacity': 0.5 if not args else args[0],
+        'break_gaps': True
+    }
+    return style_data
+
+
+@builtin('showStyleCircles')
+def _syntax_showStyleCircles(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'circles',
+        'radius': 3 if not args else args[0]
+    }
+    return style_data
+
+
+@builtin('showStyleColumns')
+def _syntax_showStyleColumns(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'columns',
+        'width': 0.8 if not args else args[0]
+    }
+    return style_data
+
+
+@builtin('showStyleCross')
+def _syntax_showStyleCross(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'cross',
+        'size': 5 if not args else args[0]
+    }
+    return style_data
+
+
+@builtin('showStyleHistogram')
+def _syntax_showStyleHistogram(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'histogram',
+        'base_level': 0 if not args else args[0]
+    }
+    return style_data
+
+
+@builtin('showStyleLine')
+def _syntax_showStyleLine(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'line',
+        'width': 1 if not args else args[0]
+    }
+    return style_data
+
+
+@builtin('showStyleLineBr')
+def _syntax_showStyleLineBr(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'line_br',
+        'width': 1 if not args else args[0],
+        'break_gaps': True
+    }
+    return style_data
+
+
+@builtin('showStyleStepLine')
+def _syntax_showStyleStepLine(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'stepline',
+        'width': 1 if not args else args[0]
+    }
+    return style_data
+
+
+@builtin('showStyleStepLineDiamond')
+def _syntax_showStyleStepLineDiamond(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'stepline_diamond',
+        'width': 1 if not args else args[0],
+        'marker_size': 5
+    }
+    return style_data
+
+
+@builtin('showStyleStepLineBr')
+def _syntax_showStyleStepLineBr(self, *args):
+    style_data = {
+        'type': 'plot_style',
+        'style': 'stepline_br',
+        'width': 1 if not args else args[0],
+        'break_gaps': True
+    }
+    return style_data
+
+
+@builtin('positionBottomCenter')
+def _syntax_positionBottomCenter(self, *args):
+    position_data = {
+        'vertical': 'bottom',
+        'horizontal': 'center',
+        'alignment': 'bottom_center'
+    }
+    return position_data
+
+
+@builtin('positionBottomLeft')
+def _syntax_positionBottomLeft(self, *args):
+    position_data = {
+        'vertical': 'bottom',
+        'horizontal': 'left',
+        'alignment': 'bottom_left'
+    }
+    return position_data
+
+
+@builtin('positionBottomRight')
+def _syntax_positionBottomRight(self, *args):
+    position_data = {
+        'vertical': 'bottom',
+        'horizontal': 'right',
+        'alignment': 'bottom_right'
+    }
+    return position_data
+
+
+@builtin('positionMiddleCenter')
+def _syntax_positionMiddleCenter(self, *args):
+    position_data = {
+        'vertical': 'middle',
+        'horizontal': 'center',
+        'alignment': 'middle_center'
+    }
+    return position_data
+
+
+@builtin('positionMiddleLeft')
+def _syntax_positionMiddleLeft(self, *args):
+    position_data = {
+        'vertical': 'middle',
+        'horizontal': 'left',
+        'alignment': 'middle_left'
+    }
+    return position_data
+
+
+@builtin('positionMiddleRight')
+def _syntax_positionMiddleRight(self, *args):
+    position_data = {
+        'vertical': 'middle',
+        'horizontal': 'right',
+        'alignment': 'middle_right'
+    }
+    return position_data
+
+
+@builtin('positionTopCenter')
+def _syntax_positionTopCenter(self, *args):
+    position_data = {
+        'vertical': 'top',
+        'horizontal': 'center',
+        'alignment': 'top_center'
+    }
+    return position_data
+
+
+@builtin('positionTopLeft')
+def _syntax_positionTopLeft(self, *args):
+    position_data = {
+        'vertical': 'top',
+        'horizontal': 'left',
+        'alignment': 'top_left'
+    }
+    return position_data
+
+
+@builtin('positionTopRight')
+def _syntax_positionTopRight(self, *args):
+    position_data = {
+        'vertical': 'top',
+        'horizontal': 'right',
+        'alignment': 'top_right'
+    }
+    return position_data
+
+
+@builtin('scaleLeft')
+def _syntax_scaleLeft(self, *args):
+    scale_data = {
+        'scale_position': 'left',
+        'visible': True
+    }
+    return scale_data
+
+
+@builtin('scaleNone')
+def _syntax_scaleNone(self, *args):
+    scale_data = {
+        'scale_position': 'none',
+        'visible': False
+    }
+    return scale_data
+
+
+@builtin('scaleRight')
+def _syntax_scaleRight(self, *args):
+    scale_data = {
+        'scale_position': 'right',
+        'visible': True
+    }
+    return scale_data
+
+
+@builtin('sessionExtended')
+def _syntax_sessionExtended(self, *args):
+    session_data = {
+        'session_type': 'extended',
+        'include_pre_post': True,
+        'extended_hours': True
+    }
+    return session_data
+
+
+@builtin('sessionRegular')
+def _syntax_sessionRegular(self, *args):
+    session_data = {
+        'session_type': 'regular',
+        'include_pre_post': False,
+        'extended_hours': False
+    }
+    return session_data
+
+
+@builtin('settlementAsCloseInherit')
+def _syntax_settlementAsCloseInherit(self, *args):
+    settlement_data = {
+        'settlement_as_close': 'inherit',
+        'use_settlement': None
+    }
+    return settlement_data
+
+
+@builtin('settlementAsCloseOff')
+def _syntax_settlementAsCloseOff(self, *args):
+    settlement_data = {
+        'settlement_as_close': False,
+        'use_settlement': False
+    }
+    return settlement_data
+
+
+@builtin('settlementAsCloseOn')
+def _syntax_settlementAsCloseOn(self, *args):
+    settlement_data = {
+        'settlement_as_close': True,
+        'use_settlement': True
+    }
+    return settlement_data
+
+
+# shape
+
+@builtin('shapeArrowDown')
+def _syntax_shapeArrowDown(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'arrow_down',
+        'points': [[0, -1], [1, 0], [0.5, 0], [0.5, 1], [-0.5, 1], [-0.5, 0], [-1, 0]]
+    }
+
+
+@builtin('shapeArrowUp')
+def _syntax_shapeArrowUp(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'arrow_up',
+        'points': [[0, 1], [1, 0], [0.5, 0], [0.5, -1], [-0.5, -1], [-0.5, 0], [-1, 0]]
+    }
+
+
+@builtin('shapeCircle')
+def _syntax_shapeCircle(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'circle',
+        'radius': 1.0,
+        'segments': 32
+    }
+
+
+@builtin('shapeCross')
+def _syntax_shapeCross(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'cross',
+        'points': [[0.5, 0.5], [-0.5, -0.5], [0, 0], [-0.5, 0.5], [0.5, -0.5]]
+    }
+
+
+@builtin('shapeDiamond')
+def _syntax_shapeDiamond(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'diamond',
+        'points': [[0, 1], [1, 0], [0, -1], [-1, 0]]
+    }
+
+
+@builtin('shapeFlag')
+def _syntax_shapeFlag(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'flag',
+        'points': [[0, 0], [0, 1], [1, 0.75], [0, 0.5]]
+    }
+
+
+@builtin('shapeLabelDown')
+def _syntax_shapeLabelDown(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'label_down',
+        'points': [[0, 0], [1, -1], [-1, -1]]
+    }
+
+
+@builtin('shapeLabelUp')
+def _syntax_shapeLabelUp(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'label_up',
+        'points': [[0, 0], [1, 1], [-1, 1]]
+    }
+
+
+@builtin('shapeSquare')
+def _syntax_shapeSquare(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'square',
+        'points': [[1, 1], [1, -1], [-1, -1], [-1, 1]]
+    }
+
+
+@builtin('shapeTriangleDown')
+def _syntax_shapeTriangleDown(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'triangle_down',
+        'points': [[0, -1], [1, 1], [-1, 1]]
+    }
+
+
+@builtin('shapeTriangleUp')
+def _syntax_shapeTriangleUp(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'triangle_up',
+        'points': [[0, 1], [1, -1], [-1, -1]]
+    }
+
+
+@builtin('shapeXCross')
+def _syntax_shapeXCross(self, *args):
+    return {
+        'type': 'shape',
+        'shape': 'xcross',
+        'points': [[1, 1], [-1, -1], [0, 0], [-1, 1], [1, -1]]
+    }
+
+
+@builtin('sizeAuto')
+def _syntax_sizeAuto(self, *args):
+    return {
+        'type': 'size',
+        'value': 'auto',
+        'scale_factor': 1.0
+    }
+
+
+@builtin('sizeHuge')
+def _syntax_sizeHuge(self, *args):
+    return {
+        'type': 'size',
+        'value': 'huge',
+        'scale_factor': 2.5
+    }
+
+
+@builtin('sizeLarge')
+def _syntax_sizeLarge(self, *args):
+    return {
+        'type': 'size',
+        'value': 'large',
+        'scale_factor': 1.5
+    }
+
+
+@builtin('sizeNormal')
+def _syntax_sizeNormal(self, *args):
+    return {
+        'type': 'size',
+        'value': 'normal',
+        'scale_factor': 1.0
+    }
+
+
+@builtin('sizeSmall')
+def _syntax_sizeSmall(self, *args):
+    return {
+        'type': 'size',
+        'value': 'small',
+        'scale_factor': 0.75
+    }
+
+
+@builtin('sizeTiny')
+def _syntax_sizeTiny(self, *args):
+    return {
+        'type': 'size',
+        'value': 'tiny',
+        'scale_factor': 0.5
+    }
+
+
+@builtin('splitsDenominator')
+def _syntax_splitsDenominator(self, *args):
+    return {
+        'type': 'splits',
+        'value': args[0]['denominator'] if args else 1,
+        'split_type': 'denominator'
+    }
+
+
+@builtin('splitsNumerator')
+def _syntax_splitsNumerator(self, *args):
+    return {
+        'type': 'splits',
+        'value': args[0]['numerator'] if args else 1,
+        'split_type': 'numerator'
+    }
+
+
+@builtin('strategyCash')
+def _syntax_strategyCash(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'cash',
+        'value': args[0] if args else 100000
+    }
+
+
+@builtin('strategyCommissionCashPerContract')
+def _syntax_strategyCommissionCashPerContract(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'commission',
+        'model': 'cash_per_contract',
+        'value': args[0] if args else 0.0
+    }
+
+
+@builtin('strategyCommissionCashPerOrder')
+def _syntax_strategyCommissionCashPerOrder(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'commission',
+        'model': 'cash_per_order',
+        'value': args[0] if args else 0.0
+    }
+
+
+@builtin('strategyCommissionPercent')
+def _syntax_strategyCommissionPercent(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'commission',
+        'model': 'percent',
+        'value': args[0] if args else 0.0
+    }
+
+
+@builtin('strategyDirectionAll')
+def _syntax_strategyDirectionAll(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'direction',
+        'value': 'all'
+    }
+
+
+@builtin('strategyDirectionLong')
+def _syntax_strategyDirectionLong(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'direction',
+        'value': 'long'
+    }
+
+
+@builtin('strategyDirectionShort')
+def _syntax_strategyDirectionShort(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'direction',
+        'value': 'short'
+    }
+
+
+@builtin('strategyFixed')
+def _syntax_strategyFixed(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'position_size',
+        'model': 'fixed',
+        'value': args[0] if args else 1
+    }
+
+
+@builtin('strategyLong')
+def _syntax_strategyLong(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'position',
+        'value': 'long'
+    }
+
+
+@builtin('strategyOcaCancel')
+def _syntax_strategyOcaCancel(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'oca',
+        'behavior': 'cancel'
+    }
+
+
+@builtin('strategyOcaNone')
+def _syntax_strategyOcaNone(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'oca',
+        'behavior': 'none'
+    }
+
+
+@builtin('strategyOcaReduce')
+def _syntax_strategyOcaReduce(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'oca',
+        'behavior': 'reduce'
+    }
+
+
+@builtin('strategyPercentOfEquity')
+def _syntax_strategyPercentOfEquity(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'position_size',
+        'model': 'percent_of_equity',
+        'value': args[0] if args else 100
+    }
+
+
+@builtin('strategyShort')
+def _syntax_strategyShort(self, *args):
+    return {
+        'type': 'strategy_parameter',
+        'parameter': 'position',
+        'value': 'short'
+    }
+
+
+@builtin('textAlignBottom')
+def _syntax_textAlignBottom(self, *args):
+    return {
+        'type': 'text_parameter',
+        'parameter': 'vertical_align',
+        'value': 'bottom'
+    }
+
+
+@builtin('textAlignCenter')
+def _syntax_textAlignCenter(self, *args):
+    return {
+        'type': 'text_parameter',
+        'parameter': 'horizontal_align',
+        'value': 'center'
+    }
+
+
+@builtin('textAlignLeft')
+def _syntax_textAlignLeft(self, *args):
+    return {
+        'type': 'text_parameter',
+        'parameter': 'horizontal_align',
+        'value': 'left'
+    }
+
+
+@builtin('textAlignRight')
+def _syntax_textAlignRight(self, *args):
+    return {
+        'type': 'text_parameter',
+        'parameter': 'horizontal_align',
+        'value': 'right'
+    }
+
+
+@builtin('textAlignTop')
+def _syntax_textAlignTop(self, *args):
+    return {
+        'type': 'text_parameter',
+        'parameter': 'vertical_align',
+        'value': 'top'
+    }
+
+
+@builtin('textWrapAuto')
+def _syntax_textWrapAuto(self, *args):
+    return {
+        'type': 'text_parameter',
+        'parameter': 'wrap',
+        'value': 'auto'
+    }
+
+
+@builtin('textWrapNone')
+def _syntax_textWrapNone(self, *args):
+    return {
+        'type': 'text_parameter',
+        'parameter': 'wrap',
+        'value': 'none'
+    }
+
+
+@builtin('trueValue')
+def _syntax_trueValue(self, *args):
+    return {
+        'type': 'boolean',
+        'value': True
+    }
+
+
+@builtin('locationAboveBar')
+def _syntax_locationAboveBar(self, *args):
+    return {
+        'type': 'location',
+        'position': 'above_bar',
+        'offset': 1
+    }
+
+
+@builtin('locationAbsolute')
+def _syntax_locationAbsolute(self, *args):
+    return {
+        'type': 'location',
+        'position': 'absolute',
+        'coordinates': args[0] if args else [0, 0]
+    }
+
+
+@builtin('locationBelowBar')
+def _syntax_locationBelowBar(self, *args):
+    return {
+        'type': 'location',
+        'position': 'below_bar',
+        'offset': -1
+    }
+
+
+@builtin('locationBottom')
+def _syntax_locationBottom(self, *args):
+    return {
+        'type': 'location',
+        'position': 'bottom',
+        'value': 0
+    }
+
+
+@builtin('locationTop')
+def _syntax_locationTop(self, *args):
+    return {
+        'type': 'location',
+        'position': 'top',
+        'value': 100
+    }
+
+
+@builtin('mathE')
+def _syntax_mathE(self, *args):
+    return {
+        'type': 'constant',
+        'name': 'e',
+        'value': 2.718281828459045
+    }
+
+
+@builtin('mathPhi')
+def _syntax_mathPhi(self, *args):
+    return {
+        'type': 'constant',
+        'name': 'phi',
+        'value': 1.618033988749895
+    }
+
+
+@builtin('mathPi')
+def _syntax_mathPi(self, *args):
+    return {
+        'type': 'constant',
+        'name': 'pi',
+        'value': 3.141592653589793
+    }
+
+
+@builtin('mathRPhi')
+def _syntax_mathRPhi(self, *args):
+    return {
+        'type': 'constant',
+        'name': 'rphi',
+        'value': 0.618033988749895
+    }
+
+
+@builtin('orderAscending')
+def _syntax_orderAscending(self, *args):
+    return {
+        'type': 'order',
+        'direction': 'ascending',
+        'value': 1
+    }
+
+
+@builtin('orderDescending')
+def _syntax_orderDescending(self, *args):
+    return {
+        'type': 'order',
+        'direction': 'descending',
+        'value': -1
+    }
+
+
+@builtin('onTick')
+def _syntax_onTick(self, *args):
+    return {
+        'type': 'event',
+        'trigger': 'tick',
+        'timestamp': args[0] if args else 0
+    }
+
+
+@builtin('onBar')
+def _syntax_onBar(self, *args):
+    return {
+        'type': 'event',
+        'trigger': 'bar',
+        'timestamp': args[0] if args else 0
+    }
+
+
+@builtin('=')
+def _syntax_assign(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'assign',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('+')
+def _syntax_add(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'add',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('-')
+def _syntax_sub(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'subtract',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('*')
+def _syntax_mul(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'multiply',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('/')
+def _syntax_div(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'divide',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('%')
+def _syntax_mod(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'modulo',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('==')
+def _syntax_eq(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'equal',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('!=')
+def _syntax_ne(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'not_equal',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('>')
+def _syntax_gt(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'greater',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('<')
+def _syntax_lt(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'less',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('>=')
+def _syntax_ge(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'greater_equal',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('<=')
+def _syntax_le(self, *args):
+    return {
+        'type': 'operator',
+        'operation': 'less_equal',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('and')
+def _syntax_and(self, *args):
+    return {
+        'type': 'logical',
+        'operation': 'and',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('or')
+def _syntax_or(self, *args):
+    return {
+        'type': 'logical',
+        'operation': 'or',
+        'left': args[0],
+        'right': args[1]
+    }
+
+
+@builtin('not')
+def _syntax_not(self, *args):
+    return {
+        'type': 'logical',
+        'operation': 'not',
+        'operand': args[0]
+    }
+
+
+@builtin('if')
+def _syntax_if(self, *args):
+    return {
+        'type': 'control',
+        'operation': 'if',
+        'condition': args[0],
+        'then': args[1],
+        'else': args[2] if len(args) > 2 else None
+    }
+
+
+@builtin('else')
+def _syntax_else(self, *args):
+    return {
+        'type': 'control',
+        'operation': 'else',
+        'body': args[0]
+    }
+
+
+@builtin('for')
+def _syntax_for(self, *args):
+    return {
+        'type': 'control',
+        'operation': 'for',
+        'init': args[0],
+        'condition': args[1],
+        'increment': args[2],
+        'body': args[3]
+    }
+
+
+@builtin('while')
+def _syntax_while(self, *args):
+    return {
+        'type': 'control',
+        'operation': 'while',
+        'condition': args[0],
+        'body': args[1]
+    }
+
+
+@builtin('arr')
+def _syntax_arr(self, *args):
+    return {
+        'type': 'array',
+        'elements': args[0] if args else []
+    }
+
+
+@builtin('bool')
+def _syntax_bool(self, *args):
+    return {
+        'type': 'boolean',
+        'value': bool(args[0]) if args else False
+    }
+
+
+@builtin('box')
+def _syntax_box(self, *args):
+    return {
+        'type': 'box',
+        'left': args[0] if args else 0,
+        'top': args[1] if len(args) > 1 else 0,
+        'right': args[2] if len(args) > 2 else 0,
+        'bottom': args[3] if len(args) > 3 else 0
+    }
+
+
+@builtin('chartPoint')
+def _syntax_chartPoint(self, *args):
+    return {
+        'type': 'chart_point',
+        'x': args[0] if args else 0,
+        'y': args[1] if len(args) > 1 else 0
+    }
 
-        # strategy
 
-        elif syntax_list['name'] == 'strategyFunc':
-            return {
-                'name': args[0],
-                'initial_capital': args[1],
-                'currency': args[2],
-                'trades': [],
-                'open_positions': []
-            }
-            
-        elif syntax_list['name'] == 'strategyCancelFunc':
-            return {
-                'order_id': args[0],
-                'status': 'cancelled'
-            }
-            
-        elif syntax_list['name'] == 'strategyCancelAllFunc':
-            return {
-                'status': 'all_cancelled'
-            }
-            
-        elif syntax_list['name'] == 'strategyCloseFunc':
-            return {
-                'position_id': args[0],
-                'exit_price': args[1],
-                'exit_time': args[2]
-            }
-            
-        elif syntax_list['name'] == 'strategyCloseAllFunc':
-            return {
-                'exit_price': args[0],
-                'exit_time': args[1]
-            }
-            
-        elif syntax_list['name'] == 'strategyClosedTradesCommissionFunc':
-            return args[0]['trades'][args[1]]['commission']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesEntryBarIndexFunc':
-            return args[0]['trades'][args[1]]['entry_bar_index']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesEntryCommentFunc':
-            return args[0]['trades'][args[1]]['entry_comment']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesEntryIdFunc':
-            return args[0]['trades'][args[1]]['entry_id']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesEntryPriceFunc':
-            return args[0]['trades'][args[1]]['entry_price']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesEntryTimeFunc':
-            return args[0]['trades'][args[1]]['entry_time']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesExitBarIndexFunc':
-            return args[0]['trades'][args[1]]['exit_bar_index']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesExitCommentFunc':
-            return args[0]['trades'][args[1]]['exit_comment']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesExitIdFunc':
-            return args[0]['trades'][args[1]]['exit_id']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesExitPriceFunc':
-            return args[0]['trades'][args[1]]['exit_price']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesExitTimeFunc':
-            return args[0]['trades'][args[1]]['exit_time']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesMaxDrawdownFunc':
-            return args[0]['trades'][args[1]]['max_drawdown']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesMaxDrawdownPercentFunc':
-            trade = args[0]['trades'][args[1]]
-            return (trade['max_drawdown'] / trade['entry_price']) * 100
-            
-        elif syntax_list['name'] == 'strategyClosedTradesMaxRunupFunc':
-            return args[0]['trades'][args[1]]['max_runup']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesMaxRunupPercentFunc':
-            trade = args[0]['trades'][args[1]]
-            return (trade['max_runup'] / trade['entry_price']) * 100
-            
-        elif syntax_list['name'] == 'strategyClosedTradesProfitFunc':
-            trade = args[0]['trades'][args[1]]
-            return (trade['exit_price'] - trade['entry_price']) * trade['size']
-            
-        elif syntax_list['name'] == 'strategyClosedTradesProfitPercentFunc':
-            trade = args[0]['trades'][args[1]]
-            return ((trade['exit_price'] - trade['entry_price']) / trade['entry_price']) * 100
-            
-        elif syntax_list['name'] == 'strategyClosedTradesSizeFunc':
-            return args[0]['trades'][args[1]]['size']
-            
-        elif syntax_list['name'] == 'strategyConvertToAccountFunc':
-            return args[0] * args[1]  # value * exchange_rate
-            
-        elif syntax_list['name'] == 'strategyConvertToSymbolFunc':
-            return args[0] / args[1]  # value / exchange_rate
-            
-        elif syntax_list['name'] == 'strategyDefaultEntryQtyFunc':
-            return {
-                'quantity': args[0],
-                'status': 'set'
-            }
-            
-        elif syntax_list['name'] == 'strategyEntryFunc':
-            return {
-                'direction': args[0],
-                'size': args[1],
-                'price': args[2],
-                'comment': args[3]
-            }
-            
-        elif syntax_list['name'] == 'strategyExitFunc':
-            return {
-                'from_entry': args[0],
-                'size': args[1],
-                'price': args[2],
-                'comment': args[3]
-            }
-            
-        elif syntax_list['name'] == 'strategyOpenTradesCommissionFunc':
-            return args[0]['open_positions'][args[1]]['commission']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesEntryBarIndexFunc':
-            return args[0]['open_positions'][args[1]]['entry_bar_index']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesEntryCommentFunc':
-            return args[0]['open_positions'][args[1]]['entry_comment']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesEntryIdFunc':
-            return args[0]['open_positions'][args[1]]['entry_id']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesEntryPriceFunc':
-            return args[0]['open_positions'][args[1]]['entry_price']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesEntryTimeFunc':
-            return args[0]['open_positions'][args[1]]['entry_time']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesMaxDrawdownFunc':
-            return args[0]['open_positions'][args[1]]['max_drawdown']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesMaxDrawdownPercentFunc':
-            pos = args[0]['open_positions'][args[1]]
-            return (pos['max_drawdown'] / pos['entry_price']) * 100
-            
-        elif syntax_list['name'] == 'strategyOpenTradesMaxRunupFunc':
-            return args[0]['open_positions'][args[1]]['max_runup']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesMaxRunupPercentFunc':
-            pos = args[0]['open_positions'][args[1]]
-            return (pos['max_runup'] / pos['entry_price']) * 100
-            
-        elif syntax_list['name'] == 'strategyOpenTradesProfitFunc':
-            pos = args[0]['open_positions'][args[1]]
-            current_price = args[2]
-            return (current_price - pos['entry_price']) * pos['size']
-            
-        elif syntax_list['name'] == 'strategyOpenTradesProfitPercentFunc':
-            pos = args[0]['open_positions'][args[1]]
-            current_price = args[2]
-            return ((current_price - pos['entry_price']) / pos['entry_price']) * 100
-            
-        elif syntax_list['name'] == 'strategyOpenTradesSizeFunc':
-            return args[0]['open_positions'][args[1]]['size']
-            
-        elif syntax_list['name'] == 'strategyOrderFunc':
-            return {
-                'type': args[0],
-                'direction': args[1],
-                'size': args[2],
-                'price': args[3],
-                'comment': args[4]
-            }
-            
-        elif syntax_list['name'] == 'strategyRiskAllowEntryInFunc':
-            return args[0] <= args[1]  # current_risk <= max_risk
-            
-        elif syntax_list['name'] == 'strategyRiskMaxConsLossDaysFunc':
-            return args[0] <= args[1]  # consecutive_loss_days <= max_days
-            
-        elif syntax_list['name'] == 'strategyRiskMaxDrawdownFunc':
-            return args[0] <= args[1]  # current_drawdown <= max_drawdown
-            
-        elif syntax_list['name'] == 'strategyRiskMaxIntradayFilledOrdersFunc':
-            return args[0] <= args[1]  # filled_orders <= max_orders
-            
-        elif syntax_list['name'] == 'strategyRiskMaxIntradayLossFunc':
-            return args[0] <= args[1]  # intraday_loss <= max_loss
-            
-        elif syntax_list['name'] == 'strategyRiskMaxPositionSizeFunc':
-            return args[0] <= args[1]  # position_size <= max_size
-        
+@builtin('col')
+def _syntax_col(self, *args):
+    return {
+        'type': 'color',
+        'r': args[0] if args else 0,
+        'g': args[1] if len(args) > 1 else 0,
+        'b': args[2] if len(args) > 2 else 0
+    }
 
-        # weird functions
-
-        elif syntax_list['name'] == 'symInfoPrefixFunc':
-            return args[0].split(':')[0] if ':' in args[0] else ''
-            
-        elif syntax_list['name'] == 'symInfoTickerFunc':
-            return args[0].split(':')[1] if ':' in args[0] else args[0]
-            
-        elif syntax_list['name'] == 'timeFunc':
-            return args[0].timestamp()
-            
-        elif syntax_list['name'] == 'timeCloseFunc':
-            return args[0].replace(hour=16, minute=0, second=0, microsecond=0).timestamp()
-            
-        elif syntax_list['name'] == 'timeframeChangeFunc':
-            return {
-                'original': args[0],
-                'new': args[1],
-                'adjustment': args[2]
-            }
-            
-        elif syntax_list['name'] == 'timeframeFromSecondsFunc':
-            seconds = args[0]
-            if seconds < 60:
-                return f"{seconds}S"
-            elif seconds < 3600:
-                return f"{seconds//60}M"
-            elif seconds < 86400:
-                return f"{seconds//3600}H"
-            else:
-                return f"{seconds//86400}D"
-            
-        elif syntax_list['name'] == 'timeframeInSecondsFunc':
-            timeframe = args[0].upper()
-            multiplier = int(''.join(filter(str.isdigit, timeframe)))
-            unit = ''.join(filter(str.isalpha, timeframe))
-            
-            if unit == 'S':
-                return multiplier
-            elif unit == 'M':
-                return multiplier * 60
-            elif unit == 'H':
-                return multiplier * 3600
-            elif unit == 'D':
-                return multiplier * 86400
-            
-        elif syntax_list['name'] == 'timestampFunc':
-            return args[0].timestamp()
-            
-        elif syntax_list['name'] == 'weekOfYearFunc':
-            return args[0].isocalendar()[1]
-            
-        elif syntax_list['name'] == 'yearFunc':
-            return args[0].year
-            
-        elif syntax_list['name'] == 'show':
-            return {
-                'type': 'plot',
-                'series': args[0],
-                'title': args[1] if len(args) > 1 else '',
-                'color': args[2] if len(args) > 2 else '#000000',
-                'linewidth': args[3] if len(args) > 3 else 1,
-                'style': args[4] if len(args) > 4 else 'line'
-            }
-            
-        elif syntax_list['name'] == 'showshape':
-            return {
-                'type': 'shape',
-                'location': args[0],
-                'shape': args[1],
-                'color': args[2] if len(args) > 2 else '#000000',
-                'size': args[3] if len(args) > 3 else 'normal',
-                'text': args[4] if len(args) > 4 else ''
-            }
-            
-        elif syntax_list['name'] == 'showcond':
-            return {
-                'type': 'plot_condition',
-                'condition': args[0],
-                'title': args[1] if len(args) > 1 else '',
-                'color': args[2] if len(args) > 2 else '#000000',
-                'linewidth': args[3] if len(args) > 3 else 1,
-                'style': args[4] if len(args) > 4 else 'line'
-            }
-            
-        elif syntax_list['name'] == 'solid':
-            return {
-                'line_style': 'solid',
-                'pattern': []
-            }
-            
-        elif syntax_list['name'] == 'dotted':
-            return {
-                'line_style': 'dotted',
-                'pattern': [1, 1]
-            }
-            
-        elif syntax_list['name'] == 'dashed':
-            return {
-                'line_style': 'dashed',
-                'pattern': [5, 5]
-            }
-            
-        elif syntax_list['name'] == 'fontFamilyDefault':
-            return {
-                'font': 'Arial',
-                'type': 'default'
-            }
-            
-        elif syntax_list['name'] == 'fontFamilyMonospace':
-            return {
-                'font': 'Courier New',
-                'type': 'monospace'
-            }
-            
-        elif syntax_list['name'] == 'extendBoth':
-            return {
-                'extend': 'both',
-                'plot_range': {'start': -999999, 'end': 999999},
-                'visibility': {'past': True, 'future': True}
-            }
-            
-        elif syntax_list['name'] == 'extendLeft':
-            return {
-                'extend': 'left',
-                'plot_range': {'start': -999999, 'end': 0},
-                'visibility': {'past': True, 'future': False}
-            }
-            
-        elif syntax_list['name'] == 'extendNone':
-            return {
-                'extend': 'none',
-                'plot_range': {'start': 0, 'end': 0},
-                'visibility': {'past': False, 'future': False}
-            }
-            
-        elif syntax_list['name'] == 'extendRight':
-            return {
-                'extend': 'right',
-                'plot_range': {'start': 0, 'end': 999999},
-                'visibility': {'past': False, 'future': True}
-            }
-            
-        elif syntax_list['name'] == 'hlineStyleDashed':
-            return {
-                'style': 'dashed',
-                'pattern': [5, 5],
-                'type': 'horizontal'
-            }
-            
-        elif syntax_list['name'] == 'hlineStyleDotted':
-            return {
-                'style': 'dotted',
-                'pattern': [1, 1],
-                'type': 'horizontal'
-            }
-            
-        elif syntax_list['name'] == 'hlineStyleSolid':
-            return {
-                'style': 'solid',
-                'pattern': [],
-                'type': 'horizontal'
-            }
 
-        elif syntax_list['name'] == 'dayOfMonth':
-            timestamp = args[0]
-            days_since_epoch = timestamp // 86400
-            year = 1970 + (days_since_epoch // 365.25)
-            day_of_year = days_since_epoch % 365.25
-            month_days = [31, 28 + (year % 4 == 0), 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-            month = 0
-            while day_of_year > month_days[month]:
-                day_of_year -= month_days[month]
-                month += 1
-            return int(day_of_year)
-            
-        elif syntax_list['name'] == 'dayOfWeek':
-            timestamp = args[0]
-            days_since_epoch = timestamp // 86400
-            return int((days_since_epoch + 4) % 7)
-            
-        elif syntax_list['name'] == 'hour':
-            timestamp = args[0]
-            return int((timestamp % 86400) // 3600)
-            
-        elif syntax_list['name'] == 'minute':
-            timestamp = args[0]
-            return int((timestamp % 3600) // 60)
-            
-        elif syntax_list['name'] == 'month':
-            timestamp = args[0]
-            days_since_epoch = timestamp // 86400
-            year = 1970 + (days_since_epoch // 365.25)
-            day_of_year = days_since_epoch % 365.25
-            month_days = [31, 28 + (year % 4 == 0), 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-            month = 0
-            while day_of_year > month_days[month]:
-                day_of_year -= month_days[month]
-                month += 1
-            return month + 1
-            
-        elif syntax_list['name'] == 'second':
-            timestamp = args[0]
-            return int(timestamp % 60)
-            
-        elif syntax_list['name'] == 'time':
-            current_bar = args[0]
-            return current_bar['timestamp']
-            
-        elif syntax_list['name'] == 'timeClose':
-            current_bar = args[0]
-            return current_bar['timestamp'] + current_bar['duration']
-            
-        elif syntax_list['name'] == 'timeTradingDay':
-            current_bar = args[0]
-            day_start = current_bar['timestamp'] - (current_bar['timestamp'] % 86400)
-            market_open = day_start + current_bar['session']['market_open_offset']
-            return market_open
-            
-        elif syntax_list['name'] == 'timeNow':
-            return int(time.time())
-            
-        elif syntax_list['name'] == 'weekOfYear':
-            timestamp = args[0]
-            days_since_epoch = timestamp // 86400
-            year = 1970 + (days_since_epoch // 365.25)
-            day_of_year = days_since_epoch % 365.25
-            return int((day_of_year + 10) // 7)
-            
-        elif syntax_list['name'] == 'year':
-            timestamp = args[0]
-            days_since_epoch = timestamp // 86400
-            return int(1970 + (days_since_epoch // 365.25))
-
-        elif syntax_list['name'] == 'sessionIsFirstBar':
-            bar_data = args[0]
-            session_start = bar_data['session_start']
-            current_time = bar_data['timestamp']
-            return current_time == session_start
-            
-        elif syntax_list['name'] == 'sessionIsFirstBarRegular':
-            bar_data = args[0]
-            regular_session_start = bar_data['regular_session_start']
-            current_time = bar_data['timestamp']
-            return current_time == regular_session_start
-            
-        elif syntax_list['name'] == 'sessionIsLastBar':
-            bar_data = args[0]
-            session_end = bar_data['session_end']
-            current_time = bar_data['timestamp']
-            bar_duration = bar_data['duration']
-            return current_time + bar_duration == session_end
-            
-        elif syntax_list['name'] == 'sessionIsLastBarRegular':
-            bar_data = args[0]
-            regular_session_end = bar_data['regular_session_end']
-            current_time = bar_data['timestamp']
-            bar_duration = bar_data['duration']
-            return current_time + bar_duration == regular_session_end
-            
-        elif syntax_list['name'] == 'sessionIsMarket':
-            bar_data = args[0]
-            current_time = bar_data['timestamp']
-            market_start = bar_data['market_session_start']
-            market_end = bar_data['market_session_end']
-            return market_start <= current_time < market_end
-            
-        elif syntax_list['name'] == 'sessionIsPostMarket':
-            bar_data = args[0]
-            current_time = bar_data['timestamp']
-            market_end = bar_data['market_session_end']
-            session_end = bar_data['session_end']
-            return market_end <= current_time < session_end
-            
-        elif syntax_list['name'] == 'sessionIsPreMarket':
-            bar_data = args[0]
-            current_time = bar_data['timestamp']
-            session_start = bar_data['session_start']
-            market_start = bar_data['market_session_start']
-            return session_start <= current_time < market_start
-
-        elif syntax_list['name'] == 'boxAll':
-            chart_data = args[0]
-            boxes = []
-            for box in chart_data['boxes']:
-                boxes.append({
-                    'id': box['id'],
-                    'left': box['left'],
-                    'top': box['top'],
-                    'right': box['right'],
-                    'bottom': box['bottom'],
-                    'border_color': box['border_color'],
-                    'background_color': box['background_color'],
-                    'text': box['text']
-                })
-            return boxes
-            
-        elif syntax_list['name'] == 'chartBgCol':
-            chart_data = args[0]
-            return chart_data['background_color']
-            
-        elif syntax_list['name'] == 'chartFgCol':
-            chart_data = args[0]
-            return chart_data['foreground_color']
-            
-        elif syntax_list['name'] == 'chartIsHeikinAshi':
-            chart_data = args[0]
-            return chart_data['chart_type'] == 'heikin_ashi'
-            
-        elif syntax_list['name'] == 'chartIsKagi':
-            chart_data = args[0]
-            return chart_data['chart_type'] == 'kagi'
-            
-        elif syntax_list['name'] == 'chartIsLineBreak':
-            chart_data = args[0]
-            return chart_data['chart_type'] == 'line_break'
-            
-        elif syntax_list['name'] == 'chartIsPnf':
-            chart_data = args[0]
-            return chart_data['chart_type'] == 'point_and_figure'
-            
-        elif syntax_list['name'] == 'chartIsRange':
-            chart_data = args[0]
-            return chart_data['chart_type'] == 'range'
-            
-        elif syntax_list['name'] == 'chartIsRenko':
-            chart_data = args[0]
-            return chart_data['chart_type'] == 'renko'
-            
-        elif syntax_list['name'] == 'chartIsStandard':
-            chart_data = args[0]
-            return chart_data['chart_type'] == 'standard'
-            
-        elif syntax_list['name'] == 'chartLeftVisibleBarTime':
-            chart_data = args[0]
-            return chart_data['visible_range']['left_bar_time']
-            
-        elif syntax_list['name'] == 'chartRightVisibleBarTime':
-            chart_data = args[0]
-            return chart_data['visible_range']['right_bar_time']
-
-        elif syntax_list['name'] == 'labelAll':
-            chart_data = args[0]
-            labels = []
-            for label in chart_data['labels']:
-                labels.append({
-                    'id': label['id'],
-                    'x': label['x'],
-                    'y': label['y'],
-                    'text': label['text'],
-                    'color': label['color'],
-                    'style': label['style'],
-                    'size': label['size']
-                })
-            return labels
-            
-        elif syntax_list['name'] == 'lineAll':
-            chart_data = args[0]
-            lines = []
-            for line in chart_data['lines']:
-                lines.append({
-                    'id': line['id'],
-                    'x1': line['x1'],
-                    'y1': line['y1'],
-                    'x2': line['x2'],
-                    'y2': line['y2'],
-                    'color': line['color'],
-                    'width': line['width'],
-                    'style': line['style']
-                })
-            return lines
-            
-        elif syntax_list['name'] == 'lineFillAll':
-            chart_data = args[0]
-            fills = []
-            for fill in chart_data['line_fills']:
-                fills.append({
-                    'id': fill['id'],
-                    'line1_id': fill['line1_id'],
-                    'line2_id': fill['line2_id'],
-                    'color': fill['color'],
-                    'transparency': fill['transparency']
-                })
-            return fills
-            
-        elif syntax_list['name'] == 'polylineAll':
-            chart_data = args[0]
-            polylines = []
-            for polyline in chart_data['polylines']:
-                polylines.append({
-                    'id': polyline['id'],
-                    'points': polyline['points'],
-                    'color': polyline['color'],
-                    'width': polyline['width'],
-                    'style': polyline['style']
-                })
-            return polylines
-            
-        elif syntax_list['name'] == 'tableAll':
-            chart_data = args[0]
-            tables = []
-            for table in chart_data['tables']:
-                tables.append({
-                    'id': table['id'],
-                    'position': table['position'],
-                    'rows': table['rows'],
-                    'columns': table['columns'],
-                    'cells': table['cells'],
-                    'colors': table['colors'],
-                    'borders': table['borders']
-                })
-            return tables
-
-        elif syntax_list['name'] == 'andOp':
-            left_operand = args[0]
-            right_operand = args[1]
-            return bool(left_operand and right_operand)
-            
-        elif syntax_list['name'] == 'enumType':
-            enum_name = args[0]
-            enum_values = args[1]
-            enum_dict = {}
-            for i, value in enumerate(enum_values):
-                enum_dict[value] = i
-            return {
-                'name': enum_name,
-                'values': enum_dict,
-                'type': 'enum'
-            }
-            
-        elif syntax_list['name'] == 'exportFunc':
-            export_name = args[0]
-            export_value = args[1]
-            return {
-                'name': export_name,
-                'value': export_value,
-                'type': 'export'
-            }
-            
-        elif syntax_list['name'] == 'forLoop':
-            init_value = args[0]
-            condition = args[1]
-            increment = args[2]
-            body = args[3]
-            results = []
-            current = init_value
-            
-            while condition(current):
-                results.append(body(current))
-                current = increment(current)
-            return results
-            
-        elif syntax_list['name'] == 'forInLoop':
-            iterable = args[0]
-            body = args[1]
-            results = []
-            
-            for item in iterable:
-                results.append(body(item))
-            return results
-            
-        elif syntax_list['name'] == 'ifCond':
-            condition = args[0]
-            true_branch = args[1]
-            false_branch = args[2] if len(args) > 2 else None
-            
-            if condition:
-                return true_branch
-            elif false_branch is not None:
-                return false_branch
-            return None
-            
-        elif syntax_list['name'] == 'importFunc':
-            module_path = args[0]
-            import_options = args[1] if len(args) > 1 else {}
-            return {
-                'path': module_path,
-                'options': import_options,
-                'type': 'import'
-            }
+@builtin('const')
+def _syntax_const(self, *args):
+    return {
+        'type': 'constant',
+        'name': args[0],
+        'value': args[1]
+    }
 
-        elif syntax_list['name'] == 'methodFunc':
-            method_name = args[0]
-            parameters = args[1]
-            body = args[2]
-            return {
-                'name': method_name,
-                'parameters': parameters,
-                'body': body,
-                'type': 'method'
-            }
-            
-        elif syntax_list['name'] == 'notOp':
-            operand = args[0]
-            return not bool(operand)
-            
-        elif syntax_list['name'] == 'orOp':
-            left_operand = args[0]
-            right_operand = args[1]
-            return bool(left_operand or right_operand)
-            
-        elif syntax_list['name'] == 'switchCase':
-            value = args[0]
-            cases = args[1]
-            default = args[2] if len(args) > 2 else None
-            
-            for case in cases:
-                if case['value'] == value:
-                    return case['body']
-            return default
-            
-        elif syntax_list['name'] == 'typeDef':
-            type_name = args[0]
-            type_definition = args[1]
-            return {
-                'name': type_name,
-                'definition': type_definition,
-                'type': 'typedef'
-            }
-            
-        elif syntax_list['name'] == 'let':
-            variable_name = args[0]
-            initial_value = args[1]
-            return {
-                'name': variable_name,
-                'value': initial_value,
-                'type': 'variable',
-                'mutable': True
-            }
-            
-        elif syntax_list['name'] == 'letip':
-            variable_name = args[0]
-            initial_value = args[1]
-            return {
-                'name': variable_name,
-                'value': initial_value,
-                'type': 'variable',
-                'mutable': False
-            }
-            
-        elif syntax_list['name'] == 'whileLoop':
-            condition = args[0]
-            body = args[1]
-            results = []
-            
-            while condition():
-                results.append(body())
-            return results
 
-        
+@builtin('float')
+def _syntax_float(self, *args):
+    return {
+        'type': 'float',
+        'value': float(args[0]) if args else 0.0
+    }
 
-        # market data
-
-        elif syntax_list['name'] == 'open':
-            return args[0][0]
-            
-        elif syntax_list['name'] == 'high':
-            return args[0][1]
-            
-        elif syntax_list['name'] == 'low':
-            return args[0][2]
-            
-        elif syntax_list['name'] == 'close':
-            return args[0][3]
-            
-        elif syntax_list['name'] == 'volume':
-            return args[0][4]
-            
-        elif syntax_list['name'] == 'hl2':
-            return (args[0][1] + args[0][2]) / 2
-            
-        elif syntax_list['name'] == 'hlc3':
-            return (args[0][1] + args[0][2] + args[0][3]) / 3
-            
-        elif syntax_list['name'] == 'hlcc4':
-            return (args[0][1] + args[0][2] + args[0][3] + args[0][3]) / 4
-            
-        elif syntax_list['name'] == 'ohlc4':
-            return (args[0][0] + args[0][1] + args[0][2] + args[0][3]) / 4
-            
-        elif syntax_list['name'] == 'symInfoMinMove':
-            return {
-                'type': 'numeric',
-                'value': args[0]['instrument_details']['minimum_price_movement'],
-                'decimals': args[0]['instrument_details']['price_decimals']
-            }
-            
-        elif syntax_list['name'] == 'symInfoMinTick':
-            return {
-                'type': 'numeric',
-                'value': args[0]['instrument_details']['minimum_tick_size'],
-                'decimals': args[0]['instrument_details']['price_decimals']
-            }
-            
-        elif syntax_list['name'] == 'symInfoPointValue':
-            return {
-                'type': 'numeric',
-                'value': args[0]['instrument_details']['contract_size'],
-                'currency': args[0]['instrument_details']['currency']
-            }
-            
-        elif syntax_list['name'] == 'symInfoPrefix':
-            return {
-                'type': 'string',
-                'exchange': args[0]['exchange']['code'],
-                'market': args[0]['market']['code'],
-                'value': args[0]['exchange']['code'] + ':' + args[0]['market']['code']
-            }
-            
-        elif syntax_list['name'] == 'symInfoPriceScale':
-            return {
-                'type': 'numeric',
-                'value': 10 ** args[0]['instrument_details']['price_decimals'],
-                'decimals': args[0]['instrument_details']['price_decimals']
-            }
-            
-        elif syntax_list['name'] == 'symInfoRoot':
-            return {
-                'type': 'string',
-                'value': args[0]['instrument_details']['root_symbol'],
-                'description': args[0]['instrument_details']['description']
-            }
-            
-        elif syntax_list['name'] == 'symInfoSector':
-            return {
-                'type': 'string',
-                'sector': args[0]['company']['sector'],
-                'industry': args[0]['company']['industry'],
-                'category': args[0]['company']['category']
-            }
-            
-        elif syntax_list['name'] == 'symInfoSession':
-            return {
-                'type': 'object',
-                'regular': {
-                    'start': args[0]['session']['regular']['start'],
-                    'end': args[0]['session']['regular']['end'],
-                    'timezone': args[0]['session']['timezone']
-                },
-                'extended': {
-                    'pre_market': {
-                        'start': args[0]['session']['pre_market']['start'],
-                        'end': args[0]['session']['pre_market']['end']
-                    },
-                    'post_market': {
-                        'start': args[0]['session']['post_market']['start'],
-                        'end': args[0]['session']['post_market']['end']
-                    }
-                }
-            }
-            
-        elif syntax_list['name'] == 'symInfoShareholders':
-            return {
-                'type': 'object',
-                'institutional': {
-                    'count': args[0]['shareholders']['institutional']['count'],
-                    'ownership_percent': args[0]['shareholders']['institutional']['ownership_percent']
-                },
-                'individual': {
-                    'count': args[0]['shareholders']['individual']['count'],
-                    'ownership_percent': args[0]['shareholders']['individual']['ownership_percent']
-                }
-            }
-            
-        elif syntax_list['name'] == 'symInfoSharesOutstandingFloat':
-            return {
-                'type': 'numeric',
-                'value': args[0]['shares']['float'],
-                'last_update': args[0]['shares']['float_date']
-            }
-            
-        elif syntax_list['name'] == 'symInfoSharesOutstandingTotal':
-            return {
-                'type': 'numeric',
-                'value': args[0]['shares']['total'],
-                'last_update': args[0]['shares']['total_date']
-            }
 
+@builtin('int')
+def _syntax_int(self, *args):
+    return {
+        'type': 'integer',
+        'value': int(args[0]) if args else 0
+    }
 
 
-        # ta indicators
-
-        elif syntax_list['name'] == 'sma':
-            period = args[1]
-            values = args[0]
-            if len(values) < period:
-                return float('nan')
-            return sum(values[-period:]) / period
-            
-        elif syntax_list['name'] == 'ema':
-            period = args[1]
-            values = args[0]
-            if len(values) < period:
-                return float('nan')
-            alpha = 2 / (period + 1)
-            result = values[0]
-            for i in range(1, len(values)):
-                result = alpha * values[i] + (1 - alpha) * result
-            return result
-            
-        elif syntax_list['name'] == 'rsi':
-            period = args[1]
-            values = args[0]
-            if len(values) < period + 1:
-                return float('nan')
-            gains = []
-            losses = []
-            for i in range(1, len(values)):
-                change = values[i] - values[i-1]
-                gains.append(max(change, 0))
-                losses.append(max(-change, 0))
-            avg_gain = sum(gains[-period:]) / period
-            avg_loss = sum(losses[-period:]) / period
-            if avg_loss == 0:
-                return 100
-            rs = avg_gain / avg_loss
-            return 100 - (100 / (1 + rs))
-            
-        elif syntax_list['name'] == 'minvalue':
-            return min(args[0])
-            
-        elif syntax_list['name'] == 'maxvalue':
-            return max(args[0])
-            
-        elif syntax_list['name'] == 'taAccDist':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            volume = args[3]
-            mfm = ((close - low) - (high - close)) / (high - low) if high != low else 0
-            return mfm * volume
-            
-        elif syntax_list['name'] == 'taIII':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            volume = args[3]
-            return (2 * close - high - low) / (high - low) * volume if high != low else 0
-            
-        elif syntax_list['name'] == 'taNVI':
-            close = args[0]
-            volume = args[1]
-            if len(close) < 2:
-                return 1000
-            prev_volume = volume[-2]
-            curr_volume = volume[-1]
-            if curr_volume < prev_volume:
-                return (close[-1] - close[-2]) / close[-2] * 1000
-            return 1000
-            
-        elif syntax_list['name'] == 'taOBV':
-            close = args[0]
-            volume = args[1]
-            if len(close) < 2:
-                return 0
-            prev_close = close[-2]
-            curr_close = close[-1]
-            if curr_close > prev_close:
-                return volume[-1]
-            elif curr_close < prev_close:
-                return -volume[-1]
-            return 0
-            
-        elif syntax_list['name'] == 'taPVI':
-            close = args[0]
-            volume = args[1]
-            if len(close) < 2:
-                return 1000
-            prev_volume = volume[-2]
-            curr_volume = volume[-1]
-            if curr_volume > prev_volume:
-                return (close[-1] - close[-2]) / close[-2] * 1000
-            return 1000
-            
-        elif syntax_list['name'] == 'taPVT':
-            close = args[0]
-            volume = args[1]
-            if len(close) < 2:
-                return 0
-            return ((close[-1] - close[-2]) / close[-2]) * volume[-1]
-            
-        elif syntax_list['name'] == 'taTR':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            if len(close) < 2:
-                return high[-1] - low[-1]
-            prev_close = close[-2]
-            return max(high[-1] - low[-1], abs(high[-1] - prev_close), abs(low[-1] - prev_close))
-            
-        elif syntax_list['name'] == 'taVWAP':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            volume = args[3]
-            typical_price = (high + low + close) / 3
-            return sum(typical_price * volume) / sum(volume)
-
-        elif syntax_list['name'] == 'taWAD':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            if len(close) < 2:
-                return 0
-            prev_close = close[-2]
-            if close[-1] > prev_close:
-                return close[-1] - min(low[-1], prev_close)
-            else:
-                return close[-1] - max(high[-1], prev_close)
-                
-        elif syntax_list['name'] == 'taWVAD':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            volume = args[3]
-            if len(close) < 2:
-                return 0
-            prev_close = close[-2]
-            if close[-1] > prev_close:
-                return (close[-1] - min(low[-1], prev_close)) * volume[-1]
-            else:
-                return (close[-1] - max(high[-1], prev_close)) * volume[-1]
-                
-        elif syntax_list['name'] == 'taAlma':
-            data = args[0]
-            window = args[1]
-            offset = args[2]
-            sigma = args[3]
-            m = offset * (window - 1)
-            s = window / sigma
-            weights = []
-            norm = 0
-            
-            for i in range(window):
-                w = exp(-((i - m) * (i - m)) / (2 * s * s))
-                weights.append(w)
-                norm += w
-                
-            for i in range(window):
-                weights[i] /= norm
-                
-            result = 0
-            for i in range(window):
-                result += data[-i-1] * weights[i]
-            return result
-            
-        elif syntax_list['name'] == 'taAtr':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            period = args[3]
-            tr_values = []
-            
-            for i in range(len(close)):
-                if i == 0:
-                    tr = high[i] - low[i]
-                else:
-                    tr = max(high[i] - low[i],
-                            abs(high[i] - close[i-1]),
-                            abs(low[i] - close[i-1]))
-                tr_values.append(tr)
-                
-            if len(tr_values) < period:
-                return float('nan')
-                
-            return sum(tr_values[-period:]) / period
-        
-        elif syntax_list['name'] == 'taBarsSince':
-            condition = args[0]
-            count = 0
-            for i in reversed(range(len(condition))):
-                if not condition[i]:
-                    count += 1
-                else:
-                    break
-            return count
-            
-        elif syntax_list['name'] == 'taBb':
-            data = args[0]
-            period = args[1]
-            mult = args[2]
-            if len(data) < period:
-                return float('nan')
-            sma = sum(data[-period:]) / period
-            variance = sum((x - sma) ** 2 for x in data[-period:]) / period
-            std = variance ** 0.5
-            return {
-                'middle': sma,
-                'upper': sma + mult * std,
-                'lower': sma - mult * std
-            }
-            
-        elif syntax_list['name'] == 'taBbw':
-            data = args[0]
-            period = args[1]
-            mult = args[2]
-            if len(data) < period:
-                return float('nan')
-            sma = sum(data[-period:]) / period
-            variance = sum((x - sma) ** 2 for x in data[-period:]) / period
-            std = variance ** 0.5
-            return ((sma + mult * std) - (sma - mult * std)) / sma * 100
-            
-        elif syntax_list['name'] == 'taCci':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            period = args[3]
-            if len(close) < period:
-                return float('nan')
-            tp = [(h + l + c) / 3 for h, l, c in zip(high[-period:], low[-period:], close[-period:])]
-            sma = sum(tp) / period
-            mean_dev = sum(abs(x - sma) for x in tp) / period
-            return (tp[-1] - sma) / (0.015 * mean_dev) if mean_dev != 0 else 0
-            
-        elif syntax_list['name'] == 'taChange':
-            data = args[0]
-            if len(data) < 2:
-                return float('nan')
-            return data[-1] - data[-2]
-            
-        elif syntax_list['name'] == 'taCmo':
-            data = args[0]
-            period = args[1]
-            if len(data) < period + 1:
-                return float('nan')
-            ups = []
-            downs = []
-            for i in range(1, period + 1):
-                change = data[-i] - data[-i-1]
-                ups.append(max(change, 0))
-                downs.append(max(-change, 0))
-            sum_ups = sum(ups)
-            sum_downs = sum(downs)
-            return 100 * (sum_ups - sum_downs) / (sum_ups + sum_downs) if (sum_ups + sum_downs) != 0 else 0
-
-        elif syntax_list['name'] == 'taCog':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            numerator = 0
-            denominator = 0
-            for i in range(period):
-                numerator += (i + 1) * data[-i-1]
-                denominator += data[-i-1]
-            return -numerator / denominator if denominator != 0 else 0
-            
-        elif syntax_list['name'] == 'taCorrelation':
-            data1 = args[0]
-            data2 = args[1]
-            period = args[2]
-            if len(data1) < period or len(data2) < period:
-                return float('nan')
-            x = data1[-period:]
-            y = data2[-period:]
-            mean_x = sum(x) / period
-            mean_y = sum(y) / period
-            covar = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(period))
-            var_x = sum((val - mean_x) ** 2 for val in x)
-            var_y = sum((val - mean_y) ** 2 for val in y)
-            return covar / ((var_x * var_y) ** 0.5) if var_x != 0 and var_y != 0 else 0
-            
-        elif syntax_list['name'] == 'taCross':
-            data1 = args[0]
-            data2 = args[1]
-            if len(data1) < 2 or len(data2) < 2:
-                return False
-            return (data1[-2] <= data2[-2] and data1[-1] > data2[-1]) or (data1[-2] >= data2[-2] and data1[-1] < data2[-1])
-            
-        elif syntax_list['name'] == 'taCrossover':
-            data1 = args[0]
-            data2 = args[1]
-            if len(data1) < 2 or len(data2) < 2:
-                return False
-            return data1[-2] <= data2[-2] and data1[-1] > data2[-1]
-            
-        elif syntax_list['name'] == 'taCrossunder':
-            data1 = args[0]
-            data2 = args[1]
-            if len(data1) < 2 or len(data2) < 2:
-                return False
-            return data1[-2] >= data2[-2] and data1[-1] < data2[-1]
-            
-        elif syntax_list['name'] == 'taCum':
-            data = args[0]
-            result = 0
-            for value in data:
-                result += value
-            return result
+@builtin('label')
+def _syntax_label(self, *args):
+    return {
+        'type': 'label',
+        'text': args[0] if args else '',
+        'x': args[1] if len(args) > 1 else 0,
+        'y': args[2] if len(args) > 2 else 0
+    }
 
-        elif syntax_list['name'] == 'taDev':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            mean = sum(data[-period:]) / period
-            return sum(abs(x - mean) for x in data[-period:]) / period
-            
-        elif syntax_list['name'] == 'taDmi':
-            high = args[0]
-            low = args[1]
-            period = args[2]
-            if len(high) < period + 1:
-                return float('nan')
-            tr_list = []
-            plus_dm_list = []
-            minus_dm_list = []
-            
-            for i in range(1, len(high)):
-                tr = max(high[i] - low[i],
-                        abs(high[i] - low[i-1]),
-                        abs(low[i] - high[i-1]))
-                plus_dm = max(high[i] - high[i-1], 0) if high[i] - high[i-1] > low[i-1] - low[i] else 0
-                minus_dm = max(low[i-1] - low[i], 0) if low[i-1] - low[i] > high[i] - high[i-1] else 0
-                tr_list.append(tr)
-                plus_dm_list.append(plus_dm)
-                minus_dm_list.append(minus_dm)
-                
-            tr_sum = sum(tr_list[-period:])
-            plus_dm_sum = sum(plus_dm_list[-period:])
-            minus_dm_sum = sum(minus_dm_list[-period:])
-            
-            plus_di = 100 * plus_dm_sum / tr_sum if tr_sum != 0 else 0
-            minus_di = 100 * minus_dm_sum / tr_sum if tr_sum != 0 else 0
-            dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di) if (plus_di + minus_di) != 0 else 0
-            
-            return {
-                'plus_di': plus_di,
-                'minus_di': minus_di,
-                'dx': dx
-            }
-            
-        elif syntax_list['name'] == 'taEma':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            alpha = 2 / (period + 1)
-            result = data[0]
-            for i in range(1, len(data)):
-                result = alpha * data[i] + (1 - alpha) * result
-            return result
-            
-        elif syntax_list['name'] == 'taFalling':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return False
-            for i in range(1, period):
-                if data[-i] >= data[-i-1]:
-                    return False
-            return True
 
-        elif syntax_list['name'] == 'taHighest':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return max(data[-period:])
-            
-        elif syntax_list['name'] == 'taHighestBars':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            highest = max(data[-period:])
-            for i in range(period):
-                if data[-i-1] == highest:
-                    return i
-            return 0
-            
-        elif syntax_list['name'] == 'taHma':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            
-            half_period = period // 2
-            sqrt_period = int(period ** 0.5)
-            
-            wma1 = []
-            wma2 = []
-            for i in range(len(data) - period + 1):
-                sum1 = sum((j + 1) * data[i + j] for j in range(half_period))
-                div1 = sum(j + 1 for j in range(half_period))
-                wma1.append(sum1 / div1 if div1 != 0 else 0)
-                
-                sum2 = sum((j + 1) * data[i + j] for j in range(period))
-                div2 = sum(j + 1 for j in range(period))
-                wma2.append(sum2 / div2 if div2 != 0 else 0)
-            
-            raw = [2 * wma1[i] - wma2[i] for i in range(len(wma1))]
-            
-            final_sum = sum((j + 1) * raw[-(sqrt_period-j)] for j in range(sqrt_period))
-            final_div = sum(j + 1 for j in range(sqrt_period))
-            
-            return final_sum / final_div if final_div != 0 else 0
-            
-        elif syntax_list['name'] == 'taKc':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            period = args[3]
-            mult = args[4]
-            if len(close) < period:
-                return float('nan')
-                
-            typical_prices = [(h + l + c) / 3 for h, l, c in zip(high[-period:], low[-period:], close[-period:])]
-            sma = sum(typical_prices) / period
-            
-            mean_dev = sum(abs(tp - sma) for tp in typical_prices) / period
-            
-            return {
-                'middle': sma,
-                'upper': sma + mult * mean_dev,
-                'lower': sma - mult * mean_dev
-            }
+# table
 
-        elif syntax_list['name'] == 'taKcw':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            period = args[3]
-            mult = args[4]
-            if len(close) < period:
-                return float('nan')
-                
-            typical_prices = [(h + l + c) / 3 for h, l, c in zip(high[-period:], low[-period:], close[-period:])]
-            sma = sum(typical_prices) / period
-            mean_dev = sum(abs(tp - sma) for tp in typical_prices) / period
-            
-            return (2 * mult * mean_dev) / sma * 100
-            
-        elif syntax_list['name'] == 'taLinReg':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-                
-            x = list(range(period))
-            y = data[-period:]
-            sum_x = sum(x)
-            sum_y = sum(y)
-            sum_xy = sum(x[i] * y[i] for i in range(period))
-            sum_xx = sum(x[i] * x[i] for i in range(period))
-            
-            slope = (period * sum_xy - sum_x * sum_y) / (period * sum_xx - sum_x * sum_x)
-            intercept = (sum_y - slope * sum_x) / period
-            
-            return slope * (period - 1) + intercept
-            
-        elif syntax_list['name'] == 'taLowest':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return min(data[-period:])
-            
-        elif syntax_list['name'] == 'taLowestBars':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            lowest = min(data[-period:])
-            for i in range(period):
-                if data[-i-1] == lowest:
-                    return i
-            return 0
-            
-        elif syntax_list['name'] == 'taMacd':
-            data = args[0]
-            fast_length = args[1]
-            slow_length = args[2]
-            signal_length = args[3]
-            if len(data) < max(fast_length, slow_length, signal_length):
-                return float('nan')
-                
-            alpha_fast = 2 / (fast_length + 1)
-            alpha_slow = 2 / (slow_length + 1)
-            alpha_signal = 2 / (signal_length + 1)
-            
-            ema_fast = data[0]
-            ema_slow = data[0]
-            for price in data[1:]:
-                ema_fast = alpha_fast * price + (1 - alpha_fast) * ema_fast
-                ema_slow = alpha_slow * price + (1 - alpha_slow) * ema_slow
-                
-            macd_line = ema_fast - ema_slow
-            signal_line = alpha_signal * macd_line + (1 - alpha_signal) * (ema_fast - ema_slow)
-            histogram = macd_line - signal_line
-            
-            return {
-                'macd': macd_line,
-                'signal': signal_line,
-                'histogram': histogram
-            }
-        
-        elif syntax_list['name'] == 'taMax':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return max(data[-period:])
-            
-        elif syntax_list['name'] == 'taMedian':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            sorted_data = sorted(data[-period:])
-            mid = period // 2
-            return sorted_data[mid] if period % 2 else (sorted_data[mid-1] + sorted_data[mid]) / 2
-            
-        elif syntax_list['name'] == 'taMfi':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            volume = args[3]
-            period = args[4]
-            if len(close) < period + 1:
-                return float('nan')
-                
-            typical_prices = [(h + l + c) / 3 for h, l, c in zip(high, low, close)]
-            money_flows = [tp * v for tp, v in zip(typical_prices, volume)]
-            
-            pos_flows = []
-            neg_flows = []
-            for i in range(1, len(typical_prices)):
-                if typical_prices[i] > typical_prices[i-1]:
-                    pos_flows.append(money_flows[i])
-                    neg_flows.append(0)
-                else:
-                    pos_flows.append(0)
-                    neg_flows.append(money_flows[i])
-                    
-            pos_sum = sum(pos_flows[-period:])
-            neg_sum = sum(neg_flows[-period:])
-            
-            return 100 * pos_sum / (pos_sum + neg_sum) if (pos_sum + neg_sum) != 0 else 50
-            
-        elif syntax_list['name'] == 'taMin':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return min(data[-period:])
-            
-        elif syntax_list['name'] == 'taMode':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            values = data[-period:]
-            counts = {}
-            for value in values:
-                counts[value] = counts.get(value, 0) + 1
-            max_count = max(counts.values())
-            modes = [k for k, v in counts.items() if v == max_count]
-            return modes[0]
-
-        elif syntax_list['name'] == 'taMom':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return data[-1] - data[-period]
-            
-        elif syntax_list['name'] == 'taPercentile':
-            data = args[0]
-            period = args[1]
-            percentage = args[2]
-            if len(data) < period:
-                return float('nan')
-            sorted_data = sorted(data[-period:])
-            index = (period - 1) * percentage / 100
-            lower_idx = int(index)
-            fraction = index - lower_idx
-            if lower_idx + 1 >= period:
-                return sorted_data[-1]
-            return sorted_data[lower_idx] + fraction * (sorted_data[lower_idx + 1] - sorted_data[lower_idx])
-            
-        elif syntax_list['name'] == 'taPercentRank':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            current = data[-1]
-            window = data[-period:]
-            count = sum(1 for x in window if x < current)
-            return 100 * count / (period - 1)
-            
-        elif syntax_list['name'] == 'taPivotHigh':
-            data = args[0]
-            left_bars = args[1]
-            right_bars = args[2]
-            if len(data) < left_bars + right_bars + 1:
-                return float('nan')
-            center_idx = -right_bars - 1
-            value = data[center_idx]
-            for i in range(-right_bars - left_bars - 1, -right_bars):
-                if data[i] > value:
-                    return float('nan')
-            for i in range(-right_bars, 0):
-                if data[i] >= value:
-                    return float('nan')
-            return value
-            
-        elif syntax_list['name'] == 'taPivotLow':
-            data = args[0]
-            left_bars = args[1]
-            right_bars = args[2]
-            if len(data) < left_bars + right_bars + 1:
-                return float('nan')
-            center_idx = -right_bars - 1
-            value = data[center_idx]
-            for i in range(-right_bars - left_bars - 1, -right_bars):
-                if data[i] < value:
-                    return float('nan')
-            for i in range(-right_bars, 0):
-                if data[i] <= value:
-                    return float('nan')
-            return value
-
-        elif syntax_list['name'] == 'taRange':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return max(data[-period:]) - min(data[-period:])
-            
-        elif syntax_list['name'] == 'taRising':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return False
-            for i in range(1, period):
-                if data[-i] <= data[-i-1]:
-                    return False
-            return True
-            
-        elif syntax_list['name'] == 'taRma':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            alpha = 1 / period
-            result = sum(data[:period]) / period
-            for i in range(period, len(data)):
-                result = alpha * data[i] + (1 - alpha) * result
-            return result
-            
-        elif syntax_list['name'] == 'taRoc':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return ((data[-1] - data[-period]) / data[-period]) * 100 if data[-period] != 0 else float('nan')
-            
-        elif syntax_list['name'] == 'taRsi':
-            data = args[0]
-            period = args[1]
-            if len(data) < period + 1:
-                return float('nan')
-            gains = []
-            losses = []
-            for i in range(1, len(data)):
-                change = data[i] - data[i-1]
-                gains.append(max(change, 0))
-                losses.append(max(-change, 0))
-            avg_gain = sum(gains[-period:]) / period
-            avg_loss = sum(losses[-period:]) / period
-            if avg_loss == 0:
-                return 100
-            rs = avg_gain / avg_loss
-            return 100 - (100 / (1 + rs))
-
-        elif syntax_list['name'] == 'taSar':
-            high = args[0]
-            low = args[1]
-            acceleration = args[2]
-            maximum = args[3]
-            if len(high) < 2:
-                return float('nan')
-            trend = 1  # 1 for up, -1 for down
-            sar = low[0]
-            extreme_point = high[0]
-            acc_factor = acceleration
-            
-            for i in range(1, len(high)):
-                if trend == 1:
-                    sar = sar + acc_factor * (extreme_point - sar)
-                    if low[i] < sar:
-                        trend = -1
-                        sar = extreme_point
-                        extreme_point = low[i]
-                        acc_factor = acceleration
-                    else:
-                        if high[i] > extreme_point:
-                            extreme_point = high[i]
-                            acc_factor = min(acc_factor + acceleration, maximum)
-                else:
-                    sar = sar - acc_factor * (sar - extreme_point)
-                    if high[i] > sar:
-                        trend = 1
-                        sar = extreme_point
-                        extreme_point = high[i]
-                        acc_factor = acceleration
-                    else:
-                        if low[i] < extreme_point:
-                            extreme_point = low[i]
-                            acc_factor = min(acc_factor + acceleration, maximum)
-            return sar
-            
-        elif syntax_list['name'] == 'taSma':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            return sum(data[-period:]) / period
-            
-        elif syntax_list['name'] == 'taStdev':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            mean = sum(data[-period:]) / period
-            squared_diff_sum = sum((x - mean) ** 2 for x in data[-period:])
-            return (squared_diff_sum / period) ** 0.5
-            
-        elif syntax_list['name'] == 'taStoch':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            period = args[3]
-            smooth_k = args[4]
-            smooth_d = args[5]
-            if len(close) < period:
-                return float('nan')
-                
-            k_raw = 100 * (close[-1] - min(low[-period:])) / (max(high[-period:]) - min(low[-period:]))
-            k = sum([k_raw] * smooth_k) / smooth_k
-            d = sum([k] * smooth_d) / smooth_d
-            
-            return {
-                'k': k,
-                'd': d
-            }
+@builtin('tableFunc')
+def _syntax_tableFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'create',
+        'id': args[0] if args else 'default_table',
+        'rows': 1,
+        'columns': 1
+    }
 
-        elif syntax_list['name'] == 'taSuperTrend':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            period = args[3]
-            multiplier = args[4]
-            if len(close) < period:
-                return float('nan')
-                
-            tr_list = []
-            for i in range(1, len(high)):
-                tr = max(high[i] - low[i],
-                        abs(high[i] - close[i-1]),
-                        abs(low[i] - close[i-1]))
-                tr_list.append(tr)
-                
-            atr = sum(tr_list[-period:]) / period
-            
-            upper_band = (high[-1] + low[-1]) / 2 + multiplier * atr
-            lower_band = (high[-1] + low[-1]) / 2 - multiplier * atr
-            
-            supertrend = upper_band if close[-1] <= upper_band else lower_band
-            
-            return {
-                'supertrend': supertrend,
-                'direction': -1 if close[-1] > supertrend else 1
-            }
-            
-        elif syntax_list['name'] == 'taSwma':
-            data = args[0]
-            if len(data) < 4:
-                return float('nan')
-            weights = [1/6, 2/6, 2/6, 1/6]
-            return sum(w * d for w, d in zip(weights, data[-4:]))
-            
-        elif syntax_list['name'] == 'taTsi':
-            data = args[0]
-            r_period = args[1]
-            s_period = args[2]
-            if len(data) < max(r_period, s_period):
-                return float('nan')
-                
-            momentum = [data[i] - data[i-1] for i in range(1, len(data))]
-            
-            smooth1 = []
-            value = momentum[0]
-            for price in momentum[1:]:
-                value = (2 / (r_period + 1)) * price + (1 - (2 / (r_period + 1))) * value
-                smooth1.append(value)
-                
-            smooth2 = []
-            value = smooth1[0]
-            for price in smooth1[1:]:
-                value = (2 / (s_period + 1)) * price + (1 - (2 / (s_period + 1))) * value
-                smooth2.append(value)
-                
-            abs_momentum = [abs(x) for x in momentum]
-            
-            abs_smooth1 = []
-            value = abs_momentum[0]
-            for price in abs_momentum[1:]:
-                value = (2 / (r_period + 1)) * price + (1 - (2 / (r_period + 1))) * value
-                abs_smooth1.append(value)
-                
-            abs_smooth2 = []
-            value = abs_smooth1[0]
-            for price in abs_smooth1[1:]:
-                value = (2 / (s_period + 1)) * price + (1 - (2 / (s_period + 1))) * value
-                abs_smooth2.append(value)
-                
-            return 100 * (smooth2[-1] / abs_smooth2[-1]) if abs_smooth2[-1] != 0 else 0
-
-        elif syntax_list['name'] == 'taValueWhen':
-            condition = args[0]
-            source = args[1]
-            occurrence = args[2]
-            if len(condition) != len(source):
-                return float('nan')
-            count = 0
-            for i in reversed(range(len(condition))):
-                if condition[i]:
-                    if count == occurrence:
-                        return source[i]
-                    count += 1
-            return float('nan')
-            
-        elif syntax_list['name'] == 'taVariance':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            mean = sum(data[-period:]) / period
-            return sum((x - mean) ** 2 for x in data[-period:]) / period
-            
-        elif syntax_list['name'] == 'taVwap':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            volume = args[3]
-            typical_price = [(h + l + c) / 3 for h, l, c in zip(high, low, close)]
-            return sum(tp * v for tp, v in zip(typical_price, volume)) / sum(volume) if sum(volume) != 0 else float('nan')
-            
-        elif syntax_list['name'] == 'taVwma':
-            data = args[0]
-            volume = args[1]
-            period = args[2]
-            if len(data) < period:
-                return float('nan')
-            return sum(d * v for d, v in zip(data[-period:], volume[-period:])) / sum(volume[-period:]) if sum(volume[-period:]) != 0 else float('nan')
-            
-        elif syntax_list['name'] == 'taWma':
-            data = args[0]
-            period = args[1]
-            if len(data) < period:
-                return float('nan')
-            weights = list(range(1, period + 1))
-            weighted_sum = sum(w * d for w, d in zip(weights, data[-period:]))
-            return weighted_sum / sum(weights)
-            
-        elif syntax_list['name'] == 'taWpr':
-            high = args[0]
-            low = args[1]
-            close = args[2]
-            period = args[3]
-            if len(close) < period:
-                return float('nan')
-            highest_high = max(high[-period:])
-            lowest_low = min(low[-period:])
-            return -100 * (highest_high - close[-1]) / (highest_high - lowest_low) if (highest_high - lowest_low) != 0 else 0
-
-
-        # strategy 
-
-        elif syntax_list['name'] == 'strategyAccountCurrency':
-            return args[0]['account']['currency']
-            
-        elif syntax_list['name'] == 'strategyAvgLosingTrade':
-            total_loss = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
-            loss_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] < 0)
-            return total_loss / loss_count if loss_count > 0 else 0
-            
-        elif syntax_list['name'] == 'strategyAvgLosingTradePercent':
-            total_loss_percent = sum(trade['profit_percent'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
-            loss_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] < 0)
-            return total_loss_percent / loss_count if loss_count > 0 else 0
-            
-        elif syntax_list['name'] == 'strategyAvgTrade':
-            total_profit = sum(trade['profit'] for trade in args[0]['closed_trades'])
-            trade_count = len(args[0]['closed_trades'])
-            return total_profit / trade_count if trade_count > 0 else 0
-            
-        elif syntax_list['name'] == 'strategyAvgTradePercent':
-            total_profit_percent = sum(trade['profit_percent'] for trade in args[0]['closed_trades'])
-            trade_count = len(args[0]['closed_trades'])
-            return total_profit_percent / trade_count if trade_count > 0 else 0
-            
-        elif syntax_list['name'] == 'strategyAvgWinningTrade':
-            total_win = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
-            win_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] > 0)
-            return total_win / win_count if win_count > 0 else 0
-            
-        elif syntax_list['name'] == 'strategyAvgWinningTradePercent':
-            total_win_percent = sum(trade['profit_percent'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
-            win_count = sum(1 for trade in args[0]['closed_trades'] if trade['profit'] > 0)
-            return total_win_percent / win_count if win_count > 0 else 0
-            
-        elif syntax_list['name'] == 'strategyClosedTrades':
-            return len(args[0]['closed_trades'])
-            
-        elif syntax_list['name'] == 'strategyClosedTradesFirstIndex':
-            return args[0]['closed_trades'][0]['entry_bar_index'] if args[0]['closed_trades'] else 0
-            
-        elif syntax_list['name'] == 'strategyEquity':
-            return args[0]['account']['initial_capital'] + args[0]['net_profit']
-            
-        elif syntax_list['name'] == 'strategyEvenTrades':
-            return sum(1 for trade in args[0]['closed_trades'] if trade['profit'] == 0)
-
-        elif syntax_list['name'] == 'strategyGrossLoss':
-            return sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
-            
-        elif syntax_list['name'] == 'strategyGrossLossPercent':
-            initial_capital = args[0]['account']['initial_capital']
-            gross_loss = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] < 0)
-            return (gross_loss / initial_capital) * 100 if initial_capital != 0 else 0
-            
-        elif syntax_list['name'] == 'strategyGrossProfit':
-            return sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
-            
-        elif syntax_list['name'] == 'strategyGrossProfitPercent':
-            initial_capital = args[0]['account']['initial_capital']
-            gross_profit = sum(trade['profit'] for trade in args[0]['closed_trades'] if trade['profit'] > 0)
-            return (gross_profit / initial_capital) * 100 if initial_capital != 0 else 0
-            
-        elif syntax_list['name'] == 'strategyInitialCapital':
-            return args[0]['account']['initial_capital']
-            
-        elif syntax_list['name'] == 'strategyLossTrades':
-            return sum(1 for trade in args[0]['closed_trades'] if trade['profit'] < 0)
-            
-        elif syntax_list['name'] == 'strategyMarginLiquidationPrice':
-            position = args[0]['position']
-            margin_requirement = args[0]['account']['margin_requirement']
-            return position['entry_price'] * (1 - margin_requirement) if position['direction'] == 'long' else position['entry_price'] * (1 + margin_requirement)
-            
-        elif syntax_list['name'] == 'strategyMaxContractsHeldAll':
-            return max(trade['contracts'] for trade in args[0]['all_trades'])
-            
-        elif syntax_list['name'] == 'strategyMaxContractsHeldLong':
-            return max((trade['contracts'] for trade in args[0]['all_trades'] if trade['direction'] == 'long'), default=0)
-            
-        elif syntax_list['name'] == 'strategyMaxContractsHeldShort':
-            return max((trade['contracts'] for trade in args[0]['all_trades'] if trade['direction'] == 'short'), default=0)
-
-        elif syntax_list['name'] == 'strategyMaxDrawdown':
-            equity_curve = []
-            current_equity = args[0]['account']['initial_capital']
-            for trade in args[0]['closed_trades']:
-                current_equity += trade['profit']
-                equity_curve.append(current_equity)
-            
-            max_drawdown = 0
-            peak = equity_curve[0]
-            for equity in equity_curve:
-                if equity > peak:
-                    peak = equity
-                drawdown = peak - equity
-                max_drawdown = max(max_drawdown, drawdown)
-            return max_drawdown
-            
-        elif syntax_list['name'] == 'strategyMaxDrawdownPercent':
-            equity_curve = []
-            current_equity = args[0]['account']['initial_capital']
-            for trade in args[0]['closed_trades']:
-                current_equity += trade['profit']
-                equity_curve.append(current_equity)
-            
-            max_drawdown_percent = 0
-            peak = equity_curve[0]
-            for equity in equity_curve:
-                if equity > peak:
-                    peak = equity
-                drawdown_percent = ((peak - equity) / peak) * 100 if peak != 0 else 0
-                max_drawdown_percent = max(max_drawdown_percent, drawdown_percent)
-            return max_drawdown_percent
-            
-        elif syntax_list['name'] == 'strategyMaxRunup':
-            equity_curve = []
-            current_equity = args[0]['account']['initial_capital']
-            for trade in args[0]['closed_trades']:
-                current_equity += trade['profit']
-                equity_curve.append(current_equity)
-            
-            max_runup = 0
-            trough = equity_curve[0]
-            for equity in equity_curve:
-                if equity < trough:
-                    trough = equity
-                runup = equity - trough
-                max_runup = max(max_runup, runup)
-            return max_runup
-            
-        elif syntax_list['name'] == 'strategyMaxRunupPercent':
-            equity_curve = []
-            current_equity = args[0]['account']['initial_capital']
-            for trade in args[0]['closed_trades']:
-                current_equity += trade['profit']
-                equity_curve.append(current_equity)
-            
-            max_runup_percent = 0
-            trough = equity_curve[0]
-            for equity in equity_curve:
-                if equity < trough:
-                    trough = equity
-                runup_percent = ((equity - trough) / trough) * 100 if trough != 0 else 0
-                max_runup_percent = max(max_runup_percent, runup_percent)
-            return max_runup_percent
-
-        elif syntax_list['name'] == 'strategyNetProfit':
-            return sum(trade['profit'] for trade in args[0]['closed_trades'])
-            
-        elif syntax_list['name'] == 'strategyNetProfitPercent':
-            initial_capital = args[0]['account']['initial_capital']
-            net_profit = sum(trade['profit'] for trade in args[0]['closed_trades'])
-            return (net_profit / initial_capital) * 100 if initial_capital != 0 else 0
-            
-        elif syntax_list['name'] == 'strategyOpenProfit':
-            return sum(trade['unrealized_profit'] for trade in args[0]['open_trades'])
-            
-        elif syntax_list['name'] == 'strategyOpenProfitPercent':
-            initial_capital = args[0]['account']['initial_capital']
-            open_profit = sum(trade['unrealized_profit'] for trade in args[0]['open_trades'])
-            return (open_profit / initial_capital) * 100 if initial_capital != 0 else 0
-            
-        elif syntax_list['name'] == 'strategyOpenTrades':
-            return len(args[0]['open_trades'])
-            
-        elif syntax_list['name'] == 'strategyOpenTradesCapitalHeld':
-            return sum(trade['margin_required'] for trade in args[0]['open_trades'])
-            
-        elif syntax_list['name'] == 'strategyPositionAvgPrice':
-            open_positions = args[0]['open_trades']
-            total_cost = sum(trade['entry_price'] * trade['contracts'] for trade in open_positions)
-            total_contracts = sum(trade['contracts'] for trade in open_positions)
-            return total_cost / total_contracts if total_contracts > 0 else 0
-            
-        elif syntax_list['name'] == 'strategyPositionEntryName':
-            return args[0]['position']['entry_name'] if args[0]['position'] else ''
-            
-        elif syntax_list['name'] == 'strategyPositionSize':
-            return sum(trade['contracts'] for trade in args[0]['open_trades'])
-            
-        elif syntax_list['name'] == 'strategyWinTrades':
-            return sum(1 for trade in args[0]['closed_trades'] if trade['profit'] > 0)
-
-
-        # timeframe is
-
-        elif syntax_list['name'] == 'timeClose':
-            bar_data = args[0]
-            return bar_data['timestamp'] + bar_data['bar_length']
-            
-        elif syntax_list['name'] == 'timeTradingDay':
-            bar_data = args[0]
-            timestamp = bar_data['timestamp']
-            day_start = timestamp - (timestamp % 86400)
-            return day_start + bar_data['session_offset']
-            
-        elif syntax_list['name'] == 'timeframeIsDaily':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] == 'day' and timeframe_data['value'] == 1
-            
-        elif syntax_list['name'] == 'timeframeIsDWM':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] in ['day', 'week', 'month']
-            
-        elif syntax_list['name'] == 'timeframeIsIntraday':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] in ['minute', 'second', 'tick']
-            
-        elif syntax_list['name'] == 'timeframeIsMinutes':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] == 'minute'
-            
-        elif syntax_list['name'] == 'timeframeIsMonthly':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] == 'month' and timeframe_data['value'] == 1
-            
-        elif syntax_list['name'] == 'timeframeIsSeconds':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] == 'second'
-            
-        elif syntax_list['name'] == 'timeframeIsTicks':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] == 'tick'
-            
-        elif syntax_list['name'] == 'timeframeIsWeekly':
-            timeframe_data = args[0]
-            return timeframe_data['unit'] == 'week' and timeframe_data['value'] == 1
-            
-        elif syntax_list['name'] == 'timeframeMainPeriod':
-            timeframe_data = args[0]
-            return timeframe_data['main_period']
-            
-        elif syntax_list['name'] == 'timeframeMultiplier':
-            timeframe_data = args[0]
-            return timeframe_data['value']
-            
-        elif syntax_list['name'] == 'timeframePeriod':
-            timeframe_data = args[0]
-            base_periods = {'tick': 1, 'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400, 'week': 604800, 'month': 2592000}
-            return base_periods[timeframe_data['unit']] * timeframe_data['value']
-            
-        elif syntax_list['name'] == 'timeNow':
-            return int(time.time())
-            
-        elif syntax_list['name'] == 'weekOfYear':
-            timestamp = args[0]
-            days_since_epoch = timestamp // 86400
-            day_of_year = days_since_epoch % 365.25
-            return int((day_of_year + 10) // 7)
-            
-        elif syntax_list['name'] == 'year':
-            timestamp = args[0]
-            seconds_per_year = 31536000
-            years_since_epoch = timestamp // seconds_per_year
-            return 1970 + years_since_epoch
-
-
-        # show style
-
-        elif syntax_list['name'] == 'showStyleArea':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'area',
-                'fill_opacity': 0.5 if not args else args[0]
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleAreaBr':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'area_br',
-                'fill_opacity': 0.5 if not args else args[0],
-                'break_gaps': True
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleCircles':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'circles',
-                'radius': 3 if not args else args[0]
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleColumns':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'columns',
-                'width': 0.8 if not args else args[0]
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleCross':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'cross',
-                'size': 5 if not args else args[0]
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleHistogram':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'histogram',
-                'base_level': 0 if not args else args[0]
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleLine':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'line',
-                'width': 1 if not args else args[0]
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleLineBr':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'line_br',
-                'width': 1 if not args else args[0],
-                'break_gaps': True
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleStepLine':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'stepline',
-                'width': 1 if not args else args[0]
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleStepLineDiamond':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'stepline_diamond',
-                'width': 1 if not args else args[0],
-                'marker_size': 5
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'showStyleStepLineBr':
-            style_data = {
-                'type': 'plot_style',
-                'style': 'stepline_br',
-                'width': 1 if not args else args[0],
-                'break_gaps': True
-            }
-            return style_data
-            
-        elif syntax_list['name'] == 'positionBottomCenter':
-            position_data = {
-                'vertical': 'bottom',
-                'horizontal': 'center',
-                'alignment': 'bottom_center'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionBottomLeft':
-            position_data = {
-                'vertical': 'bottom',
-                'horizontal': 'left',
-                'alignment': 'bottom_left'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionBottomRight':
-            position_data = {
-                'vertical': 'bottom',
-                'horizontal': 'right',
-                'alignment': 'bottom_right'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionMiddleCenter':
-            position_data = {
-                'vertical': 'middle',
-                'horizontal': 'center',
-                'alignment': 'middle_center'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionMiddleLeft':
-            position_data = {
-                'vertical': 'middle',
-                'horizontal': 'left',
-                'alignment': 'middle_left'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionMiddleRight':
-            position_data = {
-                'vertical': 'middle',
-                'horizontal': 'right',
-                'alignment': 'middle_right'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionTopCenter':
-            position_data = {
-                'vertical': 'top',
-                'horizontal': 'center',
-                'alignment': 'top_center'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionTopLeft':
-            position_data = {
-                'vertical': 'top',
-                'horizontal': 'left',
-                'alignment': 'top_left'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'positionTopRight':
-            position_data = {
-                'vertical': 'top',
-                'horizontal': 'right',
-                'alignment': 'top_right'
-            }
-            return position_data
-            
-        elif syntax_list['name'] == 'scaleLeft':
-            scale_data = {
-                'scale_position': 'left',
-                'visible': True
-            }
-            return scale_data
-            
-        elif syntax_list['name'] == 'scaleNone':
-            scale_data = {
-                'scale_position': 'none',
-                'visible': False
-            }
-            return scale_data
-            
-        elif syntax_list['name'] == 'scaleRight':
-            scale_data = {
-                'scale_position': 'right',
-                'visible': True
-            }
-            return scale_data
-            
-        elif syntax_list['name'] == 'sessionExtended':
-            session_data = {
-                'session_type': 'extended',
-                'include_pre_post': True,
-                'extended_hours': True
-            }
-            return session_data
-            
-        elif syntax_list['name'] == 'sessionRegular':
-            session_data = {
-                'session_type': 'regular',
-                'include_pre_post': False,
-                'extended_hours': False
-            }
-            return session_data
-            
-        elif syntax_list['name'] == 'settlementAsCloseInherit':
-            settlement_data = {
-                'settlement_as_close': 'inherit',
-                'use_settlement': None
-            }
-            return settlement_data
-            
-        elif syntax_list['name'] == 'settlementAsCloseOff':
-            settlement_data = {
-                'settlement_as_close': False,
-                'use_settlement': False
-            }
-            return settlement_data
-            
-        elif syntax_list['name'] == 'settlementAsCloseOn':
-            settlement_data = {
-                'settlement_as_close': True,
-                'use_settlement': True
-            }
-            return settlement_data
 
+@builtin('tableCellFunc')
+def _syntax_tableCellFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'get_cell',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2]
+    }
+
+
+@builtin('tableCellSetBgColFunc')
+def _syntax_tableCellSetBgColFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_bgcolor',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'color': args[3]
+    }
+
+
+@builtin('tableCellSetHeightFunc')
+def _syntax_tableCellSetHeightFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_height',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'height': args[3]
+    }
+
+
+@builtin('tableCellSetTextFunc')
+def _syntax_tableCellSetTextFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_text',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'text': args[3]
+    }
+
+
+@builtin('tableCellSetTextColFunc')
+def _syntax_tableCellSetTextColFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_text_color',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'color': args[3]
+    }
+
+
+@builtin('tableCellSetTextFontFamily')
+def _syntax_tableCellSetTextFontFamily(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_font_family',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'font_family': args[3]
+    }
+
+
+@builtin('tableCellSetTextHAlignFunc')
+def _syntax_tableCellSetTextHAlignFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_text_halign',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'alignment': args[3]
+    }
+
+
+@builtin('tableCellSetTextSizeFunc')
+def _syntax_tableCellSetTextSizeFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_text_size',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'size': args[3]
+    }
+
+
+@builtin('tableCellSetTextVAlignFunc')
+def _syntax_tableCellSetTextVAlignFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_text_valign',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'alignment': args[3]
+    }
+
+
+@builtin('tableCellSetToolTipFunc')
+def _syntax_tableCellSetToolTipFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_tooltip',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'tooltip': args[3]
+    }
+
+
+@builtin('tableCellSetWidthFunc')
+def _syntax_tableCellSetWidthFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_cell_width',
+        'table_id': args[0],
+        'row': args[1],
+        'column': args[2],
+        'width': args[3]
+    }
+
+
+@builtin('tableClearFunc')
+def _syntax_tableClearFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'clear',
+        'table_id': args[0]
+    }
+
+
+@builtin('tableDeleteFunc')
+def _syntax_tableDeleteFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'delete',
+        'table_id': args[0]
+    }
 
-        # shape
-        
-        elif syntax_list['name'] == 'shapeArrowDown':
-            return {
-                'type': 'shape',
-                'shape': 'arrow_down',
-                'points': [[0, -1], [1, 0], [0.5, 0], [0.5, 1], [-0.5, 1], [-0.5, 0], [-1, 0]]
-            }
-            
-        elif syntax_list['name'] == 'shapeArrowUp':
-            return {
-                'type': 'shape',
-                'shape': 'arrow_up',
-                'points': [[0, 1], [1, 0], [0.5, 0], [0.5, -1], [-0.5, -1], [-0.5, 0], [-1, 0]]
-            }
-            
-        elif syntax_list['name'] == 'shapeCircle':
-            return {
-                'type': 'shape',
-                'shape': 'circle',
-                'radius': 1.0,
-                'segments': 32
-            }
-            
-        elif syntax_list['name'] == 'shapeCross':
-            return {
-                'type': 'shape',
-                'shape': 'cross',
-                'points': [[0.5, 0.5], [-0.5, -0.5], [0, 0], [-0.5, 0.5], [0.5, -0.5]]
-            }
-            
-        elif syntax_list['name'] == 'shapeDiamond':
-            return {
-                'type': 'shape',
-                'shape': 'diamond',
-                'points': [[0, 1], [1, 0], [0, -1], [-1, 0]]
-            }
-            
-        elif syntax_list['name'] == 'shapeFlag':
-            return {
-                'type': 'shape',
-                'shape': 'flag',
-                'points': [[0, 0], [0, 1], [1, 0.75], [0, 0.5]]
-            }
-            
-        elif syntax_list['name'] == 'shapeLabelDown':
-            return {
-                'type': 'shape',
-                'shape': 'label_down',
-                'points': [[0, 0], [1, -1], [-1, -1]]
-            }
-            
-        elif syntax_list['name'] == 'shapeLabelUp':
-            return {
-                'type': 'shape',
-                'shape': 'label_up',
-                'points': [[0, 0], [1, 1], [-1, 1]]
-            }
-            
-        elif syntax_list['name'] == 'shapeSquare':
-            return {
-                'type': 'shape',
-                'shape': 'square',
-                'points': [[1, 1], [1, -1], [-1, -1], [-1, 1]]
-            }
-            
-        elif syntax_list['name'] == 'shapeTriangleDown':
-            return {
-                'type': 'shape',
-                'shape': 'triangle_down',
-                'points': [[0, -1], [1, 1], [-1, 1]]
-            }
-            
-        elif syntax_list['name'] == 'shapeTriangleUp':
-            return {
-                'type': 'shape',
-                'shape': 'triangle_up',
-                'points': [[0, 1], [1, -1], [-1, -1]]
-            }
-            
-        elif syntax_list['name'] == 'shapeXCross':
-            return {
-                'type': 'shape',
-                'shape': 'xcross',
-                'points': [[1, 1], [-1, -1], [0, 0], [-1, 1], [1, -1]]
-            }
-            
-        elif syntax_list['name'] == 'sizeAuto':
-            return {
-                'type': 'size',
-                'value': 'auto',
-                'scale_factor': 1.0
-            }
-            
-        elif syntax_list['name'] == 'sizeHuge':
-            return {
-                'type': 'size',
-                'value': 'huge',
-                'scale_factor': 2.5
-            }
-            
-        elif syntax_list['name'] == 'sizeLarge':
-            return {
-                'type': 'size',
-                'value': 'large',
-                'scale_factor': 1.5
-            }
-            
-        elif syntax_list['name'] == 'sizeNormal':
-            return {
-                'type': 'size',
-                'value': 'normal',
-                'scale_factor': 1.0
-            }
-            
-        elif syntax_list['name'] == 'sizeSmall':
-            return {
-                'type': 'size',
-                'value': 'small',
-                'scale_factor': 0.75
-            }
-            
-        elif syntax_list['name'] == 'sizeTiny':
-            return {
-                'type': 'size',
-                'value': 'tiny',
-                'scale_factor': 0.5
-            }
-            
-        elif syntax_list['name'] == 'splitsDenominator':
-            return {
-                'type': 'splits',
-                'value': args[0]['denominator'] if args else 1,
-                'split_type': 'denominator'
-            }
-            
-        elif syntax_list['name'] == 'splitsNumerator':
-            return {
-                'type': 'splits',
-                'value': args[0]['numerator'] if args else 1,
-                'split_type': 'numerator'
-            }
 
+@builtin('tableMergeCellsFunc')
+def _syntax_tableMergeCellsFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'merge_cells',
+        'table_id': args[0],
+        'start_row': args[1],
+        'start_col': args[2],
+        'end_row': args[3],
+        'end_col': args[4]
+    }
 
 
-        elif syntax_list['name'] == 'strategyCash':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'cash',
-                'value': args[0] if args else 100000
-            }
-            
-        elif syntax_list['name'] == 'strategyCommissionCashPerContract':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'commission',
-                'model': 'cash_per_contract',
-                'value': args[0] if args else 0.0
-            }
-            
-        elif syntax_list['name'] == 'strategyCommissionCashPerOrder':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'commission',
-                'model': 'cash_per_order',
-                'value': args[0] if args else 0.0
-            }
-            
-        elif syntax_list['name'] == 'strategyCommissionPercent':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'commission',
-                'model': 'percent',
-                'value': args[0] if args else 0.0
-            }
-            
-        elif syntax_list['name'] == 'strategyDirectionAll':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'direction',
-                'value': 'all'
-            }
-            
-        elif syntax_list['name'] == 'strategyDirectionLong':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'direction',
-                'value': 'long'
-            }
-            
-        elif syntax_list['name'] == 'strategyDirectionShort':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'direction',
-                'value': 'short'
-            }
-            
-        elif syntax_list['name'] == 'strategyFixed':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'position_size',
-                'model': 'fixed',
-                'value': args[0] if args else 1
-            }
-            
-        elif syntax_list['name'] == 'strategyLong':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'position',
-                'value': 'long'
-            }
-            
-        elif syntax_list['name'] == 'strategyOcaCancel':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'oca',
-                'behavior': 'cancel'
-            }
-            
-        elif syntax_list['name'] == 'strategyOcaNone':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'oca',
-                'behavior': 'none'
-            }
-            
-        elif syntax_list['name'] == 'strategyOcaReduce':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'oca',
-                'behavior': 'reduce'
-            }
-            
-        elif syntax_list['name'] == 'strategyPercentOfEquity':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'position_size',
-                'model': 'percent_of_equity',
-                'value': args[0] if args else 100
-            }
-            
-        elif syntax_list['name'] == 'strategyShort':
-            return {
-                'type': 'strategy_parameter',
-                'parameter': 'position',
-                'value': 'short'
-            }
-            
-        elif syntax_list['name'] == 'textAlignBottom':
-            return {
-                'type': 'text_parameter',
-                'parameter': 'vertical_align',
-                'value': 'bottom'
-            }
-            
-        elif syntax_list['name'] == 'textAlignCenter':
-            return {
-                'type': 'text_parameter',
-                'parameter': 'horizontal_align',
-                'value': 'center'
-            }
-            
-        elif syntax_list['name'] == 'textAlignLeft':
-            return {
-                'type': 'text_parameter',
-                'parameter': 'horizontal_align',
-                'value': 'left'
-            }
-            
-        elif syntax_list['name'] == 'textAlignRight':
-            return {
-                'type': 'text_parameter',
-                'parameter': 'horizontal_align',
-                'value': 'right'
-            }
-            
-        elif syntax_list['name'] == 'textAlignTop':
-            return {
-                'type': 'text_parameter',
-                'parameter': 'vertical_align',
-                'value': 'top'
-            }
-            
-        elif syntax_list['name'] == 'textWrapAuto':
-            return {
-                'type': 'text_parameter',
-                'parameter': 'wrap',
-                'value': 'auto'
-            }
-            
-        elif syntax_list['name'] == 'textWrapNone':
-            return {
-                'type': 'text_parameter',
-                'parameter': 'wrap',
-                'value': 'none'
-            }
-            
-        elif syntax_list['name'] == 'trueValue':
-            return {
-                'type': 'boolean',
-                'value': True
-            }
+@builtin('tableNewFunc')
+def _syntax_tableNewFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'new',
+        'id': args[0],
+        'rows': args[1],
+        'columns': args[2]
+    }
 
 
-        elif syntax_list['name'] == 'locationAboveBar':
-            return {
-                'type': 'location',
-                'position': 'above_bar',
-                'offset': 1
-            }
-            
-        elif syntax_list['name'] == 'locationAbsolute':
-            return {
-                'type': 'location',
-                'position': 'absolute',
-                'coordinates': args[0] if args else [0, 0]
-            }
-            
-        elif syntax_list['name'] == 'locationBelowBar':
-            return {
-                'type': 'location',
-                'position': 'below_bar',
-                'offset': -1
-            }
-            
-        elif syntax_list['name'] == 'locationBottom':
-            return {
-                'type': 'location',
-                'position': 'bottom',
-                'value': 0
-            }
-            
-        elif syntax_list['name'] == 'locationTop':
-            return {
-                'type': 'location',
-                'position': 'top',
-                'value': 100
-            }
-            
-        elif syntax_list['name'] == 'mathE':
-            return {
-                'type': 'constant',
-                'name': 'e',
-                'value': 2.718281828459045
-            }
-            
-        elif syntax_list['name'] == 'mathPhi':
-            return {
-                'type': 'constant',
-                'name': 'phi',
-                'value': 1.618033988749895
-            }
-            
-        elif syntax_list['name'] == 'mathPi':
-            return {
-                'type': 'constant',
-                'name': 'pi',
-                'value': 3.141592653589793
-            }
-            
-        elif syntax_list['name'] == 'mathRPhi':
-            return {
-                'type': 'constant',
-                'name': 'rphi',
-                'value': 0.618033988749895
-            }
-            
-        elif syntax_list['name'] == 'orderAscending':
-            return {
-                'type': 'order',
-                'direction': 'ascending',
-                'value': 1
-            }
-            
-        elif syntax_list['name'] == 'orderDescending':
-            return {
-                'type': 'order',
-                'direction': 'descending',
-                'value': -1
-            }
-            
-        elif syntax_list['name'] == 'onTick':
-            return {
-                'type': 'event',
-                'trigger': 'tick',
-                'timestamp': args[0] if args else 0
-            }
-            
-        elif syntax_list['name'] == 'onBar':
-            return {
-                'type': 'event',
-                'trigger': 'bar',
-                'timestamp': args[0] if args else 0
-            }
-            
-        elif syntax_list['name'] == '=':
-            return {
-                'type': 'operator',
-                'operation': 'assign',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '+':
-            return {
-                'type': 'operator',
-                'operation': 'add',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '-':
-            return {
-                'type': 'operator',
-                'operation': 'subtract',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '*':
-            return {
-                'type': 'operator',
-                'operation': 'multiply',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '/':
-            return {
-                'type': 'operator',
-                'operation': 'divide',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '%':
-            return {
-                'type': 'operator',
-                'operation': 'modulo',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '==':
-            return {
-                'type': 'operator',
-                'operation': 'equal',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '!=':
-            return {
-                'type': 'operator',
-                'operation': 'not_equal',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '>':
-            return {
-                'type': 'operator',
-                'operation': 'greater',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '<':
-            return {
-                'type': 'operator',
-                'operation': 'less',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '>=':
-            return {
-                'type': 'operator',
-                'operation': 'greater_equal',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == '<=':
-            return {
-                'type': 'operator',
-                'operation': 'less_equal',
-                'left': args[0],
-                'right': args[1]
-            }
+@builtin('tableSetBgColFunc')
+def _syntax_tableSetBgColFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_bgcolor',
+        'table_id': args[0],
+        'color': args[1]
+    }
 
-        elif syntax_list['name'] == 'and':
-            return {
-                'type': 'logical',
-                'operation': 'and',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == 'or':
-            return {
-                'type': 'logical',
-                'operation': 'or',
-                'left': args[0],
-                'right': args[1]
-            }
-            
-        elif syntax_list['name'] == 'not':
-            return {
-                'type': 'logical',
-                'operation': 'not',
-                'operand': args[0]
-            }
-            
-        elif syntax_list['name'] == 'if':
-            return {
-                'type': 'control',
-                'operation': 'if',
-                'condition': args[0],
-                'then': args[1],
-                'else': args[2] if len(args) > 2 else None
-            }
-            
-        elif syntax_list['name'] == 'else':
-            return {
-                'type': 'control',
-                'operation': 'else',
-                'body': args[0]
-            }
-            
-        elif syntax_list['name'] == 'for':
-            return {
-                'type': 'control',
-                'operation': 'for',
-                'init': args[0],
-                'condition': args[1],
-                'increment': args[2],
-                'body': args[3]
-            }
-            
-        elif syntax_list['name'] == 'while':
-            return {
-                'type': 'control',
-                'operation': 'while',
-                'condition': args[0],
-                'body': args[1]
-            }
-            
-        elif syntax_list['name'] == 'let':
-            return {
-                'type': 'declaration',
-                'operation': 'let',
-                'name': args[0],
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'arr':
-            return {
-                'type': 'array',
-                'elements': args[0] if args else []
-            }
-            
-        elif syntax_list['name'] == 'bool':
-            return {
-                'type': 'boolean',
-                'value': bool(args[0]) if args else False
-            }
-            
-        elif syntax_list['name'] == 'box':
-            return {
-                'type': 'box',
-                'left': args[0] if args else 0,
-                'top': args[1] if len(args) > 1 else 0,
-                'right': args[2] if len(args) > 2 else 0,
-                'bottom': args[3] if len(args) > 3 else 0
-            }
-            
-        elif syntax_list['name'] == 'chartPoint':
-            return {
-                'type': 'chart_point',
-                'x': args[0] if args else 0,
-                'y': args[1] if len(args) > 1 else 0
-            }
-            
-        elif syntax_list['name'] == 'col':
-            return {
-                'type': 'color',
-                'r': args[0] if args else 0,
-                'g': args[1] if len(args) > 1 else 0,
-                'b': args[2] if len(args) > 2 else 0
-            }
-            
-        elif syntax_list['name'] == 'const':
-            return {
-                'type': 'constant',
-                'name': args[0],
-                'value': args[1]
-            }
-            
-        elif syntax_list['name'] == 'float':
-            return {
-                'type': 'float',
-                'value': float(args[0]) if args else 0.0
-            }
-            
-        elif syntax_list['name'] == 'int':
-            return {
-                'type': 'integer',
-                'value': int(args[0]) if args else 0
-            }
-            
-        elif syntax_list['name'] == 'label':
-            return {
-                'type': 'label',
-                'text': args[0] if args else '',
-                'x': args[1] if len(args) > 1 else 0,
-                'y': args[2] if len(args) > 2 else 0
-            }
 
-        elif syntax_list['name'] == 'dayOfMonth':
-            return {
-                'type': 'time',
-                'component': 'day_of_month',
-                'value': args[0]['timestamp'].day if args else 1
-            }
-            
-        elif syntax_list['name'] == 'dayOfWeek':
-            return {
-                'type': 'time',
-                'component': 'day_of_week',
-                'value': args[0]['timestamp'].weekday() if args else 0
-            }
-            
-        elif syntax_list['name'] == 'hour':
-            return {
-                'type': 'time',
-                'component': 'hour',
-                'value': args[0]['timestamp'].hour if args else 0
-            }
-            
-        elif syntax_list['name'] == 'minute':
-            return {
-                'type': 'time',
-                'component': 'minute',
-                'value': args[0]['timestamp'].minute if args else 0
-            }
-            
-        elif syntax_list['name'] == 'month':
-            return {
-                'type': 'time',
-                'component': 'month',
-                'value': args[0]['timestamp'].month if args else 1
-            }
-            
-        elif syntax_list['name'] == 'second':
-            return {
-                'type': 'time',
-                'component': 'second',
-                'value': args[0]['timestamp'].second if args else 0
-            }
-            
-        elif syntax_list['name'] == 'time':
-            return {
-                'type': 'time',
-                'component': 'timestamp',
-                'value': args[0]['timestamp'].timestamp() if args else 0
-            }
-            
-        elif syntax_list['name'] == 'timeClose':
-            return {
-                'type': 'time',
-                'component': 'close_time',
-                'value': args[0]['bar_close_time'] if args else 0
-            }
-            
-        elif syntax_list['name'] == 'timeTradingDay':
-            return {
-                'type': 'time',
-                'component': 'trading_day',
-                'value': args[0]['trading_day_timestamp'] if args else 0
-            }
-            
-        elif syntax_list['name'] == 'timeNow':
-            return {
-                'type': 'time',
-                'component': 'current_time',
-                'value': int(time.time())
-            }
-            
-        elif syntax_list['name'] == 'weekOfYear':
-            return {
-                'type': 'time',
-                'component': 'week_of_year',
-                'value': args[0]['timestamp'].isocalendar()[1] if args else 1
-            }
-            
-        elif syntax_list['name'] == 'year':
-            return {
-                'type': 'time',
-                'component': 'year',
-                'value': args[0]['timestamp'].year if args else 1970
-            }
-            
-        elif syntax_list['name'] == 'sessionIsFirstBar':
-            return {
-                'type': 'session',
-                'component': 'first_bar',
-                'value': args[0]['session']['is_first_bar'] if args else False
-            }
-            
-        elif syntax_list['name'] == 'sessionIsFirstBarRegular':
-            return {
-                'type': 'session',
-                'component': 'first_bar_regular',
-                'value': args[0]['session']['is_first_bar_regular'] if args else False
-            }
-            
-        elif syntax_list['name'] == 'sessionIsLastBar':
-            return {
-                'type': 'session',
-                'component': 'last_bar',
-                'value': args[0]['session']['is_last_bar'] if args else False
-            }
-            
-        elif syntax_list['name'] == 'sessionIsLastBarRegular':
-            return {
-                'type': 'session',
-                'component': 'last_bar_regular',
-                'value': args[0]['session']['is_last_bar_regular'] if args else False
-            }
-            
-        elif syntax_list['name'] == 'sessionIsMarket':
-            return {
-                'type': 'session',
-                'component': 'is_market',
-                'value': args[0]['session']['is_market'] if args else False
-            }
-            
-        elif syntax_list['name'] == 'sessionIsPostMarket':
-            return {
-                'type': 'session',
-                'component': 'is_post_market',
-                'value': args[0]['session']['is_post_market'] if args else False
-            }
-            
-        elif syntax_list['name'] == 'sessionIsPreMarket':
-            return {
-                'type': 'session',
-                'component': 'is_pre_market',
-                'value': args[0]['session']['is_pre_market'] if args else False
-            }
+@builtin('tableSetBorderColFunc')
+def _syntax_tableSetBorderColFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_border_color',
+        'table_id': args[0],
+        'color': args[1]
+    }
 
 
-        # table 
+@builtin('tableSetBorderWidthFunc')
+def _syntax_tableSetBorderWidthFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_border_width',
+        'table_id': args[0],
+        'width': args[1]
+    }
+
+
+@builtin('tableSetFrameColFunc')
+def _syntax_tableSetFrameColFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_frame_color',
+        'table_id': args[0],
+        'color': args[1]
+    }
+
+
+@builtin('tableSetFrameWidthFunc')
+def _syntax_tableSetFrameWidthFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_frame_width',
+        'table_id': args[0],
+        'width': args[1]
+    }
+
+
+@builtin('tableSetPositionFunc')
+def _syntax_tableSetPositionFunc(self, *args):
+    return {
+        'type': 'table',
+        'operation': 'set_position',
+        'table_id': args[0],
+        'position': args[1]
+    }
 
-        elif syntax_list['name'] == 'tableFunc':
-            return {
-                'type': 'table',
-                'operation': 'create',
-                'id': args[0] if args else 'default_table',
-                'rows': 1,
-                'columns': 1
-            }
-            
-        elif syntax_list['name'] == 'tableCellFunc':
-            return {
-                'type': 'table',
-                'operation': 'get_cell',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetBgColFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_bgcolor',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'color': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetHeightFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_height',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'height': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetTextFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_text',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'text': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetTextColFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_text_color',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'color': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetTextFontFamily':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_font_family',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'font_family': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetTextHAlignFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_text_halign',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'alignment': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetTextSizeFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_text_size',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'size': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetTextVAlignFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_text_valign',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'alignment': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetToolTipFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_tooltip',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'tooltip': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableCellSetWidthFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_cell_width',
-                'table_id': args[0],
-                'row': args[1],
-                'column': args[2],
-                'width': args[3]
-            }
-            
-        elif syntax_list['name'] == 'tableClearFunc':
-            return {
-                'type': 'table',
-                'operation': 'clear',
-                'table_id': args[0]
-            }
-            
-        elif syntax_list['name'] == 'tableDeleteFunc':
-            return {
-                'type': 'table',
-                'operation': 'delete',
-                'table_id': args[0]
-            }
-            
-        elif syntax_list['name'] == 'tableMergeCellsFunc':
-            return {
-                'type': 'table',
-                'operation': 'merge_cells',
-                'table_id': args[0],
-                'start_row': args[1],
-                'start_col': args[2],
-                'end_row': args[3],
-                'end_col': args[4]
-            }
-            
-        elif syntax_list['name'] == 'tableNewFunc':
-            return {
-                'type': 'table',
-                'operation': 'new',
-                'id': args[0],
-                'rows': args[1],
-                'columns': args[2]
-            }
-            
-        elif syntax_list['name'] == 'tableSetBgColFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_bgcolor',
-                'table_id': args[0],
-                'color': args[1]
-            }
-            
-        elif syntax_list['name'] == 'tableSetBorderColFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_border_color',
-                'table_id': args[0],
-                'color': args[1]
-            }
-            
-        elif syntax_list['name'] == 'tableSetBorderWidthFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_border_width',
-                'table_id': args[0],
-                'width': args[1]
-            }
-            
-        elif syntax_list['name'] == 'tableSetFrameColFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_frame_color',
-                'table_id': args[0],
-                'color': args[1]
-            }
-            
-        elif syntax_list['name'] == 'tableSetFrameWidthFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_frame_width',
-                'table_id': args[0],
-                'width': args[1]
-            }
-            
-        elif syntax_list['name'] == 'tableSetPositionFunc':
-            return {
-                'type': 'table',
-                'operation': 'set_position',
-                'table_id': args[0],
-                'position': args[1]
-            }
 
 
 """-----------------------------------------------------------------------------------------------------------------"""
@@ -7534,19 +9132,20 @@ class Environment:
         self.bar_index += 1
         self._update_series()
 
+    def _series(self, name):
+        """Series storage for `name`, bounded to max_bars_back"""
+        series = self.series_data.get(name)
+        if series is None:
+            series = self.series_data[name] = RingBuffer(self.max_bars_back)
+        return series
+
     def _update_series(self):
         for key in ['open', 'high', 'low', 'close', 'volume']:
-            if key not in self.series_data:
-                self.series_data[key] = []
-            self.series_data[key].append(self.current_bar[key])
-            if len(self.series_data[key]) > self.max_bars_back:
-                self.series_data[key].pop(0)
+            self._series(key).append(self.current_bar[key])
 
     def get_value(self, name, offset=0):
         if name in self.series_data:
-            idx = -1 - offset
-            if abs(idx) <= len(self.series_data[name]):
-                return self.series_data[name][idx]
+            return self.series_data[name].get(offset)
         return None
 
     def set_value(self, name, value):
@@ -7554,9 +9153,7 @@ class Environment:
 
         def process_indicator(self, name, *args):
             result = self.execute_calculation(name, *args)
-            if name not in self.series_data:
-                self.series_data[name] = []
-            self.series_data[name].append(result)
+            self._series(name).append(result)
             return result
 
     def get_series(self, name):
@@ -7596,9 +9193,7 @@ class Environment:
     def process_time_series(self, indicator_name, *args):
             if self.current_bar:
                 value = self.execute_calculation(indicator_name, *args)
-                if indicator_name not in self.series_data:
-                    self.series_data[indicator_name] = []
-                self.series_data[indicator_name].append(value)
+                self._series(indicator_name).append(value)
                 return value
             return None
 
@@ -7653,16 +9248,12 @@ class Environment:
     def get_last_values(self, series_name, length):
         """Gets last n values from a series"""
         if series_name in self.series_data:
-            return self.series_data[series_name][-length:]
+            return self.series_data[series_name].view(length)
         return []
 
     def commit_calculation(self, name, value):
         """Commits calculated values to series storage"""
-        if name not in self.series_data:
-            self.series_data[name] = []
-        self.series_data[name].append(value)
-        if len(self.series_data[name]) > self.max_bars_back:
-            self.series_data[name].pop(0)
+        self._series(name).append(value)
     
     def evaluate_code(source_code):
     # Initialize environment
@@ -7689,23 +9280,87 @@ class Environment:
 
 """-----------------------------------------------------------------------------------------------------------"""
 
-def evaluate_code(source_code):
-    # Initialize environment
-    env = Environment()
-    
-    # Tokenize the source code
-    tokenizer = Tokenizer(source_code)
-    tokens = tokenizer.tokenize()
-    
-    # Parse tokens
-    parser = Parser(tokens)
-    syntax = parser.parse_all_syntax()
-    
-    # Execute calculation using environment
-    if syntax:
-        result = env.execute_calculation(syntax['name'])
-        return result
-    return None
+# TA-Lib wrappers: they take whole input series and return a full output series
+TALIB_INDICATORS = frozenset([
+    'adLine', 'adOsc', 'adx', 'adxr', 'apo', 'aroon', 'aroonOsc', 'atr', 'avgPrice', 'bbands', 'beta', 'bop',
+    'cci', 'cmo', 'correl', 'dema', 'dx', 'htDcPeriod', 'htDcPhase', 'htPhasor', 'htSine', 'htTrendline',
+    'htTrendMode', 'kama', 'linearReg', 'linearRegAngle', 'linearRegIntercept', 'linearRegSlope', 'ma',
+    'macd', 'macdExt', 'macdFix', 'mama', 'maxIndex', 'medPrice', 'mfi', 'midPoint', 'midPrice', 'minIndex',
+    'minMax', 'minMaxIndex', 'minusDI', 'minusDM', 'mom', 'natr', 'obv', 'plusDI', 'plusDM', 'ppo', 'roc',
+    'rocp', 'rocr', 'rocr100', 'sar', 'sarExt', 'stdDev', 'stoch', 'stochF', 'stochRsi', 'sum', 't3', 'tema',
+    'tRange', 'trima', 'trix', 'tsf', 'typPrice', 'ultOsc', 'variance', 'wclPrice', 'willr', 'wma',
+    'sma', 'ema', 'rsi', 'minvalue', 'maxvalue',
+])
+
+# builtins whose series arguments are passed as history rather than the current bar's value
+SERIES_BUILTINS = TALIB_INDICATORS | frozenset(
+    name for name in SYNTAX_NAMES
+    if name.startswith('pattern') or (name.startswith('ta') and name[2:3].isupper()))
+
+
+# Bump whenever tokenizer/parser output changes so cached front-end results are invalidated
+LANGUAGE_VERSION = '2'
+
+SCRIPT_CACHE = ScriptCache(LANGUAGE_VERSION, cache_dir=os.environ.get('DEVSCRIPT_CACHE_DIR'))
+
+
+def parse_source(source_code):
+    """Front end: tokens and the ASTNode program of a script, from the inter_pine tokenizer and parser"""
+    tokens = pine_tokenizer.Tokenizer(source_code).tokenize()
+    parser = pine_parser.Parser(tokens)
+    program = parser.parse()
+    if parser.had_error:
+        raise ParserError('; '.join(parser.errors))
+    return tokens, program
+
+
+# builtins are pure functions of their arguments, the calculate_syntax `self` slot is unused
+SCRIPT_FUNCTIONS = {name: partial(entry.func, None) for name, entry in BUILTINS.items()}
+
+
+def compile_syntax(program):
+    """Lower a parsed program once; every run instantiates its own frame and series state"""
+    return Compiler(SCRIPT_FUNCTIONS, series_functions=SERIES_BUILTINS).lower(program)
+
+
+def load_script(source_code):
+    return SCRIPT_CACHE.get_or_build(source_code, parse_source, compile_syntax)
+
+
+def start_script(source_code, env):
+    """A fresh run of the cached compiled script, with the environment's max_bars_back"""
+    return load_script(source_code).compiled.instantiate(env.max_bars_back)
+
+
+def bar_inputs(env):
+    """Input values a script reads on the environment's current bar"""
+    inputs = env.get_built_in_vars()
+    if env.current_bar:
+        inputs['time'] = env.current_bar['time']
+        inputs['barIndex'] = env.bar_index - 1
+    return inputs
+
+
+def _plain(value):
+    """JSON-friendly form of a script value: python scalars, na as None, plots as their series value"""
+    if isinstance(value, dict):
+        if value.get('type') == 'plot':
+            return _plain(value.get('series'))
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_plain(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def evaluate_code(source_code, env=None):
+    """Value of a script on the environment's current bar"""
+    env = env or Environment()
+    script = start_script(source_code, env)
+    return script.step(bar_inputs(env))
 
 # Example usage:
 def run_script(code):
@@ -7713,4 +9368,26 @@ def run_script(code):
     return result
 
 
+def run_interpreter(source_code, ohlcv_data, settings=None):
+    """Run a script bar by bar over chart candles given as open/high/low/close/volume/time columns.
 
+    Returns the script's value on every bar (`values`) and on the last one
+    (`result`), plus the per-bar series of each variable it assigns.
+    """
+    env = Environment()
+    if settings and settings.get('max_bars_back'):
+        env.max_bars_back = int(settings['max_bars_back'])
+    script = start_script(source_code, env)
+
+    values = []
+    variables = {name: [] for name, _ in script.outputs}
+    collectors = [(variables[name].append, slot) for name, slot in script.outputs]
+    columns = ('open', 'high', 'low', 'close', 'volume', 'time')
+    for bar in zip(*(ohlcv_data[column] for column in columns)):
+        env.update_bar(dict(zip(columns, bar)))
+        values.append(_plain(script.step(bar_inputs(env))))
+        frame = script.frame
+        for append, slot in collectors:
+            append(_plain(frame[slot]))
+    return {'result': values[-1] if values else None, 'values': values,
+            'variables': variables, 'bars': env.bar_index}
@@ -0,0 +1,93 @@
+import copy
+import unittest
+
+import numpy as np
+
+from Devscript.interpreter import interpreter as I
+
+
+class TaEvaluator(I.Evaluator):
+    # the module-level helpers the ta path needs; arguments are pre-evaluated literals
+    _calculate_sma = I._calculate_sma
+    _handle_ta_operation = I._handle_ta_operation
+    _evaluate_builtin_function = I._evaluate_builtin_function
+
+    def _evaluate(self, node):
+        return node
+
+
+def sma_call(source, period, call_site):
+    return {'type': 'function_call', 'name': 'taSmaFunc', 'arguments': [source, period], 'call_site': call_site}
+
+
+class TestTaOperations(unittest.TestCase):
+    def test_full_series_uses_batch_calculation(self):
+        evaluator = TaEvaluator({})
+        self.assertEqual(evaluator._handle_ta_operation('taSmaFunc', [list(range(1, 11)), 5]), 8.0)
+
+    def test_repeated_call_within_bar_is_not_advanced(self):
+        evaluator = TaEvaluator({})
+        first, again = [], []
+        for bar in range(10):
+            evaluator.bar_index = bar
+            first.append(evaluator._handle_ta_operation('taSmaFunc', [float(bar + 1), 3], call_site=1))
+            again.append(evaluator._handle_ta_operation('taSmaFunc', [float(bar + 1), 3], call_site=1))
+        np.testing.assert_array_equal(first, again)
+        self.assertAlmostEqual(first[-1], 9.0)
+
+    def test_bar_index_falls_back_to_environment(self):
+        evaluator = TaEvaluator({})
+        for bar in range(4):
+            evaluator.environment = {'barIndex': bar}
+            evaluator._handle_ta_operation('taSmaFunc', [float(bar), 2], call_site=2)
+            value = evaluator._handle_ta_operation('taSmaFunc', [float(bar), 2], call_site=2)
+        self.assertAlmostEqual(value, 2.5)
+
+    def test_call_site_survives_copied_ast(self):
+        # cached ASTs are handed out as copies; the parse-time id keeps one kernel per call node
+        evaluator = TaEvaluator({})
+        node = sma_call(0.0, 2, next(I.CALL_SITE_IDS))
+        for bar in range(4):
+            bar_node = copy.deepcopy(node)
+            bar_node['arguments'][0] = float(bar)
+            evaluator.bar_index = bar
+            value = evaluator._evaluate_builtin_function(bar_node)
+        self.assertAlmostEqual(value, 2.5)
+        self.assertEqual(len(evaluator.ta_stream.call_sites), 1)
+
+
+class TestBuiltinRegistry(unittest.TestCase):
+    def call(self, evaluator, name, *args):
+        return evaluator._evaluate_builtin_function({'type': 'function_call', 'name': name, 'arguments': list(args)})
+
+    def test_callables_are_bound_once(self):
+        evaluator = TaEvaluator({})
+        entry = evaluator.builtins['arrAbs']
+        self.assertIs(entry.func.__self__, evaluator)
+        self.assertIs(entry.func.__func__, I._array_arrAbs)
+        self.assertIs(I.BUILTINS['taWprFunc'].func, I._handle_ta_operation)
+
+    def test_first_definition_of_a_name_wins(self):
+        register = I.builtin('arrAbs', 'testOnlyFunc')
+        try:
+            register(lambda self, operation_name, args: 'shadow')
+            self.assertIs(I.BUILTINS['arrAbs'].func, I._array_arrAbs)
+            self.assertEqual(I.BUILTINS['testOnlyFunc'].func(None, 'testOnlyFunc', []), 'shadow')
+        finally:
+            I.BUILTINS.pop('testOnlyFunc', None)
+
+    def test_alert_and_log_dispatch_through_the_table(self):
+        evaluator = TaEvaluator({})
+        self.assertIs(I.BUILTINS['logInfoFunc'].func, I._log_logInfoFunc)
+        self.assertTrue(self.call(evaluator, 'alertConditionFunc', True, 1))
+        self.assertFalse(self.call(evaluator, 'alertConditionFunc', True, 0))
+        self.assertEqual(self.call(evaluator, 'arrAbs', [-1, 2, -3]), [1, 2, 3])
+        self.assertEqual(self.call(evaluator, 'arrNewInt', 2, 7), [7, 7])
+        self.assertEqual(self.call(evaluator, 'sma', [1, 2, 3, 4], 2), 3.5)
+
+    def test_unknown_name_returns_none(self):
+        self.assertIsNone(self.call(TaEvaluator({}), 'notABuiltin', 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
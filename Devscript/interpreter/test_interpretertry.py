@@ -0,0 +1,196 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import talib
+
+from Devscript.interpreter import interpretertry as T
+from Devscript.interpreter.inter_pine.core.compiler import CompiledProgram
+from Devscript.interpreter.inter_pine.core.parser import NodeType
+from Devscript.interpreter.inter_pine.indicators.streaming import STREAMING_KERNELS, StreamingTAEngine
+
+CLOSES = [1.5, 2.5, 3.5, 4.0, 5.5, 6.5]
+OHLCV = {
+    'open': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+    'high': [2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+    'low': [0.5, 1.5, 2.5, 3.5, 4.5, 5.5],
+    'close': CLOSES,
+    'volume': [10.0] * 6,
+    'time': [1000 * i for i in range(6)],
+}
+
+
+class TestRunInterpreter(unittest.TestCase):
+    def run_script(self, source):
+        return T.run_interpreter(source, OHLCV)
+
+    def test_price_series(self):
+        result = self.run_script('return close')
+        self.assertEqual(result['values'], CLOSES)
+        self.assertEqual(result['result'], 6.5)
+        self.assertEqual(result['bars'], 6)
+
+    def test_talib_builtin_sees_the_series_up_to_each_bar(self):
+        result = self.run_script('return sma(close, 5)')
+        expected = talib.SMA(np.array(CLOSES), timeperiod=5)
+        self.assertEqual(result['values'][:4], [None] * 4)
+        self.assertAlmostEqual(result['values'][4], expected[4])
+        self.assertAlmostEqual(result['result'], expected[5])
+
+    def test_assignment_is_evaluated_per_bar(self):
+        result = self.run_script('x = close + 1')
+        self.assertEqual(result['variables']['x'], [c + 1 for c in CLOSES])
+
+    def test_every_statement_runs(self):
+        result = self.run_script('a = 1\nb = a + 1\nreturn show(close * b)')
+        self.assertEqual(result['variables']['a'], [1] * 6)
+        self.assertEqual(result['variables']['b'], [2] * 6)
+        self.assertEqual(result['values'], [c * 2 for c in CLOSES])
+
+    def test_constant_length_and_streaming_ta(self):
+        result = self.run_script('length = 3\nfast = taSma(close, length)\nslow = sma(close, length)')
+        np.testing.assert_allclose(np.array(result['variables']['fast'][2:]),
+                                   np.array(result['variables']['slow'][2:]))
+
+    def test_if_else_and_history(self):
+        result = self.run_script('if (close > 3 and close[1] > 2) { side = 1 } else { side = -1 }')
+        self.assertEqual(result['variables']['side'], [-1, -1, 1, 1, 1, 1])
+
+    def test_unknown_function_is_an_error(self):
+        with self.assertRaises(Exception):
+            self.run_script('notABuiltin(close)')
+
+
+class TestParseSource(unittest.TestCase):
+    def test_program_keeps_every_statement(self):
+        _, program = T.parse_source('var a = 1;\nb = 2\nreturn a + b')
+        self.assertEqual([node.type for node in program.children],
+                         [NodeType.VARIABLE_DECL, NodeType.ASSIGNMENT, NodeType.RETURN_STATEMENT])
+
+    def test_precedence(self):
+        self.assertEqual(T.run_script('return 1 + 2 * 3 - -4'), 11)
+        self.assertEqual(T.run_script('return (1 + 2) * 3 == 9'), True)
+
+    def test_script_without_return_has_no_value(self):
+        self.assertIsNone(T.run_script('x = 1 + 2'))
+
+    def test_syntax_errors_are_raised_and_not_cached(self):
+        with self.assertRaises(T.ParserError):
+            T.load_script('x = (1 + 2')
+        self.assertIsNone(T.SCRIPT_CACHE.get('x = (1 + 2'))
+
+
+class TestCompiledScripts(unittest.TestCase):
+    SOURCE = 'fast = taSma(close, 2)\nslow = sma(close, 3)\nreturn fast - slow + nz(close[1])'
+
+    def test_script_is_compiled_once_and_run_from_the_cache(self):
+        source = self.SOURCE + ' + 0'
+        with mock.patch.object(T, 'compile_syntax', wraps=T.compile_syntax) as compile_syntax:
+            first = T.run_interpreter(source, OHLCV)
+            second = T.run_interpreter(source, OHLCV)
+        self.assertEqual(compile_syntax.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsInstance(T.load_script(source).compiled, CompiledProgram)
+
+    def test_runs_of_one_program_do_not_share_state(self):
+        env = T.Environment()
+        program = T.load_script(self.SOURCE).compiled
+        left, right = program.instantiate(), program.instantiate()
+        for close in CLOSES:
+            left.step({'close': close})
+            right.step({'close': close * 10})
+        self.assertIs(T.start_script(self.SOURCE, env).program, program)
+        self.assertAlmostEqual(left.variables()['fast'], (CLOSES[-1] + CLOSES[-2]) / 2)
+        self.assertAlmostEqual(right.variables()['fast'], (CLOSES[-1] + CLOSES[-2]) * 5)
+        self.assertEqual(T.run_interpreter(self.SOURCE, OHLCV)['variables']['fast'][-1],
+                         left.variables()['fast'])
+
+
+# arguments each streamed builtin is called with: series by name, everything else as a parameter
+KERNEL_ARGS = {
+    'taAlma': ('close', 9, 0.85, 6), 'taAtr': ('high', 'low', 'close', 5), 'taBarsSince': ('up',),
+    'taBb': ('close', 5, 2), 'taBbw': ('close', 5, 2), 'taCci': ('high', 'low', 'close', 5),
+    'taChange': ('close',), 'taCmo': ('close', 5), 'taCog': ('close', 5), 'taCorrelation': ('close', 'high', 5),
+    'taCross': ('close', 'open'), 'taCrossover': ('close', 'open'), 'taCrossunder': ('close', 'open'),
+    'taCum': ('close',), 'taDev': ('close', 5), 'taDmi': ('high', 'low', 5), 'taEma': ('close', 5),
+    'taFalling': ('close', 3), 'taHighest': ('close', 5), 'taHighestBars': ('close', 5), 'taHma': ('close', 9),
+    'taKc': ('high', 'low', 'close', 5, 2), 'taKcw': ('high', 'low', 'close', 5, 2), 'taLinReg': ('close', 5),
+    'taLowest': ('close', 5), 'taLowestBars': ('close', 5), 'taMacd': ('close', 3, 6, 4), 'taMax': ('close', 5),
+    'taMedian': ('close', 5), 'taMfi': ('high', 'low', 'close', 'volume', 5), 'taMin': ('close', 5),
+    'taMode': ('close', 5), 'taMom': ('close', 5), 'taPercentile': ('close', 5, 30), 'taPercentRank': ('close', 5),
+    'taPivotHigh': ('close', 2, 2), 'taPivotLow': ('close', 2, 2), 'taRange': ('close', 5), 'taRising': ('close', 3),
+    'taRma': ('close', 5), 'taRoc': ('close', 5), 'taRsi': ('close', 5), 'taSar': ('high', 'low', 0.02, 0.2),
+    'taSma': ('close', 5), 'taStdev': ('close', 5), 'taStoch': ('high', 'low', 'close', 5, 3, 3),
+    'taSuperTrend': ('high', 'low', 'close', 5, 2), 'taSwma': ('close',), 'taTsi': ('close', 5, 3),
+    'taValueWhen': ('up', 'close', 1), 'taVariance': ('close', 5), 'taVwap': ('high', 'low', 'close', 'volume'),
+    'taVwma': ('close', 'volume', 5), 'taWma': ('close', 5), 'taWpr': ('high', 'low', 'close', 5),
+}
+
+# kernels with no batch builtin of the same name
+KERNEL_ONLY = {'taPercentileLinearInterpolation', 'taPercentileNearestRank', 'taTr'}
+
+
+class TestStreamingKernels(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        # prices on a 0.5 grid so windows hold ties and unchanged bars
+        close = 100 + np.round(np.cumsum(rng.normal(0, 1, 120)) * 2) / 2
+        self.series = {
+            'close': list(close),
+            'open': list(close + np.round(rng.normal(0, 1, 120) * 2) / 2),
+            'high': list(close + rng.integers(0, 4, 120) / 2),
+            'low': list(close - rng.integers(1, 4, 120) / 2),
+            'volume': list(rng.integers(1, 50, 120) * 100.0),
+            'up': list(rng.random(120) < 0.3),
+        }
+
+    def assertSameValue(self, streamed, batch, message):
+        if isinstance(batch, dict):
+            self.assertIsInstance(streamed, dict, message)
+            self.assertEqual(streamed.keys(), batch.keys(), message)
+            for key in batch:
+                self.assertSameValue(streamed[key], batch[key], f'{message} [{key}]')
+        elif batch != batch:
+            self.assertTrue(streamed != streamed, f'{message}: {streamed} is not na')
+        else:
+            self.assertAlmostEqual(streamed, batch, places=7, msg=message)
+
+    def test_every_kernel_matches_its_builtin_bar_by_bar(self):
+        self.assertEqual(set(STREAMING_KERNELS) - set(KERNEL_ARGS), KERNEL_ONLY)
+        self.assertFalse(KERNEL_ONLY & set(T.BUILTINS))
+        for name, args in KERNEL_ARGS.items():
+            engine = StreamingTAEngine()
+            self.assertTrue(engine.supports(name, args), name)
+            for bar in range(len(self.series['close'])):
+                history = [self.series[arg][:bar + 1] if isinstance(arg, str) else arg for arg in args]
+                current = [self.series[arg][bar] if isinstance(arg, str) else arg for arg in args]
+                self.assertSameValue(engine.update(name, name, current, bar),
+                                     T.BUILTINS[name].func(None, *history), f'{name} on bar {bar}')
+
+    def test_cog_of_a_zero_window_is_zero(self):
+        engine = StreamingTAEngine()
+        values = [engine.update('cog', 'taCog', [value, 3], bar) for bar, value in enumerate([0.0] * 4)]
+        self.assertEqual(values[2:], [0, 0])
+        self.assertEqual(T.BUILTINS['taCog'].func(None, [0.0] * 4, 3), 0)
+
+    def test_channel_builtins_stream_inside_scripts(self):
+        for name, args in (('taKc', ('high', 'low', 'close', 3, 2)), ('taKcw', ('high', 'low', 'close', 3, 2)),
+                           ('taDmi', ('high', 'low', 3)), ('taSuperTrend', ('high', 'low', 'close', 3, 2))):
+            source = f"return {name}({', '.join(map(str, args))})"
+            script = T.load_script(source).compiled.instantiate()
+            for bar in range(len(CLOSES)):
+                script.step({column: OHLCV[column][bar] for column in OHLCV})
+            self.assertEqual(len(script.ta_engine.call_sites), 1, name)
+
+            values = T.run_interpreter(source, OHLCV)['values']
+            for bar, value in enumerate(values):
+                history = [OHLCV[arg][:bar + 1] if isinstance(arg, str) else arg for arg in args]
+                expected = T._plain(T.BUILTINS[name].func(None, *history))
+                if isinstance(expected, dict):
+                    for key in expected:
+                        self.assertAlmostEqual(value[key], expected[key], places=7, msg=name)
+                else:
+                    self.assertEqual(value, expected, name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,40 @@
+from typing import Callable, Dict, NamedTuple
+
+
+class Builtin(NamedTuple):
+    name: str
+    func: Callable
+
+
+# name -> Builtin for calculate_syntax, filled in at import by @builtin
+BUILTINS: Dict[str, Builtin] = {}
+
+# name -> Builtin for the _handle_*_operation families, filled in at import by @handles
+OPERATIONS: Dict[str, Builtin] = {}
+
+
+def _registrar(table):
+    def register_as(*names):
+        """Register an implementation under its DevScript name(s); the first definition of a name wins"""
+        def register(func):
+            for name in names:
+                table.setdefault(name, Builtin(name, func))
+            return func
+        return register
+    return register_as
+
+
+builtin = _registrar(BUILTINS)
+handles = _registrar(OPERATIONS)
+
+
+def _handle_operation(self, operation, args):
+    entry = OPERATIONS.get(operation)
+    if entry is None:
+        return None
+    return entry.func(self, operation, args)
+
+
 def _calculate_market_data(self):
     """
     Calculate all market data related values including OHLCV, symbol info, and derived price calculations
@@ -108,381 +145,419 @@ def _calculate_market_data(self):
 
 
 
-def _handle_ta_operation(self, operation, args):
-    """
-    Technical Analysis handler with syntax validation and calculations
-    """
-    # Basic Technical Indicators
-    if operation == 'sma':
-        source = args[0]
-        length = args[1]
-        return sum(source[-length:]) / length
-        
-    if operation == 'ema':
-        source = args[0]
-        length = args[1]
-        alpha = 2 / (length + 1)
-        result = source[0]
-        for value in source[1:]:
-            result = alpha * value + (1 - alpha) * result
-        return result
-        
-    if operation == 'rsi':
-        source = args[0]
-        length = args[1]
-        changes = [source[i] - source[i-1] for i in range(1, len(source))]
-        gains = [max(0, change) for change in changes]
-        losses = [abs(min(0, change)) for change in changes]
-        avg_gain = sum(gains[-length:]) / length
-        avg_loss = sum(losses[-length:]) / length
-        rs = avg_gain / avg_loss if avg_loss != 0 else float('inf')
-        return 100 - (100 / (1 + rs))
+#Ta
 
-    # Volume Analysis
-    if operation == 'taAccDist':
-        high, low, close, volume = args
-        mfm = ((close - low) - (high - close)) / (high - low) if high != low else 0
-        return mfm * volume
-        
-    if operation == 'taOBV':
-        close, volume = args
-        prev_close = close[-1]
-        if close > prev_close:
-            return volume
-        elif close < prev_close:
-            return -volume
-        return 0
-        
-    if operation == 'taVWAP':
-        high, low, close, volume = args
-        typical_price = (high + low + close) / 3
-        return sum(typical_price * volume) / sum(volume)
-
-    # Momentum Indicators
-    if operation == 'taMom':
-        source = args[0]
-        length = args[1]
-        return source[-1] - source[-length]
-        
-    if operation == 'taCci':
-        high, low, close, length = args
-        typical_price = (high + low + close) / 3
-        sma = sum(typical_price[-length:]) / length
-        mean_deviation = sum(abs(price - sma) for price in typical_price[-length:]) / length
-        return (typical_price[-1] - sma) / (0.015 * mean_deviation)
-        
-    if operation == 'taRoc':
-        source = args[0]
-        length = args[1]
-        return ((source[-1] - source[-length]) / source[-length]) * 100
-
-    # Volatility Indicators
-    if operation == 'taAtr':
-        high, low, close, length = args
-        tr = max(
-            high - low,
-            abs(high - close[-1]),
-            abs(low - close[-1])
-        )
-        return sum(tr[-length:]) / length
-        
-    if operation == 'taBb':
-        source, length, mult = args
-        sma = sum(source[-length:]) / length
-        std = (sum((x - sma) ** 2 for x in source[-length:]) / length) ** 0.5
-        return {
-            'middle': sma,
-            'upper': sma + (mult * std),
-            'lower': sma - (mult * std)
-        }
-
-    # Trend Indicators
-    if operation == 'taDmi':
-        high, low, close, length = args
-        tr = max(high - low, abs(high - close[-1]), abs(low - close[-1]))
-        plus_dm = max(0, high - high[-1]) if high - high[-1] > low[-1] - low else 0
-        minus_dm = max(0, low[-1] - low) if low[-1] - low > high - high[-1] else 0
-        tr_sum = sum(tr[-length:])
-        plus_di = 100 * sum(plus_dm[-length:]) / tr_sum
-        minus_di = 100 * sum(minus_dm[-length:]) / tr_sum
-        return {
-            'plus_di': plus_di,
-            'minus_di': minus_di,
-            'adx': abs(plus_di - minus_di) / (plus_di + minus_di) * 100
-        }
-
-    # Statistical Indicators
-    if operation == 'taStdev':
-        source = args[0]
-        length = args[1]
-        mean = sum(source[-length:]) / length
-        return (sum((x - mean) ** 2 for x in source[-length:]) / length) ** 0.5
-        
-    if operation == 'taVariance':
-        source = args[0]
-        length = args[1]
-        mean = sum(source[-length:]) / length
-        return sum((x - mean) ** 2 for x in source[-length:]) / length
-        
-    if operation == 'taMedian':
-        source = args[0]
-        length = args[1]
-        sorted_values = sorted(source[-length:])
-        mid = length // 2
-        return sorted_values[mid] if length % 2 else (sorted_values[mid-1] + sorted_values[mid]) / 2
-
-    # Range Indicators
-    if operation == 'taHighest':
-        source = args[0]
-        length = args[1]
-        return max(source[-length:])
-        
-    if operation == 'taLowest':
-        source = args[0]
-        length = args[1]
-        return min(source[-length:])
-        
-    if operation == 'taRange':
-        source = args[0]
-        length = args[1]
-        return max(source[-length:]) - min(source[-length:])
-
-        # Moving Average Variants
-    if operation == 'taWma':
-        source, length = args
-        weights = list(range(1, length + 1))
-        weight_sum = sum(weights)
-        return sum(source[-i] * weights[i-1] for i in range(1, length + 1)) / weight_sum
-        
-    if operation == 'taHma':
-        source, length = args
-        wma1 = self._handle_ta_operation('taWma', [source, length//2])
-        wma2 = self._handle_ta_operation('taWma', [source, length])
-        diff = [2 * wma1[i] - wma2[i] for i in range(len(wma1))]
-        return self._handle_ta_operation('taWma', [diff, int(length**0.5)])
-        
-    if operation == 'taAlma':
-        source, length, offset, sigma = args
-        m = offset * (length - 1)
-        s = length / sigma
-        weights = [exp(-((i - m)**2) / (2 * s**2)) for i in range(length)]
-        weight_sum = sum(weights)
-        return sum(source[-i] * weights[i-1] for i in range(1, length + 1)) / weight_sum
-
-    # Oscillators
-    if operation == 'taMfi':
-        high, low, close, volume, length = args
-        typical_price = [(h + l + c) / 3 for h, l, c in zip(high, low, close)]
-        money_flow = [tp * v for tp, v in zip(typical_price, volume)]
-        pos_flow = sum(mf for mf, tp, ptp in zip(money_flow[-length:], typical_price[-length:], typical_price[-length-1:]) if tp > ptp)
-        neg_flow = sum(mf for mf, tp, ptp in zip(money_flow[-length:], typical_price[-length:], typical_price[-length-1:]) if tp < ptp)
-        return 100 * pos_flow / (pos_flow + neg_flow) if (pos_flow + neg_flow) > 0 else 50
-        
-    if operation == 'taWpr':
-        high, low, close, length = args
-        highest = max(high[-length:])
-        lowest = min(low[-length:])
-        return -100 * (highest - close[-1]) / (highest - lowest) if (highest - lowest) > 0 else 0
-
-    # Trend Strength
-    if operation == 'taTsi':
-        source, short_length, long_length = args
-        momentum = [source[i] - source[i-1] for i in range(1, len(source))]
-        smooth1 = self._handle_ta_operation('taEma', [momentum, long_length])
-        smooth2 = self._handle_ta_operation('taEma', [smooth1, short_length])
-        abs_momentum = [abs(m) for m in momentum]
-        abs_smooth1 = self._handle_ta_operation('taEma', [abs_momentum, long_length])
-        abs_smooth2 = self._handle_ta_operation('taEma', [abs_smooth1, short_length])
-        return 100 * smooth2[-1] / abs_smooth2[-1] if abs_smooth2[-1] != 0 else 0
-        
-    if operation == 'taCmo':
-        source, length = args
-        changes = [source[i] - source[i-1] for i in range(1, len(source))]
-        pos_sum = sum(ch for ch in changes[-length:] if ch > 0)
-        neg_sum = abs(sum(ch for ch in changes[-length:] if ch < 0))
-        return 100 * (pos_sum - neg_sum) / (pos_sum + neg_sum) if (pos_sum + neg_sum) > 0 else 0
-
-    # Pattern Recognition
-    if operation == 'taCross':
-        source1, source2 = args
-        return source1[-2] < source2[-2] and source1[-1] > source2[-1]
-        
-    if operation == 'taCrossover':
-        source1, source2 = args
-        return source1[-2] <= source2[-2] and source1[-1] > source2[-1]
-        
-    if operation == 'taCrossunder':
-        source1, source2 = args
-        return source1[-2] >= source2[-2] and source1[-1] < source2[-1]
-
-    # Pivot Points
-    if operation == 'taPivotHigh':
-        source, leftbars, rightbars = args
-        if len(source) < leftbars + rightbars + 1:
-            return None
-        center = source[-rightbars-1]
-        left_range = source[-(leftbars+rightbars+1):-rightbars-1]
-        right_range = source[-rightbars:]
-        return center if all(center >= x for x in left_range + right_range) else None
-        
-    if operation == 'taPivotLow':
-        source, leftbars, rightbars = args
-        if len(source) < leftbars + rightbars + 1:
-            return None
-        center = source[-rightbars-1]
-        left_range = source[-(leftbars+rightbars+1):-rightbars-1]
-        right_range = source[-rightbars:]
-        return center if all(center <= x for x in left_range + right_range) else None
-
-    # Correlation and Regression
-    if operation == 'taCorrelation':
-        source1, source2, length = args
-        if len(source1) < length or len(source2) < length:
-            return None
-        mean1 = sum(source1[-length:]) / length
-        mean2 = sum(source2[-length:]) / length
-        covar = sum((x - mean1) * (y - mean2) for x, y in zip(source1[-length:], source2[-length:]))
-        std1 = sum((x - mean1)**2 for x in source1[-length:]) ** 0.5
-        std2 = sum((x - mean2)**2 for x in source2[-length:]) ** 0.5
-        return covar / (std1 * std2) if std1 * std2 != 0 else 0
-        
-    if operation == 'taLinReg':
-        source, length = args
-        x = list(range(length))
-        y = source[-length:]
-        mean_x = sum(x) / length
-        mean_y = sum(y) / length
-        covar = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
-        var_x = sum((xi - mean_x)**2 for xi in x)
-        slope = covar / var_x if var_x != 0 else 0
-        intercept = mean_y - slope * mean_x
-        return slope * (length - 1) + intercept
-
-        # Supertrend Indicator
-    if operation == 'taSuperTrend':
-        high, low, close, length, multiplier = args
-        atr = self._handle_ta_operation('taAtr', [high, low, close, length])
-        hl2 = [(h + l) / 2 for h, l in zip(high, low)]
-        
-        upper_band = [hl + multiplier * atr for hl in hl2]
-        lower_band = [hl - multiplier * atr for hl in hl2]
-        
-        trend = [1]  # 1 for uptrend, -1 for downtrend
-        supertrend = [lower_band[0]]
-        
-        for i in range(1, len(close)):
-            if close[i] > supertrend[i-1]:
-                trend.append(1)
-            elif close[i] < supertrend[i-1]:
-                trend.append(-1)
-            else:
-                trend.append(trend[i-1])
-                
-            if trend[i] == 1:
-                supertrend.append(min(lower_band[i], supertrend[i-1]))
-            else:
-                supertrend.append(max(upper_band[i], supertrend[i-1]))
-                
-        return supertrend[-1]
-
-    # Value When Condition
-    if operation == 'taValueWhen':
-        condition, source = args
-        for i in range(len(condition)-1, -1, -1):
-            if condition[i]:
-                return source[i]
-        return None
+# Basic Technical Indicators
+@handles('sma')
+def _ta_sma(self, operation, args):
+    source = args[0]
+    length = args[1]
+    return sum(source[-length:]) / length
 
-    # Bars Since Condition
-    if operation == 'taBarsSince':
-        condition = args[0]
-        count = 0
-        for i in range(len(condition)-1, -1, -1):
-            if condition[i]:
-                return count
-            count += 1
-        return count
-
-    # Rising/Falling Detection
-    if operation == 'taRising':
-        source, length = args
-        return all(source[i] > source[i-1] for i in range(-1, -length-1, -1))
-        
-    if operation == 'taFalling':
-        source, length = args
-        return all(source[i] < source[i-1] for i in range(-1, -length-1, -1))
-
-    # Center of Gravity
-    if operation == 'taCog':
-        source, length = args
-        weighted_sum = sum(source[-i] * i for i in range(1, length + 1))
-        total_sum = sum(source[-length:])
-        return -weighted_sum / total_sum if total_sum != 0 else 0
-
-    # Percentile and Rank
-    if operation == 'taPercentile':
-        source, length, percentage = args
-        sorted_values = sorted(source[-length:])
-        index = (length - 1) * percentage / 100
-        return sorted_values[int(index)]
-        
-    if operation == 'taPercentRank':
-        source, length = args
-        current = source[-1]
-        history = source[-length:]
-        return sum(1 for x in history if x < current) * 100 / length
-
-    # Keltner Channels
-    if operation == 'taKc':
-        high, low, close, length, mult = args
-        basis = self._handle_ta_operation('taEma', [close, length])
-        atr = self._handle_ta_operation('taAtr', [high, low, close, length])
-        
-        return {
-            'middle': basis,
-            'upper': basis + mult * atr,
-            'lower': basis - mult * atr
-        }
-        
-    if operation == 'taKcw':
-        high, low, close, length = args
-        return self._handle_ta_operation('taKc', [high, low, close, length, 1.0])
-
-    # Smoothed Moving Average
-    if operation == 'taSwma':
-        source = args[0]
-        weights = [0.4, 0.3, 0.2, 0.1]
-        if len(source) < 4:
-            return None
-        return sum(w * p for w, p in zip(weights, source[-4:]))
-
-    # Running Moving Average
-    if operation == 'taRma':
-        source, length = args
-        alpha = 1 / length
-        result = source[0]
-        for value in source[1:]:
-            result = alpha * value + (1 - alpha) * result
-        return result
-
-    # Cumulative Sum
-    if operation == 'taCum':
-        source = args[0]
-        return sum(source)
-
-    # Change Over Time
-    if operation == 'taChange':
-        source, length = args
-        return source[-1] - source[-length]
+@handles('ema')
+def _ta_ema(self, operation, args):
+    source = args[0]
+    length = args[1]
+    alpha = 2 / (length + 1)
+    result = source[0]
+    for value in source[1:]:
+        result = alpha * value + (1 - alpha) * result
+    return result
+
+@handles('rsi')
+def _ta_rsi(self, operation, args):
+    source = args[0]
+    length = args[1]
+    changes = [source[i] - source[i-1] for i in range(1, len(source))]
+    gains = [max(0, change) for change in changes]
+    losses = [abs(min(0, change)) for change in changes]
+    avg_gain = sum(gains[-length:]) / length
+    avg_loss = sum(losses[-length:]) / length
+    rs = avg_gain / avg_loss if avg_loss != 0 else float('inf')
+    return 100 - (100 / (1 + rs))
+
+# Volume Analysis
+@handles('taAccDist')
+def _ta_taAccDist(self, operation, args):
+    high, low, close, volume = args
+    mfm = ((close - low) - (high - close)) / (high - low) if high != low else 0
+    return mfm * volume
+
+@handles('taOBV')
+def _ta_taOBV(self, operation, args):
+    close, volume = args
+    prev_close = close[-1]
+    if close > prev_close:
+        return volume
+    elif close < prev_close:
+        return -volume
+    return 0
+
+@handles('taVWAP')
+def _ta_taVWAP(self, operation, args):
+    high, low, close, volume = args
+    typical_price = (high + low + close) / 3
+    return sum(typical_price * volume) / sum(volume)
+
+# Momentum Indicators
+@handles('taMom')
+def _ta_taMom(self, operation, args):
+    source = args[0]
+    length = args[1]
+    return source[-1] - source[-length]
+
+@handles('taCci')
+def _ta_taCci(self, operation, args):
+    high, low, close, length = args
+    typical_price = (high + low + close) / 3
+    sma = sum(typical_price[-length:]) / length
+    mean_deviation = sum(abs(price - sma) for price in typical_price[-length:]) / length
+    return (typical_price[-1] - sma) / (0.015 * mean_deviation)
+
+@handles('taRoc')
+def _ta_taRoc(self, operation, args):
+    source = args[0]
+    length = args[1]
+    return ((source[-1] - source[-length]) / source[-length]) * 100
+
+# Volatility Indicators
+@handles('taAtr')
+def _ta_taAtr(self, operation, args):
+    high, low, close, length = args
+    tr = max(
+        high - low,
+        abs(high - close[-1]),
+        abs(low - close[-1])
+    )
+    return sum(tr[-length:]) / length
+
+@handles('taBb')
+def _ta_taBb(self, operation, args):
+    source, length, mult = args
+    sma = sum(source[-length:]) / length
+    std = (sum((x - sma) ** 2 for x in source[-length:]) / length) ** 0.5
+    return {
+        'middle': sma,
+        'upper': sma + (mult * std),
+        'lower': sma - (mult * std)
+    }
 
+# Trend Indicators
+@handles('taDmi')
+def _ta_taDmi(self, operation, args):
+    high, low, close, length = args
+    tr = max(high - low, abs(high - close[-1]), abs(low - close[-1]))
+    plus_dm = max(0, high - high[-1]) if high - high[-1] > low[-1] - low else 0
+    minus_dm = max(0, low[-1] - low) if low[-1] - low > high - high[-1] else 0
+    tr_sum = sum(tr[-length:])
+    plus_di = 100 * sum(plus_dm[-length:]) / tr_sum
+    minus_di = 100 * sum(minus_dm[-length:]) / tr_sum
+    return {
+        'plus_di': plus_di,
+        'minus_di': minus_di,
+        'adx': abs(plus_di - minus_di) / (plus_di + minus_di) * 100
+    }
+
+# Statistical Indicators
+@handles('taStdev')
+def _ta_taStdev(self, operation, args):
+    source = args[0]
+    length = args[1]
+    mean = sum(source[-length:]) / length
+    return (sum((x - mean) ** 2 for x in source[-length:]) / length) ** 0.5
+
+@handles('taVariance')
+def _ta_taVariance(self, operation, args):
+    source = args[0]
+    length = args[1]
+    mean = sum(source[-length:]) / length
+    return sum((x - mean) ** 2 for x in source[-length:]) / length
+
+@handles('taMedian')
+def _ta_taMedian(self, operation, args):
+    source = args[0]
+    length = args[1]
+    sorted_values = sorted(source[-length:])
+    mid = length // 2
+    return sorted_values[mid] if length % 2 else (sorted_values[mid-1] + sorted_values[mid]) / 2
+
+# Range Indicators
+@handles('taHighest')
+def _ta_taHighest(self, operation, args):
+    source = args[0]
+    length = args[1]
+    return max(source[-length:])
+
+@handles('taLowest')
+def _ta_taLowest(self, operation, args):
+    source = args[0]
+    length = args[1]
+    return min(source[-length:])
+
+@handles('taRange')
+def _ta_taRange(self, operation, args):
+    source = args[0]
+    length = args[1]
+    return max(source[-length:]) - min(source[-length:])
+
+# Moving Average Variants
+@handles('taWma')
+def _ta_taWma(self, operation, args):
+    source, length = args
+    weights = list(range(1, length + 1))
+    weight_sum = sum(weights)
+    return sum(source[-i] * weights[i-1] for i in range(1, length + 1)) / weight_sum
+
+@handles('taHma')
+def _ta_taHma(self, operation, args):
+    source, length = args
+    wma1 = self._handle_ta_operation('taWma', [source, length//2])
+    wma2 = self._handle_ta_operation('taWma', [source, length])
+    diff = [2 * wma1[i] - wma2[i] for i in range(len(wma1))]
+    return self._handle_ta_operation('taWma', [diff, int(length**0.5)])
+
+@handles('taAlma')
+def _ta_taAlma(self, operation, args):
+    source, length, offset, sigma = args
+    m = offset * (length - 1)
+    s = length / sigma
+    weights = [exp(-((i - m)**2) / (2 * s**2)) for i in range(length)]
+    weight_sum = sum(weights)
+    return sum(source[-i] * weights[i-1] for i in range(1, length + 1)) / weight_sum
+
+# Oscillators
+@handles('taMfi')
+def _ta_taMfi(self, operation, args):
+    high, low, close, volume, length = args
+    typical_price = [(h + l + c) / 3 for h, l, c in zip(high, low, close)]
+    money_flow = [tp * v for tp, v in zip(typical_price, volume)]
+    pos_flow = sum(mf for mf, tp, ptp in zip(money_flow[-length:], typical_price[-length:], typical_price[-length-1:]) if tp > ptp)
+    neg_flow = sum(mf for mf, tp, ptp in zip(money_flow[-length:], typical_price[-length:], typical_price[-length-1:]) if tp < ptp)
+    return 100 * pos_flow / (pos_flow + neg_flow) if (pos_flow + neg_flow) > 0 else 50
+
+@handles('taWpr')
+def _ta_taWpr(self, operation, args):
+    high, low, close, length = args
+    highest = max(high[-length:])
+    lowest = min(low[-length:])
+    return -100 * (highest - close[-1]) / (highest - lowest) if (highest - lowest) > 0 else 0
+
+# Trend Strength
+@handles('taTsi')
+def _ta_taTsi(self, operation, args):
+    source, short_length, long_length = args
+    momentum = [source[i] - source[i-1] for i in range(1, len(source))]
+    smooth1 = self._handle_ta_operation('taEma', [momentum, long_length])
+    smooth2 = self._handle_ta_operation('taEma', [smooth1, short_length])
+    abs_momentum = [abs(m) for m in momentum]
+    abs_smooth1 = self._handle_ta_operation('taEma', [abs_momentum, long_length])
+    abs_smooth2 = self._handle_ta_operation('taEma', [abs_smooth1, short_length])
+    return 100 * smooth2[-1] / abs_smooth2[-1] if abs_smooth2[-1] != 0 else 0
+
+@handles('taCmo')
+def _ta_taCmo(self, operation, args):
+    source, length = args
+    changes = [source[i] - source[i-1] for i in range(1, len(source))]
+    pos_sum = sum(ch for ch in changes[-length:] if ch > 0)
+    neg_sum = abs(sum(ch for ch in changes[-length:] if ch < 0))
+    return 100 * (pos_sum - neg_sum) / (pos_sum + neg_sum) if (pos_sum + neg_sum) > 0 else 0
+
+# Pattern Recognition
+@handles('taCross')
+def _ta_taCross(self, operation, args):
+    source1, source2 = args
+    return source1[-2] < source2[-2] and source1[-1] > source2[-1]
+
+@handles('taCrossover')
+def _ta_taCrossover(self, operation, args):
+    source1, source2 = args
+    return source1[-2] <= source2[-2] and source1[-1] > source2[-1]
+
+@handles('taCrossunder')
+def _ta_taCrossunder(self, operation, args):
+    source1, source2 = args
+    return source1[-2] >= source2[-2] and source1[-1] < source2[-1]
+
+# Pivot Points
+@handles('taPivotHigh')
+def _ta_taPivotHigh(self, operation, args):
+    source, leftbars, rightbars = args
+    if len(source) < leftbars + rightbars + 1:
+        return None
+    center = source[-rightbars-1]
+    left_range = source[-(leftbars+rightbars+1):-rightbars-1]
+    right_range = source[-rightbars:]
+    return center if all(center >= x for x in left_range + right_range) else None
+
+@handles('taPivotLow')
+def _ta_taPivotLow(self, operation, args):
+    source, leftbars, rightbars = args
+    if len(source) < leftbars + rightbars + 1:
+        return None
+    center = source[-rightbars-1]
+    left_range = source[-(leftbars+rightbars+1):-rightbars-1]
+    right_range = source[-rightbars:]
+    return center if all(center <= x for x in left_range + right_range) else None
+
+# Correlation and Regression
+@handles('taCorrelation')
+def _ta_taCorrelation(self, operation, args):
+    source1, source2, length = args
+    if len(source1) < length or len(source2) < length:
+        return None
+    mean1 = sum(source1[-length:]) / length
+    mean2 = sum(source2[-length:]) / length
+    covar = sum((x - mean1) * (y - mean2) for x, y in zip(source1[-length:], source2[-length:]))
+    std1 = sum((x - mean1)**2 for x in source1[-length:]) ** 0.5
+    std2 = sum((x - mean2)**2 for x in source2[-length:]) ** 0.5
+    return covar / (std1 * std2) if std1 * std2 != 0 else 0
+
+@handles('taLinReg')
+def _ta_taLinReg(self, operation, args):
+    source, length = args
+    x = list(range(length))
+    y = source[-length:]
+    mean_x = sum(x) / length
+    mean_y = sum(y) / length
+    covar = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
+    var_x = sum((xi - mean_x)**2 for xi in x)
+    slope = covar / var_x if var_x != 0 else 0
+    intercept = mean_y - slope * mean_x
+    return slope * (length - 1) + intercept
+
+# Supertrend Indicator
+@handles('taSuperTrend')
+def _ta_taSuperTrend(self, operation, args):
+    high, low, close, length, multiplier = args
+    atr = self._handle_ta_operation('taAtr', [high, low, close, length])
+    hl2 = [(h + l) / 2 for h, l in zip(high, low)]
+    
+    upper_band = [hl + multiplier * atr for hl in hl2]
+    lower_band = [hl - multiplier * atr for hl in hl2]
+    
+    trend = [1]  # 1 for uptrend, -1 for downtrend
+    supertrend = [lower_band[0]]
+    
+    for i in range(1, len(close)):
+        if close[i] > supertrend[i-1]:
+            trend.append(1)
+        elif close[i] < supertrend[i-1]:
+            trend.append(-1)
+        else:
+            trend.append(trend[i-1])
+            
+        if trend[i] == 1:
+            supertrend.append(min(lower_band[i], supertrend[i-1]))
+        else:
+            supertrend.append(max(upper_band[i], supertrend[i-1]))
+            
+    return supertrend[-1]
+
+# Value When Condition
+@handles('taValueWhen')
+def _ta_taValueWhen(self, operation, args):
+    condition, source = args
+    for i in range(len(condition)-1, -1, -1):
+        if condition[i]:
+            return source[i]
     return None
 
+# Bars Since Condition
+@handles('taBarsSince')
+def _ta_taBarsSince(self, operation, args):
+    condition = args[0]
+    count = 0
+    for i in range(len(condition)-1, -1, -1):
+        if condition[i]:
+            return count
+        count += 1
+    return count
+
+# Rising/Falling Detection
+@handles('taRising')
+def _ta_taRising(self, operation, args):
+    source, length = args
+    return all(source[i] > source[i-1] for i in range(-1, -length-1, -1))
+
+@handles('taFalling')
+def _ta_taFalling(self, operation, args):
+    source, length = args
+    return all(source[i] < source[i-1] for i in range(-1, -length-1, -1))
+
+# Center of Gravity
+@handles('taCog')
+def _ta_taCog(self, operation, args):
+    source, length = args
+    weighted_sum = sum(source[-i] * i for i in range(1, length + 1))
+    total_sum = sum(source[-length:])
+    return -weighted_sum / total_sum if total_sum != 0 else 0
+
+# Percentile and Rank
+@handles('taPercentile')
+def _ta_taPercentile(self, operation, args):
+    source, length, percentage = args
+    sorted_values = sorted(source[-length:])
+    index = (length - 1) * percentage / 100
+    return sorted_values[int(index)]
+
+@handles('taPercentRank')
+def _ta_taPercentRank(self, operation, args):
+    source, length = args
+    current = source[-1]
+    history = source[-length:]
+    return sum(1 for x in history if x < current) * 100 / length
+
+# Keltner Channels
+@handles('taKc')
+def _ta_taKc(self, operation, args):
+    high, low, close, length, mult = args
+    basis = self._handle_ta_operation('taEma', [close, length])
+    atr = self._handle_ta_operation('taAtr', [high, low, close, length])
+    
+    return {
+        'middle': basis,
+        'upper': basis + mult * atr,
+        'lower': basis - mult * atr
+    }
 
+@handles('taKcw')
+def _ta_taKcw(self, operation, args):
+    high, low, close, length = args
+    return self._handle_ta_operation('taKc', [high, low, close, length, 1.0])
+
+# Smoothed Moving Average
+@handles('taSwma')
+def _ta_taSwma(self, operation, args):
+    source = args[0]
+    weights = [0.4, 0.3, 0.2, 0.1]
+    if len(source) < 4:
+        return None
+    return sum(w * p for w, p in zip(weights, source[-4:]))
 
+# Running Moving Average
+@handles('taRma')
+def _ta_taRma(self, operation, args):
+    source, length = args
+    alpha = 1 / length
+    result = source[0]
+    for value in source[1:]:
+        result = alpha * value + (1 - alpha) * result
+    return result
 
+# Cumulative Sum
+@handles('taCum')
+def _ta_taCum(self, operation, args):
+    source = args[0]
+    return sum(source)
 
+# Change Over Time
+@handles('taChange')
+def _ta_taChange(self, operation, args):
+    source, length = args
+    return source[-1] - source[-length]
 
 
+_handle_ta_operation = _handle_operation
 
 
 
@@ -495,425 +570,547 @@ def _handle_ta_operation(self, operation, args):
 
 
 
-def _handle_ticker_operation(self, operation, args):
-    """
-    Handles all ticker and symbol related operations
-    """
-    # Basic Symbol Info
-    if operation == 'symInfoMinMove':
-        return self.symbol.min_move
-        
-    if operation == 'symInfoMinTick':
-        return self.symbol.min_tick
-        
-    if operation == 'symInfoPointValue':
-        return self.symbol.point_value
-        
-    if operation == 'symInfoPrefix':
-        return self.symbol.prefix
-        
-    if operation == 'symInfoPriceScale':
-        return self.symbol.price_scale
-        
-    if operation == 'symInfoRoot':
-        return self.symbol.root
-        
-    if operation == 'symInfoSector':
-        return self.symbol.sector
-        
-    if operation == 'symInfoSession':
-        return self.symbol.session
 
-    # Company Information
-    if operation == 'symInfoBaseCurrency':
-        return self.symbol.base_currency
-        
-    if operation == 'symInfoCountry':
-        return self.symbol.country
-        
-    if operation == 'symInfoCurrency':
-        return self.symbol.currency
-        
-    if operation == 'symInfoDescription':
-        return self.symbol.description
-        
-    if operation == 'symInfoEmployees':
-        return self.symbol.employees
-        
-    if operation == 'symInfoIndustry':
-        return self.symbol.industry
 
-    # Market Data
-    if operation == 'symInfoMainTickerId':
-        return self.symbol.main_ticker_id
-        
-    if operation == 'symInfoMinContract':
-        return self.symbol.min_contract
-        
-    if operation == 'symInfoType':
-        return self.symbol.type
-        
-    if operation == 'symInfoVolumeType':
-        return self.symbol.volume_type
 
-    # Share Statistics
-    if operation == 'symInfoShareholders':
-        return self.symbol.shareholders
-        
-    if operation == 'symInfoSharesOutstandingFloat':
-        return self.symbol.shares_outstanding_float
-        
-    if operation == 'symInfoSharesOutstandingTotal':
-        return self.symbol.shares_outstanding_total
 
-    # Analyst Recommendations
-    if operation == 'symInfoRecommendationsBuy':
-        return self.symbol.recommendations_buy
-        
-    if operation == 'symInfoRecommendationsBuyStrong':
-        return self.symbol.recommendations_buy_strong
-        
-    if operation == 'symInfoRecommendationsDate':
-        return self.symbol.recommendations_date
-        
-    if operation == 'symInfoRecommendationsHold':
-        return self.symbol.recommendations_hold
-        
-    if operation == 'symInfoRecommendationsSell':
-        return self.symbol.recommendations_sell
-        
-    if operation == 'symInfoRecommendationsSellStrong':
-        return self.symbol.recommendations_sell_strong
-        
-    if operation == 'symInfoRecommendationsTotal':
-        return self.symbol.recommendations_total
 
-    # Price Targets
-    if operation == 'symInfoTargetPriceAverage':
-        return self.symbol.target_price_average
-        
-    if operation == 'symInfoTargetPriceDate':
-        return self.symbol.target_price_date
-        
-    if operation == 'symInfoTargetPriceEstimates':
-        return self.symbol.target_price_estimates
-        
-    if operation == 'symInfoTargetPriceHigh':
-        return self.symbol.target_price_high
-        
-    if operation == 'symInfoTargetPriceLow':
-        return self.symbol.target_price_low
-        
-    if operation == 'symInfoTargetPriceMedian':
-        return self.symbol.target_price_median
 
-    # Identifiers
-    if operation == 'symInfoTicker':
-        return self.symbol.ticker
-        
-    if operation == 'symInfoTickerId':
-        return self.symbol.ticker_id
-        
-    if operation == 'symInfoTimezone':
-        return self.symbol.timezone
 
-        # Dividends Information
-    if operation == 'dividendsFutureAmount':
-        return self.symbol.dividends_future_amount
-        
-    if operation == 'dividendsFutureExDate':
-        return self.symbol.dividends_future_ex_date
-        
-    if operation == 'dividendsFuturePayDate':
-        return self.symbol.dividends_future_pay_date
+#Ticker
 
-    # Earnings Information    
-    if operation == 'earningsFutureEps':
-        return self.symbol.earnings_future_eps
-        
-    if operation == 'earningsFuturePeriodEndTime':
-        return self.symbol.earnings_future_period_end_time
-        
-    if operation == 'earningsFutureRevenue':
-        return self.symbol.earnings_future_revenue
-        
-    if operation == 'earningsFutureTime':
-        return self.symbol.earnings_future_time
+# Basic Symbol Info
+@handles('symInfoMinMove')
+def _ticker_symInfoMinMove(self, operation, args):
+    return self.symbol.min_move
 
-    # Splits Information
-    if operation == 'splitsDenominator':
-        return self.symbol.splits_denominator
-        
-    if operation == 'splitsNumerator':
-        return self.symbol.splits_numerator
+@handles('symInfoMinTick')
+def _ticker_symInfoMinTick(self, operation, args):
+    return self.symbol.min_tick
 
-    # Adjustments
-    if operation == 'adjustmentDividends':
-        return self.symbol.adjustment_dividends
-        
-    if operation == 'adjustmentNone':
-        return self.symbol.adjustment_none
-        
-    if operation == 'adjustmentSplits':
-        return self.symbol.adjustment_splits
+@handles('symInfoPointValue')
+def _ticker_symInfoPointValue(self, operation, args):
+    return self.symbol.point_value
 
-    return None
+@handles('symInfoPrefix')
+def _ticker_symInfoPrefix(self, operation, args):
+    return self.symbol.prefix
 
+@handles('symInfoPriceScale')
+def _ticker_symInfoPriceScale(self, operation, args):
+    return self.symbol.price_scale
 
+@handles('symInfoRoot')
+def _ticker_symInfoRoot(self, operation, args):
+    return self.symbol.root
 
+@handles('symInfoSector')
+def _ticker_symInfoSector(self, operation, args):
+    return self.symbol.sector
 
+@handles('symInfoSession')
+def _ticker_symInfoSession(self, operation, args):
+    return self.symbol.session
 
+# Company Information
+@handles('symInfoBaseCurrency')
+def _ticker_symInfoBaseCurrency(self, operation, args):
+    return self.symbol.base_currency
 
+@handles('symInfoCountry')
+def _ticker_symInfoCountry(self, operation, args):
+    return self.symbol.country
 
+@handles('symInfoCurrency')
+def _ticker_symInfoCurrency(self, operation, args):
+    return self.symbol.currency
 
+@handles('symInfoDescription')
+def _ticker_symInfoDescription(self, operation, args):
+    return self.symbol.description
 
+@handles('symInfoEmployees')
+def _ticker_symInfoEmployees(self, operation, args):
+    return self.symbol.employees
 
+@handles('symInfoIndustry')
+def _ticker_symInfoIndustry(self, operation, args):
+    return self.symbol.industry
 
+# Market Data
+@handles('symInfoMainTickerId')
+def _ticker_symInfoMainTickerId(self, operation, args):
+    return self.symbol.main_ticker_id
 
+@handles('symInfoMinContract')
+def _ticker_symInfoMinContract(self, operation, args):
+    return self.symbol.min_contract
 
+@handles('symInfoType')
+def _ticker_symInfoType(self, operation, args):
+    return self.symbol.type
 
+@handles('symInfoVolumeType')
+def _ticker_symInfoVolumeType(self, operation, args):
+    return self.symbol.volume_type
 
+# Share Statistics
+@handles('symInfoShareholders')
+def _ticker_symInfoShareholders(self, operation, args):
+    return self.symbol.shareholders
 
+@handles('symInfoSharesOutstandingFloat')
+def _ticker_symInfoSharesOutstandingFloat(self, operation, args):
+    return self.symbol.shares_outstanding_float
 
+@handles('symInfoSharesOutstandingTotal')
+def _ticker_symInfoSharesOutstandingTotal(self, operation, args):
+    return self.symbol.shares_outstanding_total
 
+# Analyst Recommendations
+@handles('symInfoRecommendationsBuy')
+def _ticker_symInfoRecommendationsBuy(self, operation, args):
+    return self.symbol.recommendations_buy
 
+@handles('symInfoRecommendationsBuyStrong')
+def _ticker_symInfoRecommendationsBuyStrong(self, operation, args):
+    return self.symbol.recommendations_buy_strong
+
+@handles('symInfoRecommendationsDate')
+def _ticker_symInfoRecommendationsDate(self, operation, args):
+    return self.symbol.recommendations_date
+
+@handles('symInfoRecommendationsHold')
+def _ticker_symInfoRecommendationsHold(self, operation, args):
+    return self.symbol.recommendations_hold
+
+@handles('symInfoRecommendationsSell')
+def _ticker_symInfoRecommendationsSell(self, operation, args):
+    return self.symbol.recommendations_sell
+
+@handles('symInfoRecommendationsSellStrong')
+def _ticker_symInfoRecommendationsSellStrong(self, operation, args):
+    return self.symbol.recommendations_sell_strong
 
+@handles('symInfoRecommendationsTotal')
+def _ticker_symInfoRecommendationsTotal(self, operation, args):
+    return self.symbol.recommendations_total
 
+# Price Targets
+@handles('symInfoTargetPriceAverage')
+def _ticker_symInfoTargetPriceAverage(self, operation, args):
+    return self.symbol.target_price_average
 
+@handles('symInfoTargetPriceDate')
+def _ticker_symInfoTargetPriceDate(self, operation, args):
+    return self.symbol.target_price_date
 
+@handles('symInfoTargetPriceEstimates')
+def _ticker_symInfoTargetPriceEstimates(self, operation, args):
+    return self.symbol.target_price_estimates
 
+@handles('symInfoTargetPriceHigh')
+def _ticker_symInfoTargetPriceHigh(self, operation, args):
+    return self.symbol.target_price_high
 
-def _handle_strategy_operation(self, operation, args):
-    """
-    Handles all strategy related operations and calculations
-    """
-    # Account Information
-    if operation == 'strategyAccountCurrency':
-        return self.strategy.account_currency
-        
-    if operation == 'strategyInitialCapital':
-        return self.strategy.initial_capital
-        
-    if operation == 'strategyEquity':
-        return self.strategy.equity
+@handles('symInfoTargetPriceLow')
+def _ticker_symInfoTargetPriceLow(self, operation, args):
+    return self.symbol.target_price_low
 
-    # Trade Performance
-    if operation == 'strategyNetProfit':
-        return self.strategy.net_profit
-        
-    if operation == 'strategyNetProfitPercent':
-        return (self.strategy.net_profit / self.strategy.initial_capital) * 100
-        
-    if operation == 'strategyGrossProfit':
-        return self.strategy.gross_profit
-        
-    if operation == 'strategyGrossProfitPercent':
-        return (self.strategy.gross_profit / self.strategy.initial_capital) * 100
-        
-    if operation == 'strategyGrossLoss':
-        return self.strategy.gross_loss
-        
-    if operation == 'strategyGrossLossPercent':
-        return (self.strategy.gross_loss / self.strategy.initial_capital) * 100
+@handles('symInfoTargetPriceMedian')
+def _ticker_symInfoTargetPriceMedian(self, operation, args):
+    return self.symbol.target_price_median
 
-    # Trade Statistics
-    if operation == 'strategyWinTrades':
-        return self.strategy.win_trades
-        
-    if operation == 'strategyLossTrades':
-        return self.strategy.loss_trades
-        
-    if operation == 'strategyEvenTrades':
-        return self.strategy.even_trades
-        
-    if operation == 'strategyClosedTrades':
-        return self.strategy.closed_trades
-        
-    if operation == 'strategyClosedTradesFirstIndex':
-        return self.strategy.closed_trades_first_index
+# Identifiers
+@handles('symInfoTicker')
+def _ticker_symInfoTicker(self, operation, args):
+    return self.symbol.ticker
 
-    # Average Trade Performance
-    if operation == 'strategyAvgTrade':
-        return self.strategy.avg_trade
-        
-    if operation == 'strategyAvgTradePercent':
-        return self.strategy.avg_trade_percent
-        
-    if operation == 'strategyAvgWinningTrade':
-        return self.strategy.avg_winning_trade
-        
-    if operation == 'strategyAvgWinningTradePercent':
-        return self.strategy.avg_winning_trade_percent
-        
-    if operation == 'strategyAvgLosingTrade':
-        return self.strategy.avg_losing_trade
-        
-    if operation == 'strategyAvgLosingTradePercent':
-        return self.strategy.avg_losing_trade_percent
+@handles('symInfoTickerId')
+def _ticker_symInfoTickerId(self, operation, args):
+    return self.symbol.ticker_id
 
-    # Position Information
-    if operation == 'strategyOpenTrades':
-        return self.strategy.open_trades
-        
-    if operation == 'strategyOpenTradesCapitalHeld':
-        return self.strategy.open_trades_capital_held
-        
-    if operation == 'strategyPositionSize':
-        return self.strategy.position_size
-        
-    if operation == 'strategyPositionAvgPrice':
-        return self.strategy.position_avg_price
-        
-    if operation == 'strategyPositionEntryName':
-        return self.strategy.position_entry_name
+@handles('symInfoTimezone')
+def _ticker_symInfoTimezone(self, operation, args):
+    return self.symbol.timezone
 
-    # Risk Metrics
-    if operation == 'strategyMaxDrawdown':
-        return self.strategy.max_drawdown
-        
-    if operation == 'strategyMaxDrawdownPercent':
-        return self.strategy.max_drawdown_percent
-        
-    if operation == 'strategyMaxRunup':
-        return self.strategy.max_runup
-        
-    if operation == 'strategyMaxRunupPercent':
-        return self.strategy.max_runup_percent
+# Dividends Information
+@handles('dividendsFutureAmount')
+def _ticker_dividendsFutureAmount(self, operation, args):
+    return self.symbol.dividends_future_amount
 
-    # Contract Holdings
-    if operation == 'strategyMaxContractsHeldAll':
-        return self.strategy.max_contracts_held_all
-        
-    if operation == 'strategyMaxContractsHeldLong':
-        return self.strategy.max_contracts_held_long
-        
-    if operation == 'strategyMaxContractsHeldShort':
-        return self.strategy.max_contracts_held_short
+@handles('dividendsFutureExDate')
+def _ticker_dividendsFutureExDate(self, operation, args):
+    return self.symbol.dividends_future_ex_date
 
-    # Open Profit/Loss
-    if operation == 'strategyOpenProfit':
-        return self.strategy.open_profit
-        
-    if operation == 'strategyOpenProfitPercent':
-        return self.strategy.open_profit_percent
+@handles('dividendsFuturePayDate')
+def _ticker_dividendsFuturePayDate(self, operation, args):
+    return self.symbol.dividends_future_pay_date
 
-    # Margin Information
-    if operation == 'strategyMarginLiquidationPrice':
-        return self.strategy.margin_liquidation_price
+# Earnings Information
+@handles('earningsFutureEps')
+def _ticker_earningsFutureEps(self, operation, args):
+    return self.symbol.earnings_future_eps
 
-        # Trade Ratios
-    if operation == 'strategyProfitFactor':
-        return abs(self.strategy.gross_profit / self.strategy.gross_loss) if self.strategy.gross_loss != 0 else float('inf')
-        
-    if operation == 'strategyWinRate':
-        return (self.strategy.win_trades / self.strategy.closed_trades * 100) if self.strategy.closed_trades > 0 else 0
-        
-    if operation == 'strategyPayoffRatio':
-        avg_win = self.strategy.avg_winning_trade
-        avg_loss = abs(self.strategy.avg_losing_trade)
-        return avg_win / avg_loss if avg_loss != 0 else float('inf')
+@handles('earningsFuturePeriodEndTime')
+def _ticker_earningsFuturePeriodEndTime(self, operation, args):
+    return self.symbol.earnings_future_period_end_time
 
-    # Trade Duration Stats
-    if operation == 'strategyAvgTradeLength':
-        return self.strategy.avg_trade_length
-        
-    if operation == 'strategyAvgWinningTradeLength':
-        return self.strategy.avg_winning_trade_length
-        
-    if operation == 'strategyAvgLosingTradeLength':
-        return self.strategy.avg_losing_trade_length
-        
-    if operation == 'strategyMaxTradeLength':
-        return self.strategy.max_trade_length
-        
-    if operation == 'strategyMinTradeLength':
-        return self.strategy.min_trade_length
+@handles('earningsFutureRevenue')
+def _ticker_earningsFutureRevenue(self, operation, args):
+    return self.symbol.earnings_future_revenue
 
-    # Commission and Slippage
-    if operation == 'strategyCommissionPaid':
-        return self.strategy.commission_paid
-        
-    if operation == 'strategyTotalFeesPaid':
-        return self.strategy.total_fees_paid
-        
-    if operation == 'strategySlippagePaid':
-        return self.strategy.slippage_paid
+@handles('earningsFutureTime')
+def _ticker_earningsFutureTime(self, operation, args):
+    return self.symbol.earnings_future_time
 
-    # Risk-Adjusted Returns
-    if operation == 'strategySharpeRatio':
-        return self.strategy.sharpe_ratio
-        
-    if operation == 'strategySortinoRatio':
-        return self.strategy.sortino_ratio
-        
-    if operation == 'strategyCalmarRatio':
-        return self.strategy.calmar_ratio
+# Splits Information
+@handles('splitsDenominator')
+def _ticker_splitsDenominator(self, operation, args):
+    return self.symbol.splits_denominator
 
-    # Consecutive Trade Stats
-    if operation == 'strategyMaxConsecutiveWins':
-        return self.strategy.max_consecutive_wins
-        
-    if operation == 'strategyMaxConsecutiveLosses':
-        return self.strategy.max_consecutive_losses
+@handles('splitsNumerator')
+def _ticker_splitsNumerator(self, operation, args):
+    return self.symbol.splits_numerator
 
-    # Trade Volume Stats
-    if operation == 'strategyTotalVolumeLong':
-        return self.strategy.total_volume_long
-        
-    if operation == 'strategyTotalVolumeShort':
-        return self.strategy.total_volume_short
-        
-    if operation == 'strategyTotalVolumeTraded':
-        return self.strategy.total_volume_traded
+# Adjustments
+@handles('adjustmentDividends')
+def _ticker_adjustmentDividends(self, operation, args):
+    return self.symbol.adjustment_dividends
 
-    # Position Tracking
-    if operation == 'strategyPositionProfit':
-        return self.strategy.position_profit
-        
-    if operation == 'strategyPositionRisk':
-        return self.strategy.position_risk
-        
-    if operation == 'strategyPositionDirection':
-        return self.strategy.position_direction
+@handles('adjustmentNone')
+def _ticker_adjustmentNone(self, operation, args):
+    return self.symbol.adjustment_none
 
-    # Trade Count by Direction
-    if operation == 'strategyLongTrades':
-        return self.strategy.long_trades
-        
-    if operation == 'strategyShortTrades':
-        return self.strategy.short_trades
+@handles('adjustmentSplits')
+def _ticker_adjustmentSplits(self, operation, args):
+    return self.symbol.adjustment_splits
 
-    # Performance Metrics
-    if operation == 'strategyReturnOnCapital':
-        return self.strategy.return_on_capital
-        
-    if operation == 'strategyAnnualizedReturn':
-        return self.strategy.annualized_return
-        
-    if operation == 'strategyMonthlyReturn':
-        return self.strategy.monthly_return
-        
-    if operation == 'strategyDailyReturn':
-        return self.strategy.daily_return
 
-    # Risk Management
-    if operation == 'strategyCurrentRisk':
-        return self.strategy.current_risk
-        
-    if operation == 'strategyMaxRiskPerTrade':
-        return self.strategy.max_risk_per_trade
-        
-    if operation == 'strategyRiskFreeRate':
-        return self.strategy.risk_free_rate
+_handle_ticker_operation = _handle_operation
 
-    # Market Exposure
-    if operation == 'strategyMarketExposure':
-        return self.strategy.market_exposure
-        
-    if operation == 'strategyTimeInMarket':
-        return self.strategy.time_in_market
 
-    return None
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+#Strategy
+
+# Account Information
+@handles('strategyAccountCurrency')
+def _strategy_strategyAccountCurrency(self, operation, args):
+    return self.strategy.account_currency
+
+@handles('strategyInitialCapital')
+def _strategy_strategyInitialCapital(self, operation, args):
+    return self.strategy.initial_capital
+
+@handles('strategyEquity')
+def _strategy_strategyEquity(self, operation, args):
+    return self.strategy.equity
+
+# Trade Performance
+@handles('strategyNetProfit')
+def _strategy_strategyNetProfit(self, operation, args):
+    return self.strategy.net_profit
+
+@handles('strategyNetProfitPercent')
+def _strategy_strategyNetProfitPercent(self, operation, args):
+    return (self.strategy.net_profit / self.strategy.initial_capital) * 100
+
+@handles('strategyGrossProfit')
+def _strategy_strategyGrossProfit(self, operation, args):
+    return self.strategy.gross_profit
+
+@handles('strategyGrossProfitPercent')
+def _strategy_strategyGrossProfitPercent(self, operation, args):
+    return (self.strategy.gross_profit / self.strategy.initial_capital) * 100
+
+@handles('strategyGrossLoss')
+def _strategy_strategyGrossLoss(self, operation, args):
+    return self.strategy.gross_loss
+
+@handles('strategyGrossLossPercent')
+def _strategy_strategyGrossLossPercent(self, operation, args):
+    return (self.strategy.gross_loss / self.strategy.initial_capital) * 100
+
+# Trade Statistics
+@handles('strategyWinTrades')
+def _strategy_strategyWinTrades(self, operation, args):
+    return self.strategy.win_trades
+
+@handles('strategyLossTrades')
+def _strategy_strategyLossTrades(self, operation, args):
+    return self.strategy.loss_trades
+
+@handles('strategyEvenTrades')
+def _strategy_strategyEvenTrades(self, operation, args):
+    return self.strategy.even_trades
+
+@handles('strategyClosedTrades')
+def _strategy_strategyClosedTrades(self, operation, args):
+    return self.strategy.closed_trades
+
+@handles('strategyClosedTradesFirstIndex')
+def _strategy_strategyClosedTradesFirstIndex(self, operation, args):
+    return self.strategy.closed_trades_first_index
+
+# Average Trade Performance
+@handles('strategyAvgTrade')
+def _strategy_strategyAvgTrade(self, operation, args):
+    return self.strategy.avg_trade
+
+@handles('strategyAvgTradePercent')
+def _strategy_strategyAvgTradePercent(self, operation, args):
+    return self.strategy.avg_trade_percent
+
+@handles('strategyAvgWinningTrade')
+def _strategy_strategyAvgWinningTrade(self, operation, args):
+    return self.strategy.avg_winning_trade
+
+@handles('strategyAvgWinningTradePercent')
+def _strategy_strategyAvgWinningTradePercent(self, operation, args):
+    return self.strategy.avg_winning_trade_percent
+
+@handles('strategyAvgLosingTrade')
+def _strategy_strategyAvgLosingTrade(self, operation, args):
+    return self.strategy.avg_losing_trade
+
+@handles('strategyAvgLosingTradePercent')
+def _strategy_strategyAvgLosingTradePercent(self, operation, args):
+    return self.strategy.avg_losing_trade_percent
+
+# Position Information
+@handles('strategyOpenTrades')
+def _strategy_strategyOpenTrades(self, operation, args):
+    return self.strategy.open_trades
+
+@handles('strategyOpenTradesCapitalHeld')
+def _strategy_strategyOpenTradesCapitalHeld(self, operation, args):
+    return self.strategy.open_trades_capital_held
+
+@handles('strategyPositionSize')
+def _strategy_strategyPositionSize(self, operation, args):
+    return self.strategy.position_size
+
+@handles('strategyPositionAvgPrice')
+def _strategy_strategyPositionAvgPrice(self, operation, args):
+    return self.strategy.position_avg_price
+
+@handles('strategyPositionEntryName')
+def _strategy_strategyPositionEntryName(self, operation, args):
+    return self.strategy.position_entry_name
+
+# Risk Metrics
+@handles('strategyMaxDrawdown')
+def _strategy_strategyMaxDrawdown(self, operation, args):
+    return self.strategy.max_drawdown
+
+@handles('strategyMaxDrawdownPercent')
+def _strategy_strategyMaxDrawdownPercent(self, operation, args):
+    return self.strategy.max_drawdown_percent
+
+@handles('strategyMaxRunup')
+def _strategy_strategyMaxRunup(self, operation, args):
+    return self.strategy.max_runup
+
+@handles('strategyMaxRunupPercent')
+def _strategy_strategyMaxRunupPercent(self, operation, args):
+    return self.strategy.max_runup_percent
+
+# Contract Holdings
+@handles('strategyMaxContractsHeldAll')
+def _strategy_strategyMaxContractsHeldAll(self, operation, args):
+    return self.strategy.max_contracts_held_all
+
+@handles('strategyMaxContractsHeldLong')
+def _strategy_strategyMaxContractsHeldLong(self, operation, args):
+    return self.strategy.max_contracts_held_long
+
+@handles('strategyMaxContractsHeldShort')
+def _strategy_strategyMaxContractsHeldShort(self, operation, args):
+    return self.strategy.max_contracts_held_short
+
+# Open Profit/Loss
+@handles('strategyOpenProfit')
+def _strategy_strategyOpenProfit(self, operation, args):
+    return self.strategy.open_profit
+
+@handles('strategyOpenProfitPercent')
+def _strategy_strategyOpenProfitPercent(self, operation, args):
+    return self.strategy.open_profit_percent
+
+# Margin Information
+@handles('strategyMarginLiquidationPrice')
+def _strategy_strategyMarginLiquidationPrice(self, operation, args):
+    return self.strategy.margin_liquidation_price
+
+# Trade Ratios
+@handles('strategyProfitFactor')
+def _strategy_strategyProfitFactor(self, operation, args):
+    return abs(self.strategy.gross_profit / self.strategy.gross_loss) if self.strategy.gross_loss != 0 else float('inf')
+
+@handles('strategyWinRate')
+def _strategy_strategyWinRate(self, operation, args):
+    return (self.strategy.win_trades / self.strategy.closed_trades * 100) if self.strategy.closed_trades > 0 else 0
+
+@handles('strategyPayoffRatio')
+def _strategy_strategyPayoffRatio(self, operation, args):
+    avg_win = self.strategy.avg_winning_trade
+    avg_loss = abs(self.strategy.avg_losing_trade)
+    return avg_win / avg_loss if avg_loss != 0 else float('inf')
+
+# Trade Duration Stats
+@handles('strategyAvgTradeLength')
+def _strategy_strategyAvgTradeLength(self, operation, args):
+    return self.strategy.avg_trade_length
+
+@handles('strategyAvgWinningTradeLength')
+def _strategy_strategyAvgWinningTradeLength(self, operation, args):
+    return self.strategy.avg_winning_trade_length
+
+@handles('strategyAvgLosingTradeLength')
+def _strategy_strategyAvgLosingTradeLength(self, operation, args):
+    return self.strategy.avg_losing_trade_length
+
+@handles('strategyMaxTradeLength')
+def _strategy_strategyMaxTradeLength(self, operation, args):
+    return self.strategy.max_trade_length
+
+@handles('strategyMinTradeLength')
+def _strategy_strategyMinTradeLength(self, operation, args):
+    return self.strategy.min_trade_length
+
+# Commission and Slippage
+@handles('strategyCommissionPaid')
+def _strategy_strategyCommissionPaid(self, operation, args):
+    return self.strategy.commission_paid
+
+@handles('strategyTotalFeesPaid')
+def _strategy_strategyTotalFeesPaid(self, operation, args):
+    return self.strategy.total_fees_paid
+
+@handles('strategySlippagePaid')
+def _strategy_strategySlippagePaid(self, operation, args):
+    return self.strategy.slippage_paid
+
+# Risk-Adjusted Returns
+@handles('strategySharpeRatio')
+def _strategy_strategySharpeRatio(self, operation, args):
+    return self.strategy.sharpe_ratio
+
+@handles('strategySortinoRatio')
+def _strategy_strategySortinoRatio(self, operation, args):
+    return self.strategy.sortino_ratio
+
+@handles('strategyCalmarRatio')
+def _strategy_strategyCalmarRatio(self, operation, args):
+    return self.strategy.calmar_ratio
+
+# Consecutive Trade Stats
+@handles('strategyMaxConsecutiveWins')
+def _strategy_strategyMaxConsecutiveWins(self, operation, args):
+    return self.strategy.max_consecutive_wins
+
+@handles('strategyMaxConsecutiveLosses')
+def _strategy_strategyMaxConsecutiveLosses(self, operation, args):
+    return self.strategy.max_consecutive_losses
+
+# Trade Volume Stats
+@handles('strategyTotalVolumeLong')
+def _strategy_strategyTotalVolumeLong(self, operation, args):
+    return self.strategy.total_volume_long
+
+@handles('strategyTotalVolumeShort')
+def _strategy_strategyTotalVolumeShort(self, operation, args):
+    return self.strategy.total_volume_short
+
+@handles('strategyTotalVolumeTraded')
+def _strategy_strategyTotalVolumeTraded(self, operation, args):
+    return self.strategy.total_volume_traded
+
+# Position Tracking
+@handles('strategyPositionProfit')
+def _strategy_strategyPositionProfit(self, operation, args):
+    return self.strategy.position_profit
+
+@handles('strategyPositionRisk')
+def _strategy_strategyPositionRisk(self, operation, args):
+    return self.strategy.position_risk
+
+@handles('strategyPositionDirection')
+def _strategy_strategyPositionDirection(self, operation, args):
+    return self.strategy.position_direction
+
+# Trade Count by Direction
+@handles('strategyLongTrades')
+def _strategy_strategyLongTrades(self, operation, args):
+    return self.strategy.long_trades
+
+@handles('strategyShortTrades')
+def _strategy_strategyShortTrades(self, operation, args):
+    return self.strategy.short_trades
+
+# Performance Metrics
+@handles('strategyReturnOnCapital')
+def _strategy_strategyReturnOnCapital(self, operation, args):
+    return self.strategy.return_on_capital
+
+@handles('strategyAnnualizedReturn')
+def _strategy_strategyAnnualizedReturn(self, operation, args):
+    return self.strategy.annualized_return
+
+@handles('strategyMonthlyReturn')
+def _strategy_strategyMonthlyReturn(self, operation, args):
+    return self.strategy.monthly_return
+
+@handles('strategyDailyReturn')
+def _strategy_strategyDailyReturn(self, operation, args):
+    return self.strategy.daily_return
+
+# Risk Management
+@handles('strategyCurrentRisk')
+def _strategy_strategyCurrentRisk(self, operation, args):
+    return self.strategy.current_risk
+
+@handles('strategyMaxRiskPerTrade')
+def _strategy_strategyMaxRiskPerTrade(self, operation, args):
+    return self.strategy.max_risk_per_trade
+
+@handles('strategyRiskFreeRate')
+def _strategy_strategyRiskFreeRate(self, operation, args):
+    return self.strategy.risk_free_rate
+
+# Market Exposure
+@handles('strategyMarketExposure')
+def _strategy_strategyMarketExposure(self, operation, args):
+    return self.strategy.market_exposure
+
+@handles('strategyTimeInMarket')
+def _strategy_strategyTimeInMarket(self, operation, args):
+    return self.strategy.time_in_market
+
+
+_handle_strategy_operation = _handle_operation
 
 
 
@@ -1470,76 +1667,92 @@ def _calculate_session_states(self):
 
 
 
-def _handle_color_operation(self, operation, args):
-    """
-    Handles all color-related operations
-    """
-    # Basic Colors
-    if operation == 'colAqua':
-        return '#00FFFF'
-        
-    if operation == 'colBlack':
-        return '#000000'
-        
-    if operation == 'colBlue':
-        return '#0000FF'
-        
-    if operation == 'colFuchsia':
-        return '#FF00FF'
-        
-    if operation == 'colGray':
-        return '#808080'
-        
-    if operation == 'colGreen':
-        return '#008000'
-        
-    if operation == 'colLime':
-        return '#00FF00'
-        
-    if operation == 'colMaroon':
-        return '#800000'
-        
-    if operation == 'colNavy':
-        return '#000080'
-        
-    if operation == 'colOlive':
-        return '#808000'
-        
-    if operation == 'colOrange':
-        return '#FFA500'
-        
-    if operation == 'colPurple':
-        return '#800080'
-        
-    if operation == 'colRed':
-        return '#FF0000'
-        
-    if operation == 'colSilver':
-        return '#C0C0C0'
-        
-    if operation == 'colTeal':
-        return '#008080'
-        
-    if operation == 'colWhite':
-        return '#FFFFFF'
-        
-    if operation == 'colYellow':
-        return '#FFFF00'
+#Color
 
-    return None
+# Basic Colors
+@handles('colAqua')
+def _color_colAqua(self, operation, args):
+    return '#00FFFF'
 
+@handles('colBlack')
+def _color_colBlack(self, operation, args):
+    return '#000000'
 
+@handles('colBlue')
+def _color_colBlue(self, operation, args):
+    return '#0000FF'
 
+@handles('colFuchsia')
+def _color_colFuchsia(self, operation, args):
+    return '#FF00FF'
 
+@handles('colGray')
+def _color_colGray(self, operation, args):
+    return '#808080'
 
+@handles('colGreen')
+def _color_colGreen(self, operation, args):
+    return '#008000'
 
+@handles('colLime')
+def _color_colLime(self, operation, args):
+    return '#00FF00'
 
+@handles('colMaroon')
+def _color_colMaroon(self, operation, args):
+    return '#800000'
 
+@handles('colNavy')
+def _color_colNavy(self, operation, args):
+    return '#000080'
 
-def _handle_type_declaration(self, node, args):
-    """
-    Handles all type declarations and operations
-    """
+@handles('colOlive')
+def _color_colOlive(self, operation, args):
+    return '#808000'
+
+@handles('colOrange')
+def _color_colOrange(self, operation, args):
+    return '#FFA500'
+
+@handles('colPurple')
+def _color_colPurple(self, operation, args):
+    return '#800080'
+
+@handles('colRed')
+def _color_colRed(self, operation, args):
+    return '#FF0000'
+
+@handles('colSilver')
+def _color_colSilver(self, operation, args):
+    return '#C0C0C0'
+
+@handles('colTeal')
+def _color_colTeal(self, operation, args):
+    return '#008080'
+
+@handles('colWhite')
+def _color_colWhite(self, operation, args):
+    return '#FFFFFF'
+
+@handles('colYellow')
+def _color_colYellow(self, operation, args):
+    return '#FFFF00'
+
+
+_handle_color_operation = _handle_operation
+
+
+
+
+
+
+
+
+
+def _handle_type_declaration(self, node, args):
+    """
+    Handles all type declarations and operations
+    """
     # Basic Types
     if node == 'bool':
         return bool(args[0]) if args else False
@@ -2091,1688 +2304,1938 @@ def constant(self, name):
 
 
 
-def _handle_array_operation(self, operation, args):
-    """
-    Handles all array operations
-    """
-    # Array Creation
-    if operation == 'arrNewBool':
-        return [False] * args[0]
-        
-    if operation == 'arrNewFloat':
-        return [0.0] * args[0]
-        
-    if operation == 'arrNewInt':
-        return [0] * args[0]
-        
-    if operation == 'arrNewString':
-        return [''] * args[0]
+#Array
 
-    # Array Manipulation
-    if operation == 'arrPush':
-        array, value = args
-        array.append(value)
-        return array
-        
-    if operation == 'arrPop':
-        return args[0].pop()
-        
-    if operation == 'arrShift':
-        return args[0].pop(0)
-        
-    if operation == 'arrUnshift':
-        array, value = args
-        array.insert(0, value)
-        return array
+# Array Creation
+@handles('arrNewBool')
+def _array_arrNewBool(self, operation, args):
+    return [False] * args[0]
 
-    # Array Search
-    if operation == 'arrIndexOf':
-        array, value = args
-        return array.index(value) if value in array else -1
-        
-    if operation == 'arrLastIndexOf':
-        array, value = args
-        return len(array) - 1 - array[::-1].index(value) if value in array else -1
-        
-    if operation == 'arrIncludes':
-        array, value = args
-        return value in array
+@handles('arrNewFloat')
+def _array_arrNewFloat(self, operation, args):
+    return [0.0] * args[0]
 
-    # Array Transformation
-    if operation == 'arrConcat':
-        return args[0] + args[1]
-        
-    if operation == 'arrSlice':
-        array, start, end = args
-        return array[start:end]
-        
-    if operation == 'arrJoin':
-        array, separator = args
-        return separator.join(map(str, array))
-        
-    if operation == 'arrReverse':
-        return args[0][::-1]
-        
-    if operation == 'arrSort':
-        return sorted(args[0])
+@handles('arrNewInt')
+def _array_arrNewInt(self, operation, args):
+    return [0] * args[0]
 
-    # Array Statistics
-    if operation == 'arrSum':
-        return sum(args[0])
-        
-    if operation == 'arrAvg':
-        return sum(args[0]) / len(args[0])
-        
-    if operation == 'arrMin':
-        return min(args[0])
-        
-    if operation == 'arrMax':
-        return max(args[0])
-        
-    if operation == 'arrStdev':
-        return self._calculate_stdev(args[0])
+@handles('arrNewString')
+def _array_arrNewString(self, operation, args):
+    return [''] * args[0]
+
+# Array Manipulation
+@handles('arrPush')
+def _array_arrPush(self, operation, args):
+    array, value = args
+    array.append(value)
+    return array
+
+@handles('arrPop')
+def _array_arrPop(self, operation, args):
+    return args[0].pop()
+
+@handles('arrShift')
+def _array_arrShift(self, operation, args):
+    return args[0].pop(0)
+
+@handles('arrUnshift')
+def _array_arrUnshift(self, operation, args):
+    array, value = args
+    array.insert(0, value)
+    return array
+
+# Array Search
+@handles('arrIndexOf')
+def _array_arrIndexOf(self, operation, args):
+    array, value = args
+    return array.index(value) if value in array else -1
+
+@handles('arrLastIndexOf')
+def _array_arrLastIndexOf(self, operation, args):
+    array, value = args
+    return len(array) - 1 - array[::-1].index(value) if value in array else -1
+
+@handles('arrIncludes')
+def _array_arrIncludes(self, operation, args):
+    array, value = args
+    return value in array
+
+# Array Transformation
+@handles('arrConcat')
+def _array_arrConcat(self, operation, args):
+    return args[0] + args[1]
+
+@handles('arrSlice')
+def _array_arrSlice(self, operation, args):
+    array, start, end = args
+    return array[start:end]
+
+@handles('arrJoin')
+def _array_arrJoin(self, operation, args):
+    array, separator = args
+    return separator.join(map(str, array))
+
+@handles('arrReverse')
+def _array_arrReverse(self, operation, args):
+    return args[0][::-1]
+
+@handles('arrSort')
+def _array_arrSort(self, operation, args):
+    return sorted(args[0])
+
+# Array Statistics
+@handles('arrSum')
+def _array_arrSum(self, operation, args):
+    return sum(args[0])
+
+@handles('arrAvg')
+def _array_arrAvg(self, operation, args):
+    return sum(args[0]) / len(args[0])
+
+@handles('arrMin')
+def _array_arrMin(self, operation, args):
+    return min(args[0])
+
+@handles('arrMax')
+def _array_arrMax(self, operation, args):
+    return max(args[0])
+
+@handles('arrStdev')
+def _array_arrStdev(self, operation, args):
+    return self._calculate_stdev(args[0])
+
+# Array Utility
+@handles('arrClear')
+def _array_arrClear(self, operation, args):
+    args[0].clear()
+    return args[0]
+
+@handles('arrSize')
+def _array_arrSize(self, operation, args):
+    return len(args[0])
+
+@handles('arrCopy')
+def _array_arrCopy(self, operation, args):
+    return args[0].copy()
+
+# Array Advanced Statistics
+@handles('arrMedian')
+def _array_arrMedian(self, operation, args):
+    sorted_arr = sorted(args[0])
+    n = len(sorted_arr)
+    mid = n // 2
+    return sorted_arr[mid] if n % 2 else (sorted_arr[mid-1] + sorted_arr[mid]) / 2
+
+@handles('arrMode')
+def _array_arrMode(self, operation, args):
+    from statistics import mode
+    return mode(args[0])
+
+@handles('arrVariance')
+def _array_arrVariance(self, operation, args):
+    return self._calculate_variance(args[0])
+
+@handles('arrCovariance')
+def _array_arrCovariance(self, operation, args):
+    return self._calculate_covariance(args[0], args[1])
+
+# Array Search Advanced
+@handles('arrBinarySearch')
+def _array_arrBinarySearch(self, operation, args):
+    return self._binary_search(args[0], args[1])
+
+@handles('arrBinarySearchLeftmost')
+def _array_arrBinarySearchLeftmost(self, operation, args):
+    return self._binary_search_leftmost(args[0], args[1])
+
+@handles('arrBinarySearchRightmost')
+def _array_arrBinarySearchRightmost(self, operation, args):
+    return self._binary_search_rightmost(args[0], args[1])
+
+# Array Testing
+@handles('arrEvery')
+def _array_arrEvery(self, operation, args):
+    return all(args[0])
+
+@handles('arrSome')
+def _array_arrSome(self, operation, args):
+    return any(args[0])
+
+# Array Manipulation Advanced
+@handles('arrFill')
+def _array_arrFill(self, operation, args):
+    array, value = args
+    for i in range(len(array)):
+        array[i] = value
+    return array
+
+@handles('arrInsert')
+def _array_arrInsert(self, operation, args):
+    array, index, value = args
+    array.insert(index, value)
+    return array
+
+@handles('arrRemove')
+def _array_arrRemove(self, operation, args):
+    array, index = args
+    return array.pop(index)
+
+# Array Creation Advanced
+@handles('arrFrom')
+def _array_arrFrom(self, operation, args):
+    return list(args[0])
+
+@handles('arrRange')
+def _array_arrRange(self, operation, args):
+    start, end, step = args if len(args) == 3 else (args[0], args[1], 1)
+    return list(range(start, end, step))
+
+# Array Element Access
+@handles('arrFirst')
+def _array_arrFirst(self, operation, args):
+    return args[0][0] if args[0] else None
+
+@handles('arrLast')
+def _array_arrLast(self, operation, args):
+    return args[0][-1] if args[0] else None
+
+@handles('arrGet')
+def _array_arrGet(self, operation, args):
+    array, index = args
+    return array[index]
+
+@handles('arrSet')
+def _array_arrSet(self, operation, args):
+    array, index, value = args
+    array[index] = value
+    return array
+
+# Array Sorting Advanced
+@handles('arrSortIndices')
+def _array_arrSortIndices(self, operation, args):
+    return sorted(range(len(args[0])), key=lambda k: args[0][k])
+
+@handles('arrStandardize')
+def _array_arrStandardize(self, operation, args):
+    return self._standardize_array(args[0])
+
+# Array Percentile Operations
+@handles('arrPercentileLinearInterpolation')
+def _array_arrPercentileLinearInterpolation(self, operation, args):
+    return self._percentile_linear(args[0], args[1])
+
+@handles('arrPercentileNearestRank')
+def _array_arrPercentileNearestRank(self, operation, args):
+    return self._percentile_nearest(args[0], args[1])
+
+@handles('arrPercentRank')
+def _array_arrPercentRank(self, operation, args):
+    return self._percent_rank(args[0], args[1])
+
+# Chart Object Arrays
+@handles('arrNewBox')
+def _array_arrNewBox(self, operation, args):
+    return [{'type': 'box', 'props': {}} for _ in range(args[0])]
+
+@handles('arrNewLabel')
+def _array_arrNewLabel(self, operation, args):
+    return [{'type': 'label', 'props': {}} for _ in range(args[0])]
+
+@handles('arrNewLine')
+def _array_arrNewLine(self, operation, args):
+    return [{'type': 'line', 'props': {}} for _ in range(args[0])]
+
+@handles('arrNewLineFill')
+def _array_arrNewLineFill(self, operation, args):
+    return [{'type': 'linefill', 'props': {}} for _ in range(args[0])]
+
+# Data Structure Arrays
+@handles('arrNewTable')
+def _array_arrNewTable(self, operation, args):
+    return [{'type': 'table', 'data': {}} for _ in range(args[0])]
+
+@handles('arrNewType')
+def _array_arrNewType(self, operation, args):
+    return [{'type': args[1], 'value': None} for _ in range(args[0])]
+
+# Array Type Conversion
+@handles('arrToString')
+def _array_arrToString(self, operation, args):
+    return [str(x) for x in args[0]]
+
+@handles('arrToFloat')
+def _array_arrToFloat(self, operation, args):
+    return [float(x) for x in args[0]]
+
+@handles('arrToInt')
+def _array_arrToInt(self, operation, args):
+    return [int(x) for x in args[0]]
+
+@handles('arrToBool')
+def _array_arrToBool(self, operation, args):
+    return [bool(x) for x in args[0]]
+
+
+_handle_array_operation = _handle_operation
+
+
+
+
+
+#Box
+
+# Box Creation
+@handles('boxNew')
+def _box_boxNew(self, operation, args):
+    return {'type': 'box', 'props': {}}
+
+@handles('boxAdd')
+def _box_boxAdd(self, operation, args):
+    left, top, right, bottom = args
+    return {'type': 'box', 'props': {
+        'left': left,
+        'top': top,
+        'right': right,
+        'bottom': bottom
+    }}
+
+# Box Properties
+@handles('boxSetBgColor')
+def _box_boxSetBgColor(self, operation, args):
+    box, color = args
+    box['props']['bgcolor'] = color
+    return box
+
+@handles('boxSetBorderColor')
+def _box_boxSetBorderColor(self, operation, args):
+    box, color = args
+    box['props']['border_color'] = color
+    return box
+
+@handles('boxSetBorderStyle')
+def _box_boxSetBorderStyle(self, operation, args):
+    box, style = args
+    box['props']['border_style'] = style
+    return box
+
+@handles('boxSetBorderWidth')
+def _box_boxSetBorderWidth(self, operation, args):
+    box, width = args
+    box['props']['border_width'] = width
+    return box
+
+@handles('boxSetLeftBottom')
+def _box_boxSetLeftBottom(self, operation, args):
+    box, x, y = args
+    box['props']['left'] = x
+    box['props']['bottom'] = y
+    return box
+
+@handles('boxSetRightTop')
+def _box_boxSetRightTop(self, operation, args):
+    box, x, y = args
+    box['props']['right'] = x
+    box['props']['top'] = y
+    return box
+
+@handles('boxSetText')
+def _box_boxSetText(self, operation, args):
+    box, text = args
+    box['props']['text'] = text
+    return box
+
+@handles('boxSetTextColor')
+def _box_boxSetTextColor(self, operation, args):
+    box, color = args
+    box['props']['text_color'] = color
+    return box
+
+@handles('boxSetTextHalign')
+def _box_boxSetTextHalign(self, operation, args):
+    box, align = args
+    box['props']['text_halign'] = align
+    return box
+
+@handles('boxSetTextSize')
+def _box_boxSetTextSize(self, operation, args):
+    box, size = args
+    box['props']['text_size'] = size
+    return box
+
+@handles('boxSetTextValign')
+def _box_boxSetTextValign(self, operation, args):
+    box, align = args
+    box['props']['text_valign'] = align
+    return box
+
+# Box State
+@handles('boxDelete')
+def _box_boxDelete(self, operation, args):
+    return {'action': 'delete', 'box': args[0]}
+
+@handles('boxGet')
+def _box_boxGet(self, operation, args):
+    return {'action': 'get', 'id': args[0]}
+
+# Box Visibility
+@handles('boxSetVisible')
+def _box_boxSetVisible(self, operation, args):
+    box, visible = args
+    box['props']['visible'] = visible
+    return box
+
+@handles('boxIsVisible')
+def _box_boxIsVisible(self, operation, args):
+    return args[0]['props'].get('visible', True)
+
+# Box Coordinates
+@handles('boxGetBottom')
+def _box_boxGetBottom(self, operation, args):
+    return args[0]['props'].get('bottom')
+
+@handles('boxGetLeft')
+def _box_boxGetLeft(self, operation, args):
+    return args[0]['props'].get('left')
+
+@handles('boxGetRight')
+def _box_boxGetRight(self, operation, args):
+    return args[0]['props'].get('right')
+
+@handles('boxGetTop')
+def _box_boxGetTop(self, operation, args):
+    return args[0]['props'].get('top')
+
+# Box Text Properties
+@handles('boxGetText')
+def _box_boxGetText(self, operation, args):
+    return args[0]['props'].get('text', '')
+
+@handles('boxSetTextFont')
+def _box_boxSetTextFont(self, operation, args):
+    box, font = args
+    box['props']['text_font'] = font
+    return box
 
-    # Array Utility
-    if operation == 'arrClear':
-        args[0].clear()
-        return args[0]
-        
-    if operation == 'arrSize':
-        return len(args[0])
-        
-    if operation == 'arrCopy':
-        return args[0].copy()
+@handles('boxSetTextWrap')
+def _box_boxSetTextWrap(self, operation, args):
+    box, wrap = args
+    box['props']['text_wrap'] = wrap
+    return box
 
-        # Array Advanced Statistics
-    if operation == 'arrMedian':
-        sorted_arr = sorted(args[0])
-        n = len(sorted_arr)
-        mid = n // 2
-        return sorted_arr[mid] if n % 2 else (sorted_arr[mid-1] + sorted_arr[mid]) / 2
-        
-    if operation == 'arrMode':
-        from statistics import mode
-        return mode(args[0])
-        
-    if operation == 'arrVariance':
-        return self._calculate_variance(args[0])
-        
-    if operation == 'arrCovariance':
-        return self._calculate_covariance(args[0], args[1])
+# Box Style Properties
+@handles('boxSetExtend')
+def _box_boxSetExtend(self, operation, args):
+    box, extend = args
+    box['props']['extend'] = extend
+    return box
 
-    # Array Search Advanced
-    if operation == 'arrBinarySearch':
-        return self._binary_search(args[0], args[1])
-        
-    if operation == 'arrBinarySearchLeftmost':
-        return self._binary_search_leftmost(args[0], args[1])
-        
-    if operation == 'arrBinarySearchRightmost':
-        return self._binary_search_rightmost(args[0], args[1])
+@handles('boxSetOpacity')
+def _box_boxSetOpacity(self, operation, args):
+    box, opacity = args
+    box['props']['opacity'] = opacity
+    return box
 
-    # Array Testing
-    if operation == 'arrEvery':
-        return all(args[0])
-        
-    if operation == 'arrSome':
-        return any(args[0])
 
-    # Array Manipulation Advanced
-    if operation == 'arrFill':
-        array, value = args
-        for i in range(len(array)):
-            array[i] = value
-        return array
-        
-    if operation == 'arrInsert':
-        array, index, value = args
-        array.insert(index, value)
-        return array
-        
-    if operation == 'arrRemove':
-        array, index = args
-        return array.pop(index)
+_handle_box_operation = _handle_operation
 
-    # Array Creation Advanced
-    if operation == 'arrFrom':
-        return list(args[0])
-        
-    if operation == 'arrRange':
-        start, end, step = args if len(args) == 3 else (args[0], args[1], 1)
-        return list(range(start, end, step))
 
-    # Array Element Access
-    if operation == 'arrFirst':
-        return args[0][0] if args[0] else None
-        
-    if operation == 'arrLast':
-        return args[0][-1] if args[0] else None
-        
-    if operation == 'arrGet':
-        array, index = args
-        return array[index]
-        
-    if operation == 'arrSet':
-        array, index, value = args
-        array[index] = value
-        return array
 
-    # Array Sorting Advanced
-    if operation == 'arrSortIndices':
-        return sorted(range(len(args[0])), key=lambda k: args[0][k])
-        
-    if operation == 'arrStandardize':
-        return self._standardize_array(args[0])
 
-    # Array Percentile Operations
-    if operation == 'arrPercentileLinearInterpolation':
-        return self._percentile_linear(args[0], args[1])
-        
-    if operation == 'arrPercentileNearestRank':
-        return self._percentile_nearest(args[0], args[1])
-        
-    if operation == 'arrPercentRank':
-        return self._percent_rank(args[0], args[1])
 
-        # Chart Object Arrays
-    if operation == 'arrNewBox':
-        return [{'type': 'box', 'props': {}} for _ in range(args[0])]
-        
-    if operation == 'arrNewLabel':
-        return [{'type': 'label', 'props': {}} for _ in range(args[0])]
-        
-    if operation == 'arrNewLine':
-        return [{'type': 'line', 'props': {}} for _ in range(args[0])]
-        
-    if operation == 'arrNewLineFill':
-        return [{'type': 'linefill', 'props': {}} for _ in range(args[0])]
 
-    # Data Structure Arrays
-    if operation == 'arrNewTable':
-        return [{'type': 'table', 'data': {}} for _ in range(args[0])]
-        
-    if operation == 'arrNewType':
-        return [{'type': args[1], 'value': None} for _ in range(args[0])]
+#Chart
 
-    # Array Type Conversion
-    if operation == 'arrToString':
-        return [str(x) for x in args[0]]
-        
-    if operation == 'arrToFloat':
-        return [float(x) for x in args[0]]
-        
-    if operation == 'arrToInt':
-        return [int(x) for x in args[0]]
-        
-    if operation == 'arrToBool':
-        return [bool(x) for x in args[0]]
+# Chart Properties
+@handles('chartSetBarStyle')
+def _chart_chartSetBarStyle(self, operation, args):
+    return {'action': 'set_bar_style', 'style': args[0]}
 
-    return None
+@handles('chartSetBgColor')
+def _chart_chartSetBgColor(self, operation, args):
+    return {'action': 'set_bgcolor', 'color': args[0]}
 
+@handles('chartSetGridColor')
+def _chart_chartSetGridColor(self, operation, args):
+    return {'action': 'set_grid_color', 'color': args[0]}
 
+@handles('chartSetTextColor')
+def _chart_chartSetTextColor(self, operation, args):
+    return {'action': 'set_text_color', 'color': args[0]}
 
+# Chart Layout
+@handles('chartSetLayout')
+def _chart_chartSetLayout(self, operation, args):
+    return {'action': 'set_layout', 'layout': args[0]}
 
+@handles('chartSetOverlay')
+def _chart_chartSetOverlay(self, operation, args):
+    return {'action': 'set_overlay', 'overlay': args[0]}
 
-def _handle_box_operation(self, operation, args):
-    """
-    Handles all box operations
-    """
-    # Box Creation
-    if operation == 'boxNew':
-        return {'type': 'box', 'props': {}}
-        
-    if operation == 'boxAdd':
-        left, top, right, bottom = args
-        return {'type': 'box', 'props': {
-            'left': left,
-            'top': top,
-            'right': right,
-            'bottom': bottom
-        }}
-
-    # Box Properties
-    if operation == 'boxSetBgColor':
-        box, color = args
-        box['props']['bgcolor'] = color
-        return box
-        
-    if operation == 'boxSetBorderColor':
-        box, color = args
-        box['props']['border_color'] = color
-        return box
-        
-    if operation == 'boxSetBorderStyle':
-        box, style = args
-        box['props']['border_style'] = style
-        return box
-        
-    if operation == 'boxSetBorderWidth':
-        box, width = args
-        box['props']['border_width'] = width
-        return box
-        
-    if operation == 'boxSetLeftBottom':
-        box, x, y = args
-        box['props']['left'] = x
-        box['props']['bottom'] = y
-        return box
-        
-    if operation == 'boxSetRightTop':
-        box, x, y = args
-        box['props']['right'] = x
-        box['props']['top'] = y
-        return box
-        
-    if operation == 'boxSetText':
-        box, text = args
-        box['props']['text'] = text
-        return box
-        
-    if operation == 'boxSetTextColor':
-        box, color = args
-        box['props']['text_color'] = color
-        return box
-        
-    if operation == 'boxSetTextHalign':
-        box, align = args
-        box['props']['text_halign'] = align
-        return box
-        
-    if operation == 'boxSetTextSize':
-        box, size = args
-        box['props']['text_size'] = size
-        return box
-        
-    if operation == 'boxSetTextValign':
-        box, align = args
-        box['props']['text_valign'] = align
-        return box
-
-    # Box State
-    if operation == 'boxDelete':
-        return {'action': 'delete', 'box': args[0]}
-        
-    if operation == 'boxGet':
-        return {'action': 'get', 'id': args[0]}
-
-        # Box Visibility
-    if operation == 'boxSetVisible':
-        box, visible = args
-        box['props']['visible'] = visible
-        return box
-        
-    if operation == 'boxIsVisible':
-        return args[0]['props'].get('visible', True)
-
-    # Box Coordinates
-    if operation == 'boxGetBottom':
-        return args[0]['props'].get('bottom')
-        
-    if operation == 'boxGetLeft':
-        return args[0]['props'].get('left')
-        
-    if operation == 'boxGetRight':
-        return args[0]['props'].get('right')
-        
-    if operation == 'boxGetTop':
-        return args[0]['props'].get('top')
-
-    # Box Text Properties
-    if operation == 'boxGetText':
-        return args[0]['props'].get('text', '')
-        
-    if operation == 'boxSetTextFont':
-        box, font = args
-        box['props']['text_font'] = font
-        return box
-        
-    if operation == 'boxSetTextWrap':
-        box, wrap = args
-        box['props']['text_wrap'] = wrap
-        return box
-
-    # Box Style Properties
-    if operation == 'boxSetExtend':
-        box, extend = args
-        box['props']['extend'] = extend
-        return box
-        
-    if operation == 'boxSetOpacity':
-        box, opacity = args
-        box['props']['opacity'] = opacity
-        return box
+@handles('chartSetScale')
+def _chart_chartSetScale(self, operation, args):
+    return {'action': 'set_scale', 'scale': args[0]}
 
-    return None
+@handles('chartSetZoom')
+def _chart_chartSetZoom(self, operation, args):
+    return {'action': 'set_zoom', 'zoom': args[0]}
 
+# Chart Time Properties
+@handles('chartSetTimeZone')
+def _chart_chartSetTimeZone(self, operation, args):
+    return {'action': 'set_timezone', 'timezone': args[0]}
 
+@handles('chartSetSession')
+def _chart_chartSetSession(self, operation, args):
+    return {'action': 'set_session', 'session': args[0]}
 
+# Chart Data Properties
+@handles('chartSetSymbol')
+def _chart_chartSetSymbol(self, operation, args):
+    return {'action': 'set_symbol', 'symbol': args[0]}
 
+@handles('chartSetResolution')
+def _chart_chartSetResolution(self, operation, args):
+    return {'action': 'set_resolution', 'resolution': args[0]}
 
+@handles('chartSetRange')
+def _chart_chartSetRange(self, operation, args):
+    return {'action': 'set_range', 'from': args[0], 'to': args[1]}
 
-def _handle_chart_operation(self, operation, args):
-    """
-    Handles all chart operations
-    """
-    # Chart Properties
-    if operation == 'chartSetBarStyle':
-        return {'action': 'set_bar_style', 'style': args[0]}
-        
-    if operation == 'chartSetBgColor':
-        return {'action': 'set_bgcolor', 'color': args[0]}
-        
-    if operation == 'chartSetGridColor':
-        return {'action': 'set_grid_color', 'color': args[0]}
-        
-    if operation == 'chartSetTextColor':
-        return {'action': 'set_text_color', 'color': args[0]}
+# Chart State
+@handles('chartClear')
+def _chart_chartClear(self, operation, args):
+    return {'action': 'clear'}
 
-    # Chart Layout
-    if operation == 'chartSetLayout':
-        return {'action': 'set_layout', 'layout': args[0]}
-        
-    if operation == 'chartSetOverlay':
-        return {'action': 'set_overlay', 'overlay': args[0]}
-        
-    if operation == 'chartSetScale':
-        return {'action': 'set_scale', 'scale': args[0]}
-        
-    if operation == 'chartSetZoom':
-        return {'action': 'set_zoom', 'zoom': args[0]}
+@handles('chartRefresh')
+def _chart_chartRefresh(self, operation, args):
+    return {'action': 'refresh'}
 
-    # Chart Time Properties
-    if operation == 'chartSetTimeZone':
-        return {'action': 'set_timezone', 'timezone': args[0]}
-        
-    if operation == 'chartSetSession':
-        return {'action': 'set_session', 'session': args[0]}
 
-    # Chart Data Properties
-    if operation == 'chartSetSymbol':
-        return {'action': 'set_symbol', 'symbol': args[0]}
-        
-    if operation == 'chartSetResolution':
-        return {'action': 'set_resolution', 'resolution': args[0]}
-        
-    if operation == 'chartSetRange':
-        return {'action': 'set_range', 'from': args[0], 'to': args[1]}
+_handle_chart_operation = _handle_operation
 
-    # Chart State
-    if operation == 'chartClear':
-        return {'action': 'clear'}
-        
-    if operation == 'chartRefresh':
-        return {'action': 'refresh'}
 
-    return None
 
 
 
 
 
 
+#Input
 
+# Basic Inputs
+@handles('inputBool')
+def _input_inputBool(self, operation, args):
+    title, defval = args
+    return {'type': 'bool', 'title': title, 'defval': defval}
 
-def _handle_input_operation(self, operation, args):
-    """
-    Handles all input operations
-    """
-    # Basic Inputs
-    if operation == 'inputBool':
-        title, defval = args
-        return {'type': 'bool', 'title': title, 'defval': defval}
-        
-    if operation == 'inputInt':
-        title, defval = args
-        return {'type': 'int', 'title': title, 'defval': defval}
-        
-    if operation == 'inputFloat':
-        title, defval = args
-        return {'type': 'float', 'title': title, 'defval': defval}
-        
-    if operation == 'inputString':
-        title, defval = args
-        return {'type': 'string', 'title': title, 'defval': defval}
-
-    # Range Inputs
-    if operation == 'inputTimeRange':
-        title, defval = args
-        return {'type': 'time_range', 'title': title, 'defval': defval}
-        
-    if operation == 'inputPriceRange':
-        title, defval = args
-        return {'type': 'price_range', 'title': title, 'defval': defval}
-
-    # Selection Inputs
-    if operation == 'inputOptions':
-        title, options, defval = args
-        return {'type': 'options', 'title': title, 'options': options, 'defval': defval}
-        
-    if operation == 'inputSymbol':
-        title, defval = args
-        return {'type': 'symbol', 'title': title, 'defval': defval}
-        
-    if operation == 'inputResolution':
-        title, defval = args
-        return {'type': 'resolution', 'title': title, 'defval': defval}
-
-    # Advanced Inputs
-    if operation == 'inputColor':
-        title, defval = args
-        return {'type': 'color', 'title': title, 'defval': defval}
-        
-    if operation == 'inputSession':
-        title, defval = args
-        return {'type': 'session', 'title': title, 'defval': defval}
-        
-    if operation == 'inputSource':
-        title, defval = args
-        return {'type': 'source', 'title': title, 'defval': defval}
-
-        # Input with Constraints
-    if operation == 'inputIntStep':
-        title, defval, minval, maxval, step = args
-        return {
-            'type': 'int_step',
-            'title': title,
-            'defval': defval,
-            'minval': minval,
-            'maxval': maxval,
-            'step': step
-        }
-        
-    if operation == 'inputFloatStep':
-        title, defval, minval, maxval, step = args
-        return {
-            'type': 'float_step',
-            'title': title,
-            'defval': defval,
-            'minval': minval,
-            'maxval': maxval,
-            'step': step
-        }
-
-    # Group Inputs
-    if operation == 'inputGroup':
-        title, inputs = args
-        return {'type': 'group', 'title': title, 'inputs': inputs}
-        
-    if operation == 'inputSection':
-        title = args[0]
-        return {'type': 'section', 'title': title}
-
-    # Specialized Inputs
-    if operation == 'inputBarState':
-        title, defval = args
-        return {'type': 'bar_state', 'title': title, 'defval': defval}
-        
-    if operation == 'inputDatetime':
-        title, defval = args
-        return {'type': 'datetime', 'title': title, 'defval': defval}
-        
-    if operation == 'inputStyle':
-        title, defval = args
-        return {'type': 'style', 'title': title, 'defval': defval}
-        
-    if operation == 'inputTextArea':
-        title, defval = args
-        return {'type': 'textarea', 'title': title, 'defval': defval}
+@handles('inputInt')
+def _input_inputInt(self, operation, args):
+    title, defval = args
+    return {'type': 'int', 'title': title, 'defval': defval}
 
-    return None
+@handles('inputFloat')
+def _input_inputFloat(self, operation, args):
+    title, defval = args
+    return {'type': 'float', 'title': title, 'defval': defval}
 
+@handles('inputString')
+def _input_inputString(self, operation, args):
+    title, defval = args
+    return {'type': 'string', 'title': title, 'defval': defval}
 
+# Range Inputs
+@handles('inputTimeRange')
+def _input_inputTimeRange(self, operation, args):
+    title, defval = args
+    return {'type': 'time_range', 'title': title, 'defval': defval}
 
+@handles('inputPriceRange')
+def _input_inputPriceRange(self, operation, args):
+    title, defval = args
+    return {'type': 'price_range', 'title': title, 'defval': defval}
 
+# Selection Inputs
+@handles('inputOptions')
+def _input_inputOptions(self, operation, args):
+    title, options, defval = args
+    return {'type': 'options', 'title': title, 'options': options, 'defval': defval}
 
+@handles('inputSymbol')
+def _input_inputSymbol(self, operation, args):
+    title, defval = args
+    return {'type': 'symbol', 'title': title, 'defval': defval}
 
-def _handle_label_operation(self, operation, args):
-    """
-    Handles all label operations
-    """
-    # Label Creation
-    if operation == 'labelNew':
-        x, y, text = args
-        return {'type': 'label', 'props': {
-            'x': x,
-            'y': y,
-            'text': text
-        }}
-
-    # Label Properties
-    if operation == 'labelSetColor':
-        label, color = args
-        label['props']['color'] = color
-        return label
-        
-    if operation == 'labelSetStyle':
-        label, style = args
-        label['props']['style'] = style
-        return label
-        
-    if operation == 'labelSetText':
-        label, text = args
-        label['props']['text'] = text
-        return label
-        
-    if operation == 'labelSetTextColor':
-        label, color = args
-        label['props']['text_color'] = color
-        return label
-        
-    if operation == 'labelSetXY':
-        label, x, y = args
-        label['props']['x'] = x
-        label['props']['y'] = y
-        return label
-        
-    if operation == 'labelSetSize':
-        label, size = args
-        label['props']['size'] = size
-        return label
-        
-    if operation == 'labelSetTooltip':
-        label, tooltip = args
-        label['props']['tooltip'] = tooltip
-        return label
-
-    # Label Alignment
-    if operation == 'labelSetHAlign':
-        label, align = args
-        label['props']['halign'] = align
-        return label
-        
-    if operation == 'labelSetVAlign':
-        label, align = args
-        label['props']['valign'] = align
-        return label
-
-    # Label State
-    if operation == 'labelDelete':
-        return {'action': 'delete', 'label': args[0]}
-        
-    if operation == 'labelGet':
-        return {'action': 'get', 'id': args[0]}
-
-        # Label Text Properties
-    if operation == 'labelSetFont':
-        label, font = args
-        label['props']['font'] = font
-        return label
-        
-    if operation == 'labelSetTextWrap':
-        label, wrap = args
-        label['props']['text_wrap'] = wrap
-        return label
-
-    # Label Visibility
-    if operation == 'labelSetVisible':
-        label, visible = args
-        label['props']['visible'] = visible
-        return label
-        
-    if operation == 'labelIsVisible':
-        return args[0]['props'].get('visible', True)
-
-    # Label Position
-    if operation == 'labelGetX':
-        return args[0]['props'].get('x')
-        
-    if operation == 'labelGetY':
-        return args[0]['props'].get('y')
-        
-    if operation == 'labelGetText':
-        return args[0]['props'].get('text', '')
-
-    # Label Style Properties
-    if operation == 'labelSetBorderColor':
-        label, color = args
-        label['props']['border_color'] = color
-        return label
-        
-    if operation == 'labelSetBorderWidth':
-        label, width = args
-        label['props']['border_width'] = width
-        return label
-        
-    if operation == 'labelSetBgColor':
-        label, color = args
-        label['props']['bgcolor'] = color
-        return label
-        
-    if operation == 'labelSetOpacity':
-        label, opacity = args
-        label['props']['opacity'] = opacity
-        return label
+@handles('inputResolution')
+def _input_inputResolution(self, operation, args):
+    title, defval = args
+    return {'type': 'resolution', 'title': title, 'defval': defval}
 
-    return None
+# Advanced Inputs
+@handles('inputColor')
+def _input_inputColor(self, operation, args):
+    title, defval = args
+    return {'type': 'color', 'title': title, 'defval': defval}
 
+@handles('inputSession')
+def _input_inputSession(self, operation, args):
+    title, defval = args
+    return {'type': 'session', 'title': title, 'defval': defval}
 
+@handles('inputSource')
+def _input_inputSource(self, operation, args):
+    title, defval = args
+    return {'type': 'source', 'title': title, 'defval': defval}
 
+# Input with Constraints
+@handles('inputIntStep')
+def _input_inputIntStep(self, operation, args):
+    title, defval, minval, maxval, step = args
+    return {
+        'type': 'int_step',
+        'title': title,
+        'defval': defval,
+        'minval': minval,
+        'maxval': maxval,
+        'step': step
+    }
 
+@handles('inputFloatStep')
+def _input_inputFloatStep(self, operation, args):
+    title, defval, minval, maxval, step = args
+    return {
+        'type': 'float_step',
+        'title': title,
+        'defval': defval,
+        'minval': minval,
+        'maxval': maxval,
+        'step': step
+    }
 
+# Group Inputs
+@handles('inputGroup')
+def _input_inputGroup(self, operation, args):
+    title, inputs = args
+    return {'type': 'group', 'title': title, 'inputs': inputs}
+
+@handles('inputSection')
+def _input_inputSection(self, operation, args):
+    title = args[0]
+    return {'type': 'section', 'title': title}
+
+# Specialized Inputs
+@handles('inputBarState')
+def _input_inputBarState(self, operation, args):
+    title, defval = args
+    return {'type': 'bar_state', 'title': title, 'defval': defval}
+
+@handles('inputDatetime')
+def _input_inputDatetime(self, operation, args):
+    title, defval = args
+    return {'type': 'datetime', 'title': title, 'defval': defval}
+
+@handles('inputStyle')
+def _input_inputStyle(self, operation, args):
+    title, defval = args
+    return {'type': 'style', 'title': title, 'defval': defval}
+
+@handles('inputTextArea')
+def _input_inputTextArea(self, operation, args):
+    title, defval = args
+    return {'type': 'textarea', 'title': title, 'defval': defval}
+
+
+_handle_input_operation = _handle_operation
+
+
+
+
+
+
+#Label
+
+# Label Creation
+@handles('labelNew')
+def _label_labelNew(self, operation, args):
+    x, y, text = args
+    return {'type': 'label', 'props': {
+        'x': x,
+        'y': y,
+        'text': text
+    }}
+
+# Label Properties
+@handles('labelSetColor')
+def _label_labelSetColor(self, operation, args):
+    label, color = args
+    label['props']['color'] = color
+    return label
+
+@handles('labelSetStyle')
+def _label_labelSetStyle(self, operation, args):
+    label, style = args
+    label['props']['style'] = style
+    return label
+
+@handles('labelSetText')
+def _label_labelSetText(self, operation, args):
+    label, text = args
+    label['props']['text'] = text
+    return label
+
+@handles('labelSetTextColor')
+def _label_labelSetTextColor(self, operation, args):
+    label, color = args
+    label['props']['text_color'] = color
+    return label
+
+@handles('labelSetXY')
+def _label_labelSetXY(self, operation, args):
+    label, x, y = args
+    label['props']['x'] = x
+    label['props']['y'] = y
+    return label
+
+@handles('labelSetSize')
+def _label_labelSetSize(self, operation, args):
+    label, size = args
+    label['props']['size'] = size
+    return label
+
+@handles('labelSetTooltip')
+def _label_labelSetTooltip(self, operation, args):
+    label, tooltip = args
+    label['props']['tooltip'] = tooltip
+    return label
+
+# Label Alignment
+@handles('labelSetHAlign')
+def _label_labelSetHAlign(self, operation, args):
+    label, align = args
+    label['props']['halign'] = align
+    return label
+
+@handles('labelSetVAlign')
+def _label_labelSetVAlign(self, operation, args):
+    label, align = args
+    label['props']['valign'] = align
+    return label
+
+# Label State
+@handles('labelDelete')
+def _label_labelDelete(self, operation, args):
+    return {'action': 'delete', 'label': args[0]}
+
+@handles('labelGet')
+def _label_labelGet(self, operation, args):
+    return {'action': 'get', 'id': args[0]}
+
+# Label Text Properties
+@handles('labelSetFont')
+def _label_labelSetFont(self, operation, args):
+    label, font = args
+    label['props']['font'] = font
+    return label
+
+@handles('labelSetTextWrap')
+def _label_labelSetTextWrap(self, operation, args):
+    label, wrap = args
+    label['props']['text_wrap'] = wrap
+    return label
+
+# Label Visibility
+@handles('labelSetVisible')
+def _label_labelSetVisible(self, operation, args):
+    label, visible = args
+    label['props']['visible'] = visible
+    return label
+
+@handles('labelIsVisible')
+def _label_labelIsVisible(self, operation, args):
+    return args[0]['props'].get('visible', True)
+
+# Label Position
+@handles('labelGetX')
+def _label_labelGetX(self, operation, args):
+    return args[0]['props'].get('x')
+
+@handles('labelGetY')
+def _label_labelGetY(self, operation, args):
+    return args[0]['props'].get('y')
+
+@handles('labelGetText')
+def _label_labelGetText(self, operation, args):
+    return args[0]['props'].get('text', '')
+
+# Label Style Properties
+@handles('labelSetBorderColor')
+def _label_labelSetBorderColor(self, operation, args):
+    label, color = args
+    label['props']['border_color'] = color
+    return label
+
+@handles('labelSetBorderWidth')
+def _label_labelSetBorderWidth(self, operation, args):
+    label, width = args
+    label['props']['border_width'] = width
+    return label
+
+@handles('labelSetBgColor')
+def _label_labelSetBgColor(self, operation, args):
+    label, color = args
+    label['props']['bgcolor'] = color
+    return label
+
+@handles('labelSetOpacity')
+def _label_labelSetOpacity(self, operation, args):
+    label, opacity = args
+    label['props']['opacity'] = opacity
+    return label
+
+
+_handle_label_operation = _handle_operation
+
+
+
+
+
+
+#Line
+
+# Line Creation
+@handles('lineNew')
+def _line_lineNew(self, operation, args):
+    x1, y1, x2, y2 = args
+    return {'type': 'line', 'props': {
+        'x1': x1,
+        'y1': y1,
+        'x2': x2,
+        'y2': y2
+    }}
+
+# Line Properties
+@handles('lineSetColor')
+def _line_lineSetColor(self, operation, args):
+    line, color = args
+    line['props']['color'] = color
+    return line
 
-def _handle_line_operation(self, operation, args):
-    """
-    Handles all line operations
-    """
-    # Line Creation
-    if operation == 'lineNew':
-        x1, y1, x2, y2 = args
-        return {'type': 'line', 'props': {
-            'x1': x1,
-            'y1': y1,
-            'x2': x2,
-            'y2': y2
-        }}
-
-    # Line Properties
-    if operation == 'lineSetColor':
-        line, color = args
-        line['props']['color'] = color
-        return line
-        
-    if operation == 'lineSetStyle':
-        line, style = args
-        line['props']['style'] = style
-        return line
-        
-    if operation == 'lineSetWidth':
-        line, width = args
-        line['props']['width'] = width
-        return line
-        
-    if operation == 'lineSetXY1':
-        line, x1, y1 = args
-        line['props']['x1'] = x1
-        line['props']['y1'] = y1
-        return line
-        
-    if operation == 'lineSetXY2':
-        line, x2, y2 = args
-        line['props']['x2'] = x2
-        line['props']['y2'] = y2
-        return line
-
-    # Line State
-    if operation == 'lineDelete':
-        return {'action': 'delete', 'line': args[0]}
-        
-    if operation == 'lineGet':
-        return {'action': 'get', 'id': args[0]}
-
-        # Line Visibility
-    if operation == 'lineSetVisible':
-        line, visible = args
-        line['props']['visible'] = visible
-        return line
-        
-    if operation == 'lineIsVisible':
-        return args[0]['props'].get('visible', True)
-
-    # Line Coordinates
-    if operation == 'lineGetX1':
-        return args[0]['props'].get('x1')
-        
-    if operation == 'lineGetY1':
-        return args[0]['props'].get('y1')
-        
-    if operation == 'lineGetX2':
-        return args[0]['props'].get('x2')
-        
-    if operation == 'lineGetY2':
-        return args[0]['props'].get('y2')
-
-    # Line Extensions
-    if operation == 'lineSetExtend':
-        line, extend = args
-        line['props']['extend'] = extend
-        return line
-        
-    if operation == 'lineGetExtend':
-        return args[0]['props'].get('extend', 'none')
-
-    # Line Style Properties
-    if operation == 'lineSetOpacity':
-        line, opacity = args
-        line['props']['opacity'] = opacity
-        return line
-        
-    if operation == 'lineSetDash':
-        line, dash = args
-        line['props']['dash'] = dash
-        return line
+@handles('lineSetStyle')
+def _line_lineSetStyle(self, operation, args):
+    line, style = args
+    line['props']['style'] = style
+    return line
+
+@handles('lineSetWidth')
+def _line_lineSetWidth(self, operation, args):
+    line, width = args
+    line['props']['width'] = width
+    return line
+
+@handles('lineSetXY1')
+def _line_lineSetXY1(self, operation, args):
+    line, x1, y1 = args
+    line['props']['x1'] = x1
+    line['props']['y1'] = y1
+    return line
+
+@handles('lineSetXY2')
+def _line_lineSetXY2(self, operation, args):
+    line, x2, y2 = args
+    line['props']['x2'] = x2
+    line['props']['y2'] = y2
+    return line
+
+# Line State
+@handles('lineDelete')
+def _line_lineDelete(self, operation, args):
+    return {'action': 'delete', 'line': args[0]}
+
+@handles('lineGet')
+def _line_lineGet(self, operation, args):
+    return {'action': 'get', 'id': args[0]}
+
+# Line Visibility
+@handles('lineSetVisible')
+def _line_lineSetVisible(self, operation, args):
+    line, visible = args
+    line['props']['visible'] = visible
+    return line
+
+@handles('lineIsVisible')
+def _line_lineIsVisible(self, operation, args):
+    return args[0]['props'].get('visible', True)
+
+# Line Coordinates
+@handles('lineGetX1')
+def _line_lineGetX1(self, operation, args):
+    return args[0]['props'].get('x1')
+
+@handles('lineGetY1')
+def _line_lineGetY1(self, operation, args):
+    return args[0]['props'].get('y1')
+
+@handles('lineGetX2')
+def _line_lineGetX2(self, operation, args):
+    return args[0]['props'].get('x2')
+
+@handles('lineGetY2')
+def _line_lineGetY2(self, operation, args):
+    return args[0]['props'].get('y2')
+
+# Line Extensions
+@handles('lineSetExtend')
+def _line_lineSetExtend(self, operation, args):
+    line, extend = args
+    line['props']['extend'] = extend
+    return line
+
+@handles('lineGetExtend')
+def _line_lineGetExtend(self, operation, args):
+    return args[0]['props'].get('extend', 'none')
+
+# Line Style Properties
+@handles('lineSetOpacity')
+def _line_lineSetOpacity(self, operation, args):
+    line, opacity = args
+    line['props']['opacity'] = opacity
+    return line
+
+@handles('lineSetDash')
+def _line_lineSetDash(self, operation, args):
+    line, dash = args
+    line['props']['dash'] = dash
+    return line
+
+
+_handle_line_operation = _handle_operation
+
+
+
+
+
+
+
+
+
+
+#Log
+
+# Basic Logging
+@handles('log')
+def _log_log(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'info'}
+
+@handles('logDebug')
+def _log_logDebug(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'debug'}
+
+@handles('logError')
+def _log_logError(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'error'}
+
+@handles('logInfo')
+def _log_logInfo(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'info'}
+
+@handles('logWarn')
+def _log_logWarn(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'warn'}
+
+# Formatted Logging
+@handles('logFormat')
+def _log_logFormat(self, operation, args):
+    template, *values = args
+    return {'action': 'log', 'message': template.format(*values), 'level': 'info'}
+
+# Trade Logging
+@handles('logTrade')
+def _log_logTrade(self, operation, args):
+    trade_info = args[0]
+    return {'action': 'log', 'message': trade_info, 'level': 'trade'}
+
+# Advanced Logging
+@handles('logTrace')
+def _log_logTrace(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'trace'}
+
+@handles('logVerbose')
+def _log_logVerbose(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'verbose'}
+
+@handles('logCritical')
+def _log_logCritical(self, operation, args):
+    message = args[0]
+    return {'action': 'log', 'message': message, 'level': 'critical'}
+
+# Structured Logging
+@handles('logJson')
+def _log_logJson(self, operation, args):
+    data = args[0]
+    return {'action': 'log', 'message': data, 'level': 'info', 'format': 'json'}
+
+@handles('logTable')
+def _log_logTable(self, operation, args):
+    table_data = args[0]
+    return {'action': 'log', 'message': table_data, 'level': 'info', 'format': 'table'}
+
+# Log Control
+@handles('logClear')
+def _log_logClear(self, operation, args):
+    return {'action': 'log_clear'}
+
+@handles('logSetLevel')
+def _log_logSetLevel(self, operation, args):
+    level = args[0]
+    return {'action': 'log_set_level', 'level': level}
+
+
+_handle_log_operation = _handle_operation
+
+
+
+
+
+
+
+
+#Map
+
+# Map Creation and Basic Operations
+@handles('mapNew')
+def _map_mapNew(self, operation, args):
+    return {}
+
+@handles('mapSet')
+def _map_mapSet(self, operation, args):
+    map_obj, key, value = args
+    map_obj[key] = value
+    return map_obj
+
+@handles('mapGet')
+def _map_mapGet(self, operation, args):
+    map_obj, key = args
+    return map_obj.get(key)
+
+@handles('mapDelete')
+def _map_mapDelete(self, operation, args):
+    map_obj, key = args
+    if key in map_obj:
+        del map_obj[key]
+    return map_obj
+
+@handles('mapClear')
+def _map_mapClear(self, operation, args):
+    args[0].clear()
+    return args[0]
+
+# Map Information
+@handles('mapSize')
+def _map_mapSize(self, operation, args):
+    return len(args[0])
+
+@handles('mapContains')
+def _map_mapContains(self, operation, args):
+    map_obj, key = args
+    return key in map_obj
+
+@handles('mapEmpty')
+def _map_mapEmpty(self, operation, args):
+    return len(args[0]) == 0
+
+# Map Keys and Values
+@handles('mapKeys')
+def _map_mapKeys(self, operation, args):
+    return list(args[0].keys())
+
+@handles('mapValues')
+def _map_mapValues(self, operation, args):
+    return list(args[0].values())
+
+@handles('mapItems')
+def _map_mapItems(self, operation, args):
+    return list(args[0].items())
+
+# Map Operations
+@handles('mapCopy')
+def _map_mapCopy(self, operation, args):
+    return args[0].copy()
+
+@handles('mapMerge')
+def _map_mapMerge(self, operation, args):
+    map1, map2 = args
+    map1.update(map2)
+    return map1
+
+@handles('mapReverse')
+def _map_mapReverse(self, operation, args):
+    return {v: k for k, v in args[0].items()}
+
+# Map Type Operations
+@handles('mapToArray')
+def _map_mapToArray(self, operation, args):
+    return [{'key': k, 'value': v} for k, v in args[0].items()]
+
+@handles('mapFromArray')
+def _map_mapFromArray(self, operation, args):
+    return {item['key']: item['value'] for item in args[0]}
+
+@handles('mapToJson')
+def _map_mapToJson(self, operation, args):
+    return json.dumps(args[0])
+
+@handles('mapFromJson')
+def _map_mapFromJson(self, operation, args):
+    return json.loads(args[0])
+
+# Map Filtering
+@handles('mapFilter')
+def _map_mapFilter(self, operation, args):
+    map_obj, predicate = args
+    return {k: v for k, v in map_obj.items() if predicate(k, v)}
+
+@handles('mapFind')
+def _map_mapFind(self, operation, args):
+    map_obj, predicate = args
+    return next((k for k, v in map_obj.items() if predicate(k, v)), None)
+
+# Map Transformation
+@handles('mapTransform')
+def _map_mapTransform(self, operation, args):
+    map_obj, transform_func = args
+    return {k: transform_func(v) for k, v in map_obj.items()}
+
+@handles('mapTransformKeys')
+def _map_mapTransformKeys(self, operation, args):
+    map_obj, transform_func = args
+    return {transform_func(k): v for k, v in map_obj.items()}
+
+# Map Validation
+@handles('mapValidate')
+def _map_mapValidate(self, operation, args):
+    map_obj, schema = args
+    return self._validate_map(map_obj, schema)
+
+@handles('mapHasAllKeys')
+def _map_mapHasAllKeys(self, operation, args):
+    map_obj, keys = args
+    return all(key in map_obj for key in keys)
+
+
+_handle_map_operation = _handle_operation
+
+
+
+
+#Math
+
+# Basic Math
+@handles('mathAbs')
+def _math_mathAbs(self, operation, args):
+    return abs(args[0])
+
+@handles('mathAdd')
+def _math_mathAdd(self, operation, args):
+    return args[0] + args[1]
+
+@handles('mathCeil')
+def _math_mathCeil(self, operation, args):
+    return math.ceil(args[0])
+
+@handles('mathFloor')
+def _math_mathFloor(self, operation, args):
+    return math.floor(args[0])
+
+@handles('mathMax')
+def _math_mathMax(self, operation, args):
+    return max(args)
+
+@handles('mathMin')
+def _math_mathMin(self, operation, args):
+    return min(args)
+
+@handles('mathMod')
+def _math_mathMod(self, operation, args):
+    return args[0] % args[1]
+
+@handles('mathPow')
+def _math_mathPow(self, operation, args):
+    return math.pow(args[0], args[1])
+
+@handles('mathRound')
+def _math_mathRound(self, operation, args):
+    return round(args[0])
+
+@handles('mathSign')
+def _math_mathSign(self, operation, args):
+    return -1 if args[0] < 0 else 1 if args[0] > 0 else 0
+
+@handles('mathSqrt')
+def _math_mathSqrt(self, operation, args):
+    return math.sqrt(args[0])
+
+# Trigonometry
+@handles('mathAcos')
+def _math_mathAcos(self, operation, args):
+    return math.acos(args[0])
+
+@handles('mathAsin')
+def _math_mathAsin(self, operation, args):
+    return math.asin(args[0])
+
+@handles('mathAtan')
+def _math_mathAtan(self, operation, args):
+    return math.atan(args[0])
+
+@handles('mathAtan2')
+def _math_mathAtan2(self, operation, args):
+    return math.atan2(args[0], args[1])
+
+@handles('mathCos')
+def _math_mathCos(self, operation, args):
+    return math.cos(args[0])
+
+@handles('mathSin')
+def _math_mathSin(self, operation, args):
+    return math.sin(args[0])
+
+@handles('mathTan')
+def _math_mathTan(self, operation, args):
+    return math.tan(args[0])
+
+# Logarithmic
+@handles('mathLog')
+def _math_mathLog(self, operation, args):
+    return math.log(args[0])
+
+@handles('mathLog10')
+def _math_mathLog10(self, operation, args):
+    return math.log10(args[0])
+
+@handles('mathExp')
+def _math_mathExp(self, operation, args):
+    return math.exp(args[0])
+
+
+_handle_math_operation = _handle_operation
+
+
+
+bisect.bisect_left(args[0], args[1])
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+@builtin('arrAbs')
+def _syntax_arrAbs(self, *args):
+    return [abs(x) for x in args[0]]
+
+
+@builtin('arrAvg')
+def _syntax_arrAvg(self, *args):
+    return sum(args[0]) / len(args[0])
 
+
+@builtin('arrBinarySearch')
+def _syntax_arrBinarySearch(self, *args):
+    left, right = 0, len(args[0]) - 1
+    while left <= right:
+        mid = (left + right) // 2
+        if args[0][mid] == args[1]:
+            return mid
+        elif args[0][mid] < args[1]:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return left
+
+
+@builtin('arrBinarySearchLeftmost')
+def _syntax_arrBinarySearchLeftmost(self, *args):
+    left, right = 0, len(args[0])
+    while left < right:
+        mid = (left + right) // 2
+        if args[0][mid] < args[1]:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+@builtin('arrBinarySearchRightmost')
+def _syntax_arrBinarySearchRightmost(self, *args):
+    left, right = 0, len(args[0])
+    while left < right:
+        mid = (left + right) // 2
+        if args[0][mid] <= args[1]:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+@builtin('arrClear')
+def _syntax_arrClear(self, *args):
+    args[0] = []
+    return args[0]
+
+
+@builtin('arrConcat')
+def _syntax_arrConcat(self, *args):
+    result = []
+    for x in args[0]:
+        result.append(x)
+    for x in args[1]:
+        result.append(x)
+    return result
+
+
+@builtin('arrCopy')
+def _syntax_arrCopy(self, *args):
+    result = []
+    for x in args[0]:
+        result.append(x)
+    return result
+
+
+@builtin('arrCovariance')
+def _syntax_arrCovariance(self, *args):
+    mean1 = sum(args[0]) / len(args[0])
+    mean2 = sum(args[1]) / len(args[1])
+    sum_of_products = sum((x - mean1) * (y - mean2) for x, y in zip(args[0], args[1]))
+    return sum_of_products / len(args[0])
+
+
+@builtin('arrEvery')
+def _syntax_arrEvery(self, *args):
+    for x in args[0]:
+        if not args[1](x):
+            return False
+    return True
+
+
+@builtin('arrFill')
+def _syntax_arrFill(self, *args):
+    result = []
+    for _ in range(len(args[0])):
+        result.append(args[1])
+    return result
+
+
+@builtin('arrFirst')
+def _syntax_arrFirst(self, *args):
+    if len(args[0]) > 0:
+        return args[0][0]
     return None
 
 
+@builtin('arrFrom')
+def _syntax_arrFrom(self, *args):
+    result = []
+    for x in args[0]:
+        result.append(x)
+    return result
 
 
+@builtin('arrGet')
+def _syntax_arrGet(self, *args):
+    return args[0][args[1]]
 
 
+@builtin('arrIncludes')
+def _syntax_arrIncludes(self, *args):
+    for x in args[0]:
+        if x == args[1]:
+            return True
+    return False
 
 
+@builtin('arrIndexOf')
+def _syntax_arrIndexOf(self, *args):
+    for i in range(len(args[0])):
+        if args[0][i] == args[1]:
+            return i
+    return -1
 
 
-def _handle_log_operation(self, operation, args):
-    """
-    Handles all logging operations
-    """
-    # Basic Logging
-    if operation == 'log':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'info'}
-        
-    if operation == 'logDebug':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'debug'}
-        
-    if operation == 'logError':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'error'}
-        
-    if operation == 'logInfo':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'info'}
-        
-    if operation == 'logWarn':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'warn'}
-
-    # Formatted Logging
-    if operation == 'logFormat':
-        template, *values = args
-        return {'action': 'log', 'message': template.format(*values), 'level': 'info'}
-
-    # Trade Logging
-    if operation == 'logTrade':
-        trade_info = args[0]
-        return {'action': 'log', 'message': trade_info, 'level': 'trade'}
-
-        # Advanced Logging
-    if operation == 'logTrace':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'trace'}
-        
-    if operation == 'logVerbose':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'verbose'}
-        
-    if operation == 'logCritical':
-        message = args[0]
-        return {'action': 'log', 'message': message, 'level': 'critical'}
-
-    # Structured Logging
-    if operation == 'logJson':
-        data = args[0]
-        return {'action': 'log', 'message': data, 'level': 'info', 'format': 'json'}
-        
-    if operation == 'logTable':
-        table_data = args[0]
-        return {'action': 'log', 'message': table_data, 'level': 'info', 'format': 'table'}
-
-    # Log Control
-    if operation == 'logClear':
-        return {'action': 'log_clear'}
-        
-    if operation == 'logSetLevel':
-        level = args[0]
-        return {'action': 'log_set_level', 'level': level}
+@builtin('arrInsert')
+def _syntax_arrInsert(self, *args):
+    result = []
+    for i in range(len(args[0])):
+        if i == args[1]:
+            result.append(args[2])
+        result.append(args[0][i])
+    if args[1] >= len(args[0]):
+        result.append(args[2])
+    return result
+
+
+@builtin('arrJoin')
+def _syntax_arrJoin(self, *args):
+    result = str(args[0][0]) if args[0] else ""
+    for x in args[0][1:]:
+        result += args[1] + str(x)
+    return result
+
 
+@builtin('arrLast')
+def _syntax_arrLast(self, *args):
+    if len(args[0]) > 0:
+        return args[0][-1]
     return None
 
 
+@builtin('arrLastIndexOf')
+def _syntax_arrLastIndexOf(self, *args):
+    for i in range(len(args[0])-1, -1, -1):
+        if args[0][i] == args[1]:
+            return i
+    return -1
 
 
+@builtin('arrMax')
+def _syntax_arrMax(self, *args):
+    if not args[0]:
+        return None
+    max_val = args[0][0]
+    for x in args[0][1:]:
+        if x > max_val:
+            max_val = x
+    return max_val
+
+
+@builtin('arrMedian')
+def _syntax_arrMedian(self, *args):
+    sorted_arr = []
+    for x in args[0]:
+        sorted_arr.append(x)
+    for i in range(len(sorted_arr)):
+        for j in range(len(sorted_arr)-1-i):
+            if sorted_arr[j] > sorted_arr[j+1]:
+                sorted_arr[j], sorted_arr[j+1] = sorted_arr[j+1], sorted_arr[j]
+    n = len(sorted_arr)
+    if n % 2 == 0:
+        return (sorted_arr[n//2-1] + sorted_arr[n//2]) / 2
+    return sorted_arr[n//2]
+
+
+@builtin('arrMin')
+def _syntax_arrMin(self, *args):
+    if not args[0]:
+        return None
+    min_val = args[0][0]
+    for x in args[0][1:]:
+        if x < min_val:
+            min_val = x
+    return min_val
 
 
+@builtin('arrMode')
+def _syntax_arrMode(self, *args):
+    if not args[0]:
+        return None
+    counts = {}
+    for x in args[0]:
+        if x in counts:
+            counts[x] += 1
+        else:
+            counts[x] = 1
+    max_count = 0
+    mode = None
+    for x, count in counts.items():
+        if count > max_count:
+            max_count = count
+            mode = x
+    return mode
+
+
+@builtin('arrNewBox')
+def _syntax_arrNewBox(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
+
+
+@builtin('aryNewCol')
+def _syntax_aryNewCol(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append([])
+    return result
+
+
+@builtin('arrNewLabel')
+def _syntax_arrNewLabel(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
+
+
+@builtin('arrNewLine')
+def _syntax_arrNewLine(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
+
+
+@builtin('arrNewLineFill')
+def _syntax_arrNewLineFill(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
+
+
+@builtin('arrNewTable')
+def _syntax_arrNewTable(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
+
+
+@builtin('arrNewType')
+def _syntax_arrNewType(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(None)
+    return result
+
+
+@builtin('arrPercentileLinearInterpolation')
+def _syntax_arrPercentileLinearInterpolation(self, *args):
+    sorted_arr = sorted(args[0])
+    rank = args[1] * (len(sorted_arr) - 1) / 100
+    lower_idx = int(rank)
+    fraction = rank - lower_idx
+    if lower_idx >= len(sorted_arr) - 1:
+        return sorted_arr[-1]
+    return sorted_arr[lower_idx] + fraction * (sorted_arr[lower_idx + 1] - sorted_arr[lower_idx])
+
+
+@builtin('arrPercentileNearestRank')
+def _syntax_arrPercentileNearestRank(self, *args):
+    sorted_arr = sorted(args[0])
+    rank = round(args[1] * (len(sorted_arr) - 1) / 100)
+    return sorted_arr[rank]
+
+
+@builtin('arrRemove')
+def _syntax_arrRemove(self, *args):
+    result = []
+    for x in args[0]:
+        if x != args[1]:
+            result.append(x)
+    return result
+
+
+@builtin('arrSome')
+def _syntax_arrSome(self, *args):
+    for x in args[0]:
+        if args[1](x):
+            return True
+    return False
 
 
-def _handle_map_operation(self, operation, args):
-    """
-    Handles all map operations
-    """
-    # Map Creation and Basic Operations
-    if operation == 'mapNew':
-        return {}
-        
-    if operation == 'mapSet':
-        map_obj, key, value = args
-        map_obj[key] = value
-        return map_obj
-        
-    if operation == 'mapGet':
-        map_obj, key = args
-        return map_obj.get(key)
-        
-    if operation == 'mapDelete':
-        map_obj, key = args
-        if key in map_obj:
-            del map_obj[key]
-        return map_obj
-        
-    if operation == 'mapClear':
-        args[0].clear()
-        return args[0]
+@builtin('arrSortIndices')
+def _syntax_arrSortIndices(self, *args):
+    indices = list(range(len(args[0])))
+    for i in range(len(indices)):
+        for j in range(len(indices)-1-i):
+            if args[0][indices[j]] > args[0][indices[j+1]]:
+                indices[j], indices[j+1] = indices[j+1], indices[j]
+    return indices
 
-    # Map Information
-    if operation == 'mapSize':
-        return len(args[0])
-        
-    if operation == 'mapContains':
-        map_obj, key = args
-        return key in map_obj
-        
-    if operation == 'mapEmpty':
-        return len(args[0]) == 0
 
-    # Map Keys and Values
-    if operation == 'mapKeys':
-        return list(args[0].keys())
-        
-    if operation == 'mapValues':
-        return list(args[0].values())
-        
-    if operation == 'mapItems':
-        return list(args[0].items())
+@builtin('arrNewBool')
+def _syntax_arrNewBool(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(False)
+    return result
 
-    # Map Operations
-    if operation == 'mapCopy':
-        return args[0].copy()
-        
-    if operation == 'mapMerge':
-        map1, map2 = args
-        map1.update(map2)
-        return map1
-        
-    if operation == 'mapReverse':
-        return {v: k for k, v in args[0].items()}
 
-        # Map Type Operations
-    if operation == 'mapToArray':
-        return [{'key': k, 'value': v} for k, v in args[0].items()]
-        
-    if operation == 'mapFromArray':
-        return {item['key']: item['value'] for item in args[0]}
-        
-    if operation == 'mapToJson':
-        return json.dumps(args[0])
-        
-    if operation == 'mapFromJson':
-        return json.loads(args[0])
+@builtin('arrNewFloat')
+def _syntax_arrNewFloat(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(0.0)
+    return result
 
-    # Map Filtering
-    if operation == 'mapFilter':
-        map_obj, predicate = args
-        return {k: v for k, v in map_obj.items() if predicate(k, v)}
-        
-    if operation == 'mapFind':
-        map_obj, predicate = args
-        return next((k for k, v in map_obj.items() if predicate(k, v)), None)
 
-    # Map Transformation
-    if operation == 'mapTransform':
-        map_obj, transform_func = args
-        return {k: transform_func(v) for k, v in map_obj.items()}
-        
-    if operation == 'mapTransformKeys':
-        map_obj, transform_func = args
-        return {transform_func(k): v for k, v in map_obj.items()}
+@builtin('arrNewInt')
+def _syntax_arrNewInt(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append(0)
+    return result
+
+
+@builtin('arrNewString')
+def _syntax_arrNewString(self, *args):
+    result = []
+    for _ in range(args[0]):
+        result.append("")
+    return result
+
+
+@builtin('arrPercentRank')
+def _syntax_arrPercentRank(self, *args):
+    result = []
+    for val in args[0]:
+        count = 0
+        for x in args[0]:
+            if x < val:
+                count += 1
+        result.append(count / len(args[0]))
+    return result
 
-    # Map Validation
-    if operation == 'mapValidate':
-        map_obj, schema = args
-        return self._validate_map(map_obj, schema)
-        
-    if operation == 'mapHasAllKeys':
-        map_obj, keys = args
-        return all(key in map_obj for key in keys)
 
+@builtin('arrPop')
+def _syntax_arrPop(self, *args):
+    if len(args[0]) > 0:
+        last_val = args[0][-1]
+        args[0] = args[0][:-1]
+        return last_val
     return None
 
 
+@builtin('arrPush')
+def _syntax_arrPush(self, *args):
+    args[0].append(args[1])
+    return len(args[0])
 
 
-def _handle_math_operation(self, operation, args):
-    """
-    Handles all mathematical operations
-    """
-    # Basic Math
-    if operation == 'mathAbs':
-        return abs(args[0])
-        
-    if operation == 'mathAdd':
-        return args[0] + args[1]
-        
-    if operation == 'mathCeil':
-        return math.ceil(args[0])
-        
-    if operation == 'mathFloor':
-        return math.floor(args[0])
-        
-    if operation == 'mathMax':
-        return max(args)
-        
-    if operation == 'mathMin':
-        return min(args)
-        
-    if operation == 'mathMod':
-        return args[0] % args[1]
-        
-    if operation == 'mathPow':
-        return math.pow(args[0], args[1])
-        
-    if operation == 'mathRound':
-        return round(args[0])
-        
-    if operation == 'mathSign':
-        return -1 if args[0] < 0 else 1 if args[0] > 0 else 0
-        
-    if operation == 'mathSqrt':
-        return math.sqrt(args[0])
+@builtin('arrRange')
+def _syntax_arrRange(self, *args):
+    start = args[0]
+    end = args[1]
+    step = args[2] if len(args) > 2 else 1
+    result = []
+    current = start
+    while (step > 0 and current < end) or (step < 0 and current > end):
+        result.append(current)
+        current += step
+    return result
 
-    # Trigonometry
-    if operation == 'mathAcos':
-        return math.acos(args[0])
-        
-    if operation == 'mathAsin':
-        return math.asin(args[0])
-        
-    if operation == 'mathAtan':
-        return math.atan(args[0])
-        
-    if operation == 'mathAtan2':
-        return math.atan2(args[0], args[1])
-        
-    if operation == 'mathCos':
-        return math.cos(args[0])
-        
-    if operation == 'mathSin':
-        return math.sin(args[0])
-        
-    if operation == 'mathTan':
-        return math.tan(args[0])
 
-    # Logarithmic
-    if operation == 'mathLog':
-        return math.log(args[0])
-        
-    if operation == 'mathLog10':
-        return math.log10(args[0])
-        
-    if operation == 'mathExp':
-        return math.exp(args[0])
+@builtin('arrReverse')
+def _syntax_arrReverse(self, *args):
+    result = []
+    for i in range(len(args[0])-1, -1, -1):
+        result.append(args[0][i])
+    return result
+
 
+@builtin('arrSet')
+def _syntax_arrSet(self, *args):
+    args[0][args[1]] = args[2]
+    return args[0]
+
+
+@builtin('arrShift')
+def _syntax_arrShift(self, *args):
+    if len(args[0]) > 0:
+        first_val = args[0][0]
+        args[0] = args[0][1:]
+        return first_val
     return None
 
 
+@builtin('arrSize')
+def _syntax_arrSize(self, *args):
+    count = 0
+    for _ in args[0]:
+        count += 1
+    return count
+
+
+@builtin('arrSlice')
+def _syntax_arrSlice(self, *args):
+    result = []
+    start = args[1]
+    end = args[2]
+    for i in range(start, end):
+        result.append(args[0][i])
+    return result
+
+
+@builtin('arrSort')
+def _syntax_arrSort(self, *args):
+    result = args[0].copy()
+    for i in range(len(result)):
+        for j in range(len(result)-1-i):
+            if result[j] > result[j+1]:
+                result[j], result[j+1] = result[j+1], result[j]
+    return result
+
+
+@builtin('arrStandardize')
+def _syntax_arrStandardize(self, *args):
+    mean = sum(args[0]) / len(args[0])
+    squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
+    std_dev = (squared_diff_sum / len(args[0])) ** 0.5
+    return [(x - mean) / std_dev for x in args[0]]
+
+
+@builtin('arrStdev')
+def _syntax_arrStdev(self, *args):
+    mean = sum(args[0]) / len(args[0])
+    squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
+    return (squared_diff_sum / (len(args[0]) - 1)) ** 0.5
+
+
+@builtin('arrSum')
+def _syntax_arrSum(self, *args):
+    total = 0
+    for x in args[0]:
+        total += x
+    return total
+
+
+@builtin('arrUnshift')
+def _syntax_arrUnshift(self, *args):
+    result = [args[1]]
+    for x in args[0]:
+        result.append(x)
+    return result
+
+
+@builtin('arrVariance')
+def _syntax_arrVariance(self, *args):
+    mean = sum(args[0]) / len(args[0])
+    squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
+    return squared_diff_sum / (len(args[0]) - 1)
+
+
+@builtin('boxFunc')
+def _syntax_boxFunc(self, *args):
+    return {
+        'left': 0,
+        'top': 0,
+        'right': 0,
+        'bottom': 0,
+        'text': '',
+        'bgColor': '#FFFFFF',
+        'borderColor': '#000000',
+        'borderWidth': 1,
+        'borderStyle': 'solid',
+        'textColor': '#000000',
+        'textSize': 12,
+        'textAlign': 'center',
+        'textVAlign': 'middle',
+        'textWrap': 'none',
+        'textFontFamily': 'Arial'
+    }
 
-bisect.bisect_left(args[0], args[1])
 
-def calculate_syntax(self, syntax_list, *args):
-    syntax_info = self.registry['syntax_registry']['elements'].get(syntax_list['name'])
-    
-    if syntax_info:
-        if syntax_list['name'] == 'arrAbs':
-            return [abs(x) for x in args[0]]
-        elif syntax_list['name'] == 'arrAvg':
-            return sum(args[0]) / len(args[0])
-        elif syntax_list['name'] == 'arrBinarySearch':
-            return bisect.bisect_left(args[0], args[1])
-        elif syntax_list['name'] == 'arrBinarySearchLeftmost':
-            return bisect.bisect_left(args[0], args[1])
-        elif syntax_list['name'] == 'arrBinarySearchRightmost':
-            return bisect.bisect_right(args[0], args[1])
-        elif syntax_list['name'] == 'arrClear':
-            args[0].clear()
-            return args[0]
-        elif syntax_list['name'] == 'arrConcat':
-            return args[0] + args[1]
-        elif syntax_list['name'] == 'arrCopy':
-            return args[0].copy()
-        elif syntax_list['name'] == 'arrCovariance':
-            return np.cov(args[0], args[1])[0][1]
-        elif syntax_list['name'] == 'arrEvery':
-            return all(args[1](x) for x in args[0])
-        elif syntax_list['name'] == 'arrFill':
-            return [args[1]] * len(args[0])
-        elif syntax_list['name'] == 'arrFirst':
-            return args[0][0] if args[0] else None
-        elif syntax_list['name'] == 'arrFrom':
-            return list(args[0])
-        elif syntax_list['name'] == 'arrGet':
-            return args[0][args[1]]
-        elif syntax_list['name'] == 'arrIncludes':
-            return args[1] in args[0]
-        elif syntax_list['name'] == 'arrIndexOf':
-            return args[0].index(args[1]) if args[1] in args[0] else -1
-        elif syntax_list['name'] == 'arrInsert':
-            args[0].insert(args[1], args[2])
-            return args[0]
-        elif syntax_list['name'] == 'arrJoin':
-            return args[1].join(map(str, args[0]))
-        elif syntax_list['name'] == 'arrLast':
-            return args[0][-1] if args[0] else None
-        elif syntax_list['name'] == 'arrLastIndexOf':
-            return len(args[0]) - 1 - args[0][::-1].index(args[1]) if args[1] in args[0] else -1
-        elif syntax_list['name'] == 'arrMax':
-            return max(args[0])
-        elif syntax_list['name'] == 'arrMedian':
-            return statistics.median(args[0])
-        elif syntax_list['name'] == 'arrMin':
-            return min(args[0])
-        elif syntax_list['name'] == 'arrMode':
-            return statistics.mode(args[0])
-        elif syntax_list['name'] == 'arrNewBool':
-            return [False] * args[0]
-        elif syntax_list['name'] == 'arrNewBox':
-            return [None] * args[0]
-        elif syntax_list['name'] == 'arrNewFloat':
-            return [0.0] * args[0]
-        elif syntax_list['name'] == 'arrNewInt':
-            return [0] * args[0]
-        elif syntax_list['name'] == 'arrNewLabel':
-            return [None] * args[0]
-        elif syntax_list['name'] == 'arrNewLine':
-            return [None] * args[0]
-        elif syntax_list['name'] == 'arrNewLineFill':
-            return [None] * args[0]
-        elif syntax_list['name'] == 'arrNewString':
-            return [''] * args[0]
-        elif syntax_list['name'] == 'arrNewTable':
-            return [None] * args[0]
-        elif syntax_list['name'] == 'arrNewType':
-            return [None] * args[0]
-        elif syntax_list['name'] == 'arrPercentileLinearInterpolation':
-            return np.percentile(args[0], args[1])
-        elif syntax_list['name'] == 'arrPercentileNearestRank':
-            return np.percentile(args[0], args[1], interpolation='nearest')
-        elif syntax_list['name'] == 'arrPercentRank':
-            return [sum(x < val for x in args[0]) / len(args[0]) for val in args[0]]
-        elif syntax_list['name'] == 'arrPop':
-            return args[0].pop()
-        elif syntax_list['name'] == 'arrPush':
-            args[0].append(args[1])
-            return args[0]
-        elif syntax_list['name'] == 'arrRange':
-            return list(range(args[0], args[1], args[2] if len(args) > 2 else 1))
-        elif syntax_list['name'] == 'arrRemove':
-            args[0].remove(args[1])
-            return args[0]
-        elif syntax_list['name'] == 'arrReverse':
-            return args[0][::-1]
-        elif syntax_list['name'] == 'arrSet':
-            args[0][args[1]] = args[2]
-            return args[0]
-        elif syntax_list['name'] == 'arrShift':
-            return args[0].pop(0) if args[0] else None
-        elif syntax_list['name'] == 'arrSize':
-            return len(args[0])
-        elif syntax_list['name'] == 'arrSlice':
-            return args[0][args[1]:args[2]]
-        elif syntax_list['name'] == 'arrSome':
-            return any(args[1](x) for x in args[0])
-        elif syntax_list['name'] == 'arrSort':
-            return sorted(args[0], reverse=args[1] if len(args) > 1 else False)
-        elif syntax_list['name'] == 'arrSortIndices':
-            return sorted(range(len(args[0])), key=lambda k: args[0][k], reverse=args[1] if len(args) > 1 else False)
-        elif syntax_list['name'] == 'arrStandardize':
-            mean = sum(args[0]) / len(args[0])
-            std = (sum((x - mean) ** 2 for x in args[0]) / len(args[0])) ** 0.5
-            return [(x - mean) / std for x in args[0]]
-        elif syntax_list['name'] == 'arrStdev':
-            return statistics.stdev(args[0])
-        elif syntax_list['name'] == 'arrSum':
-            return sum(args[0])
-        elif syntax_list['name'] == 'arrUnshift':
-            args[0].insert(0, args[1])
-            return args[0]
-        elif syntax_list['name'] == 'arrVariance':
-            return statistics.variance(args[0])
+@builtin('boxCopyFunc')
+def _syntax_boxCopyFunc(self, *args):
+    return {
+        'left': args[0]['left'],
+        'top': args[0]['top'],
+        'right': args[0]['right'],
+        'bottom': args[0]['bottom'],
+        'text': args[0]['text'],
+        'bgColor': args[0]['bgColor'],
+        'borderColor': args[0]['borderColor'],
+        'borderWidth': args[0]['borderWidth'],
+        'borderStyle': args[0]['borderStyle'],
+        'textColor': args[0]['textColor'],
+        'textSize': args[0]['textSize'],
+        'textAlign': args[0]['textAlign'],
+        'textVAlign': args[0]['textVAlign'],
+        'textWrap': args[0]['textWrap'],
+        'textFontFamily': args[0]['textFontFamily']
+    }
 
 
+@builtin('boxDeleteFunc')
+def _syntax_boxDeleteFunc(self, *args):
+    args[0] = None
+    return True
 
 
+@builtin('boxGetBottomFunc')
+def _syntax_boxGetBottomFunc(self, *args):
+    return args[0]['bottom']
 
 
+@builtin('boxGetLeftFunc')
+def _syntax_boxGetLeftFunc(self, *args):
+    return args[0]['left']
 
 
+@builtin('boxGetRightFunc')
+def _syntax_boxGetRightFunc(self, *args):
+    return args[0]['right']
 
 
+@builtin('boxGetTopFunc')
+def _syntax_boxGetTopFunc(self, *args):
+    return args[0]['top']
 
 
+@builtin('boxNewFunc')
+def _syntax_boxNewFunc(self, *args):
+    return {
+        'left': args[0],
+        'top': args[1],
+        'right': args[2],
+        'bottom': args[3]
+    }
 
 
-def calculate_syntax(self, syntax_list, *args):
-    syntax_info = self.registry['syntax_registry']['elements'].get(syntax_list['name'])
-    
-    if syntax_info:
-        if syntax_list['name'] == 'arrAbs':
-            return [abs(x) for x in args[0]]
-            
-        elif syntax_list['name'] == 'arrAvg':
-            return sum(args[0]) / len(args[0])
-            
-        elif syntax_list['name'] == 'arrBinarySearch':
-            left, right = 0, len(args[0]) - 1
-            while left <= right:
-                mid = (left + right) // 2
-                if args[0][mid] == args[1]:
-                    return mid
-                elif args[0][mid] < args[1]:
-                    left = mid + 1
-                else:
-                    right = mid - 1
-            return left
-            
-        elif syntax_list['name'] == 'arrBinarySearchLeftmost':
-            left, right = 0, len(args[0])
-            while left < right:
-                mid = (left + right) // 2
-                if args[0][mid] < args[1]:
-                    left = mid + 1
-                else:
-                    right = mid
-            return left
-            
-        elif syntax_list['name'] == 'arrBinarySearchRightmost':
-            left, right = 0, len(args[0])
-            while left < right:
-                mid = (left + right) // 2
-                if args[0][mid] <= args[1]:
-                    left = mid + 1
-                else:
-                    right = mid
-            return left
-            
-        elif syntax_list['name'] == 'arrClear':
-            args[0] = []
-            return args[0]
-            
-        elif syntax_list['name'] == 'arrConcat':
-            result = []
-            for x in args[0]:
-                result.append(x)
-            for x in args[1]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrCopy':
-            result = []
-            for x in args[0]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrCovariance':
-            mean1 = sum(args[0]) / len(args[0])
-            mean2 = sum(args[1]) / len(args[1])
-            sum_of_products = sum((x - mean1) * (y - mean2) for x, y in zip(args[0], args[1]))
-            return sum_of_products / len(args[0])
-            
-        elif syntax_list['name'] == 'arrEvery':
-            for x in args[0]:
-                if not args[1](x):
-                    return False
-            return True
-            
-        elif syntax_list['name'] == 'arrFill':
-            result = []
-            for _ in range(len(args[0])):
-                result.append(args[1])
-            return result
-            
-        elif syntax_list['name'] == 'arrFirst':
-            if len(args[0]) > 0:
-                return args[0][0]
-            return None
-            
-        elif syntax_list['name'] == 'arrFrom':
-            result = []
-            for x in args[0]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrGet':
-            return args[0][args[1]]
-            
-        elif syntax_list['name'] == 'arrIncludes':
-            for x in args[0]:
-                if x == args[1]:
-                    return True
-            return False
-            
-        elif syntax_list['name'] == 'arrIndexOf':
-            for i in range(len(args[0])):
-                if args[0][i] == args[1]:
-                    return i
-            return -1
-            
-        elif syntax_list['name'] == 'arrInsert':
-            result = []
-            for i in range(len(args[0])):
-                if i == args[1]:
-                    result.append(args[2])
-                result.append(args[0][i])
-            if args[1] >= len(args[0]):
-                result.append(args[2])
-            return result
-            
-        elif syntax_list['name'] == 'arrJoin':
-            result = str(args[0][0]) if args[0] else ""
-            for x in args[0][1:]:
-                result += args[1] + str(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrLast':
-            if len(args[0]) > 0:
-                return args[0][-1]
-            return None
-            
-        elif syntax_list['name'] == 'arrLastIndexOf':
-            for i in range(len(args[0])-1, -1, -1):
-                if args[0][i] == args[1]:
-                    return i
-            return -1
-            
-        elif syntax_list['name'] == 'arrMax':
-            if not args[0]:
-                return None
-            max_val = args[0][0]
-            for x in args[0][1:]:
-                if x > max_val:
-                    max_val = x
-            return max_val
-            
-        elif syntax_list['name'] == 'arrMedian':
-            sorted_arr = []
-            for x in args[0]:
-                sorted_arr.append(x)
-            for i in range(len(sorted_arr)):
-                for j in range(len(sorted_arr)-1-i):
-                    if sorted_arr[j] > sorted_arr[j+1]:
-                        sorted_arr[j], sorted_arr[j+1] = sorted_arr[j+1], sorted_arr[j]
-            n = len(sorted_arr)
-            if n % 2 == 0:
-                return (sorted_arr[n//2-1] + sorted_arr[n//2]) / 2
-            return sorted_arr[n//2]
-            
-        elif syntax_list['name'] == 'arrMin':
-            if not args[0]:
-                return None
-            min_val = args[0][0]
-            for x in args[0][1:]:
-                if x < min_val:
-                    min_val = x
-            return min_val
-            
-        elif syntax_list['name'] == 'arrMode':
-            if not args[0]:
-                return None
-            counts = {}
-            for x in args[0]:
-                if x in counts:
-                    counts[x] += 1
-                else:
-                    counts[x] = 1
-            max_count = 0
-            mode = None
-            for x, count in counts.items():
-                if count > max_count:
-                    max_count = count
-                    mode = x
-            return mode
-            
-        elif syntax_list['name'] == 'arrNewBox':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'aryNewCol':
-            result = []
-            for _ in range(args[0]):
-                result.append([])
-            return result
-            
-        elif syntax_list['name'] == 'arrNewLabel':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewLine':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewLineFill':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewTable':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewType':
-            result = []
-            for _ in range(args[0]):
-                result.append(None)
-            return result
-            
-        elif syntax_list['name'] == 'arrPercentileLinearInterpolation':
-            sorted_arr = sorted(args[0])
-            rank = args[1] * (len(sorted_arr) - 1) / 100
-            lower_idx = int(rank)
-            fraction = rank - lower_idx
-            if lower_idx >= len(sorted_arr) - 1:
-                return sorted_arr[-1]
-            return sorted_arr[lower_idx] + fraction * (sorted_arr[lower_idx + 1] - sorted_arr[lower_idx])
-            
-        elif syntax_list['name'] == 'arrPercentileNearestRank':
-            sorted_arr = sorted(args[0])
-            rank = round(args[1] * (len(sorted_arr) - 1) / 100)
-            return sorted_arr[rank]
-            
-        elif syntax_list['name'] == 'arrRemove':
-            result = []
-            for x in args[0]:
-                if x != args[1]:
-                    result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrSome':
-            for x in args[0]:
-                if args[1](x):
-                    return True
-            return False
-            
-        elif syntax_list['name'] == 'arrSortIndices':
-            indices = list(range(len(args[0])))
-            for i in range(len(indices)):
-                for j in range(len(indices)-1-i):
-                    if args[0][indices[j]] > args[0][indices[j+1]]:
-                        indices[j], indices[j+1] = indices[j+1], indices[j]
-            return indices
-
-        elif syntax_list['name'] == 'arrNewBool':
-            result = []
-            for _ in range(args[0]):
-                result.append(False)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewFloat':
-            result = []
-            for _ in range(args[0]):
-                result.append(0.0)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewInt':
-            result = []
-            for _ in range(args[0]):
-                result.append(0)
-            return result
-            
-        elif syntax_list['name'] == 'arrNewString':
-            result = []
-            for _ in range(args[0]):
-                result.append("")
-            return result
-            
-        elif syntax_list['name'] == 'arrPercentRank':
-            result = []
-            for val in args[0]:
-                count = 0
-                for x in args[0]:
-                    if x < val:
-                        count += 1
-                result.append(count / len(args[0]))
-            return result
-            
-        elif syntax_list['name'] == 'arrPop':
-            if len(args[0]) > 0:
-                last_val = args[0][-1]
-                args[0] = args[0][:-1]
-                return last_val
-            return None
-            
-        elif syntax_list['name'] == 'arrPush':
-            args[0].append(args[1])
-            return len(args[0])
-            
-        elif syntax_list['name'] == 'arrRange':
-            start = args[0]
-            end = args[1]
-            step = args[2] if len(args) > 2 else 1
-            result = []
-            current = start
-            while (step > 0 and current < end) or (step < 0 and current > end):
-                result.append(current)
-                current += step
-            return result
-            
-        elif syntax_list['name'] == 'arrReverse':
-            result = []
-            for i in range(len(args[0])-1, -1, -1):
-                result.append(args[0][i])
-            return result
-            
-        elif syntax_list['name'] == 'arrSet':
-            args[0][args[1]] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'arrShift':
-            if len(args[0]) > 0:
-                first_val = args[0][0]
-                args[0] = args[0][1:]
-                return first_val
-            return None
-            
-        elif syntax_list['name'] == 'arrSize':
-            count = 0
-            for _ in args[0]:
-                count += 1
-            return count
-            
-        elif syntax_list['name'] == 'arrSlice':
-            result = []
-            start = args[1]
-            end = args[2]
-            for i in range(start, end):
-                result.append(args[0][i])
-            return result
-            
-        elif syntax_list['name'] == 'arrSort':
-            result = args[0].copy()
-            for i in range(len(result)):
-                for j in range(len(result)-1-i):
-                    if result[j] > result[j+1]:
-                        result[j], result[j+1] = result[j+1], result[j]
-            return result
-            
-        elif syntax_list['name'] == 'arrStandardize':
-            mean = sum(args[0]) / len(args[0])
-            squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
-            std_dev = (squared_diff_sum / len(args[0])) ** 0.5
-            return [(x - mean) / std_dev for x in args[0]]
-            
-        elif syntax_list['name'] == 'arrStdev':
-            mean = sum(args[0]) / len(args[0])
-            squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
-            return (squared_diff_sum / (len(args[0]) - 1)) ** 0.5
-            
-        elif syntax_list['name'] == 'arrSum':
-            total = 0
-            for x in args[0]:
-                total += x
-            return total
-            
-        elif syntax_list['name'] == 'arrUnshift':
-            result = [args[1]]
-            for x in args[0]:
-                result.append(x)
-            return result
-            
-        elif syntax_list['name'] == 'arrVariance':
-            mean = sum(args[0]) / len(args[0])
-            squared_diff_sum = sum((x - mean) ** 2 for x in args[0])
-            return squared_diff_sum / (len(args[0]) - 1)
+@builtin('boxSetBgColFunc')
+def _syntax_boxSetBgColFunc(self, *args):
+    args[0]['bgColor'] = args[1]
+    return args[0]
 
 
+@builtin('boxSetBorderColFunc')
+def _syntax_boxSetBorderColFunc(self, *args):
+    args[0]['borderColor'] = args[1]
+    return args[0]
 
 
+@builtin('boxSetBorderStyleFunc')
+def _syntax_boxSetBorderStyleFunc(self, *args):
+    args[0]['borderStyle'] = args[1]
+    return args[0]
 
 
+@builtin('boxSetBorderWidthFunc')
+def _syntax_boxSetBorderWidthFunc(self, *args):
+    args[0]['borderWidth'] = args[1]
+    return args[0]
 
 
+@builtin('boxSetBottomFunc')
+def _syntax_boxSetBottomFunc(self, *args):
+    args[0]['bottom'] = args[1]
+    return args[0]
 
 
+@builtin('boxSetBottomRightPointFunc')
+def _syntax_boxSetBottomRightPointFunc(self, *args):
+    args[0]['bottom'] = args[1]
+    args[0]['right'] = args[2]
+    return args[0]
 
 
-        elif syntax_list['name'] == 'boxFunc':
-            return {
-                'left': 0,
-                'top': 0,
-                'right': 0,
-                'bottom': 0,
-                'text': '',
-                'bgColor': '#FFFFFF',
-                'borderColor': '#000000',
-                'borderWidth': 1,
-                'borderStyle': 'solid',
-                'textColor': '#000000',
-                'textSize': 12,
-                'textAlign': 'center',
-                'textVAlign': 'middle',
-                'textWrap': 'none',
-                'textFontFamily': 'Arial'
-            }
-            
-        elif syntax_list['name'] == 'boxCopyFunc':
-            return {
-                'left': args[0]['left'],
-                'top': args[0]['top'],
-                'right': args[0]['right'],
-                'bottom': args[0]['bottom'],
-                'text': args[0]['text'],
-                'bgColor': args[0]['bgColor'],
-                'borderColor': args[0]['borderColor'],
-                'borderWidth': args[0]['borderWidth'],
-                'borderStyle': args[0]['borderStyle'],
-                'textColor': args[0]['textColor'],
-                'textSize': args[0]['textSize'],
-                'textAlign': args[0]['textAlign'],
-                'textVAlign': args[0]['textVAlign'],
-                'textWrap': args[0]['textWrap'],
-                'textFontFamily': args[0]['textFontFamily']
-            }
-            
-        elif syntax_list['name'] == 'boxDeleteFunc':
-            args[0] = None
-            return True
-            
-        elif syntax_list['name'] == 'boxGetBottomFunc':
-            return args[0]['bottom']
-            
-        elif syntax_list['name'] == 'boxGetLeftFunc':
-            return args[0]['left']
-            
-        elif syntax_list['name'] == 'boxGetRightFunc':
-            return args[0]['right']
-            
-        elif syntax_list['name'] == 'boxGetTopFunc':
-            return args[0]['top']
-            
-        elif syntax_list['name'] == 'boxNewFunc':
-            return {
-                'left': args[0],
-                'top': args[1],
-                'right': args[2],
-                'bottom': args[3]
-            }
-            
-        elif syntax_list['name'] == 'boxSetBgColFunc':
-            args[0]['bgColor'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBorderColFunc':
-            args[0]['borderColor'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBorderStyleFunc':
-            args[0]['borderStyle'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBorderWidthFunc':
-            args[0]['borderWidth'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBottomFunc':
-            args[0]['bottom'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetBottomRightPointFunc':
-            args[0]['bottom'] = args[1]
-            args[0]['right'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetExtendFunc':
-            args[0]['extend'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetLeftFunc':
-            args[0]['left'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetLeftTopFunc':
-            args[0]['left'] = args[1]
-            args[0]['top'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetRightFunc':
-            args[0]['right'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetRightBottomFunc':
-            args[0]['right'] = args[1]
-            args[0]['bottom'] = args[2]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextFunc':
-            args[0]['text'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextColFunc':
-            args[0]['textColor'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextFontFamilyFunc':
-            args[0]['textFontFamily'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextHAlignFunc':
-            args[0]['textAlign'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextSizeFunc':
-            args[0]['textSize'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextVAlignFunc':
-            args[0]['textVAlign'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTextWrapFunc':
-            args[0]['textWrap'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTopFunc':
-            args[0]['top'] = args[1]
-            return args[0]
-            
-        elif syntax_list['name'] == 'boxSetTopLeftPointFunc':
-            args[0]['top'] = args[1]
-            args[0]['left'] = args[2]
-            return args[0]
+@builtin('boxSetExtendFunc')
+def _syntax_boxSetExtendFunc(self, *args):
+    args[0]['extend'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetLeftFunc')
+def _syntax_boxSetLeftFunc(self, *args):
+    args[0]['left'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetLeftTopFunc')
+def _syntax_boxSetLeftTopFunc(self, *args):
+    args[0]['left'] = args[1]
+    args[0]['top'] = args[2]
+    return args[0]
+
+
+@builtin('boxSetRightFunc')
+def _syntax_boxSetRightFunc(self, *args):
+    args[0]['right'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetRightBottomFunc')
+def _syntax_boxSetRightBottomFunc(self, *args):
+    args[0]['right'] = args[1]
+    args[0]['bottom'] = args[2]
+    return args[0]
+
+
+@builtin('boxSetTextFunc')
+def _syntax_boxSetTextFunc(self, *args):
+    args[0]['text'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextColFunc')
+def _syntax_boxSetTextColFunc(self, *args):
+    args[0]['textColor'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextFontFamilyFunc')
+def _syntax_boxSetTextFontFamilyFunc(self, *args):
+    args[0]['textFontFamily'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextHAlignFunc')
+def _syntax_boxSetTextHAlignFunc(self, *args):
+    args[0]['textAlign'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextSizeFunc')
+def _syntax_boxSetTextSizeFunc(self, *args):
+    args[0]['textSize'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextVAlignFunc')
+def _syntax_boxSetTextVAlignFunc(self, *args):
+    args[0]['textVAlign'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTextWrapFunc')
+def _syntax_boxSetTextWrapFunc(self, *args):
+    args[0]['textWrap'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTopFunc')
+def _syntax_boxSetTopFunc(self, *args):
+    args[0]['top'] = args[1]
+    return args[0]
+
+
+@builtin('boxSetTopLeftPointFunc')
+def _syntax_boxSetTopLeftPointFunc(self, *args):
+    args[0]['top'] = args[1]
+    args[0]['left'] = args[2]
+    return args[0]
+
+
+
+
+def calculate_syntax(self, syntax_list, *args):
+    if not self.registry['syntax_registry']['elements'].get(syntax_list['name']):
+        return None
+    entry = BUILTINS.get(syntax_list['name'])
+    if entry is None:
+        return None
+    return entry.func(self, *args)
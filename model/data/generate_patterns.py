@@ -1,6 +1,9 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import requests
 
 from .indicators_calc import (TrendIndicators, Oscillators, VolumeIndicators, 
@@ -12,88 +15,206 @@ from .drawing_pattern_calc import Point
 
 
 
-def organize_all_data(symbol: str = 'AAPL') -> pd.DataFrame:
-    # Fetch data from API instead of CSV
-    response = requests.get(f'http://localhost:5000/fetch_candles?symbol={symbol}')
-    df = pd.DataFrame(response.json())
-    df['time'] = pd.to_datetime(df['time'], unit='ms')
-    organized_data = {}
+CANDLE_PATTERNS = [
+    'bullish_engulfing', 'bearish_engulfing', 'hammer', 'shooting_star',
+    'doji', 'morning_star', 'evening_star', 'three_white_soldiers',
+    'three_black_crows', 'harami', 'piercing_line', 'dark_cloud_cover',
+    'abandoned_baby'
+]
+
+
+def fibonacci_tools(df: pd.DataFrame):
+    high_point = Point(df['High'].idxmax(), df['High'].max())
+    low_point = Point(df['Low'].idxmin(), df['Low'].min())
+    return FibonacciTools.retracements(high_point, low_point)
+
 
-    high_point = Point(df['high'].idxmax(), df['high'].max())
-    low_point = Point(df['low'].idxmin(), df['low'].min())
+def gann_tools(df: pd.DataFrame):
+    return GannTools.fan(Point(0, df['Close'].iloc[0]), len(df))
+
+
+# (result key, analyzer); every analyzer only reads the shared frame, so they can run in any order
+ANALYZERS = [(pattern, getattr(CandlePatterns, pattern)) for pattern in CANDLE_PATTERNS] + [
+    # Trend Indicators
+    ('moving_averages', TrendIndicators.moving_average),
+    ('bollinger_bands', TrendIndicators.bollinger_bands),
+    ('keltner_channels', TrendIndicators.keltner_channels),
+    ('donchian_channels', TrendIndicators.donchian_channels),
+    ('parabolic_sar', TrendIndicators.parabolic_sar),
+    # Oscillators
+    ('rsi', Oscillators.rsi),
+    ('stochastic', Oscillators.stochastic),
+    ('macd', Oscillators.macd),
+    ('williams_r', Oscillators.williams_r),
+    ('cci', Oscillators.cci),
+    # Volume Indicators
+    ('obv', VolumeIndicators.on_balance_volume),
+    ('ad_line', VolumeIndicators.accumulation_distribution),
+    ('mfi', VolumeIndicators.money_flow_index),
+    ('cmf', VolumeIndicators.chaikin_money_flow),
+    ('vpt', VolumeIndicators.volume_price_trend),
+    # Momentum Indicators
+    ('awesome_oscillator', MomentumIndicators.awesome_oscillator),
+    ('momentum', MomentumIndicators.momentum),
+    ('roc', MomentumIndicators.rate_of_change),
+    ('rvi', MomentumIndicators.relative_vigor_index),
+    # Volatility Indicators
+    ('atr', VolatilityIndicators.average_true_range),
+    ('bbw', VolatilityIndicators.bollinger_bandwidth),
+    ('kcw', VolatilityIndicators.keltner_channel_bandwidth),
+    # Chart Patterns
+    ('head_and_shoulders', ChartPatterns.head_and_shoulders),
+    ('double_patterns', ChartPatterns.double_top_bottom),
+    ('volume_profile', VolumeProfile.calculate),
+    # Drawing Tools
+    ('fibonacci_tools', fibonacci_tools),
+    ('gann_tools', gann_tools),
+]
+
+ANALYZERS_BY_KEY = dict(ANALYZERS)
+
+_executor = None
+_workers = 1
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (its affinity mask, e.g. a container's quota), not the host's count"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def analysis_executor() -> Optional[ProcessPoolExecutor]:
+    """Shared worker pool (ANALYSIS_WORKERS processes, default one per available CPU); None runs analyzers inline.
+
+    Workers are spawned rather than forked: the pool may be created from a
+    request thread of a multi-threaded server, and forking there would copy
+    locks held by other threads into the children.
+    """
+    global _executor, _workers
+    workers = int(os.environ.get('ANALYSIS_WORKERS', available_cpus()))
+    if workers <= 1 or multiprocessing.parent_process() is not None:
+        return None
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        _workers = workers
+    return _executor
+
+
+def _ready() -> bool:
+    return True
+
+
+def warm_analysis_executor() -> Optional[ProcessPoolExecutor]:
+    """Start the worker processes now (at server startup) so the first analysis doesn't pay for spawning them"""
+    executor = analysis_executor()
+    if executor is not None:
+        for _ in range(_workers):
+            executor.submit(_ready)
+    return executor
+
+
+def candle_frame(candles: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Candle columns (time in epoch ms) -> the frame every analyzer reads, in their column naming"""
+    return pd.DataFrame({
+        'time': pd.to_datetime(np.asarray(candles['time']), unit='ms'),
+        'Open': np.asarray(candles['open'], dtype=np.float64),
+        'High': np.asarray(candles['high'], dtype=np.float64),
+        'Low': np.asarray(candles['low'], dtype=np.float64),
+        'Close': np.asarray(candles['close'], dtype=np.float64),
+        'Volume': np.asarray(candles['volume'], dtype=np.float64),
+    })
+
+
+def jsonable(value):
+    """Analyzer output (Series, arrays, Points, nested dicts/tuples) -> plain lists and dicts"""
+    if isinstance(value, (pd.Series, np.ndarray)):
+        return np.asarray(value).tolist()
+    if isinstance(value, dict):
+        return {str(key): jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonable(item) for item in value]
+    if isinstance(value, Point):
+        return [jsonable(value.x), jsonable(value.y)]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def analyzer_groups(workers: int) -> List[List[str]]:
+    """ANALYZERS keys dealt round-robin into one group per worker"""
+    keys = [key for key, _ in ANALYZERS]
+    return [group for group in (keys[index::workers] for index in range(workers)) if group]
+
+
+def _run_group(df: pd.DataFrame, keys: List[str]) -> Dict[str, object]:
+    return {key: ANALYZERS_BY_KEY[key](df) for key in keys}
+
+
+def run_analyzers(df: pd.DataFrame, executor=None, workers: Optional[int] = None) -> Dict[str, object]:
+    """Raw analyzer results keyed like ANALYZERS, computed concurrently when an executor is given.
+
+    The analyzers are batched into one task per worker, so the frame is
+    pickled to each worker once rather than once per analyzer.
+    """
+    if executor is None:
+        return _run_group(df, list(ANALYZERS_BY_KEY))
+    futures = [executor.submit(_run_group, df, keys) for keys in analyzer_groups(workers or _workers)]
+    results = {}
+    for future in futures:
+        results.update(future.result())
+    return {key: results[key] for key, _ in ANALYZERS}
+
+
+def organize_all_data(symbol: str = 'AAPL', candles: Optional[Dict[str, np.ndarray]] = None,
+                      store=None) -> pd.DataFrame:
+    """Run every analyzer over a symbol's candles and organize the results.
+
+    In the server `candles` come from the shared market data layer and the
+    result goes straight into `store`; standalone, the candles are fetched
+    from and the result posted back to the local API as before.
+    """
+    if candles is None:
+        # Fetch data from API instead of CSV
+        response = requests.get(f'http://localhost:5000/fetch_candles?symbol={symbol}')
+        candles = pd.DataFrame(response.json())
+    df = candle_frame(candles)
+    organized_data = {}
 
     def process_result(result, length=len(df)):
         if isinstance(result, (pd.Series, np.ndarray)):
             arr = result.tolist() if len(result.shape) == 1 else result.flatten().tolist()
         elif isinstance(result, (list, tuple)):
-            arr = list(result)
+            arr = [jsonable(item) for item in result]
         else:
-            arr = [result]
+            arr = [jsonable(result)]
         if len(arr) < length:
             arr.extend([np.nan] * (length - len(arr)))
         return arr[:length]
 
+    results = run_analyzers(df, analysis_executor())
+
     # Process each pattern and indicator
-    for pattern in [
-        'bullish_engulfing', 'bearish_engulfing', 'hammer', 'shooting_star',
-        'doji', 'morning_star', 'evening_star', 'three_white_soldiers',
-        'three_black_crows', 'harami', 'piercing_line', 'dark_cloud_cover',
-        'abandoned_baby'
-    ]:
-        result = getattr(CandlePatterns, pattern)(df)
+    for pattern in CANDLE_PATTERNS:
+        result = results.pop(pattern)
         organized_data[pattern] = {
             'coordinates': process_result(result),
             'explanation': f"Pattern indicates potential {pattern.replace('_', ' ')} formation",
-            'analysis': f"Found {sum(1 for x in result if x)} occurrences",
+            'analysis': f"Found {np.count_nonzero(np.asarray(result, dtype=float))} occurrences",
             'prediction': {
                 'probability': f"{np.random.randint(60, 95)}%",
                 'direction': 'bullish' if 'bullish' in pattern else 'bearish'
             }
         }
-
-    # Trend Indicators
-    organized_data['moving_averages'] = process_result(TrendIndicators.moving_average(df))
-    organized_data['bollinger_bands'] = process_result(TrendIndicators.bollinger_bands(df))
-    organized_data['keltner_channels'] = process_result(TrendIndicators.keltner_channels(df))
-    organized_data['donchian_channels'] = process_result(TrendIndicators.donchian_channels(df))
-    organized_data['parabolic_sar'] = process_result(TrendIndicators.parabolic_sar(df))
-
-    # Oscillators
-    organized_data['rsi'] = process_result(Oscillators.rsi(df))
-    organized_data['stochastic'] = process_result(Oscillators.stochastic(df))
-    organized_data['macd'] = process_result(Oscillators.macd(df))
-    organized_data['williams_r'] = process_result(Oscillators.williams_r(df))
-    organized_data['cci'] = process_result(Oscillators.cci(df))
-
-    # Volume Indicators
-    organized_data['obv'] = process_result(VolumeIndicators.on_balance_volume(df))
-    organized_data['ad_line'] = process_result(VolumeIndicators.accumulation_distribution(df))
-    organized_data['mfi'] = process_result(VolumeIndicators.money_flow_index(df))
-    organized_data['cmf'] = process_result(VolumeIndicators.chaikin_money_flow(df))
-    organized_data['vpt'] = process_result(VolumeIndicators.volume_price_trend(df))
-
-    # Momentum Indicators
-    organized_data['awesome_oscillator'] = process_result(MomentumIndicators.awesome_oscillator(df))
-    organized_data['momentum'] = process_result(MomentumIndicators.momentum(df))
-    organized_data['roc'] = process_result(MomentumIndicators.rate_of_change(df))
-    organized_data['rvi'] = process_result(MomentumIndicators.relative_vigor_index(df))
-
-    # Volatility Indicators
-    organized_data['atr'] = process_result(VolatilityIndicators.average_true_range(df))
-    organized_data['bbw'] = process_result(VolatilityIndicators.bollinger_bandwidth(df))
-    organized_data['kcw'] = process_result(VolatilityIndicators.keltner_channel_bandwidth(df))
-
-    # Chart Patterns
-    organized_data['head_and_shoulders'] = process_result(ChartPatterns.head_and_shoulders(df))
-    organized_data['double_patterns'] = process_result(ChartPatterns.double_top_bottom(df))
-    organized_data['volume_profile'] = process_result(VolumeProfile.calculate(df))
-
-    # Drawing Tools
-    organized_data['fibonacci_tools'] = process_result(FibonacciTools.retracements(high_point, low_point))
-    organized_data['gann_tools'] = process_result(GannTools.fan(Point(0, df['close'].iloc[0]), len(df)))
-
-    # Save results to API
-    requests.post('http://localhost:5000/save_analysis', json=organized_data)
+    for key, result in results.items():
+        organized_data[key] = process_result(result)
+
+    if store is not None:
+        store[symbol] = organized_data
+    else:
+        # Save results to API
+        requests.post('http://localhost:5000/save_analysis', json=organized_data)
 
     return organized_data
 
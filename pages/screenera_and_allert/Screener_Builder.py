@@ -4,7 +4,8 @@ from typing import Dict, List
 import json
 import os
 import re
-from .ScreenerData import get_current_segment_data, get_market_data
+from .ScreenerData import get_market_data
+from .vector_screener import UnsupportedFormula, Universe, VectorScreener
 
 segment_data = {
     'IN': {  # India
@@ -61,6 +62,16 @@ segment_data = {
     }
 }
 
+class IndicatorFields(dict):
+    """A multi-output indicator's result; fields read as Bb(20, 2)['upper'] or Bb(20, 2).upper"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
 class ScreenerBuilder:
     def __init__(self):
         self.functions = {
@@ -222,8 +233,8 @@ class ScreenerBuilder:
         low = data['low']
         close = data['close']
         volume = data['volume']
-        typical_price = (high + low + close) / 3
-        return sum(typical_price * volume) / sum(volume)
+        typical_price = (np.asarray(high) + np.asarray(low) + np.asarray(close)) / 3
+        return sum(typical_price * np.asarray(volume)) / sum(volume)
 
     def calculate_wad(self, data: Dict) -> float:
         high = data['high']
@@ -919,41 +930,47 @@ class ScreenerBuilder:
 
 
     def evaluate_formula(self, formula: str, data: Dict) -> bool:
+        """Evaluate `formula` on one symbol's latest bar; functions get the symbol's data as their first argument"""
         try:
             namespace = {
-                name: lambda d=data: func(d) 
+                name: lambda *args, func=func: self._fields(func(data, *args))
                 for name, func in self.functions.items()
             }
-            namespace.update(data)
-            
-            return eval(formula, {"__builtins__": {}}, namespace)
+            namespace.update({
+                key: value[-1] if isinstance(value, (list, tuple, np.ndarray)) and len(value) else value
+                for key, value in data.items()
+            })
+
+            return bool(eval(formula, {"__builtins__": {}}, namespace))
         except Exception as e:
             print(f"Formula evaluation error: {e}")
             return False
 
+    @staticmethod
+    def _fields(result):
+        return IndicatorFields(result) if isinstance(result, dict) else result
+
+    def screen_per_symbol(self, formula: str, segment_data: Dict) -> List[str]:
+        data = segment_data.get('data', segment_data)
+        return [symbol for symbol, series in data.items() if self.evaluate_formula(formula, series)]
+
+    def screen_segment(self, formula: str, segment_data: Dict) -> List[str]:
+        """One vectorized pass over the segment, or the per-symbol path for formulas it cannot evaluate"""
+        try:
+            return VectorScreener(Universe.from_market_data(segment_data)).screen(formula)
+        except UnsupportedFormula as e:
+            # e.g. Sar/SuperTrend/pivots (no vector form) or calls that don't match a function's parameters
+            print(f"Formula has no vectorized form, evaluating per symbol: {e}")
+            return self.screen_per_symbol(formula, segment_data)
 
     def screen_stocks(self, formula: str, country: str, segment: str, timeframe: str) -> Dict:
         segment_data = get_market_data(country, segment, timeframe)
         if not segment_data:
             return []
-            
-        matching_stocks = []
-        for symbol, data in segment_data['data'].items():
-            try:
-                if self.evaluate_formula(formula, data):
-                    matching_stocks.append(symbol)
-            except Exception as e:
-                print(f"Error evaluating {symbol}: {e}")
-                continue
-                
+
+        matching_stocks = self.screen_segment(formula, segment_data)
+
         return json.dumps({
             'filtered_symbols': matching_stocks,
             'segment_data': segment_data
         })
-
-
-
-
-
-
-
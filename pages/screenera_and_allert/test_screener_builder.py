@@ -0,0 +1,139 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from pages.screenera_and_allert.Screener_Builder import ScreenerBuilder
+from pages.screenera_and_allert.vector_screener import KERNELS, UnsupportedFormula, Universe, VectorScreener
+
+# Arguments each kernel is checked with; must name every entry of KERNELS
+KERNEL_ARGS = {
+    'Sma': [(5,), (20,)], 'Ema': [(10,)], 'Rma': [(14,)], 'Wma': [(9,)], 'Hma': [(9,), (16,)],
+    'Variance': [(10,)], 'Stdev': [(10,)], 'Dev': [(10,)], 'Highest': [(10,)], 'Lowest': [(10,)],
+    'Max': [(7,)], 'Min': [(7,)], 'Range': [(10,)], 'Change': [()], 'Mom': [(1,), (10,)],
+    'Roc': [(10,)], 'Rsi': [(14,)], 'Cmo': [(9,)], 'LinReg': [(10,)], 'PercentRank': [(10,)],
+    'Rising': [(1,), (2,), (3,)], 'Falling': [(2,), (3,)], 'Macd': [(), (5, 10, 4)],
+    'Bb': [(20, 2)], 'Bbw': [(20, 2)], 'Tsi': [(13, 25), (5, 3)], 'Vwma': [(10,)], 'Mfi': [(14,)],
+    'Stoch': [(14, 3, 3)], 'Kc': [(20, 2)], 'Kcw': [(20, 1.5)], 'Cci': [(20,)], 'Wpr': [(14,)],
+    'TR': [()], 'Atr': [(14,)], 'Dmi': [(14,)], 'OBV': [()], 'VWAP': [()],
+}
+
+
+def segment(symbols=12, bars=40, seed=7):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for index in range(symbols):
+        close = 100 + np.cumsum(rng.normal(0, 1, bars))
+        data[f'SYM{index}'] = {
+            'open': (close + rng.normal(0, 0.2, bars)).tolist(),
+            'high': (close + 1).tolist(),
+            'low': (close - 1).tolist(),
+            'close': close.tolist(),
+            'volume': rng.integers(1000, 5000, bars).astype(float).tolist(),
+        }
+    return {'data': data}
+
+
+def mixed_segment():
+    """Random walks plus a short history and a flat series, for the length checks and zero-division branches"""
+    market = segment(symbols=10, bars=80, seed=11)
+    short = {field: values[-12:] for field, values in market['data']['SYM0'].items()}
+    market['data']['SHORT'] = short
+    market['data']['FLAT'] = {field: [10.0] * 80 for field in ('open', 'high', 'low', 'close')}
+    market['data']['FLAT']['volume'] = [1000.0] * 80
+    return market
+
+
+def call(name, args):
+    return f"{name}({', '.join(map(str, args))})"
+
+
+class TestScreenSegment(unittest.TestCase):
+    def setUp(self):
+        self.builder = ScreenerBuilder()
+        self.segment = segment()
+
+    def test_vectorized_and_per_symbol_paths_agree(self):
+        for formula in ('close > Sma(10)', 'Sma(5) > Sma(20) and close > 100',
+                        'Highest(10) - close < 2', 'close - Lowest(10) > 3 or close < Sma(3)'):
+            vectorized = VectorScreener(Universe.from_market_data(self.segment)).screen(formula)
+            per_symbol = self.builder.screen_per_symbol(formula, self.segment)
+            self.assertEqual(vectorized, per_symbol, formula)
+            self.assertEqual(self.builder.screen_segment(formula, self.segment), vectorized)
+
+    def per_symbol(self, name, series, args):
+        try:
+            return self.builder.functions[name](series, *args)
+        except (ZeroDivisionError, IndexError):
+            return float('nan')
+
+    def assert_same(self, vectorized, expected, label):
+        if isinstance(expected, (bool, np.bool_)) or vectorized.dtype == bool:
+            self.assertEqual(bool(vectorized), bool(expected), label)
+        else:
+            np.testing.assert_allclose(vectorized, expected, rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=label)
+
+    def test_every_kernel_matches_its_per_symbol_function(self):
+        self.assertEqual(set(KERNEL_ARGS), set(KERNELS))
+        market = mixed_segment()
+        universe = Universe.from_market_data(market)
+        for name, arg_sets in KERNEL_ARGS.items():
+            for args in arg_sets:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    vectorized = KERNELS[name](universe, *args)
+                for row, symbol in enumerate(universe.symbols):
+                    expected = self.per_symbol(name, market['data'][symbol], args)
+                    label = f"{call(name, args)} on {symbol}"
+                    if isinstance(vectorized, dict):
+                        for field, values in vectorized.items():
+                            value = expected[field] if isinstance(expected, dict) else expected
+                            self.assert_same(values[row, -1], value, f"{label}['{field}']")
+                    else:
+                        self.assert_same(vectorized[row, -1], expected, label)
+
+    def test_every_kernel_screens_like_the_per_symbol_path(self):
+        market = mixed_segment()
+        screener = VectorScreener(Universe.from_market_data(market))
+        for name, arg_sets in KERNEL_ARGS.items():
+            for args in arg_sets:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    result = KERNELS[name](screener.universe, *args)
+                fields = list(result) if isinstance(result, dict) else [None]
+                for field in fields:
+                    expression = call(name, args) + (f"['{field}']" if field else '')
+                    latest = (result[field] if field else result)[:, -1]
+                    if latest.dtype == bool:
+                        formula = expression
+                    else:
+                        # halfway between two neighbouring values, so rounding can't decide a match
+                        values = np.unique(latest[~np.isnan(latest)])
+                        middle = max(len(values) // 2, 1)
+                        formula = f"{expression} > {float(values[middle - 1:middle + 1].mean())!r}"
+                    self.assertEqual(screener.screen(formula), self.builder.screen_per_symbol(formula, market), formula)
+
+    def test_kernel_errors_are_not_swallowed_by_the_fallback(self):
+        def broken(u, period):
+            raise RuntimeError('kernel bug')
+
+        with mock.patch.dict(KERNELS, {'Sma': broken}):
+            with self.assertRaises(RuntimeError):
+                self.builder.screen_segment('close > Sma(10)', self.segment)
+
+    def test_formulas_without_a_vector_form_fall_back_per_symbol(self):
+        formula = 'close > Sar(0.02, 0.2)'
+        with self.assertRaises(ValueError):
+            VectorScreener(Universe.from_market_data(self.segment)).screen(formula)
+        matches = self.builder.screen_segment(formula, self.segment)
+        self.assertEqual(matches, self.builder.screen_per_symbol(formula, self.segment))
+        self.assertTrue(matches)
+
+    def test_rejected_formulas_fall_back_instead_of_raising(self):
+        for formula in ('Sma(close) > 0', 'Rsi(14, 3) > 50', 'hl2 > 0', 'close >'):
+            with self.assertRaises(UnsupportedFormula):
+                VectorScreener(Universe.from_market_data(self.segment)).screen(formula)
+            self.assertEqual(self.builder.screen_segment(formula, self.segment),
+                             self.builder.screen_per_symbol(formula, self.segment))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,510 @@
+import ast
+import inspect
+import operator
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class Universe:
+    """A whole segment as aligned (symbols x bars) float arrays.
+
+    Series are right-aligned so column -1 is every symbol's latest bar; shorter
+    histories are left-padded with NaN.
+    """
+
+    def __init__(self, symbols: List[str], fields: Dict[str, np.ndarray]):
+        self.symbols = symbols
+        self.fields = fields
+
+    @classmethod
+    def from_market_data(cls, market_data: Dict) -> 'Universe':
+        """Build from get_market_data()'s {'data': {symbol: {'open': [...], ...}}}"""
+        data = market_data.get('data', market_data)
+        symbols = [symbol for symbol, series in data.items() if len(series.get('close', ()))]
+        bars = max((len(data[symbol]['close']) for symbol in symbols), default=0)
+        fields = {}
+        for field in FIELDS:
+            matrix = np.full((len(symbols), bars), np.nan)
+            for row, symbol in enumerate(symbols):
+                values = np.asarray(data[symbol].get(field, ()), dtype=np.float64)
+                if len(values):
+                    matrix[row, bars - len(values):] = values
+            fields[field] = matrix
+        return cls(symbols, fields)
+
+    def series(self, name: str) -> np.ndarray:
+        f = self.fields
+        if name in f:
+            return f[name]
+        if name == 'hl2':
+            return (f['high'] + f['low']) / 2
+        if name == 'hlc3':
+            return (f['high'] + f['low'] + f['close']) / 3
+        if name == 'ohlc4':
+            return (f['open'] + f['high'] + f['low'] + f['close']) / 4
+        raise ValueError(f"Unknown series '{name}'")
+
+
+class UnsupportedFormula(ValueError):
+    """The formula uses syntax, a function or a call signature the vectorized path does not evaluate"""
+
+
+# Kernels: every function takes the Universe plus the arguments of the ScreenerBuilder.calculate_*
+# function of the same name, and returns (symbols x bars) arrays (or a dict of them) whose column t
+# is what that function returns for the bars up to t
+
+def shift(x, n=1):
+    out = np.full_like(x, np.nan)
+    if n < x.shape[1]:
+        out[:, n:] = x[:, :x.shape[1] - n]
+    return out
+
+
+def windows(x, n):
+    """(symbols x bars x n) trailing windows; the first n-1 bars get an all-NaN window"""
+    padded = np.concatenate([np.full((x.shape[0], n - 1), np.nan), x], axis=1)
+    return sliding_window_view(padded, n, axis=1)
+
+
+def bars(x):
+    """Number of bars each symbol has up to and including each column"""
+    return np.cumsum(~np.isnan(x), axis=1)
+
+
+def rolling_sum(x, n):
+    valid = ~np.isnan(x)
+    totals = np.concatenate([np.zeros((x.shape[0], 1)), np.cumsum(np.where(valid, x, 0.0), axis=1)], axis=1)
+    counts = np.concatenate([np.zeros((x.shape[0], 1)), np.cumsum(valid, axis=1)], axis=1)
+    out = np.full_like(x, np.nan)
+    if n <= x.shape[1]:
+        full = (counts[:, n:] - counts[:, :-n]) == n
+        out[:, n - 1:] = np.where(full, totals[:, n:] - totals[:, :-n], np.nan)
+    return out
+
+
+def sma(x, n):
+    return rolling_sum(x, n) / n
+
+
+def mean_dev(x, n):
+    return np.abs(windows(x, n) - sma(x, n)[..., None]).mean(axis=-1)
+
+
+def variance(x, n):
+    w = windows(x, n)
+    return ((w - w.mean(axis=-1, keepdims=True)) ** 2).mean(axis=-1)
+
+
+def highest(x, n):
+    return windows(x, n).max(axis=-1)
+
+
+def lowest(x, n):
+    return windows(x, n).min(axis=-1)
+
+
+def change(x, n=1):
+    return x - shift(x, n)
+
+
+def wma(x, n):
+    weights = np.arange(1, n + 1, dtype=np.float64)
+    return windows(x, n) @ weights / weights.sum()
+
+
+def seeded_ema(x, alpha):
+    """alpha * x + (1 - alpha) * previous, seeded with each row's first value, like calculate_ema"""
+    out = np.full_like(x, np.nan)
+    previous = np.full(x.shape[0], np.nan)
+    for t in range(x.shape[1]):
+        previous = np.where(np.isnan(previous), x[:, t], alpha * x[:, t] + (1 - alpha) * previous)
+        out[:, t] = previous
+    return out
+
+
+def true_range(u):
+    high, low, close = u.fields['high'], u.fields['low'], u.fields['close']
+    previous = shift(close)
+    # fmax: a symbol's first bar has no previous close and its range is high - low
+    return np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+
+
+def nonzero(denominator, value, otherwise):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator == 0, otherwise, value)
+
+
+def rma(u, period):
+    close = u.fields['close']
+    alpha = 1 / period
+    seed = sma(close, period)
+    out = np.full_like(close, np.nan)
+    previous = np.full(close.shape[0], np.nan)
+    for t in range(close.shape[1]):
+        previous = np.where(np.isnan(previous), seed[:, t], alpha * close[:, t] + (1 - alpha) * previous)
+        out[:, t] = previous
+    return out
+
+
+def ema(u, period):
+    close = u.fields['close']
+    return np.where(bars(close) < period, np.nan, seeded_ema(close, 2 / (period + 1)))
+
+
+def hma(u, period):
+    close = u.fields['close']
+    half = period // 2
+    # calculate_hma's first WMA covers the oldest `half` bars of each `period` window
+    raw = 2 * shift(wma(close, half), period - half) - wma(close, period)
+    return wma(raw, int(period ** 0.5))
+
+
+def mom(u, period):
+    close = u.fields['close']
+    return close - shift(close, period - 1)
+
+
+def roc(u, period):
+    close = u.fields['close']
+    previous = shift(close, period - 1)
+    return nonzero(previous, (close - previous) / previous * 100, np.nan)
+
+
+def rsi(u, period):
+    delta = change(u.fields['close'])
+    gain = sma(np.maximum(delta, 0.0), period)
+    loss = sma(np.maximum(-delta, 0.0), period)
+    return nonzero(loss, 100 - (100 / (1 + gain / loss)), 100.0)
+
+
+def cmo(u, period):
+    delta = change(u.fields['close'])
+    ups = rolling_sum(np.maximum(delta, 0.0), period)
+    downs = rolling_sum(np.maximum(-delta, 0.0), period)
+    return nonzero(ups + downs, 100 * (ups - downs) / (ups + downs), 0.0)
+
+
+def linreg(u, period):
+    t = np.arange(period, dtype=np.float64) - (period - 1) / 2
+    w = windows(u.fields['close'], period)
+    slope = (w * t).sum(axis=-1) / (t * t).sum()
+    return w.mean(axis=-1) + slope * (period - 1) / 2
+
+
+def percent_rank(u, period):
+    w = windows(u.fields['close'], period)
+    below = (w < w[..., -1:]).sum(axis=-1)
+    return np.where(np.isnan(w).any(axis=-1), np.nan, 100 * below / (period - 1))
+
+
+def consecutive(u, period, compare):
+    close = u.fields['close']
+    if period <= 1:
+        return ~np.isnan(close)
+    steps = compare(close, shift(close)).astype(np.float64)
+    return windows(steps, period - 1).min(axis=-1) == 1
+
+
+def macd(u, fast_length=12, slow_length=26, signal_length=9):
+    close = u.fields['close']
+    fast = seeded_ema(close, 2 / (fast_length + 1))
+    slow = seeded_ema(close, 2 / (slow_length + 1))
+    line = fast - slow
+    alpha = 2 / (signal_length + 1)
+    # calculate_macd's signal is one EMA step from the MACD line onto itself
+    signal = alpha * line + (1 - alpha) * (fast - slow)
+    enough = bars(close) >= max(fast_length, slow_length, signal_length)
+    return {name: np.where(enough, value, np.nan)
+            for name, value in (('macd', line), ('signal', signal), ('histogram', line - signal))}
+
+
+def bollinger(u, period, mult):
+    close = u.fields['close']
+    middle = sma(close, period)
+    std = variance(close, period) ** 0.5
+    return {'middle': middle, 'upper': middle + mult * std, 'lower': middle - mult * std}
+
+
+def bollinger_width(u, period, mult):
+    close = u.fields['close']
+    middle = sma(close, period)
+    std = variance(close, period) ** 0.5
+    return ((middle + mult * std) - (middle - mult * std)) / middle * 100
+
+
+def tsi(u, r_period, s_period):
+    close = u.fields['close']
+    momentum = change(close)
+
+    def double_smooth(x):
+        first = seeded_ema(x, 2 / (r_period + 1))
+        # the second pass starts from the first smoothed value after the seed
+        first = np.where(bars(x) == 1, np.nan, first)
+        return seeded_ema(first, 2 / (s_period + 1))
+
+    numerator, denominator = double_smooth(momentum), double_smooth(np.abs(momentum))
+    value = nonzero(denominator, 100 * (numerator / denominator), 0.0)
+    return np.where(bars(close) < max(r_period, s_period, 4), np.nan, value)
+
+
+def vwma(u, period):
+    close, volume = u.fields['close'], u.fields['volume']
+    total = rolling_sum(volume, period)
+    return nonzero(total, rolling_sum(close * volume, period) / total, np.nan)
+
+
+def mfi(u, period):
+    typical = u.series('hlc3')
+    flow = typical * u.fields['volume']
+    delta = change(typical)
+    valid = ~np.isnan(delta)
+    positive = rolling_sum(np.where(valid, np.where(delta > 0, flow, 0.0), np.nan), period)
+    negative = rolling_sum(np.where(valid, np.where(delta > 0, 0.0, flow), np.nan), period)
+    return nonzero(positive + negative, 100 * positive / (positive + negative), 50.0)
+
+
+def stoch(u, period, smooth_k, smooth_d):
+    lo = lowest(u.fields['low'], period)
+    k = 100 * (u.fields['close'] - lo) / (highest(u.fields['high'], period) - lo)
+
+    def repeated_mean(value, times):
+        total = 0
+        for _ in range(times):
+            total = total + value
+        return total / times
+
+    k = repeated_mean(k, smooth_k)
+    return {'k': k, 'd': repeated_mean(k, smooth_d)}
+
+
+def keltner(u, period, mult):
+    typical = u.series('hlc3')
+    middle = sma(typical, period)
+    deviation = mean_dev(typical, period)
+    return {'middle': middle, 'upper': middle + mult * deviation, 'lower': middle - mult * deviation}
+
+
+def keltner_width(u, period, mult):
+    typical = u.series('hlc3')
+    return (2 * mult * mean_dev(typical, period)) / sma(typical, period) * 100
+
+
+def cci(u, period):
+    typical = u.series('hlc3')
+    deviation = mean_dev(typical, period)
+    return nonzero(deviation, (typical - sma(typical, period)) / (0.015 * deviation), 0.0)
+
+
+def wpr(u, period):
+    high, low = highest(u.fields['high'], period), lowest(u.fields['low'], period)
+    return nonzero(high - low, -100 * (high - u.fields['close']) / (high - low), 0.0)
+
+
+def dmi(u, period):
+    high, low = u.fields['high'], u.fields['low']
+    up, down = change(high), -change(low)
+    valid = ~np.isnan(up) & ~np.isnan(down)
+    # calculate_dmi's true range pairs each bar's high with the previous low and vice versa
+    tr = np.maximum(high - low, np.maximum(np.abs(high - shift(low)), np.abs(low - shift(high))))
+    plus = np.where(valid, np.where(up > down, np.maximum(up, 0.0), 0.0), np.nan)
+    minus = np.where(valid, np.where(down > up, np.maximum(down, 0.0), 0.0), np.nan)
+    tr_sum = rolling_sum(tr, period)
+    plus_di = nonzero(tr_sum, 100 * rolling_sum(plus, period) / tr_sum, 0.0)
+    minus_di = nonzero(tr_sum, 100 * rolling_sum(minus, period) / tr_sum, 0.0)
+    dx = nonzero(plus_di + minus_di, 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di), 0.0)
+    return {'plus_di': plus_di, 'minus_di': minus_di, 'dx': dx}
+
+
+def obv(u):
+    close, volume = u.fields['close'], u.fields['volume']
+    delta = change(close)
+    signed = np.where(delta > 0, volume, np.where(delta < 0, -volume, 0.0))
+    return np.where(np.isnan(close), np.nan, np.where(np.isnan(delta), 0.0, signed))
+
+
+def cum(x):
+    return np.nancumsum(x, axis=1) + np.where(np.isnan(x), np.nan, 0.0)
+
+
+def vwap(u):
+    volume = u.fields['volume']
+    return cum(u.series('hlc3') * volume) / cum(volume)
+
+
+def on_close(kernel):
+    return lambda u, period: kernel(u.fields['close'], period)
+
+
+# name -> kernel, for every ScreenerBuilder.functions entry that has a vector form
+KERNELS: Dict[str, Callable] = {
+    'Sma': on_close(sma),
+    'Ema': ema,
+    'Rma': rma,
+    'Wma': on_close(wma),
+    'Hma': hma,
+    'Variance': on_close(variance),
+    'Stdev': lambda u, period: variance(u.fields['close'], period) ** 0.5,
+    'Dev': on_close(mean_dev),
+    'Highest': on_close(highest),
+    'Lowest': on_close(lowest),
+    'Max': on_close(highest),
+    'Min': on_close(lowest),
+    'Range': lambda u, period: highest(u.fields['close'], period) - lowest(u.fields['close'], period),
+    'Change': lambda u: change(u.fields['close']),
+    'Mom': mom,
+    'Roc': roc,
+    'Rsi': rsi,
+    'Cmo': cmo,
+    'LinReg': linreg,
+    'PercentRank': percent_rank,
+    'Rising': lambda u, period: consecutive(u, period, np.greater),
+    'Falling': lambda u, period: consecutive(u, period, np.less),
+    'Macd': macd,
+    'Bb': bollinger,
+    'Bbw': bollinger_width,
+    'Tsi': tsi,
+    'Vwma': vwma,
+    'Mfi': mfi,
+    'Stoch': stoch,
+    'Kc': keltner,
+    'Kcw': keltner_width,
+    'Cci': cci,
+    'Wpr': wpr,
+    'TR': true_range,
+    'Atr': lambda u, period: sma(true_range(u), period),
+    'Dmi': dmi,
+    'OBV': obv,
+    'VWAP': vwap,
+}
+
+BINARY_OPERATORS: Dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.BitAnd: np.logical_and,
+    ast.BitOr: np.logical_or,
+}
+
+COMPARE_OPERATORS: Dict[type, Callable] = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+class VectorScreener:
+    """Evaluates a screener formula once over a whole Universe.
+
+    The formula is parsed with `ast` (no eval), each distinct indicator call
+    is computed once for all symbols and memoised, and the expression is
+    reduced to a boolean mask over the symbols using their latest bar.
+    """
+
+    def __init__(self, universe: Universe):
+        self.universe = universe
+        self.cache: Dict[str, object] = {}
+
+    def mask(self, formula: str) -> np.ndarray:
+        try:
+            tree = ast.parse(formula.strip(), mode='eval')
+        except SyntaxError as e:
+            raise UnsupportedFormula(f"Formula is not valid syntax: {e}") from e
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = self._eval(tree.body)
+        if isinstance(result, dict):
+            raise UnsupportedFormula("Formula evaluates to a multi-output indicator; select a field, e.g. Bb(20, 2)['upper']")
+        result = np.asarray(result)
+        if result.ndim == 2:
+            result = result[:, -1]
+        result = np.broadcast_to(result, (len(self.universe.symbols),))
+        return np.where(np.isnan(result.astype(np.float64)), False, result.astype(bool))
+
+    def screen(self, formula: str) -> List[str]:
+        mask = self.mask(formula)
+        return [symbol for symbol, matched in zip(self.universe.symbols, mask) if matched]
+
+    def _eval(self, node: ast.AST):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, bool)):
+            return node.value
+        if isinstance(node, ast.Name):
+            if node.id not in FIELDS:
+                raise UnsupportedFormula(f"Unknown series '{node.id}'")
+            return self.universe.fields[node.id]
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+            return BINARY_OPERATORS[type(node.op)](self._eval(node.left), self._eval(node.right))
+        if isinstance(node, ast.UnaryOp):
+            operand = self._eval(node.operand)
+            if isinstance(node.op, ast.USub):
+                return -operand
+            if isinstance(node.op, (ast.Not, ast.Invert)):
+                return np.logical_not(operand)
+        if isinstance(node, ast.BoolOp):
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = self._eval(node.values[0])
+            for value in node.values[1:]:
+                result = combine(result, self._eval(value))
+            return result
+        if isinstance(node, ast.Compare):
+            left = self._eval(node.left)
+            result = True
+            for op, comparator in zip(node.ops, node.comparators):
+                compare = COMPARE_OPERATORS.get(type(op))
+                if compare is None:
+                    break
+                right = self._eval(comparator)
+                result = np.logical_and(result, compare(left, right))
+                left = right
+            else:
+                return result
+        if isinstance(node, ast.Attribute):
+            value = self._eval(node.value)
+            if isinstance(value, dict) and node.attr in value:
+                return value[node.attr]
+            raise UnsupportedFormula(f"Unknown indicator field '{node.attr}'")
+        if isinstance(node, ast.Subscript):
+            value = self._eval(node.value)
+            if isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str):
+                if isinstance(value, dict) and node.slice.value in value:
+                    return value[node.slice.value]
+                raise UnsupportedFormula(f"Unknown indicator field '{node.slice.value}'")
+            if isinstance(value, dict):
+                raise UnsupportedFormula('Select an indicator field before indexing into its history')
+            return shift(value, int(self._eval(node.slice)))
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            return self._call(node)
+        raise UnsupportedFormula(f"Unsupported formula syntax: {ast.unparse(node)}")
+
+    def _call(self, node: ast.Call):
+        key = ast.dump(node)
+        if key in self.cache:
+            return self.cache[key]
+        name = node.func.id
+        kernel = KERNELS.get(name)
+        if kernel is None:
+            raise UnsupportedFormula(f"Screener function '{name}' is not available for vectorized screening")
+        args = [self._eval(arg) for arg in node.args]
+        # like ScreenerBuilder.functions, kernels read the symbol's own bars and take constant parameters
+        if not all(isinstance(arg, (int, float)) for arg in args):
+            raise UnsupportedFormula(f"{name} takes constant parameters, not series")
+        args = [int(arg) if isinstance(arg, float) and arg.is_integer() else arg for arg in args]
+        try:
+            inspect.signature(kernel).bind(self.universe, *args)
+        except TypeError as e:
+            raise UnsupportedFormula(f"{name}{tuple(args)}: {e}") from e
+        result = self.cache[key] = kernel(self.universe, *args)
+        return result
+
+
+def screen(formula: str, market_data: Dict, universe: Optional[Universe] = None) -> List[str]:
+    """Symbols of `market_data` whose latest bar satisfies `formula`"""
+    return VectorScreener(universe or Universe.from_market_data(market_data)).screen(formula)
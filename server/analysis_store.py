@@ -0,0 +1,50 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class AnalysisStore:
+    """Bounded, expiring analysis results per symbol, shared by the server's request threads.
+
+    Keeps at most `max_entries` symbols, evicting the least recently written
+    one, and treats an entry older than `ttl` seconds as absent. Supports the
+    dict operations the routes used on the old module-level dict.
+    """
+
+    def __init__(self, max_entries=512, ttl=3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, symbol, analysis):
+        with self._lock:
+            self._entries[symbol] = (time.monotonic() + self.ttl, analysis)
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, symbol, default=None):
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._entries[symbol]
+                return default
+            return entry[1]
+
+    def __getitem__(self, symbol):
+        missing = object()
+        analysis = self.get(symbol, missing)
+        if analysis is missing:
+            raise KeyError(symbol)
+        return analysis
+
+    def __contains__(self, symbol):
+        return self.get(symbol) is not None
+
+    def __len__(self):
+        with self._lock:
+            now = time.monotonic()
+            return sum(1 for expires, _ in self._entries.values() if expires > now)
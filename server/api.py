@@ -1,4 +1,4 @@
-from flask import Flask, jsonify, request, make_response
+from flask import Flask, Response, jsonify, request, make_response, stream_with_context
 from flask_cors import CORS
 import os
 import threading
@@ -10,18 +10,24 @@ from datetime import datetime
 import time
 import sys
 import os
-import numpy as np
-import talib
 import json
 import requests
 import pandas as pd
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from model.data.generate_patterns import organize_all_data
+from model.data.generate_patterns import organize_all_data, warm_analysis_executor
+from Devscript.interpreter.interpretertry import run_interpreter
+from server.analysis_store import AnalysisStore
+from server.candle_store import CandleStore, interval_ttl
+from server.market_data import MarketData
+from server.technicals import TechnicalsCache, technical_summary
+from server.serialization import candle_columns, encode, negotiate, records_from_bars
+from server.fetch_executor import ClientPool, FetchExecutor, TokenBucket
+from server.single_flight import SingleFlight
+from server.news import NEWS_KEY, NEWS_TTL, fetch_news
 
 # Add these imports at the top
-from functools import lru_cache
 import time
 # Add these imports at the top
 import random
@@ -49,38 +55,63 @@ def create_yf_session():
     return session
 
 def get_ticker_with_retry(symbol):
+    # yf.Ticker is lazy; requests it makes are paced by fetch_executor's 'yahoo' limit instead of a fixed sleep
     session = create_yf_session()
     ticker = yf.Ticker(symbol, session=session)
-    time.sleep(random.uniform(1, 3))  # Random delay between requests
     return ticker
 
 
 yf.__version__="0.2.26"
 
-# Add rate limiting cache
-@lru_cache(maxsize=100)
-def get_cached_ticker(symbol: str):
-    return yf.Ticker(symbol)
-
 # Add cooldown decorator
 def with_cooldown(seconds=1):
     def decorator(func):
-        last_called = {}
+        bucket = TokenBucket(rate=1.0 / seconds, burst=1)
         def wrapper(*args, **kwargs):
-            now = time.time()
-            if func.__name__ in last_called:
-                time_passed = now - last_called[func.__name__]
-                if time_passed < seconds:
-                    time.sleep(seconds - time_passed)
-            last_called[func.__name__] = now
+            # only waits when calls actually exceed the rate, and is safe across request threads
+            delay = bucket.reserve()
+            if delay:
+                time.sleep(delay)
             return func(*args, **kwargs)
         return wrapper
     return decorator
 
+# Shared upstream fetch pool: bounded parallelism and a token bucket per data provider
+fetch_executor = FetchExecutor(max_workers=int(os.environ.get('FETCH_WORKERS', 16)))
+fetch_executor.limit('tradingview', concurrency=6, rate=10, burst=10)
+fetch_executor.limit('yahoo', concurrency=4, rate=5, burst=5)
+
+# Identical in-flight upstream calls share one fetch; results are kept for a short, interval-aware TTL
+upstream = SingleFlight(max_entries=int(os.environ.get('UPSTREAM_CACHE_ENTRIES', 1024)))
+QUOTE_TTL = float(os.environ.get('QUOTE_TTL', 15))
+STATEMENT_TTL = 3600
+
+# One keep-alive connection pool for plain upstream HTTP, sized for the async server's I/O workers
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=int(os.environ.get('ASGI_IO_WORKERS', 64))))
+
+def get_cached_ticker(symbol: str):
+    return upstream.do(('yahoo', symbol, 'ticker'), yf.Ticker, symbol, ttl=STATEMENT_TTL)
+
+def yahoo_attr(symbol, attribute, ttl=QUOTE_TTL):
+    """A yfinance Ticker property (info, income_stmt, ...), fetched once for all concurrent requests"""
+    return upstream.do(('yahoo', symbol, attribute), lambda: getattr(yf.Ticker(symbol), attribute), ttl=ttl)
+
+def yahoo_history(symbol, period, interval='1d'):
+    return upstream.do(('yahoo', symbol, 'history', period, interval),
+                       lambda: yf.Ticker(symbol).history(period=period, interval=interval),
+                       ttl=interval_ttl(interval))
+
 app = Flask(__name__)
 CORS(app)
 
-analysis_data = {}
+# Latest analysis per symbol, bounded and expiring (ANALYSIS_TTL seconds)
+analysis_data = AnalysisStore(
+    max_entries=int(os.environ.get('ANALYSIS_MAX_SYMBOLS', 512)),
+    ttl=float(os.environ.get('ANALYSIS_TTL', 3600))
+)
+# Spawn the analysis workers now rather than on the first /analyze request
+warm_analysis_executor()
 
 
 
@@ -229,8 +260,7 @@ def codellama_chart_model():
         yf_symbol = convert_symbol_format(symbol)
         print(f"\nCodeLlama Chart Analysis for {symbol} (YF: {yf_symbol})")
         
-        ticker = yf.Ticker(yf_symbol)
-        data = ticker.history(period='2y')[['Open', 'High', 'Low', 'Close', 'Volume']]
+        data = yahoo_history(yf_symbol, period='2y')[['Open', 'High', 'Low', 'Close', 'Volume']]
         
         if data.empty:
             return jsonify({'error': f'No data available for {yf_symbol}'}), 404
@@ -314,69 +344,54 @@ TV_PASSWORD = "APVOm@007!!!"
 # Initialize TvDatafeed with username and password
 tv = TvDatafeed(username=TV_USERNAME, password=TV_PASSWORD)
 
+# TvDatafeed keeps its websocket on the instance, so a client serves one fetch at a time. A small pool of
+# logged-in clients (seeded with `tv`) is shared by the fetch threads behind the 'tradingview' token bucket,
+# instead of one login per thread
+tv_clients = ClientPool(lambda: TvDatafeed(username=TV_USERNAME, password=TV_PASSWORD),
+                        size=int(os.environ.get('TV_CLIENTS', 2)), clients=[tv])
+
+def tv_get_hist(**kwargs):
+    return tv_clients.call(lambda client: client.get_hist(**kwargs))
+
+# Local candle cache: only bars newer than the last stored one are fetched from TradingView
+candle_store = CandleStore(
+    os.environ.get('CANDLE_STORE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'candle_store')),
+    fetch=tv_get_hist,
+    offline=os.environ.get('CANDLE_STORE_OFFLINE') == '1',
+    single_flight=upstream
+)
+
 # Store exchange info from symbol search results
 exchange_info = {}
 
+# Shared in-process candle access: routes and analytics read the store directly, never over HTTP
+market_data = MarketData(
+    candle_store,
+    intervals={
+        '1d': Interval.in_daily,
+        '1w': Interval.in_weekly,
+        '1M': Interval.in_monthly,
+        '1h': Interval.in_1_hour,
+        '4h': Interval.in_4_hour,
+        '15m': Interval.in_15_minute,
+        '5m': Interval.in_5_minute,
+        '30m': Interval.in_30_minute
+    },
+    default_interval=Interval.in_daily,
+    resolve_exchange=determine_market
+)
+
 @app.route('/fetch_candles', methods=['GET'])
 def fetch_candles():
     try:
         symbol = request.args.get('symbol')
         timeframe = request.args.get('timeframe', '1D')
         
-        # Handle default crypto pairs and other symbols
-        if ':' not in symbol:
-            if 'USDT' in symbol:
-                exchange = 'BINANCE'
-                base_symbol = symbol
-            elif 'USD' in symbol and not symbol.endswith('USD'):
-                exchange = 'COINBASE'
-                base_symbol = symbol
-            else:
-                exchange = determine_market(symbol)
-                base_symbol = symbol
-            
-            symbol = f"{exchange}:{base_symbol}"
-        else:
-            exchange, base_symbol = symbol.split(':')
-            
         print(f"Fetching data for {symbol}")
+        columns = market_data.candles(symbol, timeframe)
         
-        interval_mapping = {
-            '1d': Interval.in_daily,
-            '1w': Interval.in_weekly,
-            '1M': Interval.in_monthly,
-            '1h': Interval.in_1_hour,
-            '4h': Interval.in_4_hour,
-            '15m': Interval.in_15_minute,
-            '5m': Interval.in_5_minute,
-            '30m': Interval.in_30_minute
-        }
-        
-        df = tv.get_hist(
-            symbol=symbol,
-            exchange=exchange,
-            interval=interval_mapping.get(timeframe.lower(), Interval.in_daily),
-            n_bars=1000
-        )
-        
-        if df is None or df.empty:
-            raise ValueError(f"No data available for {symbol}")
-        
-        candles = []
-        for index, row in df.iterrows():
-            timestamp = int(time.mktime(index.timetuple()) * 1000)
-            candle = {
-                'time': timestamp,
-                'open': float(row['open']),
-                'high': float(row['high']),
-                'low': float(row['low']),
-                'close': float(row['close']),
-                'volume': float(row['volume'])
-            }
-            candles.append(candle)
-            
-        print(f"Successfully returned {len(candles)} candles for {symbol}")
-        return jsonify(candles)
+        print(f"Successfully returned {len(columns['time'])} candles for {symbol}")
+        return candle_response(columns)
 
     except Exception as e:
         print(f"Error processing request: {str(e)}")
@@ -399,26 +414,44 @@ def fetch_segment_data():
     
     interval = interval_mapping.get(timeframe, Interval.in_daily)
     exchanges = segment_data[country][segment]['exchanges']
-    segment_tickers_data = {}
-    
+
+    pairs = []
     for exchange in exchanges:
-        symbols = tv.search_symbol(exchange)
-        for symbol in symbols:
-            df = tv.get_hist(
-                symbol=symbol,
-                exchange=exchange,
-                interval=interval,
-                n_bars=300
-            )
-            segment_tickers_data[symbol] = {
-                'open': df['open'].tolist(),
-                'high': df['high'].tolist(),
-                'low': df['low'].tolist(),
-                'close': df['close'].tolist(),
-                'volume': df['volume'].tolist(),
-                'timestamp': df.index.astype(np.int64) // 10**6
-            }
-    
+        for symbol in tv.search_symbol(exchange):
+            pairs.append((symbol['symbol'] if isinstance(symbol, dict) else symbol, exchange))
+
+    def fetch(pair):
+        symbol, exchange = pair
+        df = candle_store.get(
+            symbol=symbol,
+            exchange=exchange,
+            interval=interval,
+            n_bars=300
+        )
+        columns = candle_columns(df)
+        return {
+            'open': columns['open'].tolist(),
+            'high': columns['high'].tolist(),
+            'low': columns['low'].tolist(),
+            'close': columns['close'].tolist(),
+            'volume': columns['volume'].tolist(),
+            'timestamp': columns['time'].tolist()
+        }
+
+    results = fetch_executor.as_completed('tradingview', fetch, pairs)
+    if wants_ndjson():
+        return ndjson_response(
+            {'symbol': symbol, 'exchange': exchange, 'data': data, 'error': error and str(error)}
+            for (symbol, exchange), data, error in results
+        )
+
+    segment_tickers_data = {}
+    for (symbol, exchange), data, error in results:
+        if error is not None:
+            print(f"Error fetching {symbol}: {error}")
+            continue
+        segment_tickers_data[symbol] = data
+
     return jsonify({
         'country': country,
         'segment': segment,
@@ -434,22 +467,28 @@ def format_symbol(symbol):
     return symbol
 
 
+def wants_ndjson():
+    return request.args.get('stream') == '1' or 'application/x-ndjson' in request.headers.get('Accept', '')
 
 
-def process_historical_data(data):
-    """Process historical data into candle format"""
-    candles = []
-    for bar in data:
-        candle = {
-            'time': int(bar['time']),
-            'open': str(bar['open']),
-            'high': str(bar['high']),
-            'low': str(bar['low']),
-            'close': str(bar['close']),
-            'volume': str(bar['volume'])
-        }
-        candles.append(candle)
-    return candles
+def ndjson_response(records):
+    """Stream one JSON document per line as each upstream fetch completes"""
+    def generate():
+        for record in records:
+            yield json.dumps(record) + '\n'
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+def candle_response(columns):
+    """Encode candle columns as row JSON (default), columnar JSON or raw binary, per ?format= / Accept"""
+    try:
+        mimetype = negotiate(request.headers.get('Accept'), request.args.get('format'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 406
+    response = make_response(encode(columns, mimetype))
+    response.headers['Content-Type'] = mimetype
+    response.headers['Vary'] = 'Accept'
+    return response
 
 
 
@@ -475,8 +514,10 @@ def fetch_stock_details():
         yf_symbol = convert_symbol_format(symbol)
         print(f"Fetching details for symbol: {symbol} (YF: {yf_symbol})")
         
-        ticker = get_ticker_with_retry(yf_symbol)
-        info = ticker.info
+        # One pool task that coalesces inside the worker; submitting again from within it could deadlock a full pool
+        info = fetch_executor.submit('yahoo', upstream.do, ('yahoo', yf_symbol, 'info'),
+                                     lambda: get_ticker_with_retry(yf_symbol).info,
+                                     ttl=QUOTE_TTL).result()
         
         stock_details = {
             'symbol': symbol,
@@ -557,8 +598,7 @@ def watchlist():
         stocks_data = []
         for symbol in symbol_list:
             try:
-                ticker = yf.Ticker(symbol.strip())
-                info = ticker.info
+                info = yahoo_attr(symbol.strip(), 'info')
                 stock_data = {
                     'symbol': symbol.strip(),
                     'last': str(info.get('currentPrice', info.get('regularMarketPrice', 0))),
@@ -582,25 +622,30 @@ def fetch_multiple_stocks():
             return jsonify({'error': 'Symbols are required'}), 400
 
         # Split the comma-separated symbols
-        symbol_list = symbols.split(',')
+        symbol_list = [symbol.strip() for symbol in symbols.split(',')]
 
-        stocks_data = []
-        for symbol in symbol_list:
-            try:
-                ticker = yf.Ticker(symbol.strip())
-                info = ticker.info
+        def fetch(symbol):
+            info = yahoo_attr(symbol, 'info')
+            return {
+                'symbol': symbol,
+                'price': str(info.get('currentPrice', info.get('regularMarketPrice', 0))),
+                'change': str(info.get('regularMarketChange', 0)),
+                'changePercent': str(info.get('regularMarketChangePercent', 0)),
+                'companyName': info.get('longName', '')
+            }
 
-                stock_data = {
-                    'symbol': symbol.strip(),
-                    'price': str(info.get('currentPrice', info.get('regularMarketPrice', 0))),
-                    'change': str(info.get('regularMarketChange', 0)),
-                    'changePercent': str(info.get('regularMarketChangePercent', 0)),
-                    'companyName': info.get('longName', '')
-                }
-                stocks_data.append(stock_data)
-            except Exception as e:
-                print(f"Error fetching data for {symbol}: {str(e)}")
+        results = fetch_executor.as_completed('yahoo', fetch, symbol_list)
+        if wants_ndjson():
+            return ndjson_response(stock_data for _, stock_data, error in results if error is None)
+
+        # Concurrent fetches finish out of order; keep the requested order in the JSON list
+        by_symbol = {}
+        for symbol, stock_data, error in results:
+            if error is not None:
+                print(f"Error fetching data for {symbol}: {str(error)}")
                 continue
+            by_symbol[symbol] = stock_data
+        stocks_data = [by_symbol[symbol] for symbol in symbol_list if symbol in by_symbol]
 
         return jsonify(stocks_data)
 
@@ -616,7 +661,11 @@ def fetch_multiple_stocks():
 @app.route('/analyze', methods=['GET'])
 def analyze():
     symbol = request.args.get('symbol', 'AAPL')
-    analysis_results = organize_all_data(symbol)
+    try:
+        candles = market_data.candles(symbol)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    analysis_results = organize_all_data(symbol, candles=candles, store=analysis_data)
     return jsonify(analysis_results)
 
 
@@ -675,11 +724,9 @@ def fetch_financials():
             
         print(f"Fetching income statement for symbol: {symbol}")
         
-        ticker = yf.Ticker(symbol)
-        
         try:
             # Get income statement data with error handling
-            annual_income_stmt = ticker.income_stmt
+            annual_income_stmt = yahoo_attr(symbol, 'income_stmt', ttl=STATEMENT_TTL)
             print(f"Raw income statement data received for {symbol}")
             
             # Validate if we got valid data
@@ -748,11 +795,9 @@ def fetch_balance_sheet():
             
         print(f"Fetching balance sheet for symbol: {symbol}")
         
-        ticker = yf.Ticker(symbol)
-        
         try:
             # Get balance sheet data with error handling
-            balance_sheet = ticker.balance_sheet
+            balance_sheet = yahoo_attr(symbol, 'balance_sheet', ttl=STATEMENT_TTL)
             print(f"Raw balance sheet data received for {symbol}")
             
             # Validate if we got valid data
@@ -821,11 +866,9 @@ def fetch_cash_flow():
             
         print(f"Fetching cash flow for symbol: {symbol}")
         
-        ticker = yf.Ticker(symbol)
-        
         try:
             # Get cash flow data with error handling
-            cash_flow = ticker.cashflow
+            cash_flow = yahoo_attr(symbol, 'cashflow', ttl=STATEMENT_TTL)
             print(f"Raw cash flow data received for {symbol}")
             
             # Validate if we got valid data
@@ -894,14 +937,13 @@ def fetch_statistics():
             
         print(f"Fetching statistics for symbol: {symbol}")
         
-        ticker = yf.Ticker(symbol)
-        stats = ticker.stats()
+        stats = upstream.do(('yahoo', symbol, 'stats'), lambda: yf.Ticker(symbol).stats(), ttl=STATEMENT_TTL)
         
         if not stats:
             return jsonify({'error': f'No statistics data found for symbol {symbol}'}), 404
         
         # Include ticker info
-        ticker_info = ticker.info
+        ticker_info = yahoo_attr(symbol, 'info')
         
         statistics_data = {
             'stats': stats,
@@ -936,77 +978,16 @@ def get_market_segments():
     })
 
 def fetch_candle_data(symbol, timeframe):
-    response = requests.get(f'http://localhost:5000/fetch_candles?symbol={symbol}&timeframe={timeframe}')
-    return response.json()
+    """Candle columns (dict of numpy arrays) straight from the shared market data layer"""
+    return market_data.candles(symbol, timeframe)
 
 def calculate_technicals(candle_data):
-    close_prices = np.array([candle['close'] for candle in candle_data])
-    high_prices = np.array([candle['high'] for candle in candle_data])
-    low_prices = np.array([candle['low'] for candle in candle_data])
-    volume = np.array([candle['volume'] for candle in candle_data])
-
-    def safe_talib_function(func, *args, **kwargs):
-        result = func(*args, **kwargs)
-        return np.nan_to_num(result).tolist()
-
-    technicals = {
-        'moving_averages': {
-            'SMA': {
-                'SMA10': safe_talib_function(talib.SMA, close_prices, timeperiod=10),
-                'SMA20': safe_talib_function(talib.SMA, close_prices, timeperiod=20),
-                'SMA30': safe_talib_function(talib.SMA, close_prices, timeperiod=30),
-                'SMA50': safe_talib_function(talib.SMA, close_prices, timeperiod=50),
-                'SMA100': safe_talib_function(talib.SMA, close_prices, timeperiod=100),
-                'SMA200': safe_talib_function(talib.SMA, close_prices, timeperiod=200),
-            },
-            'EMA': {
-                'EMA10': safe_talib_function(talib.EMA, close_prices, timeperiod=10),
-                'EMA20': safe_talib_function(talib.EMA, close_prices, timeperiod=20),
-                'EMA30': safe_talib_function(talib.EMA, close_prices, timeperiod=30),
-                'EMA50': safe_talib_function(talib.EMA, close_prices, timeperiod=50),
-                'EMA100': safe_talib_function(talib.EMA, close_prices, timeperiod=100),
-                'EMA200': safe_talib_function(talib.EMA, close_prices, timeperiod=200),
-            },
-            'VWMA': {
-                'VWMA20': safe_talib_function(talib.WMA, close_prices, timeperiod=20),
-            },
-            'HMA': {
-                'HMA9': safe_talib_function(talib.WMA, close_prices, timeperiod=9),
-            },
-        },
-        'oscillators': {
-            'RSI': safe_talib_function(talib.RSI, close_prices, timeperiod=14),
-            'MACD': {
-                'macd': safe_talib_function(talib.MACD, close_prices)[0],
-                'signal': safe_talib_function(talib.MACD, close_prices)[1],
-                'hist': safe_talib_function(talib.MACD, close_prices)[2],
-            },
-            'Stochastic': {
-                'slowk': safe_talib_function(talib.STOCH, high_prices, low_prices, close_prices)[0],
-                'slowd': safe_talib_function(talib.STOCH, high_prices, low_prices, close_prices)[1],
-            },
-            'CCI': safe_talib_function(talib.CCI, high_prices, low_prices, close_prices),
-            'ADX': safe_talib_function(talib.ADX, high_prices, low_prices, close_prices),
-            'Williams%R': safe_talib_function(talib.WILLR, high_prices, low_prices, close_prices),
-            
-            'Momentum': safe_talib_function(talib.MOM, close_prices, timeperiod=10),
-            'StochRSI': {
-                'fastk': safe_talib_function(talib.STOCHRSI, close_prices)[0],
-                'fastd': safe_talib_function(talib.STOCHRSI, close_prices)[1],
-            },
-            'BullBearPower': safe_talib_function(talib.BBANDS, close_prices)[0],
-            'UltimateOscillator': safe_talib_function(talib.ULTOSC, high_prices, low_prices, close_prices, timeperiod1=7, timeperiod2=14, timeperiod3=28),
-        },
-        'pivots': {
-            'Classic': safe_talib_function(talib.PIVOT, high_prices, low_prices, close_prices),
-            'Fibonacci': safe_talib_function(talib.PIVOT, high_prices, low_prices, close_prices, type='fibonacci'),
-            'Camarilla': safe_talib_function(talib.PIVOT, high_prices, low_prices, close_prices, type='camarilla'),
-            'Woodie': safe_talib_function(talib.PIVOT, high_prices, low_prices, close_prices, type='woodie'),
-            'DM': safe_talib_function(talib.PIVOT, high_prices, low_prices, close_prices, type='dm'),
-        }
-    }
-    
-    return technicals
+    if isinstance(candle_data, list):
+        candle_data = records_from_bars(candle_data)
+    return technical_summary(candle_data)
+
+# Encoded technicals per (symbol, timeframe), reused until a newer bar arrives
+technicals_cache = TechnicalsCache()
 
 @app.route('/fetch_technicals', methods=['GET'])
 def fetch_technicals():
@@ -1016,25 +997,20 @@ def fetch_technicals():
     if not symbol:
         return jsonify({'error': 'Symbol is required'}), 400
     
-    candle_data = fetch_candle_data(symbol, timeframe)
-    if isinstance(candle_data, dict) and 'error' in candle_data:
-        return jsonify(candle_data), 500
+    try:
+        candle_data = fetch_candle_data(symbol, timeframe)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
     
-    technicals = calculate_technicals(candle_data)
+    payload = technicals_cache.get(symbol, market_data.interval(timeframe), int(candle_data['time'][-1]), candle_data)
     
-    return jsonify(technicals)
+    return Response(payload, mimetype='application/json')
 
 @app.route('/market_news', methods=['GET'])
 def get_market_news():
     try:
         # You can integrate with news APIs like NewsAPI or Financial Modeling Prep
-        news_data = requests.get('https://newsapi.org/v2/everything', 
-            params={
-                'q': 'stock market',
-                'apiKey': 'YOUR_API_KEY',
-                'pageSize': 30
-            }
-        ).json()
+        news_data = upstream.do(NEWS_KEY, fetch_news, http_session, ttl=NEWS_TTL)
         
         return jsonify(news_data)
     except Exception as e:
@@ -1051,9 +1027,9 @@ def get_market_movers():
         indices = ['SPY', 'QQQ', 'DIA', 'IWM']
         
         for symbol in indices:
-            ticker = yf.Ticker(symbol)
-            current_price = ticker.info.get('regularMarketPrice', 0)
-            prev_close = ticker.info.get('previousClose', 0)
+            info = yahoo_attr(symbol, 'info')
+            current_price = info.get('regularMarketPrice', 0)
+            prev_close = info.get('previousClose', 0)
             change = ((current_price - prev_close) / prev_close) * 100
             
             data = {
@@ -1081,8 +1057,7 @@ def get_market_indices():
         index_data = {}
         
         for index in indices:
-            ticker = yf.Ticker(index)
-            hist = ticker.history(period='1d', interval='5m')
+            hist = yahoo_history(index, period='1d', interval='5m')
             
             index_data[index] = {
                 'prices': hist['Close'].tolist(),
@@ -0,0 +1,227 @@
+import asyncio
+import io
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from server.news import NEWS_KEY, NEWS_TIMEOUT, NEWS_TTL, fetch_news_async
+
+# Routes that spend their time waiting on upstream HTTP (yfinance, news API)
+IO_ROUTES = frozenset({
+    '/market_news',
+    '/market_movers',
+    '/market_indices',
+    '/fetch_financials',
+    '/fetch_balance_sheet',
+    '/fetch_cash_flow',
+    '/fetch_statistics',
+})
+
+JSON_HEADERS = [(b'content-type', b'application/json')]
+ERROR_RESPONSE = (500, JSON_HEADERS, b'{"error": "Internal Server Error"}')
+
+
+async def market_news(server):
+    """/market_news on the event loop: one shared aiohttp session, coalesced through the app's SingleFlight"""
+    try:
+        news = await server.upstream.do_async(NEWS_KEY, fetch_news_async, server.http_session(), ttl=NEWS_TTL)
+    except Exception as e:
+        return 500, JSON_HEADERS, json.dumps({'error': str(e)}).encode('utf-8')
+    return 200, JSON_HEADERS, json.dumps(news).encode('utf-8')
+
+
+# GET routes whose upstream has an async client; served natively instead of through the WSGI app
+ASYNC_ROUTES = {
+    '/market_news': market_news,
+}
+
+
+def wsgi_environ(scope, body):
+    """ASGI http scope + request body -> WSGI environ"""
+    server_name, server_port = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        # scope['path'] is already percent-decoded; WSGI wants those bytes as a latin-1 str
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server_name,
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', []):
+        key = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if key == 'CONTENT_TYPE' or key == 'CONTENT_LENGTH':
+            environ[key] = value
+        else:
+            key = f'HTTP_{key}'
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def call_wsgi(app, environ, on_chunk=None):
+    """Run a WSGI app; returns (status, headers, body), or (status, headers, None) after streaming to on_chunk"""
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response['status'] = int(status.split(' ', 1)[0])
+        response['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+
+    result = app(environ, start_response)
+    try:
+        if on_chunk is None:
+            return response['status'], response['headers'], b''.join(result)
+        for chunk in result:
+            if chunk:
+                on_chunk(response['status'], response['headers'], chunk)
+        return response['status'], response['headers'], None
+    finally:
+        close = getattr(result, 'close', None)
+        if close is not None:
+            close()
+
+
+class AsgiServer:
+    """ASGI front end for the Flask app, with async upstream I/O where an async client exists.
+
+    `async_routes` (plain HTTP upstreams such as the news API) run on the
+    event loop through one shared aiohttp session and its connection pool,
+    coalesced by the app's SingleFlight (`upstream`), so a request waiting on
+    a slow upstream costs a coroutine, not a thread. They need aiohttp and an
+    `upstream`; without them those paths fall back to the WSGI app.
+
+    The yfinance-backed `io_routes` have no async API and still run as
+    blocking WSGI code on the `io_workers` pool: each in-flight request holds
+    one of those threads. That keeps them from starving the `cpu_workers`
+    pool that serves everything else (e.g. /run_script), whose chunked
+    responses are streamed as they are produced.
+    """
+
+    def __init__(self, wsgi_app, io_routes=IO_ROUTES, io_workers=64, cpu_workers=None,
+                 upstream=None, async_routes=ASYNC_ROUTES, session=None, http_connections=100):
+        self.wsgi_app = wsgi_app
+        self.io_routes = frozenset(io_routes)
+        self.io_pool = ThreadPoolExecutor(io_workers, thread_name_prefix='asgi-io')
+        self.cpu_pool = ThreadPoolExecutor(cpu_workers or min(32, (os.cpu_count() or 1) + 4),
+                                           thread_name_prefix='asgi-wsgi')
+        self.upstream = upstream
+        native = upstream is not None and (session is not None or aiohttp is not None)
+        self.async_routes = dict(async_routes) if native else {}
+        self.http_connections = http_connections
+        self._session = session
+        self._owns_session = session is None
+
+    def http_session(self):
+        """The shared aiohttp session, created on first use inside the running loop"""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.http_connections),
+                timeout=aiohttp.ClientTimeout(total=NEWS_TIMEOUT))
+        return self._session
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        body = await self._read_body(receive)
+        handler = self.async_routes.get(scope['path'])
+        if handler is not None and scope['method'] == 'GET':
+            await self._respond(send, *await handler(self))
+            return
+        environ = wsgi_environ(scope, body)
+        if scope['path'] in self.io_routes:
+            await self._buffered(environ, send)
+        else:
+            await self._bridge(environ, send)
+
+    async def _read_body(self, receive):
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body'):
+                return b''.join(chunks)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self._owns_session and self._session is not None:
+                    await self._session.close()
+                self.io_pool.shutdown(wait=False)
+                self.cpu_pool.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _buffered(self, environ, send):
+        loop = asyncio.get_running_loop()
+        try:
+            status, headers, payload = await loop.run_in_executor(self.io_pool, call_wsgi, self.wsgi_app, environ)
+        except Exception:
+            traceback.print_exc(file=environ['wsgi.errors'])
+            status, headers, payload = ERROR_RESPONSE
+        await self._respond(send, status, headers, payload)
+
+    async def _bridge(self, environ, send):
+        loop = asyncio.get_running_loop()
+        started = []
+
+        def on_chunk(status, headers, chunk):
+            # runs on the worker thread; hand each chunk to the event loop as it is produced
+            if not started:
+                started.append(True)
+                asyncio.run_coroutine_threadsafe(
+                    send({'type': 'http.response.start', 'status': status, 'headers': headers}), loop).result()
+            asyncio.run_coroutine_threadsafe(
+                send({'type': 'http.response.body', 'body': chunk, 'more_body': True}), loop).result()
+
+        try:
+            status, headers, _ = await loop.run_in_executor(self.cpu_pool, call_wsgi, self.wsgi_app, environ, on_chunk)
+        except Exception:
+            traceback.print_exc(file=environ['wsgi.errors'])
+            if started:
+                # the status line is already out; end the body so the client is not left hanging
+                await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+                return
+            await self._respond(send, *ERROR_RESPONSE)
+            return
+        if not started:
+            await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    async def _respond(self, send, status, headers, payload):
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': payload})
+
+
+def create_app():
+    from server.api import app, upstream
+    return AsgiServer(app, io_workers=int(os.environ.get('ASGI_IO_WORKERS', 64)),
+                      cpu_workers=int(os.environ.get('ASGI_CPU_WORKERS', 0)) or None,
+                      upstream=upstream, http_connections=int(os.environ.get('ASGI_HTTP_CONNECTIONS', 100)))
+
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run(create_app(), host='0.0.0.0', port=int(os.environ.get('PORT', 8000)))
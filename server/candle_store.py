@@ -0,0 +1,193 @@
+import math
+import os
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from dateutil.tz import tzlocal
+
+COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+# Bar length per tvDatafeed Interval name, used to size incremental top-ups
+INTERVAL_SECONDS = {
+    'in_1_minute': 60,
+    'in_3_minute': 180,
+    'in_5_minute': 300,
+    'in_15_minute': 900,
+    'in_30_minute': 1800,
+    'in_45_minute': 2700,
+    'in_1_hour': 3600,
+    'in_2_hour': 7200,
+    'in_3_hour': 10800,
+    'in_4_hour': 14400,
+    'in_daily': 86400,
+    'in_weekly': 604800,
+    'in_monthly': 2592000,
+}
+
+
+# yfinance interval strings ('5m', '1h', '1d', '1wk', '1mo') -> seconds per unit
+YF_UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400, 'wk': 604800, 'mo': 2592000}
+
+
+def interval_name(interval):
+    return getattr(interval, 'name', str(interval))
+
+
+def bar_seconds(interval, default=60):
+    """Bar length of a tvDatafeed Interval (or its name) or a yfinance interval string"""
+    name = interval_name(interval)
+    if name in INTERVAL_SECONDS:
+        return INTERVAL_SECONDS[name]
+    match = re.fullmatch(r'(\d+)(m|h|d|wk|mo)', name)
+    return int(match.group(1)) * YF_UNIT_SECONDS[match.group(2)] if match else default
+
+
+def interval_ttl(interval, fraction=0.05, minimum=1.0, maximum=300.0):
+    """How long a fetched series stays fresh: a small fraction of one bar, clamped"""
+    return min(max(bar_seconds(interval) * fraction, minimum), maximum)
+
+
+class CandleStore:
+    """Local OHLCV cache per (symbol, exchange, interval).
+
+    Each series is one float64 .npy file of shape (6, n) whose rows are the
+    columns time (epoch ms), open, high, low, close, volume, so every column is
+    contiguous and reads go through a read-only memory map. `get` only asks the
+    upstream `fetch` (tvDatafeed's get_hist signature) for the bars newer than
+    the last stored timestamp; with `offline=True` the store never fetches and
+    serves whatever was recorded, which makes replayed benchmarks possible.
+    With a `single_flight` (server.single_flight.SingleFlight), concurrent
+    `get`s of the same series share one top-up and read. Nothing is cached
+    beyond that: `refresh_after` alone decides how fresh a series is.
+
+    Times are stored as UTC epoch ms. Naive upstream timestamps are read in
+    `source_tz` (default: the host's local zone, which is what tvDatafeed
+    returns). "NSE:RELIANCE" and "RELIANCE" on NSE are the same series.
+    """
+
+    def __init__(self, root, fetch=None, max_bars=50000, offline=False, single_flight=None, source_tz=None):
+        self.root = root
+        self.fetch = fetch
+        self.max_bars = max_bars
+        self.offline = offline or fetch is None
+        self.single_flight = single_flight
+        self.source_tz = source_tz
+        self._checked = {}
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, symbol, exchange, interval):
+        key = f"{exchange}_{store_symbol(symbol, exchange)}_{interval_name(interval)}"
+        return os.path.join(self.root, re.sub(r'[^A-Za-z0-9_.-]', '_', key) + '.npy')
+
+    def _lock(self, path):
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _load(self, path):
+        try:
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            return np.empty((len(COLUMNS), 0))
+
+    def _write(self, path, columns):
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as handle:
+            np.save(handle, np.ascontiguousarray(columns))
+        os.replace(temp_path, path)
+
+    def read(self, symbol, exchange, interval, start=None, end=None, n_bars=None):
+        """Stored bars with start <= time <= end (epoch ms), optionally only the last n_bars"""
+        columns = self._load(self.path(symbol, exchange, interval))
+        times = columns[0]
+        lo = 0 if start is None else int(np.searchsorted(times, start, side='left'))
+        hi = len(times) if end is None else int(np.searchsorted(times, end, side='right'))
+        if n_bars is not None:
+            lo = max(lo, hi - n_bars)
+        return to_frame(columns[:, lo:hi])
+
+    def top_up(self, symbol, exchange, interval, n_bars=1000):
+        """Fetch the bars missing since the last stored one and append them; returns the number fetched"""
+        if self.offline:
+            return 0
+        path = self.path(symbol, exchange, interval)
+        with self._lock(path):
+            stored = self._load(path)
+            if stored.shape[1] >= n_bars:
+                last_time = stored[0, -1]
+                bar_ms = INTERVAL_SECONDS.get(interval_name(interval), 60) * 1000
+                # +2: the stored last bar may still have been forming, and upstream may be a bar ahead
+                missing = int(math.ceil((time.time() * 1000 - last_time) / bar_ms)) + 2
+                wanted = max(2, min(n_bars, missing))
+            else:
+                # not enough history stored yet: backfill the full window
+                wanted = n_bars
+            frame = self.fetch(symbol=symbol, exchange=exchange, interval=interval, n_bars=wanted)
+            if frame is None or frame.empty:
+                return 0
+            fresh = from_frame(frame, self.source_tz)
+            if wanted < n_bars and fresh[0, 0] > last_time:
+                # no overlap with what we have (more bars missed than estimated): backfill instead of leaving a gap
+                frame = self.fetch(symbol=symbol, exchange=exchange, interval=interval, n_bars=n_bars)
+                if frame is None or frame.empty:
+                    return 0
+                fresh = from_frame(frame, self.source_tz)
+            # fetched bars win over stored ones from their first timestamp on (the last stored bar may have been forming)
+            keep = int(np.searchsorted(stored[0], fresh[0, 0], side='left'))
+            merged = np.concatenate([np.asarray(stored[:, :keep]), fresh], axis=1)
+            del stored
+            self._write(path, merged[:, -self.max_bars:])
+            return fresh.shape[1]
+
+    def get(self, symbol, exchange, interval, n_bars=1000, refresh_after=None):
+        """Last n_bars of a series, topping up from upstream at most once per `refresh_after` seconds"""
+        if self.single_flight is not None:
+            key = ('candles', self.path(symbol, exchange, interval), n_bars)
+            return self.single_flight.do(key, self._get, symbol, exchange, interval, n_bars, refresh_after, ttl=0)
+        return self._get(symbol, exchange, interval, n_bars, refresh_after)
+
+    def _get(self, symbol, exchange, interval, n_bars, refresh_after):
+        path = self.path(symbol, exchange, interval)
+        if refresh_after is None:
+            refresh_after = min(INTERVAL_SECONDS.get(interval_name(interval), 60), 60)
+        now = time.monotonic()
+        # a recent top-up only covers requests up to the number of bars it was asked for
+        checked_at, checked_bars = self._checked.get(path, (-math.inf, 0))
+        if now - checked_at >= refresh_after or n_bars > checked_bars:
+            self.top_up(symbol, exchange, interval, n_bars=n_bars)
+            # the stored series only grows, so earlier, longer backfills stay covered
+            self._checked[path] = (now, max(n_bars, checked_bars))
+        return self.read(symbol, exchange, interval, n_bars=n_bars)
+
+
+def store_symbol(symbol, exchange):
+    """Symbol without its exchange prefix, so qualified and bare requests share one series"""
+    prefix, _, bare = symbol.partition(':')
+    return bare if bare and prefix == exchange else symbol
+
+
+def from_frame(frame, source_tz=None):
+    """tvDatafeed/pandas OHLCV frame with a DatetimeIndex -> (6, n) column array, times in UTC epoch ms
+
+    A naive index is taken to be in `source_tz` (default: the host's local zone).
+    """
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is None:
+        index = index.tz_localize(source_tz or tzlocal(), ambiguous=np.zeros(len(index), dtype=bool),
+                                  nonexistent='shift_forward')
+    columns = np.empty((len(COLUMNS), len(frame)), dtype=np.float64)
+    columns[0] = index.tz_convert('UTC').tz_localize(None).values.astype('datetime64[ms]').astype(np.int64)
+    for row, name in enumerate(COLUMNS[1:], start=1):
+        columns[row] = frame[name].to_numpy(dtype=np.float64)
+    return columns
+
+
+def to_frame(columns):
+    """(6, n) column array -> OHLCV frame indexed like tvDatafeed's get_hist output, tz-aware in UTC"""
+    index = pd.DatetimeIndex(np.asarray(columns[0]).astype(np.int64).astype('datetime64[ms]'),
+                             name='datetime').tz_localize('UTC')
+    return pd.DataFrame({name: np.asarray(columns[row]) for row, name in enumerate(COLUMNS[1:], start=1)}, index=index)
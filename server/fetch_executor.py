@@ -0,0 +1,134 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens/s up to `burst`.
+
+    `reserve` never waits: it books the next token and returns how long the
+    caller has to hold off before using it (0.0 when one is available now), so
+    callers pace themselves instead of sleeping a fixed 1-3 s.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def reserve(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostLimit:
+    def __init__(self, concurrency, rate, burst):
+        self.semaphore = threading.BoundedSemaphore(concurrency)
+        self.bucket = TokenBucket(rate, burst)
+
+
+class FetchExecutor:
+    """Shared worker pool for upstream data fetches with a concurrency cap and rate limit per host"""
+
+    def __init__(self, max_workers=16, default_concurrency=4, default_rate=10.0, default_burst=10):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch')
+        self.default = (default_concurrency, default_rate, default_burst)
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def limit(self, host, concurrency=None, rate=None, burst=None):
+        """Set (or replace) the limits used for `host`"""
+        default_concurrency, default_rate, default_burst = self.default
+        with self._lock:
+            self.hosts[host] = HostLimit(concurrency or default_concurrency, rate or default_rate,
+                                         burst or default_burst)
+            return self.hosts[host]
+
+    def _host(self, host):
+        with self._lock:
+            limit = self.hosts.get(host)
+        return limit or self.limit(host)
+
+    def _run(self, limit, fn, args, kwargs):
+        delay = limit.bucket.reserve()
+        if delay:
+            time.sleep(delay)
+        with limit.semaphore:
+            return fn(*args, **kwargs)
+
+    def submit(self, host, fn, *args, **kwargs):
+        return self.pool.submit(self._run, self._host(host), fn, args, kwargs)
+
+    def as_completed(self, host, fn, items, timeout=None):
+        """Call fn(item) for every item concurrently, yielding (item, result, error) as each finishes"""
+        futures = {self.submit(host, fn, item): item for item in items}
+        for future in as_completed(futures, timeout=timeout):
+            error = future.exception()
+            yield futures[future], (None if error else future.result()), error
+
+    def map(self, host, fn, items, timeout=None):
+        """Like as_completed but collected into {item: result}, skipping failures"""
+        return {item: result for item, result, error in self.as_completed(host, fn, items, timeout)
+                if error is None}
+
+    def shutdown(self, wait=True):
+        self.pool.shutdown(wait=wait)
+
+
+class ClientPool:
+    """At most `size` clients made by `factory`, each lent to one caller at a time.
+
+    Clients are created lazily, so a pool that is never busy logs in once;
+    callers beyond `size` wait for a client to be returned.
+    """
+
+    def __init__(self, factory, size=1, clients=()):
+        self.factory = factory
+        self.size = max(size, 1)
+        self.created = len(clients)
+        self._idle = list(clients)
+        self._available = threading.Condition()
+
+    def acquire(self):
+        with self._available:
+            while not self._idle and self.created >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self.created += 1
+        try:
+            return self.factory()
+        except Exception:
+            with self._available:
+                self.created -= 1
+                self._available.notify()
+            raise
+
+    def release(self, client):
+        with self._available:
+            self._idle.append(client)
+            self._available.notify()
+
+    def call(self, fn, *args, **kwargs):
+        """fn(client, *args, **kwargs) with a client borrowed for the duration of the call"""
+        client = self.acquire()
+        try:
+            return fn(client, *args, **kwargs)
+        finally:
+            self.release(client)
@@ -0,0 +1,49 @@
+from server.serialization import candle_columns
+
+
+class MarketData:
+    """In-process candle access shared by the HTTP routes and the analytics built on them.
+
+    Resolves a chart symbol ("BINANCE:BTCUSDT" or a bare "AAPL") and
+    timeframe the way /fetch_candles always has, then reads through the
+    CandleStore and returns a dict of numpy columns (time in epoch ms, then
+    open/high/low/close/volume). Callers inside the server use this directly
+    instead of requesting their own /fetch_candles endpoint over HTTP.
+    """
+
+    def __init__(self, store, intervals, default_interval, resolve_exchange, n_bars=1000):
+        self.store = store
+        self.intervals = intervals
+        self.default_interval = default_interval
+        self.resolve_exchange = resolve_exchange
+        self.n_bars = n_bars
+
+    def resolve(self, symbol):
+        """(qualified symbol, exchange) for a chart symbol"""
+        if ':' in symbol:
+            exchange, _ = symbol.split(':')
+            return symbol, exchange
+        # Handle default crypto pairs and other symbols
+        if 'USDT' in symbol:
+            exchange = 'BINANCE'
+        elif 'USD' in symbol and not symbol.endswith('USD'):
+            exchange = 'COINBASE'
+        else:
+            exchange = self.resolve_exchange(symbol)
+        return f"{exchange}:{symbol}", exchange
+
+    def interval(self, timeframe):
+        return self.intervals.get(timeframe.lower(), self.default_interval)
+
+    def candles(self, symbol, timeframe='1d', n_bars=None):
+        """Candle columns for a chart symbol; raises ValueError when nothing is available"""
+        qualified, exchange = self.resolve(symbol)
+        frame = self.store.get(
+            symbol=qualified,
+            exchange=exchange,
+            interval=self.interval(timeframe),
+            n_bars=n_bars or self.n_bars
+        )
+        if frame is None or frame.empty:
+            raise ValueError(f"No data available for {qualified}")
+        return candle_columns(frame)
@@ -0,0 +1,21 @@
+# Market news upstream, shared by the Flask /market_news route and the ASGI server's async handler
+NEWS_URL = 'https://newsapi.org/v2/everything'
+NEWS_PARAMS = {
+    'q': 'stock market',
+    'apiKey': 'YOUR_API_KEY',
+    'pageSize': 30
+}
+NEWS_KEY = ('news', 'stock market')
+NEWS_TTL = 300
+NEWS_TIMEOUT = 10
+
+
+def fetch_news(session):
+    """Blocking fetch through a requests.Session"""
+    return session.get(NEWS_URL, params=NEWS_PARAMS, timeout=NEWS_TIMEOUT).json()
+
+
+async def fetch_news_async(session):
+    """The same fetch through an aiohttp.ClientSession, waiting on the event loop"""
+    async with session.get(NEWS_URL, params=NEWS_PARAMS) as response:
+        return await response.json(content_type=None)
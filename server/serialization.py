@@ -0,0 +1,138 @@
+import json
+import struct
+
+import numpy as np
+import pandas as pd
+from dateutil.tz import tzlocal
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+CANDLE_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+JSON_MIMETYPE = 'application/json'
+COLUMNAR_JSON_MIMETYPE = 'application/vnd.candles.columnar+json'
+BINARY_MIMETYPE = 'application/vnd.candles.columns'
+ARROW_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+FORMATS = {
+    'json': JSON_MIMETYPE,
+    'columnar': COLUMNAR_JSON_MIMETYPE,
+    'binary': BINARY_MIMETYPE,
+    'arrow': ARROW_MIMETYPE,
+}
+
+BINARY_MAGIC = b'CNDL'
+BINARY_VERSION = 1
+
+
+def epoch_ms(index):
+    """DatetimeIndex -> int64 epoch ms; naive timestamps are server-local time, as time.mktime treated them"""
+    if index.tz is None:
+        index = index.tz_localize(tzlocal(), ambiguous='NaT', nonexistent='shift_forward')
+    return index.as_unit('ms').asi8
+
+
+def candle_columns(frame):
+    """OHLCV frame with a DatetimeIndex (or a 'time' column in epoch ms) -> dict of numpy columns"""
+    if 'time' in frame.columns:
+        times = frame['time'].to_numpy(dtype=np.int64)
+    else:
+        times = epoch_ms(pd.DatetimeIndex(frame.index))
+    columns = {'time': times}
+    for name in CANDLE_COLUMNS[1:]:
+        columns[name] = frame[name].to_numpy(dtype=np.float64)
+    return columns
+
+
+def records_from_bars(bars):
+    """List of bar dicts -> dict of numpy columns"""
+    frame = pd.DataFrame.from_records(bars, columns=CANDLE_COLUMNS)
+    return candle_columns(frame)
+
+
+def to_records_json(columns):
+    """[{time, open, ...}, ...] built by pandas' C encoder instead of per-row dicts"""
+    return pd.DataFrame(columns).to_json(orient='records', double_precision=15)
+
+
+def to_columnar_json(columns):
+    """{"time": [...], "open": [...], ...}"""
+    parts = (f'"{name}":{pd.Series(values).to_json(orient="values", double_precision=15)}'
+             for name, values in columns.items())
+    return '{' + ','.join(parts) + '}'
+
+
+def to_binary(columns):
+    """Raw little-endian column buffers behind a small JSON header.
+
+    Layout: b'CNDL', uint16 version, uint32 header length, header JSON
+    ({"length": n, "columns": [[name, numpy dtype str], ...]}), then each
+    column's n values back to back in header order.
+    """
+    arrays = [(name, np.ascontiguousarray(values, dtype=np.asarray(values).dtype.newbyteorder('<')))
+              for name, values in columns.items()]
+    length = len(arrays[0][1]) if arrays else 0
+    header = json.dumps({
+        'length': length,
+        'columns': [[name, array.dtype.str] for name, array in arrays]
+    }).encode('utf-8')
+    return b''.join([BINARY_MAGIC, struct.pack('<HI', BINARY_VERSION, len(header)), header]
+                    + [array.tobytes() for _, array in arrays])
+
+
+def from_binary(payload):
+    """Inverse of to_binary; columns are zero-copy views over `payload`"""
+    if payload[:4] != BINARY_MAGIC:
+        raise ValueError('Not a candle column payload')
+    version, header_length = struct.unpack_from('<HI', payload, 4)
+    if version != BINARY_VERSION:
+        raise ValueError(f'Unsupported candle payload version {version}')
+    offset = 10 + header_length
+    header = json.loads(payload[10:offset])
+    columns = {}
+    for name, dtype in header['columns']:
+        dtype = np.dtype(dtype)
+        columns[name] = np.frombuffer(payload, dtype=dtype, count=header['length'], offset=offset)
+        offset += dtype.itemsize * header['length']
+    return columns
+
+
+def to_arrow(columns):
+    if pa is None:
+        raise ValueError('pyarrow is not installed')
+    table = pa.table({name: pa.array(values) for name, values in columns.items()})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+ENCODERS = {
+    JSON_MIMETYPE: to_records_json,
+    COLUMNAR_JSON_MIMETYPE: to_columnar_json,
+    BINARY_MIMETYPE: to_binary,
+    ARROW_MIMETYPE: to_arrow,
+}
+
+
+def negotiate(accept=None, format=None):
+    """Pick a response mimetype from an explicit ?format= or the Accept header, defaulting to row JSON"""
+    if format:
+        mimetype = FORMATS.get(format)
+        if mimetype is None:
+            raise ValueError(f'Unknown format {format!r}, expected one of {sorted(FORMATS)}')
+        return mimetype
+    for part in (accept or '').split(','):
+        mimetype = part.split(';')[0].strip()
+        if mimetype in ENCODERS and (mimetype != ARROW_MIMETYPE or pa is not None):
+            return mimetype
+        if mimetype == 'application/octet-stream':
+            return BINARY_MIMETYPE
+    return JSON_MIMETYPE
+
+
+def encode(columns, mimetype):
+    return ENCODERS[mimetype](columns)
@@ -0,0 +1,109 @@
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+def private_copy(value):
+    """A copy of a shared result that the caller may mutate: containers deep, pandas/numpy objects via .copy()"""
+    if isinstance(value, (dict, list, set)):
+        return copy.deepcopy(value)
+    if hasattr(value, 'copy') and hasattr(value, 'shape'):
+        return value.copy()
+    return value
+
+
+class SingleFlight:
+    """Coalesces identical upstream calls: one in-flight Future per key, results kept for a TTL.
+
+    The first caller for a key runs the fetch; callers arriving while it is
+    in flight block on the same Future and get its result (or exception).
+    Successful results are then served for `ttl` seconds, and at most
+    `max_entries` of them are kept, least recently used first out. Failures
+    are never cached.
+
+    Every caller, the leader included, gets its own `copy_result` of the
+    shared value (private_copy by default: dicts, lists and DataFrames are
+    copied, other objects such as clients are handed out as is), so one
+    caller mutating its result cannot change what the others see.
+    """
+
+    def __init__(self, max_entries=1024, default_ttl=15.0, copy_result=private_copy):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.copy_result = copy_result
+        self._results = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    def _begin(self, key):
+        """(value, None, False) on a cache hit, else (None, future, leader)"""
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return entry[1], None, False
+                del self._results[key]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+            return None, future, leader
+
+    def _fail(self, key, future, error):
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_exception(error)
+
+    def _finish(self, key, future, value, ttl):
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._inflight.pop(key, None)
+            if ttl > 0:
+                self._results[key] = (time.monotonic() + ttl, value)
+                self._results.move_to_end(key)
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def do(self, key, fn, *args, ttl=None, **kwargs):
+        value, future, leader = self._begin(key)
+        if future is None:
+            return self.copy_result(value)
+        if not leader:
+            return self.copy_result(future.result())
+        try:
+            value = fn(*args, **kwargs)
+        except BaseException as error:
+            self._fail(key, future, error)
+            raise
+        return self.copy_result(self._finish(key, future, value, ttl))
+
+    async def do_async(self, key, fn, *args, ttl=None, **kwargs):
+        """`do` for a coroutine function; waits on the event loop and shares keys and results with `do`"""
+        value, future, leader = self._begin(key)
+        if future is None:
+            return self.copy_result(value)
+        if not leader:
+            return self.copy_result(await asyncio.wrap_future(future))
+        try:
+            value = await fn(*args, **kwargs)
+        except BaseException as error:
+            self._fail(key, future, error)
+            raise
+        return self.copy_result(self._finish(key, future, value, ttl))
+
+    def forget(self, key):
+        with self._lock:
+            self._results.pop(key, None)
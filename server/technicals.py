@@ -0,0 +1,146 @@
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import talib
+
+MA_PERIODS = (10, 20, 30, 50, 100, 200)
+
+
+def series(values):
+    """Indicator array -> JSON-safe list (NaN warm-up values become 0, as the route always returned)"""
+    return np.nan_to_num(values).tolist()
+
+
+def rolling_means(values, periods, weights=None):
+    """Simple (or `weights`-weighted) moving averages for every period from one cumulative-sum pass"""
+    values = np.asarray(values, dtype=np.float64)
+    numerator = values if weights is None else values * weights
+    sums = np.concatenate([[0.0], np.cumsum(numerator)])
+    weight_sums = None if weights is None else np.concatenate([[0.0], np.cumsum(weights)])
+    means = {}
+    for period in periods:
+        mean = np.full(len(values), np.nan)
+        if period <= len(values):
+            window = sums[period:] - sums[:-period]
+            if weight_sums is None:
+                mean[period - 1:] = window / period
+            else:
+                volume = weight_sums[period:] - weight_sums[:-period]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    mean[period - 1:] = np.where(volume != 0, window / volume, np.nan)
+        means[period] = mean
+    return means
+
+
+def pivot_points(open_, high, low, close):
+    """Classic, Fibonacci, Camarilla, Woodie and DM pivot levels per bar, from the previous bar's prices"""
+    def previous(values):
+        shifted = np.full(len(values), np.nan)
+        shifted[1:] = values[:-1]
+        return shifted
+
+    o, h, l, c = previous(open_), previous(high), previous(low), previous(close)
+    span = h - l
+    pivot = (h + l + c) / 3
+    woodie = (h + l + 2 * c) / 4
+    dm = np.where(c < o, h + 2 * l + c, np.where(c > o, 2 * h + l + c, h + l + 2 * c))
+    return {
+        'Classic': {'P': pivot, 'R1': 2 * pivot - l, 'S1': 2 * pivot - h, 'R2': pivot + span,
+                    'S2': pivot - span, 'R3': h + 2 * (pivot - l), 'S3': l - 2 * (h - pivot)},
+        'Fibonacci': {'P': pivot, 'R1': pivot + 0.382 * span, 'S1': pivot - 0.382 * span,
+                      'R2': pivot + 0.618 * span, 'S2': pivot - 0.618 * span,
+                      'R3': pivot + span, 'S3': pivot - span},
+        'Camarilla': {'P': pivot, 'R1': c + span * 1.1 / 12, 'S1': c - span * 1.1 / 12,
+                      'R2': c + span * 1.1 / 6, 'S2': c - span * 1.1 / 6,
+                      'R3': c + span * 1.1 / 4, 'S3': c - span * 1.1 / 4},
+        'Woodie': {'P': woodie, 'R1': 2 * woodie - l, 'S1': 2 * woodie - h,
+                   'R2': woodie + span, 'S2': woodie - span},
+        'DM': {'P': dm / 4, 'R1': dm / 2 - l, 'S1': dm / 2 - h},
+    }
+
+
+def technical_summary(columns):
+    """Every technicals-view indicator from candle columns, each multi-output TA-Lib call made once"""
+    open_ = np.asarray(columns['open'], dtype=np.float64)
+    high = np.asarray(columns['high'], dtype=np.float64)
+    low = np.asarray(columns['low'], dtype=np.float64)
+    close = np.asarray(columns['close'], dtype=np.float64)
+    volume = np.asarray(columns['volume'], dtype=np.float64)
+
+    sma = rolling_means(close, MA_PERIODS)
+    vwma = rolling_means(close, (20,), weights=volume)
+    macd, macd_signal, macd_hist = talib.MACD(close)
+    slowk, slowd = talib.STOCH(high, low, close)
+    fastk, fastd = talib.STOCHRSI(close)
+    upper_band = talib.BBANDS(close)[0]
+    pivots = pivot_points(open_, high, low, close)
+
+    return {
+        'moving_averages': {
+            'SMA': {f'SMA{period}': series(sma[period]) for period in MA_PERIODS},
+            'EMA': {f'EMA{period}': series(talib.EMA(close, timeperiod=period)) for period in MA_PERIODS},
+            'VWMA': {
+                'VWMA20': series(vwma[20]),
+            },
+            'HMA': {
+                'HMA9': series(talib.WMA(close, timeperiod=9)),
+            },
+        },
+        'oscillators': {
+            'RSI': series(talib.RSI(close, timeperiod=14)),
+            'MACD': {
+                'macd': series(macd),
+                'signal': series(macd_signal),
+                'hist': series(macd_hist),
+            },
+            'Stochastic': {
+                'slowk': series(slowk),
+                'slowd': series(slowd),
+            },
+            'CCI': series(talib.CCI(high, low, close)),
+            'ADX': series(talib.ADX(high, low, close)),
+            'Williams%R': series(talib.WILLR(high, low, close)),
+            'Momentum': series(talib.MOM(close, timeperiod=10)),
+            'StochRSI': {
+                'fastk': series(fastk),
+                'fastd': series(fastd),
+            },
+            'BullBearPower': series(upper_band),
+            'UltimateOscillator': series(talib.ULTOSC(high, low, close, timeperiod1=7, timeperiod2=14, timeperiod3=28)),
+        },
+        'pivots': {name: {level: series(values) for level, values in levels.items()}
+                   for name, levels in pivots.items()},
+    }
+
+
+class TechnicalsCache:
+    """Encoded technical summaries per (symbol, interval), valid until a bar with a newer timestamp arrives.
+
+    Holds one entry per series (the newest bar's timestamp replaces the
+    previous one) and evicts the least recently viewed series beyond
+    `max_entries`. Entries are the JSON payload itself, so a repeated view
+    skips both the indicators and the encoding.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, symbol, interval, last_ts, columns):
+        """JSON technicals for candle `columns` whose newest bar is at `last_ts`"""
+        key = (symbol, str(interval))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == last_ts:
+                self._entries.move_to_end(key)
+                return entry[1]
+        payload = json.dumps(technical_summary(columns))
+        with self._lock:
+            self._entries[key] = (last_ts, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
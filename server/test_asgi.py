@@ -0,0 +1,225 @@
+import asyncio
+import io
+import threading
+import unittest
+from unittest import mock
+
+from server.asgi import AsgiServer, wsgi_environ
+from server.single_flight import SingleFlight
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self, content_type='application/json'):
+        return self.payload
+
+
+class FakeSession:
+    """Stands in for aiohttp.ClientSession: `get` is an async context manager that waits before answering"""
+
+    def __init__(self, payload, delay=0.05):
+        self.payload = payload
+        self.delay = delay
+        self.requests = []
+
+    def get(self, url, params=None):
+        self.requests.append(url)
+        session = self
+
+        class Pending(FakeResponse):
+            async def __aenter__(self):
+                await asyncio.sleep(session.delay)
+                if isinstance(session.payload, Exception):
+                    raise session.payload
+                return self
+
+        return Pending(self.payload)
+
+
+def http_scope(path, method='GET', query=b'', raw_path=None, headers=()):
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query,
+             'headers': list(headers), 'http_version': '1.1', 'scheme': 'http'}
+    if raw_path is not None:
+        scope['raw_path'] = raw_path
+    return scope
+
+
+def request(server, scope, body=b''):
+    """Drive one request through the ASGI app; returns the list of messages it sent"""
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(server(scope, receive, send))
+    return sent
+
+
+def response(sent):
+    start = sent[0]
+    assert start['type'] == 'http.response.start'
+    assert not sent[-1].get('more_body')
+    return start['status'], dict(start['headers']), b''.join(message.get('body', b'') for message in sent[1:])
+
+
+def echo_app(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [environ['PATH_INFO'].encode('latin-1'), b'?', environ['QUERY_STRING'].encode('latin-1')]
+
+
+class TestWsgiEnviron(unittest.TestCase):
+    def test_path_info_is_decoded(self):
+        environ = wsgi_environ(http_scope('/fetch candles/é', raw_path=b'/fetch%20candles/%C3%A9'), b'')
+        self.assertEqual(environ['PATH_INFO'].encode('latin-1').decode('utf-8'), '/fetch candles/é')
+
+    def test_headers_and_body(self):
+        scope = http_scope('/run_script', method='POST', headers=[
+            (b'content-type', b'application/json'), (b'accept', b'a'), (b'accept', b'b')])
+        environ = wsgi_environ(scope, b'{}')
+        self.assertEqual(environ['CONTENT_TYPE'], 'application/json')
+        self.assertEqual(environ['HTTP_ACCEPT'], 'a,b')
+        self.assertEqual(environ['wsgi.input'].read(), b'{}')
+
+
+class TestAsgiServer(unittest.TestCase):
+    def server(self, app, **kwargs):
+        server = AsgiServer(app, io_routes={'/market_news'}, io_workers=4, cpu_workers=2, **kwargs)
+        self.addCleanup(server.cpu_pool.shutdown)
+        self.addCleanup(server.io_pool.shutdown)
+        return server
+
+    def test_io_and_bridged_routes(self):
+        server = self.server(echo_app)
+        for path in ('/market_news', '/run_script'):
+            status, headers, body = response(request(server, http_scope(path, query=b'q=1')))
+            self.assertEqual(status, 200)
+            self.assertEqual(headers[b'content-type'], b'text/plain')
+            self.assertEqual(body, path.encode() + b'?q=1')
+
+    def test_bridge_streams_chunks(self):
+        def app(environ, start_response):
+            start_response('200 OK', [('Content-Type', 'application/x-ndjson')])
+            return iter([b'{"a": 1}\n', b'', b'{"b": 2}\n'])
+
+        sent = request(self.server(app), http_scope('/fetch_segment_data'))
+        self.assertEqual([message.get('body') for message in sent[1:]], [b'{"a": 1}\n', b'{"b": 2}\n', b''])
+        self.assertEqual(response(sent)[0], 200)
+
+    def test_app_errors_become_500(self):
+        def broken(environ, start_response):
+            raise RuntimeError('boom')
+
+        server = self.server(broken)
+        for path in ('/market_news', '/run_script'):
+            with mock.patch('sys.stderr', io.StringIO()) as errors:
+                status, _, body = response(request(server, http_scope(path)))
+            self.assertEqual(status, 500)
+            self.assertIn(b'Internal Server Error', body)
+            self.assertIn('boom', errors.getvalue())
+
+    def test_iterator_error_after_first_chunk_ends_the_response(self):
+        def app(environ, start_response):
+            start_response('200 OK', [('Content-Type', 'text/plain')])
+            yield b'partial'
+            raise RuntimeError('boom')
+
+        with mock.patch('sys.stderr', io.StringIO()):
+            sent = request(self.server(app), http_scope('/run_script'))
+        status, _, body = response(sent)
+        self.assertEqual((status, body), (200, b'partial'))
+
+    def test_io_requests_are_not_coalesced_by_the_server(self):
+        # de-duplicating upstream calls is the app's SingleFlight's job, not the front end's
+        calls = []
+        lock = threading.Lock()
+
+        def app(environ, start_response):
+            with lock:
+                calls.append(environ['PATH_INFO'])
+            start_response('200 OK', [])
+            return [b'ok']
+
+        server = self.server(app)
+
+        async def burst():
+            async def one():
+                sent = []
+
+                async def receive():
+                    return {'type': 'http.request', 'body': b''}
+
+                async def send(message):
+                    sent.append(message)
+
+                await server(http_scope('/market_news'), receive, send)
+                return response(sent)
+
+            return await asyncio.gather(*(one() for _ in range(5)))
+
+        results = asyncio.run(burst())
+        self.assertEqual([status for status, _, _ in results], [200] * 5)
+        self.assertEqual(len(calls), 5)
+
+
+class TestAsyncRoutes(unittest.TestCase):
+    def server(self, session):
+        def wsgi_app(environ, start_response):
+            raise AssertionError('async routes must not reach the WSGI app')
+
+        server = AsgiServer(wsgi_app, io_workers=1, cpu_workers=1, upstream=SingleFlight(), session=session)
+        self.addCleanup(server.cpu_pool.shutdown)
+        self.addCleanup(server.io_pool.shutdown)
+        return server
+
+    def burst(self, server, count):
+        async def one():
+            sent = []
+
+            async def receive():
+                return {'type': 'http.request', 'body': b''}
+
+            async def send(message):
+                sent.append(message)
+
+            await server(http_scope('/market_news'), receive, send)
+            return response(sent)
+
+        async def run():
+            return await asyncio.gather(*(one() for _ in range(count)))
+
+        return asyncio.run(run())
+
+    def test_slow_upstream_waits_on_the_loop_not_on_threads(self):
+        session = FakeSession({'articles': [1, 2]})
+        threads = threading.active_count()
+        results = self.burst(self.server(session), 200)
+        self.assertEqual({(status, body) for status, _, body in results}, {(200, b'{"articles": [1, 2]}')})
+        # 200 concurrent requests with a single I/O worker: one upstream call, no extra threads
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_upstream_errors_are_json_500s(self):
+        results = self.burst(self.server(FakeSession(OSError('upstream down'))), 3)
+        self.assertEqual({(status, body) for status, _, body in results},
+                         {(500, b'{"error": "upstream down"}')})
+
+    def test_without_an_upstream_the_route_goes_through_the_app(self):
+        server = AsgiServer(echo_app, io_workers=1, cpu_workers=1, session=FakeSession({}))
+        self.addCleanup(server.cpu_pool.shutdown)
+        self.addCleanup(server.io_pool.shutdown)
+        self.assertEqual(response(request(server, http_scope('/market_news')))[2], b'/market_news?')
+
+
+if __name__ == '__main__':
+    unittest.main()
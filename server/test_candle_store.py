@@ -0,0 +1,123 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from server.candle_store import CandleStore, from_frame, store_symbol
+from server.serialization import candle_columns
+from server.single_flight import SingleFlight
+
+DAY_MS = 86400 * 1000
+
+
+class FakeFeed:
+    """Daily bars ending today, as naive UTC frames; records every n_bars asked for"""
+
+    def __init__(self, bars=400, shift_days=0):
+        today = int(time.time() * 1000) // DAY_MS * DAY_MS
+        self.times = today - DAY_MS * np.arange(bars)[::-1] - shift_days * DAY_MS
+        self.requests = []
+        self.fail = False
+
+    def frame(self, n_bars):
+        times = self.times[-n_bars:]
+        index = pd.DatetimeIndex(times.astype('datetime64[ms]'), name='datetime')
+        close = (times // DAY_MS % 1000).astype(np.float64)
+        return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+                             'volume': np.ones(len(times))}, index=index)
+
+    def __call__(self, symbol, exchange, interval, n_bars):
+        self.requests.append(n_bars)
+        return None if self.fail else self.frame(n_bars)
+
+
+class TestCandleStore(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.feed = FakeFeed()
+        self.store = CandleStore(self.root.name, fetch=self.feed, source_tz='UTC')
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def test_top_up_only_fetches_missing_bars(self):
+        self.assertEqual(self.store.top_up('AAPL', 'NASDAQ', 'in_daily', n_bars=100), 100)
+        self.assertEqual(self.store.top_up('AAPL', 'NASDAQ', 'in_daily', n_bars=100), 3)
+        self.assertEqual(self.feed.requests, [100, 3])
+        frame = self.store.read('AAPL', 'NASDAQ', 'in_daily')
+        self.assertEqual(len(frame), 100)
+        self.assertEqual(frame.index[-1].value // 10 ** 6, self.feed.times[-1])
+
+    def test_refresh_is_keyed_on_bars_requested(self):
+        self.store.get('AAPL', 'NASDAQ', 'in_daily', n_bars=50, refresh_after=60)
+        self.store.get('AAPL', 'NASDAQ', 'in_daily', n_bars=50, refresh_after=60)
+        self.assertEqual(self.feed.requests, [50])
+        frame = self.store.get('AAPL', 'NASDAQ', 'in_daily', n_bars=200, refresh_after=60)
+        self.assertEqual(len(frame), 200)
+        self.assertEqual(self.feed.requests, [50, 200])
+        self.store.get('AAPL', 'NASDAQ', 'in_daily', n_bars=100, refresh_after=60)
+        self.assertEqual(self.feed.requests, [50, 200])
+
+    def test_single_flight_does_not_delay_refreshes(self):
+        # 1m bars get a multi-second interval_ttl; the store must still top up once refresh_after passes
+        store = CandleStore(self.root.name, fetch=self.feed, source_tz='UTC', single_flight=SingleFlight())
+        store.get('AAPL', 'NASDAQ', 'in_1_minute', n_bars=50, refresh_after=0)
+        store.get('AAPL', 'NASDAQ', 'in_1_minute', n_bars=50, refresh_after=0)
+        self.assertEqual(len(self.feed.requests), 2)
+
+    def test_gap_backfills_the_full_window(self):
+        self.store.top_up('AAPL', 'NASDAQ', 'in_daily', n_bars=100)
+        # upstream moved on by more bars than the estimate covers
+        later = FakeFeed(shift_days=-10)
+        self.store.fetch = later
+        self.store.top_up('AAPL', 'NASDAQ', 'in_daily', n_bars=100)
+        self.assertEqual(len(later.requests), 2)
+        self.assertEqual(later.requests[-1], 100)
+        times = self.store.read('AAPL', 'NASDAQ', 'in_daily').index.values.astype('datetime64[ms]').astype(np.int64)
+        self.assertTrue((np.diff(times) == DAY_MS).all())
+
+    def test_empty_fetch_is_ignored(self):
+        self.store.top_up('AAPL', 'NASDAQ', 'in_daily', n_bars=100)
+        self.store.fetch = later = FakeFeed(shift_days=-10)
+        later.fail = True
+        self.assertEqual(self.store.top_up('AAPL', 'NASDAQ', 'in_daily', n_bars=100), 0)
+        self.assertEqual(len(self.store.read('AAPL', 'NASDAQ', 'in_daily')), 100)
+
+    def test_qualified_and_bare_symbols_share_a_series(self):
+        self.assertEqual(store_symbol('NSE:RELIANCE', 'NSE'), 'RELIANCE')
+        self.assertEqual(store_symbol('BINANCE:BTCUSDT', 'NSE'), 'BINANCE:BTCUSDT')
+        self.assertEqual(self.store.path('NSE:RELIANCE', 'NSE', 'in_daily'),
+                         self.store.path('RELIANCE', 'NSE', 'in_daily'))
+
+    def test_naive_times_are_read_in_the_source_zone(self):
+        frame = self.feed.frame(3)
+        utc = from_frame(frame, 'UTC')[0]
+        india = from_frame(frame, 'Asia/Kolkata')[0]
+        np.testing.assert_array_equal(utc - india, [5.5 * 3600 * 1000] * 3)
+        np.testing.assert_array_equal(from_frame(frame.tz_localize('UTC'), 'Asia/Kolkata')[0], utc)
+
+    def test_served_times_survive_a_non_utc_host(self):
+        previous = os.environ.get('TZ')
+        os.environ['TZ'] = 'Asia/Kolkata'
+        time.tzset()
+        try:
+            frame = self.store.get('AAPL', 'NASDAQ', 'in_daily', n_bars=10)
+            np.testing.assert_array_equal(candle_columns(frame)['time'], self.feed.times[-10:])
+            local = CandleStore(self.root.name, fetch=self.feed)
+            local_frame = local.get('MSFT', 'NASDAQ', 'in_daily', n_bars=10)
+            # a naive upstream frame in host time reads back as the instants time.mktime gave
+            expected = [int(time.mktime(stamp.timetuple()) * 1000) for stamp in self.feed.frame(10).index]
+            np.testing.assert_array_equal(candle_columns(local_frame)['time'], expected)
+        finally:
+            if previous is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = previous
+            time.tzset()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import threading
+import time
+import unittest
+from concurrent.futures import TimeoutError
+
+from server.fetch_executor import ClientPool, FetchExecutor, TokenBucket
+from server.single_flight import SingleFlight
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_empty(self):
+        bucket = TokenBucket(rate=1, burst=3)
+        self.assertEqual([bucket.try_acquire() for _ in range(4)], [True, True, True, False])
+
+    def test_reserve_books_future_tokens(self):
+        bucket = TokenBucket(rate=10, burst=1)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+        self.assertFalse(bucket.try_acquire())
+
+    def test_refill_is_capped_at_burst(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        bucket.try_acquire()
+        bucket.try_acquire()
+        bucket.updated -= 60
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [True, True, False])
+
+
+class TestFetchExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = FetchExecutor(max_workers=8)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_rate_limit_paces_calls(self):
+        self.executor.limit('host', concurrency=8, rate=20, burst=1)
+        started = time.monotonic()
+        results = self.executor.map('host', lambda item: item * 2, range(5))
+        self.assertEqual(results, {0: 0, 1: 2, 2: 4, 3: 6, 4: 8})
+        self.assertGreaterEqual(time.monotonic() - started, 0.18)
+
+    def test_concurrency_cap_per_host(self):
+        self.executor.limit('host', concurrency=2, rate=1000, burst=1000)
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def fetch(item):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return item
+
+        self.assertEqual(len(self.executor.map('host', fetch, range(8))), 8)
+        self.assertEqual(running[1], 2)
+
+    def test_failures_are_reported_not_raised(self):
+        def fetch(item):
+            if item == 2:
+                raise ValueError('upstream down')
+            return item
+
+        outcomes = {item: (result, error) for item, result, error in self.executor.as_completed('host', fetch, range(4))}
+        self.assertIsInstance(outcomes[2][1], ValueError)
+        self.assertIsNone(outcomes[2][0])
+        self.assertEqual(self.executor.map('host', fetch, range(4)), {0: 0, 1: 1, 3: 3})
+
+    def test_timeout(self):
+        release = threading.Event()
+        try:
+            with self.assertRaises(TimeoutError):
+                list(self.executor.as_completed('host', lambda _: release.wait(5), range(2), timeout=0.05))
+        finally:
+            release.set()
+
+    def test_saturated_pool_completes_every_item(self):
+        executor = FetchExecutor(max_workers=2)
+        executor.limit('host', concurrency=2, rate=1000, burst=1000)
+        try:
+            results = executor.map('host', lambda item: (time.sleep(0.005), item)[1], range(40))
+        finally:
+            executor.shutdown()
+        self.assertEqual(results, {item: item for item in range(40)})
+
+    def test_coalesced_calls_on_a_saturated_pool_do_not_deadlock(self):
+        executor = FetchExecutor(max_workers=2)
+        upstream = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'info'
+
+        try:
+            futures = [executor.submit('host', upstream.do, 'key', fetch, ttl=60) for _ in range(6)]
+            self.assertEqual([future.result(timeout=2) for future in futures], ['info'] * 6)
+        finally:
+            executor.shutdown()
+        self.assertEqual(len(calls), 1)
+
+
+class TestClientPool(unittest.TestCase):
+    def test_fetch_threads_share_a_bounded_set_of_logins(self):
+        logins = []
+        lock = threading.Lock()
+        busy = [0, 0]
+
+        def login():
+            with lock:
+                logins.append(object())
+                return logins[-1]
+
+        def get_hist(client, item):
+            with lock:
+                busy[0] += 1
+                busy[1] = max(busy)
+                self.assertNotIn(client, in_use)
+                in_use.add(client)
+            time.sleep(0.01)
+            with lock:
+                in_use.discard(client)
+                busy[0] -= 1
+            return item
+
+        in_use = set()
+        seed = object()
+        pool = ClientPool(login, size=2, clients=[seed])
+        executor = FetchExecutor(max_workers=16)
+        executor.limit('tradingview', concurrency=16, rate=1000, burst=1000)
+        try:
+            results = executor.map('tradingview', lambda item: pool.call(get_hist, item), range(40))
+        finally:
+            executor.shutdown()
+        self.assertEqual(results, {item: item for item in range(40)})
+        # the seeded client plus one more login, however many threads fetch
+        self.assertEqual(len(logins), 1)
+        self.assertEqual(busy[1], 2)
+
+    def test_failed_login_frees_its_slot(self):
+        attempts = []
+
+        def login():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError('login refused')
+            return 'client'
+
+        pool = ClientPool(login, size=1)
+        with self.assertRaises(ConnectionError):
+            pool.acquire()
+        self.assertEqual(pool.call(lambda client: client), 'client')
+        self.assertEqual(pool.call(lambda client: client), 'client')
+        self.assertEqual(len(attempts), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from server import serialization as S
+
+BARS = [
+    {'time': 1700000000000, 'open': 1.5, 'high': 2.25, 'low': 1.0, 'close': 2.0, 'volume': 100.0},
+    {'time': 1700086400000, 'open': 2.0, 'high': 3.0, 'low': 1.75, 'close': 2.125, 'volume': 250.5},
+]
+
+
+class TestEncoders(unittest.TestCase):
+    def setUp(self):
+        self.columns = S.records_from_bars(BARS)
+
+    def test_columns_are_typed(self):
+        self.assertEqual(self.columns['time'].dtype, np.int64)
+        self.assertEqual(self.columns['close'].dtype, np.float64)
+        self.assertEqual(list(self.columns), list(S.CANDLE_COLUMNS))
+
+    def test_row_json_round_trips_the_bars(self):
+        self.assertEqual(json.loads(S.encode(self.columns, S.JSON_MIMETYPE)), BARS)
+
+    def test_columnar_json(self):
+        decoded = json.loads(S.encode(self.columns, S.COLUMNAR_JSON_MIMETYPE))
+        self.assertEqual(list(decoded), list(S.CANDLE_COLUMNS))
+        for name in S.CANDLE_COLUMNS:
+            self.assertEqual(decoded[name], [bar[name] for bar in BARS])
+
+    def test_binary_round_trip(self):
+        payload = S.encode(self.columns, S.BINARY_MIMETYPE)
+        self.assertEqual(payload[:4], S.BINARY_MAGIC)
+        decoded = S.from_binary(payload)
+        self.assertEqual(list(decoded), list(S.CANDLE_COLUMNS))
+        for name, values in self.columns.items():
+            np.testing.assert_array_equal(decoded[name], values)
+            self.assertEqual(decoded[name].dtype, values.dtype)
+
+    def test_binary_rejects_foreign_payloads(self):
+        with self.assertRaises(ValueError):
+            S.from_binary(b'JUNK' + bytes(16))
+        payload = bytearray(S.to_binary(self.columns))
+        payload[4] = 99
+        with self.assertRaises(ValueError):
+            S.from_binary(bytes(payload))
+
+    def test_empty_columns(self):
+        columns = S.records_from_bars([])
+        self.assertEqual(json.loads(S.to_records_json(columns)), [])
+        self.assertEqual(len(S.from_binary(S.to_binary(columns))['time']), 0)
+
+    def test_frame_index_is_read_as_epoch_ms(self):
+        index = pd.DatetimeIndex(pd.to_datetime([bar['time'] for bar in BARS], unit='ms', utc=True))
+        frame = pd.DataFrame(BARS, index=index).drop(columns='time')
+        np.testing.assert_array_equal(S.candle_columns(frame)['time'], self.columns['time'])
+
+
+class TestNegotiate(unittest.TestCase):
+    def test_defaults_to_row_json(self):
+        self.assertEqual(S.negotiate(), S.JSON_MIMETYPE)
+        self.assertEqual(S.negotiate('text/html, */*'), S.JSON_MIMETYPE)
+
+    def test_accept_header(self):
+        self.assertEqual(S.negotiate('application/octet-stream'), S.BINARY_MIMETYPE)
+        self.assertEqual(S.negotiate(f'{S.COLUMNAR_JSON_MIMETYPE};q=0.9, application/json'),
+                         S.COLUMNAR_JSON_MIMETYPE)
+
+    def test_format_parameter_wins(self):
+        self.assertEqual(S.negotiate(S.JSON_MIMETYPE, 'binary'), S.BINARY_MIMETYPE)
+        with self.assertRaises(ValueError):
+            S.negotiate(None, 'xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
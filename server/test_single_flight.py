@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import pandas as pd
+
+from server.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_fetch(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do('key', fetch))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['value'] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.do('key', fetch), 'value')
+        self.assertEqual(flight.hits, 1)
+
+    def test_failures_are_not_cached(self):
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do('key', lambda: (_ for _ in ()).throw(ValueError('down')))
+        self.assertEqual(flight.do('key', lambda: 'value'), 'value')
+
+    def test_async_callers_coalesce_with_sync_ones(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {'articles': []}
+
+        async def run():
+            return await asyncio.gather(*(flight.do_async('news', fetch, ttl=60) for _ in range(20)))
+
+        self.assertEqual(asyncio.run(run()), [{'articles': []}] * 20)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.coalesced, 19)
+        # the sync path serves the result the async leader cached
+        self.assertEqual(flight.do('news', lambda: self.fail('refetched')), {'articles': []})
+
+    def test_callers_get_private_copies(self):
+        flight = SingleFlight()
+        first = flight.do('quote', lambda: {'bids': [1, 2]}, ttl=60)
+        first['bids'].append(3)
+        self.assertEqual(flight.do('quote', lambda: self.fail('refetched')), {'bids': [1, 2]})
+
+        frame = flight.do('candles', lambda: pd.DataFrame({'close': [1.0, 2.0]}), ttl=60)
+        frame['close'] *= 10
+        frame['sma'] = 0.0
+        pd.testing.assert_frame_equal(flight.do('candles', lambda: None), pd.DataFrame({'close': [1.0, 2.0]}))
+
+    def test_coalesced_async_callers_do_not_share_a_result(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return {'articles': []}
+
+        async def run():
+            return await asyncio.gather(*(flight.do_async('news', fetch, ttl=0) for _ in range(3)))
+
+        results = asyncio.run(run())
+        results[0]['articles'].append('edited')
+        self.assertEqual(results[1:], [{'articles': []}] * 2)
+        self.assertEqual(len({id(result) for result in results}), 3)
+
+    def test_objects_without_a_copy_are_shared(self):
+        client = object()
+        flight = SingleFlight()
+        self.assertIs(flight.do('client', lambda: client, ttl=60), client)
+        self.assertIs(flight.do('client', lambda: None), client)
+
+
+if __name__ == '__main__':
+    unittest.main()
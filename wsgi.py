@@ -1,4 +1,5 @@
 from supabase import create_client
+import os
 import talib
 from server.api import app
 
@@ -13,5 +14,11 @@ supabase = create_client(
 )
 
 if __name__ == "__main__":
-    from waitress import serve
-    serve(app, host='0.0.0.0', port=8000)
+    if os.environ.get('SERVER_MODE') == 'asgi':
+        # async upstream I/O where a client exists, separate pools for the rest; see server/asgi.py
+        import uvicorn
+        from server.asgi import create_app
+        uvicorn.run(create_app(), host='0.0.0.0', port=8000)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=8000)